@@ -0,0 +1,50 @@
+"""add source file manifest
+
+Revision ID: 5e8b1f0c3a27
+Revises: 2c9f4e7b81a6
+Create Date: 2026-09-01 10:00:00.000000+00:00
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5e8b1f0c3a27'
+down_revision: str | None = '2c9f4e7b81a6'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Apply this revision.
+
+    Adds ``source_file``, the manifest ``--incremental`` imports read to skip an
+    archive whose SHA-256 is the one recorded and to replace one whose SHA-256 is
+    not. Nothing is backfilled: a database imported before this revision has no
+    manifest, so its first incremental run imports every file once more — after
+    which the manifest is complete.
+    """
+    op.create_table('source_file',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('data_provider_id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('sha256', sa.String(length=64), nullable=False),
+    sa.Column('size_bytes', sa.BigInteger(), nullable=False),
+    sa.Column('first_wildfire_id', sa.Integer(), nullable=True),
+    sa.Column('last_wildfire_id', sa.Integer(), nullable=True),
+    sa.Column('wildfire_count', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['data_provider_id'], ['data_provider.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('data_provider_id', 'name', name='uq_source_file_provider_name')
+    )
+
+
+def downgrade() -> None:
+    """Revert this revision."""
+    op.drop_table('source_file')
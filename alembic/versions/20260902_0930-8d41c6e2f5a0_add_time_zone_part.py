@@ -0,0 +1,62 @@
+"""add time zone part
+
+Revision ID: 8d41c6e2f5a0
+Revises: 5e8b1f0c3a27
+Create Date: 2026-09-02 09:30:00.000000+00:00
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+from geoalchemy2 import Geometry
+
+# revision identifiers, used by Alembic.
+revision: str = '8d41c6e2f5a0'
+down_revision: str | None = '5e8b1f0c3a27'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+#: Name of the time_zone_part -> time_zone foreign key, spelled out for the same
+#: reason as ``ADMIN_BOUNDARY_FK`` in f6f5319de6bf: it is what PostgreSQL would
+#: have picked, so a migrated database and one built by ``create_all()`` match.
+TIME_ZONE_FK = "time_zone_part_time_zone_id_fkey"
+
+#: Cuts the zones already loaded, so that a database migrated to this revision
+#: looks points up in pieces straight away rather than after the next time zone
+#: import. A copy of :data:`src.apps.imports.common.MISSING_TIME_ZONE_PARTS_SQL`,
+#: frozen here as a migration has to be.
+BUILD_PARTS_SQL = """
+INSERT INTO time_zone_part (time_zone_id, name, geometry)
+SELECT time_zone.id, time_zone.name, ST_Subdivide(time_zone.geometry, 256)
+FROM time_zone
+"""
+
+
+def upgrade() -> None:
+    """Apply this revision.
+
+    Adds ``time_zone_part``, the subdivided copy of ``time_zone`` the importers
+    resolve a point's zone against, and fills it from the zones already there.
+    """
+    op.create_geospatial_table('time_zone_part',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('time_zone_id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('geometry', Geometry(geometry_type='POLYGON', srid=4326, dimension=2, spatial_index=False, from_text='ST_GeomFromEWKT', name='geometry', nullable=False), nullable=False),
+    sa.ForeignKeyConstraint(['time_zone_id'], ['time_zone.id'], name=TIME_ZONE_FK, ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_geospatial_index('idx_time_zone_part_geometry', 'time_zone_part', ['geometry'], unique=False, postgresql_using='gist', postgresql_ops={})
+    op.create_index('ix_time_zone_part_time_zone_id', 'time_zone_part', ['time_zone_id'], unique=False)
+    op.execute(BUILD_PARTS_SQL)
+    op.execute('ANALYZE time_zone_part')
+
+
+def downgrade() -> None:
+    """Revert this revision."""
+    op.drop_index('ix_time_zone_part_time_zone_id', table_name='time_zone_part')
+    op.drop_geospatial_index('idx_time_zone_part_geometry', table_name='time_zone_part', postgresql_using='gist', column_name='geometry')
+    op.drop_geospatial_table('time_zone_part')
@@ -0,0 +1,64 @@
+"""add admin boundary part
+
+Revision ID: a61f3d9c0e52
+Revises: 8d41c6e2f5a0
+Create Date: 2026-09-03 09:30:00.000000+00:00
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+from geoalchemy2 import Geometry
+
+# revision identifiers, used by Alembic.
+revision: str = 'a61f3d9c0e52'
+down_revision: str | None = '8d41c6e2f5a0'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+#: Cuts the boundaries already imported, so that a database migrated to this
+#: revision attributes fires from pieces straight away rather than after the next
+#: boundary import. A copy of
+#: :data:`src.apps.imports.common.MISSING_ADMIN_BOUNDARY_PARTS_SQL`, frozen here as
+#: a migration has to be.
+BUILD_PARTS_SQL = """
+INSERT INTO admin_boundary_part (admin_boundary_id, data_provider_id, level, geometry)
+SELECT boundary.id, boundary.data_provider_id, boundary.level,
+       ST_Subdivide(boundary.geometry, 256)
+FROM admin_boundary AS boundary
+"""
+
+
+def upgrade() -> None:
+    """Apply this revision.
+
+    Adds ``admin_boundary_part``, the subdivided copy of ``admin_boundary`` fires
+    are attributed against, and fills it from the boundaries already there. On a
+    database holding the OCHA, IGN and CAOP boundaries this takes a few minutes.
+    """
+    op.create_geospatial_table('admin_boundary_part',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('admin_boundary_id', sa.Integer(), nullable=False),
+    sa.Column('data_provider_id', sa.Integer(), nullable=False),
+    sa.Column('level', sa.Integer(), nullable=False),
+    sa.Column('geometry', Geometry(geometry_type='POLYGON', srid=4326, dimension=2, spatial_index=False, from_text='ST_GeomFromEWKT', name='geometry', nullable=False), nullable=False),
+    sa.ForeignKeyConstraint(['admin_boundary_id'], ['admin_boundary.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['data_provider_id'], ['data_provider.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_geospatial_index('idx_admin_boundary_part_geometry', 'admin_boundary_part', ['geometry'], unique=False, postgresql_using='gist', postgresql_ops={})
+    op.create_index('ix_admin_boundary_part_admin_boundary_id', 'admin_boundary_part', ['admin_boundary_id'], unique=False)
+    op.create_index('ix_admin_boundary_part_provider_level', 'admin_boundary_part', ['data_provider_id', 'level'], unique=False)
+    op.execute(BUILD_PARTS_SQL)
+    op.execute('ANALYZE admin_boundary_part')
+
+
+def downgrade() -> None:
+    """Revert this revision."""
+    op.drop_index('ix_admin_boundary_part_provider_level', table_name='admin_boundary_part')
+    op.drop_index('ix_admin_boundary_part_admin_boundary_id', table_name='admin_boundary_part')
+    op.drop_geospatial_index('idx_admin_boundary_part_geometry', table_name='admin_boundary_part', postgresql_using='gist', column_name='geometry')
+    op.drop_geospatial_table('admin_boundary_part')
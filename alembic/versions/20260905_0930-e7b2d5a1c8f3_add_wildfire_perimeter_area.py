@@ -0,0 +1,35 @@
+"""add wildfire perimeter area
+
+Revision ID: e7b2d5a1c8f3
+Revises: c3e8f1a9d4b6
+Create Date: 2026-09-05 09:30:00.000000+00:00
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b2d5a1c8f3'
+down_revision: str | None = 'c3e8f1a9d4b6'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Apply this revision.
+
+    Adds ``wildfire.perimeter_area_m2``, the geodesic area of the perimeter as a
+    stored generated column. Adding it rewrites the table and measures every
+    perimeter already there once — on the full GWIS archive that is the same tens
+    of minutes a single statistics run used to spend, paid here for the last time.
+    """
+    op.add_column('wildfire', sa.Column('perimeter_area_m2', sa.Float(), sa.Computed('ST_Area(perimeter::geography)', persisted=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Revert this revision."""
+    op.drop_column('wildfire', 'perimeter_area_m2')
@@ -0,0 +1,63 @@
+"""add wildfire yearly summary
+
+Revision ID: f4a9c2e7b1d5
+Revises: e7b2d5a1c8f3
+Create Date: 2026-09-06 09:30:00.000000+00:00
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4a9c2e7b1d5'
+down_revision: str | None = 'e7b2d5a1c8f3'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Apply this revision.
+
+    Adds ``wildfire_yearly_summary``, what ``--from-summary`` reports read instead
+    of every fire, and fills it from the GWIS and GFA fires already imported —
+    the two providers whose importers keep it up to date from here on. Nobody
+    else's fires are summarised: a row no import refreshes would be a stale
+    answer waiting for a report to trust it. The fill is one pass over the stored
+    areas and costs about what one ``--country-source reported`` report did.
+    """
+    op.create_table('wildfire_yearly_summary',
+    sa.Column('data_provider_id', sa.Integer(), nullable=False),
+    sa.Column('admin_boundary_id', sa.Integer(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('surface', sa.String(), nullable=False),
+    sa.Column('fires', sa.Integer(), nullable=False),
+    sa.Column('minimum_m2', sa.Float(), nullable=False),
+    sa.Column('maximum_m2', sa.Float(), nullable=False),
+    sa.Column('total_m2', sa.Float(), nullable=False),
+    sa.Column('refreshed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['admin_boundary_id'], ['admin_boundary.id'], ),
+    sa.ForeignKeyConstraint(['data_provider_id'], ['data_provider.id'], ),
+    sa.PrimaryKeyConstraint('data_provider_id', 'admin_boundary_id', 'year', 'surface')
+    )
+    op.execute("""
+        INSERT INTO wildfire_yearly_summary
+            (data_provider_id, admin_boundary_id, year, surface,
+             fires, minimum_m2, maximum_m2, total_m2)
+        SELECT data_provider_id, admin_boundary_id,
+               EXTRACT(YEAR FROM start_date_time AT TIME ZONE COALESCE(time_zone, 'UTC'))::integer,
+               'perimeter', count(*), min(perimeter_area_m2), max(perimeter_area_m2),
+               sum(perimeter_area_m2)
+        FROM wildfire
+        WHERE admin_boundary_id IS NOT NULL AND perimeter_area_m2 IS NOT NULL
+          AND id IN (SELECT id FROM gwis_wildfire UNION ALL SELECT id FROM gfa_wildfire)
+        GROUP BY 1, 2, 3
+    """)
+
+
+def downgrade() -> None:
+    """Revert this revision."""
+    op.drop_table('wildfire_yearly_summary')
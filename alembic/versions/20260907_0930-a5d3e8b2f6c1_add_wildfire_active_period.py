@@ -0,0 +1,39 @@
+"""add wildfire active period
+
+Revision ID: a5d3e8b2f6c1
+Revises: f4a9c2e7b1d5
+Create Date: 2026-09-07 09:30:00.000000+00:00
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a5d3e8b2f6c1'
+down_revision: str | None = 'f4a9c2e7b1d5'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Apply this revision.
+
+    Adds ``wildfire.active_period``, the fire's start and end dates as a stored
+    generated ``tstzrange``, and one GiST index over the perimeter and that period
+    together, so that "burning in this box during this window" is answered by a
+    single index. Adding the column rewrites the table, and building the index
+    reads every perimeter once; both are done here rather than on first use.
+    """
+    op.add_column('wildfire', sa.Column('active_period', postgresql.TSTZRANGE(), sa.Computed("tstzrange(start_date_time, CASE WHEN end_date_time < start_date_time THEN start_date_time ELSE end_date_time END, '[]')", persisted=True), nullable=False))
+    op.create_index('ix_wildfire_perimeter_active_period', 'wildfire', ['perimeter', 'active_period'], unique=False, postgresql_using='gist')
+
+
+def downgrade() -> None:
+    """Revert this revision."""
+    op.drop_index('ix_wildfire_perimeter_active_period', table_name='wildfire', postgresql_using='gist')
+    op.drop_column('wildfire', 'active_period')
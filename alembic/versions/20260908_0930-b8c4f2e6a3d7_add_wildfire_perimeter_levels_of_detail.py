@@ -0,0 +1,151 @@
+"""add wildfire perimeter levels of detail
+
+Revision ID: b8c4f2e6a3d7
+Revises: a5d3e8b2f6c1
+Create Date: 2026-09-08 09:30:00.000000+00:00
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from geoalchemy2 import Geometry
+
+from alembic import op
+
+from src.data_model.replaceable import ReplaceableObject
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8c4f2e6a3d7'
+down_revision: str | None = 'a5d3e8b2f6c1'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+# --- View definitions -------------------------------------------------------
+#
+# One view per dataset and level of detail, over the three simplified perimeters
+# this revision adds to ``wildfire``. They follow the four rules set out in
+# revision e4b7c1a90f3d — ``id`` first, the geometry selected straight from its
+# table (the generated columns are declared ``geometry(MultiPolygon,4326)``, so the
+# type modifier survives), one geometry per view, a ``*_local`` companion for every
+# datetime — and name the geometry ``perimeter`` at every level, so the style of a
+# dataset's full-resolution layer loads unchanged on its three coarser ones.
+#
+# Only the datasets whose EPSG:4326 view draws ``wildfire.perimeter`` get them:
+# the perimeters on a provider's own grid are not simplified, and a POINT layer
+# has nothing to simplify.
+#
+# The columns are the few a layer drawn at national scale is styled or labelled
+# by — the provider's identifier, the dates, the boundary and the area — and not
+# the full attribute table: these layers exist to move fewer bytes, and the full
+# view is one zoom step away for anything else.
+
+# The generic columns of a level-of-detail view and the lookups behind them. ``s``
+# is the provider's table, ``w`` ``wildfire``, ``dp`` ``data_provider``, ``ab``
+# ``admin_boundary``.
+_LOD_COLUMNS = """
+    w.start_date_time AS start_date_time,
+    w.end_date_time AS end_date_time,
+    w.start_date_time AT TIME ZONE w.time_zone AS start_date_time_local,
+    w.end_date_time AT TIME ZONE w.time_zone AS end_date_time_local,
+    w.time_zone AS time_zone,
+    dp.name AS data_provider_name,
+    ab.name AS admin_boundary_name,
+    ab.name_en AS admin_boundary_name_en,
+    w.perimeter_area_m2 AS perimeter_area_m2"""
+
+_LOD_JOINS = """
+JOIN wildfire w ON w.id = s.id
+LEFT JOIN data_provider dp ON dp.id = w.data_provider_id
+LEFT JOIN admin_boundary ab ON ab.id = w.admin_boundary_id"""
+
+#: The datasets, as ``(view prefix, provider table, identifier columns)``: the
+#: columns a feature is known by in its own provider's terms.
+DATASETS = [
+    ("v_gwis_wildfire", "gwis_wildfire", ("gwis_id",)),
+    ("v_gfa_wildfire", "gfa_wildfire", ("gfa_id",)),
+    ("v_icnf_wildfire", "icnf_wildfire", ("sgif_code",)),
+    ("v_darpa_wildfire", "darpa_wildfire", ("code",)),
+    ("v_rediam_wildfire", "rediam_wildfire", ("code",)),
+    ("v_nbac_wildfire", "nbac_wildfire", ("nfireid",)),
+    ("v_conafor_wildfire", "conafor_wildfire", ("fire_code",)),
+    ("v_conaf_magnitud_wildfire", "conaf_magnitud_wildfire", ("season", "number", "name")),
+]
+
+#: The three levels, coarsest first, as ``ST_SimplifyPreserveTopology`` tolerances
+#: in degrees; a snapshot of ``PERIMETER_LOD_TOLERANCES`` in
+#: ``src/data_model/wildfire.py``.
+TOLERANCES = (0.01, 0.001, 0.0001)
+
+
+def _lod_view(prefix: str, table: str, identifiers: tuple[str, ...], level: int) -> ReplaceableObject:
+    """Build one dataset's view at one level of detail.
+
+    Parameters
+    ----------
+    prefix : str
+        Name of the dataset's views, without the level suffix.
+    table : str
+        The provider's table.
+    identifiers : tuple of str
+        The provider's identifier columns on ``table``.
+    level : int
+        1, 2 or 3: which ``perimeter_z*`` column to expose as ``perimeter``.
+
+    Returns
+    -------
+    ReplaceableObject
+        The view definition.
+    """
+    identifier_columns = "".join(f"\n    s.{column} AS {column}," for column in identifiers)
+    return ReplaceableObject(
+        f"{prefix}_lod{level}",
+        f"""
+SELECT
+    w.id AS id,{identifier_columns}{_LOD_COLUMNS},
+    w.perimeter_z{level} AS perimeter
+FROM {table} s{_LOD_JOINS}
+""",
+    )
+
+
+#: Every view this revision creates, dataset by dataset.
+VIEWS = [_lod_view(prefix, table, identifiers, level)
+         for prefix, table, identifiers in DATASETS
+         for level in (1, 2, 3)]
+
+
+def _perimeter_lod_column(level: int) -> sa.Column:
+    """The ``perimeter_z<level>`` column, as the model declares it."""
+    return sa.Column(
+        f'perimeter_z{level}',
+        Geometry(geometry_type='MULTIPOLYGON', srid=4326, dimension=2, spatial_index=False, from_text='ST_GeomFromEWKT', name='geometry'),
+        sa.Computed(f'ST_SimplifyPreserveTopology(perimeter, {TOLERANCES[level - 1]})', persisted=True),
+        nullable=True,
+    )
+
+
+def upgrade() -> None:
+    """Apply this revision.
+
+    Adds ``wildfire.perimeter_z1``, ``_z2`` and ``_z3``, the perimeter simplified
+    at three fixed tolerances as stored generated columns, each with its own GiST
+    index, and the ``v_*_lod1`` to ``v_*_lod3`` views that serve them to QGIS.
+    Each column rewrites the table and simplifies every perimeter already there
+    once; from then on an import pays for it as it writes each perimeter.
+    """
+    for level in (1, 2, 3):
+        op.add_geospatial_column('wildfire', _perimeter_lod_column(level))
+        op.create_geospatial_index(f'idx_wildfire_perimeter_z{level}', 'wildfire', [f'perimeter_z{level}'], unique=False, postgresql_using='gist', postgresql_ops={})
+    for view in VIEWS:
+        op.create_view(view)
+
+
+def downgrade() -> None:
+    """Revert this revision."""
+    for view in reversed(VIEWS):
+        op.drop_view(view)
+    for level in (3, 2, 1):
+        op.drop_geospatial_index(f'idx_wildfire_perimeter_z{level}', table_name='wildfire', postgresql_using='gist', column_name=f'perimeter_z{level}')
+        op.drop_geospatial_column('wildfire', f'perimeter_z{level}')
@@ -0,0 +1,114 @@
+"""add wildfire boundary area
+
+Revision ID: c3f7a9d2e5b8
+Revises: b8c4f2e6a3d7
+Create Date: 2026-09-09 09:30:00.000000+00:00
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f7a9d2e5b8'
+down_revision: str | None = 'b8c4f2e6a3d7'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+#: The GWIS and GFA fires with a perimeter, each with its local year. The fill's
+#: counterpart of :data:`src.apps.imports.common.BOUNDARY_AREA_FIRES_SQL`, over
+#: every year at once.
+_FIRES_SQL = """
+SELECT id, data_provider_id,
+       EXTRACT(YEAR FROM start_date_time AT TIME ZONE COALESCE(time_zone, 'UTC'))::integer AS year,
+       perimeter, perimeter_area_m2
+FROM wildfire
+WHERE perimeter IS NOT NULL
+  AND id IN (SELECT id FROM gwis_wildfire UNION ALL SELECT id FROM gfa_wildfire)
+"""
+
+#: The pieces of the OCHA countries and their first subdivision, the boundaries the
+#: GWIS and GFA importers attribute their fires to.
+_PARTS_SQL = """
+SELECT part.*
+FROM admin_boundary_part AS part
+JOIN data_provider AS provider ON provider.id = part.data_provider_id
+WHERE provider.name = 'OCHA'
+  AND provider.product = 'Global International Boundaries - OSM'
+  AND part.level IN (0, 1)
+"""
+
+#: :data:`src.apps.imports.common.INSERT_COVERED_BOUNDARY_AREAS_SQL`, frozen here
+#: as a migration has to be.
+FILL_COVERED_SQL = f"""
+INSERT INTO wildfire_boundary_area
+    (wildfire_id, admin_boundary_id, data_provider_id, level, year, area_m2)
+SELECT DISTINCT ON (fire.id, part.level)
+       fire.id, part.admin_boundary_id, fire.data_provider_id, part.level, fire.year,
+       fire.perimeter_area_m2
+FROM ({_FIRES_SQL}) AS fire
+JOIN ({_PARTS_SQL}) AS part
+  ON part.geometry ~ fire.perimeter
+ AND ST_Covers(part.geometry, ST_Envelope(fire.perimeter))
+ORDER BY fire.id, part.level, part.id
+"""
+
+#: :data:`src.apps.imports.common.INSERT_SPLIT_BOUNDARY_AREAS_SQL`, frozen likewise.
+FILL_SPLIT_SQL = f"""
+INSERT INTO wildfire_boundary_area
+    (wildfire_id, admin_boundary_id, data_provider_id, level, year, area_m2)
+SELECT fire.id, part.admin_boundary_id, fire.data_provider_id, part.level, fire.year,
+       sum(ST_Area(ST_Intersection(part.geometry, fire.valid)::geography))
+FROM (
+    SELECT fire.*,
+           CASE WHEN ST_IsValid(fire.perimeter) THEN fire.perimeter
+                ELSE ST_CollectionExtract(ST_MakeValid(fire.perimeter), 3) END AS valid
+    FROM ({_FIRES_SQL}) AS fire
+) AS fire
+JOIN ({_PARTS_SQL}) AS part ON ST_Intersects(part.geometry, fire.perimeter)
+WHERE NOT EXISTS (SELECT 1 FROM wildfire_boundary_area AS covered
+                  WHERE covered.wildfire_id = fire.id AND covered.level = part.level)
+GROUP BY 1, 2, 3, 4, 5
+HAVING sum(ST_Area(ST_Intersection(part.geometry, fire.valid)::geography)) > 0
+"""
+
+
+def upgrade() -> None:
+    """Apply this revision.
+
+    Adds ``wildfire_boundary_area``, what ``--split-area`` reports read, and fills
+    it from the GWIS and GFA fires already imported against the OCHA boundaries —
+    the providers whose importers keep it up to date from here on, for the reason
+    revision f4a9c2e7b1d5 gives. Nothing is filled on a database without the OCHA
+    boundaries. The fill intersects only the perimeters that cross a border, and
+    takes about as long as an import of those.
+    """
+    op.create_table('wildfire_boundary_area',
+    sa.Column('wildfire_id', sa.Integer(), nullable=False),
+    sa.Column('admin_boundary_id', sa.Integer(), nullable=False),
+    sa.Column('data_provider_id', sa.Integer(), nullable=False),
+    sa.Column('level', sa.Integer(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('area_m2', sa.Float(), nullable=False),
+    sa.Column('refreshed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['admin_boundary_id'], ['admin_boundary.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['data_provider_id'], ['data_provider.id'], ),
+    sa.ForeignKeyConstraint(['wildfire_id'], ['wildfire.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('wildfire_id', 'admin_boundary_id')
+    )
+    op.create_index('ix_wildfire_boundary_area_admin_boundary_id', 'wildfire_boundary_area', ['admin_boundary_id'], unique=False)
+    op.create_index('ix_wildfire_boundary_area_provider_level_year', 'wildfire_boundary_area', ['data_provider_id', 'level', 'year'], unique=False)
+    op.execute(FILL_COVERED_SQL)
+    op.execute(FILL_SPLIT_SQL)
+    op.execute('ANALYZE wildfire_boundary_area')
+
+
+def downgrade() -> None:
+    """Revert this revision."""
+    op.drop_index('ix_wildfire_boundary_area_provider_level_year', table_name='wildfire_boundary_area')
+    op.drop_index('ix_wildfire_boundary_area_admin_boundary_id', table_name='wildfire_boundary_area')
+    op.drop_table('wildfire_boundary_area')
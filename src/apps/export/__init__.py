@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Applications that copy imported data out of the database into files.
+
+Like :mod:`src.apps.statistics` they only read the database. What they write is
+meant for analyses that would otherwise run against it: the same rows the QGIS
+views show, in a columnar format that pandas, GeoPandas, DuckDB and Spark read
+without a connection, and the FlatGeobuf or GeoPackage files QGIS opens in the
+field. See :mod:`src.apps.export.export_geoparquet` and
+:mod:`src.apps.export.export_bundle`.
+"""
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Export the dataset views to FlatGeobuf or GeoPackage, for QGIS without a database.
+
+Writes each ``v_`` dataset view — the same columns, the same one geometry, the
+same flattening of a provider's subclass onto ``wildfire`` or ``ignition`` that
+QGIS already shows — into files a field team opens with no connection at all::
+
+    python3 -m src.apps.export.export_bundle --format fgb --output-dir bundle
+
+    python3 -m src.apps.export.export_bundle --format gpkg --output-dir bundle \\
+        --views v_gwis_wildfire v_icnf_wildfire_4326
+
+After an import has replaced some years, rewrite only those::
+
+    python3 -m src.apps.export.export_bundle --format fgb --output-dir bundle --years 2021
+
+Without ``--views`` every dataset view is written except the level-of-detail
+ones (``v_*_lod1`` to ``v_*_lod3``), which are the same rows again with a coarser
+geometry. The application only reads the database, and writes through
+``ogr2ogr``, which must be on ``PATH``. Database settings come from the
+environment (``.env``, see :mod:`src.settings`); every one of them can be
+overridden with a command-line argument.
+
+Every row gains a ``local_year`` column, the year it counts towards in the
+reports (see :mod:`src.apps.export.partitions`), which is what a field team
+filters on and what an incremental run deletes by.
+
+FlatGeobuf: one file per provider and year
+------------------------------------------
+
+A FlatGeobuf file carries a packed Hilbert R-tree ahead of its features, which is
+what lets QGIS read only the features inside the map extent — from local disk,
+or over HTTP range requests from a plain web server. The tree is packed: it is
+built once, over every feature, when the file is written, and there is no
+inserting into it afterwards. So a file is never updated, only replaced, and the
+unit replaced is the partition::
+
+    bundle/v_gwis_wildfire/data_provider_id=3/local_year=2021/data.fgb
+
+GDAL builds the tree from a temporary file of the features and an in-memory
+array of their boxes — some forty bytes a feature — so the memory a file takes
+is bounded by one provider-year, whatever the size of the dataset.
+
+GeoPackage: one file per view
+-----------------------------
+
+A GeoPackage keeps its R-tree current on every insert and delete, by triggers,
+so one file per view is updated in place: an incremental run deletes the rows
+of the years it rewrites and appends them again, one partition at a time. A full
+run builds the file beside the old one and moves it over it once complete.
+
+``ogr2ogr`` reads the view through a cursor, a page at a time, and writes in
+transactions of :data:`TRANSACTION_SIZE` features, so the memory a GeoPackage
+takes is that of one page and one transaction.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import re
+import shutil
+import sqlite3
+import subprocess
+import sys
+
+from pathlib import Path
+
+from sqlalchemy import Connection
+from sqlalchemy import Engine
+from sqlalchemy import create_engine
+from sqlalchemy import inspect
+
+import src.settings  # noqa: F401  (imported for the side effect of loading .env)
+
+from src.apps.export import partitions
+from src.apps.imports import common
+
+#: The formats, by the name the command line takes, with the GDAL driver.
+FORMATS = {"fgb": "FlatGeobuf", "gpkg": "GPKG"}
+
+#: The FlatGeobuf file written in each partition directory.
+FGB_FILE_NAME = "data.fgb"
+
+#: Features per ``ogr2ogr`` transaction into a GeoPackage.
+TRANSACTION_SIZE = 65_536
+
+#: The views left out unless asked for by name: the level-of-detail copies.
+LOD_VIEW = re.compile(r"^v_.+_lod\d$")
+
+#: One partition of a view, with its local year, as ``ogr2ogr -sql`` runs it.
+PARTITION_SQL = 'SELECT *, {local_year} AS local_year FROM "{source}" WHERE {where}'
+
+#: Removes the rows of some years from a GeoPackage layer. The R-tree's delete
+#: trigger is plain SQL, so SQLite runs it without GDAL's spatial functions.
+DELETE_YEARS_SQL = 'DELETE FROM "{layer}" WHERE local_year IN ({placeholders})'
+
+
+def dataset_views(connection: Connection) -> list[str]:
+    """Every dataset view, the level-of-detail ones left out."""
+    return sorted(view for view in inspect(connection).get_view_names()
+                  if view.startswith("v_") and not LOD_VIEW.match(view))
+
+
+def partition_sql(source: partitions.Source, provider_id: int, year: int) -> str:
+    """The query ``ogr2ogr`` reads one partition with."""
+    return PARTITION_SQL.format(local_year=source.year_sql, source=source.name,
+                                where=source.partition_filter(provider_id, year))
+
+
+def ogr2ogr_command(ogr2ogr: str, driver: str, destination: Path, settings: dict[str, str],
+                    source: partitions.Source, provider_id: int, year: int,
+                    append: bool) -> list[str]:
+    """The ``ogr2ogr`` run writing one partition into ``destination``.
+
+    The geometry type and CRS are given from the view's typmod rather than left
+    to be guessed from the first row, so every file of a view declares the same
+    ones whichever rows it happens to hold.
+    """
+    geometry_type, srid = source.geometries[source.primary_geometry]
+    command = [
+        ogr2ogr,
+        "-f", driver, str(destination), common.ogr_connection_string(settings),
+        "-sql", partition_sql(source, provider_id, year),
+        "-nln", source.name,
+        "-nlt", geometry_type,
+        "-a_srs", f"EPSG:{srid}",
+    ]
+    if append:
+        command.append("-append")
+    else:
+        command += ["-lco", "SPATIAL_INDEX=YES"]
+        if driver == FORMATS["gpkg"]:
+            command += ["-lco", f"GEOMETRY_NAME={source.primary_geometry}"]
+    if driver == FORMATS["gpkg"]:
+        command += ["-gt", str(TRANSACTION_SIZE)]
+    return command
+
+
+def run_ogr2ogr(command: list[str], settings: dict[str, str], logger: logging.Logger) -> None:
+    """Run ``ogr2ogr``, the password in the environment and its diagnostics surfaced.
+
+    Raises
+    ------
+    RuntimeError
+        If it exits with an error.
+    """
+    logger.debug("Running %s", " ".join(command))
+    environment = dict(os.environ)
+    if settings["password"]:
+        environment["PGPASSWORD"] = settings["password"]
+
+    result = subprocess.run(command, env=environment, text=True,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"ogr2ogr failed with exit code {result.returncode}:\n{result.stderr.strip()}")
+    if result.stderr.strip():
+        logger.warning("ogr2ogr: %s", result.stderr.strip())
+
+
+def geopackage_path(output: Path, view: str) -> Path:
+    """The GeoPackage of one view."""
+    return output / f"{view}.gpkg"
+
+
+def delete_years(path: Path, layer: str, years: list[int]) -> int:
+    """Delete the rows of ``years`` from a GeoPackage layer; returns how many went."""
+    connection = sqlite3.connect(path)
+    try:
+        with connection:
+            deleted = connection.execute(
+                DELETE_YEARS_SQL.format(layer=layer, placeholders=", ".join("?" * len(years))),
+                years).rowcount
+    finally:
+        connection.close()
+    return deleted
+
+
+# --------------------------------------------------------------------------
+# Writing
+# --------------------------------------------------------------------------
+
+def write_flatgeobuf(source: partitions.Source, found: list[tuple[int, int, int]],
+                     output: Path, years: list[int] | None, settings: dict[str, str],
+                     ogr2ogr: str, logger: logging.Logger) -> int:
+    """Write one FlatGeobuf per partition of ``found``, replacing any already there.
+
+    Each is written beside its final name and moved over it once complete, so an
+    interrupted run leaves the previous file of the partition in place. Returns
+    the partitions written.
+    """
+    for path in partitions.remove_stale_partitions(output, source.name, FGB_FILE_NAME,
+                                                   found, years):
+        logger.info("Removed %s: no rows left", path)
+
+    progress = common.ProgressReporter(len(found), source.name, logger, log_every=10)
+    for provider_id, year, _ in found:
+        path = partitions.partition_path(output, source.name, provider_id, year)
+        path.mkdir(parents=True, exist_ok=True)
+        # Ending in .fgb: the driver takes any other name for a directory to fill.
+        partial = path / ".data.partial.fgb"
+        run_ogr2ogr(ogr2ogr_command(ogr2ogr, FORMATS["fgb"], partial, settings, source,
+                                    provider_id, year, append=False), settings, logger)
+        os.replace(partial, path / FGB_FILE_NAME)
+        progress.advance()
+    progress.finish()
+    return len(found)
+
+
+def write_geopackage(source: partitions.Source, found: list[tuple[int, int, int]],
+                     output: Path, years: list[int] | None, settings: dict[str, str],
+                     ogr2ogr: str, logger: logging.Logger) -> int:
+    """Write the partitions of ``found`` into the view's GeoPackage.
+
+    A full run builds a new file; an incremental one deletes the rows of
+    ``years`` from the existing file first, which also takes out a provider's
+    year the database no longer has. Returns the partitions written.
+    """
+    final = geopackage_path(output, source.name)
+    if years is None:
+        path = output / f".{source.name}.partial.gpkg"
+        path.unlink(missing_ok=True)
+    else:
+        path = final
+        deleted = delete_years(path, source.name, years)
+        logger.info("Deleted %d row(s) of %s from %s", deleted,
+                    ", ".join(str(year) for year in years), path)
+
+    output.mkdir(parents=True, exist_ok=True)
+    progress = common.ProgressReporter(len(found), source.name, logger, log_every=10)
+    for provider_id, year, _ in found:
+        append = path.exists()
+        run_ogr2ogr(ogr2ogr_command(ogr2ogr, FORMATS["gpkg"], path, settings, source,
+                                    provider_id, year, append=append), settings, logger)
+        progress.advance()
+    progress.finish()
+
+    if years is None:
+        if path.exists():
+            os.replace(path, final)
+        else:
+            final.unlink(missing_ok=True)
+            logger.info("%s has no rows: no GeoPackage written", source.name)
+    return len(found)
+
+
+WRITERS = {"fgb": write_flatgeobuf, "gpkg": write_geopackage}
+
+
+def export_bundle(engine: Engine, output_format: str, output: Path, views: list[str] | None,
+                  years: list[int] | None, settings: dict[str, str], ogr2ogr: str,
+                  logger: logging.Logger) -> int:
+    """Write ``views``, or every dataset view, in ``output_format`` under ``output``.
+
+    Every view is described and its partitions counted before anything is
+    written, so a name that is not a dataset view — or, for an incremental
+    GeoPackage run, a view with no GeoPackage yet — fails the run before it has
+    touched a file.
+
+    Returns
+    -------
+    int
+        Partitions written, over every view.
+
+    Raises
+    ------
+    RuntimeError
+        If a view cannot be exported, or an incremental GeoPackage run has no file
+        to update.
+    """
+    with engine.connect() as connection:
+        names = views if views is not None else dataset_views(connection)
+        planned = []
+        for name in names:
+            if not name.startswith("v_"):
+                raise RuntimeError(f"{name} is not a dataset view (v_...).")
+            source = partitions.describe_source(connection, name)
+            if len(source.geometries) > 1:
+                raise RuntimeError(f"{name} has more than one geometry column.")
+            if output_format == "gpkg" and years is not None \
+                    and not geopackage_path(output, name).exists():
+                raise RuntimeError(f"{geopackage_path(output, name)} does not exist: "
+                                   f"run once without --years first")
+            planned.append((source, partitions.find_partitions(connection, source, years)))
+
+    written = 0
+    for source, found in planned:
+        written += WRITERS[output_format](source, found, output, years, settings, ogr2ogr, logger)
+    logger.info("Wrote %d partition(s) of %d view(s) to %s", written, len(planned), output)
+    return written
+
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(
+        description="Export the dataset views to FlatGeobuf or GeoPackage, partitioned by "
+                    "provider and year, for use in QGIS without a database.",
+        epilog="Without --years every partition is rewritten. Database settings not given "
+               "here are read from the environment (.env).",
+    )
+    parser.add_argument("-f", "--format", required=True, choices=sorted(FORMATS),
+                        dest="output_format",
+                        help="fgb: one FlatGeobuf per provider and year; gpkg: one "
+                             "GeoPackage per view")
+    parser.add_argument("-o", "--output-dir", required=True, type=Path,
+                        help="directory the bundle is written under")
+    parser.add_argument("--views", nargs="+", metavar="VIEW",
+                        help="the dataset views to write (default: all of them but the "
+                             "level-of-detail ones)")
+    parser.add_argument("-y", "--years", type=int, nargs="+", metavar="YEAR",
+                        help="rewrite only these years; for after an import replaced them")
+    parser.add_argument("--ogr2ogr", default="ogr2ogr",
+                        help="path to the ogr2ogr binary (default: found on PATH)")
+
+    common.add_database_arguments(parser)
+    parser.add_argument("--log-level", default=os.getenv("GISFIRE_LOG_LEVEL", "INFO"),
+                        choices=["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"],
+                        help="verbosity (env: GISFIRE_LOG_LEVEL, default INFO)")
+
+    arguments = parser.parse_args(argv)
+    for view in arguments.views or []:
+        if not view.startswith("v_"):
+            parser.error(f"{view} is not a dataset view: their names start with v_")
+    return arguments
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_arguments(argv)
+    logging.basicConfig(level=args.log_level, format=common.LOG_FORMAT)
+    logger = logging.getLogger("export-bundle")
+
+    if shutil.which(args.ogr2ogr) is None:
+        logger.error("ogr2ogr not found (looked for %r). It comes with GDAL and must be on PATH.",
+                     args.ogr2ogr)
+        return 1
+
+    try:
+        settings = common.resolve_database_settings(args)
+    except RuntimeError as error:
+        logger.error("%s", error)
+        return 1
+
+    engine = create_engine(common.database_url(settings))
+    try:
+        common.require_tables(engine, ["data_provider"], logger)
+        export_bundle(engine, args.output_format, args.output_dir, args.views, args.years,
+                      settings, args.ogr2ogr, logger)
+    except Exception as error:  # noqa: BLE001  (the CLI boundary: report, do not traceback)
+        logger.error("%s", error)
+        return 1
+    finally:
+        engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":  # pragma nocover
+    sys.exit(main())
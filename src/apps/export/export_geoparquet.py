@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Export a dataset view, or the generic tables, to partitioned GeoParquet.
+
+Streams every row of one relation — a provider's ``v_<dataset>_...`` view, or the
+generic ``wildfire`` or ``ignition`` table — out of the database through a
+server-side cursor and into `GeoParquet <https://geoparquet.org>`_ files, one per
+provider and year::
+
+    python3 -m src.apps.export.export_geoparquet --source v_gwis_wildfire \\
+        --output-dir exports
+
+    python3 -m src.apps.export.export_geoparquet --source wildfire --output-dir exports
+
+After an import has replaced some years, export only those::
+
+    python3 -m src.apps.export.export_geoparquet --source v_gwis_wildfire \\
+        --output-dir exports --years 2021 2022
+
+The application only reads the database. Database settings come from the
+environment (``.env``, see :mod:`src.settings`); every one of them can be
+overridden with a command-line argument.
+
+The layout on disk
+------------------
+
+One directory per source, one file per provider and local year, laid out as
+:mod:`src.apps.export.partitions` describes::
+
+    exports/v_gwis_wildfire/data_provider_id=3/local_year=2021/data.parquet
+
+``data_provider_id`` is not repeated inside the files: readers restore it, and
+``local_year``, from the path, and would refuse a column present in both. A view
+also carries the provider's name and product, for a file read on its own.
+
+Reading one year of one dataset back is then a directory read, and anything
+narrower is left to the reader::
+
+    geopandas.read_parquet("exports/v_gwis_wildfire/data_provider_id=3/local_year=2021")
+
+What a file holds
+-----------------
+
+The relation's columns as they are, with the types they have in PostgreSQL
+(:func:`column_expression`): integers stay integers of the same width, a
+``timestamptz`` is an instant in UTC, a ``timestamp`` — the views' ``*_local``
+columns — stays a naive wall-clock reading, and a ``numeric`` with a declared
+scale stays a decimal. A type with no Parquet equivalent is written as its text.
+
+Every geometry column is written as WKB and declared in the ``geo`` metadata
+GeoParquet 1.1 specifies, with its geometry type and the CRS of its SRID, so a
+reader needs nothing from the database to place it. The primary geometry also
+gets a ``bbox`` struct column — the specification's *bounding box covering* —
+whose row group statistics are what lets a reader skip the groups outside the
+area it asked for, without decoding a single geometry.
+
+The columns the database derives from others — the active period and the
+simplified perimeters (:data:`~src.apps.export.partitions.DERIVED_COLUMNS`) —
+are left out: they are cheaper to recompute from the file than to store in it.
+
+Row groups that can be skipped
+------------------------------
+
+A filter can only skip a row group if the group's statistics exclude it, and
+statistics over rows in arbitrary order exclude nothing: every group spans the
+whole dataset. So each partition is read ordered by the geohash of its rows'
+centres — a Z-order curve, which keeps rows that are near each other on the map
+near each other in the file — and cut into groups of :data:`ROW_GROUP_SIZE` rows,
+each one a compact patch of the map whose ``bbox`` statistics a spatial filter
+tests. The row group is also the unit that is streamed: the cursor fetches one
+group's rows at a time, which is all the memory a partition of any size takes.
+
+Files are compressed with zstd, which on these columns — repeated provider
+strings, sorted timestamps, WKB coordinates — is both smaller and faster to read
+than the default Snappy.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pyproj
+
+from geoalchemy2 import Geometry
+from sqlalchemy import BigInteger
+from sqlalchemy import Boolean
+from sqlalchemy import Connection
+from sqlalchemy import Date
+from sqlalchemy import DateTime
+from sqlalchemy import Engine
+from sqlalchemy import Float
+from sqlalchemy import Integer
+from sqlalchemy import Interval
+from sqlalchemy import Numeric
+from sqlalchemy import SmallInteger
+from sqlalchemy import String
+from sqlalchemy import Time
+from sqlalchemy import create_engine
+from sqlalchemy import text
+
+import src.settings  # noqa: F401  (imported for the side effect of loading .env)
+
+from src.apps.export import partitions
+from src.apps.imports import common
+
+#: The partition key that is a column of every source, written in the path
+#: rather than in the files.
+PROVIDER_KEY = partitions.PARTITION_KEYS[0]
+
+#: Rows per row group, and per fetch from the server-side cursor. Small enough
+#: that a group covers a patch of the map a spatial filter can rule out, large
+#: enough that the per-group overhead stays a few percent of a GWIS year.
+ROW_GROUP_SIZE = 50_000
+
+#: Parquet compression codec.
+COMPRESSION = "zstd"
+
+#: The GeoParquet specification version the ``geo`` metadata follows.
+GEOPARQUET_VERSION = "1.1.0"
+
+#: Name of the bounding box covering column of the primary geometry.
+BBOX_COLUMN = "bbox"
+
+#: The file written in each partition directory.
+FILE_NAME = "data.parquet"
+
+#: PostGIS geometry type names as the GeoParquet ``geometry_types`` spells them.
+#: ``GEOMETRY`` — any type — is an empty list there, which says the same.
+GEOMETRY_TYPES = {
+    "POINT": "Point",
+    "LINESTRING": "LineString",
+    "POLYGON": "Polygon",
+    "MULTIPOINT": "MultiPoint",
+    "MULTILINESTRING": "MultiLineString",
+    "MULTIPOLYGON": "MultiPolygon",
+    "GEOMETRYCOLLECTION": "GeometryCollection",
+}
+
+#: One partition's rows, nearest first along a geohash.
+PARTITION_SQL = """
+SELECT {columns}
+FROM {source}
+WHERE {where}
+ORDER BY {order} NULLS LAST, id
+"""
+
+#: The sort key of a geometry: the geohash of its bounding box's centre, in
+#: lon/lat whatever the geometry's own CRS.
+GEOHASH_SQL = "ST_GeoHash(ST_Transform(ST_Centroid(ST_Envelope({column})), 4326), 12)"
+
+
+def column_expression(name: str, column_type: object) -> tuple[str, pa.DataType]:
+    """The ``SELECT`` expression of a column and the Arrow type it is written as.
+
+    The SQL side is where a value is brought to something Arrow takes as it is —
+    a geometry to its WKB, an unbounded ``numeric`` to a double, anything without
+    an Arrow equivalent (a range, an array, a JSON document) to its text — so
+    that no row is converted in Python.
+    """
+    quoted = f'"{name}"'
+    if isinstance(column_type, Geometry):
+        return f"ST_AsBinary({quoted})", pa.binary()
+    if isinstance(column_type, Boolean):
+        return quoted, pa.bool_()
+    if isinstance(column_type, SmallInteger):
+        return quoted, pa.int16()
+    if isinstance(column_type, BigInteger):
+        return quoted, pa.int64()
+    if isinstance(column_type, Integer):
+        return quoted, pa.int32()
+    if isinstance(column_type, Float):
+        return f"{quoted}::double precision", pa.float64()
+    if isinstance(column_type, Numeric):
+        if column_type.precision is not None and column_type.scale is not None:
+            return quoted, pa.decimal128(column_type.precision, column_type.scale)
+        return f"{quoted}::double precision", pa.float64()
+    if isinstance(column_type, DateTime):
+        return quoted, pa.timestamp("us", tz="UTC" if column_type.timezone else None)
+    if isinstance(column_type, Date):
+        return quoted, pa.date32()
+    if isinstance(column_type, Time):
+        return quoted, pa.time64("us")
+    if isinstance(column_type, Interval):
+        return quoted, pa.duration("us")
+    if isinstance(column_type, String):
+        return quoted, pa.string()
+    return f"{quoted}::text", pa.string()
+
+
+def bbox_type() -> pa.DataType:
+    """The bounding box covering column, as GeoParquet 1.1 specifies it."""
+    return pa.struct([(field, pa.float64()) for field in ("xmin", "ymin", "xmax", "ymax")])
+
+
+def geo_metadata(source: partitions.Source) -> dict:
+    """The ``geo`` file metadata: one entry per geometry column, and the covering.
+
+    An SRID of 4326 is declared as OGC:CRS84, which is the same datum with the
+    axes in the order the coordinates are actually written — longitude first.
+    EPSG:4326 proper is latitude first, and a reader honouring it would swap them.
+    """
+    columns = {}
+    for column, (geometry_type, srid) in source.geometries.items():
+        crs = pyproj.CRS("OGC:CRS84") if srid == 4326 else pyproj.CRS.from_epsg(srid)
+        columns[column] = {
+            "encoding": "WKB",
+            "geometry_types": [GEOMETRY_TYPES[geometry_type]] if geometry_type in GEOMETRY_TYPES else [],
+            "crs": crs.to_json_dict(),
+        }
+    columns[source.primary_geometry]["covering"] = {
+        "bbox": {field: [BBOX_COLUMN, field] for field in ("xmin", "ymin", "xmax", "ymax")}
+    }
+    return {"version": GEOPARQUET_VERSION, "primary_column": source.primary_geometry,
+            "columns": columns}
+
+
+def partition_query(source: partitions.Source) -> tuple[str, pa.Schema]:
+    """The query reading one partition, and the schema its rows are written with.
+
+    The query returns the exported columns in order and then the four corners of
+    the primary geometry's bounding box, which :func:`record_batch` folds into the
+    ``bbox`` struct. ``data_provider_id`` is left to the path.
+    """
+    expressions, fields = [], []
+    for column, column_type in source.columns:
+        if column == PROVIDER_KEY:
+            continue
+        expression, arrow_type = column_expression(column, column_type)
+        expressions.append(f'{expression} AS "{column}"')
+        fields.append(pa.field(column, arrow_type))
+
+    primary = f'"{source.primary_geometry}"'
+    expressions += [f"ST_XMin({primary}) AS bbox_xmin", f"ST_YMin({primary}) AS bbox_ymin",
+                    f"ST_XMax({primary}) AS bbox_xmax", f"ST_YMax({primary}) AS bbox_ymax"]
+    fields.append(pa.field(BBOX_COLUMN, bbox_type()))
+
+    sql = PARTITION_SQL.format(columns=",\n       ".join(expressions), source=f'"{source.name}"',
+                               where=source.partition_filter(),
+                               order=GEOHASH_SQL.format(column=primary))
+    schema = pa.schema(fields, metadata={b"geo": json.dumps(geo_metadata(source)).encode()})
+    return sql, schema
+
+
+def record_batch(rows: list, schema: pa.Schema) -> pa.RecordBatch:
+    """Turn fetched rows into a batch of ``schema``, the bbox corners into a struct."""
+    columns = list(zip(*rows))
+    arrays = [pa.array(values, type=field.type) for values, field in zip(columns, list(schema)[:-1])]
+    corners = columns[-4:]
+    arrays.append(pa.array(
+        [None if xmin is None else {"xmin": xmin, "ymin": ymin, "xmax": xmax, "ymax": ymax}
+         for xmin, ymin, xmax, ymax in zip(*corners)],
+        type=schema.field(BBOX_COLUMN).type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def statistics_columns(source: partitions.Source, schema: pa.Schema) -> list[str]:
+    """The leaf columns row group statistics are written for: all but the geometries.
+
+    Statistics on a WKB column are two arbitrary byte strings per group, and are
+    left out; the ``bbox`` fields are what a spatial filter reads instead. A
+    struct's statistics are its fields', named by their dotted path.
+    """
+    leaves = []
+    for field in schema:
+        if field.name in source.geometries:
+            continue
+        if pa.types.is_struct(field.type):
+            leaves += [f"{field.name}.{child.name}" for child in field.type]
+        else:
+            leaves.append(field.name)
+    return leaves
+
+
+# --------------------------------------------------------------------------
+# Partitions
+# --------------------------------------------------------------------------
+
+def write_partition(connection: Connection, source: partitions.Source, path: Path, provider_id: int,
+                    year: int, row_group_size: int, progress: common.ProgressReporter) -> int:
+    """Stream one partition into ``path``, one row group per fetch.
+
+    Written beside the final name and moved over it only once complete, so a
+    reader never sees a half-written file and an interrupted run leaves the
+    previous export of the partition in place.
+
+    Returns
+    -------
+    int
+        Rows written.
+    """
+    sql, schema = partition_query(source)
+    path.mkdir(parents=True, exist_ok=True)
+    final = path / FILE_NAME
+    partial = path / f".{FILE_NAME}.partial"
+
+    rows = 0
+    result = connection.execution_options(stream_results=True, yield_per=row_group_size).execute(
+        text(sql), {"provider_id": provider_id, "year": year})
+    with pq.ParquetWriter(partial, schema, compression=COMPRESSION,
+                          write_statistics=statistics_columns(source, schema)) as writer:
+        for fetched in result.partitions():
+            writer.write_batch(record_batch(fetched, schema), row_group_size=row_group_size)
+            rows += len(fetched)
+            progress.advance(len(fetched))
+    os.replace(partial, final)
+    return rows
+
+
+def export(engine: Engine, source_name: str, output: Path, years: list[int] | None,
+           row_group_size: int, logger: logging.Logger) -> tuple[int, int]:
+    """Export ``source_name`` under ``output``, every partition or those of ``years``.
+
+    A partition the source no longer has — a provider's year emptied by an
+    import — is removed, so that the directory holds exactly what the database
+    does (:func:`~src.apps.export.partitions.remove_stale_partitions`).
+
+    Returns
+    -------
+    tuple of int
+        Partitions written and partitions removed.
+    """
+    with engine.connect() as connection:
+        source = partitions.describe_source(connection, source_name)
+        found = partitions.find_partitions(connection, source, years)
+        stale = partitions.remove_stale_partitions(output, source.name, FILE_NAME, found, years)
+        for path in stale:
+            logger.info("Removed %s: no rows left", path)
+
+        total = sum(row_count for _, _, row_count in found)
+        progress = common.ProgressReporter(total, source.name, logger, log_every=row_group_size)
+        for provider_id, year, _ in found:
+            path = partitions.partition_path(output, source.name, provider_id, year)
+            rows = write_partition(connection, source, path, provider_id, year,
+                                   row_group_size, progress)
+            logger.debug("Wrote %d row(s) to %s", rows, path)
+        progress.finish()
+
+    logger.info("Exported %s: %d partition(s) written to %s, %d removed",
+                source.name, len(found), output / source.name, len(stale))
+    return len(found), len(stale)
+
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(
+        description="Export a dataset view, or the generic wildfire or ignition table, to "
+                    "GeoParquet files partitioned by provider and year.",
+        epilog="Without --years every partition of the source is rewritten. Database settings "
+               "not given here are read from the environment (.env).",
+    )
+    parser.add_argument("-s", "--source", required=True,
+                        help=f"what to export: {' or '.join(partitions.TABLES)}, or a dataset view "
+                             f"such as v_gwis_wildfire")
+    parser.add_argument("-o", "--output-dir", required=True, type=Path,
+                        help="directory the source's partitions are written under")
+    parser.add_argument("-y", "--years", type=int, nargs="+", metavar="YEAR",
+                        help="export only these years; for after an import replaced them")
+    parser.add_argument("--row-group-size", type=int, default=ROW_GROUP_SIZE, metavar="ROWS",
+                        help=f"rows per Parquet row group (default {ROW_GROUP_SIZE})")
+
+    common.add_database_arguments(parser)
+    parser.add_argument("--log-level", default=os.getenv("GISFIRE_LOG_LEVEL", "INFO"),
+                        choices=["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"],
+                        help="verbosity (env: GISFIRE_LOG_LEVEL, default INFO)")
+
+    arguments = parser.parse_args(argv)
+    if arguments.row_group_size < 1:
+        parser.error("--row-group-size must be at least 1")
+    return arguments
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_arguments(argv)
+    logging.basicConfig(level=args.log_level, format=common.LOG_FORMAT)
+    logger = logging.getLogger("export-geoparquet")
+
+    try:
+        settings = common.resolve_database_settings(args)
+    except RuntimeError as error:
+        logger.error("%s", error)
+        return 1
+
+    engine = create_engine(common.database_url(settings))
+    try:
+        common.require_tables(engine, ["data_provider"], logger)
+        export(engine, args.source, args.output_dir, args.years, args.row_group_size, logger)
+    except Exception as error:  # noqa: BLE001  (the CLI boundary: report, do not traceback)
+        logger.error("%s", error)
+        return 1
+    finally:
+        engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":  # pragma nocover
+    sys.exit(main())
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""What every export shares: the sources, and how they are cut into partitions.
+
+An export writes one relation — a dataset view, or one of the generic tables —
+as one file per provider and *local year*: the year a fire counts towards in
+every report (:data:`~src.apps.imports.common.LOCAL_YEAR_SQL`), or the local
+year of an ignition's instant. That is the unit an import replaces, so it is
+also the unit an export rewrites after one: ``--years`` rewrites those years'
+partitions and leaves every other file alone.
+
+Partitions are laid out the way Hive, Spark, DuckDB and ``pyarrow.dataset`` read
+without being told (:func:`partition_path`)::
+
+    exports/v_gwis_wildfire/data_provider_id=3/local_year=2021/
+
+The key is ``local_year`` rather than ``year`` because several views already
+have a ``year`` column — the one the provider published, which is not always the
+same thing.
+"""
+
+from __future__ import annotations
+
+import shutil
+
+from pathlib import Path
+
+from sqlalchemy import Connection
+from sqlalchemy import inspect
+from sqlalchemy import text
+
+#: The generic tables, exported across every provider. Any view whose name starts
+#: with ``v_`` is a source as well; see :func:`describe_source`.
+TABLES = ("wildfire", "ignition")
+
+#: Columns the database computes from others, left out of every export: the
+#: active period is the two dates, and the simplified perimeters are the
+#: perimeter at three tolerances.
+DERIVED_COLUMNS = frozenset({"active_period", "perimeter_z1", "perimeter_z2", "perimeter_z3"})
+
+#: The partition keys, in path order.
+PARTITION_KEYS = ("data_provider_id", "local_year")
+
+#: The geometry columns of a relation, with their typmod. PostGIS lists a view's
+#: columns here too, provided the view selects them straight from a table — which
+#: every dataset view does, for QGIS's sake.
+GEOMETRY_COLUMNS_SQL = """
+SELECT f_geometry_column, type, srid
+FROM geometry_columns
+WHERE f_table_schema = current_schema() AND f_table_name = :relation
+"""
+
+#: The local year of a row, for either time column: the same expression as
+#: :data:`~src.apps.imports.common.LOCAL_YEAR_SQL`, which names the wildfire's.
+LOCAL_YEAR_TEMPLATE = "EXTRACT(YEAR FROM {time_column} AT TIME ZONE COALESCE(time_zone, 'UTC'))::integer"
+
+#: The partitions of a source, with their row counts, optionally narrowed to
+#: some years.
+PARTITIONS_SQL = """
+SELECT data_provider_id, {year} AS local_year, count(*) AS row_count
+FROM {source}
+{where}
+GROUP BY 1, 2
+ORDER BY 1, 2
+"""
+
+#: The rows of one partition. The ±1 day window is what lets the time index
+#: narrow the scan before the local year is computed on every row, as in the
+#: yearly summary's refresh.
+PARTITION_FILTER_SQL = """data_provider_id = {provider_id}
+  AND {time_column} >= make_timestamptz({year}, 1, 1, 0, 0, 0, 'UTC') - interval '1 day'
+  AND {time_column} < make_timestamptz({year} + 1, 1, 1, 0, 0, 0, 'UTC') + interval '1 day'
+  AND {local_year} = {year}"""
+
+
+class Source:
+    """A relation to export, as the database describes it.
+
+    Attributes
+    ----------
+    name : str
+        The table or view.
+    columns : list of tuple
+        ``(name, SQLAlchemy type)`` of every column, in the relation's order, the
+        derived columns left out.
+    geometries : dict
+        ``{column: (PostGIS type, SRID)}`` of every geometry column left in, in
+        the relation's order; the first is the primary one.
+    time_column : str
+        The instant the year is taken from: ``start_date_time`` for a wildfire,
+        ``date_time`` for an ignition.
+    """
+
+    def __init__(self, name: str, columns: list[tuple[str, object]],
+                 geometries: dict[str, tuple[str, int]], time_column: str) -> None:
+        self.name = name
+        self.columns = columns
+        self.geometries = geometries
+        self.time_column = time_column
+
+    @property
+    def primary_geometry(self) -> str:
+        return next(iter(self.geometries))
+
+    @property
+    def year_sql(self) -> str:
+        return LOCAL_YEAR_TEMPLATE.format(time_column=self.time_column)
+
+    def partition_filter(self, provider_id: int | str = ":provider_id",
+                         year: int | str = ":year") -> str:
+        """The ``WHERE`` condition of one partition.
+
+        Bound parameters by default; a caller handing the query to ``ogr2ogr``,
+        which takes no parameters, passes the two integers instead.
+        """
+        return PARTITION_FILTER_SQL.format(provider_id=provider_id, year=year,
+                                           time_column=self.time_column,
+                                           local_year=self.year_sql)
+
+
+def describe_source(connection: Connection, name: str) -> Source:
+    """Read the columns of ``name`` from the catalogue.
+
+    Raises
+    ------
+    RuntimeError
+        If ``name`` is neither one of :data:`TABLES` nor an existing ``v_`` view,
+        or has no geometry, no provider or no time column to partition on.
+    """
+    inspector = inspect(connection)
+    if name not in TABLES and not (name.startswith("v_") and name in inspector.get_view_names()):
+        raise RuntimeError(
+            f"{name} is not a source that can be exported: name one of "
+            f"{', '.join(TABLES)} or a dataset view (v_...).")
+
+    reflected = [(column["name"], column["type"]) for column in inspector.get_columns(name)]
+    names = {column for column, _ in reflected}
+    time_column = next((column for column in ("start_date_time", "date_time") if column in names), None)
+    if time_column is None or "data_provider_id" not in names:
+        raise RuntimeError(f"{name} has no data_provider_id and start_date_time or date_time "
+                           f"to partition on.")
+
+    typmods = {column: (geometry_type, srid) for column, geometry_type, srid
+               in connection.execute(text(GEOMETRY_COLUMNS_SQL), {"relation": name})}
+    geometries = {column: typmods[column] for column, _ in reflected
+                  if column in typmods and column not in DERIVED_COLUMNS}
+    if not geometries:
+        raise RuntimeError(f"{name} has no geometry column.")
+
+    columns = [(column, column_type) for column, column_type in reflected
+               if column not in DERIVED_COLUMNS]
+    return Source(name, columns, geometries, time_column)
+
+
+def find_partitions(connection: Connection, source: Source,
+                    years: list[int] | None) -> list[tuple[int, int, int]]:
+    """``(provider id, year, rows)`` of every partition, or of those in ``years``."""
+    where = f"WHERE {source.year_sql} = ANY(:years)" if years is not None else ""
+    sql = PARTITIONS_SQL.format(year=source.year_sql, source=f'"{source.name}"', where=where)
+    return [tuple(row) for row in connection.execute(text(sql), {"years": years})]
+
+
+def partition_path(output: Path, source: str, provider_id: int, year: int) -> Path:
+    """The directory of one partition, in Hive's ``key=value`` form."""
+    provider_key, year_key = PARTITION_KEYS
+    return output / source / f"{provider_key}={provider_id}" / f"{year_key}={year}"
+
+
+def existing_partitions(output: Path, source: str, file_name: str) -> set[tuple[int, int]]:
+    """The ``(provider id, year)`` partitions of ``source`` holding a ``file_name``.
+
+    A directory without one is an export that never completed, and is not a
+    partition.
+    """
+    provider_key, year_key = PARTITION_KEYS
+    return {
+        (int(path.parent.parent.name.split("=", 1)[1]), int(path.parent.name.split("=", 1)[1]))
+        for path in (output / source).glob(f"{provider_key}=*/{year_key}=*/{file_name}")
+    }
+
+
+def remove_stale_partitions(output: Path, source: str, file_name: str,
+                            partitions: list[tuple[int, int, int]],
+                            years: list[int] | None) -> list[Path]:
+    """Delete the partitions on disk the database no longer has.
+
+    Only among the partitions this run rewrites — those of ``years``, or all of
+    them — so a provider's year emptied by an import goes, and a year the run was
+    not asked about stays whatever it holds.
+
+    Returns
+    -------
+    list of pathlib.Path
+        The directories removed.
+    """
+    current = {(provider_id, year) for provider_id, year, _ in partitions}
+    removed = []
+    for provider_id, year in sorted(existing_partitions(output, source, file_name)):
+        if (years is None or year in years) and (provider_id, year) not in current:
+            path = partition_path(output, source, provider_id, year)
+            shutil.rmtree(path)
+            removed.append(path)
+    return removed
@@ -39,6 +39,11 @@ boundary the OCHA import loads at level 0. If that has not been run, they are
 imported as roots and the link is filled in by re-running this import once it has;
 see :func:`relink_orphans`.
 
+Each boundary written is also cut into
+:class:`~src.data_model.geography.admin_boundary.AdminBoundaryPart` pieces in the
+same transaction: those, not the boundaries themselves, are what the wildfire
+importers and statistics attribute fires against.
+
 Database settings come from the environment (``.env``, see :mod:`src.settings`);
 every one of them can be overridden with a command-line argument.
 
@@ -452,7 +457,8 @@ def import_boundaries(args: argparse.Namespace, engine: Engine, logger: logging.
     logger.info("Importing %d GeoPackage(s) as the %s edition", len(geopackages), args.edition)
 
     common.require_tables(
-        engine, ["admin_boundary", "caop_admin_boundary", "data_provider"], logger
+        engine, ["admin_boundary", "admin_boundary_part", "caop_admin_boundary", "data_provider"],
+        logger,
     )
     common.create_staging_schema(engine, args.staging_schema)
 
@@ -475,6 +481,7 @@ def import_boundaries(args: argparse.Namespace, engine: Engine, logger: logging.
             for kind in caop.KINDS
         )
         relink_orphans(session, provider, country_id, logger)
+        common.cut_admin_boundary_parts(session, logger, provider.id)
 
         if not args.keep_staging:
             for staging_table in staging_tables.values():
@@ -22,6 +22,11 @@ Run it with::
 
     python3 -m src.apps.imports.admin_boundaries.ocha.import_admin_boundaries -g adm0_polygons.gpkg
 
+Each boundary written is also cut into
+:class:`~src.data_model.geography.admin_boundary.AdminBoundaryPart` pieces in the
+same transaction: those, not the boundaries themselves, are what the wildfire
+importers and statistics attribute fires against.
+
 Database settings come from the environment (``.env``, see :mod:`src.settings`);
 every one of them can be overridden with a command-line argument.
 
@@ -170,7 +175,8 @@ def import_boundaries(args: argparse.Namespace, engine: Engine, logger: logging.
     """
     staging_table = f"{args.staging_schema}.{args.staging_table}"
 
-    common.require_tables(engine, ["admin_boundary", "ocha_admin_boundary", "data_provider"], logger)
+    common.require_tables(engine, ["admin_boundary", "admin_boundary_part", "ocha_admin_boundary",
+                                   "data_provider"], logger)
     common.create_staging_schema(engine, args.staging_schema)
     common.load_staging_table(str(args.geopackage), args.layer, staging_table, args,
                               common.resolve_database_settings(args), logger)
@@ -178,6 +184,7 @@ def import_boundaries(args: argparse.Namespace, engine: Engine, logger: logging.
     with Session(engine) as session:
         provider = get_or_create_data_provider(session, logger)
         imported = transform(session, provider, staging_table, logger)
+        common.cut_admin_boundary_parts(session, logger, provider.id)
         if not args.keep_staging:
             common.drop_staging_table(session, staging_table, logger)
         session.commit()
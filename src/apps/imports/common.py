@@ -18,15 +18,24 @@ application that resolves its database settings here gets the file read for it a
 does not have to remember to import :mod:`src.settings` itself.
 
 Requires the ``ogr2ogr`` binary (GDAL) on ``PATH``. It is a system dependency,
-not a Python package.
+not a Python package. ``--loader copy`` reads the source in-process instead and
+needs the GDAL Python bindings (``osgeo``) matching that same library; they are
+imported only when asked for, and without them the load falls back to
+``ogr2ogr``.
 """
 
 from __future__ import annotations
 
 import argparse
 import datetime
+import decimal
+import hashlib
 import logging
+import multiprocessing
 import os
+import queue
+import re
+import struct
 import subprocess
 import sys
 import threading
@@ -34,18 +43,34 @@ import time
 import typing
 import zipfile
 
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+from dataclasses import dataclass
 from pathlib import Path
 
+import numpy
+import psycopg
+import shapely
+
+from sqlalchemy import Connection
 from sqlalchemy import Engine
+from sqlalchemy import create_engine
+from sqlalchemy import func
 from sqlalchemy import select
 from sqlalchemy import text
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.engine import URL
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
 
 import src.settings  # noqa: F401  (imported for the side effect of loading .env)
 
 from src.data_model.data_provider import DataProvider
+from src.data_model.geography import SUBDIVIDE_VERTICES
+from src.data_model.source_file import SourceFile
+from src.data_model.wildfire_boundary_area import BOUNDARY_AREA_LEVELS
+from src.data_model.wildfire_yearly_summary import SURFACE_PERIMETER
 from src.providers import ocha
 
 #: Where the importers unload their staging tables. A schema of its own,
@@ -54,6 +79,12 @@ from src.providers import ocha
 #: migration.
 DEFAULT_STAGING_SCHEMA = "staging"
 
+#: The two ways :func:`load_staging_table` can land a layer. ``ogr2ogr`` is the
+#: default and the fallback; ``copy`` is the in-process loader, see
+#: :func:`copy_staging_table`.
+LOADERS = ("ogr2ogr", "copy")
+DEFAULT_LOADER = "ogr2ogr"
+
 
 # --------------------------------------------------------------------------
 # Command line
@@ -86,9 +117,14 @@ def add_staging_arguments(parser: argparse.ArgumentParser, default_table: str) -
 
 
 def add_common_arguments(parser: argparse.ArgumentParser) -> None:
-    """Add the options every importer has: the ``ogr2ogr`` path and the log level."""
+    """Add the options every importer has: the staging loader and the log level."""
     parser.add_argument("--ogr2ogr", default="ogr2ogr",
                         help="path to the ogr2ogr binary (default: found on PATH)")
+    parser.add_argument("--loader", default=DEFAULT_LOADER, choices=LOADERS,
+                        help="how the source lands in the staging table: 'ogr2ogr' runs the "
+                             "binary, 'copy' reads the layer in-process through the GDAL "
+                             "Python bindings and streams it with a binary COPY "
+                             f"(default: {DEFAULT_LOADER})")
     parser.add_argument("--log-level", default=os.getenv("GISFIRE_LOG_LEVEL", "INFO"),
                         choices=["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"],
                         help="verbosity (env: GISFIRE_LOG_LEVEL, default INFO)")
@@ -235,14 +271,30 @@ def shapefile_datasource(path: Path) -> tuple[str, str]:
 # Staging
 # --------------------------------------------------------------------------
 
+#: Layer creation options every staging table is loaded with.
+#:
+#: ``UNLOGGED`` because a staging table is rebuilt from its source on every run
+#: and dropped at the end of it: writing it to the WAL as well buys crash safety
+#: nobody wants for it, doubles the write volume of the load, and on a replicated
+#: cluster ships a 300 MB archive's worth of rows to every standby, where an
+#: unlogged table cannot even be read. ``SPATIAL_INDEX=NONE`` because
+#: :func:`index_staging_table` builds the index after the load instead of GDAL
+#: creating it up front and maintaining it through every insert.
+STAGING_LAYER_OPTIONS = ["UNLOGGED=ON", "SPATIAL_INDEX=NONE"]
+
+#: Builds one index on a loaded staging table, once.
+STAGING_INDEX_SQL = "CREATE INDEX IF NOT EXISTS {name} ON {staging_table} USING {method} ({column})"
+
+
 def load_staging_table(datasource: str, layer: str, staging_table: str,
                        args: argparse.Namespace, settings: dict[str, str],
                        logger: logging.Logger, geometry_type: str = "MULTIPOLYGON",
                        progress: bool | None = None, target_srs: str = "EPSG:4326",
                        open_options: list[str] | None = None,
                        append: bool = False, fid_column: str = "fid",
-                       creation_options: list[str] | None = None) -> None:
-    """Copy one layer into the staging table with ``ogr2ogr``.
+                       creation_options: list[str] | None = None,
+                       index_columns: list[str] | None = None) -> None:
+    """Copy one layer into the staging table with ``ogr2ogr``, then index and analyse it.
 
     Geometries are promoted to ``geometry_type`` and forced to ``target_srs``,
     even for a source that already publishes in it — an import should not quietly
@@ -293,8 +345,56 @@ def load_staging_table(datasource: str, layer: str, staging_table: str,
     redirected log. ``progress`` overrides that decision either way — parallel
     workers pass ``False``, because several bars drawn onto one terminal at once
     are unreadable.
+
+    ``args.loader`` chooses how the layer is landed. ``"copy"`` hands the same
+    arguments to :func:`copy_staging_table`, which reads the layer in this process
+    and streams it with a binary ``COPY`` instead of ``ogr2ogr``'s row-by-row
+    inserts; the table it leaves behind has the same columns and the same ``fid``.
+    Without the GDAL Python bindings it falls back to ``ogr2ogr`` with a warning,
+    so asking for the faster loader never makes an import fail that would
+    otherwise have run.
+
+    The table is created ``UNLOGGED`` and without its spatial index, which
+    :func:`index_staging_table` builds once the rows are in, with a btree on each
+    of ``index_columns`` — the fields a transform filters, groups or slices the
+    staged rows by — before analysing the table. Every importer therefore starts
+    its transform from an indexed table with statistics, whether or not it runs an
+    ``ANALYZE`` of its own afterwards; those that rewrite staged columns first
+    still do.
+
+    The time it takes is added up per process, which is how :func:`run_imports`
+    tells a file's loading from its mapping.
     """
+    started = time.monotonic()
+    try:
+        _load_staging_table(datasource, layer, staging_table, args, settings, logger,
+                            geometry_type, progress, target_srs, open_options, append,
+                            fid_column, creation_options)
+        index_staging_table(staging_table, settings, logger, index_columns)
+    finally:
+        # Added to rather than set: an import that appends several files into one
+        # table — the CAOP's four territories — loads more than once per file.
+        _STAGE_SECONDS["load"] = _STAGE_SECONDS.get("load", 0.0) + time.monotonic() - started
+
+
+def _load_staging_table(datasource: str, layer: str, staging_table: str,
+                        args: argparse.Namespace, settings: dict[str, str],
+                        logger: logging.Logger, geometry_type: str, progress: bool | None,
+                        target_srs: str, open_options: list[str] | None, append: bool,
+                        fid_column: str, creation_options: list[str] | None) -> None:
+    """Do the work of :func:`load_staging_table`, untimed."""
     show_progress = logger.isEnabledFor(logging.INFO) if progress is None else progress
+    if getattr(args, "loader", DEFAULT_LOADER) == "copy":
+        if _gdal_bindings() is not None:
+            copy_staging_table(datasource, layer, staging_table, settings, logger,
+                               geometry_type=geometry_type, progress=show_progress,
+                               target_srs=target_srs, open_options=open_options,
+                               append=append, fid_column=fid_column,
+                               creation_options=creation_options)
+            return
+        logger.warning("--loader copy needs the GDAL Python bindings (osgeo), which are not "
+                       "installed; loading with ogr2ogr instead")
+
     command = [
         args.ogr2ogr,
         "-f", "PostgreSQL", ogr_connection_string(settings),
@@ -310,6 +410,7 @@ def load_staging_table(datasource: str, layer: str, staging_table: str,
     ]
     if not append:
         command += ["-lco", "GEOMETRY_NAME=geom", "-lco", f"FID={fid_column}"]
+        command += [option for creation in STAGING_LAYER_OPTIONS for option in ("-lco", creation)]
         for option in creation_options or []:
             command += ["-lco", option]
     if show_progress:
@@ -334,6 +435,298 @@ def load_staging_table(datasource: str, layer: str, staging_table: str,
         logger.warning("ogr2ogr: %s", result.stderr.strip())
 
 
+#: Geometry types :func:`copy_staging_table` can promote to, by the name
+#: ``ogr2ogr -nlt`` takes, with the OGR constant's name. Looked up by name rather
+#: than holding the constants so this module imports without GDAL installed.
+COPY_GEOMETRY_TYPES = {
+    "POINT": "wkbPoint",
+    "MULTIPOINT": "wkbMultiPoint",
+    "LINESTRING": "wkbLineString",
+    "MULTILINESTRING": "wkbMultiLineString",
+    "POLYGON": "wkbPolygon",
+    "MULTIPOLYGON": "wkbMultiPolygon",
+}
+
+#: The EWKB flag saying an SRID follows the geometry type.
+EWKB_SRID_FLAG = 0x20000000
+
+
+def _gdal_bindings() -> tuple[typing.Any, typing.Any, typing.Any] | None:
+    """Return the ``(gdal, ogr, osr)`` modules, or ``None`` if they are not installed.
+
+    Imported here rather than at the top of the module: the bindings are only
+    needed by ``--loader copy``, and a GDAL whose Python package does not match
+    the system library is common enough that every other import must not depend
+    on it.
+    """
+    try:
+        from osgeo import gdal
+        from osgeo import ogr
+        from osgeo import osr
+    except ImportError:
+        return None
+    gdal.UseExceptions()
+    return gdal, ogr, osr
+
+
+def launder_column_name(name: str) -> str:
+    """Return the column name ``ogr2ogr`` would give a field, with ``LAUNDER=YES``.
+
+    Lower case, with the three characters the PostgreSQL driver replaces turned
+    into underscores and cut to PostgreSQL's 63-byte identifier limit. The
+    importers name staging columns the way ``ogr2ogr`` lands them, so the
+    in-process loader has to land them the same way.
+    """
+    laundered = name.lower()
+    for character in "'-#":
+        laundered = laundered.replace(character, "_")
+    return laundered[:63]
+
+
+def ewkb(wkb: bytes, srid: int) -> bytes:
+    """Splice ``srid`` into a 2D ISO WKB geometry, making it EWKB.
+
+    PostGIS's binary input reads EWKB, and the only difference from the WKB GDAL
+    exports for a flat geometry is the SRID: a flag on the type word and four
+    bytes after it, in the byte order the geometry itself declares.
+    """
+    order = "<" if wkb[0] == 1 else ">"
+    (kind,) = struct.unpack_from(f"{order}I", wkb, 1)
+    return wkb[:1] + struct.pack(f"{order}II", kind | EWKB_SRID_FLAG, srid) + wkb[5:]
+
+
+def _copy_column(ogr: typing.Any, field: typing.Any,
+                 preserve_precision: bool) -> tuple[str, str]:
+    """Return the column DDL type and the ``COPY`` wire type for one OGR field.
+
+    Mirrors the PostgreSQL driver's own choice, ``PRECISION`` included, so a
+    transform written against an ``ogr2ogr`` staging table reads the same types
+    from this one. The wire type is what :meth:`psycopg.Copy.set_types` is told,
+    and differs from the DDL only where the binary format of the two agrees
+    (``varchar`` travels as ``text``).
+    """
+    kind, subtype = field.GetType(), field.GetSubType()
+    width, precision = field.GetWidth(), field.GetPrecision()
+    if kind == ogr.OFTInteger:
+        if subtype == ogr.OFSTBoolean:
+            return "BOOLEAN", "bool"
+        if subtype == ogr.OFSTInt16:
+            return "SMALLINT", "int2"
+        if width > 0 and preserve_precision:
+            return f"NUMERIC({width},0)", "numeric"
+        return "INTEGER", "int4"
+    if kind == ogr.OFTInteger64:
+        if width > 0 and preserve_precision:
+            return f"NUMERIC({width},0)", "numeric"
+        return "INT8", "int8"
+    if kind == ogr.OFTReal:
+        if subtype == ogr.OFSTFloat32:
+            return "REAL", "float4"
+        if width > 0 and precision > 0 and preserve_precision:
+            return f"NUMERIC({width},{precision})", "numeric"
+        return "FLOAT8", "float8"
+    if kind == ogr.OFTDate:
+        return "DATE", "date"
+    if kind == ogr.OFTTime:
+        return "TIME", "time"
+    if kind == ogr.OFTDateTime:
+        return "TIMESTAMP WITH TIME ZONE", "timestamptz"
+    if kind == ogr.OFTString and width > 0 and preserve_precision:
+        return f"VARCHAR({width})", "text"
+    # Strings with no declared width, and the list and binary types no source of
+    # this project publishes, which are landed as their text rendering.
+    return "VARCHAR", "text"
+
+
+def _copy_value(ogr: typing.Any, feature: typing.Any, index: int, wire_type: str) -> object:
+    """Read one field of ``feature`` as the Python value its wire type dumps."""
+    if not feature.IsFieldSetAndNotNull(index):
+        return None
+    if wire_type in ("int2", "int4", "int8"):
+        return feature.GetFieldAsInteger64(index)
+    if wire_type == "bool":
+        return bool(feature.GetFieldAsInteger(index))
+    if wire_type in ("float4", "float8"):
+        return feature.GetFieldAsDouble(index)
+    if wire_type == "numeric":
+        # Through the text rendering rather than the double, which is what the
+        # declared precision is there to protect.
+        return decimal.Decimal(feature.GetFieldAsString(index))
+    if wire_type in ("date", "time", "timestamptz"):
+        year, month, day, hour, minute, second, zone = feature.GetFieldAsDateTime(index)
+        whole = int(second)
+        micro = round((second - whole) * 1_000_000)
+        if wire_type == "date":
+            return datetime.date(year, month, day)
+        if wire_type == "time":
+            return datetime.time(hour, minute, whole, micro)
+        # OGR's zone flag: 100 is UTC, each step either side fifteen minutes.
+        # Anything below (unknown, local) is read as UTC, where ogr2ogr would have
+        # left it to the session's TimeZone: the two agree on a server kept in UTC.
+        offset = datetime.timedelta(minutes=15 * (zone - 100)) if zone >= 100 else datetime.timedelta(0)
+        return datetime.datetime(year, month, day, hour, minute, whole, micro,
+                                 tzinfo=datetime.timezone(offset))
+    return feature.GetFieldAsString(index)
+
+
+def copy_staging_table(datasource: str, layer: str, staging_table: str,
+                       settings: dict[str, str], logger: logging.Logger,
+                       geometry_type: str = "MULTIPOLYGON", progress: bool = True,
+                       target_srs: str = "EPSG:4326",
+                       open_options: list[str] | None = None,
+                       append: bool = False, fid_column: str = "fid",
+                       creation_options: list[str] | None = None) -> int:
+    """Copy one layer into the staging table in this process, returning the rows.
+
+    The ``--loader copy`` half of :func:`load_staging_table`, which documents the
+    parameters; they mean the same here. ``ogr2ogr`` writes to PostgreSQL one
+    ``INSERT`` per feature, so on a 300 MB GWIS year the staging load took longer
+    than the transform that follows it. This reads the layer through the GDAL
+    Python bindings — ``/vsizip/`` included, so an archive is still read in place
+    — and streams it with a single binary ``COPY ... FROM STDIN``, geometries as
+    EWKB, which PostGIS's binary input reads without a text round trip.
+
+    The table it leaves is the one ``ogr2ogr`` would have: the ``fid_column``
+    serial first, then ``geom`` in ``target_srs`` promoted to ``geometry_type``,
+    then the fields laundered as :func:`launder_column_name` describes, typed as
+    the driver types them, in an ``UNLOGGED`` table that
+    :func:`index_staging_table` indexes once the rows are in. Appending writes
+    only the fields the existing table has, as ``ogr2ogr -append`` does.
+
+    Raises
+    ------
+    RuntimeError
+        If the bindings are missing, the layer is not in the datasource, the
+        geometry type is one this loader does not promote to, or the layer has no
+        coordinate system to reproject from.
+    """
+    bindings = _gdal_bindings()
+    if bindings is None:
+        raise RuntimeError("The in-process loader needs the GDAL Python bindings (osgeo)")
+    gdal, ogr, osr = bindings
+    if geometry_type.upper() not in COPY_GEOMETRY_TYPES:
+        raise RuntimeError(f"The in-process loader cannot promote to {geometry_type}; "
+                           f"use --loader ogr2ogr")
+    promote_to = getattr(ogr, COPY_GEOMETRY_TYPES[geometry_type.upper()])
+
+    source = gdal.OpenEx(datasource, gdal.OF_VECTOR, open_options=open_options or [])
+    source_layer = source.GetLayerByName(layer)
+    if source_layer is None:
+        raise RuntimeError(f"{datasource} has no layer {layer}")
+
+    target = osr.SpatialReference()
+    target.SetFromUserInput(target_srs)
+    target.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
+    target.AutoIdentifyEPSG()
+    srid = int(target.GetAuthorityCode(None))
+    published = source_layer.GetSpatialRef()
+    if published is None:
+        raise RuntimeError(f"{layer} has no coordinate system to reproject to {target_srs} from")
+    published.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
+    transformation = None if published.IsSame(target) else osr.CoordinateTransformation(published, target)
+
+    preserve_precision = "PRECISION=NO" not in [option.upper() for option in creation_options or []]
+    definition = source_layer.GetLayerDefn()
+    fields: list[tuple[int, str, str, str]] = []
+    for index in range(definition.GetFieldCount()):
+        field = definition.GetFieldDefn(index)
+        column = launder_column_name(field.GetName())
+        if column in (fid_column, "geom"):
+            # ogr2ogr refuses such a field too, and numbers the rows itself.
+            logger.debug("Skipping field %s, which would shadow the %s column", field.GetName(), column)
+            continue
+        fields.append((index, column, *_copy_column(ogr, field, preserve_precision)))
+
+    schema, _, table = staging_table.rpartition(".")
+    with psycopg.connect(host=settings["host"], port=settings["port"], dbname=settings["name"],
+                         user=settings["user"], password=settings["password"] or None) as connection:
+        if append:
+            existing = {row[0] for row in connection.execute(
+                "SELECT column_name FROM information_schema.columns "
+                "WHERE table_schema = %s AND table_name = %s", (schema or "public", table))}
+            fields = [field for field in fields if field[1] in existing]
+        else:
+            connection.execute(f"DROP TABLE IF EXISTS {staging_table} CASCADE")
+            columns = [f"{fid_column} SERIAL PRIMARY KEY",
+                       f"geom geometry({geometry_type.upper()},{srid})"]
+            columns += [f'"{column}" {ddl}' for _, column, ddl, _ in fields]
+            connection.execute(f"CREATE UNLOGGED TABLE {staging_table} ({', '.join(columns)})")
+
+        names = ", ".join(["geom", *(f'"{column}"' for _, column, _, _ in fields)])
+        reporter = (ProgressReporter(source_layer.GetFeatureCount(), layer, logger)
+                    if progress else None)
+        logger.info("Loading %s (layer %s) into %s with COPY", datasource, layer, staging_table)
+        copied = 0
+        with connection.cursor() as cursor:
+            with cursor.copy(f"COPY {staging_table} ({names}) FROM STDIN (FORMAT BINARY)") as copy:
+                copy.set_types(["bytea", *(wire for _, _, _, wire in fields)])
+                source_layer.ResetReading()
+                for feature in source_layer:
+                    geometry = feature.GetGeometryRef()
+                    value = None
+                    if geometry is not None:
+                        geometry = ogr.ForceTo(geometry.Clone(), promote_to)
+                        if transformation is not None:
+                            geometry.Transform(transformation)
+                        geometry.FlattenTo2D()
+                        value = ewkb(geometry.ExportToWkb(ogr.wkbNDR), srid)
+                    copy.write_row([value, *(_copy_value(ogr, feature, index, wire)
+                                             for index, _, _, wire in fields)])
+                    copied += 1
+                    if reporter is not None:
+                        reporter.advance()
+        if reporter is not None:
+            reporter.finish()
+    logger.debug("Copied %d features into %s", copied, staging_table)
+    return copied
+
+
+def index_staging_table(staging_table: str, settings: dict[str, str], logger: logging.Logger,
+                        index_columns: list[str] | None = None) -> None:
+    """Index a freshly loaded staging table and give it statistics.
+
+    A GiST index on ``geom`` and a btree on each of ``index_columns``, built after
+    the load rather than maintained through it: one sort-based build is far
+    cheaper than an index insertion per feature, which is why both loaders
+    create the table without them. ``fid`` needs nothing, being the primary key,
+    so the transforms' joins back to the staging table by ``fid`` are index scans
+    already.
+
+    Then ``ANALYZE``. The loaders leave a table with no statistics at all, and the
+    planner sizes a million-row staging table as if it held a handful and picks
+    nested loops over the spatial joins. An importer that rewrites staged columns
+    before its transform analyses again afterwards; one that does not no longer
+    has to remember to.
+
+    Named, and created ``IF NOT EXISTS``, so that a table loaded in several
+    appends — the CAOP's four territories — is indexed once rather than once per
+    file. An ``index_columns`` entry the layer does not have is skipped with a
+    warning: a wrong ``--id-field`` fails the transform with a clearer message
+    than the index build would.
+    """
+    schema, _, table = staging_table.rpartition(".")
+    with psycopg.connect(host=settings["host"], port=settings["port"], dbname=settings["name"],
+                         user=settings["user"], password=settings["password"] or None,
+                         autocommit=True) as connection:
+        existing = {row[0] for row in connection.execute(
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_schema = %s AND table_name = %s", (schema or "public", table))}
+        if "geom" in existing:
+            connection.execute(STAGING_INDEX_SQL.format(
+                name=f"{table}_geom_idx", staging_table=staging_table, method="GIST",
+                column="geom"))
+        for column in dict.fromkeys(index_columns or []):
+            laundered = launder_column_name(column)
+            if laundered not in existing:
+                logger.warning("%s has no column %s to index", staging_table, laundered)
+                continue
+            connection.execute(STAGING_INDEX_SQL.format(
+                name=f"{table}_{laundered}_idx", staging_table=staging_table, method="BTREE",
+                column=laundered))
+        connection.execute(f"ANALYZE {staging_table}")
+    logger.debug("Indexed and analysed %s", staging_table)
+
+
 def create_staging_schema(engine: Engine, schema: str) -> None:
     """Create the staging schema if it is not there yet, in its own transaction."""
     with Session(engine) as session:
@@ -569,6 +962,84 @@ class Spinner:
             frame += 1
 
 
+#: Records a :func:`read_ahead` thread hands over at a time. Large enough that the
+#: queue is not what the two threads spend their time on, small enough that the
+#: writer never waits long for the first of a batch.
+READ_AHEAD_CHUNK = 500
+
+#: Chunks a :func:`read_ahead` thread may be ahead of the writer before it waits.
+#: Four of :data:`READ_AHEAD_CHUNK` is one importer batch: enough that a batch is
+#: ready when the writer comes back for it, and a bound on what is held in memory
+#: however far parsing outruns the database.
+READ_AHEAD_DEPTH = 4
+
+_Record = typing.TypeVar("_Record")
+
+
+def read_ahead(records: typing.Iterable[_Record], chunk: int = READ_AHEAD_CHUNK,
+               depth: int = READ_AHEAD_DEPTH) -> typing.Iterator[_Record]:
+    """Iterate over ``records`` while a thread parses the next ones.
+
+    The spreadsheet importers parse a batch of rows, then wait while it is
+    written, then parse the next: the parser sits idle during the write and the
+    database during the parse, so a run costs their sum. Iterated through this,
+    ``records`` is driven by a reader thread into a bounded queue while the caller
+    converts and writes, and a run costs roughly the larger of the two. The
+    database round trips release the GIL, which is what lets the parse go on
+    meanwhile.
+
+    The queue holds at most ``depth`` chunks of ``chunk`` records; a reader that
+    gets that far ahead waits, so memory stays flat on a 586,000-row export. The
+    records come out in the order ``records`` yields them, and an exception
+    raised by the reader is raised here, in the caller's thread, at the point the
+    records ran out. Closing the iterator early — a ``break``, or an exception in
+    the caller — stops the reader before it returns, so a workbook is never
+    still being read once the importer has moved on.
+    """
+    handoff: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item: tuple[list[_Record] | None, BaseException | None]) -> bool:
+        # A timeout rather than a blocking put, so that a caller that stopped
+        # reading can never leave this thread waiting on a full queue for good.
+        while not stop.is_set():
+            try:
+                handoff.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def read() -> None:
+        pending: list[_Record] = []
+        try:
+            for record in records:
+                pending.append(record)
+                if len(pending) >= chunk:
+                    if not put((pending, None)):
+                        return
+                    pending = []
+            if pending and not put((pending, None)):
+                return
+            put((None, None))
+        except BaseException as error:  # noqa: BLE001  (re-raised in the caller)
+            put((None, error))
+
+    reader = threading.Thread(target=read, name="read-ahead", daemon=True)
+    reader.start()
+    try:
+        while True:
+            pending, error = handoff.get()
+            if error is not None:
+                raise error
+            if pending is None:
+                return
+            yield from pending
+    finally:
+        stop.set()
+        reader.join()
+
+
 class ArchiveLogger(logging.LoggerAdapter):
     """Prefixes every line with the source file it is about.
 
@@ -603,10 +1074,63 @@ ORDER BY time_zone.name
 """
 
 
+#: Cuts the time zone areas that have no pieces yet into
+#: :class:`~src.data_model.geography.time_zone.TimeZonePart` rows, the table every
+#: importer looks a point's zone up in.
+#:
+#: **This is where the zone lookup's cost goes.** A zone is a few thousand to a
+#: few hundred thousand vertices, and a point test against one detoasts and walks
+#: all of them: the GiST index on ``time_zone`` finds the right zone quickly and
+#: then every fire pays for its whole outline. Cut into pieces of at most
+#: :data:`~src.data_model.geography.SUBDIVIDE_VERTICES` vertices, the
+#: index lands on a piece a few hundred vertices long and the test is over almost
+#: as soon as it starts.
+#:
+#: "No pieces yet" rather than "all": the time zone import replaces the pieces of
+#: the zones it rewrites itself (see :func:`cut_time_zone_parts`), so what is left
+#: for this to find is a zone written some other way — by hand, or by a database
+#: restored without the table — and cutting only those makes the check free when
+#: there are none.
+MISSING_TIME_ZONE_PARTS_SQL = """
+INSERT INTO time_zone_part (time_zone_id, name, geometry)
+SELECT time_zone.id, time_zone.name, ST_Subdivide(time_zone.geometry, :max_vertices)
+FROM time_zone
+WHERE NOT EXISTS (
+    SELECT 1 FROM time_zone_part WHERE time_zone_part.time_zone_id = time_zone.id
+)
+"""
+
+#: Drops the pieces of the given zones, so that they are cut again from the
+#: geometry they have now.
+STALE_TIME_ZONE_PARTS_SQL = "DELETE FROM time_zone_part WHERE time_zone_id = ANY(:zone_ids)"
+
+
+def cut_time_zone_parts(session: Session, logger: logging.Logger,
+                        replace: list[int] | None = None) -> int:
+    """Bring ``time_zone_part`` in step with ``time_zone``, returning the pieces cut.
+
+    Zones with no pieces are cut; so are the zones in ``replace``, whose existing
+    pieces are dropped first — the time zone import passes the ids it has just
+    rewritten, since their old pieces no longer match their geometry. Runs in the
+    caller's transaction, so a zone and its pieces are committed together.
+    """
+    if replace:
+        session.execute(text(STALE_TIME_ZONE_PARTS_SQL), {"zone_ids": replace})
+    cut = session.execute(text(MISSING_TIME_ZONE_PARTS_SQL),
+                          {"max_vertices": SUBDIVIDE_VERTICES}).rowcount
+    if cut:
+        session.execute(text("ANALYZE time_zone_part"))
+        logger.info("Cut %d time zone piece(s) to look points up in", cut)
+    return cut
+
+
 def check_time_zones(session: Session, logger: logging.Logger,
                      fallback: str = FALLBACK_TIME_ZONE) -> None:
     """Warn if no time zone areas are loaded; refuse if any is unusable.
 
+    Also cuts the pieces of any zone that has none yet (see
+    :data:`MISSING_TIME_ZONE_PARTS_SQL`), since those are what the lookup reads.
+
     ``fallback`` is the zone the caller will date its events in when the lookup
     finds nothing, and is only used to say so. It is a parameter because it is not
     the same for every importer: a worldwide source has nothing better than
@@ -638,15 +1162,59 @@ def check_time_zones(session: Session, logger: logging.Logger,
             f"{', ...' if len(unknown) > 5 else ''}). Its tzdata is older than the "
             f"release that was imported; update the server or import an older release."
         )
+    cut_time_zone_parts(session, logger)
     logger.debug("%d time zone areas available", zones)
 
 
+#: Cuts the boundaries that have no pieces yet into
+#: :class:`~src.data_model.geography.admin_boundary.AdminBoundaryPart` rows, the
+#: table fires are attributed to a country or a region against. Optionally kept to
+#: one provider's boundaries, ``:provider_id``, or ``NULL`` for all of them.
+#:
+#: Only boundaries without pieces, for the same reason as
+#: :data:`MISSING_TIME_ZONE_PARTS_SQL`, and here with even less to miss: every
+#: boundary import inserts ``ON CONFLICT DO NOTHING``, so a boundary's geometry is
+#: never rewritten and the pieces of one already cut stay right for good.
+MISSING_ADMIN_BOUNDARY_PARTS_SQL = """
+INSERT INTO admin_boundary_part (admin_boundary_id, data_provider_id, level, geometry)
+SELECT boundary.id, boundary.data_provider_id, boundary.level,
+       ST_Subdivide(boundary.geometry, :max_vertices)
+FROM admin_boundary AS boundary
+WHERE (CAST(:provider_id AS integer) IS NULL OR boundary.data_provider_id = :provider_id)
+  AND NOT EXISTS (
+      SELECT 1 FROM admin_boundary_part AS part WHERE part.admin_boundary_id = boundary.id
+  )
+"""
+
+
+def cut_admin_boundary_parts(session: Session, logger: logging.Logger,
+                             provider_id: int | None = None) -> int:
+    """Cut the boundaries that have no pieces yet, returning the pieces cut.
+
+    Called by each boundary import before it commits, for the boundaries it has
+    just written, and by :func:`find_boundary_provider` for any the wildfire
+    import is about to read. Runs in the caller's transaction, so a boundary and
+    its pieces are committed together.
+    """
+    cut = session.execute(text(MISSING_ADMIN_BOUNDARY_PARTS_SQL),
+                          {"max_vertices": SUBDIVIDE_VERTICES,
+                           "provider_id": provider_id}).rowcount
+    if cut:
+        session.execute(text("ANALYZE admin_boundary_part"))
+        logger.info("Cut %d boundary piece(s) to attribute fires against", cut)
+    return cut
+
+
 def find_boundary_provider(session: Session, logger: logging.Logger) -> DataProvider | None:
     """Return the OCHA provider whose boundaries fires are attributed to, if imported.
 
     Returning ``None`` rather than raising is deliberate: the perimeters and the
     dates are worth having on their own, and the boundaries can be imported later
     without the fires having to be.
+
+    A provider that is found has any of its boundaries still missing their pieces
+    cut here (see :func:`cut_admin_boundary_parts`), because the pieces are what the
+    import attributes fires against.
     """
     provider = session.scalar(
         select(DataProvider).where(DataProvider.name == ocha.PROVIDER_NAME,
@@ -658,9 +1226,1473 @@ def find_boundary_provider(session: Session, logger: logging.Logger) -> DataProv
             "src.apps.imports.admin_boundaries.ocha.import_admin_boundaries",
             ocha.PROVIDER_NAME, ocha.PROVIDER_PRODUCT,
         )
+    else:
+        cut_admin_boundary_parts(session, logger, provider.id)
     return provider
 
 
+# --------------------------------------------------------------------------
+# Resolving points in Python
+# --------------------------------------------------------------------------
+
+#: A window over the whole world, for a resolver whose points can be anywhere.
+WORLD_BOUNDS = (-180.0, -90.0, 180.0, 90.0)
+
+#: The pieces of one provider's boundaries at one level that touch a window, as
+#: WKB, for :class:`SpatialResolver`. Ordered by piece so that a point on a cut
+#: between two countries resolves the same way on every run.
+BOUNDARY_PIECES_SQL = """
+SELECT part.admin_boundary_id, ST_AsBinary(part.geometry)
+FROM admin_boundary_part AS part
+WHERE part.data_provider_id = :provider_id
+  AND part.level = :level
+  AND part.geometry && ST_MakeEnvelope(:west, :south, :east, :north, 4326)
+ORDER BY part.id
+"""
+
+
+class SpatialResolver:
+    """Answers "which area is this point in" for a whole batch of points at once.
+
+    The perimeter importers resolve a fire's country and zone in the one
+    ``TRANSFORM_SQL`` that moves the staging table into the model, a set-based
+    join the planner runs once. The record-based importers have no staging table:
+    they write a batch of rows with an ``executemany``, and a lookup written into
+    that statement is a correlated subquery probed once per row, on the server,
+    inside the insert. For the Greek archive that is 54,000 probes, each planned
+    and run on its own.
+
+    This loads the pieces once per run (:data:`BOUNDARY_PIECES_SQL`) into a
+    Shapely ``STRtree`` and answers a batch
+    with one vectorised query, so that the statement binds a plain id. The pieces
+    are the subdivided ones the SQL lookups use, for the same reason: a tree
+    over whole countries would find the right one quickly and then test every
+    point against all of its coastline.
+
+    The answers are the SQL lookup's. The predicate is *intersects*, GEOS's in
+    both places, so a point on a border or on a cut still resolves; and where a
+    point intersects several pieces the first by piece id wins, where the
+    ``LIMIT 1`` it replaces took whichever the index returned first.
+
+    Parameters
+    ----------
+    keys : list
+        What each geometry resolves to — a boundary id.
+    geometries : list of shapely.Geometry
+        The pieces, in the order of ``keys``.
+    """
+
+    def __init__(self, keys: list[typing.Any], geometries: typing.Sequence[typing.Any]) -> None:
+        self.keys = keys
+        self.tree = shapely.STRtree(geometries)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @classmethod
+    def load(cls, session: Session, sql: str,
+             parameters: dict[str, object]) -> SpatialResolver:
+        """Build a resolver from a statement returning ``(key, wkb)`` rows."""
+        rows = session.execute(text(sql), parameters).all()
+        geometries = shapely.from_wkb([bytes(wkb) for _, wkb in rows])
+        return cls([key for key, _ in rows], geometries)
+
+    def resolve(self, longitudes: typing.Sequence[float | None],
+                latitudes: typing.Sequence[float | None]) -> list[typing.Any]:
+        """The key of the area each point is in, or ``None``, in the order given.
+
+        A point with either coordinate ``None`` resolves to ``None``, as
+        ``ST_Intersects`` on a ``NULL`` point does.
+        """
+        resolved: list[typing.Any] = [None] * len(longitudes)
+        if not self.keys or not resolved:
+            return resolved
+
+        x = numpy.asarray(longitudes, dtype=float)
+        y = numpy.asarray(latitudes, dtype=float)
+        present = numpy.flatnonzero(~(numpy.isnan(x) | numpy.isnan(y)))
+        points = shapely.points(x[present], y[present])
+        point_index, piece_index = self.tree.query(points, predicate="intersects")
+
+        # The first piece of each point: sorted by point and then piece, the first
+        # occurrence of each point index is its lowest piece.
+        order = numpy.lexsort((piece_index, point_index))
+        point_index, piece_index = point_index[order], piece_index[order]
+        _, first = numpy.unique(point_index, return_index=True)
+        for point, piece in zip(point_index[first], piece_index[first]):
+            resolved[present[point]] = self.keys[piece]
+        return resolved
+
+
+def _window(bounds: tuple[float, float, float, float]) -> dict[str, float]:
+    """The ``ST_MakeEnvelope`` parameters for a (west, south, east, north) box."""
+    west, south, east, north = bounds
+    return {"west": west, "south": south, "east": east, "north": north}
+
+
+def load_boundary_resolver(session: Session, provider_id: int | None, logger: logging.Logger,
+                           bounds: tuple[float, float, float, float] = WORLD_BOUNDS,
+                           level: int = 0) -> SpatialResolver:
+    """A :class:`SpatialResolver` over one provider's boundaries, to ``admin_boundary.id``.
+
+    ``bounds`` (west, south, east, north, in degrees) is where the caller's
+    points can be. An importer that refuses points outside a country passes that
+    country's box, and the resolver holds a few thousand pieces rather than the
+    world's. ``provider_id`` of ``None`` — no boundaries imported — gives a
+    resolver that resolves nothing, which is what the SQL lookup did too.
+    """
+    if provider_id is None:
+        return SpatialResolver([], [])
+    resolver = SpatialResolver.load(session, BOUNDARY_PIECES_SQL,
+                                    {"provider_id": provider_id, "level": level,
+                                     **_window(bounds)})
+    logger.debug("%d boundary piece(s) loaded to resolve points against", len(resolver))
+    return resolver
+
+
+# --------------------------------------------------------------------------
+# Writing a batch with COPY
+# --------------------------------------------------------------------------
+
+def copy_batch(session: Session, batch_table: str, source_table: str,
+               columns: typing.Sequence[str], extra_columns: dict[str, str],
+               rows: typing.Iterable[typing.Sequence[object]]) -> int:
+    """COPY a batch of rows into a temporary table, returning the rows copied.
+
+    The record-based importers write a batch to four or five tables. As one
+    ``executemany`` per table that is a bind and an execution per row per table;
+    as a ``COPY`` into one table and an ``INSERT ... SELECT`` per target it is a
+    single stream and a handful of set-based statements, however large the batch.
+    This is the first half; the importer writes the second, because which
+    columns go where — and whether a row that is already there is updated — is
+    specific to each source.
+
+    The table is ``columns`` of ``source_table``, typed as they are there, and
+    then ``extra_columns`` (name to SQL type) for what the targets need that the
+    source table does not hold, such as the naive published instants before their
+    zone is applied. Created with ``CREATE TABLE ... AS ... WITH NO DATA`` rather
+    than ``LIKE``, so that none of the source's ``NOT NULL`` constraints come with
+    it to refuse a column a step does not write. Temporary, dropped at commit,
+    and dropped and created again by the next batch, so each batch reads only its
+    own rows. In the session's own transaction, so a batch is committed or rolled
+    back with everything else the import wrote.
+
+    ``rows`` are sequences in the order of ``columns`` and then of
+    ``extra_columns``.
+    """
+    select_list = [f"{source_table}.{name}" for name in columns]
+    select_list += [f"CAST(NULL AS {kind}) AS {name}" for name, kind in extra_columns.items()]
+    # pg_temp, so that a permanent table of the same name can never be the one dropped.
+    session.execute(text(f"DROP TABLE IF EXISTS pg_temp.{batch_table}"))
+    session.execute(text(
+        f"CREATE TEMPORARY TABLE {batch_table} ON COMMIT DROP AS "
+        f"SELECT {', '.join(select_list)} FROM {source_table} WITH NO DATA"
+    ))
+
+    names = ", ".join([*columns, *extra_columns])
+    copied = 0
+    connection = session.connection().connection.driver_connection
+    with connection.cursor() as cursor:
+        with cursor.copy(f"COPY {batch_table} ({names}) FROM STDIN") as copy:
+            for row in rows:
+                copy.write_row(row)
+                copied += 1
+    return copied
+
+
+# --------------------------------------------------------------------------
+# Incremental imports
+# --------------------------------------------------------------------------
+
+#: Bytes read per step when hashing a source file. Large enough that the hash,
+#: not the read loop, is what a 300 MB archive spends its time on.
+DIGEST_CHUNK = 1 << 20
+
+#: The last id the wildfire sequence handed out, or 0 before it has handed out
+#: any. Taken before a transform so that the rows it writes can be found after it
+#: by an index range scan above this value instead of a scan of the whole table.
+WILDFIRE_ID_FLOOR_SQL = """
+SELECT COALESCE(pg_sequence_last_value(pg_get_serial_sequence('wildfire', 'id')::regclass), 0)
+"""
+
+#: The wildfire ids *this transaction* wrote for a provider, above the floor.
+#:
+#: ``xmin`` is the transaction that created a row version, so comparing it with
+#: the current one picks out exactly the rows of this import, even when parallel
+#: workers are drawing ids from the same sequence at the same time and their
+#: ranges interleave with this one.
+WILDFIRE_ID_RANGE_SQL = """
+SELECT min(id), max(id), count(*)
+FROM wildfire
+WHERE id > :floor
+  AND data_provider_id = :provider_id
+  AND xmin = pg_current_xact_id()::xid
+"""
+
+#: Counts a provider's wildfires inside a recorded range.
+WILDFIRE_RANGE_COUNT_SQL = """
+SELECT count(*) FROM wildfire
+WHERE data_provider_id = :provider_id AND id BETWEEN :first_id AND :last_id
+"""
+
+#: Deletes a source file's wildfires — the provider's subclass row and the generic
+#: one — in one statement, for the reason the per-year deletes of the Greek and
+#: Andalusian importers give: the child references the parent, and inside one
+#: statement the foreign keys are checked once, against the final state.
+#:
+#: ``{ignition_clause}`` is empty unless the provider links each wildfire to an
+#: ignition it wrote from the same published row (GFA's ``gfa_ignition_id``), in
+#: which case that ignition goes too; nothing else references it.
+DELETE_SOURCE_FILE_SQL = """
+WITH doomed AS (
+    SELECT id FROM wildfire
+    WHERE data_provider_id = :provider_id AND id BETWEEN :first_id AND :last_id
+),
+removed_child AS (
+    DELETE FROM {child_table} WHERE id IN (SELECT id FROM doomed) RETURNING {returning}
+),
+removed_parent AS (
+    DELETE FROM wildfire WHERE id IN (SELECT id FROM removed_child) RETURNING id
+){ignition_clause}
+SELECT count(*) FROM removed_parent
+"""
+
+DELETE_SOURCE_FILE_IGNITION_CLAUSE = """,
+removed_ignition_child AS (
+    DELETE FROM {ignition_child_table}
+    WHERE id IN (SELECT {ignition_column} FROM removed_child WHERE {ignition_column} IS NOT NULL)
+    RETURNING id
+),
+removed_ignition AS (
+    DELETE FROM ignition WHERE id IN (SELECT id FROM removed_ignition_child) RETURNING id
+)"""
+
+
+def add_incremental_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add ``--incremental``, for an importer that records its files in the manifest."""
+    parser.add_argument("--incremental", action="store_true",
+                        help="skip files whose SHA-256 matches the one recorded when they "
+                             "were last imported, and replace the fires of files whose "
+                             "SHA-256 has changed")
+
+
+def source_members(path: Path) -> list[Path]:
+    """List the files whose bytes make up one source, in a stable order.
+
+    An archive or a single file is itself. A loose ``.shp`` is the shapefile and
+    every sidecar sharing its stem — a republished ``.dbf`` changes the fires as
+    much as a republished ``.shp``. A directory is every file in it.
+    """
+    if path.is_dir():
+        return sorted(member for member in path.iterdir() if member.is_file())
+    if path.suffix.lower() == ".shp":
+        return sorted(member for member in path.parent.glob(f"{path.stem}.*") if member.is_file())
+    return [path]
+
+
+def source_digest(path: Path) -> tuple[str, int]:
+    """Return the hexadecimal SHA-256 of a source and the number of bytes hashed.
+
+    Each member's name is hashed before its content, so two shapefiles whose
+    sidecars merely swap contents do not hash alike.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    for member in source_members(path):
+        digest.update(member.name.encode())
+        with member.open("rb") as stream:
+            while chunk := stream.read(DIGEST_CHUNK):
+                digest.update(chunk)
+                size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def find_source_file(session: Session, provider_id: int, path: Path) -> SourceFile | None:
+    """Return the manifest entry for ``path``'s name under this provider, if any."""
+    return session.scalar(
+        select(SourceFile).where(SourceFile.data_provider_id == provider_id,
+                                 SourceFile.name == path.name)
+    )
+
+
+def is_unchanged(record: SourceFile | None, sha256: str, size: int) -> bool:
+    """Say whether the file is the one the manifest recorded.
+
+    The size is compared first only because it is free; the hash decides.
+    """
+    return record is not None and record.size_bytes == size and record.sha256 == sha256
+
+
+#: The digest a file is recorded with when only some of the slices importing it
+#: committed (see :class:`SlicedTransform`). It is not hexadecimal, so no file
+#: hashes to it: the next ``--incremental`` run finds the file changed and
+#: deletes by range the fires that did commit before importing it again.
+INCOMPLETE_SHA256 = "incomplete"
+
+
+def changed_source_digest(engine: Engine, provider_id: int, path: Path,
+                          logger: logging.Logger) -> tuple[str, int] | None:
+    """Hash ``path`` and compare it with the manifest, for an ``--incremental`` run.
+
+    Returns ``None`` when the file is the one last imported, which tells the
+    caller to skip it, and otherwise the ``(sha256, size)`` to hand to
+    :func:`record_source_file` once the file is in.
+    """
+    sha256, size = source_digest(path)
+    with Session(engine) as session:
+        record = find_source_file(session, provider_id, path)
+        if is_unchanged(record, sha256, size):
+            logger.info("unchanged since it was imported (sha256 %s), skipped", sha256[:12])
+            return None
+        if record is not None:
+            logger.info("changed since it was imported (sha256 %s, was %s), replacing it",
+                        sha256[:12], record.sha256[:12])
+    return sha256, size
+
+
+def wildfire_id_floor(session: Session) -> int:
+    """Return the last wildfire id handed out, to pass to :func:`record_source_file`."""
+    return session.scalar(text(WILDFIRE_ID_FLOOR_SQL)) or 0
+
+
+def delete_source_file_wildfires(session: Session, record: SourceFile, child_table: str,
+                                 logger: logging.Logger,
+                                 ignition_child_table: str | None = None,
+                                 ignition_column: str | None = None) -> int:
+    """Delete the wildfires a previous import of a file produced, returning how many.
+
+    The manifest stores the file's id range and count rather than every id. A
+    range is only safe to delete by if it holds this file's fires and nothing
+    else, and the count says whether it does. An importer that records ranges
+    under ``--jobs`` draws each file's ids as one block
+    (:func:`whole_table_slice`, :class:`SlicedTransform`), so that the ranges of
+    files imported at once do not interleave; a range written by an older
+    parallel run, or by hand, still can. In that case nothing is deleted and the
+    import stops, since deleting by range would take the other file's fires with
+    it.
+
+    Raises
+    ------
+    RuntimeError
+        If the provider has a different number of wildfires in the range than the
+        file produced.
+    """
+    if record.first_wildfire_id is None:
+        return 0
+    bounds = {"provider_id": record.data_provider_id,
+              "first_id": record.first_wildfire_id, "last_id": record.last_wildfire_id}
+    held = session.scalar(text(WILDFIRE_RANGE_COUNT_SQL), bounds)
+    if held != record.wildfire_count:
+        raise RuntimeError(
+            f"{record.name}: the manifest records {record.wildfire_count} wildfires in ids "
+            f"{record.first_wildfire_id}-{record.last_wildfire_id} but the provider holds "
+            f"{held} there, so the range is shared with another file. Delete the file's "
+            f"fires by hand and import it again, which records a range of its own."
+        )
+    ignition_clause = ""
+    returning = "id"
+    if ignition_child_table is not None and ignition_column is not None:
+        ignition_clause = DELETE_SOURCE_FILE_IGNITION_CLAUSE.format(
+            ignition_child_table=ignition_child_table, ignition_column=ignition_column)
+        returning = f"id, {ignition_column}"
+    deleted = session.scalar(text(DELETE_SOURCE_FILE_SQL.format(
+        child_table=child_table, returning=returning, ignition_clause=ignition_clause)), bounds)
+    logger.info("deleted the %d wildfires of the previous import of %s", deleted, record.name)
+    return deleted
+
+
+def imported_span(session: Session, provider_id: int,
+                  floor: int) -> tuple[int | None, int | None, int]:
+    """Return ``(first id, last id, count)`` of the wildfires this transaction wrote.
+
+    ``floor`` is what :func:`wildfire_id_floor` returned before the transform.
+    """
+    return tuple(session.execute(
+        text(WILDFIRE_ID_RANGE_SQL), {"floor": floor, "provider_id": provider_id}
+    ).one())
+
+
+def record_source_file(session: Session, provider_id: int, path: Path, sha256: str, size: int,
+                       floor: int, span: tuple[int | None, int | None, int] | None = None) -> None:
+    """Write ``path``'s manifest entry from the wildfires this transaction imported.
+
+    Called inside the import's own transaction, after the transform, so the entry
+    commits with the fires it describes or not at all: an import that fails
+    half-way leaves the file recorded as it was before, and the next run tries it
+    again. A transform run in slices wrote its fires in other transactions: it
+    passes their ``span`` — :attr:`SlicedTransform.span` — instead, in the
+    transaction after theirs (see :class:`SlicedTransform`).
+
+    An importer that replaces what it imports by year, season or layer has no use
+    for the range, and one that writes a file over several transactions cannot
+    take it from this one: it passes ``(None, None, count)``, which
+    :func:`delete_source_file_wildfires` reads as nothing to delete by range.
+    """
+    if span is None:
+        span = imported_span(session, provider_id, floor)
+    first_id, last_id, count = span
+    values = {"data_provider_id": provider_id, "name": path.name, "sha256": sha256,
+              "size_bytes": size, "first_wildfire_id": first_id, "last_wildfire_id": last_id,
+              "wildfire_count": count}
+    session.execute(
+        pg_insert(SourceFile.__table__).values(**values).on_conflict_do_update(
+            constraint="uq_source_file_provider_name",
+            set_={**values, "updated_at": func.now()},
+        )
+    )
+
+
+# --------------------------------------------------------------------------
+# The yearly summary
+# --------------------------------------------------------------------------
+
+#: First key of the advisory lock a summary refresh holds; the second is the
+#: provider's id. Any constant would do as long as nothing else uses it.
+YEARLY_SUMMARY_LOCK = 0x5EA5
+
+#: The year a fire counts towards in every report: the year of its *local* start
+#: date. The same expression as the reports' ``LOCAL_YEAR``, written out as text.
+LOCAL_YEAR_SQL = "EXTRACT(YEAR FROM start_date_time AT TIME ZONE COALESCE(time_zone, 'UTC'))::integer"
+
+#: The local years of a provider's wildfires inside an id range — the years a
+#: file's fires fall in, read from the range the manifest or a transform recorded.
+WILDFIRE_YEARS_SQL = f"""
+SELECT DISTINCT {LOCAL_YEAR_SQL}
+FROM wildfire
+WHERE data_provider_id = :provider_id AND id BETWEEN :first_id AND :last_id
+"""
+
+#: Serialises the refreshes of one provider's summary until the transaction ends.
+#:
+#: Two workers of a parallel run can replace the same year. Without the lock each
+#: would delete the rows and recompute them from a snapshot that cannot see the
+#: other's uncommitted fires, and the second insert would collide with the first.
+#: With it the second waits, and its statements — each taking a fresh snapshot
+#: under READ COMMITTED — see the first one's fires once they have committed.
+LOCK_YEARLY_SUMMARY_SQL = "SELECT pg_advisory_xact_lock(:lock, :provider_id)"
+
+DELETE_YEARLY_SUMMARY_SQL = """
+DELETE FROM wildfire_yearly_summary
+WHERE data_provider_id = :provider_id AND surface = :surface AND year = ANY(:years)
+"""
+
+#: Recomputes a provider's summary for some years from the stored areas.
+#:
+#: The ``start_date_time`` window is only there for the index on
+#: ``(data_provider_id, start_date_time)``: no local year reaches more than a day
+#: beyond its UTC bounds, so the window keeps every fire the year test keeps, and
+#: lets a refresh of one year read that year's fires instead of the provider's.
+INSERT_YEARLY_SUMMARY_SQL = f"""
+INSERT INTO wildfire_yearly_summary
+    (data_provider_id, admin_boundary_id, year, surface, fires, minimum_m2, maximum_m2, total_m2)
+SELECT data_provider_id, admin_boundary_id, {LOCAL_YEAR_SQL} AS year, :surface,
+       count(*), min(perimeter_area_m2), max(perimeter_area_m2), sum(perimeter_area_m2)
+FROM wildfire
+WHERE data_provider_id = :provider_id
+  AND admin_boundary_id IS NOT NULL
+  AND perimeter_area_m2 IS NOT NULL
+  AND start_date_time >= make_timestamptz(:first_year, 1, 1, 0, 0, 0, 'UTC') - interval '1 day'
+  AND start_date_time < make_timestamptz(:last_year + 1, 1, 1, 0, 0, 0, 'UTC') + interval '1 day'
+  AND {LOCAL_YEAR_SQL} = ANY(:years)
+GROUP BY 1, 2, 3
+"""
+
+
+def wildfire_years(session: Session, provider_id: int,
+                   span: tuple[int | None, int | None, int]) -> set[int]:
+    """Return the local years of a provider's wildfires in an id ``span``.
+
+    ``span`` is ``(first id, last id, count)``, as :func:`imported_span` and
+    :attr:`SlicedTransform.span` return it and the manifest records it; an empty
+    one has no years.
+    """
+    first_id, last_id, _ = span
+    if first_id is None:
+        return set()
+    return set(session.scalars(text(WILDFIRE_YEARS_SQL), {
+        "provider_id": provider_id, "first_id": first_id, "last_id": last_id}))
+
+
+def refresh_yearly_summary(session: Session, provider_id: int, years: typing.Iterable[int],
+                           logger: logging.Logger) -> int:
+    """Recompute a provider's ``wildfire_yearly_summary`` rows for ``years``.
+
+    Called by an importer in the transaction that replaced those years, after
+    its transform, so the summary commits with the fires it describes. Only the
+    years named are touched: the years of the fires a file wrote, and of the
+    fires its previous import wrote if it replaced one. A year is recomputed
+    whole, from every fire of the provider in it, which is what keeps two files
+    sharing a year from overwriting each other's figures.
+
+    Returns the number of summary rows written.
+    """
+    years = sorted(set(years))
+    if not years:
+        return 0
+    parameters = {"provider_id": provider_id, "surface": SURFACE_PERIMETER, "years": years}
+    session.execute(text(LOCK_YEARLY_SUMMARY_SQL),
+                    {"lock": YEARLY_SUMMARY_LOCK, "provider_id": provider_id})
+    session.execute(text(DELETE_YEARLY_SUMMARY_SQL), parameters)
+    written = session.execute(text(INSERT_YEARLY_SUMMARY_SQL), {
+        **parameters, "first_year": years[0], "last_year": years[-1]}).rowcount
+    logger.info("refreshed the yearly summary for %s (%d rows)",
+                ", ".join(str(year) for year in years), written)
+    return written
+
+
+# --------------------------------------------------------------------------
+# The areas per boundary
+# --------------------------------------------------------------------------
+
+#: First key of the advisory lock a boundary-area refresh holds; the second is the
+#: provider's id. For the same reason as :data:`YEARLY_SUMMARY_LOCK`.
+BOUNDARY_AREA_LOCK = 0xB0A4
+
+DELETE_BOUNDARY_AREAS_SQL = """
+DELETE FROM wildfire_boundary_area
+WHERE data_provider_id = :provider_id AND year = ANY(:years)
+"""
+
+#: A provider's fires with a perimeter in some local years, with the window of
+#: :data:`INSERT_YEARLY_SUMMARY_SQL` for the index on ``start_date_time``.
+BOUNDARY_AREA_FIRES_SQL = f"""
+SELECT id, data_provider_id, {LOCAL_YEAR_SQL} AS year, perimeter, perimeter_area_m2
+FROM wildfire
+WHERE data_provider_id = :provider_id
+  AND perimeter IS NOT NULL
+  AND start_date_time >= make_timestamptz(:first_year, 1, 1, 0, 0, 0, 'UTC') - interval '1 day'
+  AND start_date_time < make_timestamptz(:last_year + 1, 1, 1, 0, 0, 0, 'UTC') + interval '1 day'
+  AND {LOCAL_YEAR_SQL} = ANY(:years)
+"""
+
+#: The fires whose bounding box one piece of a boundary covers, whole, at each level.
+#:
+#: ``~`` is "bounding box contains" and is what the GiST index on the pieces answers;
+#: ``ST_Covers`` against the envelope then settles it exactly, and against a piece of
+#: a few hundred vertices it is cheap. Such a fire cannot cross that boundary's
+#: border, so its area there is the stored one and nothing is intersected. The pieces
+#: tile their boundaries without overlapping, so at most one piece per level can
+#: cover an envelope; ``DISTINCT ON`` only makes sure of it.
+INSERT_COVERED_BOUNDARY_AREAS_SQL = f"""
+INSERT INTO wildfire_boundary_area
+    (wildfire_id, admin_boundary_id, data_provider_id, level, year, area_m2)
+SELECT DISTINCT ON (fire.id, part.level)
+       fire.id, part.admin_boundary_id, fire.data_provider_id, part.level, fire.year,
+       fire.perimeter_area_m2
+FROM ({BOUNDARY_AREA_FIRES_SQL}) AS fire
+JOIN admin_boundary_part AS part
+  ON part.geometry ~ fire.perimeter
+ AND ST_Covers(part.geometry, ST_Envelope(fire.perimeter))
+WHERE part.data_provider_id = :boundary_provider_id
+  AND part.level = ANY(:levels)
+ORDER BY fire.id, part.level, part.id
+"""
+
+#: The other fires — those whose bounding box crosses a border, a coastline or a cut
+#: between two pieces — intersected with every piece they meet and summed per
+#: boundary.
+#:
+#: The area is geodesic, as ``perimeter_area_m2`` is, so a fire's rows add up to its
+#: stored area less whatever of it lies in no boundary. A perimeter GWIS or GFA
+#: published invalid is repaired first, and only here: intersecting it as it is could
+#: abort the import on a topology error.
+INSERT_SPLIT_BOUNDARY_AREAS_SQL = f"""
+INSERT INTO wildfire_boundary_area
+    (wildfire_id, admin_boundary_id, data_provider_id, level, year, area_m2)
+SELECT fire.id, part.admin_boundary_id, fire.data_provider_id, part.level, fire.year,
+       sum(ST_Area(ST_Intersection(part.geometry, fire.valid)::geography))
+FROM (
+    SELECT fire.*,
+           CASE WHEN ST_IsValid(fire.perimeter) THEN fire.perimeter
+                ELSE ST_CollectionExtract(ST_MakeValid(fire.perimeter), 3) END AS valid
+    FROM ({BOUNDARY_AREA_FIRES_SQL}) AS fire
+) AS fire
+JOIN admin_boundary_part AS part ON ST_Intersects(part.geometry, fire.perimeter)
+WHERE part.data_provider_id = :boundary_provider_id
+  AND part.level = ANY(:levels)
+  AND NOT EXISTS (SELECT 1 FROM wildfire_boundary_area AS covered
+                  WHERE covered.wildfire_id = fire.id AND covered.level = part.level)
+GROUP BY 1, 2, 3, 4, 5
+HAVING sum(ST_Area(ST_Intersection(part.geometry, fire.valid)::geography)) > 0
+"""
+
+
+def refresh_boundary_areas(session: Session, provider_id: int,
+                           boundary_provider_id: int | None,
+                           years: typing.Iterable[int], logger: logging.Logger) -> int:
+    """Recompute a provider's ``wildfire_boundary_area`` rows for ``years``.
+
+    Called beside :func:`refresh_yearly_summary`, in the same transaction and for the
+    same years, so the areas commit with the fires they split. A year is recomputed
+    whole. Nothing is written when no boundaries are imported: the fires are then in
+    no boundary at all, and the rows a later import of them would write are the ones
+    a report needs.
+
+    Two statements, so that only the fires that can cross a border are intersected:
+    first those a single boundary piece covers, which take their stored area, then
+    the rest (see :data:`INSERT_COVERED_BOUNDARY_AREAS_SQL` and
+    :data:`INSERT_SPLIT_BOUNDARY_AREAS_SQL`).
+
+    Returns the number of rows written.
+    """
+    years = sorted(set(years))
+    if not years or boundary_provider_id is None:
+        return 0
+    parameters = {"provider_id": provider_id, "years": years,
+                  "first_year": years[0], "last_year": years[-1],
+                  "boundary_provider_id": boundary_provider_id,
+                  "levels": list(BOUNDARY_AREA_LEVELS)}
+    session.execute(text(LOCK_YEARLY_SUMMARY_SQL),
+                    {"lock": BOUNDARY_AREA_LOCK, "provider_id": provider_id})
+    session.execute(text(DELETE_BOUNDARY_AREAS_SQL), parameters)
+    covered = session.execute(text(INSERT_COVERED_BOUNDARY_AREAS_SQL), parameters).rowcount
+    split = session.execute(text(INSERT_SPLIT_BOUNDARY_AREAS_SQL), parameters).rowcount
+    logger.info("refreshed the areas per boundary for %s (%d whole, %d split)",
+                ", ".join(str(year) for year in years), covered, split)
+    return covered + split
+
+
+# --------------------------------------------------------------------------
+# Running several imports at once
+# --------------------------------------------------------------------------
+
+#: Log format of the import applications, which a worker process has to set up
+#: again for itself: a spawned process does not inherit the parent's handlers.
+LOG_FORMAT = "%(asctime)s %(levelname)s %(message)s"
+
+#: What ``--jobs auto`` is parsed to.
+AUTO_JOBS = 0
+
+#: Connections one worker can hold at the same moment: its engine's pooled
+#: connection, left open between files, and the one ``ogr2ogr`` opens to load the
+#: next file. The pool is sized so that every worker can have both.
+CONNECTIONS_PER_WORKER = 2
+
+#: Connections left unclaimed when the pool is sized, for the parent's own
+#: connection, a ``psql`` someone opens to watch the run, and autovacuum's
+#: launcher, which counts against the limit like any client.
+RESERVED_CONNECTIONS = 3
+
+#: How many more client connections the server will accept right now. Superuser
+#: slots are subtracted because an import does not run as a superuser and cannot
+#: have them; connections already open — another import, a dashboard — are
+#: subtracted because they are not going anywhere.
+FREE_CONNECTIONS_SQL = """
+SELECT current_setting('max_connections')::int
+     - current_setting('superuser_reserved_connections')::int
+     - (SELECT count(*) FROM pg_stat_activity WHERE backend_type = 'client backend')
+"""
+
+#: Seconds spent in :func:`load_staging_table` since the current file began, by
+#: the process doing the work. Read by the scheduler to split a file's time into
+#: loading and mapping without every importer having to time itself.
+_STAGE_SECONDS: dict[str, float] = {}
+
+#: Per-process state of a parallel worker. A module global because a pool
+#: initializer is the only place a worker can build something once and reuse it
+#: across the files it is handed, and an :class:`~sqlalchemy.engine.Engine` must
+#: not be inherited across a fork: its pooled connections would be shared by two
+#: processes writing over each other's protocol state.
+_WORKER: dict[str, typing.Any] = {}
+
+
+def jobs_argument(value: str) -> int:
+    """Parse ``--jobs``: ``auto``, or a number of workers, rejecting zero and negatives."""
+    if value == "auto":
+        return AUTO_JOBS
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be 1 or more, or 'auto', not {number}")
+    return number
+
+
+def add_jobs_arguments(parser: argparse.ArgumentParser, unit: str) -> None:
+    """Add ``--jobs``, naming the ``unit`` (``archives``, ``layers``) a worker takes."""
+    parser.add_argument("-j", "--jobs", type=jobs_argument, default=1,
+                        help=f"{unit} to import at the same time, in separate processes "
+                             f"(default: 1). 'auto' sizes the pool from this machine's CPUs "
+                             f"and the connections the server has free. Each worker is "
+                             f"another connection doing spatial joins, so raise the server's "
+                             f"work_mem and shared_buffers before raising this")
+
+
+def worker_staging_table(args: argparse.Namespace, slot: int) -> str:
+    """The staging table worker ``slot`` of a parallel run loads into.
+
+    One per worker, not one per file: ``ogr2ogr -overwrite`` drops and recreates
+    the table, so two workers sharing one would destroy each other's load, while
+    one worker only ever has one file staged at a time.
+    """
+    return f"{args.staging_schema}.{args.staging_table}_{slot:02d}"
+
+
+def source_size(path: Path) -> int:
+    """Bytes on disk behind ``path``, counting a loose shapefile's sidecars."""
+    return sum(member.stat().st_size for member in source_members(path))
+
+
+def worker_count(engine: Engine, requested: int, tasks: int, logger: logging.Logger) -> int:
+    """Decide how many worker processes a run of ``tasks`` files gets.
+
+    Never more than there are files: an idle worker is a process and two
+    connections doing nothing. ``--jobs auto`` then takes the smallest of this
+    machine's CPU count and what the server's free connections allow. An explicit
+    ``--jobs`` is honoured above the CPU count — the server may well be another
+    machine, and the transform is what is slow — but not above the connections:
+    a worker refused one fails its file, where a smaller pool only takes longer.
+    """
+    if tasks <= 1 or requested == 1:
+        return 1
+    with engine.connect() as connection:
+        free = connection.execute(text(FREE_CONNECTIONS_SQL)).scalar()
+    room = max(1, (free - RESERVED_CONNECTIONS) // CONNECTIONS_PER_WORKER)
+
+    if requested == AUTO_JOBS:
+        cpus = os.cpu_count() or 1
+        jobs = min(tasks, cpus, room)
+        logger.info("--jobs auto: %d worker(s), from %d file(s), %d CPU(s) and room for %d "
+                    "on the server", jobs, tasks, cpus, room)
+        return jobs
+
+    jobs = min(requested, tasks)
+    if jobs > room:
+        logger.warning("--jobs %d needs %d connections and the server has %d free; running "
+                       "%d worker(s) instead", jobs, jobs * CONNECTIONS_PER_WORKER, free, room)
+        jobs = room
+    return jobs
+
+
+@dataclass(frozen=True)
+class ImportOutcome:
+    """What importing one file came to, for the totals and the timing report.
+
+    Attributes
+    ----------
+    name : str
+        The file's name.
+    result : object
+        Whatever the importer returned for it — a count of fires, or an audit —
+        or ``None`` if it failed.
+    error : str or None
+        Why it failed, as text, or ``None`` if it did not.
+    load_seconds : float
+        Time spent landing it in the staging table.
+    total_seconds : float
+        Time spent on it altogether; what is not loading is mapping.
+    """
+
+    name: str
+    result: typing.Any
+    error: str | None
+    load_seconds: float
+    total_seconds: float
+
+
+def _timed_import(importer: typing.Callable[..., typing.Any], path: Path, engine: Engine,
+                  args: argparse.Namespace, context: tuple, logger: logging.Logger,
+                  **kwargs: typing.Any) -> ImportOutcome:
+    """Run ``importer`` on one file, timing its load and the rest separately."""
+    _STAGE_SECONDS.clear()
+    started = time.monotonic()
+    result = importer(path, engine, args, *context, logger, **kwargs)
+    return ImportOutcome(path.name, result, None, _STAGE_SECONDS.get("load", 0.0),
+                         time.monotonic() - started)
+
+
+def _worker_init(importer: typing.Callable[..., typing.Any], args: argparse.Namespace,
+                 context: tuple, logger_name: str, slots: typing.Any) -> None:
+    """Give this worker process its own engine, its staging slot and what every file needs."""
+    logging.basicConfig(level=args.log_level, format=LOG_FORMAT)
+    _WORKER.update(
+        importer=importer, args=args, context=context,
+        logger=logging.getLogger(logger_name),
+        staging_table=worker_staging_table(args, slots.get()),
+        engine=create_engine(database_url(resolve_database_settings(args))),
+    )
+
+
+def _worker_import(path: Path) -> ImportOutcome:
+    """Import one file in this worker, returning the failure instead of raising.
+
+    A raise would come back as a pickled exception and stop the whole pool. One
+    file that cannot be read is not a reason to throw away the others — each is
+    its own transaction — so the error is carried back as text and reported
+    together with the rest at the end.
+    """
+    started = time.monotonic()
+    try:
+        return _timed_import(_WORKER["importer"], path, _WORKER["engine"], _WORKER["args"],
+                             _WORKER["context"], _WORKER["logger"],
+                             staging_table=_WORKER["staging_table"], progress=False)
+    except Exception as error:  # noqa: BLE001  (carried back to the parent, not swallowed)
+        return ImportOutcome(path.name, None, str(error), _STAGE_SECONDS.get("load", 0.0),
+                             time.monotonic() - started)
+
+
+def report_timings(outcomes: list[ImportOutcome], logger: logging.Logger) -> None:
+    """Log where each file's time went, slowest first.
+
+    The slowest file is the floor under a parallel run however many workers it
+    has, so it is the line to read first; the split says whether making it faster
+    is a question for the loader or for the mapping.
+    """
+    if len(outcomes) < 2:
+        return
+    logger.info("Time per file, slowest first:")
+    for outcome in sorted(outcomes, key=lambda outcome: outcome.total_seconds, reverse=True):
+        logger.info("  %s: %.0fs loading, %.0fs mapping%s", outcome.name,
+                    outcome.load_seconds, outcome.total_seconds - outcome.load_seconds,
+                    " (failed)" if outcome.error is not None else "")
+
+
+def run_imports(paths: list[Path], importer: typing.Callable[..., typing.Any], engine: Engine,
+                args: argparse.Namespace, context: tuple, logger: logging.Logger,
+                unit: str = "archive") -> list[typing.Any]:
+    """Import every file, across ``--jobs`` processes, returning each file's result.
+
+    ``importer`` is the application's own one-file function, called as
+    ``importer(path, engine, args, *context, logger)`` — and, in a worker, with
+    ``staging_table=`` the worker's own table and ``progress=False``, so it has to
+    accept both. It must be a module-level function, since it is handed to the
+    workers by reference. The results come back in no particular order, for the
+    caller to add up.
+
+    A serial run — one job, or one file — imports in this process, in the order
+    given, and stops at the first failure as it always has.
+
+    A parallel run starts the largest file first. The run cannot finish before its
+    slowest file does, and a large file started last would run alone at the end
+    while every other worker sat idle; started first, the small ones fill in
+    around it. Processes rather than threads, but not for the usual reason: both
+    slow phases release the GIL anyway, since one waits on a subprocess and the
+    other on a socket. What parallelism buys is server-side — PostgreSQL will not
+    use a parallel plan for a statement that writes, so a transform runs on one
+    core however the client is built, and the only way to get more cores onto the
+    work is more connections doing it at once.
+
+    Only safe where no two files can write the same rows: each application says
+    why that holds for its source where it calls this.
+
+    Raises
+    ------
+    RuntimeError
+        If any file failed in a parallel run, after every other one has finished.
+    """
+    jobs = worker_count(engine, args.jobs, len(paths), logger)
+    started = time.monotonic()
+
+    if jobs == 1:
+        logger.info("Importing %d %s(s)", len(paths), unit)
+        outcomes = []
+        for index, path in enumerate(paths, start=1):
+            logger.info("[%d/%d] %s", index, len(paths), path.name)
+            outcomes.append(_timed_import(importer, path, engine, args, context, logger))
+        report_timings(outcomes, logger)
+        return [outcome.result for outcome in outcomes]
+
+    ordered = sorted(paths, key=source_size, reverse=True)
+    logger.info("Importing %d %s(s) across %d process(es), largest first",
+                len(paths), unit, jobs)
+    slots = multiprocessing.Queue()
+    for slot in range(jobs):
+        slots.put(slot)
+
+    outcomes = []
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_worker_init,
+                             initargs=(importer, args, context, logger.name, slots)) as pool:
+        futures = [pool.submit(_worker_import, path) for path in ordered]
+        for finished, future in enumerate(as_completed(futures), start=1):
+            outcome = future.result()
+            outcomes.append(outcome)
+            if outcome.error is not None:
+                logger.error("%s: failed: %s", outcome.name, outcome.error)
+            logger.info("[%d/%d %ss done]", finished, len(paths), unit)
+
+    report_timings(outcomes, logger)
+    logger.info("The slowest %s took %.0fs of the run's %.0fs", unit,
+                max(outcome.total_seconds for outcome in outcomes), time.monotonic() - started)
+
+    failures = [outcome for outcome in outcomes if outcome.error is not None]
+    if failures:
+        raise RuntimeError(
+            f"{len(failures)} of {len(paths)} {unit}(s) failed: "
+            + "; ".join(f"{outcome.name} ({outcome.error})" for outcome in failures)
+        )
+    return [outcome.result for outcome in outcomes]
+
+
+# --------------------------------------------------------------------------
+# Transforming one file in slices
+# --------------------------------------------------------------------------
+
+#: Draws a wildfire id for every distinct slice key of a staging table, in key
+#: order, before any slice runs.
+#:
+#: A transform run whole draws its ids inside its own statement. Split across
+#: connections, each slice would draw as it went and the file's ids would
+#: interleave slice by slice; drawn here, once and in key order, they number the
+#: fires the way a serial run does, and each slice looks its own up by key. A key
+#: the transform then drops — no start date, no geometry — leaves a gap in the
+#: sequence, which is all a rolled-back serial insert would have left either.
+ALLOCATE_SLICE_IDS_SQL = """
+CREATE UNLOGGED TABLE {ids_table} AS
+SELECT keyed.key, nextval(pg_get_serial_sequence('wildfire', 'id')) AS id
+FROM (
+    SELECT DISTINCT staging.{key} AS key
+    FROM {staging_table} AS staging
+    WHERE staging.{key} IS NOT NULL
+    ORDER BY 1
+) AS keyed
+"""
+
+#: First key of the advisory lock held while a file's ids are drawn into
+#: :data:`ALLOCATE_SLICE_IDS_SQL`'s table; the second is the provider's id. Two
+#: workers of a ``--jobs`` run drawing at once would interleave their files' ids,
+#: and a range the manifest records would then hold another file's fires too (see
+#: :func:`delete_source_file_wildfires`). One file at a time, each file's ids are
+#: one block. Another provider drawing in between is harmless: a range is only
+#: ever read for its own provider.
+WILDFIRE_IDS_LOCK = 0x1D5
+
+#: The first and last key of each of ``:chunks`` slices holding as near the same
+#: number of keys as the split allows.
+SLICE_RANGES_SQL = """
+SELECT min(tiled.key), max(tiled.key), min(tiled.id) - 1
+FROM (SELECT key, id, ntile(:chunks) OVER (ORDER BY key) AS slice FROM {ids_table}) AS tiled
+GROUP BY tiled.slice
+ORDER BY tiled.slice
+"""
+
+#: How many transactions the server can hold prepared at once. The default is
+#: zero, and then the slices cannot be committed as one.
+MAX_PREPARED_TRANSACTIONS_SQL = "SELECT current_setting('max_prepared_transactions')::int"
+
+#: What a transform template's ``{wildfire_id}`` and ``{slice_filter}`` are when
+#: it runs over the whole staging table: ids from the sequence, and every row.
+WHOLE_TABLE_SQL = {
+    "wildfire_id": "nextval(pg_get_serial_sequence('wildfire', 'id'))",
+    "slice_filter": "",
+}
+
+
+def chunks_argument(value: str) -> int:
+    """Parse ``--chunks``: a number of slices, rejecting zero and negatives."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be 1 or more, not {number}")
+    return number
+
+
+def add_chunks_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add ``--chunks``, for an importer whose transform can run in slices."""
+    parser.add_argument("--chunks", type=chunks_argument, default=1,
+                        help="split each file's transform into this many slices of the "
+                             "staged rows, run at the same time on connections of their "
+                             "own and committed together (default: 1). PostgreSQL runs a "
+                             "writing statement on one core, so this is what puts more "
+                             "of them on one large file")
+
+
+@dataclass(frozen=True)
+class StagingSlice:
+    """One of the ``--chunks`` slices of a staging table.
+
+    Attributes
+    ----------
+    number : int
+        1-based, for the log.
+    ids_table : str
+        The table :data:`ALLOCATE_SLICE_IDS_SQL` drew the file's ids into.
+    key : str
+        The staging column the table is sliced on. Rows that make one fire have to
+        share it — ``fid`` where a row is a fire, the published fire id where
+        several parts are collected into one — so that no fire is split between
+        two slices.
+    first, last : object
+        The slice's keys, inclusive.
+    """
+
+    number: int
+    ids_table: str
+    key: str
+    first: typing.Any
+    last: typing.Any
+
+
+def draw_wildfire_ids(connection: Connection, ids_table: str, staging_table: str, key: str,
+                      provider_id: int) -> None:
+    """Draw one id per staged ``key`` into ``ids_table``, as one block of the sequence.
+
+    Runs under :data:`WILDFIRE_IDS_LOCK` until ``connection``'s transaction ends,
+    so it belongs in a short transaction of its own: the ids are the sequence's
+    and are kept whether or not the transform using them commits.
+    """
+    connection.execute(text(LOCK_YEARLY_SUMMARY_SQL),
+                       {"lock": WILDFIRE_IDS_LOCK, "provider_id": provider_id})
+    connection.execute(text(f"DROP TABLE IF EXISTS {ids_table}"))
+    connection.execute(text(ALLOCATE_SLICE_IDS_SQL.format(
+        ids_table=ids_table, staging_table=staging_table, key=key)))
+    connection.execute(text(f"ALTER TABLE {ids_table} ADD PRIMARY KEY (key)"))
+    connection.execute(text(f"ANALYZE {ids_table}"))
+
+
+def whole_table_slice(engine: Engine, staging_table: str, key: str,
+                      provider_id: int) -> StagingSlice | None:
+    """The whole staging table as one slice, with its ids drawn as one block.
+
+    For a transform run whole whose id range the manifest records: drawing its
+    ids row by row inside the transform, as :data:`WHOLE_TABLE_SQL` does, would
+    interleave them with those of the files other ``--jobs`` workers are
+    importing at the same time. ``None`` when nothing is staged. The ids table is
+    the staging table's name with ``_ids``, for the caller to drop.
+    """
+    ids_table = f"{staging_table}_ids"
+    with engine.begin() as connection:
+        draw_wildfire_ids(connection, ids_table, staging_table, key, provider_id)
+        first, last = connection.execute(
+            text(f"SELECT min(key), max(key) FROM {ids_table}")).one()
+    if first is None:
+        return None
+    return StagingSlice(1, ids_table, key, first, last)
+
+
+def slice_sql(staging_slice: StagingSlice | None) -> dict[str, str]:
+    """The ``{wildfire_id}`` and ``{slice_filter}`` of a transform template.
+
+    For the whole table, :data:`WHOLE_TABLE_SQL`. For a slice, the id allocated
+    to the row's key and a filter on the slice's keys, which a template appends to
+    its ``WHERE`` over ``staging``; the bounds are bound parameters, from
+    :func:`slice_parameters`.
+    """
+    if staging_slice is None:
+        return WHOLE_TABLE_SQL
+    return {
+        "wildfire_id": f"(SELECT allocated.id FROM {staging_slice.ids_table} AS allocated "
+                       f"WHERE allocated.key = staging.{staging_slice.key})",
+        "slice_filter": f"AND staging.{staging_slice.key} BETWEEN :slice_first AND :slice_last",
+    }
+
+
+def slice_parameters(staging_slice: StagingSlice | None) -> dict[str, typing.Any]:
+    """The bound parameters :func:`slice_sql`'s filter refers to."""
+    if staging_slice is None:
+        return {}
+    return {"slice_first": staging_slice.first, "slice_last": staging_slice.last}
+
+
+class SlicedTransform:
+    """Run one file's transform as ``--chunks`` slices, and commit them as one.
+
+    PostgreSQL will not use a parallel plan for a statement that writes, so a
+    transform over a 500,000-fire file is one backend on one core however many
+    ``--jobs`` there are: ``--jobs`` spreads *files*. This spreads one file. The
+    staged keys are split into contiguous ranges, the file's ids are drawn for
+    all of them first (:data:`ALLOCATE_SLICE_IDS_SQL`), and each range runs the
+    application's own transform on a connection of its own, in a thread — the
+    threads only wait on sockets.
+
+    The slices have to land together: a file is wholly in or wholly out, as in a
+    serial run. Where the server allows it (``max_prepared_transactions`` at
+    least the number of slices) each slice ends with ``PREPARE TRANSACTION``, a
+    durable promise to commit, and :meth:`commit` turns every promise into a
+    commit only once all of them — and the caller's own transaction — have been
+    made. Where it does not, the slices are held open until all have succeeded
+    and then committed one after another; a failure in that window is reported
+    with the slices that did commit and their ids, so that they can be deleted
+    and the file imported again.
+
+    Use as a context manager. The caller's own session commits **before**
+    :meth:`commit` whatever the slices' fires replace — a changed file's previous
+    fires, and its manifest entry with them — and the file's new manifest entry
+    is written only **after**, once every slice has committed. A slice that fails
+    to commit leaves the ones committed before it in place; the caller records
+    them under :data:`INCOMPLETE_SHA256` with :attr:`committed_span`, so that the
+    next run deletes them by range and imports the file again, rather than
+    finding it unrecorded and adding its fires a second time. The staging table
+    is dropped only afterwards too, since the slices hold it open until they
+    commit::
+
+        with common.SlicedTransform(engine, staging_table, "fid", args.chunks,
+                                    provider_id, log) as sliced:
+            imported = sum(sliced.run(transform_slice))
+            session.commit()
+            try:
+                sliced.commit()
+            except RuntimeError:
+                record_source_file(session, provider_id, path, INCOMPLETE_SHA256,
+                                   digest[1], floor, span=sliced.committed_span)
+                session.commit()
+                raise
+        record_source_file(session, provider_id, path, *digest, floor, span=sliced.span)
+
+    Leaving the block without :meth:`commit` rolls every slice back.
+    """
+
+    def __init__(self, engine: Engine, staging_table: str, key: str, chunks: int,
+                 provider_id: int, logger: logging.Logger) -> None:
+        self.engine = engine
+        self.staging_table = staging_table
+        self.ids_table = f"{staging_table}_ids"
+        self.key = key
+        self.provider_id = provider_id
+        self.logger = logger
+        self.chunks = self._slice_count(chunks)
+        self.slices: list[StagingSlice] = []
+        self.spans: dict[int, tuple[int | None, int | None, int]] = {}
+        self._floor = 0
+        self._two_phase = False
+        self._gid = f"gisfire_{os.getpid()}_{int(time.time() * 1000)}"
+        self._connections: dict[int, typing.Any] = {}
+        self._prepared: set[int] = set()
+        self._committed: list[int] = []
+        self._slice_engine = create_engine(engine.url, poolclass=NullPool)
+
+    def __enter__(self) -> SlicedTransform:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        try:
+            if len(self._committed) < len(self._connections):
+                self.rollback()
+        finally:
+            self._slice_engine.dispose()
+
+    def _slice_count(self, requested: int) -> int:
+        """``requested``, or fewer if the server has not the connections to spare."""
+        with self.engine.connect() as connection:
+            free = connection.execute(text(FREE_CONNECTIONS_SQL)).scalar()
+        room = max(1, free - RESERVED_CONNECTIONS)
+        if requested > room:
+            self.logger.warning("--chunks %d needs %d connections and the server has %d free; "
+                                "running %d slice(s) instead", requested, requested, free, room)
+        return min(requested, room)
+
+    def allocate(self) -> list[StagingSlice]:
+        """Draw the file's ids and split its keys into slices."""
+        with self.engine.begin() as connection:
+            draw_wildfire_ids(connection, self.ids_table, self.staging_table, self.key,
+                              self.provider_id)
+            ranges = connection.execute(text(SLICE_RANGES_SQL.format(ids_table=self.ids_table)),
+                                        {"chunks": self.chunks}).all()
+            prepared = connection.execute(text(MAX_PREPARED_TRANSACTIONS_SQL)).scalar()
+        self.slices = [StagingSlice(number, self.ids_table, self.key, first, last)
+                       for number, (first, last, _) in enumerate(ranges, start=1)]
+        self._floor = min((floor for _, _, floor in ranges), default=0)
+        self._two_phase = prepared >= len(self.slices)
+        if not self._two_phase and len(self.slices) > 1:
+            self.logger.warning(
+                "max_prepared_transactions is %d, fewer than the %d slices: they will be "
+                "committed one after another rather than as one", prepared, len(self.slices))
+        return self.slices
+
+    def run(self, transform: typing.Callable[[Session, StagingSlice], typing.Any]) -> list:
+        """Run ``transform(session, staging_slice)`` for every slice, returning its results.
+
+        ``transform`` is the application's own, called with a session on the
+        slice's connection; it must not commit. Each slice also records the id
+        span of the wildfires it wrote, for :attr:`span`.
+
+        Raises
+        ------
+        RuntimeError
+            If any slice failed, once every other one has finished. Nothing is
+            committed.
+        """
+        if not self.slices:
+            self.allocate()
+        started = time.monotonic()
+        self.logger.info("transforming in %d slice(s) of %s", len(self.slices), self.key)
+        results, failures = {}, []
+        with ThreadPoolExecutor(max_workers=max(1, len(self.slices))) as pool:
+            futures = {pool.submit(self._run_slice, staging_slice, transform): staging_slice
+                       for staging_slice in self.slices}
+            for future in as_completed(futures):
+                staging_slice = futures[future]
+                try:
+                    results[staging_slice.number], span = future.result()
+                    self.spans[staging_slice.number] = span
+                except Exception as error:  # noqa: BLE001  (raised below, with the rest)
+                    failures.append(f"slice {staging_slice.number} ({error})")
+        if failures:
+            raise RuntimeError(f"{len(failures)} of {len(self.slices)} slice(s) failed: "
+                               + "; ".join(failures))
+        self.logger.info("all %d slice(s) done in %.0fs", len(self.slices),
+                         time.monotonic() - started)
+        return [results[number] for number in sorted(results)]
+
+    def _run_slice(self, staging_slice: StagingSlice,
+                   transform: typing.Callable[[Session, StagingSlice], typing.Any]) -> tuple:
+        connection = self._slice_engine.connect()
+        self._connections[staging_slice.number] = connection
+        session = Session(bind=connection)
+        result = transform(session, staging_slice)
+        span = session.execute(text(WILDFIRE_ID_RANGE_SQL),
+                               {"floor": self._floor, "provider_id": self.provider_id}).one()
+        session.flush()
+        if self._two_phase:
+            connection.exec_driver_sql(f"PREPARE TRANSACTION '{self._gid}_{staging_slice.number}'")
+            self._prepared.add(staging_slice.number)
+        return result, tuple(span)
+
+    @property
+    def span(self) -> tuple[int | None, int | None, int]:
+        """First id, last id and count of the wildfires every slice wrote together.
+
+        What :func:`record_source_file` would have read back from a serial
+        transaction, which here is spread over several.
+        """
+        return self._join(self.spans.values())
+
+    @property
+    def committed_span(self) -> tuple[int | None, int | None, int]:
+        """:attr:`span` over only the slices that have committed.
+
+        After :meth:`commit` has failed, what is stored of the file: slices are
+        drawn ids in key order, so the ids of the ones rolled back between these
+        hold no fire, and :func:`delete_source_file_wildfires` finds the count
+        the range is recorded with.
+        """
+        return self._join(self.spans[number] for number in self._committed)
+
+    @staticmethod
+    def _join(spans: typing.Iterable[tuple[int | None, int | None, int]]
+              ) -> tuple[int | None, int | None, int]:
+        spans = list(spans)
+        firsts = [first for first, _, _ in spans if first is not None]
+        lasts = [last for _, last, _ in spans if last is not None]
+        return (min(firsts, default=None), max(lasts, default=None),
+                sum(count for _, _, count in spans))
+
+    def _resolve_prepared(self, verb: str, number: int) -> None:
+        with self._slice_engine.connect() as coordinator:
+            coordinator = coordinator.execution_options(isolation_level="AUTOCOMMIT")
+            coordinator.exec_driver_sql(f"{verb} PREPARED '{self._gid}_{number}'")
+
+    def commit(self) -> None:
+        """Commit every slice.
+
+        Raises
+        ------
+        RuntimeError
+            If a slice could not be committed. The rest are rolled back when the
+            block is left, and the message names the slices that did commit with
+            the wildfire ids each wrote, which are what to delete before the file
+            is imported again.
+        """
+        for number, connection in sorted(self._connections.items()):
+            try:
+                if number in self._prepared:
+                    self._resolve_prepared("COMMIT", number)
+                else:
+                    connection.commit()
+            except Exception as error:
+                committed = ", ".join(
+                    f"slice {done} (wildfires {self.spans[done][0]} to {self.spans[done][1]})"
+                    for done in self._committed
+                )
+                raise RuntimeError(f"slice {number} could not be committed ({error}); "
+                                   f"committed before it: {committed or 'none'}") from error
+            self._committed.append(number)
+        self._close()
+
+    def rollback(self) -> None:
+        """Roll back every slice not yet committed."""
+        for number, connection in sorted(self._connections.items()):
+            if number in self._committed:
+                continue
+            try:
+                if number in self._prepared:
+                    self._resolve_prepared("ROLLBACK", number)
+                else:
+                    connection.rollback()
+            except Exception as error:  # noqa: BLE001  (rolling back after a failure already raised)
+                self.logger.error("slice %d could not be rolled back: %s", number, error)
+        self._close()
+
+    def _close(self) -> None:
+        for connection in self._connections.values():
+            connection.close()
+
+
+# --------------------------------------------------------------------------
+# Measuring years in parallel, on one snapshot
+# --------------------------------------------------------------------------
+
+#: Isolation level of a statistics report's transaction and of its workers'. A
+#: report is many statements, and only under ``REPEATABLE READ`` do they all read
+#: the one snapshot its transaction took: under the default ``READ COMMITTED``
+#: each takes a fresh one, and an import committing between two years' statements
+#: would be half in the report. It is also the level ``SET TRANSACTION SNAPSHOT``
+#: needs of a transaction importing one.
+SNAPSHOT_ISOLATION_LEVEL = "REPEATABLE READ"
+
+#: Publishes the calling transaction's snapshot for others to import, returning
+#: its identifier. The snapshot stays importable only while that transaction is
+#: open, which is why the report's own session is kept open round the workers.
+EXPORT_SNAPSHOT_SQL = "SELECT pg_export_snapshot()"
+
+#: Makes a worker's transaction read the exported snapshot rather than take its
+#: own. A utility statement, so the identifier cannot be a bound parameter; it is
+#: the server's own, checked against :data:`SNAPSHOT_ID` before it is quoted in.
+IMPORT_SNAPSHOT_SQL = "SET TRANSACTION SNAPSHOT '{snapshot}'"
+
+#: What ``pg_export_snapshot()`` returns: hexadecimal groups joined by hyphens,
+#: ``00000003-0000001B-1``.
+SNAPSHOT_ID = re.compile(r"[0-9A-F]+(-[0-9A-F]+)+")
+
+#: The server's ceiling on parallel workers, which a tuned server sets to its
+#: core count. ``--jobs auto`` sizes a report's pool by it: a report's workers run
+#: their statements on the server, and this machine's CPUs say nothing about it.
+MAX_PARALLEL_WORKERS_SQL = "SELECT current_setting('max_parallel_workers')::int"
+
+#: One year's rows, whatever a report's row type is.
+_Measured = typing.TypeVar("_Measured")
+
+
+def add_snapshot_jobs_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add a statistics report's ``--jobs``: years measured at the same time."""
+    parser.add_argument("-j", "--jobs", type=jobs_argument, default=1,
+                        help="years to measure at the same time, each on a connection of "
+                             "its own reading the report's one snapshot (default: 1). "
+                             "'auto' sizes the pool from the server's max_parallel_workers "
+                             "and the connections it has free. Every worker is a backend "
+                             "running one year's statement, with the memory that takes")
+
+
+def snapshot_session(engine: Engine) -> Session:
+    """A session for a statistics report: one transaction, one snapshot, whatever it runs.
+
+    At :data:`SNAPSHOT_ISOLATION_LEVEL`, on a copy of ``engine`` rather than on
+    the engine itself, so that the connection goes back to the pool at the
+    server's default level.
+    """
+    return Session(engine.execution_options(isolation_level=SNAPSHOT_ISOLATION_LEVEL))
+
+
+def snapshot_worker_count(session: Session, requested: int, tasks: int,
+                          logger: logging.Logger) -> int:
+    """Decide how many connections measure a report's ``tasks`` years.
+
+    Never more than there are years, and never more than the server's free
+    connections allow, keeping :data:`RESERVED_CONNECTIONS` back: a worker refused
+    a connection would fail the report, where a smaller pool only takes longer.
+    ``--jobs auto`` is also held to ``max_parallel_workers``
+    (:data:`MAX_PARALLEL_WORKERS_SQL`). An explicit ``--jobs`` is not: the setting
+    caps the workers of one parallel plan, not client backends.
+    """
+    if tasks <= 1 or requested == 1:
+        return 1
+    free = session.execute(text(FREE_CONNECTIONS_SQL)).scalar()
+    room = max(1, free - RESERVED_CONNECTIONS)
+    if requested == AUTO_JOBS:
+        cores = session.execute(text(MAX_PARALLEL_WORKERS_SQL)).scalar()
+        jobs = max(1, min(tasks, cores, room))
+        logger.info("--jobs auto: %d worker(s), from %d year(s), max_parallel_workers %d "
+                    "and room for %d on the server", jobs, tasks, cores, room)
+        return jobs
+
+    jobs = min(requested, tasks)
+    if jobs > room:
+        logger.warning("--jobs %d needs %d connections and the server has %d free; running "
+                       "%d worker(s) instead", jobs, jobs, free, room)
+        jobs = room
+    return jobs
+
+
+def measure_by_year(session: Session, years: list[int],
+                    measure: typing.Callable[[Session, int], list[_Measured]],
+                    jobs: int, label: str, scope: str,
+                    logger: logging.Logger) -> list[_Measured]:
+    """Run ``measure(session, year)`` for every year, returning their rows in ``years`` order.
+
+    The statistics reports measure one statement per year so that the memory a
+    statement's spatial joins take is given back between years. Run one after
+    another, on ``session``, they take one server core between them for as long as
+    the years take together. That is the ``jobs`` of 1 path: a spinner per year,
+    ``label (scope, year: n of m)``, saying which one it is on.
+
+    With more, ``session``'s transaction exports its snapshot
+    (:data:`EXPORT_SNAPSHOT_SQL`) and up to ``jobs`` worker connections, each in a
+    thread of its own — the threads only wait on sockets — import it
+    (:data:`IMPORT_SNAPSHOT_SQL`) before their first year and measure the years
+    as they come free. Every statement, the parent's and the workers', then reads
+    the same snapshot, so the report is exactly as consistent as it is serially:
+    an import committing during the run is in none of the years or, had it
+    committed before the report began, in all of them.
+
+    ``session`` must be at :data:`SNAPSHOT_ISOLATION_LEVEL` (see
+    :func:`snapshot_session`) for its own statements to be on that snapshot too;
+    it is held open, unchanged, until the last worker is done, because an exported
+    snapshot can be imported only while the transaction that exported it lives.
+    ``measure`` must not commit.
+
+    Raises
+    ------
+    RuntimeError
+        If any year failed. The years not yet started are cancelled, the ones
+        running are let finish, and every failure is named.
+    """
+    jobs = snapshot_worker_count(session, jobs, len(years), logger)
+    if jobs == 1:
+        measured: list[_Measured] = []
+        for index, year in enumerate(years, start=1):
+            with Spinner(f"{label} ({scope}, {year}: {index} of {len(years)})", logger):
+                measured += measure(session, year)
+        return measured
+
+    snapshot = session.execute(text(EXPORT_SNAPSHOT_SQL)).scalar_one()
+    if not SNAPSHOT_ID.fullmatch(snapshot):
+        raise RuntimeError(f"the server exported a snapshot as {snapshot!r}, which is not "
+                           f"an identifier this application knows how to import")
+    label = f"{label} ({scope})"
+    logger.info("%s: %d year(s) on %d connection(s), all reading snapshot %s",
+                label, len(years), jobs, snapshot)
+
+    worker_engine = create_engine(session.get_bind().url, poolclass=NullPool,
+                                  isolation_level=SNAPSHOT_ISOLATION_LEVEL)
+    local = threading.local()
+    connections = []
+    lock = threading.Lock()
+
+    def run(year: int) -> list[_Measured]:
+        if not hasattr(local, "session"):
+            connection = worker_engine.connect()
+            with lock:
+                connections.append(connection)
+            connection.exec_driver_sql(IMPORT_SNAPSHOT_SQL.format(snapshot=snapshot))
+            local.session = Session(bind=connection)
+        return measure(local.session, year)
+
+    results: dict[int, list[_Measured]] = {}
+    failures: list[str] = []
+    progress = ProgressReporter(len(years), label, logger, log_every=1)
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            futures = {pool.submit(run, year): year for year in years}
+            for future in as_completed(futures):
+                year = futures[future]
+                if future.cancelled():
+                    continue
+                try:
+                    results[year] = future.result()
+                except Exception as error:  # noqa: BLE001  (raised below, with the rest)
+                    failures.append(f"{year} ({error})")
+                    for pending in futures:
+                        pending.cancel()
+                progress.advance()
+        progress.finish()
+    finally:
+        for connection in connections:
+            connection.rollback()
+            connection.close()
+        worker_engine.dispose()
+
+    if failures:
+        raise RuntimeError(f"{len(failures)} of {len(years)} year(s) failed: "
+                           + "; ".join(failures))
+    return [row for year in years for row in results[year]]
+
+
 # --------------------------------------------------------------------------
 # Provider
 # --------------------------------------------------------------------------
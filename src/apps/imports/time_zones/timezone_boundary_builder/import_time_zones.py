@@ -37,6 +37,12 @@ The zip is read in place; nothing is unpacked. Re-running it upgrades the table
 to a newer release: rows are matched by zone name and their geometry replaced,
 which is what makes this safe to repeat when IANA splits or merges a zone.
 
+Each zone written is also cut into
+:class:`~src.data_model.geography.time_zone.TimeZonePart` pieces of a few hundred
+vertices, in the same transaction. The importers look a fire's zone up in those
+rather than in the zones themselves: a point test against a whole zone walks its
+entire outline, one against a piece only the piece.
+
 Database settings come from the environment (``.env``, see :mod:`src.settings`);
 every one of them can be overridden with a command-line argument.
 
@@ -123,13 +129,19 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
 
 def transform(session: Session, staging_table: str, tzid_field: str,
               logger: logging.Logger) -> int:
-    """Map the staging table onto the model, returning the number of zones written."""
+    """Map the staging table onto the model, returning the number of zones written.
+
+    The zones written have their lookup pieces cut again (see
+    :func:`src.apps.imports.common.cut_time_zone_parts`): an upgraded zone's old
+    pieces describe its old area, and would go on answering for it.
+    """
     result = session.execute(
         text(TRANSFORM_SQL.format(staging_table=staging_table, tzid_field=tzid_field))
     )
-    imported = len(result.all())
-    logger.info("Imported %d time zones", imported)
-    return imported
+    zone_ids = result.scalars().all()
+    logger.info("Imported %d time zones", len(zone_ids))
+    common.cut_time_zone_parts(session, logger, replace=zone_ids)
+    return len(zone_ids)
 
 
 def import_time_zones(args: argparse.Namespace, engine: Engine, logger: logging.Logger) -> int:
@@ -142,7 +154,7 @@ def import_time_zones(args: argparse.Namespace, engine: Engine, logger: logging.
     staging_table = f"{args.staging_schema}.{args.staging_table}"
     datasource, layer = common.shapefile_datasource(args.shapefile)
 
-    common.require_tables(engine, ["time_zone"], logger)
+    common.require_tables(engine, ["time_zone", "time_zone_part"], logger)
     common.create_staging_schema(engine, args.staging_schema)
     common.load_staging_table(datasource, layer, staging_table, args,
                               common.resolve_database_settings(args), logger)
@@ -163,6 +163,18 @@ point is built from them in SQL — the same rule as the perimeter, for the same
    a disagreement between two observations, not an error to repair, and the import
    stores both and reports how many are inside.
 
+``--incremental``
+-----------------
+
+The two passes are one import here, not one per file: every point is matched to a
+perimeter of the combined layer, and re-importing the perimeters leaves the points
+of every unchanged yearly layer pointing at fires that are gone. So the manifest
+(:class:`~src.data_model.source_file.SourceFile`) records the **source** — the
+directory, or the one file given — with a SHA-256 over every file in it, and an
+incremental run either skips the whole import or runs it whole. The entry is
+written once both passes have committed. It records both passes and every year,
+so it cannot be combined with ``--year`` or ``--skip-ignitions``.
+
 The encoding
 ------------
 
@@ -452,17 +464,17 @@ located AS MATERIALIZED (
     SELECT projected.*, zone.name AS time_zone, country.id AS admin_boundary_id
     FROM projected
     LEFT JOIN LATERAL (
-        SELECT time_zone.name
-        FROM time_zone
-        WHERE ST_Contains(time_zone.geometry, projected.locator)
+        SELECT time_zone_part.name
+        FROM time_zone_part
+        WHERE ST_Intersects(time_zone_part.geometry, projected.locator)
         LIMIT 1
     ) AS zone ON TRUE
     LEFT JOIN LATERAL (
-        SELECT boundary.id
-        FROM admin_boundary AS boundary
-        WHERE boundary.data_provider_id = :boundary_provider_id
-          AND boundary.level = 0
-          AND ST_Contains(boundary.geometry, projected.locator)
+        SELECT part.admin_boundary_id AS id
+        FROM admin_boundary_part AS part
+        WHERE part.data_provider_id = :boundary_provider_id
+          AND part.level = 0
+          AND ST_Intersects(part.geometry, projected.locator)
         LIMIT 1
     ) AS country ON TRUE
 ),
@@ -604,17 +616,17 @@ located AS MATERIALIZED (
     SELECT projected.*, zone.name AS time_zone, country.id AS admin_boundary_id
     FROM projected
     LEFT JOIN LATERAL (
-        SELECT time_zone.name
-        FROM time_zone
-        WHERE ST_Contains(time_zone.geometry, projected.geometry)
+        SELECT time_zone_part.name
+        FROM time_zone_part
+        WHERE ST_Intersects(time_zone_part.geometry, projected.geometry)
         LIMIT 1
     ) AS zone ON TRUE
     LEFT JOIN LATERAL (
-        SELECT boundary.id
-        FROM admin_boundary AS boundary
-        WHERE boundary.data_provider_id = :boundary_provider_id
-          AND boundary.level = 0
-          AND ST_Contains(boundary.geometry, projected.geometry)
+        SELECT part.admin_boundary_id AS id
+        FROM admin_boundary_part AS part
+        WHERE part.data_provider_id = :boundary_provider_id
+          AND part.level = 0
+          AND ST_Intersects(part.geometry, projected.geometry)
         LIMIT 1
     ) AS country ON TRUE
 ),
@@ -699,12 +711,19 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
                         help="do all the work and roll it back, reporting what would have "
                              "been imported. Nothing is written, including the replacement "
                              "of years already in the database")
+    common.add_incremental_arguments(parser)
 
+    common.add_jobs_arguments(parser, "yearly layers")
     common.add_database_arguments(parser)
     common.add_staging_arguments(parser, DEFAULT_STAGING_TABLE)
     common.add_common_arguments(parser)
 
-    return parser.parse_args(argv)
+    args = parser.parse_args(argv)
+    if args.incremental and (args.year or args.skip_ignitions):
+        # The manifest records the whole source: a run that read part of it would
+        # be skipped next time with the rest never read.
+        parser.error("--incremental cannot be combined with --year or --skip-ignitions")
+    return args
 
 
 def find_layers(args: argparse.Namespace) -> tuple[Path | None, list[Path]]:
@@ -977,7 +996,7 @@ def transform_ignitions(session: Session, provider_id: int,
 
 
 def load_layer(archive: Path, staging_table: str, args: argparse.Namespace,
-               logger: logging.Logger) -> None:
+               logger: logging.Logger, progress: bool | None = None) -> None:
     """Stage one published layer, in the CRS it was published in.
 
     EPSG:25830 and not the EPSG:3042 GDAL reads off the ``.prj``: the same projection,
@@ -986,7 +1005,7 @@ def load_layer(archive: Path, staging_table: str, args: argparse.Namespace,
     datasource, layer = common.shapefile_datasource(archive)
     common.load_staging_table(
         datasource, layer, staging_table, args, common.resolve_database_settings(args),
-        logger,
+        logger, progress=progress,
         target_srs=f"EPSG:{andalusia_rediam.SOURCE_SRID}",
         # No ENCODING open option: every .dbf carries a .cpg and GDAL reads it.
         # check_encoding() below is the check that goes with that decision.
@@ -1015,9 +1034,8 @@ def import_perimeters(archive: Path, engine: Engine, args: argparse.Namespace,
 
     with Session(engine) as session:
         normalise_staging_columns(session, staging_table, STAGING_COLUMNS, log)
-        # ogr2ogr leaves the table with no statistics at all, so without this the
-        # planner sizes the staging table as if it held a handful of rows and picks
-        # nested loops over the spatial joins below.
+        # Again, after the load's own: the columns normalise_staging_columns adds or
+        # retypes have no statistics, and the transform below reads them.
         session.execute(text(f"ANALYZE {staging_table}"))
         check_encoding(session, staging_table, log)
 
@@ -1065,18 +1083,22 @@ def import_perimeters(archive: Path, engine: Engine, args: argparse.Namespace,
 
 def import_ignitions(archive: Path, engine: Engine, args: argparse.Namespace,
                      provider_id: int, boundary_provider_id: int | None,
-                     logger: logging.Logger) -> int:
+                     logger: logging.Logger, staging_table: str | None = None,
+                     progress: bool | None = None) -> int:
     """Import the ignition points of one yearly layer, returning the points stored.
 
     A layer that publishes no ``X_INIC`` / ``Y_INIC`` is staged, found to have none and
     skipped — which is the only way to know, the attribute list being a property of the
     file rather than of its name. That costs one load of a few dozen rows.
+
+    ``staging_table`` is given to each worker of a parallel run, so that no two load
+    over each other; a serial run keeps the plain name.
     """
-    staging_table = f"{args.staging_schema}.{args.staging_table}"
+    staging_table = staging_table or f"{args.staging_schema}.{args.staging_table}"
     source_layer = andalusia_rediam.source_layer_name(archive.stem)
     log = ArchiveLogger(logger, {"archive": archive.name})
 
-    load_layer(archive, staging_table, args, log)
+    load_layer(archive, staging_table, args, log, progress=progress)
 
     with Session(engine) as session:
         added, _ = normalise_staging_columns(
@@ -1131,11 +1153,17 @@ def delete_ignitions(session: Session, source_layer: str, logger: logging.Logger
 
 def import_wildfires(args: argparse.Namespace, engine: Engine,
                      logger: logging.Logger) -> int:
-    """Run the whole import against ``engine``, returning the fires imported."""
+    """Run the whole import against ``engine``, returning the fires imported.
+
+    With ``--incremental`` the source is hashed first and the import skipped if the
+    manifest says it is the one already imported; otherwise its entry is written
+    in a transaction of its own once both passes have committed.
+    """
     perimeter_layer, yearly_layers = find_layers(args)
     common.require_tables(engine, ["wildfire", "rediam_wildfire", "ignition",
                                    "rediam_ignition", "egif_wildfire", "time_zone",
-                                   "data_provider"], logger)
+                                   "time_zone_part", "admin_boundary_part", "data_provider"]
+                          + (["source_file"] if args.incremental else []), logger)
     common.create_staging_schema(engine, args.staging_schema)
 
     for path in skipped_layers(args):
@@ -1156,6 +1184,14 @@ def import_wildfires(args: argparse.Namespace, engine: Engine,
             boundary_provider.id if boundary_provider is not None else None
         )
 
+    source = args.directory if args.directory is not None else args.shapefile
+    digest = None
+    if args.incremental:
+        digest = common.changed_source_digest(
+            engine, provider_id, source, ArchiveLogger(logger, {"archive": source.name}))
+        if digest is None:
+            return 0
+
     started = time.monotonic()
     logger.info("Importing perimeters from %s%s", perimeter_layer.name,
                 " (dry run: nothing will be written)" if args.dry_run else "")
@@ -1173,11 +1209,20 @@ def import_wildfires(args: argparse.Namespace, engine: Engine,
         # layer is not a yearly one and cannot be in this list, and in single-file
         # mode the one file is deliberately both — a yearly layer carries the
         # perimeters *and* the points, and reading it twice is what gets both.
+        #
+        # The yearly layers are what --jobs spreads across workers; the perimeters
+        # are one layer. Each yearly one only replaces its own points and links
+        # them to its own year's fires, so no two workers write the same rows.
         logger.info("Reading %d yearly layer(s) for ignition points", len(yearly_layers))
-        for index, archive in enumerate(yearly_layers, start=1):
-            logger.info("[%d/%d] %s", index, len(yearly_layers), archive.name)
-            points += import_ignitions(archive, engine, args, provider_id,
-                                       boundary_provider_id, logger)
+        points = sum(common.run_imports(yearly_layers, import_ignitions, engine, args,
+                                        (provider_id, boundary_provider_id), logger,
+                                        unit="layer"))
+
+    if digest is not None and not args.dry_run:
+        with Session(engine) as session:
+            common.record_source_file(session, provider_id, source, *digest, 0,
+                                      span=(None, None, imported))
+            session.commit()
 
     logger.info("%s %d fire(s) and %d ignition point(s) in %.0fs",
                 "Would have imported" if args.dry_run else "Imported",
@@ -89,6 +89,13 @@ what makes a re-run of a revised publication supersede rather than double.
 ``--dry-run`` does all the work and rolls it back, including the delete, so the
 numbers reported are the ones a real run would produce.
 
+``--incremental`` skips an archive whose SHA-256 is the one recorded in the
+``source_file`` manifest when it was last imported (see
+:class:`~src.data_model.source_file.SourceFile`), and imports one whose hash has
+changed as any run would, replacing its years. The entry is written in the year's
+own transaction. It records whole archives, so it cannot be combined with
+``--year``.
+
 Database settings come from the environment (``.env``, see :mod:`src.settings`);
 every one of them can be overridden with a command-line argument.
 """
@@ -387,17 +394,17 @@ located AS MATERIALIZED (
     SELECT projected.*, zone.name AS time_zone, country.id AS admin_boundary_id
     FROM projected
     LEFT JOIN LATERAL (
-        SELECT time_zone.name
-        FROM time_zone
-        WHERE ST_Contains(time_zone.geometry, projected.locator)
+        SELECT time_zone_part.name
+        FROM time_zone_part
+        WHERE ST_Intersects(time_zone_part.geometry, projected.locator)
         LIMIT 1
     ) AS zone ON TRUE
     LEFT JOIN LATERAL (
-        SELECT boundary.id
-        FROM admin_boundary AS boundary
-        WHERE boundary.data_provider_id = :boundary_provider_id
-          AND boundary.level = 0
-          AND ST_Contains(boundary.geometry, projected.locator)
+        SELECT part.admin_boundary_id AS id
+        FROM admin_boundary_part AS part
+        WHERE part.data_provider_id = :boundary_provider_id
+          AND part.level = 0
+          AND ST_Intersects(part.geometry, projected.locator)
         LIMIT 1
     ) AS country ON TRUE
 ),
@@ -645,7 +652,7 @@ def transform(session: Session, provider_id: int, boundary_provider_id: int | No
 # --------------------------------------------------------------------------
 
 def load_archive(archive: Path, staging_table: str, args: argparse.Namespace,
-                 logger: logging.LoggerAdapter) -> None:
+                 logger: logging.LoggerAdapter, progress: bool | None = None) -> None:
     """Stage one published archive, in the CRS it was published in.
 
     EPSG:3978 and not whatever GDAL decides to call the unnamed projection in the
@@ -655,7 +662,7 @@ def load_archive(archive: Path, staging_table: str, args: argparse.Namespace,
     datasource, layer = common.shapefile_datasource(archive)
     common.load_staging_table(
         datasource, layer, staging_table, args, common.resolve_database_settings(args),
-        logger,
+        logger, progress=progress,
         target_srs=f"EPSG:{canada_nbac.SOURCE_SRID}",
         fid_column=STAGING_FID_COLUMN,
         creation_options=STAGING_CREATION_OPTIONS,
@@ -664,19 +671,31 @@ def load_archive(archive: Path, staging_table: str, args: argparse.Namespace,
 
 def import_archive(archive: Path, engine: Engine, args: argparse.Namespace,
                    provider_id: int, boundary_provider_id: int | None,
-                   logger: logging.Logger) -> int:
-    """Import one yearly archive in its own transaction, returning the fires stored."""
-    staging_table = f"{args.staging_schema}.{args.staging_table}"
+                   logger: logging.Logger, staging_table: str | None = None,
+                   progress: bool | None = None) -> int:
+    """Import one yearly archive in its own transaction, returning the fires stored.
+
+    ``staging_table`` is given to each worker of a parallel run, so that no two
+    load over each other; a serial run keeps the plain name.
+
+    With ``--incremental`` the archive is hashed first and skipped, before anything
+    is loaded, if the manifest says it is the one already imported.
+    """
+    staging_table = staging_table or f"{args.staging_schema}.{args.staging_table}"
     log = ArchiveLogger(logger, {"archive": archive.name})
 
     started = time.monotonic()
-    load_archive(archive, staging_table, args, log)
+    digest = None
+    if args.incremental:
+        digest = common.changed_source_digest(engine, provider_id, archive, log)
+        if digest is None:
+            return 0
+    load_archive(archive, staging_table, args, log, progress=progress)
 
     with Session(engine) as session:
         normalise_staging_columns(session, staging_table, STAGING_COLUMNS, log)
-        # ogr2ogr leaves the table with no statistics at all, so without this the
-        # planner sizes it as if it held a handful of rows and picks nested loops
-        # over the spatial joins.
+        # Again, after the load's own: the columns normalise_staging_columns adds or
+        # retypes have no statistics, and the transform filters on them.
         session.execute(text(f"ANALYZE {staging_table}"))
         check_extent(session, staging_table, log)
 
@@ -690,8 +709,11 @@ def import_archive(archive: Path, engine: Engine, args: argparse.Namespace,
             return 0
         delete_years(session, years, log)
 
+        floor = common.wildfire_id_floor(session)
         audit = transform(session, provider_id, boundary_provider_id, staging_table,
                           args.year)
+        if digest is not None:
+            common.record_source_file(session, provider_id, archive, *digest, floor)
         if not args.keep_staging:
             common.drop_staging_table(session, staging_table, log)
         if args.dry_run:
@@ -758,11 +780,18 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
                         help="do all the work and roll it back, reporting what would have "
                              "been imported. Nothing is written, including the replacement "
                              "of years already in the database")
+    common.add_incremental_arguments(parser)
 
+    common.add_jobs_arguments(parser, "archives")
     common.add_database_arguments(parser)
     common.add_staging_arguments(parser, DEFAULT_STAGING_TABLE)
     common.add_common_arguments(parser)
-    return parser.parse_args(argv)
+    args = parser.parse_args(argv)
+    if args.incremental and args.year:
+        # The manifest records whole archives: one imported for a single year
+        # would be skipped next time with the rest of it never read.
+        parser.error("--incremental cannot be combined with --year")
+    return args
 
 
 def find_archives(args: argparse.Namespace) -> list[Path]:
@@ -788,8 +817,9 @@ def import_wildfires(args: argparse.Namespace, engine: Engine,
     archives = find_archives(args)
 
     common.require_tables(engine, ["wildfire", "nbac_wildfire", "nfdb_wildfire",
-                                   "admin_boundary", "time_zone", "data_provider"],
-                          logger)
+                                   "admin_boundary", "time_zone", "time_zone_part",
+                                   "admin_boundary_part", "data_provider"]
+                          + (["source_file"] if args.incremental else []), logger)
     common.create_staging_schema(engine, args.staging_schema)
 
     with Session(engine) as session:
@@ -804,12 +834,10 @@ def import_wildfires(args: argparse.Namespace, engine: Engine,
         boundary_provider_id = None if boundary_provider is None else boundary_provider.id
 
     started = time.monotonic()
-    written = 0
-    logger.info("%d archive(s) to import", len(archives))
-    for index, archive in enumerate(archives, start=1):
-        logger.info("[%d/%d] %s", index, len(archives), archive.name)
-        written += import_archive(archive, engine, args, provider_id,
-                                  boundary_provider_id, logger)
+    # Each archive replaces the years it holds and the archives are one year each,
+    # so no two workers delete or write the same fires.
+    written = sum(common.run_imports(archives, import_archive, engine, args,
+                                     (provider_id, boundary_provider_id), logger))
 
     logger.info("%s%d fire(s) from %d archive(s) in %.0fs",
                 "Would have imported " if args.dry_run else "Imported ",
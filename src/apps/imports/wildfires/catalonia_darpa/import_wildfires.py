@@ -141,6 +141,12 @@ failure that is hard to notice.
    the bound rows before deleting them and says so at ``WARNING``; re-running the
    binding application afterwards is what puts them back.
 
+``--incremental`` replaces only the layers the department actually republished: it
+compares each file's SHA-256 with the one recorded in the ``source_file`` manifest
+when it was last imported (see :class:`~src.data_model.source_file.SourceFile`)
+and skips the files whose hash is unchanged — which also keeps their EGIF
+bindings. ``--year`` picks whole files here, so the two combine.
+
 The year comes from the file, not from the layer inside it
 -----------------------------------------------------------
 
@@ -422,17 +428,17 @@ located AS MATERIALIZED (
     SELECT projected.*, zone.name AS time_zone, country.id AS admin_boundary_id
     FROM projected
     LEFT JOIN LATERAL (
-        SELECT time_zone.name
-        FROM time_zone
-        WHERE ST_Contains(time_zone.geometry, projected.locator)
+        SELECT time_zone_part.name
+        FROM time_zone_part
+        WHERE ST_Intersects(time_zone_part.geometry, projected.locator)
         LIMIT 1
     ) AS zone ON TRUE
     LEFT JOIN LATERAL (
-        SELECT boundary.id
-        FROM admin_boundary AS boundary
-        WHERE boundary.data_provider_id = :boundary_provider_id
-          AND boundary.level = 0
-          AND ST_Contains(boundary.geometry, projected.locator)
+        SELECT part.admin_boundary_id AS id
+        FROM admin_boundary_part AS part
+        WHERE part.data_provider_id = :boundary_provider_id
+          AND part.level = 0
+          AND ST_Intersects(part.geometry, projected.locator)
         LIMIT 1
     ) AS country ON TRUE
 ),
@@ -503,7 +509,9 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
                         help="do all the work and roll it back, reporting what would have "
                              "been imported. Nothing is written, including the replacement "
                              "of a layer already in the database")
+    common.add_incremental_arguments(parser)
 
+    common.add_jobs_arguments(parser, "layers")
     common.add_database_arguments(parser)
     common.add_staging_arguments(parser, DEFAULT_STAGING_TABLE)
     common.add_common_arguments(parser)
@@ -726,14 +734,22 @@ def transform(session: Session, provider_id: int, boundary_provider_id: int | No
 
 def import_archive(archive: Path, engine: Engine, args: argparse.Namespace,
                    provider_id: int, boundary_provider_id: int | None,
-                   logger: logging.Logger) -> int:
+                   logger: logging.Logger, staging_table: str | None = None,
+                   progress: bool | None = None) -> int:
     """Import one layer in its own transaction, returning the fires imported.
 
     Under ``--dry-run`` everything happens exactly as it would otherwise —
     including the delete of a layer already stored, so that the numbers are the
     ones a real run would produce — and the transaction is rolled back at the end.
+
+    With ``--incremental`` the file is hashed first and skipped, before anything is
+    loaded, if the manifest says it is the one already imported; otherwise its
+    entry is written in this transaction.
+
+    ``staging_table`` is given to each worker of a parallel run, so that no two
+    load over each other; a serial run keeps the plain name.
     """
-    staging_table = f"{args.staging_schema}.{args.staging_table}"
+    staging_table = staging_table or f"{args.staging_schema}.{args.staging_table}"
     datasource, layer = common.shapefile_datasource(archive)
     # From the file the department versions, never from the GDAL layer inside it:
     # incendis22.zip holds a layer called plainly "incendis", which carries no year
@@ -744,8 +760,14 @@ def import_archive(archive: Path, engine: Engine, args: argparse.Namespace,
     log = ArchiveLogger(logger, {"archive": archive.name})
 
     started = time.monotonic()
+    digest = None
+    if args.incremental:
+        digest = common.changed_source_digest(engine, provider_id, archive, log)
+        if digest is None:
+            return 0
     common.load_staging_table(
         datasource, layer, staging_table, args, common.resolve_database_settings(args), log,
+        progress=progress,
         # The published CRS, kept rather than converted: the model stores the
         # polygon in it as well as in EPSG:4326, and the 4326 one is derived from
         # it in SQL so that the two provably agree.
@@ -761,14 +783,16 @@ def import_archive(archive: Path, engine: Engine, args: argparse.Namespace,
             delete_layer(session, source_layer, log)
 
         normalise_staging_columns(session, staging_table, log)
-        # ogr2ogr leaves the table with no statistics at all, so without this the
-        # planner sizes the staging table as if it held a handful of rows and
-        # picks nested loops over the spatial joins below.
+        # Again, after the load's own: the columns normalise_staging_columns adds or
+        # retypes have no statistics, and the transform below reads them.
         session.execute(text(f"ANALYZE {staging_table}"))
         check_encoding(session, staging_table, log)
 
+        floor = common.wildfire_id_floor(session)
         audit = transform(session, provider_id, boundary_provider_id,
                           staging_table, source_layer, year)
+        if digest is not None:
+            common.record_source_file(session, provider_id, archive, *digest, floor)
         if not args.keep_staging:
             common.drop_staging_table(session, staging_table, log)
         if args.dry_run:
@@ -802,7 +826,9 @@ def import_wildfires(args: argparse.Namespace, engine: Engine, logger: logging.L
     archives = find_archives(args)
     duplicates, unnamed = skipped_archives(args)
     common.require_tables(engine, ["wildfire", "darpa_wildfire", "egif_wildfire",
-                                   "time_zone", "data_provider"], logger)
+                                   "time_zone", "time_zone_part", "admin_boundary_part",
+                                   "data_provider"]
+                          + (["source_file"] if args.incremental else []), logger)
     common.create_staging_schema(engine, args.staging_schema)
 
     for path in duplicates:
@@ -827,13 +853,14 @@ def import_wildfires(args: argparse.Namespace, engine: Engine, logger: logging.L
         )
 
     started = time.monotonic()
-    imported = 0
-    logger.info("Importing %d layer(s)%s", len(archives),
-                " (dry run: nothing will be written)" if args.dry_run else "")
-    for index, archive in enumerate(archives, start=1):
-        logger.info("[%d/%d] %s", index, len(archives), archive.name)
-        imported += import_archive(archive, engine, args, provider_id,
-                                   boundary_provider_id, logger)
+    if args.dry_run:
+        logger.info("Dry run: nothing will be written")
+    # One layer is one year and only ever replaces that year's fires, and the
+    # duplicate copies of a year were set aside above, so no two workers write
+    # the same rows.
+    imported = sum(common.run_imports(archives, import_archive, engine, args,
+                                      (provider_id, boundary_provider_id), logger,
+                                      unit="layer"))
 
     logger.info("%s %d fires from %d layer(s) in %.0fs",
                 "Would have imported" if args.dry_run else "Imported",
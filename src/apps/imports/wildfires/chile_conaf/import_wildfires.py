@@ -54,6 +54,14 @@ points this way, so replacing a season underneath it would leave a dangling
 reference the foreign key would refuse anyway — asked up front so the run says what
 the problem is instead of dying on a constraint.
 
+``--incremental`` skips an archive whose SHA-256 is the one recorded in the
+``source_file`` manifest when it was last imported (see
+:class:`~src.data_model.source_file.SourceFile`), so a nightly re-run over the 23
+archives re-reads only what CONAF republished — and does not trip over the
+*magnitud* links of the seasons it leaves alone. The entry is written once every
+season of the archive has committed. It records whole archives, so it cannot be
+combined with ``--season``.
+
 The published attributes are named 34 different ways
 ------------------------------------------------------
 
@@ -424,107 +432,6 @@ WHERE NOT corrupt
 ORDER BY season_start_year
 """
 
-#: How finely :data:`BOUNDARY_PARTS_SQL` and :data:`TIME_ZONE_PARTS_SQL` cut the
-#: polygons they copy. The PostGIS recipe's own figure; anything of this order works,
-#: because what matters is that a piece is small, not how small.
-SUBDIVIDE_VERTICES = 256
-
-#: The countries the staged points could be in, cut into pieces small enough to test
-#: a point against.
-#:
-#: **This is what makes the import take minutes rather than hours.** The lookup it
-#: replaces — ``ST_Contains`` straight against ``admin_boundary`` — is indexed and
-#: still costs about 100 ms per fire, because Chile's OCHA level 0 boundary is
-#: 8.7 million vertices and 134 MB: the GiST index finds the country, and then every
-#: single row detoasts and tests against the whole of it. Cut into ≤256-vertex
-#: pieces, the same lookup costs 0.03 ms — three thousand times less — and answers
-#: identically, because the pieces tile the country they came from.
-#:
-#: Restricted to the staged extent, so an archive pays only for the countries its own
-#: fires could be in: Chile and its neighbours, not all 318 of them. A country whose
-#: polygon contains one of the points necessarily has a bounding box meeting their
-#: extent, so nothing that could match is left out.
-#:
-#: Built during the run and dropped when it ends. A permanent table of pieces would
-#: serve every import rather than only this one — ``canada_nbac`` and ``canada_nfdb``
-#: pay the same toll on Canada's 8.5 million vertices — but it would have to be kept
-#: in step with the boundary imports that fill ``admin_boundary``, and this import
-#: does not have to wait for that to be built.
-BOUNDARY_PARTS_SQL = """
-CREATE TABLE {parts_table} AS
-SELECT boundary.id AS admin_boundary_id,
-       ST_Subdivide(boundary.geometry, {max_vertices}) AS geometry
-FROM admin_boundary AS boundary
-WHERE boundary.level = 0
-  AND boundary.data_provider_id = :boundary_provider_id
-  AND boundary.geometry && ST_GeomFromText(:extent, 4326)
-"""
-
-#: The time zone areas the staged points could be in, cut the same way.
-#:
-#: Cheaper to begin with than the countries — no zone is a Chile — but the same 3 ms
-#: per fire is a quarter of an hour over the whole archive, and it goes the same way
-#: for the same reason.
-TIME_ZONE_PARTS_SQL = """
-CREATE TABLE {parts_table} AS
-SELECT time_zone.name AS name,
-       ST_Subdivide(time_zone.geometry, {max_vertices}) AS geometry
-FROM time_zone
-WHERE time_zone.geometry && ST_GeomFromText(:extent, 4326)
-"""
-
-#: The index that is the whole point of the two tables above.
-PARTS_INDEX_SQL = "CREATE INDEX ON {parts_table} USING gist (geometry)"
-
-#: The grid the staged extent is rounded out to, in degrees.
-#:
-#: Coarse on purpose, and this is the number that decides how often a run stops to
-#: cut polygons up. Rounded to the degree, every season is a slightly different box —
-#: one fire further north than last year's is enough — so each archive would find the
-#: pieces a hair too small and cut Chile again, 23 times over a full run. Rounded to
-#: ten, every mainland season is the same box and Rapa Nui is one other: two builds
-#: for the whole directory, and the second only because Rapa Nui is 3,500 km out.
-#:
-#: The price is the neighbours a wider box takes in — Peru, Bolivia, Argentina and
-#: the rest of the Southern Cone are cut up as well as Chile. They are small: Chile
-#: alone is 8.7 million of the vertices involved, and the whole of the rest of the
-#: box is a fraction of it.
-EXTENT_SNAP_DEGREES = 10
-
-#: The box the staged points cover, in EPSG:4326, or ``NULL`` for an empty archive,
-#: rounded out to :data:`EXTENT_SNAP_DEGREES` so the next archive can reuse it.
-STAGED_EXTENT_SQL = """
-SELECT ST_AsText(ST_MakeEnvelope(
-           GREATEST(floor(ST_XMin(box) / {snap}) * {snap}, -180),
-           GREATEST(floor(ST_YMin(box) / {snap}) * {snap}, -90),
-           LEAST(ceil(ST_XMax(box) / {snap}) * {snap}, 180),
-           LEAST(ceil(ST_YMax(box) / {snap}) * {snap}, 90),
-           4326)) AS extent
-FROM (
-    SELECT ST_Extent(ST_Transform(staging.geom, 4326))::geometry AS box
-    FROM {staging_table} AS staging
-    WHERE NOT staging.corrupt AND staging.geom IS NOT NULL
-) AS staged
-WHERE box IS NOT NULL
-"""
-
-#: Whether pieces cut for ``:covered`` can answer for points inside ``:extent``.
-#:
-#: They can when the one box holds the other, and only then: a country selected for
-#: the first box is not necessarily one that would have been selected for a box
-#: reaching further, and the pieces of the country that was missed do not exist to
-#: be found. Boundary cases are answered ``false`` and cost a rebuild, which is the
-#: harmless way round.
-EXTENT_COVERED_SQL = """
-SELECT ST_Contains(ST_GeomFromText(:covered, 4326), ST_GeomFromText(:extent, 4326))
-"""
-
-#: The box holding both, for a rebuild that will not have to be done again for either.
-EXTENT_UNION_SQL = """
-SELECT ST_AsText(ST_Envelope(ST_Collect(ST_GeomFromText(:covered, 4326),
-                                        ST_GeomFromText(:extent, 4326))))
-"""
-
 #: Which of ``conaf_ignition``'s two grid columns a fire has to be on to belong to
 #: the territory the archive being imported covers.
 #:
@@ -605,10 +512,12 @@ WHERE conaf_wildfire_id IN (
 #: ``zoned``
 #:     Zone and country from the point. Chile spans three zones, so this is a real
 #:     lookup and not a formality: ``Pacific/Easter`` is two hours from the mainland
-#:     and ``America/Punta_Arenas`` one. Both lookups go to the subdivided copies
-#:     :func:`build_lookup_parts` leaves in the staging schema rather than to
-#:     ``admin_boundary`` and ``time_zone`` themselves — see :data:`BOUNDARY_PARTS_SQL`
-#:     for why, and for the three orders of magnitude it is worth.
+#:     and ``America/Punta_Arenas`` one. Both lookups go to the subdivided
+#:     ``admin_boundary_part`` and ``time_zone_part`` rather than to the tables they
+#:     were cut from: Chile's OCHA boundary is 8.7 million vertices, and a point
+#:     tested against the whole of it costs about 100 ms where against a piece of it
+#:     it costs 0.03 ms (see
+#:     :class:`~src.data_model.geography.admin_boundary.AdminBoundaryPart`).
 #:
 #:     ``ST_Intersects`` and not ``ST_Contains``, which is forced by the subdivision:
 #:     cutting a country into pieces creates internal edges that were never part of
@@ -700,14 +609,16 @@ zoned AS MATERIALIZED (
     FROM numbered
     LEFT JOIN LATERAL (
         SELECT part.name
-        FROM {time_zone_parts} AS part
+        FROM time_zone_part AS part
         WHERE ST_Intersects(part.geometry, ST_Transform(numbered.geom, 4326))
         LIMIT 1
     ) AS zone ON TRUE
     LEFT JOIN LATERAL (
         SELECT part.admin_boundary_id AS id
-        FROM {boundary_parts} AS part
-        WHERE ST_Intersects(part.geometry, ST_Transform(numbered.geom, 4326))
+        FROM admin_boundary_part AS part
+        WHERE part.data_provider_id = :boundary_provider_id
+          AND part.level = 0
+          AND ST_Intersects(part.geometry, ST_Transform(numbered.geom, 4326))
         LIMIT 1
     ) AS country ON TRUE
 ),
@@ -1317,93 +1228,11 @@ class Audit:
                         for field in fields(self)})
 
 
-@dataclass
-class LookupParts:
-    """The two subdivided lookup tables, and the box they were cut for.
-
-    Named after the staging table and living in the staging schema beside it, so
-    that ``--staging-table`` keeps two runs apart exactly as it already does, and
-    ``--keep-staging`` keeps these to be looked at too.
-
-    One of these is made per run and handed to every archive, because ``covered`` is
-    what lets the second archive use the first one's pieces: cutting Chile up costs
-    about half a minute, and a run over all 23 archives that did it again each time
-    would spend ten minutes cutting the same country into the same pieces.
-    """
-
-    boundary: str
-    time_zone: str
-    #: The box the pieces answer for, as WKT in EPSG:4326, or ``None`` before the
-    #: first build. Grows to hold each archive that does not fit it — the mainland
-    #: and Rapa Nui together, after which nothing in this dataset is outside it.
-    covered: str | None = None
-
-    @classmethod
-    def beside(cls, staging_table: str) -> LookupParts:
-        """The names to use next to ``staging_table``."""
-        return cls(boundary=f"{staging_table}_boundary_parts",
-                   time_zone=f"{staging_table}_time_zone_parts")
-
-    def __iter__(self) -> typing.Iterator[str]:
-        """The two table names, for dropping them."""
-        return iter((self.boundary, self.time_zone))
-
-
-def build_lookup_parts(session: Session, staging_table: str, parts: LookupParts,
-                       boundary_provider_id: int | None,
-                       logger: logging.Logger) -> None:
-    """Cut the countries and zones the staged points could be in into small pieces.
-
-    Called once per archive, before any of its seasons is written; it does the work
-    only when the pieces it already has cannot answer for the points just staged.
-    The tables it builds are what :data:`TRANSFORM_SQL` looks points up in — see
-    :data:`BOUNDARY_PARTS_SQL` for what they are worth.
-
-    An empty ``boundary_provider_id`` — the boundaries were never imported — builds
-    the table empty rather than skipping it, so the transform has something to join
-    to and fires simply come out with no country, which is what happened before.
-    """
-    extent = session.scalar(text(STAGED_EXTENT_SQL.format(staging_table=staging_table,
-                                                          snap=EXTENT_SNAP_DEGREES)))
-    if extent is None:
-        logger.debug("Nothing staged to look up; leaving the lookup tables alone")
-        if parts.covered is not None:
-            return
-        extent = "POLYGON EMPTY"
-
-    if parts.covered is not None:
-        if session.scalar(text(EXTENT_COVERED_SQL),
-                          {"covered": parts.covered, "extent": extent}):
-            logger.debug("Reusing the lookup pieces already cut for %s", parts.covered)
-            return
-        extent = session.scalar(text(EXTENT_UNION_SQL),
-                                {"covered": parts.covered, "extent": extent})
-
-    for name in parts:
-        session.execute(text(f"DROP TABLE IF EXISTS {name}"))
-    session.execute(text(BOUNDARY_PARTS_SQL.format(
-        parts_table=parts.boundary, max_vertices=SUBDIVIDE_VERTICES,
-    )), {"boundary_provider_id": boundary_provider_id, "extent": extent})
-    session.execute(text(TIME_ZONE_PARTS_SQL.format(
-        parts_table=parts.time_zone, max_vertices=SUBDIVIDE_VERTICES,
-    )), {"extent": extent})
-    for name in parts:
-        session.execute(text(PARTS_INDEX_SQL.format(parts_table=name)))
-        session.execute(text(f"ANALYZE {name}"))
-    parts.covered = extent
-
-    logger.debug("Cut %d boundary piece(s) and %d time zone piece(s) to look points up in",
-                 session.scalar(text(f"SELECT count(*) FROM {parts.boundary}")),
-                 session.scalar(text(f"SELECT count(*) FROM {parts.time_zone}")))
-
-
-def transform(session: Session, provider_id: int, parts: LookupParts,
+def transform(session: Session, provider_id: int, boundary_provider_id: int | None,
               staging_table: str, source_srid: int, season: int) -> Audit:
     """Map the staged rows of one season onto the model."""
     statement = TRANSFORM_SQL.format(
         staging_table=staging_table,
-        boundary_parts=parts.boundary,
-        time_zone_parts=parts.time_zone,
         trimmed=TRIMMED_CHARS,
         season_filter=season_filter([season]),
         reporter=REPORTER_SQL.format(trimmed=TRIMMED_CHARS),
@@ -1421,6 +1250,7 @@ def transform(session: Session, provider_id: int, parts: LookupParts,
     )
     parameters = {
         "provider_id": provider_id,
+        "boundary_provider_id": boundary_provider_id,
         "fallback_time_zone": chile_conaf.DEFAULT_TIME_ZONE,
         "seasons": [season],
         "season_label": f"{season}-{season + 1}",
@@ -1539,27 +1369,42 @@ def assert_season_survived(season: int, audit: Audit, staging_table: str) -> Non
 
 def import_archive(archive: Path, engine: Engine, args: argparse.Namespace,
                    provider_id: int, boundary_provider_id: int | None,
-                   parts: LookupParts, logger: logging.Logger) -> Audit:
+                   logger: logging.Logger, staging_table: str | None = None,
+                   progress: bool | None = None) -> Audit:
     """Stage one published archive and write the seasons it holds.
 
+    ``staging_table`` is given to each worker of a parallel run, so that no two
+    load over each other; a serial run keeps the plain name.
+
     Notes
     -----
     Staging happens once, then each season is deleted and rewritten in its own
     transaction. A season that fails rolls back alone: the seasons before it stay
     written and the run reports which one stopped it, rather than losing an hour's
     work to one bad row.
+
+    With ``--incremental`` the archive is hashed first and skipped if the manifest
+    says it is the one already imported. Its entry is written with the staging
+    table's drop, after the last season: the seasons replace themselves, so it
+    carries no id range, and an archive a season failed in stays unrecorded.
     """
     log = common.ArchiveLogger(logger, {"archive": archive.name})
     settings = common.resolve_database_settings(args)
-    staging_table = f"{args.staging_schema}.{args.staging_table}"
+    staging_table = staging_table or f"{args.staging_schema}.{args.staging_table}"
     total = Audit()
 
+    digest = None
+    if args.incremental:
+        digest = common.changed_source_digest(engine, provider_id, archive, log)
+        if digest is None:
+            return total
+
     with archives.archive_datasource(archive, log) as (datasource, layer, shapefile):
         source_srid = archives.archive_grid(shapefile, log)
         with exclusive_run(engine, staging_table, log):
             common.load_staging_table(
                 datasource, layer, staging_table, args, settings, log,
-                geometry_type="POINT",
+                geometry_type="POINT", progress=progress,
                 target_srs=f"EPSG:{source_srid}",
                 fid_column=STAGING_FID_COLUMN,
                 creation_options=STAGING_CREATION_OPTIONS,
@@ -1573,8 +1418,6 @@ def import_archive(archive: Path, engine: Engine, args: argparse.Namespace,
                 resolve_dates(session, staging_table, log)
                 upsert_causes(session, staging_table, log)
                 archives.check_extent(session, staging_table, source_srid, log)
-                build_lookup_parts(session, staging_table, parts,
-                                   boundary_provider_id, log)
                 seasons = staged_seasons(session, staging_table, args.season)
                 session.commit()
 
@@ -1586,7 +1429,7 @@ def import_archive(archive: Path, engine: Engine, args: argparse.Namespace,
             for season in seasons:
                 with Session(engine) as session:
                     delete_seasons(session, [season], source_srid)
-                    audit = transform(session, provider_id, parts,
+                    audit = transform(session, provider_id, boundary_provider_id,
                                       staging_table, source_srid, season)
                     assert_season_survived(season, audit, staging_table)
                     if args.dry_run:
@@ -1600,6 +1443,9 @@ def import_archive(archive: Path, engine: Engine, args: argparse.Namespace,
                     total = total + audit
 
             with Session(engine) as session:
+                if digest is not None and not args.dry_run:
+                    common.record_source_file(session, provider_id, archive, *digest, 0,
+                                              span=(None, None, total.written))
                 if not args.keep_staging:
                     common.drop_staging_table(session, staging_table, log)
                 session.commit()
@@ -1660,11 +1506,18 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument("--dry-run", action="store_true",
                         help="do all the work and roll it back, reporting what would "
                              "have been imported")
+    common.add_incremental_arguments(parser)
 
+    common.add_jobs_arguments(parser, "archives")
     common.add_database_arguments(parser)
     common.add_staging_arguments(parser, DEFAULT_STAGING_TABLE)
     common.add_common_arguments(parser)
-    return parser.parse_args(argv)
+    args = parser.parse_args(argv)
+    if args.incremental and args.season:
+        # The manifest records whole archives: one imported for a single season
+        # would be skipped next time with its other seasons never read.
+        parser.error("--incremental cannot be combined with --season")
+    return args
 
 
 def find_archives(directory: Path) -> list[Path]:
@@ -1686,8 +1539,9 @@ def import_wildfires(args: argparse.Namespace, engine: Engine,
     """Import the archives against ``engine``, returning the totals."""
     common.require_tables(engine, ["wildfire", "ignition", "conaf_wildfire",
                                    "conaf_ignition", "conaf_fire_cause",
-                                   "conaf_magnitud_wildfire", "admin_boundary",
-                                   "time_zone", "data_provider"], logger)
+                                   "conaf_magnitud_wildfire", "admin_boundary", "time_zone",
+                                   "time_zone_part", "admin_boundary_part", "data_provider"]
+                          + (["source_file"] if args.incremental else []), logger)
     common.create_staging_schema(engine, args.staging_schema)
 
     with Session(engine) as session:
@@ -1705,22 +1559,13 @@ def import_wildfires(args: argparse.Namespace, engine: Engine,
                      else list(args.shapefile))
     if not archive_paths:
         raise RuntimeError(f"no archive found in {args.directory}")
-    logger.info("Importing %d archive(s)", len(archive_paths))
 
-    total = Audit()
-    # Cut for the first archive that needs them, reused by every archive after it,
-    # and dropped however the run ends — see :class:`LookupParts`.
-    parts = LookupParts.beside(f"{args.staging_schema}.{args.staging_table}")
-    try:
-        for archive in archive_paths:
-            total = total + import_archive(archive, engine, args, provider_id,
-                                           boundary_provider_id, parts, logger)
-    finally:
-        if not args.keep_staging:
-            with Session(engine) as session:
-                for name in parts:
-                    common.drop_staging_table(session, name, logger)
-                session.commit()
+    # Each archive replaces only the seasons it holds, in the grid it was
+    # published in, so two workers never delete or write the same fires; the
+    # causes are shared but upserted.
+    total = sum(common.run_imports(archive_paths, import_archive, engine, args,
+                                   (provider_id, boundary_provider_id), logger),
+                Audit())
 
     with Session(engine) as session:
         if not args.dry_run:
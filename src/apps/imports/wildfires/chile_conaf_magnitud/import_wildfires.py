@@ -348,19 +348,19 @@ zoned AS MATERIALIZED (
            country.id AS admin_boundary_id
     FROM numbered
     LEFT JOIN LATERAL (
-        SELECT time_zone.name
-        FROM time_zone
-        WHERE ST_Contains(time_zone.geometry,
+        SELECT time_zone_part.name
+        FROM time_zone_part
+        WHERE ST_Intersects(time_zone_part.geometry,
                           ST_PointOnSurface(ST_Transform(numbered.geom, 4326)))
         LIMIT 1
     ) AS zone ON TRUE
     LEFT JOIN LATERAL (
-        SELECT boundary.id
-        FROM admin_boundary AS boundary
-        WHERE boundary.data_provider_id = :boundary_provider_id
-          AND boundary.level = 0
-          AND ST_Contains(boundary.geometry,
-                          ST_PointOnSurface(ST_Transform(numbered.geom, 4326)))
+        SELECT part.admin_boundary_id AS id
+        FROM admin_boundary_part AS part
+        WHERE part.data_provider_id = :boundary_provider_id
+          AND part.level = 0
+          AND ST_Intersects(part.geometry,
+                            ST_PointOnSurface(ST_Transform(numbered.geom, 4326)))
         LIMIT 1
     ) AS country ON TRUE
 ),
@@ -892,10 +892,9 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
 def import_wildfires(args: argparse.Namespace, engine: Engine,
                      logger: logging.Logger) -> Audit:
     """Import the archives against ``engine``, returning the totals."""
-    common.require_tables(engine, ["wildfire", "conaf_magnitud_wildfire",
-                                   "conaf_wildfire", "conaf_fire_cause",
-                                   "admin_boundary", "time_zone", "data_provider"],
-                          logger)
+    common.require_tables(engine, ["wildfire", "conaf_magnitud_wildfire", "conaf_wildfire",
+                                   "conaf_fire_cause", "admin_boundary", "time_zone",
+                                   "time_zone_part", "admin_boundary_part", "data_provider"], logger)
     common.create_staging_schema(engine, args.staging_schema)
 
     with Session(engine) as session:
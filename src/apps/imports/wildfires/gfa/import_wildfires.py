@@ -32,6 +32,16 @@ workers cannot race on the skip-what-is-already-held probe. Each is another
 connection running spatial joins, so raise the server's ``work_mem`` and
 ``shared_buffers`` before raising this, and expect little past 3-4.
 
+Skipping by ``fire_ID`` still reads and transforms every year to find that
+nothing is new, and it cannot notice that a year was *republished*: corrected
+fires keep their ids and are skipped. ``--incremental`` skips by file instead.
+Each shapefile's SHA-256 is recorded in the ``source_file`` manifest (see
+:class:`~src.data_model.source_file.SourceFile`); a later incremental run skips
+a file whose hash is unchanged and replaces the fires and ignitions of one whose
+hash is not::
+
+    python3 -m src.apps.imports.wildfires.gfa.import_wildfires -d /path/to/SHP_perimeters/ --incremental
+
 Three things about this dataset shape the mapping
 -------------------------------------------------
 
@@ -98,8 +108,6 @@ import shutil
 import sys
 import time
 
-from concurrent.futures import ProcessPoolExecutor
-from concurrent.futures import as_completed
 from pathlib import Path
 
 from sqlalchemy import Engine
@@ -190,7 +198,7 @@ LOG_FORMAT = "%(asctime)s %(levelname)s %(message)s"
 #: single-part fires that are the overwhelming majority.
 TRANSFORM_SQL = """
 WITH collected AS MATERIALIZED (
-    SELECT nextval(pg_get_serial_sequence('wildfire', 'id')) AS wildfire_id,
+    SELECT {wildfire_id}                                        AS wildfire_id,
            nextval(pg_get_serial_sequence('ignition', 'id')) AS ignition_id,
            staging.{id_field}                                   AS gfa_id,
            NULLIF(min(staging.{start_field}), '')               AS start_date,
@@ -218,6 +226,7 @@ WITH collected AS MATERIALIZED (
       AND NOT EXISTS (
           SELECT 1 FROM gfa_wildfire AS already WHERE already.gfa_id = staging.{id_field}
       )
+      {slice_filter}
     GROUP BY staging.{id_field}
 ),
 -- Repair the collected parts into one perimeter, taking the antimeridian into
@@ -260,17 +269,17 @@ located AS MATERIALIZED (
     SELECT source.*, zone.name AS time_zone, country.id AS admin_boundary_id
     FROM shaped AS source
     LEFT JOIN LATERAL (
-        SELECT time_zone.name
-        FROM time_zone
-        WHERE ST_Contains(time_zone.geometry, source.ignition_point)
+        SELECT time_zone_part.name
+        FROM time_zone_part
+        WHERE ST_Intersects(time_zone_part.geometry, source.ignition_point)
         LIMIT 1
     ) AS zone ON TRUE
     LEFT JOIN LATERAL (
-        SELECT boundary.id
-        FROM admin_boundary AS boundary
-        WHERE boundary.data_provider_id = :boundary_provider_id
-          AND boundary.level = 0
-          AND ST_Contains(boundary.geometry, source.ignition_point)
+        SELECT part.admin_boundary_id AS id
+        FROM admin_boundary_part AS part
+        WHERE part.data_provider_id = :boundary_provider_id
+          AND part.level = 0
+          AND ST_Intersects(part.geometry, source.ignition_point)
         LIMIT 1
     ) AS country ON TRUE
 ),
@@ -353,25 +362,21 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
     fields.add_argument("--end-field", default=DEFAULT_END_FIELD,
                         help=f"attribute holding the end date (default: {DEFAULT_END_FIELD})")
 
-    parser.add_argument("-j", "--jobs", type=positive_int, default=1,
-                        help="shapefiles to import at the same time, in separate processes "
-                             "(default: 1). Each is another connection doing spatial joins, "
-                             "so raise the server's work_mem and shared_buffers before "
-                             "raising this, and expect little past 3-4")
+    common.add_jobs_arguments(parser, "shapefiles")
+    common.add_chunks_arguments(parser)
 
+    common.add_incremental_arguments(parser)
     common.add_database_arguments(parser)
     common.add_staging_arguments(parser, DEFAULT_STAGING_TABLE)
     common.add_common_arguments(parser)
 
-    return parser.parse_args(argv)
-
-
-def positive_int(value: str) -> int:
-    """Parse ``--jobs``, rejecting zero and negatives at the command line."""
-    number = int(value)
-    if number < 1:
-        raise argparse.ArgumentTypeError(f"must be 1 or more, not {number}")
-    return number
+    args = parser.parse_args(argv)
+    if args.chunks > 1 and args.incremental:
+        # The slices run beside the transaction that deletes a changed file's
+        # previous fires and cannot see the delete, so the fire_ID skip would
+        # keep every stale fire instead of importing its correction.
+        parser.error("--chunks cannot be combined with --incremental")
+    return args
 
 
 def find_shapefiles(args: argparse.Namespace) -> list[Path]:
@@ -411,19 +416,25 @@ def warn_if_already_imported(session: Session, logger: logging.Logger) -> int:
 
 
 def transform(session: Session, provider_id: int, boundary_provider_id: int | None,
-              staging_table: str, args: argparse.Namespace, logger: logging.Logger) -> int:
+              staging_table: str, args: argparse.Namespace, logger: logging.Logger,
+              staging_slice: common.StagingSlice | None = None) -> int:
     """Map the staging table onto the model, returning the number of fires imported.
 
     The count is computed by the statement itself rather than by counting the ids
     it returns: a year's file is the better part of a million fires, and pulling
     that many ids back only to call ``len`` on them would cost more memory than
     the import.
+
+    With ``staging_slice`` only the fires whose ``fire_ID`` falls in that slice
+    are mapped, with the wildfire ids allocated for them (see
+    :class:`~src.apps.imports.common.SlicedTransform`).
     """
     statement = TRANSFORM_SQL.format(
         staging_table=staging_table,
         id_field=args.id_field,
         start_field=args.start_field,
         end_field=args.end_field,
+        **common.slice_sql(staging_slice),
     )
     return session.scalar(text(statement), {
         "provider_id": provider_id,
@@ -431,6 +442,7 @@ def transform(session: Session, provider_id: int, boundary_provider_id: int | No
         # finds nothing and every fire gets a NULL country — no separate query.
         "boundary_provider_id": boundary_provider_id if boundary_provider_id is not None else -1,
         "fallback_time_zone": FALLBACK_TIME_ZONE,
+        **common.slice_parameters(staging_slice),
     })
 
 
@@ -443,28 +455,104 @@ def import_shapefile(shapefile: Path, engine: Engine, args: argparse.Namespace,
     ``staging_table`` is what makes a parallel run possible: the table is loaded
     with ``-overwrite``, so two shapefiles sharing one would destroy each other's
     work. Workers are each given their own; a serial run keeps the plain name.
+
+    With ``--incremental`` the shapefile is hashed first and skipped, before
+    anything is loaded, if the manifest says it is the one already imported. A
+    changed shapefile has its previous fires and their ignitions deleted, and its
+    manifest entry rewritten, in the transaction that imports it again.
+
+    With ``--chunks`` above 1 the transform runs in slices on connections of their
+    own, keyed on ``fire_ID`` so that the parts of one fire are collected in the
+    same slice, and the staging table is dropped once they have committed.
+
+    The yearly summary and the areas per boundary are recomputed for the years the
+    shapefile's fires fall in, and those of the fires it replaced, before the
+    transaction commits — or, in slices, in the one that follows theirs (see
+    :func:`~src.apps.imports.common.refresh_yearly_summary` and
+    :func:`~src.apps.imports.common.refresh_boundary_areas`).
     """
     staging_table = staging_table or f"{args.staging_schema}.{args.staging_table}"
     datasource, layer = common.shapefile_datasource(shapefile)
     log = ArchiveLogger(logger, {"archive": shapefile.name})
 
     started = time.monotonic()
+    digest = None
+    if args.incremental:
+        digest = common.changed_source_digest(engine, provider_id, shapefile, log)
+        if digest is None:
+            return 0
     common.load_staging_table(datasource, layer, staging_table, args,
-                              common.resolve_database_settings(args), log, progress=progress)
+                              common.resolve_database_settings(args), log, progress=progress,
+                              index_columns=[args.id_field, args.start_field])
 
     with Session(engine) as session:
-        # ogr2ogr leaves the table with no statistics at all, so without this the
-        # planner sizes a million-row staging table as if it held a handful and
-        # picks nested loops over the spatial joins below.
-        session.execute(text(f"ANALYZE {staging_table}"))
-
         staged = session.scalar(text(f"SELECT count(*) FROM {staging_table}"))
         log.info("staged %d features in %.0fs, now mapping them onto the model",
                  staged, time.monotonic() - started)
 
-        imported = transform(session, provider_id, boundary_provider_id, staging_table, args, log)
-        if not args.keep_staging:
-            common.drop_staging_table(session, staging_table, log)
+        # The years the summary has to be recomputed for: those of the fires
+        # replaced here, and below those of the fires written.
+        years: set[int] = set()
+        if digest is not None:
+            # Deleted first so that the fire_ID skip below re-imports the
+            # corrected fires rather than keeping the stale ones.
+            record = common.find_source_file(session, provider_id, shapefile)
+            if record is not None:
+                years = common.wildfire_years(session, provider_id, (
+                    record.first_wildfire_id, record.last_wildfire_id, record.wildfire_count))
+                common.delete_source_file_wildfires(
+                    session, record, "gfa_wildfire", log,
+                    ignition_child_table="gfa_ignition", ignition_column="gfa_ignition_id")
+        floor = common.wildfire_id_floor(session)
+        if args.chunks > 1:
+            # Never with --incremental (see parse_arguments), so there is no
+            # manifest entry to write beside the slices.
+            with common.SlicedTransform(engine, staging_table, args.id_field, args.chunks,
+                                        provider_id, log) as sliced:
+                imported = sum(sliced.run(
+                    lambda slice_session, staging_slice: transform(
+                        slice_session, provider_id, boundary_provider_id, staging_table,
+                        args, log, staging_slice)))
+                try:
+                    sliced.commit()
+                except RuntimeError:
+                    # What did commit is summarised, so the summary describes
+                    # what is stored.
+                    years = common.wildfire_years(session, provider_id, sliced.span)
+                    common.refresh_yearly_summary(session, provider_id, years, log)
+                    common.refresh_boundary_areas(session, provider_id,
+                                                  boundary_provider_id, years, log)
+                    session.commit()
+                    raise
+            # The slices' fires are only visible once they have committed, so
+            # their years are summarised in a transaction after theirs.
+            years = common.wildfire_years(session, provider_id, sliced.span)
+            common.refresh_yearly_summary(session, provider_id, years, log)
+            common.refresh_boundary_areas(session, provider_id, boundary_provider_id,
+                                          years, log)
+            if not args.keep_staging:
+                common.drop_staging_table(session, staging_table, log)
+                common.drop_staging_table(session, sliced.ids_table, log)
+        else:
+            # A range the manifest records is drawn as one block, so that it
+            # does not interleave with the files other --jobs workers import.
+            whole = (common.whole_table_slice(engine, staging_table, args.id_field,
+                                              provider_id)
+                     if digest is not None else None)
+            imported = transform(session, provider_id, boundary_provider_id, staging_table,
+                                 args, log, whole)
+            span = common.imported_span(session, provider_id, floor)
+            if digest is not None:
+                common.record_source_file(session, provider_id, shapefile, *digest, floor,
+                                          span=span)
+            years |= common.wildfire_years(session, provider_id, span)
+            common.refresh_yearly_summary(session, provider_id, years, log)
+            common.refresh_boundary_areas(session, provider_id, boundary_provider_id,
+                                          years, log)
+            if not args.keep_staging:
+                common.drop_staging_table(session, staging_table, log)
+                if whole is not None:
+                    common.drop_staging_table(session, whole.ids_table, log)
         session.commit()
 
     log.info("imported %d fires from %d features in %.0fs", imported, staged,
@@ -472,95 +560,14 @@ def import_shapefile(shapefile: Path, engine: Engine, args: argparse.Namespace,
     return imported
 
 
-#: Per-process state of a parallel worker. A module global because a pool
-#: initializer is the only place a worker can build something once and reuse it
-#: across the shapefiles it is handed, and an :class:`~sqlalchemy.engine.Engine`
-#: must not be inherited across a fork: its pooled connections would be shared by
-#: two processes writing over each other's protocol state.
-_WORKER: dict[str, object] = {}
-
-
-def _worker_init(args: argparse.Namespace, provider_id: int,
-                 boundary_provider_id: int | None) -> None:
-    """Give this worker process its own engine and the ids every shapefile needs."""
-    logging.basicConfig(level=args.log_level, format=LOG_FORMAT)
-    _WORKER["args"] = args
-    _WORKER["provider_id"] = provider_id
-    _WORKER["boundary_provider_id"] = boundary_provider_id
-    _WORKER["engine"] = create_engine(common.database_url(common.resolve_database_settings(args)))
-
-
-def _worker_import(task: tuple[Path, str]) -> tuple[str, int, str | None]:
-    """Import one shapefile in this worker, returning the failure instead of raising.
-
-    A raise would come back as a pickled exception and stop the whole pool. One
-    shapefile that cannot be read is not a reason to throw away the others — each
-    is its own transaction — so the error is carried back as text and reported
-    together with the rest at the end.
-    """
-    shapefile, staging_table = task
-    logger = logging.getLogger("gfa-import")
-    try:
-        imported = import_shapefile(shapefile, _WORKER["engine"], _WORKER["args"],
-                                    _WORKER["provider_id"], _WORKER["boundary_provider_id"],
-                                    logger, staging_table=staging_table, progress=False)
-        return shapefile.name, imported, None
-    except Exception as error:  # noqa: BLE001  (carried back to the parent, not swallowed)
-        return shapefile.name, 0, str(error)
-
-
-def import_in_parallel(shapefiles: list[Path], args: argparse.Namespace, provider_id: int,
-                       boundary_provider_id: int | None, jobs: int,
-                       logger: logging.Logger) -> int:
-    """Import the shapefiles across ``jobs`` processes, returning the fires imported.
-
-    Processes rather than threads, but not for the usual reason: both slow phases
-    release the GIL anyway, since one waits on a subprocess and the other on a
-    socket. What parallelism buys is server-side — PostgreSQL will not use a
-    parallel plan for a statement that writes, so the transform runs on a single
-    core however the client is built, and the only way to get more cores onto it
-    is more connections doing it at once.
-
-    ``fire_ID`` carries the year and so does not collide between files, which is
-    what makes this safe: two workers importing two years never race on the
-    ``NOT EXISTS`` skip, because no id one holds can appear in the other's file.
-
-    Raises
-    ------
-    RuntimeError
-        If any shapefile failed, after every other one has finished.
-    """
-    tasks = [(shapefile, f"{args.staging_schema}.{args.staging_table}_{index:02d}")
-             for index, shapefile in enumerate(shapefiles)]
-    logger.info("Importing %d shapefile(s) across %d process(es)", len(shapefiles), jobs)
-
-    imported = 0
-    failures: list[tuple[str, str]] = []
-    with ProcessPoolExecutor(max_workers=jobs, initializer=_worker_init,
-                             initargs=(args, provider_id, boundary_provider_id)) as pool:
-        futures = [pool.submit(_worker_import, task) for task in tasks]
-        for finished, future in enumerate(as_completed(futures), start=1):
-            name, count, error = future.result()
-            if error is None:
-                imported += count
-            else:
-                failures.append((name, error))
-                logger.error("%s: failed: %s", name, error)
-            logger.info("[%d/%d shapefiles done]", finished, len(shapefiles))
-
-    if failures:
-        raise RuntimeError(
-            f"{len(failures)} of {len(shapefiles)} shapefile(s) failed: "
-            + "; ".join(f"{name} ({error})" for name, error in failures)
-        )
-    return imported
-
-
 def import_wildfires(args: argparse.Namespace, engine: Engine, logger: logging.Logger) -> int:
     """Run the whole import against ``engine``, returning the fires imported."""
     shapefiles = find_shapefiles(args)
     common.require_tables(engine, ["wildfire", "gfa_wildfire", "ignition", "gfa_ignition",
-                                   "time_zone", "data_provider"], logger)
+                                   "time_zone", "time_zone_part", "admin_boundary_part",
+                                   "data_provider", "wildfire_yearly_summary",
+                                   "wildfire_boundary_area"]
+                          + (["source_file"] if args.incremental else []), logger)
     common.create_staging_schema(engine, args.staging_schema)
 
     with Session(engine) as session:
@@ -579,19 +586,12 @@ def import_wildfires(args: argparse.Namespace, engine: Engine, logger: logging.L
         )
 
     started = time.monotonic()
-    # More workers than shapefiles would just be idle processes, and one shapefile
-    # is a serial run whatever was asked for.
-    jobs = min(args.jobs, len(shapefiles))
-    if jobs > 1:
-        imported = import_in_parallel(shapefiles, args, provider_id, boundary_provider_id,
-                                      jobs, logger)
-    else:
-        imported = 0
-        logger.info("Importing %d shapefile(s)", len(shapefiles))
-        for index, shapefile in enumerate(shapefiles, start=1):
-            logger.info("[%d/%d] %s", index, len(shapefiles), shapefile.name)
-            imported += import_shapefile(shapefile, engine, args, provider_id,
-                                         boundary_provider_id, logger)
+    # fire_ID carries the year and so does not collide between files, which is
+    # what makes the workers safe: two of them importing two years never race on
+    # the NOT EXISTS skip, because no id one holds can appear in the other's file.
+    imported = sum(common.run_imports(shapefiles, import_shapefile, engine, args,
+                                      (provider_id, boundary_provider_id), logger,
+                                      unit="shapefile"))
 
     logger.info("Imported %d fires from %d shapefile(s) in %.0fs", imported, len(shapefiles),
                 time.monotonic() - started)
@@ -48,6 +48,14 @@ rows in five.
 The row number is in the message because for 201,948 rows it is the only way to
 say which row was refused.
 
+Within the year the rows are written a batch of :data:`BATCH_SIZE` at a time: copied
+into a temporary table with one ``COPY`` and spread over ``ignition``, ``wildfire``
+and the two provider tables with one ``INSERT ... SELECT`` each (see
+:func:`~src.apps.imports.common.copy_batch`), rather than bound and executed row by
+row. Meanwhile the workbook is parsed on a thread of its own
+(:func:`~src.apps.imports.common.read_ahead`), so that the next batch is being read
+while this one is written.
+
 What the import converts
 ------------------------
 
@@ -82,6 +90,12 @@ The country is resolved per point
     are imported that the published prefecture and municipality names could be
     matched against instead.
 
+    The test is made in Python, a batch at a time, by a
+    :class:`~src.apps.imports.common.SpatialResolver` holding the boundary pieces
+    inside Greece's bounds, and the batch carries the id it found. A lookup
+    written into the ``INSERT`` would be a subquery the server probes once per
+    row.
+
 False alarms are imported
 -------------------------
 
@@ -134,9 +148,9 @@ from src.providers import greece_ffa
 LOG_FORMAT = "%(asctime)s %(levelname)s %(message)s"
 
 #: Fires converted and written per round trip. The same size the EGIF import uses,
-#: for the same reason: large enough that the per-batch statements dominate their
-#: own overhead, small enough that the parameter lists stay well inside what
-#: psycopg will bind in one executemany.
+#: for the same reason: large enough that the ``COPY`` and the four statements
+#: that spread it are a small cost per fire, small enough that a batch's rows and
+#: the temporary table holding them stay in memory.
 BATCH_SIZE = 2000
 
 #: How many individually bad rows are logged per sheet before the rest are only
@@ -216,68 +230,84 @@ DELETE FROM ignition WHERE id IN (SELECT id FROM removed_ignition_child)
 ALLOCATE_SQL = ("SELECT nextval(pg_get_serial_sequence(:table, 'id')) "
                 "FROM generate_series(1, :count)")
 
+#: Where a located fire can be, as (west, south, east, north): the window the
+#: boundary pieces are loaded for. Nothing outside it is ever tested, because
+#: :func:`~src.providers.greece_ffa.is_located` refuses a point outside it.
+BOUNDS = (greece_ffa.PLAUSIBLE_LONGITUDE[0], greece_ffa.PLAUSIBLE_LATITUDE[0],
+          greece_ffa.PLAUSIBLE_LONGITUDE[1], greece_ffa.PLAUSIBLE_LATITUDE[1])
+
+#: The temporary table a batch is copied into before it is spread over the four
+#: tables (see :func:`~src.apps.imports.common.copy_batch`).
+BATCH_TABLE = "greece_ffa_batch"
+
+#: What a batch row carries besides ``greece_ffa_wildfire``'s own columns: what
+#: the two parent tables need. The instants are the naive published readings,
+#: converted by :func:`_local` on the way out.
+BATCH_EXTRA_COLUMNS = {
+    "admin_boundary_id": "integer",
+    "longitude": "double precision",
+    "latitude": "double precision",
+    "start_date_time": "timestamp",
+    "end_date_time": "timestamp",
+}
+
+#: A batch row's columns, in the order they are copied.
+BATCH_COLUMNS = ("id", *WILDFIRE_COLUMNS, *BATCH_EXTRA_COLUMNS)
+
 #: The stored point, straight from the two published numbers.
 #:
 #: No ``ST_Transform``: the service publishes WGS 84 degrees, which is the CRS the
 #: model stores, so the point *is* the published pair — the same position the
 #: Guatemalan import is in, and no other. See :mod:`src.providers.greece_ffa.ignition`.
-GEOMETRY_SQL = "ST_SetSRID(ST_MakePoint(:longitude, :latitude), 4326)"
-
-#: The country the point falls in, or ``NULL``.
-#:
-#: A correlated subquery rather than a join, so that it can sit inside an
-#: ``executemany`` over rows that mostly have no point at all. ``ST_Contains`` is
-#: strict, so a ``NULL`` point yields no row and the column comes out ``NULL``
-#: without a guard — and so does an unimported boundary provider, whose id is then
-#: ``NULL`` and matches nothing.
-BOUNDARY_SQL = f"""(
-    SELECT boundary.id FROM admin_boundary AS boundary
-    WHERE boundary.data_provider_id = :boundary_provider_id
-      AND boundary.level = 0
-      AND ST_Contains(boundary.geometry, {GEOMETRY_SQL})
-    LIMIT 1
-)"""
+GEOMETRY_SQL = "ST_SetSRID(ST_MakePoint(batch.longitude, batch.latitude), 4326)"
 
 
 def _local(column: str) -> str:
     """SQL resolving a naive published reading against the Greek zone.
 
-    The ``CAST`` is not decoration: ``end_date_time`` is null on 27,183 rows, and
-    PostgreSQL cannot infer a bound parameter's type from ``AT TIME ZONE`` alone —
-    an untyped null is rejected outright with *could not determine data type of
-    parameter*. Naming the type is also why no ``CASE`` is needed:
-    ``NULL::timestamp AT TIME ZONE`` is null, which is the wanted answer for a fire
-    that was never reported extinguished.
+    No ``CASE`` is needed for the 27,183 rows with no ``end_date_time``:
+    ``NULL::timestamp AT TIME ZONE`` is null, which is the wanted answer for a
+    fire that was never reported extinguished. The batch column is typed, so the
+    null is a ``timestamp`` one.
     """
-    return f"CAST(:{column} AS timestamp) AT TIME ZONE :time_zone"
+    return f"batch.{column} AT TIME ZONE :time_zone"
 
 
 INSERT_IGNITION_SQL = f"""
 INSERT INTO ignition (id, type, data_provider_id, geometry, date_time, time_zone,
                       admin_boundary_id)
-VALUES (:ignition_id, 'greece_ffa_ignition', :provider_id, {GEOMETRY_SQL},
-        {_local('start_date_time')}, :time_zone, {BOUNDARY_SQL})
+SELECT batch.ignition_id, 'greece_ffa_ignition', :provider_id, {GEOMETRY_SQL},
+       {_local('start_date_time')}, :time_zone, batch.admin_boundary_id
+FROM {BATCH_TABLE} AS batch
+WHERE batch.ignition_id IS NOT NULL
 """
 
 INSERT_WILDFIRE_SQL = f"""
 INSERT INTO wildfire (id, type, data_provider_id, start_date_time, end_date_time,
                       time_zone, admin_boundary_id)
-VALUES (:wildfire_id, 'greece_ffa_wildfire', :provider_id,
-        {_local('start_date_time')},
-        {_local('end_date_time')},
-        :time_zone, {BOUNDARY_SQL})
+SELECT batch.id, 'greece_ffa_wildfire', :provider_id,
+       {_local('start_date_time')},
+       {_local('end_date_time')},
+       :time_zone, batch.admin_boundary_id
+FROM {BATCH_TABLE} AS batch
 """
 
 
-def _insert_sql(table: str, columns: tuple[str, ...]) -> str:
-    """Build the child ``INSERT`` for one of the two provider tables."""
-    names = ("id", *columns)
-    values = ", ".join(f":{name}" for name in names)
-    return f"INSERT INTO {table} ({', '.join(names)}) VALUES ({values})"
+def _insert_sql(table: str, key: str, columns: tuple[str, ...]) -> str:
+    """Build the child ``INSERT`` for one of the two provider tables.
 
+    ``key`` is the batch column holding the row's id: ``id`` for the fire and
+    ``ignition_id`` for its point, which only the located rows have.
+    """
+    names = ", ".join(("id", *columns))
+    values = ", ".join(f"batch.{name}" for name in (key, *columns))
+    where = f" WHERE batch.{key} IS NOT NULL" if key != "id" else ""
+    return f"INSERT INTO {table} ({names}) SELECT {values} FROM {BATCH_TABLE} AS batch{where}"
 
-INSERT_GREECE_IGNITION_SQL = _insert_sql("greece_ffa_ignition", IGNITION_COLUMNS)
-INSERT_GREECE_WILDFIRE_SQL = _insert_sql("greece_ffa_wildfire", WILDFIRE_COLUMNS)
+
+INSERT_GREECE_IGNITION_SQL = _insert_sql("greece_ffa_ignition", "ignition_id",
+                                         IGNITION_COLUMNS)
+INSERT_GREECE_WILDFIRE_SQL = _insert_sql("greece_ffa_wildfire", "id", WILDFIRE_COLUMNS)
 
 
 # --------------------------------------------------------------------------
@@ -295,13 +325,11 @@ def hectares(stremmata: float | None) -> float | None:
     return stremmata * greece_ffa.STREMMA_HA
 
 
-def wildfire_parameters(record: FireRecord, sheet: Sheet, provider_id: int,
-                        boundary_provider_id: int | None) -> dict[str, object]:
-    """Everything the four statements bind for one fire, ids excepted."""
+def wildfire_parameters(record: FireRecord, sheet: Sheet,
+                        admin_boundary_id: int | None) -> dict[str, object]:
+    """Everything a batch row carries for one fire, ids excepted."""
     parameters: dict[str, object] = {
-        "provider_id": provider_id,
-        "boundary_provider_id": boundary_provider_id,
-        "time_zone": greece_ffa.DEFAULT_TIME_ZONE,
+        "admin_boundary_id": admin_boundary_id,
         "start_date_time": record.start_datetime,
         "end_date_time": record.end_datetime,
         "longitude": record.longitude if record.located else None,
@@ -350,13 +378,15 @@ def allocate(session: Session, table: str, count: int) -> list[int]:
 
 
 def write_batch(session: Session, batch: list[FireRecord], sheet: Sheet,
-                provider_id: int, boundary_provider_id: int | None,
+                provider_id: int, resolver: common.SpatialResolver,
                 outcome: SheetOutcome) -> None:
     """Insert one batch of fires, parents before children.
 
-    Four statements at most, each an ``executemany`` over the whole batch:
-    ``ignition`` and ``greece_ffa_ignition`` for the rows that have a point, then
-    ``wildfire`` and ``greece_ffa_wildfire`` for all of them.
+    The batch is copied into :data:`BATCH_TABLE` in one ``COPY`` and spread from
+    there in four ``INSERT ... SELECT``: ``ignition`` and ``greece_ffa_ignition``
+    for the rows that have a point, then ``wildfire`` and ``greece_ffa_wildfire``
+    for all of them. The countries are resolved for the whole batch first, in one
+    call to ``resolver``.
 
     Plain inserts and not upserts, because the year was deleted first — see the
     module docstring for why there is nothing to upsert on.
@@ -365,43 +395,34 @@ def write_batch(session: Session, batch: list[FireRecord], sheet: Sheet,
         return
 
     located = [record for record in batch if record.located]
+    boundary_ids = resolver.resolve(
+        [record.longitude if record.located else None for record in batch],
+        [record.latitude if record.located else None for record in batch],
+    )
     wildfire_ids = allocate(session, "wildfire", len(batch))
     ignition_ids = allocate(session, "ignition", len(located))
 
-    ignitions: list[dict[str, object]] = []
-    greece_ignitions: list[dict[str, object]] = []
-    wildfires: list[dict[str, object]] = []
-    greece_wildfires: list[dict[str, object]] = []
-
-    for record in batch:
-        parameters = wildfire_parameters(record, sheet, provider_id,
-                                         boundary_provider_id)
-        wildfire_id = wildfire_ids.pop()
-        ignition_id = None
+    rows: list[list[object]] = []
+    for record, boundary_id in zip(batch, boundary_ids):
+        parameters = wildfire_parameters(record, sheet, boundary_id)
+        parameters["id"] = wildfire_ids.pop()
+        parameters["ignition_id"] = None
         if record.located:
-            ignition_id = ignition_ids.pop()
+            parameters["ignition_id"] = ignition_ids.pop()
             outcome.located += 1
-            ignitions.append(dict(parameters, ignition_id=ignition_id))
-            greece_ignitions.append(
-                {"id": ignition_id,
-                 **{name: parameters[name] for name in IGNITION_COLUMNS}}
-            )
         if record.incident_category == greece_ffa.CATEGORY_FALSE_ALARM:
             outcome.false_alarms += 1
-
-        parameters["ignition_id"] = ignition_id
-        wildfires.append(dict(parameters, wildfire_id=wildfire_id))
-        greece_wildfires.append(
-            {"id": wildfire_id,
-             **{name: parameters[name] for name in WILDFIRE_COLUMNS}}
-        )
+        rows.append([parameters[name] for name in BATCH_COLUMNS])
         outcome.written += 1
 
-    if ignitions:
-        session.execute(text(INSERT_IGNITION_SQL), ignitions)
-        session.execute(text(INSERT_GREECE_IGNITION_SQL), greece_ignitions)
-    session.execute(text(INSERT_WILDFIRE_SQL), wildfires)
-    session.execute(text(INSERT_GREECE_WILDFIRE_SQL), greece_wildfires)
+    common.copy_batch(session, BATCH_TABLE, "greece_ffa_wildfire",
+                      ("id", *WILDFIRE_COLUMNS), BATCH_EXTRA_COLUMNS, rows)
+    parents = {"provider_id": provider_id, "time_zone": greece_ffa.DEFAULT_TIME_ZONE}
+    if located:
+        session.execute(text(INSERT_IGNITION_SQL), parents)
+        session.execute(text(INSERT_GREECE_IGNITION_SQL))
+    session.execute(text(INSERT_WILDFIRE_SQL), parents)
+    session.execute(text(INSERT_GREECE_WILDFIRE_SQL))
 
 
 # --------------------------------------------------------------------------
@@ -456,7 +477,7 @@ def delete_year(session: Session, year: int) -> int:
 
 
 def import_sheet(sheet: Sheet, session: Session, provider_id: int,
-                 boundary_provider_id: int | None,
+                 resolver: common.SpatialResolver,
                  log: logging.LoggerAdapter) -> SheetOutcome:
     """Replace one year with the records of one sheet, in the caller's transaction."""
     outcome = SheetOutcome(sheet.year, sheet.name)
@@ -483,7 +504,8 @@ def import_sheet(sheet: Sheet, session: Session, provider_id: int,
     progress = ProgressReporter(sheet.rows or None, f"{sheet.name} ({sheet.year})",
                                 log.logger)
     batch: list[FireRecord] = []
-    for record in sheet.records:
+    # Parsed on a reader thread while the batches are written; see common.read_ahead.
+    for record in common.read_ahead(sheet.records):
         outcome.read += 1
         progress.advance()
         report_problems(record, outcome, log)
@@ -491,16 +513,15 @@ def import_sheet(sheet: Sheet, session: Session, provider_id: int,
             continue
         batch.append(record)
         if len(batch) >= BATCH_SIZE:
-            write_batch(session, batch, sheet, provider_id, boundary_provider_id,
-                        outcome)
+            write_batch(session, batch, sheet, provider_id, resolver, outcome)
             batch = []
-    write_batch(session, batch, sheet, provider_id, boundary_provider_id, outcome)
+    write_batch(session, batch, sheet, provider_id, resolver, outcome)
     progress.finish()
     return outcome
 
 
 def import_file(path: Path, engine: Engine, provider_id: int,
-                boundary_provider_id: int | None, years: set[int] | None,
+                resolver: common.SpatialResolver, years: set[int] | None,
                 logger: logging.Logger) -> list[SheetOutcome]:
     """Import every year of one workbook, one transaction per year.
 
@@ -515,8 +536,7 @@ def import_file(path: Path, engine: Engine, provider_id: int,
             log.debug("Skipping %d: not among the years requested", sheet.year)
             continue
         with Session(engine) as session:
-            outcome = import_sheet(sheet, session, provider_id, boundary_provider_id,
-                                   log)
+            outcome = import_sheet(sheet, session, provider_id, resolver, log)
             session.commit()
         outcomes.append(outcome)
         log.info(
@@ -591,8 +611,8 @@ def import_wildfires(args: argparse.Namespace, engine: Engine,
     years = set(args.years) if args.years else None
 
     common.require_tables(engine, ["wildfire", "ignition", "greece_ffa_wildfire",
-                                   "greece_ffa_ignition", "admin_boundary",
-                                   "time_zone", "data_provider"], logger)
+                                   "greece_ffa_ignition", "admin_boundary", "time_zone",
+                                   "time_zone_part", "admin_boundary_part", "data_provider"], logger)
 
     with Session(engine) as session:
         common.check_time_zones(session, logger, greece_ffa.DEFAULT_TIME_ZONE)
@@ -603,15 +623,17 @@ def import_wildfires(args: argparse.Namespace, engine: Engine,
         boundary_provider = common.find_boundary_provider(session, logger)
         session.commit()
         provider_id = provider.id
-        boundary_provider_id = None if boundary_provider is None else boundary_provider.id
+        resolver = common.load_boundary_resolver(
+            session, None if boundary_provider is None else boundary_provider.id, logger,
+            BOUNDS,
+        )
 
     started = time.monotonic()
     outcomes: list[SheetOutcome] = []
     logger.info("%d workbook(s) to import", len(workbooks))
     for index, path in enumerate(workbooks, start=1):
         logger.info("[%d/%d] %s", index, len(workbooks), path.name)
-        outcomes += import_file(path, engine, provider_id, boundary_provider_id,
-                                years, logger)
+        outcomes += import_file(path, engine, provider_id, resolver, years, logger)
 
     written = sum(outcome.written for outcome in outcomes)
     seen: dict[int, str] = {}
@@ -775,14 +775,15 @@ GEOMETRY_SQL = "ST_SetSRID(ST_MakePoint(:longitude, :latitude), 4326)"
 #: The country the point falls in, or ``NULL``.
 #:
 #: A correlated subquery rather than a join, so it can sit inside an ``executemany``.
-#: ``ST_Contains`` is strict, so a record with no point yields no row and the column
+#: ``ST_Intersects`` is strict, so a record with no point yields no row and the column
 #: comes out ``NULL`` without a guard — and so does an unimported boundary provider,
-#: whose id is then ``NULL`` and matches nothing.
+#: whose id is then ``NULL`` and matches nothing. Tested against the country's pieces
+#: in ``admin_boundary_part``, not the whole polygon, like every other importer.
 BOUNDARY_SQL = f"""(
-    SELECT boundary.id FROM admin_boundary AS boundary
-    WHERE boundary.data_provider_id = :boundary_provider_id
-      AND boundary.level = 0
-      AND ST_Contains(boundary.geometry, {GEOMETRY_SQL})
+    SELECT part.admin_boundary_id AS id FROM admin_boundary_part AS part
+    WHERE part.data_provider_id = :boundary_provider_id
+      AND part.level = 0
+      AND ST_Intersects(part.geometry, {GEOMETRY_SQL})
     LIMIT 1
 )"""
 
@@ -1079,9 +1080,8 @@ def import_wildfires(args: argparse.Namespace, engine: Engine,
     files = find_files(args)
     years = set(args.years) if args.years else None
 
-    common.require_tables(engine, ["wildfire", "ignition", "inab_wildfire",
-                                   "inab_ignition", "admin_boundary",
-                                   "data_provider"], logger)
+    common.require_tables(engine, ["wildfire", "ignition", "inab_wildfire", "inab_ignition",
+                                   "admin_boundary", "admin_boundary_part", "data_provider"], logger)
 
     with Session(engine) as session:
         require_known_time_zone(session, logger)
@@ -30,6 +30,21 @@ identifier, and nothing is skipped. Importing a file twice stores it twice; the
 importer warns when the database already holds GWIS fires. After an interrupted
 run, restart it from the files that did not get in.
 
+``--incremental`` skips by *file* instead of by fire. Each archive's SHA-256 is
+recorded in the ``source_file`` manifest with the range of wildfire ids it
+produced (see :class:`~src.data_model.source_file.SourceFile`); a later
+incremental run skips an archive whose hash is unchanged and replaces the fires
+of one whose hash is not. A nightly re-run over every year then costs one hash
+pass rather than a full import::
+
+    python3 -m src.apps.imports.wildfires.gwis.import_wildfires -d /path/to/zip/ --incremental
+
+``--jobs N`` imports ``N`` archives at once; ``--chunks N`` splits *one* archive's
+transform into ``N`` slices of its staged rows, run at once on connections of
+their own and committed together (see
+:class:`~src.apps.imports.common.SlicedTransform`). The first helps a directory of
+years, the second the one year that is left running alone at the end.
+
 From a date to an instant
 -------------------------
 
@@ -78,8 +93,6 @@ import shutil
 import sys
 import time
 
-from concurrent.futures import ProcessPoolExecutor
-from concurrent.futures import as_completed
 from pathlib import Path
 
 from sqlalchemy import Engine
@@ -146,7 +159,7 @@ LOG_FORMAT = "%(asctime)s %(levelname)s %(message)s"
 #: ``start_date_time`` is NOT NULL.
 TRANSFORM_SQL = """
 WITH source AS MATERIALIZED (
-    SELECT nextval(pg_get_serial_sequence('wildfire', 'id')) AS id,
+    SELECT {wildfire_id}                      AS id,
            staging.fid                        AS staging_fid,
            staging.{id_field}::text           AS gwis_id,
            staging.{start_field}              AS start_date,
@@ -155,6 +168,7 @@ WITH source AS MATERIALIZED (
     WHERE staging.{id_field} IS NOT NULL
       AND staging.{start_field} IS NOT NULL
       AND staging.geom IS NOT NULL
+      {slice_filter}
 ),
 -- The zone of an interior point of the perimeter. ST_PointOnSurface rather than
 -- ST_Centroid: the centroid of a C-shaped or multipart burn can land outside the
@@ -164,32 +178,37 @@ located AS MATERIALIZED (
     FROM source
     JOIN {staging_table} AS staging ON staging.fid = source.staging_fid
     LEFT JOIN LATERAL (
-        SELECT time_zone.name
-        FROM time_zone
-        WHERE ST_Contains(time_zone.geometry, ST_PointOnSurface(staging.geom))
+        SELECT time_zone_part.name
+        FROM time_zone_part
+        WHERE ST_Intersects(time_zone_part.geometry, ST_PointOnSurface(staging.geom))
         LIMIT 1
     ) AS zone ON TRUE
 ),
--- Every boundary the fire touches at all. Ids only: this is the cheap,
--- index-backed part, and the great majority of fires come out of it with exactly
--- one row.
+-- Every piece of a boundary the fire touches at all. Ids only: this is the
+-- cheap, index-backed part, and the great majority of fires come out of it
+-- touching pieces of exactly one country. Pieces rather than whole countries
+-- (see AdminBoundaryPart): the index lands on a few hundred vertices instead of
+-- on a coastline of millions, which every fire would then be tested against.
 candidate AS (
-    SELECT located.id AS wildfire_id, boundary.id AS boundary_id
+    SELECT located.id AS wildfire_id, part.admin_boundary_id AS boundary_id,
+           part.id AS part_id
     FROM located
     JOIN {staging_table} AS staging ON staging.fid = located.staging_fid
-    JOIN admin_boundary AS boundary
-      ON boundary.data_provider_id = :boundary_provider_id
-     AND boundary.level = 0
-     AND ST_Intersects(boundary.geometry, staging.geom)
+    JOIN admin_boundary_part AS part
+      ON part.data_provider_id = :boundary_provider_id
+     AND part.level = 0
+     AND ST_Intersects(part.geometry, staging.geom)
 ),
 counted AS (
-    SELECT wildfire_id, count(*) AS candidates, min(boundary_id) AS single_boundary_id
+    SELECT wildfire_id, count(DISTINCT boundary_id) AS candidates,
+           min(boundary_id) AS single_boundary_id
     FROM candidate GROUP BY wildfire_id
 ),
--- Of the boundaries a fire touches, the one holding most of it. The subquery in
--- the ELSE branch is what actually intersects the polygons, and CASE evaluates
--- only the branch it takes, so that cost is paid solely for the handful of fires
--- that really do straddle a border rather than for every fire in the file.
+-- Of the boundaries a fire touches, the one holding most of it, summed over the
+-- pieces of each. The subquery in the ELSE branch is what actually intersects
+-- the polygons, and CASE evaluates only the branch it takes, so that cost is
+-- paid solely for the handful of fires that really do straddle a border rather
+-- than for every fire in the file.
 --
 -- The areas are planar, in square degrees. That is meaningless as an area but
 -- perfectly good as a comparison: the candidates are being ranked against each
@@ -199,11 +218,12 @@ country AS (
            CASE WHEN counted.candidates = 1 THEN counted.single_boundary_id
                 ELSE (SELECT candidate.boundary_id
                       FROM candidate
-                      JOIN admin_boundary AS boundary ON boundary.id = candidate.boundary_id
+                      JOIN admin_boundary_part AS part ON part.id = candidate.part_id
                       JOIN located ON located.id = candidate.wildfire_id
                       JOIN {staging_table} AS staging ON staging.fid = located.staging_fid
                       WHERE candidate.wildfire_id = counted.wildfire_id
-                      ORDER BY ST_Area(ST_Intersection(boundary.geometry, staging.geom)) DESC
+                      GROUP BY candidate.boundary_id
+                      ORDER BY sum(ST_Area(ST_Intersection(part.geometry, staging.geom))) DESC
                       LIMIT 1)
            END AS boundary_id
     FROM counted
@@ -258,12 +278,10 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
     fields.add_argument("--end-field", default=DEFAULT_END_FIELD,
                         help=f"attribute holding the end date (default: {DEFAULT_END_FIELD})")
 
-    parser.add_argument("-j", "--jobs", type=positive_int, default=1,
-                        help="archives to import at the same time, in separate processes "
-                             "(default: 1). Each is another connection doing spatial joins, "
-                             "so raise the server's work_mem and shared_buffers before "
-                             "raising this, and expect little past 3-4")
+    common.add_jobs_arguments(parser, "archives")
+    common.add_chunks_arguments(parser)
 
+    common.add_incremental_arguments(parser)
     common.add_database_arguments(parser)
     common.add_staging_arguments(parser, DEFAULT_STAGING_TABLE)
     common.add_common_arguments(parser)
@@ -271,14 +289,6 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
-def positive_int(value: str) -> int:
-    """Parse ``--jobs``, rejecting zero and negatives at the command line."""
-    number = int(value)
-    if number < 1:
-        raise argparse.ArgumentTypeError(f"must be 1 or more, not {number}")
-    return number
-
-
 def find_archives(args: argparse.Namespace) -> list[Path]:
     """List the files to import, sorted, so the years go in in order.
 
@@ -327,7 +337,8 @@ def warn_if_already_imported(session: Session, provider: DataProvider,
 
 
 def transform(session: Session, provider_id: int, boundary_provider_id: int | None,
-              staging_table: str, args: argparse.Namespace, logger: logging.Logger) -> int:
+              staging_table: str, args: argparse.Namespace, logger: logging.Logger,
+              staging_slice: common.StagingSlice | None = None) -> int:
     """Map the staging table onto the model, returning the number of fires imported.
 
     The count is computed by the statement itself rather than by counting the ids
@@ -337,12 +348,16 @@ def transform(session: Session, provider_id: int, boundary_provider_id: int | No
     Providers arrive as ids rather than as ORM objects because a parallel run
     hands them to a worker process, and an id survives being pickled and used
     against a different connection where a detached instance would not.
+
+    With ``staging_slice`` only that slice of the staging table is mapped, with
+    the ids allocated for it (see :class:`~src.apps.imports.common.SlicedTransform`).
     """
     statement = TRANSFORM_SQL.format(
         staging_table=staging_table,
         id_field=args.id_field,
         start_field=args.start_field,
         end_field=args.end_field,
+        **common.slice_sql(staging_slice),
     )
     return session.scalar(text(statement), {
         "provider_id": provider_id,
@@ -350,6 +365,7 @@ def transform(session: Session, provider_id: int, boundary_provider_id: int | No
         # finds nothing and every fire gets a NULL country — no separate query.
         "boundary_provider_id": boundary_provider_id if boundary_provider_id is not None else -1,
         "fallback_time_zone": FALLBACK_TIME_ZONE,
+        **common.slice_parameters(staging_slice),
     })
 
 
@@ -367,114 +383,127 @@ def import_archive(archive: Path, engine: Engine, args: argparse.Namespace,
     ``staging_table`` is what makes a parallel run possible: the table is loaded
     with ``-overwrite``, so two archives sharing one would destroy each other's
     work. Workers are each given their own; a serial run keeps the plain name.
+
+    With ``--incremental`` the archive is hashed first and skipped, before anything
+    is loaded, if the manifest says it is the one already imported. A changed
+    archive has its previous fires deleted and its manifest entry rewritten in the
+    transaction that imports it again.
+
+    The yearly summary and the areas per boundary are recomputed for the years the
+    archive's fires fall in, and those of the fires it replaced, before the
+    transaction commits — or, in slices, in the one that follows theirs (see
+    :func:`~src.apps.imports.common.refresh_yearly_summary` and
+    :func:`~src.apps.imports.common.refresh_boundary_areas`).
+
+    With ``--chunks`` above 1 the transform runs in slices on connections of their
+    own, keyed on ``fid`` since every staged row is one fire. They commit after
+    this transaction, which by then holds the delete of a changed archive's
+    previous fires and of its manifest entry; the entry is written again, with the
+    refreshes, only once every slice has committed. A slice that fails to commit
+    leaves the ones before it committed, and the archive is recorded with what they
+    wrote and a digest no archive has
+    (:data:`~src.apps.imports.common.INCOMPLETE_SHA256`): the next incremental run
+    deletes those fires by range and imports the archive again. The staging table
+    is dropped once the slices have committed: until then they hold it open.
     """
     staging_table = staging_table or f"{args.staging_schema}.{args.staging_table}"
     datasource, layer = common.shapefile_datasource(archive)
     log = ArchiveLogger(logger, {"archive": archive.name})
 
     started = time.monotonic()
+    digest = None
+    if args.incremental:
+        digest = common.changed_source_digest(engine, provider_id, archive, log)
+        if digest is None:
+            return 0
     common.load_staging_table(datasource, layer, staging_table, args,
-                              common.resolve_database_settings(args), log, progress=progress)
+                              common.resolve_database_settings(args), log, progress=progress,
+                              index_columns=[args.id_field, args.start_field])
 
     with Session(engine) as session:
-        # ogr2ogr leaves the table with no statistics at all, so without this the
-        # planner sizes a million-row staging table as if it held a handful and
-        # picks nested loops over the spatial joins below.
-        session.execute(text(f"ANALYZE {staging_table}"))
-
         staged = session.scalar(text(f"SELECT count(*) FROM {staging_table}"))
         log.info("staged %d features in %.0fs, now mapping them onto the model",
                  staged, time.monotonic() - started)
 
-        imported = transform(session, provider_id, boundary_provider_id, staging_table, args, log)
-        if not args.keep_staging:
-            common.drop_staging_table(session, staging_table, log)
+        # The years the summary has to be recomputed for: those of the fires
+        # replaced here, and below those of the fires written.
+        years: set[int] = set()
+        record = None
+        if digest is not None:
+            # A changed archive replaces what its last import wrote, in the same
+            # transaction, so the year is never both missing and half there.
+            record = common.find_source_file(session, provider_id, archive)
+            if record is not None:
+                years = common.wildfire_years(session, provider_id, (
+                    record.first_wildfire_id, record.last_wildfire_id, record.wildfire_count))
+                common.delete_source_file_wildfires(session, record, "gwis_wildfire", log)
+        floor = common.wildfire_id_floor(session)
+        if args.chunks > 1:
+            with common.SlicedTransform(engine, staging_table, "fid", args.chunks,
+                                        provider_id, log) as sliced:
+                imported = sum(sliced.run(
+                    lambda slice_session, staging_slice: transform(
+                        slice_session, provider_id, boundary_provider_id, staging_table,
+                        args, log, staging_slice)))
+                if record is not None:
+                    # Forgotten with its fires: until the slices have committed
+                    # the archive is not imported, and a run that stops between
+                    # the two must not find it recorded as it was.
+                    session.delete(record)
+                session.commit()
+                try:
+                    sliced.commit()
+                except RuntimeError:
+                    # What did commit is recorded, under a digest that never
+                    # matches, for the next run to replace rather than add to;
+                    # and summarised, so the summary describes what is stored.
+                    if digest is not None:
+                        common.record_source_file(
+                            session, provider_id, archive, common.INCOMPLETE_SHA256,
+                            digest[1], floor, span=sliced.committed_span)
+                    years |= common.wildfire_years(session, provider_id, sliced.span)
+                    common.refresh_yearly_summary(session, provider_id, years, log)
+                    common.refresh_boundary_areas(session, provider_id,
+                                                  boundary_provider_id, years, log)
+                    session.commit()
+                    raise
+            if digest is not None:
+                common.record_source_file(session, provider_id, archive, *digest, floor,
+                                          span=sliced.span)
+            # The slices' fires are only visible once they have committed, so
+            # their years are summarised in a transaction after theirs.
+            years |= common.wildfire_years(session, provider_id, sliced.span)
+            common.refresh_yearly_summary(session, provider_id, years, log)
+            common.refresh_boundary_areas(session, provider_id, boundary_provider_id,
+                                          years, log)
+            if not args.keep_staging:
+                common.drop_staging_table(session, staging_table, log)
+                common.drop_staging_table(session, sliced.ids_table, log)
+        else:
+            # A range the manifest records is drawn as one block, so that it
+            # does not interleave with the files other --jobs workers import.
+            whole = (common.whole_table_slice(engine, staging_table, "fid", provider_id)
+                     if digest is not None else None)
+            imported = transform(session, provider_id, boundary_provider_id, staging_table,
+                                 args, log, whole)
+            span = common.imported_span(session, provider_id, floor)
+            if digest is not None:
+                common.record_source_file(session, provider_id, archive, *digest, floor,
+                                          span=span)
+            years |= common.wildfire_years(session, provider_id, span)
+            common.refresh_yearly_summary(session, provider_id, years, log)
+            common.refresh_boundary_areas(session, provider_id, boundary_provider_id,
+                                          years, log)
+            if not args.keep_staging:
+                common.drop_staging_table(session, staging_table, log)
+                if whole is not None:
+                    common.drop_staging_table(session, whole.ids_table, log)
         session.commit()
 
     log.info("imported %d wildfires in %.0fs", imported, time.monotonic() - started)
     return imported
 
 
-#: Per-process state of a parallel worker. A module global because a pool
-#: initializer is the only place a worker can build something once and reuse it
-#: across the archives it is handed, and an :class:`~sqlalchemy.engine.Engine`
-#: must not be inherited across a fork: its pooled connections would be shared by
-#: two processes writing over each other's protocol state.
-_WORKER: dict[str, object] = {}
-
-
-def _worker_init(args: argparse.Namespace, provider_id: int,
-                 boundary_provider_id: int | None) -> None:
-    """Give this worker process its own engine and the ids every archive needs."""
-    logging.basicConfig(level=args.log_level, format=LOG_FORMAT)
-    _WORKER["args"] = args
-    _WORKER["provider_id"] = provider_id
-    _WORKER["boundary_provider_id"] = boundary_provider_id
-    _WORKER["engine"] = create_engine(common.database_url(common.resolve_database_settings(args)))
-
-
-def _worker_import(task: tuple[Path, str]) -> tuple[str, int, str | None]:
-    """Import one archive in this worker, returning the failure instead of raising.
-
-    A raise would come back as a pickled exception and stop the whole pool. One
-    archive that cannot be read is not a reason to throw away the others — each
-    is its own transaction — so the error is carried back as text and reported
-    together with the rest at the end.
-    """
-    archive, staging_table = task
-    logger = logging.getLogger("gwis-import")
-    try:
-        imported = import_archive(archive, _WORKER["engine"], _WORKER["args"],
-                                  _WORKER["provider_id"], _WORKER["boundary_provider_id"],
-                                  logger, staging_table=staging_table, progress=False)
-        return archive.name, imported, None
-    except Exception as error:  # noqa: BLE001  (carried back to the parent, not swallowed)
-        return archive.name, 0, str(error)
-
-
-def import_in_parallel(archives: list[Path], args: argparse.Namespace, provider_id: int,
-                       boundary_provider_id: int | None, jobs: int,
-                       logger: logging.Logger) -> int:
-    """Import the archives across ``jobs`` processes, returning the fires imported.
-
-    Processes rather than threads, but not for the usual reason: both slow phases
-    release the GIL anyway, since one waits on a subprocess and the other on a
-    socket. What parallelism buys is server-side — PostgreSQL will not use a
-    parallel plan for a statement that writes, so the transform runs on a single
-    core however the client is built, and the only way to get more cores onto it
-    is more connections doing it at once.
-
-    Raises
-    ------
-    RuntimeError
-        If any archive failed, after every other one has finished.
-    """
-    tasks = [(archive, f"{args.staging_schema}.{args.staging_table}_{index:02d}")
-             for index, archive in enumerate(archives)]
-    logger.info("Importing %d archive(s) across %d process(es)", len(archives), jobs)
-
-    imported = 0
-    failures: list[tuple[str, str]] = []
-    with ProcessPoolExecutor(max_workers=jobs, initializer=_worker_init,
-                             initargs=(args, provider_id, boundary_provider_id)) as pool:
-        futures = [pool.submit(_worker_import, task) for task in tasks]
-        for finished, future in enumerate(as_completed(futures), start=1):
-            name, count, error = future.result()
-            if error is None:
-                imported += count
-            else:
-                failures.append((name, error))
-                logger.error("%s: failed: %s", name, error)
-            logger.info("[%d/%d archives done]", finished, len(archives))
-
-    if failures:
-        raise RuntimeError(
-            f"{len(failures)} of {len(archives)} archive(s) failed: "
-            + "; ".join(f"{name} ({error})" for name, error in failures)
-        )
-    return imported
-
-
 def import_wildfires(args: argparse.Namespace, engine: Engine, logger: logging.Logger) -> int:
     """Run the whole import against ``engine``, returning the fires imported.
 
@@ -483,7 +512,10 @@ def import_wildfires(args: argparse.Namespace, engine: Engine, logger: logging.L
     fourteen before it.
     """
     archives = find_archives(args)
-    common.require_tables(engine, ["wildfire", "gwis_wildfire", "time_zone", "data_provider"], logger)
+    common.require_tables(engine, ["wildfire", "gwis_wildfire", "time_zone", "time_zone_part",
+                                   "admin_boundary_part", "data_provider",
+                                   "wildfire_yearly_summary", "wildfire_boundary_area"]
+                          + (["source_file"] if args.incremental else []), logger)
     common.create_staging_schema(engine, args.staging_schema)
 
     with Session(engine) as session:
@@ -492,7 +524,8 @@ def import_wildfires(args: argparse.Namespace, engine: Engine, logger: logging.L
             session, gwis.PROVIDER_NAME, gwis.PROVIDER_PRODUCT,
             gwis.PROVIDER_FULL_NAME, gwis.PROVIDER_URL, logger,
         )
-        warn_if_already_imported(session, provider, logger)
+        if not args.incremental:
+            warn_if_already_imported(session, provider, logger)
         boundary_provider = find_boundary_provider(session, logger)
         session.commit()
         # Read back after the commit: the objects are expired and the ids are
@@ -502,19 +535,10 @@ def import_wildfires(args: argparse.Namespace, engine: Engine, logger: logging.L
         )
 
     started = time.monotonic()
-    # More workers than archives would just be idle processes, and one archive is
-    # a serial run whatever was asked for.
-    jobs = min(args.jobs, len(archives))
-    if jobs > 1:
-        imported = import_in_parallel(archives, args, provider_id, boundary_provider_id,
-                                      jobs, logger)
-    else:
-        imported = 0
-        logger.info("Importing %d archive(s)", len(archives))
-        for index, archive in enumerate(archives, start=1):
-            logger.info("[%d/%d] %s", index, len(archives), archive.name)
-            imported += import_archive(archive, engine, args, provider_id,
-                                       boundary_provider_id, logger)
+    # Safe to spread across workers because nothing is skipped: each archive only
+    # inserts, so no two can race over the same rows.
+    imported = sum(common.run_imports(archives, import_archive, engine, args,
+                                      (provider_id, boundary_provider_id), logger))
 
     logger.info("Imported %d wildfires from %d archive(s) in %.0fs", imported, len(archives),
                 time.monotonic() - started)
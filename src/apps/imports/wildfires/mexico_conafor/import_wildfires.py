@@ -423,19 +423,19 @@ located AS MATERIALIZED (
     SELECT repaired.*, zone.name AS time_zone, country.id AS admin_boundary_id
     FROM repaired
     LEFT JOIN LATERAL (
-        SELECT time_zone.name
-        FROM time_zone
+        SELECT time_zone_part.name
+        FROM time_zone_part
         WHERE repaired.perimeter IS NOT NULL
-          AND ST_Contains(time_zone.geometry, ST_PointOnSurface(repaired.perimeter))
+          AND ST_Intersects(time_zone_part.geometry, ST_PointOnSurface(repaired.perimeter))
         LIMIT 1
     ) AS zone ON TRUE
     LEFT JOIN LATERAL (
-        SELECT boundary.id
-        FROM admin_boundary AS boundary
-        WHERE boundary.data_provider_id = :boundary_provider_id
-          AND boundary.level = 0
+        SELECT part.admin_boundary_id AS id
+        FROM admin_boundary_part AS part
+        WHERE part.data_provider_id = :boundary_provider_id
+          AND part.level = 0
           AND repaired.perimeter IS NOT NULL
-          AND ST_Contains(boundary.geometry, ST_PointOnSurface(repaired.perimeter))
+          AND ST_Intersects(part.geometry, ST_PointOnSurface(repaired.perimeter))
         LIMIT 1
     ) AS country ON TRUE
 ),
@@ -983,9 +983,8 @@ def import_archive(archive: Path, engine: Engine, args: argparse.Namespace,
         blank_missing_values(session, staging_table, log)
         normalise_staging_dates(session, staging_table, log)
         normalise_staging_vegetation(session, staging_table, log)
-        # ogr2ogr leaves the table with no statistics at all, so without this the
-        # planner sizes the staging table as if it held a handful of rows and
-        # picks nested loops over the spatial joins below.
+        # Again, after the load's own: the statements above rewrote the dates and
+        # the vegetation classes the load's statistics describe.
         session.execute(text(f"ANALYZE {staging_table}"))
 
         staged = session.scalar(text(f"SELECT count(*) FROM {staging_table}"))
@@ -1014,7 +1013,8 @@ def import_wildfires(args: argparse.Namespace, engine: Engine, logger: logging.L
     """Run the whole import against ``engine``, returning the fires imported."""
     archives = find_archives(args)
     common.require_tables(engine, ["wildfire", "conafor_wildfire", "conafor_fire_cause",
-                                   "time_zone", "data_provider"], logger)
+                                   "time_zone", "time_zone_part", "admin_boundary_part",
+                                   "data_provider"], logger)
     common.create_staging_schema(engine, args.staging_schema)
 
     with Session(engine) as session:
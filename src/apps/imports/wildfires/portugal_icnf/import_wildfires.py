@@ -81,6 +81,13 @@ deletes what it loaded before importing it again. That second form is what to us
 when the ICNF revises a published year, which it does — fires of 2024 carry
 ``Edicao`` dates into March 2025.
 
+``--incremental`` tells the two apart without being told: it compares each
+archive's SHA-256 with the one recorded in the ``source_file`` manifest when it
+was last imported (see :class:`~src.data_model.source_file.SourceFile`), skips
+the layers whose hash is unchanged and replaces those whose hash is not, as
+``--replace`` would. A layer imported before the manifest existed has no entry,
+and is replaced once to get one.
+
 Database settings come from the environment (``.env``, see :mod:`src.settings`);
 every one of them can be overridden with a command-line argument.
 
@@ -273,17 +280,17 @@ located AS MATERIALIZED (
     SELECT projected.*, zone.name AS time_zone, country.id AS admin_boundary_id
     FROM projected
     LEFT JOIN LATERAL (
-        SELECT time_zone.name
-        FROM time_zone
-        WHERE ST_Contains(time_zone.geometry, projected.locator)
+        SELECT time_zone_part.name
+        FROM time_zone_part
+        WHERE ST_Intersects(time_zone_part.geometry, projected.locator)
         LIMIT 1
     ) AS zone ON TRUE
     LEFT JOIN LATERAL (
-        SELECT boundary.id
-        FROM admin_boundary AS boundary
-        WHERE boundary.data_provider_id = :boundary_provider_id
-          AND boundary.level = 0
-          AND ST_Contains(boundary.geometry, projected.locator)
+        SELECT part.admin_boundary_id AS id
+        FROM admin_boundary_part AS part
+        WHERE part.data_provider_id = :boundary_provider_id
+          AND part.level = 0
+          AND ST_Intersects(part.geometry, projected.locator)
         LIMIT 1
     ) AS country ON TRUE
 ),
@@ -371,7 +378,9 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
                         help="re-import a layer already in the database, deleting what it "
                              "loaded before. Use this when the ICNF revises a published "
                              "year; without it an already-imported layer is skipped")
+    common.add_incremental_arguments(parser)
 
+    common.add_jobs_arguments(parser, "archives")
     common.add_database_arguments(parser)
     common.add_staging_arguments(parser, DEFAULT_STAGING_TABLE)
     common.add_common_arguments(parser)
@@ -543,20 +552,30 @@ def transform(session: Session, provider_id: int, boundary_provider_id: int | No
 
 def import_archive(archive: Path, engine: Engine, args: argparse.Namespace,
                    provider_id: int, boundary_provider_id: int | None,
-                   logger: logging.Logger) -> int:
+                   logger: logging.Logger, staging_table: str | None = None,
+                   progress: bool | None = None) -> int:
     """Import one archive in its own transaction, returning the fires imported.
 
     The already-imported check happens before ``ogr2ogr`` runs, not after: loading
     a staging table takes as long as the import itself and there is no point
-    paying for it only to throw the result away.
+    paying for it only to throw the result away. Under ``--incremental`` the check
+    is the manifest's, and a layer whose archive has changed is replaced.
+
+    ``staging_table`` is given to each worker of a parallel run, so that no two
+    load over each other; a serial run keeps the plain name.
     """
-    staging_table = f"{args.staging_schema}.{args.staging_table}"
+    staging_table = staging_table or f"{args.staging_schema}.{args.staging_table}"
     datasource, layer = common.shapefile_datasource(archive)
     log = ArchiveLogger(logger, {"archive": archive.name})
 
+    digest = None
+    if args.incremental:
+        digest = common.changed_source_digest(engine, provider_id, archive, log)
+        if digest is None:
+            return 0
     with Session(engine) as session:
         already = layer_is_imported(session, layer)
-    if already and not args.replace:
+    if already and not (args.replace or args.incremental):
         log.info("Layer %s is already imported; skipping (pass --replace to load it again)",
                  layer)
         return 0
@@ -564,6 +583,7 @@ def import_archive(archive: Path, engine: Engine, args: argparse.Namespace,
     started = time.monotonic()
     common.load_staging_table(
         datasource, layer, staging_table, args, common.resolve_database_settings(args), log,
+        progress=progress,
         # The published CRS, kept rather than converted: the model stores the
         # polygon in it as well as in EPSG:4326, and the 4326 one is derived from
         # it in SQL so that the two provably agree.
@@ -579,9 +599,8 @@ def import_archive(archive: Path, engine: Engine, args: argparse.Namespace,
             delete_layer(session, layer, log)
 
         normalise_staging_columns(session, staging_table, log)
-        # ogr2ogr leaves the table with no statistics at all, so without this the
-        # planner sizes the staging table as if it held a handful of rows and
-        # picks nested loops over the spatial joins below.
+        # Again, after the load's own: the columns normalise_staging_columns adds or
+        # retypes have no statistics, and the transform below reads them.
         session.execute(text(f"ANALYZE {staging_table}"))
 
         staged = session.scalar(text(f"SELECT count(*) FROM {staging_table}"))
@@ -589,7 +608,10 @@ def import_archive(archive: Path, engine: Engine, args: argparse.Namespace,
         log.info("staged %d features in %.0fs (%d cause classification(s)), now mapping them "
                  "onto the model", staged, time.monotonic() - started, causes)
 
+        floor = common.wildfire_id_floor(session)
         imported = transform(session, provider_id, boundary_provider_id, staging_table, layer)
+        if digest is not None:
+            common.record_source_file(session, provider_id, archive, *digest, floor)
         if not args.keep_staging:
             common.drop_staging_table(session, staging_table, log)
         session.commit()
@@ -607,7 +629,9 @@ def import_wildfires(args: argparse.Namespace, engine: Engine, logger: logging.L
     """Run the whole import against ``engine``, returning the fires imported."""
     archives = find_archives(args)
     common.require_tables(engine, ["wildfire", "icnf_wildfire", "icnf_fire_cause",
-                                   "time_zone", "data_provider"], logger)
+                                   "time_zone", "time_zone_part", "admin_boundary_part",
+                                   "data_provider"]
+                          + (["source_file"] if args.incremental else []), logger)
     common.create_staging_schema(engine, args.staging_schema)
 
     with Session(engine) as session:
@@ -625,12 +649,11 @@ def import_wildfires(args: argparse.Namespace, engine: Engine, logger: logging.L
         )
 
     started = time.monotonic()
-    imported = 0
-    logger.info("Importing %d archive(s)", len(archives))
-    for index, archive in enumerate(archives, start=1):
-        logger.info("[%d/%d] %s", index, len(archives), archive.name)
-        imported += import_archive(archive, engine, args, provider_id,
-                                   boundary_provider_id, logger)
+    # Each archive is one layer and only ever deletes or writes that layer's fires.
+    # The cause classifications are shared, but they are upserted, and two workers
+    # upserting one code both end with the row.
+    imported = sum(common.run_imports(archives, import_archive, engine, args,
+                                      (provider_id, boundary_provider_id), logger))
 
     logger.info("Imported %d fires from %d archive(s) in %.0fs", imported, len(archives),
                 time.monotonic() - started)
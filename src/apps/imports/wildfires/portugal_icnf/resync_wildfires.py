@@ -270,7 +270,8 @@ WHERE fire.source_layer = :source_layer
 UPDATE_PARENT_SQL = """
 UPDATE wildfire AS parent
 SET start_date_time = COALESCE(wfs.dh_inicio, parent.start_date_time),
-    end_date_time = wfs.dh_fim
+    end_date_time = wfs.dh_fim,
+    updated_at = now()
 FROM icnf_wildfire AS fire, icnf_wfs_resync AS wfs
 WHERE parent.id = fire.id
   AND wfs.cod_sgif = fire.sgif_code
@@ -289,48 +290,60 @@ RETURNING parent.id
 #: The cause joins on the whole ``(code, type, description)`` triple for the same
 #: reason the import does: four codes name two classifications each, and joining
 #: on the code alone would give a fire the meaning its code had in another year.
+#:
+#: Each fire changed here has its parent's ``updated_at`` moved too, in the same
+#: statement. The year and the areas are what the reports read, and the report
+#: cache notices a change by ``wildfire.updated_at`` (see
+#: :func:`src.apps.statistics.cache.data_fingerprint`): a fire whose year alone
+#: was corrected would otherwise leave every cached report saying the old one.
 UPDATE_FIRE_SQL = """
-UPDATE icnf_wildfire AS fire
-SET anepc_code = wfs.cod_anepc,
-    year = COALESCE(wfs.ano, fire.year),
-    date_time_precision = CASE WHEN wfs.dh_inicio IS NOT NULL
-                               THEN :precision_minute ELSE fire.date_time_precision END,
-    first_response_date_time = wfs.dh_1interv,
-    duration_minutes = wfs.duracao_m,
-    dicofre_code = wfs.pi_dicofre,
-    nuts3_name = wfs.pi_nuts3,
-    district_name = wfs.pi_distrit,
-    municipality_name = wfs.pi_conc,
-    parish_name = wfs.pi_freg,
-    place_name = wfs.pi_local,
-    cause_id = cause.id,
-    area_ha_gis = COALESCE(wfs.areahasig, fire.area_ha_gis),
-    area_ha_sgif = wfs.areahasgif,
-    area_ha_forest_stand = wfs.areahapov,
-    area_ha_shrubland = wfs.areahamato,
-    area_ha_agricultural = wfs.areahaagri,
-    edition_date_time = wfs.edicao
-FROM icnf_wfs_resync AS wfs
-LEFT JOIN icnf_fire_cause AS cause
-       ON cause.code = wfs.causa_cod
-      AND cause.type = wfs.causa_tipo
-      AND cause.description = wfs.causa_desc
-WHERE wfs.cod_sgif = fire.sgif_code
-  AND fire.source_layer = :source_layer
-  AND (fire.anepc_code, fire.year, fire.date_time_precision, fire.first_response_date_time,
-       fire.duration_minutes, fire.dicofre_code, fire.nuts3_name, fire.district_name,
-       fire.municipality_name, fire.parish_name, fire.place_name, fire.cause_id,
-       fire.area_ha_gis, fire.area_ha_sgif, fire.area_ha_forest_stand,
-       fire.area_ha_shrubland, fire.area_ha_agricultural, fire.edition_date_time)
-      IS DISTINCT FROM
-      (wfs.cod_anepc, COALESCE(wfs.ano, fire.year),
-       CASE WHEN wfs.dh_inicio IS NOT NULL THEN :precision_minute
-            ELSE fire.date_time_precision END,
-       wfs.dh_1interv, wfs.duracao_m, wfs.pi_dicofre, wfs.pi_nuts3, wfs.pi_distrit,
-       wfs.pi_conc, wfs.pi_freg, wfs.pi_local, cause.id,
-       COALESCE(wfs.areahasig, fire.area_ha_gis), wfs.areahasgif, wfs.areahapov,
-       wfs.areahamato, wfs.areahaagri, wfs.edicao)
-RETURNING fire.id
+WITH changed AS (
+    UPDATE icnf_wildfire AS fire
+    SET anepc_code = wfs.cod_anepc,
+        year = COALESCE(wfs.ano, fire.year),
+        date_time_precision = CASE WHEN wfs.dh_inicio IS NOT NULL
+                                   THEN :precision_minute ELSE fire.date_time_precision END,
+        first_response_date_time = wfs.dh_1interv,
+        duration_minutes = wfs.duracao_m,
+        dicofre_code = wfs.pi_dicofre,
+        nuts3_name = wfs.pi_nuts3,
+        district_name = wfs.pi_distrit,
+        municipality_name = wfs.pi_conc,
+        parish_name = wfs.pi_freg,
+        place_name = wfs.pi_local,
+        cause_id = cause.id,
+        area_ha_gis = COALESCE(wfs.areahasig, fire.area_ha_gis),
+        area_ha_sgif = wfs.areahasgif,
+        area_ha_forest_stand = wfs.areahapov,
+        area_ha_shrubland = wfs.areahamato,
+        area_ha_agricultural = wfs.areahaagri,
+        edition_date_time = wfs.edicao
+    FROM icnf_wfs_resync AS wfs
+    LEFT JOIN icnf_fire_cause AS cause
+           ON cause.code = wfs.causa_cod
+          AND cause.type = wfs.causa_tipo
+          AND cause.description = wfs.causa_desc
+    WHERE wfs.cod_sgif = fire.sgif_code
+      AND fire.source_layer = :source_layer
+      AND (fire.anepc_code, fire.year, fire.date_time_precision, fire.first_response_date_time,
+           fire.duration_minutes, fire.dicofre_code, fire.nuts3_name, fire.district_name,
+           fire.municipality_name, fire.parish_name, fire.place_name, fire.cause_id,
+           fire.area_ha_gis, fire.area_ha_sgif, fire.area_ha_forest_stand,
+           fire.area_ha_shrubland, fire.area_ha_agricultural, fire.edition_date_time)
+          IS DISTINCT FROM
+          (wfs.cod_anepc, COALESCE(wfs.ano, fire.year),
+           CASE WHEN wfs.dh_inicio IS NOT NULL THEN :precision_minute
+                ELSE fire.date_time_precision END,
+           wfs.dh_1interv, wfs.duracao_m, wfs.pi_dicofre, wfs.pi_nuts3, wfs.pi_distrit,
+           wfs.pi_conc, wfs.pi_freg, wfs.pi_local, cause.id,
+           COALESCE(wfs.areahasig, fire.area_ha_gis), wfs.areahasgif, wfs.areahapov,
+           wfs.areahamato, wfs.areahaagri, wfs.edicao)
+    RETURNING fire.id
+),
+touched AS (
+    UPDATE wildfire SET updated_at = now() WHERE id IN (SELECT id FROM changed)
+)
+SELECT id FROM changed
 """
 
 #: Fires the database has and the WFS did not return. Either the ICNF has
@@ -40,6 +40,14 @@ the reason, counted, and skipped, and the rest of the file is still committed.
 Losing 30,000 good fires to one bad one would be the wrong trade at every scale
 this dataset comes in.
 
+Within the file the fires are written a batch of :data:`BATCH_SIZE` at a time:
+copied into temporary tables with ``COPY`` and upserted from there with one
+``INSERT ... SELECT ... ON CONFLICT`` per table (see
+:func:`~src.apps.imports.common.copy_batch`), rather than bound and executed row by
+row. Meanwhile the export is parsed on a thread of its own
+(:func:`~src.apps.imports.common.read_ahead`), so that the next batch is being read
+while this one is written.
+
 What makes a fire unstorable is deliberately short — no report number, no
 detection instant (``wildfire.start_date_time`` is ``NOT NULL`` and nothing else
 can stand in for it). Everything else is degraded rather than refused: a fire
@@ -52,8 +60,8 @@ Progress
 
 Each file gets a :class:`~src.apps.imports.common.ProgressReporter` — a bar on a
 terminal, periodic log lines when redirected. The Excel row count is known in
-advance (a cheap second pass over the same zip), so those bars carry a percentage
-and an estimate; an XML export cannot be counted without parsing it, so its bar
+advance (read from the sheet's declared ``<dimension>``), so those bars carry a
+percentage and an estimate; an XML export cannot be counted without parsing it, so its bar
 shows the running count and rate instead.
 
 Database settings come from the environment (``.env``, see :mod:`src.settings`);
@@ -90,9 +98,9 @@ from src.providers import spain_ign
 
 LOG_FORMAT = "%(asctime)s %(levelname)s %(message)s"
 
-#: Fires converted and written per round trip. Large enough that the per-batch
-#: statements dominate their own overhead, small enough that the parameter lists
-#: stay well inside what psycopg will bind in one executemany.
+#: Fires converted and written per round trip. Large enough that the ``COPY`` and
+#: the statements that spread it are a small cost per fire, small enough that a
+#: batch's rows and the temporary tables holding them stay in memory.
 BATCH_SIZE = 2000
 
 #: How many individually bad fires are logged per file before the rest are only
@@ -190,6 +198,38 @@ GROUP BY report_number
 #: would come too late — the same reason the ICNF import takes its ids up front.
 ALLOCATE_SQL = "SELECT nextval(pg_get_serial_sequence(:table, 'id')) FROM generate_series(1, :count)"
 
+#: The temporary tables a batch is copied into before it is spread over the
+#: tables it writes (see :func:`~src.apps.imports.common.copy_batch`), one per
+#: provider table, each shaped like the table it is named after.
+IGNITION_BATCH_TABLE = "egif_ignition_batch"
+WILDFIRE_BATCH_TABLE = "egif_wildfire_batch"
+REPORT_BATCH_TABLE = "egif_wildfire_report_batch"
+
+#: What the ``wildfire`` row needs that ``egif_wildfire`` does not hold: the fire's
+#: zone, its boundary and the naive published instants, converted on the way out.
+WILDFIRE_BATCH_COLUMNS = {
+    "time_zone": "varchar",
+    "admin_boundary_id": "integer",
+    "start_date_time": "timestamp",
+    "end_date_time": "timestamp",
+}
+
+#: What the ``ignition`` row needs that ``egif_ignition`` does not hold: the same,
+#: less the extinction, plus the CRS the published easting and northing are in.
+IGNITION_BATCH_COLUMNS = {
+    "time_zone": "varchar",
+    "admin_boundary_id": "integer",
+    "start_date_time": "timestamp",
+    "srid": "integer",
+}
+
+#: The report's local instants travel naive, as ``timestamp`` columns under their
+#: own names, and the zone they are read in travels with them.
+REPORT_BATCH_COLUMNS = {
+    "time_zone": "varchar",
+    **{name: "timestamp" for name in sorted(LOCAL_DATETIME_COLUMNS)},
+}
+
 #: The stored point, built from the published easting and northing.
 #:
 #: ``ST_SetSRID`` tags the pair with the CRS resolved from its own datum and zone
@@ -197,7 +237,7 @@ ALLOCATE_SQL = "SELECT nextval(pg_get_serial_sequence(:table, 'id')) FROM genera
 #: reprojects to the EPSG:4326 the model stores. Done in PostGIS rather than in
 #: Python so that the transformation is the same one every spatial query in the
 #: database will use.
-GEOMETRY_SQL = "ST_Transform(ST_SetSRID(ST_MakePoint(:utm_x, :utm_y), :srid), 4326)"
+GEOMETRY_SQL = "ST_Transform(ST_SetSRID(ST_MakePoint(batch.utm_x, batch.utm_y), batch.srid), 4326)"
 
 def _local(column: str) -> str:
     """The SQL that resolves a naive published reading against the fire's zone.
@@ -207,22 +247,21 @@ def _local(column: str) -> str:
     Canarian fires. ``AT TIME ZONE`` applied to a ``timestamp`` yields the
     ``timestamptz`` the column stores.
 
-    The ``CAST`` is not decoration. Most of these readings are optional and
-    frequently null — only 1,089 fires of 29,926 have a coordination-resource
-    arrival — and PostgreSQL cannot infer a bound parameter's type from
-    ``AT TIME ZONE`` alone, so an untyped null is rejected outright with
-    *could not determine data type of parameter*. Naming the type is also why no
-    ``CASE`` is needed around it: ``NULL::timestamp AT TIME ZONE`` is null, which
-    is exactly the wanted answer for a fire that was never extinguished.
+    Most of these readings are optional and frequently null — only 1,089 fires of
+    29,926 have a coordination-resource arrival — and no ``CASE`` is needed around
+    them: the batch column is a ``timestamp``, and ``NULL::timestamp AT TIME ZONE``
+    is null, which is exactly the wanted answer for a fire that was never
+    extinguished.
     """
-    return f"CAST(:{column} AS timestamp) AT TIME ZONE :time_zone"
+    return f"batch.{column} AT TIME ZONE batch.time_zone"
 
 
 UPSERT_IGNITION_SQL = f"""
 INSERT INTO ignition (id, type, data_provider_id, geometry, date_time, time_zone,
                       admin_boundary_id)
-VALUES (:ignition_id, 'egif_ignition', :provider_id, {GEOMETRY_SQL},
-        {_local('start_date_time')}, :time_zone, :admin_boundary_id)
+SELECT batch.id, 'egif_ignition', :provider_id, {GEOMETRY_SQL},
+       {_local('start_date_time')}, batch.time_zone, batch.admin_boundary_id
+FROM {IGNITION_BATCH_TABLE} AS batch
 ON CONFLICT (id) DO UPDATE SET
     geometry = EXCLUDED.geometry,
     date_time = EXCLUDED.date_time,
@@ -234,10 +273,11 @@ ON CONFLICT (id) DO UPDATE SET
 UPSERT_WILDFIRE_SQL = f"""
 INSERT INTO wildfire (id, type, data_provider_id, start_date_time, end_date_time,
                       time_zone, admin_boundary_id)
-VALUES (:wildfire_id, 'egif_wildfire', :provider_id,
-        {_local('start_date_time')},
-        {_local('end_date_time')},
-        :time_zone, :admin_boundary_id)
+SELECT batch.id, 'egif_wildfire', :provider_id,
+       {_local('start_date_time')},
+       {_local('end_date_time')},
+       batch.time_zone, batch.admin_boundary_id
+FROM {WILDFIRE_BATCH_TABLE} AS batch
 ON CONFLICT (id) DO UPDATE SET
     start_date_time = EXCLUDED.start_date_time,
     end_date_time = EXCLUDED.end_date_time,
@@ -247,18 +287,19 @@ ON CONFLICT (id) DO UPDATE SET
 """
 
 
-def _upsert_sql(table: str, key: str, columns: tuple[str, ...],
+def _upsert_sql(table: str, batch_table: str, columns: tuple[str, ...],
                 extra: dict[str, str] | None = None,
                 touch_updated_at: bool = False) -> str:
-    """Build an ``INSERT ... ON CONFLICT (id) DO UPDATE`` over ``columns``.
+    """Build an ``INSERT ... SELECT ... ON CONFLICT (id) DO UPDATE`` over ``columns``.
 
+    The rows come from ``batch_table``, which holds them under the same names.
     ``extra`` maps a column to the SQL expression that produces it, for the ones
-    that are not a plain bound parameter — the local datetimes, which need the
-    fire's zone applied. Everything else binds by name.
+    that are not copied as they are stored — the local datetimes, which need the
+    fire's zone applied. Everything else is read from the batch by name.
 
     Only ``columns`` appear in the ``SET``, which is the mechanism behind "each
     step writes only what its format publishes": a column this step does not name
-    is not merely left unbound, it is not mentioned, so an existing value survives
+    is not merely left unset, it is not mentioned, so an existing value survives
     untouched.
 
     ``touch_updated_at`` adds ``updated_at = now()``, which raw SQL has to do for
@@ -268,17 +309,26 @@ def _upsert_sql(table: str, key: str, columns: tuple[str, ...],
     living on the parent rows instead.
     """
     extra = extra or {}
-    names = (key, *columns)
-    values = ", ".join(extra.get(name, f":{name}") for name in names)
+    names = ("id", *columns)
+    values = ", ".join(extra.get(name, f"batch.{name}") for name in names)
     updates = [f"{name} = EXCLUDED.{name}" for name in columns]
     if touch_updated_at:
         updates.append("updated_at = now()")
     return (
-        f"INSERT INTO {table} ({', '.join(names)}) VALUES ({values}) "
+        f"INSERT INTO {table} ({', '.join(names)}) SELECT {values} FROM {batch_table} AS batch "
         f"ON CONFLICT (id) DO UPDATE SET {', '.join(updates)}"
     )
 
 
+def _copy_batch(session: Session, batch_table: str, source_table: str,
+                columns: tuple[str, ...], extra_columns: dict[str, str],
+                rows: list[dict[str, object]]) -> None:
+    """Copy rows held as dictionaries, by column name, into a batch table."""
+    names = (*columns, *extra_columns)
+    common.copy_batch(session, batch_table, source_table, columns, extra_columns,
+                      ([row[name] for name in names] for row in rows))
+
+
 # --------------------------------------------------------------------------
 # Converting a record into the parameters the statements bind
 # --------------------------------------------------------------------------
@@ -519,10 +569,12 @@ def write_batch(session: Session, batch: list[PifRecord], provider_id: int,
                 outcome: FileOutcome, log: logging.LoggerAdapter) -> None:
     """Upsert one batch of fires, parents before children.
 
-    Five statements at most, each an ``executemany`` over the whole batch:
-    ``ignition`` and ``egif_ignition`` for the fires that have a point,
-    ``wildfire`` and ``egif_wildfire`` for all of them, and
-    ``egif_wildfire_report`` for the XML step.
+    The batch is copied into the three batch tables (:data:`IGNITION_BATCH_TABLE`
+    and its siblings), one ``COPY`` each, and spread from there in five
+    ``INSERT ... SELECT ... ON CONFLICT`` at most: ``ignition`` and
+    ``egif_ignition`` for the fires that have a point, ``wildfire`` and
+    ``egif_wildfire`` for all of them, and ``egif_wildfire_report`` for the XML
+    step.
     """
     if not batch:
         return
@@ -535,10 +587,10 @@ def write_batch(session: Session, batch: list[PifRecord], provider_id: int,
         ).all()
     }
 
+    ignition_columns = EXCEL_IGNITION_COLUMNS if from_excel else XML_IGNITION_COLUMNS
+    wildfire_columns = EXCEL_WILDFIRE_COLUMNS if from_excel else XML_WILDFIRE_COLUMNS
     ignitions: list[dict[str, object]] = []
-    egif_ignitions: list[dict[str, object]] = []
     wildfires: list[dict[str, object]] = []
-    egif_wildfires: list[dict[str, object]] = []
     reports: list[dict[str, object]] = []
 
     # Everything that needs a freshly allocated key is worked out first, so the
@@ -578,21 +630,16 @@ def write_batch(session: Session, batch: list[PifRecord], provider_id: int,
         report_problems(record, outcome, log)
 
         if srid is not None:
-            point = dict(parameters, ignition_id=ignition_id, srid=srid,
-                         utm_x=record.utm_x, utm_y=record.utm_y)
-            ignitions.append(point)
-            columns = EXCEL_IGNITION_COLUMNS if from_excel else XML_IGNITION_COLUMNS
-            egif_ignitions.append(
+            ignitions.append(
                 {"id": ignition_id, "report_number": record.report_number,
-                 **{name: getattr(record, name) for name in columns}}
+                 "srid": srid, **parameters,
+                 **{name: getattr(record, name) for name in ignition_columns}}
             )
 
-        wildfires.append(parameters)
-        columns = EXCEL_WILDFIRE_COLUMNS if from_excel else XML_WILDFIRE_COLUMNS
-        egif_wildfires.append(
-            {"id": wildfire_id, "report_number": record.report_number,
+        wildfires.append(
+            {"id": wildfire_id, "report_number": record.report_number, **parameters,
              **{name: parameters[name] if name in parameters else getattr(record, name)
-                for name in columns}}
+                for name in wildfire_columns}}
         )
 
         if not from_excel:
@@ -603,29 +650,27 @@ def write_batch(session: Session, batch: list[PifRecord], provider_id: int,
         outcome.written += 1
 
     if ignitions:
-        session.execute(text(UPSERT_IGNITION_SQL), ignitions)
-        session.execute(
-            text(_upsert_sql("egif_ignition", "id",
-                             ("report_number",) + (EXCEL_IGNITION_COLUMNS if from_excel
-                                                   else XML_IGNITION_COLUMNS))),
-            egif_ignitions,
-        )
-    session.execute(text(UPSERT_WILDFIRE_SQL), wildfires)
-    session.execute(
-        text(_upsert_sql("egif_wildfire", "id",
-                         ("report_number",) + (EXCEL_WILDFIRE_COLUMNS if from_excel
-                                               else XML_WILDFIRE_COLUMNS))),
-        egif_wildfires,
-    )
+        _copy_batch(session, IGNITION_BATCH_TABLE, "egif_ignition",
+                    ("id", "report_number", *ignition_columns), IGNITION_BATCH_COLUMNS,
+                    ignitions)
+        session.execute(text(UPSERT_IGNITION_SQL), {"provider_id": provider_id})
+        session.execute(text(_upsert_sql("egif_ignition", IGNITION_BATCH_TABLE,
+                                         ("report_number", *ignition_columns))))
+    _copy_batch(session, WILDFIRE_BATCH_TABLE, "egif_wildfire",
+                ("id", "report_number", *wildfire_columns), WILDFIRE_BATCH_COLUMNS,
+                wildfires)
+    session.execute(text(UPSERT_WILDFIRE_SQL), {"provider_id": provider_id})
+    session.execute(text(_upsert_sql("egif_wildfire", WILDFIRE_BATCH_TABLE,
+                                     ("report_number", *wildfire_columns))))
     if reports:
-        session.execute(
-            text(_upsert_sql(
-                "egif_wildfire_report", "id", REPORT_COLUMNS,
-                extra={name: _local(name) for name in LOCAL_DATETIME_COLUMNS},
-                touch_updated_at=True,
-            )),
-            reports,
-        )
+        stored = tuple(name for name in REPORT_COLUMNS if name not in LOCAL_DATETIME_COLUMNS)
+        _copy_batch(session, REPORT_BATCH_TABLE, "egif_wildfire_report",
+                    ("id", *stored), REPORT_BATCH_COLUMNS, reports)
+        session.execute(text(_upsert_sql(
+            "egif_wildfire_report", REPORT_BATCH_TABLE, REPORT_COLUMNS,
+            extra={name: _local(name) for name in LOCAL_DATETIME_COLUMNS},
+            touch_updated_at=True,
+        )))
 
 
 def allocate(session: Session, table: str, count: int) -> list[int]:
@@ -710,7 +755,9 @@ def import_file(path: Path, engine: Engine, provider_id: int,
         # violation on a 30,000-fire file rather than a named duplicate.
         seen_reports: set[str] = set()
 
-        for record in records:
+        # Parsed on a reader thread while the batches are written; see
+        # common.read_ahead.
+        for record in common.read_ahead(records):
             outcome.read += 1
             progress.advance()
             if record.report_number in seen_reports:
@@ -16,11 +16,14 @@ inside the ``.xlsx`` zip.
 Why the Excel is not read with a library
 ----------------------------------------
 
-``openpyxl`` in ``read_only`` mode would do it, at the cost of a dependency used
-for exactly one file format in one importer. What is needed here is small: one
-sheet, a header row, string cells resolved through the shared-string table. That
-is forty lines against the stored XML, and it avoids a version of the "empty
-cell" problem that a general reader has to guess at — see :data:`BLANKS`.
+``openpyxl`` in ``read_only`` mode would do it, at the cost of a cell object per
+value. What is needed here is small: one sheet, a header row, string cells
+resolved through the shared-string table. That is forty lines against the stored
+XML, and it avoids a version of the "empty cell" problem that a general reader
+has to guess at — see :data:`BLANKS`. The shared-string table and the cell
+references come from :mod:`src.apps.imports.xlsx`, which the Greek reader is
+built on; the rows are read here, as the text the export stored, because every
+EGIF cell is text and converting it is this module's job.
 
 Nothing is validated here
 -------------------------
@@ -44,6 +47,9 @@ import zipfile
 
 from pathlib import Path
 
+from src.apps.imports.xlsx import SHEET_NS
+from src.apps.imports.xlsx import SharedStrings
+from src.apps.imports.xlsx import column_index
 from src.providers import spain_egif
 
 #: Cell values that mean "no value" in the Excel export.
@@ -295,27 +301,6 @@ def parse_xml_datetime(value: object) -> datetime.datetime | None:
 # The Excel export
 # --------------------------------------------------------------------------
 
-#: The worksheet XML namespace, and the only one either sheet part uses.
-SHEET_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
-
-
-def _shared_strings(archive: zipfile.ZipFile) -> list[str]:
-    """Read the workbook's shared-string table.
-
-    Every text cell in the sheet is an index into this, so it has to be read
-    whole — but it is the *distinct* strings, which for even the largest export is
-    a few hundred thousand short municipality and cause names rather than a row
-    per fire.
-    """
-    if "xl/sharedStrings.xml" not in archive.namelist():
-        return []
-    root = ElementTree.fromstring(archive.read("xl/sharedStrings.xml"))
-    return [
-        "".join(node.text or "" for node in item.iter(f"{SHEET_NS}t"))
-        for item in root.iter(f"{SHEET_NS}si")
-    ]
-
-
 def _worksheet_name(archive: zipfile.ZipFile) -> str:
     """The single worksheet part.
 
@@ -340,21 +325,7 @@ def _worksheet_name(archive: zipfile.ZipFile) -> str:
     return sheets[0]
 
 
-def column_index(reference: str) -> int:
-    """Turn a cell reference's column letters into a zero-based index.
-
-    ``"A"`` is 0, ``"Z"`` 25, ``"AA"`` 26 and ``"AE"`` — the last of the 31
-    published columns — is 30.
-    """
-    index = 0
-    for character in reference:
-        if not character.isalpha():
-            break
-        index = index * 26 + (ord(character.upper()) - ord("A") + 1)
-    return index - 1
-
-
-def _rows(archive: zipfile.ZipFile, shared: list[str],
+def _rows(archive: zipfile.ZipFile, shared: SharedStrings,
           width: int) -> typing.Iterator[list[str | None]]:
     """Yield each row of the worksheet as a list of ``width`` cell values.
 
@@ -371,9 +342,18 @@ def _rows(archive: zipfile.ZipFile, shared: list[str],
     area is an interface flag — all of it well-formed enough to import without
     complaint. Placing each cell where its own reference says it goes gives the
     two rows a null ``Extinguido`` and leaves the other 483,000 unchanged.
+
+    Each row is removed from ``<sheetData>`` once it has been yielded. Clearing
+    the row alone would empty it but leave its shell attached to the parent,
+    one element per fire for the length of the sheet.
     """
     with archive.open(_worksheet_name(archive)) as sheet:
-        for _, row in ElementTree.iterparse(sheet, events=("end",)):
+        sheet_data = None
+        for event, row in ElementTree.iterparse(sheet, events=("start", "end")):
+            if event == "start":
+                if row.tag == f"{SHEET_NS}sheetData":
+                    sheet_data = row
+                continue
             if row.tag != f"{SHEET_NS}row":
                 continue
             values: list[str | None] = [None] * width
@@ -391,7 +371,10 @@ def _rows(archive: zipfile.ZipFile, shared: list[str],
                 if 0 <= index < width:
                     values[index] = text
             yield values
-            row.clear()
+            if sheet_data is not None:
+                sheet_data.clear()
+            else:
+                row.clear()
 
 
 #: The 31 columns of the Excel "resumen", in published order.
@@ -411,19 +394,37 @@ EXCEL_COLUMNS = (
 )
 
 
+#: A ``<dimension>`` reference: the used range's first and last cells.
+DIMENSION = re.compile(r"^[A-Z]+(\d+)(?::[A-Z]+(\d+))?$")
+
+
 def count_excel_rows(path: Path) -> int | None:
     """Count the fires in an export without converting them, for the progress bar.
 
-    Counting is a second pass over the same file, which for a 6 MB workbook costs
-    a fraction of a second and buys a bar with a percentage and an estimate rather
-    than a bare running count. ``None`` if the file cannot be read at all, which
-    :func:`read_excel` will report properly a moment later.
+    The count is read from the sheet's ``<dimension>`` — the used range every
+    EGIF export declares ahead of its rows — which costs the first few hundred
+    bytes of the sheet rather than a second pass over all of it. A sheet without
+    one (Excel writes it, but the format does not require it) is counted row by
+    row instead, which for a 6 MB workbook is still a fraction of a second. The
+    dimension counts a trailing blank row the read will skip; for a bar that is
+    an error of one.
+
+    ``None`` if the file cannot be read at all, which :func:`read_excel` will
+    report properly a moment later.
     """
     try:
         with zipfile.ZipFile(path) as archive:
             with archive.open(_worksheet_name(archive)) as sheet:
                 rows = 0
-                for _, element in ElementTree.iterparse(sheet, events=("end",)):
+                for event, element in ElementTree.iterparse(sheet, events=("start", "end")):
+                    if event == "start":
+                        if element.tag == f"{SHEET_NS}dimension":
+                            declared = DIMENSION.match(element.get("ref", "").upper())
+                            if declared:
+                                first, last = declared.groups()
+                                rows = int(last or first) - int(first) + 1
+                                break
+                        continue
                     if element.tag == f"{SHEET_NS}row":
                         rows += 1
                         element.clear()
@@ -443,7 +444,7 @@ def read_excel(path: Path) -> typing.Iterator[PifRecord]:
         fields shuffled, and every one of them would look plausible.
     """
     with zipfile.ZipFile(path) as archive:
-        shared = _shared_strings(archive)
+        shared = SharedStrings.read(archive)
         rows = _rows(archive, shared, len(EXCEL_COLUMNS))
 
         try:
@@ -657,14 +658,19 @@ def read_xml(path: Path) -> typing.Iterator[PifRecord]:
     elements are in the XSD namespace and only ``<Pif>`` is acted on, so it costs
     a parse of 37 KB and no special handling.
 
-    Each ``<Pif>`` is cleared as soon as it has been converted, which is what
-    keeps a 285 MB export inside a few megabytes of memory.
+    Each ``<Pif>`` is removed from the document root as soon as it has been
+    converted, which is what keeps a 285 MB export inside a few megabytes of
+    memory: clearing the element alone would leave an empty shell per fire
+    attached to the root.
     """
-    for _, element in ElementTree.iterparse(str(path), events=("end",)):
-        if element.tag != "Pif":
+    root = None
+    for event, element in ElementTree.iterparse(str(path), events=("start", "end")):
+        if root is None:
+            root = element
+        if event != "end" or element.tag != "Pif":
             continue
         record = _xml_record(element)
-        element.clear()
+        root.clear()
         if record is not None:
             yield record
 
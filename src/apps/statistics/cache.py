@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""A result cache for the statistics reports, keyed on the data they were computed from.
+
+Between two imports, the same ``wildfire_statistics`` command with the same arguments
+prints the same report, and computing it again means measuring every perimeter again:
+minutes, for GWIS or NBAC, to rewrite a file that has not changed. This module keeps
+each report's computed rows on disk and hands them back when nothing they depend on
+has moved.
+
+What a cached report is keyed on
+--------------------------------
+
+Four things, and a hit needs all four to match:
+
+* **the report module**, by name and by the hash of its source and of the sources of
+  the project's modules it draws on — :mod:`~src.apps.statistics.sampling`,
+  :mod:`~src.apps.statistics.engine`, :mod:`~src.apps.imports.common` and whatever
+  else it imports from :data:`CODE_PACKAGE` — so that a fix to the arithmetic,
+  wherever it is made, is never answered from rows the old arithmetic produced;
+* **the arguments that change the rows** — :func:`normalised_arguments` drops the
+  output paths, ``--jobs``, the log level, the database credentials and ``--no-cache``
+  itself, none of which changes a figure;
+* **the database**, by its URL without the password, so that two databases never
+  share an entry;
+* **a fingerprint of the data** — :func:`data_fingerprint` — read in the same
+  session the report would be computed in.
+
+The fingerprint
+---------------
+
+Per provider the report reads, ``count(*)`` and ``max(updated_at)`` from
+``wildfire``. An import replaces a year by deleting its fires and inserting them
+again, so the new rows carry a newer ``updated_at`` even when their number is the same;
+a delete that inserts nothing changes the count. Either moves the fingerprint, and
+the next run misses and recomputes. Nothing has to remember to invalidate anything.
+
+Two more things move a report without touching ``wildfire``, and are in the
+fingerprint too:
+
+* **the country boundaries**, ``count(*)`` and ``max(updated_at)`` over
+  ``admin_boundary``, because a report attributing fires by geometry attributes them
+  differently once the boundaries are imported again;
+* **the bindings**, for a report that counts bound fires: each binding application
+  rewrites ``matched_at`` on the provider's own table and leaves ``wildfire`` alone,
+  so the report passes those columns as ``bindings`` and their count and maximum are
+  read as well.
+
+Reading the fingerprint is one pass over the provider's rows of ``wildfire``, with no
+geometry in it: a second or two on the largest archive, where the report it saves
+costs minutes.
+
+Where it is kept
+----------------
+
+Under :data:`CACHE_DIRECTORY_VARIABLE` if it is set, and under
+``$XDG_CACHE_HOME/gisfire/statistics`` — ``~/.cache/gisfire/statistics`` — otherwise:
+one directory per report module, one per set of arguments inside it, and one file in
+that, for the current fingerprint. Storing a new entry removes the entries it
+supersedes, so the cache holds one report per command line rather than one per import.
+
+The entries are :mod:`pickle` files, because the rows are each module's own frozen
+dataclass and some hold sets; a cache directory is the user's own, and is trusted the
+way their shell history is. An entry that cannot be read is recomputed over.
+
+``--no-cache`` neither reads nor writes an entry.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import pickle
+import sys
+import tempfile
+
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Sequence
+from typing import TypeVar
+
+from sqlalchemy import ColumnElement
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.data_model.data_provider import DataProvider
+from src.data_model.geography.admin_boundary import AdminBoundary
+from src.data_model.wildfire import Wildfire
+
+#: Environment variable naming the cache directory.
+CACHE_DIRECTORY_VARIABLE = "GISFIRE_CACHE_DIR"
+
+#: Bumped when what an entry holds changes shape, so old entries miss rather than
+#: unpickle into something else.
+CACHE_FORMAT = 1
+
+#: Suffix of an entry's file.
+ENTRY_SUFFIX = ".pickle"
+
+#: Arguments that do not change a report's rows, and so are not part of its key.
+IGNORED_ARGUMENTS = frozenset({
+    "csv", "docx", "jobs", "log_level", "no_cache",
+    "db_host", "db_port", "db_name", "db_user", "db_password",
+})
+
+#: The package whose modules are hashed into a report's key when the report draws on
+#: them, directly or through one another. Third-party code is left out: an upgrade
+#: that changed a figure would be a bug of its own, and hashing site-packages on every
+#: run would cost more than it saves.
+CODE_PACKAGE = "src"
+
+_Row = TypeVar("_Row")
+
+
+def add_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add ``--no-cache`` to a statistics application's command line."""
+    parser.add_argument("--no-cache", action="store_true",
+                        help="compute the report even if an identical one is cached, "
+                             "and do not cache it (the cache is kept in "
+                             f"${CACHE_DIRECTORY_VARIABLE}, default "
+                             "~/.cache/gisfire/statistics)")
+
+
+def cache_directory() -> Path:
+    """Where the entries are kept. See the module docstring."""
+    configured = os.getenv(CACHE_DIRECTORY_VARIABLE)
+    if configured:
+        return Path(configured)
+    base = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "gisfire" / "statistics"
+
+
+def normalised_arguments(args: argparse.Namespace) -> dict[str, Any]:
+    """The arguments that change a report's rows, as JSON-ready values."""
+    return {name: str(value) if isinstance(value, Path) else value
+            for name, value in sorted(vars(args).items())
+            if name not in IGNORED_ARGUMENTS}
+
+
+def data_fingerprint(session: Session, providers: Sequence[ModuleType],
+                     bindings: Sequence[ColumnElement] = ()) -> list:
+    """What the report's data looks like now, cheaply. See the module docstring.
+
+    ``providers`` are the provider packages the report reads — ``src.providers.gwis``
+    — whose ``PROVIDER_NAME`` and ``PROVIDER_PRODUCT`` identify a provider together:
+    NBAC and the NFDB share a name.
+    """
+    fingerprint: list = []
+    for provider in providers:
+        name, product = provider.PROVIDER_NAME, provider.PROVIDER_PRODUCT
+        count, latest = session.execute(
+            select(func.count(), func.max(Wildfire.updated_at))
+            .select_from(Wildfire)
+            .join(DataProvider, DataProvider.id == Wildfire.data_provider_id)
+            .where(DataProvider.name == name, DataProvider.product == product)
+        ).one()
+        fingerprint.append([name, product, count, latest])
+    fingerprint.append(list(session.execute(
+        select(func.count(), func.max(AdminBoundary.updated_at))).one()))
+    for column in bindings:
+        fingerprint.append(list(session.execute(
+            select(func.count(column), func.max(column))).one()))
+    return fingerprint
+
+
+def digest(value: Any) -> str:
+    """A stable hash of a JSON-ready value."""
+    text = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def drawn_on(values: Iterable[Any]) -> list[ModuleType]:
+    """The :data:`CODE_PACKAGE` modules among ``values``, or that they were defined in."""
+    modules = []
+    for value in values:
+        if isinstance(value, ModuleType):
+            name = value.__name__
+        else:
+            name = getattr(value, "__module__", None)
+            if not isinstance(name, str):
+                continue
+        if name == CODE_PACKAGE or name.startswith(f"{CODE_PACKAGE}."):
+            module = sys.modules.get(name)
+            if module is not None:
+                modules.append(module)
+    return modules
+
+
+def project_modules(module: ModuleType,
+                    also: Sequence[ModuleType] = ()) -> list[ModuleType]:
+    """``module``, ``also``, and every :data:`CODE_PACKAGE` module they draw on, by name.
+
+    A module is drawn on when one of its globals is that module or was defined in
+    it — ``from src.apps.statistics import sampling`` and ``from
+    src.apps.imports.common import measure_by_year`` alike — and the walk continues
+    through what those modules draw on in turn.
+    """
+    found = {module.__name__: module}
+    found.update((one.__name__, one) for one in also)
+    pending = list(found.values())
+    while pending:
+        for value in drawn_on(vars(pending.pop()).values()):
+            if value.__name__ not in found:
+                found[value.__name__] = value
+                pending.append(value)
+    return [found[name] for name in sorted(found)]
+
+
+def module_identity(compute: Callable) -> tuple[str, str]:
+    """The report module's importable name and a hash of the code behind its rows.
+
+    The name is the spec's rather than ``__name__``, which is ``"__main__"`` when the
+    report is run with ``python3 -m``. The hash is over the sources of the module and
+    of every module :func:`project_modules` finds it — or ``compute`` itself, through
+    what it closes over — drawing on: a report's figures are as often decided in the
+    shared sampling, engine or import helpers as in its own file.
+    """
+    module = sys.modules[compute.__module__]
+    spec = getattr(module, "__spec__", None)
+    name = spec.name if spec is not None else module.__name__
+    closed_over = [cell.cell_contents
+                   for cell in getattr(compute, "__closure__", None) or ()]
+    source = hashlib.sha256()
+    for one in project_modules(module, drawn_on(closed_over)):
+        path = getattr(one, "__file__", None)
+        source.update(Path(path).read_bytes() if path else b"")
+    return name, source.hexdigest()
+
+
+def entry_path(directory: Path, module: str, arguments_key: str,
+               fingerprint_key: str) -> Path:
+    """The file one entry is kept in."""
+    return directory / module / arguments_key / f"{fingerprint_key}{ENTRY_SUFFIX}"
+
+
+def load(path: Path, logger: logging.Logger) -> list | None:
+    """An entry's rows, or ``None`` if there is none or it cannot be read."""
+    if not path.is_file():
+        return None
+    try:
+        with path.open("rb") as handle:
+            return pickle.load(handle)
+    except Exception as error:  # noqa: BLE001  (any unreadable entry is just a miss)
+        logger.warning("Ignoring the unreadable cached report %s: %s", path, error)
+        return None
+
+
+def store(path: Path, rows: list, logger: logging.Logger) -> None:
+    """Write an entry atomically and remove the ones it supersedes.
+
+    Written to a temporary file in the same directory and renamed over, so that a
+    report interrupted mid-write, or two run at once, never leave half an entry for the
+    next run to read. A cache that cannot be written is a warning: the report itself
+    has been computed and is still written.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        handle, temporary = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(handle, "wb") as stream:
+            pickle.dump(rows, stream, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+        for stale in path.parent.glob(f"*{ENTRY_SUFFIX}"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+    except OSError as error:
+        logger.warning("Could not cache the report in %s: %s", path.parent, error)
+
+
+def cached_compute(session: Session, args: argparse.Namespace,
+                   providers: Sequence[ModuleType],
+                   compute: Callable[[], list[_Row]], logger: logging.Logger,
+                   bindings: Sequence[ColumnElement] = (),
+                   directory: Path | None = None) -> list[_Row]:
+    """The report's rows: from the cache if nothing has changed, computed otherwise.
+
+    ``compute`` is called with no argument and is the report's own computation, in
+    ``session``; it is defined in the report module, which is how the entry knows
+    which module it belongs to. An empty report is never cached — every report treats
+    it as an error, and the likeliest fix is an import, which would miss anyway.
+    """
+    if getattr(args, "no_cache", False):
+        return compute()
+
+    module, source = module_identity(compute)
+    fingerprint = data_fingerprint(session, providers, bindings)
+    url = session.get_bind().url.render_as_string(hide_password=True)
+    path = entry_path(directory or cache_directory(), module,
+                      digest([CACHE_FORMAT, source, url, normalised_arguments(args)]),
+                      digest(fingerprint))
+
+    rows = load(path, logger)
+    if rows is not None:
+        logger.info("Nothing has been imported since this report was last computed; "
+                    "using the cached rows (%s). Pass --no-cache to compute it again",
+                    path)
+        return rows
+
+    rows = compute()
+    if rows:
+        store(path, rows, logger)
+    return rows
@@ -0,0 +1,764 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""A declarative report engine: many reports from one grouped pass over the fires.
+
+Every statistics application under :mod:`src.apps.statistics.wildfires` is the same
+program written again — a ``Row`` dataclass, a ``combine`` for the summary row, a
+``summarise`` that orders the rows, and a ``write_csv`` and ``write_docx`` that differ
+only in their columns — and each one scans the fires for itself. A monthly pack that
+runs a provider's statistics *and* its causes reads the same fires twice, through the
+same joins, to group them two ways.
+
+This module is the shared half. A provider describes itself once, as a
+:class:`Provider`:
+
+* a **source**, a ``SELECT`` with one row per fire and named columns — the joins every
+  report needs, paid for once;
+* its **dimensions**, the columns a report can group on (a country, a season, a
+  cause), with how each is printed;
+* its **measures**, the aggregates a report can print (a count, a sum, a minimum);
+* its **reports**, each a :class:`ReportDefinition` naming which dimensions it groups
+  on and which measures and :class:`Share` columns it prints.
+
+and :func:`compute` answers any number of those reports from **one** statement:
+
+.. code-block:: sql
+
+   SELECT country, season, cause,
+          GROUPING(country, season, cause) AS grouping_mask,
+          count(*) FILTER (WHERE country IS NOT NULL) AS statistics__fires,
+          ...,
+          count(*) AS causes__fires, ...
+   FROM (<source>) AS fires
+   GROUP BY GROUPING SETS ((country, season), (country),
+                           (season, cause), (cause), (season), ())
+
+``GROUPING SETS`` is what lets one pass stand in for several: the database groups the
+same rows by each set in turn, and ``GROUPING()`` says which set a result row came
+from, so a collapsed dimension's ``NULL`` is never confused with a real one. A report's
+detail rows, its summary rows and the denominators of its percentages are just three
+of the sets.
+
+Each report's measures carry that report's own ``FILTER``, so a report that excludes
+the fires in no country and one that counts every fire share the scan without sharing
+the scope.
+
+Reports
+-------
+
+A report's rows are its ``rows`` dimensions, and its summary rows are the same with
+``total_over`` collapsed — every season of a country, every season of a cause. A
+report with a ``block_over`` dimension repeats both with that one collapsed as well,
+in a block of its own: the World block of the worldwide reports, which is every
+country's years and then every country's total. A :class:`Share` is a measure divided
+by the same measure with one dimension collapsed, which is the *cause's share of its
+season* written as grouping sets rather than as a second query — or by another measure
+of the same row, which is the *dated share of the fires*.
+
+Which summary rows are printed follows the reports this engine replaces: a summary of
+a single season repeats that season's row, so it is dropped, either when the whole
+report covers one (:data:`TOTALS_PER_REPORT`) or when its own group does
+(:data:`TOTALS_PER_GROUP`); the burnt-area reports print it regardless
+(:data:`TOTALS_ALWAYS`).
+
+A name is sorted by the database's collation when its dimension is ``collated``,
+which is how the worldwide reports have always ordered their countries: Python
+compares code points and puts Côte d'Ivoire after Cyprus. The rank comes back from
+the grouped statement itself, as a window over its few hundred result rows.
+
+Registering
+-----------
+
+A provider module builds its :class:`Provider` and calls :func:`register`; the runner,
+:mod:`src.apps.statistics.run_reports`, imports the provider modules and reads
+:data:`REGISTRY`. See :mod:`src.apps.statistics.wildfires.chile_conaf.reports` for the
+first provider described this way. Every other provider with a report is described
+the same way, each in a ``reports`` module beside its applications, and each of those
+applications writes through this module when it runs with its defaults. INAB's
+classification report is the one left out: its columns are the values the data in
+scope carries, which a fixed description cannot name.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import logging
+
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Any
+from typing import Callable
+
+from sqlalchemy import ColumnElement
+from sqlalchemy import Select
+from sqlalchemy import and_
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session
+
+#: Label of a dimension collapsed by a summary row.
+TOTAL_LABEL = "Total"
+
+#: The kinds of value a measure yields, which decide how it is printed.
+KIND_COUNT = "count"
+KIND_HECTARES = "hectares"
+KIND_TEXT = "text"
+KINDS = (KIND_COUNT, KIND_HECTARES, KIND_TEXT)
+
+#: A summary row is dropped when the report as a whole covers only one value of the
+#: dimension it collapses — the causes report of one season has no summary block.
+TOTALS_PER_REPORT = "report"
+
+#: A summary row is dropped when its own group has only one detail row — a country
+#: with fires in one season has no summary row, though another country has one.
+TOTALS_PER_GROUP = "group"
+
+#: Every summary row is printed, a year's ``Total`` after that one year included.
+TOTALS_ALWAYS = "always"
+TOTALS = (TOTALS_PER_REPORT, TOTALS_PER_GROUP, TOTALS_ALWAYS)
+
+#: Label of the ``GROUPING()`` bitmask in the grouped statement.
+GROUPING_MASK = "grouping_mask"
+
+#: ``GROUPING()`` takes at most this many arguments in PostgreSQL, because its result
+#: is an ``integer`` with one bit per argument.
+MAX_DIMENSIONS = 31
+
+#: The providers known to the engine, by :attr:`Provider.name`.
+REGISTRY: dict[str, "Provider"] = {}
+
+
+@dataclass(frozen=True)
+class Dimension:
+    """A column a report can group on.
+
+    Attributes
+    ----------
+    name : str
+        The source column's name, and the key of :attr:`ReportRow.keys`.
+    heading : str
+        The column heading in both outputs.
+    label : callable
+        How a value is printed: ``2016`` as ``2016-2017`` for a season. A collapsed
+        dimension is printed as ``total_label`` and never reaches this.
+    total_label : str
+        How a summary row that collapses the dimension prints it: ``World`` for the
+        country of the rows that summarise every country.
+    descending : bool
+        Sort the rows on this dimension newest first, as the burnt-area reports
+        sort their years. For a numeric dimension.
+    collated : bool
+        Sort on this dimension by the database's collation rather than by Python's
+        code points; see the module docstring.
+    """
+
+    name: str
+    heading: str
+    label: Callable[[Any], str] = str
+    total_label: str = TOTAL_LABEL
+    descending: bool = False
+    collated: bool = False
+
+
+@dataclass(frozen=True)
+class Measure:
+    """An aggregate a report can print.
+
+    Attributes
+    ----------
+    name : str
+        The measure's name, and the key of :attr:`ReportRow.values`.
+    heading : str
+        The column heading in both outputs.
+    aggregate : callable
+        Builds the aggregate from the source's columns: ``lambda c: func.sum(c.area)``.
+    kind : str
+        One of :data:`KINDS`.
+    condition : callable or None
+        A ``FILTER`` of the measure's own, on top of the report's: the ``Dated``
+        column counts only the dated fires.
+    default : object or None
+        What an aggregate over no row becomes: ``0.0`` for a sum of hectares, which
+        ``SUM`` would otherwise return as ``NULL``. A minimum over no area stays
+        ``NULL``, because an unknown area is not an area of nought.
+    """
+
+    name: str
+    heading: str
+    aggregate: Callable[[Any], ColumnElement]
+    kind: str = KIND_COUNT
+    condition: Callable[[Any], ColumnElement] | None = None
+    default: Any = None
+
+
+@dataclass(frozen=True)
+class Share:
+    """A measure as a percentage of the same measure with one dimension collapsed, or
+    of another measure of the same row.
+
+    Attributes
+    ----------
+    name : str
+        The column's name in :attr:`ReportRow.values`.
+    heading : str
+        The column heading in both outputs.
+    measure : str
+        The :class:`Measure` divided.
+    over : str or None
+        The :class:`Dimension` the shares add up across: a cause's share of its
+        season's fires is a share ``over`` the cause.
+    of : str or None
+        The :class:`Measure` divided by, in the same row, where ``over`` is not
+        given: the dated fires' share ``of`` the fires. It need not be printed.
+    """
+
+    name: str
+    heading: str
+    measure: str
+    over: str | None = None
+    of: str | None = None
+
+
+@dataclass(frozen=True)
+class ReportDefinition:
+    """One report: what it groups on and what it prints.
+
+    Attributes
+    ----------
+    name : str
+        How the runner's ``--report`` names it, and the suffix of its file names.
+    title : str
+        The Word document's heading.
+    rows : tuple of str
+        The dimensions of a detail row, in column order.
+    columns : tuple of str
+        The measures and shares printed after them, in column order.
+    total_over : str or None
+        The dimension a summary row collapses, or ``None`` for a report without one.
+    totals : str
+        One of :data:`TOTALS`.
+    block_over : str or None
+        A dimension collapsed into a block of summary rows of its own — the detail
+        rows and their summary rows again, over every value of it — or ``None``. The
+        block sorts first: it is the World block.
+    where : callable or None
+        The report's scope, from the source's columns, applied as a ``FILTER`` to each
+        of its measures so that it narrows this report and no other.
+    order : callable or None
+        A sort key over :class:`ReportRow`. By default the rows are sorted on their
+        dimensions in order, each summary row after the detail rows it summarises.
+    notes : tuple of str
+        Paragraphs the Word document prints above the table.
+    options : dict
+        The options of the report's own application that it reproduces, by
+        ``argparse`` destination: ``{"surface": "forest", "min_area": None}``. A run
+        of the application with exactly these is computed and written here (see
+        :func:`covers`); any other is still the application's own.
+    """
+
+    name: str
+    title: str
+    rows: tuple[str, ...]
+    columns: tuple[str, ...]
+    total_over: str | None = None
+    totals: str = TOTALS_PER_REPORT
+    block_over: str | None = None
+    where: Callable[[Any], ColumnElement] | None = None
+    order: Callable[["ReportRow"], Any] | None = None
+    notes: tuple[str, ...] = ()
+    options: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class Provider:
+    """A provider's reports, with everything they are computed from.
+
+    Attributes
+    ----------
+    name : str
+        How the runner's ``--provider`` names it.
+    source : callable
+        ``source(year)`` returns a ``SELECT`` with one row per fire, restricted to one
+        year (or season) when ``year`` is not ``None``, naming every column the
+        dimensions and measures use.
+    dimensions : tuple of Dimension
+        In the order they appear in the grouped statement.
+    measures : tuple of Measure
+    reports : tuple of ReportDefinition
+    shares : tuple of Share
+        The percentage columns the reports may print.
+    tables : tuple of str
+        The tables the source reads, checked before anything is run.
+    """
+
+    name: str
+    source: Callable[[int | None], Select]
+    dimensions: tuple[Dimension, ...]
+    measures: tuple[Measure, ...]
+    reports: tuple[ReportDefinition, ...]
+    shares: tuple[Share, ...] = ()
+    tables: tuple[str, ...] = ()
+
+    def dimension(self, name: str) -> Dimension:
+        return next(one for one in self.dimensions if one.name == name)
+
+    def measure(self, name: str) -> Measure:
+        return next(one for one in self.measures if one.name == name)
+
+    def report(self, name: str) -> ReportDefinition:
+        """The report called ``name``.
+
+        Raises
+        ------
+        ValueError
+            If the provider has no such report.
+        """
+        for one in self.reports:
+            if one.name == name:
+                return one
+        raise ValueError(
+            f"{self.name} has no report {name!r}; expected one of "
+            f"{', '.join(one.name for one in self.reports)}")
+
+    def share(self, name: str) -> Share | None:
+        return next((one for one in self.shares if one.name == name), None)
+
+
+@dataclass(frozen=True)
+class ReportRow:
+    """One line of a report.
+
+    Attributes
+    ----------
+    keys : dict
+        Each of the report's dimensions, ``None`` where a summary row collapses it.
+    values : dict
+        Each of the report's measures and shares. A share is ``None`` where its
+        denominator is zero.
+    is_total : bool
+        Whether this is a summary row.
+    """
+
+    keys: dict[str, Any]
+    values: dict[str, Any]
+    is_total: bool = False
+
+
+def register(provider: Provider) -> Provider:
+    """Add a provider to :data:`REGISTRY`, checking that it is consistent.
+
+    Raises
+    ------
+    ValueError
+        If a report names a dimension, measure or share the provider does not have,
+        a share names neither or both of a dimension and a measure to divide by, or
+        the provider has more dimensions than ``GROUPING()`` can report on.
+    """
+    dimensions = {one.name for one in provider.dimensions}
+    measures = {one.name for one in provider.measures}
+    shares = {one.name: one for one in provider.shares}
+    if len(dimensions) > MAX_DIMENSIONS:
+        raise ValueError(f"{provider.name} has {len(dimensions)} dimensions; GROUPING() "
+                         f"reports on at most {MAX_DIMENSIONS}")
+    for measure in provider.measures:
+        if measure.kind not in KINDS:
+            raise ValueError(f"{provider.name}: measure {measure.name!r} has unknown "
+                             f"kind {measure.kind!r}")
+    for share in provider.shares:
+        if (share.over is None) == (share.of is None):
+            raise ValueError(f"{provider.name}: share {share.name!r} needs exactly one "
+                             f"of a dimension to collapse and a measure to divide by")
+    for report in provider.reports:
+        if report.totals not in TOTALS:
+            raise ValueError(f"{provider.name}: report {report.name!r} has unknown "
+                             f"totals {report.totals!r}")
+        unknown = [name for name in report.rows if name not in dimensions]
+        unknown += [name for name in report.columns
+                    if name not in measures and name not in shares]
+        for over in (report.total_over, report.block_over):
+            if over is not None and over not in report.rows:
+                unknown.append(over)
+        for name in report.columns:
+            share = shares.get(name)
+            if share is None:
+                continue
+            if share.over is not None and share.over not in report.rows:
+                unknown.append(share.over)
+            if share.of is not None and share.of not in measures:
+                unknown.append(share.of)
+        if unknown:
+            raise ValueError(f"{provider.name}: report {report.name!r} names "
+                             f"{', '.join(unknown)}, which it does not group on or "
+                             f"the provider does not define")
+    REGISTRY[provider.name] = provider
+    return provider
+
+
+def grouping_sets(provider: Provider, report: ReportDefinition) -> list[frozenset]:
+    """Every grouping set a report reads, detail rows first.
+
+    The detail set is the report's rows; the summary set is that with
+    :attr:`~ReportDefinition.total_over` collapsed; the block, if there is one, is
+    both of those with :attr:`~ReportDefinition.block_over` collapsed too; and each
+    share adds, for each of those, the set with its :attr:`~Share.over` collapsed,
+    which is where its denominators are. A share ``of`` another measure adds none.
+    """
+    detail = frozenset(report.rows)
+    sets = [detail]
+    if report.total_over is not None:
+        sets.append(detail - {report.total_over})
+    if report.block_over is not None:
+        sets += [one - {report.block_over} for one in list(sets)]
+    for name in report.columns:
+        share = provider.share(name)
+        if share is None or share.over is None:
+            continue
+        for one in list(sets):
+            denominator = one - {share.over}
+            if denominator not in sets:
+                sets.append(denominator)
+    return sets
+
+
+def grouping_mask(dimensions: list[str], grouped: frozenset) -> int:
+    """What ``GROUPING(*dimensions)`` returns on a row of the set ``grouped``.
+
+    The leftmost argument is the most significant bit, and a bit is set where that
+    dimension is **collapsed** — which is PostgreSQL's definition, and why a set of
+    every dimension is ``0``.
+    """
+    width = len(dimensions)
+    return sum(1 << (width - 1 - index)
+               for index, name in enumerate(dimensions) if name not in grouped)
+
+
+def pass_dimensions(provider: Provider, reports: list[ReportDefinition]) -> list[str]:
+    """The dimensions the grouped statement needs, in the provider's order."""
+    wanted = {name for report in reports for name in report.rows}
+    return [one.name for one in provider.dimensions if one.name in wanted]
+
+
+def measure_label(report: ReportDefinition, measure: str) -> str:
+    """A measure's column in the grouped statement, which is per report."""
+    return f"{report.name}__{measure}"
+
+
+def rank_label(dimension: str) -> str:
+    """A collated dimension's rank in the grouped statement, shared by every report."""
+    return f"{dimension}__rank"
+
+
+def report_measures(provider: Provider, report: ReportDefinition) -> list[str]:
+    """The measures a report's columns need, including the shares' numerators and the
+    measures a share ``of`` divides by."""
+    names: list[str] = []
+    for name in report.columns:
+        share = provider.share(name)
+        needed = [name] if share is None else [share.measure] + (
+            [share.of] if share.of is not None else [])
+        names += [one for one in needed if one not in names]
+    return names
+
+
+def grouped_query(provider: Provider, reports: list[ReportDefinition],
+                  year: int | None = None) -> Select:
+    """Build the one statement that answers every report in ``reports``.
+
+    Notes
+    -----
+    The source is a subquery so that its joins are written once and every report's
+    expressions are over the same named columns. Each report's measures are labelled
+    :func:`measure_label` and carry its :attr:`~ReportDefinition.where` as a
+    ``FILTER``: that is what lets reports with different scopes share a scan, at the
+    price of a result row per grouping set that some of them ignore. Those rows are a
+    few hundred; the scan they save is the whole archive.
+    """
+    fires = provider.source(year).subquery("fires")
+    dimensions = pass_dimensions(provider, reports)
+    columns = [fires.c[name] for name in dimensions]
+
+    selected = list(columns)
+    selected.append(func.grouping(*columns).label(GROUPING_MASK))
+    selected += [func.dense_rank().over(order_by=fires.c[name]).label(rank_label(name))
+                 for name in dimensions if provider.dimension(name).collated]
+    sets: list[frozenset] = []
+    for report in reports:
+        for one in grouping_sets(provider, report):
+            if one not in sets:
+                sets.append(one)
+        for name in report_measures(provider, report):
+            measure = provider.measure(name)
+            aggregate = measure.aggregate(fires.c)
+            conditions = []
+            if report.where is not None:
+                conditions.append(report.where(fires.c))
+            if measure.condition is not None:
+                conditions.append(measure.condition(fires.c))
+            if conditions:
+                aggregate = aggregate.filter(and_(*conditions))
+            if measure.default is not None:
+                aggregate = func.coalesce(aggregate, measure.default)
+            selected.append(aggregate.label(measure_label(report, name)))
+
+    return (select(*selected)
+            .group_by(func.grouping_sets(
+                *(tuple_(*(fires.c[name] for name in dimensions if name in one))
+                  for one in sets))))
+
+
+def default_order(provider: Provider, report: ReportDefinition,
+                  ranks: dict[str, dict[Any, int]] | None = None
+                  ) -> Callable[[ReportRow], tuple]:
+    """Sort on the report's dimensions in order, a summary row after its details and
+    the block before everything else.
+
+    ``ranks`` holds, for each collated dimension, each value's place in the
+    database's order; a value missing from it sorts last.
+    """
+    ranks = ranks or {}
+
+    def key(row: ReportRow) -> tuple:
+        parts: list = []
+        for name in report.rows:
+            value = row.keys[name]
+            dimension = provider.dimension(name)
+            collapsed = value is None
+            if name == report.block_over:
+                collapsed = not collapsed
+            if value is None:
+                value = 0
+            elif name in ranks:
+                value = ranks[name].get(value, len(ranks[name]))
+            parts += [collapsed, -value if dimension.descending else value]
+        return tuple(parts)
+    return key
+
+
+def assemble(provider: Provider, report: ReportDefinition, dimensions: list[str],
+             results: list) -> list[ReportRow]:
+    """One report's rows from the grouped statement's result.
+
+    A detail or summary row whose counts are all zero is dropped: it is a group the
+    report's ``FILTER`` emptied — the fires in no country, under a report of
+    countries — and not a group with no fires in it.
+
+    ``results`` are the grouped statement's rows as mappings, every report's together;
+    a report reads the ones whose ``GROUPING()`` mask is one of its own sets'.
+    """
+    by_set: dict[frozenset, dict[tuple, Any]] = {}
+    sets = grouping_sets(provider, report)
+    masks = {grouping_mask(dimensions, one): one for one in sets}
+    collated = [name for name in report.rows if provider.dimension(name).collated]
+    ranks: dict[str, dict[Any, int]] = {name: {} for name in collated}
+    for result in results:
+        for name in collated:
+            if result[name] is not None:
+                ranks[name][result[name]] = result[rank_label(name)]
+        grouped = masks.get(result[GROUPING_MASK])
+        if grouped is None:
+            continue
+        key = tuple(result[name] for name in dimensions if name in grouped)
+        by_set.setdefault(grouped, {})[key] = result
+
+    measures = report_measures(provider, report)
+    counts = [name for name in measures if provider.measure(name).kind == KIND_COUNT]
+    # A numeric column sums to a Decimal; the rows hold floats, as every report did.
+    hectares = [name for name in measures
+                if provider.measure(name).kind == KIND_HECTARES]
+
+    def build(grouped: frozenset, is_total: bool) -> list[ReportRow]:
+        rows = []
+        for key, result in by_set.get(grouped, {}).items():
+            values = {name: result[measure_label(report, name)]
+                      for name in measures}
+            for name in hectares:
+                if values[name] is not None:
+                    values[name] = float(values[name])
+            if counts and not any(values[name] for name in counts):
+                continue
+            keyed = dict(zip((name for name in dimensions if name in grouped), key))
+            for name in report.columns:
+                share = provider.share(name)
+                if share is None:
+                    continue
+                if share.of is not None:
+                    whole = values[share.of]
+                    values[name] = (None if not whole else
+                                    100.0 * float(values[share.measure]) / float(whole))
+                    continue
+                below = grouped - {share.over}
+                denominator_key = tuple(keyed[one] for one in dimensions if one in below)
+                denominator = by_set.get(below, {}).get(denominator_key)
+                total = (None if denominator is None
+                         else denominator[measure_label(report, share.measure)])
+                values[name] = (None if not total
+                                else 100.0 * float(values[share.measure]) / float(total))
+            rows.append(ReportRow(
+                keys={name: keyed.get(name) for name in report.rows},
+                values={name: values[name] for name in report.columns},
+                is_total=is_total))
+        return rows
+
+    def summarised(detail_set: frozenset, is_total: bool) -> list[ReportRow]:
+        """The detail rows of a set, and the summary rows :attr:`totals` keeps."""
+        rows = build(detail_set, is_total)
+        if report.total_over is None:
+            return rows
+        summary = build(detail_set - {report.total_over}, True)
+        if report.totals == TOTALS_PER_GROUP:
+            others = [name for name in report.rows if name != report.total_over]
+            sizes: dict[tuple, int] = {}
+            for row in rows:
+                group = tuple(row.keys[name] for name in others)
+                sizes[group] = sizes.get(group, 0) + 1
+            summary = [row for row in summary
+                       if sizes.get(tuple(row.keys[name] for name in others), 0) > 1]
+        elif (report.totals == TOTALS_PER_REPORT
+              and len({row.keys[report.total_over] for row in rows}) <= 1):
+            summary = []
+        return rows + summary
+
+    detail_set = frozenset(report.rows)
+    rows = summarised(detail_set, False)
+    if report.block_over is not None:
+        rows += summarised(detail_set - {report.block_over}, True)
+    return sorted(rows, key=report.order or default_order(provider, report, ranks))
+
+
+def compute(session: Session, provider: Provider, names: list[str] | None,
+            year: int | None, logger: logging.Logger) -> dict[str, list[ReportRow]]:
+    """Compute the named reports (every one, by default) in one pass.
+
+    Returns
+    -------
+    dict
+        Each report's rows, by report name, in the order the reports were asked for.
+    """
+    reports = [provider.report(name) for name in names] if names else list(
+        provider.reports)
+    logger.info("Computing %s from one pass over %s",
+                ", ".join(report.name for report in reports), provider.name)
+    results = session.execute(grouped_query(provider, reports, year)).mappings().all()
+    dimensions = pass_dimensions(provider, reports)
+    computed = {report.name: assemble(provider, report, dimensions, results)
+                for report in reports}
+    for name, rows in computed.items():
+        if not rows:
+            logger.warning("%s: no fire in scope", name)
+    return computed
+
+
+def covers(report: ReportDefinition, args: argparse.Namespace) -> bool:
+    """Whether an application run with ``args`` is the report as described here.
+
+    Every option in :attr:`~ReportDefinition.options` has to hold its value; an
+    option the application does not have is taken to hold it.
+    """
+    return all(getattr(args, name, value) == value
+               for name, value in report.options.items())
+
+
+def compute_one(session: Session, provider: Provider, name: str, year: int | None,
+                logger: logging.Logger) -> list[ReportRow]:
+    """One report's rows: :func:`compute` for an application that runs one report."""
+    return compute(session, provider, [name], year, logger)[name]
+
+
+def headings(provider: Provider, report: ReportDefinition) -> list[str]:
+    """The report's column headings, for both writers."""
+    columns = [provider.dimension(name).heading for name in report.rows]
+    for name in report.columns:
+        share = provider.share(name)
+        columns.append(share.heading if share is not None
+                       else provider.measure(name).heading)
+    return columns
+
+
+def cells(provider: Provider, report: ReportDefinition, row: ReportRow,
+          separators: bool) -> list[str]:
+    """A row's cells as text, with thousands separators for the Word document only."""
+    values = [provider.dimension(name).total_label if row.keys[name] is None
+              else provider.dimension(name).label(row.keys[name])
+              for name in report.rows]
+    comma = "," if separators else ""
+    for name in report.columns:
+        value = row.values[name]
+        share = provider.share(name)
+        if share is not None:
+            values.append("" if value is None else f"{value:.2f}")
+            continue
+        kind = provider.measure(name).kind
+        if kind == KIND_TEXT:
+            values.append(value or "")
+        elif value is None:
+            values.append("")
+        elif kind == KIND_COUNT:
+            values.append(f"{value:{comma}}")
+        else:
+            values.append(f"{float(value):{comma}.2f}")
+    return values
+
+
+def write_csv(provider: Provider, report: ReportDefinition, rows: list[ReportRow],
+              path: Path, logger: logging.Logger) -> None:
+    """Write one report as CSV, bare numbers and no thousands separators."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(headings(provider, report))
+        for row in rows:
+            writer.writerow(cells(provider, report, row, separators=False))
+    logger.info("Wrote %s", path)
+
+
+def write_docx(provider: Provider, report: ReportDefinition, rows: list[ReportRow],
+               path: Path, logger: logging.Logger) -> None:
+    """Write one report as a Word document, its summary rows in bold."""
+    # Imported here rather than at module scope so that --csv keeps working if
+    # python-docx is not installed.
+    from docx import Document
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.shared import Pt
+
+    document = Document()
+    document.add_heading(report.title, level=1)
+    for note in report.notes:
+        document.add_paragraph(note)
+
+    columns = headings(provider, report)
+    first_numeric = len(report.rows)
+    table = document.add_table(rows=1, cols=len(columns))
+    table.style = "Table Grid"
+    for cell, heading in zip(table.rows[0].cells, columns):
+        cell.text = heading
+        cell.paragraphs[0].runs[0].bold = True
+
+    text_columns = {first_numeric + index for index, name in enumerate(report.columns)
+                    if provider.share(name) is None
+                    and provider.measure(name).kind == KIND_TEXT}
+    for row in rows:
+        for index, (cell, value) in enumerate(zip(
+                table.add_row().cells, cells(provider, report, row, separators=True))):
+            cell.text = value
+            paragraph = cell.paragraphs[0]
+            if index >= first_numeric and index not in text_columns:
+                paragraph.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+            for run in paragraph.runs:
+                run.bold = row.is_total
+                run.font.size = Pt(9)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document.save(str(path))
+    logger.info("Wrote %s", path)
+
+
+def write(provider: Provider, report: ReportDefinition, rows: list[ReportRow],
+          csv_path: Path | None, docx_path: Path | None, logger: logging.Logger) -> None:
+    """Write one report where an application's ``--csv`` and ``--docx`` ask."""
+    if csv_path:
+        write_csv(provider, report, rows, csv_path, logger)
+    if docx_path:
+        write_docx(provider, report, rows, docx_path, logger)
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Run several of a provider's reports from one pass over its fires.
+
+Usage
+-----
+
+.. code-block:: console
+
+   $ python3 -m src.apps.statistics.run_reports --provider chile_conaf \\
+         --output-dir /tmp/conaf --csv --docx
+   $ python3 -m src.apps.statistics.run_reports --provider chile_conaf \\
+         --report causes -y 2023 --output-dir /tmp/conaf --csv
+
+Each report is written to ``<output-dir>/<provider>-<report>.csv`` and, or,
+``.docx``. Every report asked for is computed by
+:func:`src.apps.statistics.engine.compute` from the same grouped statement, so the
+monthly pack's statistics and causes cost one scan of the archive rather than one
+each.
+
+Every provider with a report is here — see :data:`PROVIDER_MODULES` — and each
+report is the one its application writes when run with its defaults. The options the
+engine's reports do not have stay with those applications, and so does INAB's
+classification report, whose columns are only known once the data has been read.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+
+from pathlib import Path
+
+from sqlalchemy import Engine
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+import src.settings  # noqa: F401  (imported for the side effect of loading .env)
+
+from src.apps.imports import common
+from src.apps.statistics import engine as report_engine
+# Imported for the side effect of registering their provider with the engine.
+from src.apps.statistics.wildfires.andalusia_rediam import (
+    reports as andalusia_rediam_reports)
+from src.apps.statistics.wildfires.canada_nbac import reports as canada_nbac_reports
+from src.apps.statistics.wildfires.canada_nfdb import reports as canada_nfdb_reports
+from src.apps.statistics.wildfires.catalonia_darpa import (
+    reports as catalonia_darpa_reports)
+from src.apps.statistics.wildfires.chile_conaf import reports as chile_conaf_reports
+from src.apps.statistics.wildfires.chile_conaf_magnitud import (
+    reports as chile_conaf_magnitud_reports)
+from src.apps.statistics.wildfires.gfa import reports as gfa_reports
+from src.apps.statistics.wildfires.greece_ffa import reports as greece_ffa_reports
+from src.apps.statistics.wildfires.guatemala_inab import reports as guatemala_inab_reports
+from src.apps.statistics.wildfires.gwis import reports as gwis_reports
+from src.apps.statistics.wildfires.mexico_conafor import reports as mexico_conafor_reports
+from src.apps.statistics.wildfires.portugal_icnf import reports as portugal_icnf_reports
+from src.apps.statistics.wildfires.spain_egif import reports as spain_egif_reports
+
+LOG_FORMAT = "%(asctime)s %(levelname)-8s %(message)s"
+
+#: The modules that register a provider, by the provider's name.
+PROVIDER_MODULES = {
+    andalusia_rediam_reports.PROVIDER_NAME: andalusia_rediam_reports,
+    canada_nbac_reports.PROVIDER_NAME: canada_nbac_reports,
+    canada_nfdb_reports.PROVIDER_NAME: canada_nfdb_reports,
+    catalonia_darpa_reports.PROVIDER_NAME: catalonia_darpa_reports,
+    chile_conaf_reports.PROVIDER_NAME: chile_conaf_reports,
+    chile_conaf_magnitud_reports.PROVIDER_NAME: chile_conaf_magnitud_reports,
+    gfa_reports.PROVIDER_NAME: gfa_reports,
+    greece_ffa_reports.PROVIDER_NAME: greece_ffa_reports,
+    guatemala_inab_reports.PROVIDER_NAME: guatemala_inab_reports,
+    gwis_reports.PROVIDER_NAME: gwis_reports,
+    mexico_conafor_reports.PROVIDER_NAME: mexico_conafor_reports,
+    portugal_icnf_reports.PROVIDER_NAME: portugal_icnf_reports,
+    spain_egif_reports.PROVIDER_NAME: spain_egif_reports,
+}
+
+
+def output_path(directory: Path, provider: str, report: str, suffix: str) -> Path:
+    """Where one report is written."""
+    return directory / f"{provider}-{report}{suffix}"
+
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(
+        description="Run several of a provider's reports from one pass over its fires.",
+        epilog="Each report is written to OUTPUT_DIR/PROVIDER-REPORT.csv or .docx. "
+               "Database settings not given here are read from the environment (.env).",
+    )
+    parser.add_argument("--provider", required=True,
+                        choices=sorted(report_engine.REGISTRY),
+                        help="the provider whose reports to run")
+    parser.add_argument("--report", action="append", dest="reports", metavar="NAME",
+                        help="run this report; repeat for several (default: every "
+                             "report the provider has)")
+    parser.add_argument("-y", "--year", type=int, metavar="YEAR",
+                        help="report only this year, or the season starting in it")
+
+    output = parser.add_argument_group("output")
+    output.add_argument("-o", "--output-dir", type=Path, required=True,
+                        help="directory the reports are written to")
+    output.add_argument("--csv", action="store_true", help="write each report as .csv")
+    output.add_argument("--docx", action="store_true",
+                        help="write each report as .docx")
+
+    common.add_database_arguments(parser)
+    parser.add_argument("--log-level", default=os.getenv("GISFIRE_LOG_LEVEL", "INFO"),
+                        choices=["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"],
+                        help="verbosity (env: GISFIRE_LOG_LEVEL, default INFO)")
+
+    args = parser.parse_args(argv)
+    if not args.csv and not args.docx:
+        parser.error("at least one of --csv and --docx is required")
+    provider = report_engine.REGISTRY[args.provider]
+    for name in args.reports or []:
+        try:
+            provider.report(name)
+        except ValueError as error:
+            parser.error(str(error))
+    return args
+
+
+def run(args: argparse.Namespace, engine: Engine,
+        logger: logging.Logger) -> dict[str, list[report_engine.ReportRow]]:
+    """Compute and write every report asked for."""
+    provider = report_engine.REGISTRY[args.provider]
+    common.require_tables(engine, list(provider.tables), logger)
+    with Session(engine) as session:
+        computed = report_engine.compute(session, provider, args.reports, args.year,
+                                         logger)
+    for name, rows in computed.items():
+        if not rows:
+            continue
+        report = provider.report(name)
+        if args.csv:
+            report_engine.write_csv(provider, report, rows, output_path(
+                args.output_dir, provider.name, name, ".csv"), logger)
+        if args.docx:
+            report_engine.write_docx(provider, report, rows, output_path(
+                args.output_dir, provider.name, name, ".docx"), logger)
+    return computed
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_arguments(argv)
+    logging.basicConfig(level=args.log_level, format=LOG_FORMAT)
+    logger = logging.getLogger("run-reports")
+
+    try:
+        settings = common.resolve_database_settings(args)
+    except RuntimeError as error:
+        logger.error("%s", error)
+        return 1
+
+    engine = create_engine(common.database_url(settings))
+    try:
+        run(args, engine, logger)
+    except Exception as error:  # noqa: BLE001  (the CLI boundary: report, do not traceback)
+        logger.error("Reports failed: %s", error)
+        return 1
+    finally:
+        engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Approximate statistics reports, estimated from a sample of the fires.
+
+An exact GWIS report measures twenty million fires and takes the better part of half an
+hour under ``--country-source geometry``; an exact NBAC one measures every perimeter's
+area. Neither is something to run again after each change of ``--country`` or ``--year``
+while exploring. ``--sample PERCENT`` runs the same aggregate over a ``TABLESAMPLE`` of
+the provider's fires and reports what the whole would be, with how far off it may be::
+
+    python3 -m src.apps.statistics.wildfires.gwis.wildfire_statistics \\
+        --sample 2 --country Spain --csv spain-preview.csv
+
+Every figure of such a report is labelled as what it is: the counts and the totals are
+**estimates** with a 95% confidence interval beside them, and the minimum and the
+maximum are the smallest and largest fire **observed in the sample** — bounds rather
+than estimates, since the true smallest fire can only be smaller and the true largest
+only larger.
+
+How the sample is drawn
+-----------------------
+
+From the provider's own table — ``gwis_wildfire``, ``nbac_wildfire`` — which is narrow,
+one row per fire, and joined to ``wildfire`` by key. The sampled fires are joined to
+everything else, so the expensive part of a report, the point-in-polygon test or the
+area, is paid for the sampled fires alone.
+
+``--sample-method`` chooses between PostgreSQL's two methods:
+
+``bernoulli`` (the default)
+    Each fire is kept with probability ``PERCENT / 100``, independently. The table is
+    still read from end to end, but it is the narrow one, and nothing else is.
+``system``
+    Each **page** of the table is kept with that probability, with every fire on it.
+    Only the pages kept are read, so it is the faster of the two, and the noisier: fires
+    imported together sit on the same pages, and a page is kept or dropped whole.
+
+How the figures are estimated
+-----------------------------
+
+Both methods keep each *unit* — a fire under ``bernoulli``, a page under ``system`` —
+independently with probability ``f``. A count or a total over the sample, divided by
+``f``, is then an unbiased estimate of the count or the total over everything (the
+Horvitz-Thompson estimator), and its variance is estimated from the sample as
+
+.. code-block:: text
+
+   Var = (1 - f) / f² · Σ tᵤ²
+
+where ``tᵤ`` is the unit's own count or total. That is why each report aggregates in two
+steps when it samples — per unit, then per row — and why ``system`` does not understate
+its own noise: its units are pages, and a page of large fires counts as one large unit.
+The interval printed is ``± 1.96 √Var``.
+
+A summary row — a country's ``Total``, the World block — adds its rows' estimates and
+their variances. Under ``bernoulli`` the rows are independent and that is exact; under
+``system`` a page holding fires of two rows makes them slightly correlated, and the
+summary's interval is then an approximation. Each year is a statement of its own and so
+a draw of its own unless ``--sample-seed`` is given, which makes a preview repeatable —
+and cacheable: a preview without a seed is never answered from the
+:mod:`report cache <src.apps.statistics.cache>`, which would hand back the last draw.
+
+What it cannot do
+-----------------
+
+A row the sample holds no fire of is not in the report, so a small country's year can be
+missing from a preview where the exact report has it. A row with only a handful of
+sampled fires has an interval as wide as it is honest. Neither is a fault: a preview is
+for iterating on filters, and the figures to quote come from the report run without
+``--sample``.
+
+The interval of a **total** is optimistic when few fires are sampled. Burnt areas are
+heavily skewed — a handful of fires make most of a year's hectares — and a sample that
+missed them both underestimates the total and, not having seen them, underestimates its
+own variance. Drawn from a lognormal population as skewed as a fire year, a 5% sample of
+four thousand fires covers the true total about 86 times in 100 rather than 95. The
+interval of a count has no such tail to miss.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+
+from dataclasses import dataclass
+from typing import Iterable
+from typing import Mapping
+from typing import Sequence
+
+from sqlalchemy import ColumnElement
+from sqlalchemy import Select
+from sqlalchemy import Subquery
+from sqlalchemy import Table
+from sqlalchemy import func
+from sqlalchemy import literal
+from sqlalchemy import literal_column
+from sqlalchemy import select
+from sqlalchemy import tablesample
+
+#: The two ``TABLESAMPLE`` methods PostgreSQL ships, as ``--sample-method`` accepts them.
+SAMPLE_METHOD_BERNOULLI = "bernoulli"
+SAMPLE_METHOD_SYSTEM = "system"
+SAMPLE_METHODS = (SAMPLE_METHOD_BERNOULLI, SAMPLE_METHOD_SYSTEM)
+
+#: The normal quantile of a two-sided 95% interval.
+Z_95 = 1.959963984540054
+
+#: Name of the column holding the unit a sampled fire was drawn in.
+UNIT = "sample_unit"
+
+#: The unit each method draws, as SQL over the sampled table.
+#:
+#: A page for ``system``: the block number out of the row's ``ctid``, which PostgreSQL
+#: prints as ``(block,offset)`` and has no function to take apart — hence the detour
+#: through ``point``. Unqualified, because the statement it is in reads one table.
+UNITS = {
+    SAMPLE_METHOD_BERNOULLI: None,
+    SAMPLE_METHOD_SYSTEM: literal_column("(ctid::text::point)[0]::bigint"),
+}
+
+#: The shared columns of a sampled report, in place of
+#: ``("Country", "Year", "Fires", "Minimum (ha)", "Maximum (ha)", "Total (ha)")``.
+#:
+#: Each estimate is followed by its margin, and the words "estimate" and "observed"
+#: are in the headings, so that a preview pasted into a spreadsheet still says what it
+#: is without the document around it.
+ESTIMATED_COLUMNS = ("Country", "Year", "Fires (estimate)", "Fires (± 95%)",
+                     "Minimum (ha, observed)", "Maximum (ha, observed)",
+                     "Total (ha, estimate)", "Total (ha, ± 95%)")
+
+
+@dataclass(frozen=True)
+class Sample:
+    """How a report's fires are sampled.
+
+    Attributes
+    ----------
+    percent : float
+        The share of the units kept, strictly between 0 and 100.
+    method : str
+        One of :data:`SAMPLE_METHODS`.
+    seed : int or None
+        Passed to ``REPEATABLE``, so that the same rows are drawn run after run; ``None``
+        draws afresh every statement.
+    """
+
+    percent: float
+    method: str = SAMPLE_METHOD_BERNOULLI
+    seed: int | None = None
+
+    @property
+    def fraction(self) -> float:
+        """The probability of a unit being kept."""
+        return self.percent / 100.0
+
+    @property
+    def description(self) -> str:
+        """The sample in words, for the log and the Word document."""
+        unit = "fires" if self.method == SAMPLE_METHOD_BERNOULLI else "table pages"
+        seed = "" if self.seed is None else f", seed {self.seed}"
+        return f"a {self.percent:g}% sample of the {unit} ({self.method}{seed})"
+
+
+@dataclass(frozen=True)
+class Estimate:
+    """A figure estimated from a sample, with the half-width of its 95% interval."""
+
+    value: float
+    margin: float
+
+
+def percent(text: str) -> float:
+    """Argparse type for ``--sample``: a percentage strictly between 0 and 100.
+
+    Raises
+    ------
+    argparse.ArgumentTypeError
+        If the text is not a number, or is not above 0 and below 100.
+
+    Notes
+    -----
+    100 is refused rather than accepted as "everything": a full sample is the exact
+    report, run the slow way and labelled as an estimate, and leaving ``--sample`` out is
+    what asks for it.
+    """
+    try:
+        value = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{text!r} is not a percentage")
+    if not math.isfinite(value) or not 0 < value < 100:
+        raise argparse.ArgumentTypeError(
+            f"a sample is more than 0% and less than 100% of the fires, and {text} is "
+            f"not: leave --sample out for the exact report"
+        )
+    return value
+
+
+def add_sample_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add ``--sample``, ``--sample-method`` and ``--sample-seed`` to a report."""
+    group = parser.add_argument_group(
+        "preview", "estimate the report from a sample of the fires instead of measuring "
+                   "every one; every figure is then labelled as an estimate")
+    group.add_argument("--sample", type=percent, default=None, metavar="PERCENT",
+                       help="measure this percentage of the fires (e.g. 1) and scale the "
+                            "counts and totals up, each with a 95%% confidence interval; "
+                            "minimum and maximum are those observed in the sample")
+    group.add_argument("--sample-method", default=SAMPLE_METHOD_BERNOULLI,
+                       choices=SAMPLE_METHODS,
+                       help="'bernoulli' (default) keeps each fire independently; "
+                            "'system' keeps whole table pages, which is faster and noisier")
+    group.add_argument("--sample-seed", type=int, default=None,
+                       help="draw the same sample every run (TABLESAMPLE ... REPEATABLE)")
+
+
+def from_arguments(args: argparse.Namespace) -> Sample | None:
+    """The sample the command line asks for, or ``None`` for the exact report."""
+    if getattr(args, "sample", None) is None:
+        return None
+    return Sample(args.sample, args.sample_method, args.sample_seed)
+
+
+def drawn(table: Table, sample: Sample) -> Subquery:
+    """The keys of ``table``'s sampled rows, each with the unit it was drawn in.
+
+    Returns
+    -------
+    Subquery
+        Columns ``id`` and :data:`UNIT`, to be joined to ``wildfire`` on ``id``.
+
+    Notes
+    -----
+    A subquery joined by key, rather than the sampled table put in the original's place,
+    so that every expression a report has already built over the provider's table — its
+    year, its scope, its published areas — still refers to a table in the statement.
+    """
+    method = func.bernoulli if sample.method == SAMPLE_METHOD_BERNOULLI else func.system
+    sampled = tablesample(table, method(sample.percent), name=f"{table.name}_drawn",
+                          seed=None if sample.seed is None else literal(sample.seed))
+    unit = UNITS[sample.method]
+    return (
+        select(sampled.c.id, (sampled.c.id if unit is None else unit).label(UNIT))
+        .subquery(f"{table.name}_sample")
+    )
+
+
+def estimate_query(fire: Subquery, keys: Sequence[str],
+                   counts: Mapping[str, ColumnElement | None],
+                   conditions: Iterable[ColumnElement] = ()) -> Select:
+    """Aggregate a sampled ``fire`` subquery per unit, then per row of the report.
+
+    Parameters
+    ----------
+    fire : Subquery
+        One row per sampled fire, with the ``keys``, ``hectares`` and :data:`UNIT`.
+    keys : sequence of str
+        The columns a row of the report is grouped by, e.g. ``["country"]``.
+    counts : mapping
+        The counts to estimate, by name, each with the condition a fire has to meet to
+        be counted or ``None`` for every fire: ``{"fires": None}``.
+    conditions : iterable of ColumnElement
+        Conditions on ``fire`` selecting the fires the figures are computed from.
+
+    Returns
+    -------
+    Select
+        The ``keys``, ``minimum``, ``maximum``, ``total`` and ``total_squares``, and per
+        count its sum and its ``_squares``: everything :func:`estimate` needs.
+    """
+    grouping = [fire.c[key] for key in keys] + [fire.c[UNIT]]
+    per_unit = (
+        select(
+            *grouping,
+            func.min(fire.c.hectares).label("minimum"),
+            func.max(fire.c.hectares).label("maximum"),
+            func.sum(fire.c.hectares).label("total"),
+            *[(func.count() if condition is None else func.count().filter(condition))
+              .label(name) for name, condition in counts.items()],
+        )
+        .where(*conditions)
+        .group_by(*grouping)
+        .subquery("unit")
+    )
+    squares = []
+    for name in counts:
+        squares += [func.sum(per_unit.c[name]).label(name),
+                    func.sum(per_unit.c[name] * per_unit.c[name]).label(f"{name}_squares")]
+    return (
+        select(
+            *[per_unit.c[key] for key in keys],
+            func.min(per_unit.c.minimum).label("minimum"),
+            func.max(per_unit.c.maximum).label("maximum"),
+            func.sum(per_unit.c.total).label("total"),
+            func.sum(per_unit.c.total * per_unit.c.total).label("total_squares"),
+            *squares,
+        )
+        .group_by(*[per_unit.c[key] for key in keys])
+    )
+
+
+def estimate(observed: float, squares: float, sample: Sample) -> Estimate:
+    """The whole's count or total, from the sample's and its units' sum of squares."""
+    fraction = sample.fraction
+    variance = (1.0 - fraction) / (fraction * fraction) * float(squares)
+    return Estimate(float(observed) / fraction, Z_95 * math.sqrt(variance))
+
+
+def combined_margin(margins: Iterable[float | None]) -> float | None:
+    """The margin of a sum of estimates, or ``None`` if any of them is exact.
+
+    The variances add, and a margin is a fixed multiple of a standard deviation, so the
+    margin of the sum is the root of the sum of the squared margins.
+    """
+    margins = list(margins)
+    if any(margin is None for margin in margins):
+        return None
+    return math.sqrt(math.fsum(margin * margin for margin in margins))
@@ -211,11 +211,9 @@ import sys
 from dataclasses import dataclass
 from pathlib import Path
 
-from geoalchemy2 import Geography
 from sqlalchemy import ColumnElement
 from sqlalchemy import Engine
 from sqlalchemy import Select
-from sqlalchemy import cast
 from sqlalchemy import create_engine
 from sqlalchemy import func
 from sqlalchemy import literal
@@ -226,7 +224,10 @@ from sqlalchemy.orm import Session
 import src.settings  # noqa: F401  (imported for the side effect of loading .env)
 
 from src.apps.imports import common
+from src.apps.statistics import cache
+from src.apps.statistics import engine as report_engine
 from src.data_model.wildfire import Wildfire
+from src.providers import andalusia_rediam
 from src.providers.andalusia_rediam.wildfire import RediamWildfire
 
 #: Label used in the ``Year`` column for the summary row.
@@ -346,17 +347,13 @@ def burnt_area(surface: str = SURFACE_MEASURED,
 
     The measured area is always computed from the EPSG:4326 perimeter on the parent
     ``wildfire`` row, never from the published EPSG:25830 copy — see the module
-    docstring for why the service's own grid is not an option here. The geodesic cast
-    carries the geometry type and SRID rather than being a bare ``Geography()``: that
-    renders as ``geography(GEOMETRY,-1)``, which PostGIS rejects.
+    docstring for why the service's own grid is not an option here.
     """
     fire = RediamWildfire.__table__.c
 
     if surface == SURFACE_MEASURED:
         if method == AREA_METHOD_GEODESIC:
-            square_metres = func.ST_Area(
-                cast(Wildfire.perimeter, Geography(geometry_type="MULTIPOLYGON", srid=4326))
-            )
+            square_metres = Wildfire.perimeter_area_m2
         elif method == AREA_METHOD_EQUAL_AREA:
             square_metres = func.ST_Area(
                 func.ST_Transform(Wildfire.perimeter, EQUAL_AREA_SRID))
@@ -797,6 +794,8 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument("--country", help=argparse.SUPPRESS)
     parser.add_argument("--country-source", help=argparse.SUPPRESS)
 
+    cache.add_cache_arguments(parser)
+
     output = parser.add_argument_group("output", "at least one is required")
     output.add_argument("--csv", type=Path, help="write the report to this .csv")
     output.add_argument("--docx", type=Path, help="write the report to this .docx (MS Word)")
@@ -998,12 +997,31 @@ def write_docx(rows: list[Row], path: Path, year: int | None,
     logger.info("Wrote %s", path)
 
 
-def report(args: argparse.Namespace, engine: Engine, logger: logging.Logger) -> list[Row]:
-    """Compute the statistics and write whichever outputs were asked for."""
+def report(args: argparse.Namespace, engine: Engine,
+           logger: logging.Logger) -> list[Row] | list[report_engine.ReportRow]:
+    """Compute the statistics and write whichever outputs were asked for.
+
+    Run with the options of the ``statistics`` report of
+    :mod:`~src.apps.statistics.wildfires.andalusia_rediam.reports` — the defaults — it
+    is that report: computed and written by :mod:`src.apps.statistics.engine`, and
+    returned as its rows. Any other option is computed and written here.
+    """
+    # Imported here: the description is built from this module's expressions.
+    from src.apps.statistics.wildfires.andalusia_rediam import reports
+    described = reports.PROVIDER.report("statistics")
+    covered = report_engine.covers(described, args)
     method = args.area_method or AREA_METHOD_GEODESIC
     with Session(engine) as session:
-        rows = compute(session, args.year, logger, args.surface, method, args.min_area,
-                       args.min_confidence)
+        if covered:
+            def run() -> list[report_engine.ReportRow]:
+                return report_engine.compute_one(session, reports.PROVIDER,
+                                                 described.name, args.year, logger)
+        else:
+            def run() -> list[Row]:
+                return compute(session, args.year, logger, args.surface, method,
+                               args.min_area, args.min_confidence)
+        rows = cache.cached_compute(session, args, [andalusia_rediam], run, logger,
+                                    bindings=[RediamWildfire.matched_at])
 
     if not rows:
         # An empty report is almost always a year with no data, and writing an empty
@@ -1017,11 +1035,14 @@ def report(args: argparse.Namespace, engine: Engine, logger: logging.Logger) ->
             f"2008." + threshold
         )
 
-    if args.csv is not None:
-        write_csv(rows, args.csv, logger)
-    if args.docx is not None:
-        write_docx(rows, args.docx, args.year, logger, args.surface, method,
-                   args.min_area, args.min_confidence)
+    if covered:
+        report_engine.write(reports.PROVIDER, described, rows, args.csv, args.docx, logger)
+    else:
+        if args.csv is not None:
+            write_csv(rows, args.csv, logger)
+        if args.docx is not None:
+            write_docx(rows, args.docx, args.year, logger, args.surface, method,
+                       args.min_area, args.min_confidence)
     return rows
 
 
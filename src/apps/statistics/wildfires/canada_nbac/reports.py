@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""NBAC's burnt-area and cause reports, described for the shared report engine.
+
+:mod:`~src.apps.statistics.wildfires.canada_nbac.wildfire_statistics` and
+:mod:`~src.apps.statistics.wildfires.canada_nbac.wildfire_causes` are companions over
+the same fires and the same years, each scanning the archive once per year. Described
+here as one :class:`~src.apps.statistics.engine.Provider`, the two are answered by
+:mod:`src.apps.statistics.run_reports` from a single grouped pass, and print the same
+rows — the tests hold them to it.
+
+What the engine does not have is those applications' options. These are the reports
+as they run by default: the measured geodesic area (``--surface measured``), every
+fire (no ``--min-area`` or ``--cause``), the prescribed burns excluded, and the
+natural fires counted by cause. Run with those defaults, each application computes
+and writes its report through the engine; a report needing any other option is still
+computed by its own application.
+
+The source
+----------
+
+One row per fire, with everything either report asks of it. The two do not count the
+same fires: the statistics report counts the fires with a measured perimeter, and the
+causes report every fire, its hectares being the published ``POLY_HA``. So the source
+keeps every fire and each report's ``FILTER`` narrows it.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import Select
+from sqlalchemy import func
+from sqlalchemy import literal
+from sqlalchemy import select
+
+from src.apps.statistics import engine
+from src.apps.statistics.wildfires.canada_nbac.wildfire_causes import COUNTABLE_CAUSES
+from src.apps.statistics.wildfires.canada_nbac.wildfire_causes import DEFAULT_CAUSE
+from src.apps.statistics.wildfires.canada_nbac.wildfire_causes import DETERMINED_CAUSES
+from src.apps.statistics.wildfires.canada_nbac.wildfire_causes import columns
+from src.apps.statistics.wildfires.canada_nbac.wildfire_statistics import COUNTRY_NAME
+from src.apps.statistics.wildfires.canada_nbac.wildfire_statistics import PUBLISHED_YEAR
+from src.apps.statistics.wildfires.canada_nbac.wildfire_statistics import SURFACE_MEASURED
+from src.apps.statistics.wildfires.canada_nbac.wildfire_statistics import burnt_area
+from src.apps.statistics.wildfires.canada_nbac.wildfire_statistics import is_dated
+from src.data_model.wildfire import Wildfire
+from src.providers.canada_nbac.wildfire import NbacWildfire
+
+#: How :mod:`src.apps.statistics.run_reports` names this provider.
+PROVIDER_NAME = "canada_nbac"
+
+#: The causes report's headings, which name the cause counted.
+CAUSE_HEADINGS = columns(DEFAULT_CAUSE)
+
+
+def source(year: int | None) -> Select:
+    """Every NBAC fire, or one published year's, with the columns both reports read."""
+    nbac = NbacWildfire.__table__
+    hectares, measured = burnt_area(SURFACE_MEASURED)
+
+    query = (
+        select(
+            literal(COUNTRY_NAME).label("country"),
+            PUBLISHED_YEAR.label("year"),
+            hectares.label("area"),
+            measured.label("measured"),
+            is_dated().label("dated"),
+            nbac.c.prescribed.label("prescribed"),
+            nbac.c.fire_cause.label("cause"),
+            nbac.c.area_ha_polygon.label("polygon"),
+        )
+        .select_from(Wildfire)
+        .join(nbac, nbac.c.id == Wildfire.id)
+    )
+    if year is not None:
+        query = query.where(PUBLISHED_YEAR == year)
+    return query
+
+
+PROVIDER = engine.register(engine.Provider(
+    name=PROVIDER_NAME,
+    source=source,
+    dimensions=(
+        engine.Dimension("country", "Country"),
+        engine.Dimension("year", "Year", descending=True),
+    ),
+    measures=(
+        engine.Measure("fires", "Fires", lambda c: func.count()),
+        engine.Measure("minimum", "Minimum (ha)", lambda c: func.min(c.area),
+                       kind=engine.KIND_HECTARES),
+        engine.Measure("maximum", "Maximum (ha)", lambda c: func.max(c.area),
+                       kind=engine.KIND_HECTARES),
+        engine.Measure("total", "Total (ha)", lambda c: func.sum(c.area),
+                       kind=engine.KIND_HECTARES, default=0.0),
+        engine.Measure("dated", "Dated", lambda c: func.count(),
+                       condition=lambda c: c.dated),
+        engine.Measure("determined", "Determined", lambda c: func.count(),
+                       condition=lambda c: c.cause.in_(DETERMINED_CAUSES)),
+        engine.Measure("natural", CAUSE_HEADINGS[4], lambda c: func.count(),
+                       condition=lambda c: c.cause == COUNTABLE_CAUSES[DEFAULT_CAUSE]),
+        engine.Measure("natural_ha", CAUSE_HEADINGS[6], lambda c: func.sum(c.polygon),
+                       kind=engine.KIND_HECTARES, default=0.0,
+                       condition=lambda c: c.cause == COUNTABLE_CAUSES[DEFAULT_CAUSE]),
+        engine.Measure("determined_ha", "Determined (ha)", lambda c: func.sum(c.polygon),
+                       kind=engine.KIND_HECTARES, default=0.0,
+                       condition=lambda c: c.cause.in_(DETERMINED_CAUSES)),
+    ),
+    shares=(
+        engine.Share("dated_percent", "Dated (%)", "dated", of="fires"),
+        engine.Share("natural_percent", CAUSE_HEADINGS[5], "natural", of="determined"),
+        engine.Share("natural_ha_percent", CAUSE_HEADINGS[7], "natural_ha",
+                     of="determined_ha"),
+    ),
+    reports=(
+        engine.ReportDefinition(
+            name="statistics",
+            title=f"NBAC wildfire burnt area ({COUNTRY_NAME})",
+            rows=("country", "year"),
+            columns=("fires", "minimum", "maximum", "total", "dated", "dated_percent"),
+            total_over="year",
+            totals=engine.TOTALS_ALWAYS,
+            where=lambda c: c.measured & ~c.prescribed,
+            notes=(
+                "Areas in hectares, measured geodesically on the WGS84 ellipsoid from "
+                "each fire's perimeter. A fire is one published GID and not one "
+                "polygon. Years are the published YEAR. Prescribed burns are excluded.",
+                "Dated counts the fires whose start came from a published date rather "
+                "than from the year alone. It is a column and not a filter: an undated "
+                "fire still contributes its hectares.",
+            ),
+            options={"surface": SURFACE_MEASURED, "area_method": None, "min_area": None,
+                     "cause": None, "include_prescribed": False, "sample": None},
+        ),
+        engine.ReportDefinition(
+            name="causes",
+            title=f"NBAC wildfires by cause ({COUNTRY_NAME})",
+            rows=("country", "year"),
+            columns=("fires", "determined", "natural", "natural_percent", "natural_ha",
+                     "natural_ha_percent"),
+            total_over="year",
+            totals=engine.TOTALS_ALWAYS,
+            where=lambda c: ~c.prescribed,
+            notes=(
+                "Counts of the fires whose published FIRECAUS is "
+                f"{COUNTABLE_CAUSES[DEFAULT_CAUSE]}, and the area they burnt as the "
+                "service reports it (POLY_HA). Both percentages are of the fires with "
+                "a determined cause. Years are the published YEAR. Prescribed burns "
+                "are excluded.",
+                "NBAC publishes no lightning category. "
+                f"{COUNTABLE_CAUSES[DEFAULT_CAUSE]} is the nearest it comes, and in "
+                "the Canadian boreal it is dominated by lightning.",
+            ),
+            options={"cause": DEFAULT_CAUSE, "include_prescribed": False},
+        ),
+    ),
+    tables=("wildfire", "nbac_wildfire"),
+))
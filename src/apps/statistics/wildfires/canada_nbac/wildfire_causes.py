@@ -179,6 +179,7 @@ from sqlalchemy.orm import Session
 import src.settings  # noqa: F401  (imported for the side effect of loading .env)
 
 from src.apps.imports import common
+from src.apps.statistics import engine as report_engine
 from src.apps.statistics.wildfires.canada_nbac.wildfire_statistics import COUNTRY_NAME
 from src.apps.statistics.wildfires.canada_nbac.wildfire_statistics import (
     FIRST_NUMERIC_COLUMN,
@@ -639,10 +640,26 @@ def write_docx(rows: list[Row], path: Path, year: int | None,
     logger.info("Wrote %s", path)
 
 
-def report(args: argparse.Namespace, engine: Engine, logger: logging.Logger) -> list[Row]:
-    """Count the causes and write whichever outputs were asked for."""
+def report(args: argparse.Namespace, engine: Engine,
+           logger: logging.Logger) -> list[Row] | list[report_engine.ReportRow]:
+    """Count the causes and write whichever outputs were asked for.
+
+    Run with the options of the ``causes`` report of
+    :mod:`~src.apps.statistics.wildfires.canada_nbac.reports` — the defaults — it is
+    that report: computed and written by :mod:`src.apps.statistics.engine`, and
+    returned as its rows. Any other option is counted and written here.
+    """
+    # Imported here: the description is built from this module's expressions.
+    from src.apps.statistics.wildfires.canada_nbac import reports
+    described = reports.PROVIDER.report("causes")
+    covered = report_engine.covers(described, args)
     with Session(engine) as session:
-        rows = compute(session, args.year, logger, args.cause, args.include_prescribed)
+        if covered:
+            rows = report_engine.compute_one(session, reports.PROVIDER, described.name,
+                                             args.year, logger)
+        else:
+            rows = compute(session, args.year, logger, args.cause,
+                           args.include_prescribed)
 
     if not rows:
         raise RuntimeError(
@@ -651,11 +668,14 @@ def report(args: argparse.Namespace, engine: Engine, logger: logging.Logger) ->
             f"{canada_nbac.FIRST_YEAR}."
         )
 
-    if args.csv is not None:
-        write_csv(rows, args.csv, logger, args.cause)
-    if args.docx is not None:
-        write_docx(rows, args.docx, args.year, logger, args.cause,
-                   args.include_prescribed)
+    if covered:
+        report_engine.write(reports.PROVIDER, described, rows, args.csv, args.docx, logger)
+    else:
+        if args.csv is not None:
+            write_csv(rows, args.csv, logger, args.cause)
+        if args.docx is not None:
+            write_docx(rows, args.docx, args.year, logger, args.cause,
+                       args.include_prescribed)
     return rows
 
 
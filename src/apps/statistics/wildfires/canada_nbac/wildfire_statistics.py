@@ -247,7 +247,22 @@ five datasets.
 Nothing about the figures changes. ``count``, ``sum``, ``min`` and ``max`` all
 decompose over a partition of the fires, so the ``Total`` row is exactly the number
 one pass would have returned, from the same rows. Every statement runs in one
-transaction and so against one snapshot.
+``REPEATABLE READ`` transaction and so against one snapshot — with ``--jobs N``,
+which measures N years at once on connections of their own, too: each imports the
+report's snapshot (``SET TRANSACTION SNAPSHOT``) before it measures anything.
+
+A preview from a sample
+-----------------------
+
+``--sample PERCENT`` measures that share of the fires, drawn with ``TABLESAMPLE`` from
+``nbac_wildfire``, and scales ``Fires``, ``Total (ha)`` and ``Dated`` up, each followed
+by its 95% confidence interval; ``Minimum`` and ``Maximum`` are the smallest and largest
+sampled fire, and ``Dated (%)`` is the sample's own share, the scale cancelling out of
+it. Every heading says which figures are estimates. See
+:mod:`src.apps.statistics.sampling` for how they are estimated — and note that at
+fifty-odd thousand fires a small sample of a single year is a few dozen perimeters,
+whose interval is wide and says so. A preview is cached only with ``--sample-seed``:
+without one, each run is a draw of its own and is computed again.
 """
 
 from __future__ import annotations
@@ -262,11 +277,9 @@ import sys
 from dataclasses import dataclass
 from pathlib import Path
 
-from geoalchemy2 import Geography
 from sqlalchemy import ColumnElement
 from sqlalchemy import Engine
 from sqlalchemy import Select
-from sqlalchemy import cast
 from sqlalchemy import create_engine
 from sqlalchemy import func
 from sqlalchemy import literal
@@ -276,6 +289,9 @@ from sqlalchemy.orm import Session
 import src.settings  # noqa: F401  (imported for the side effect of loading .env)
 
 from src.apps.imports import common
+from src.apps.statistics import cache
+from src.apps.statistics import engine as report_engine
+from src.apps.statistics import sampling
 from src.data_model.wildfire import Wildfire
 from src.providers import canada_nbac
 from src.providers.canada_nbac.wildfire import NbacWildfire
@@ -292,6 +308,12 @@ SHARED_COLUMNS = ("Country", "Year", "Fires", "Minimum (ha)", "Maximum (ha)", "T
 #: how many of the year's fires carry a real published date, and that as a share.
 COLUMNS = SHARED_COLUMNS + ("Dated", "Dated (%)")
 
+#: The columns of a report estimated from a sample: the shared estimate columns, then
+#: the dated count with its margin. The share needs none of its own being a ratio of
+#: two counts from the same sample, in which the scaling cancels.
+ESTIMATED_COLUMNS = sampling.ESTIMATED_COLUMNS + ("Dated (estimate)", "Dated (± 95%)",
+                                                  "Dated (%)")
+
 #: Index of the first column that holds a number, and so is right-aligned in the Word
 #: table.
 FIRST_NUMERIC_COLUMN = 2
@@ -397,18 +419,13 @@ def burnt_area(surface: str = SURFACE_MEASURED,
 
     The measured area is always computed from the EPSG:4326 perimeter on the parent
     ``wildfire`` row, never from the published EPSG:3978 copy — see the module
-    docstring for why the service's own grid is not an option. The geodesic cast
-    carries the geometry type and SRID rather than being a bare ``Geography()``: that
-    renders as ``geography(GEOMETRY,-1)``, which PostGIS rejects, because -1 is not a
-    SRID it knows.
+    docstring for why the service's own grid is not an option.
     """
     fire = NbacWildfire.__table__.c
 
     if surface == SURFACE_MEASURED:
         if method == AREA_METHOD_GEODESIC:
-            square_metres = func.ST_Area(
-                cast(Wildfire.perimeter, Geography(geometry_type="MULTIPOLYGON", srid=4326))
-            )
+            square_metres = Wildfire.perimeter_area_m2
         elif method == AREA_METHOD_EQUAL_AREA:
             square_metres = func.ST_Area(
                 func.ST_Transform(Wildfire.perimeter, EQUAL_AREA_SRID))
@@ -568,7 +585,8 @@ def statistics_query(year: int,
                      method: str = AREA_METHOD_GEODESIC,
                      min_area: float | None = None,
                      include_prescribed: bool = False,
-                     cause: str | None = None) -> Select:
+                     cause: str | None = None,
+                     sample: sampling.Sample | None = None) -> Select:
     """Build the statistics query for one year.
 
     Parameters
@@ -585,12 +603,17 @@ def statistics_query(year: int,
         Count the prescribed burns as wildfires.
     cause : str, optional
         Restrict to one ``FIRECAUS`` value.
+    sample : Sample, optional
+        Measure a sample of the fires rather than every one of them.
 
     Returns
     -------
     Select
         A query yielding at most one row, ``country, minimum, maximum, total, fires,
         dated``. The summary row and the report's order are :func:`summarise`'s work.
+        With a ``sample`` the figures are the sample's, and ``total_squares``,
+        ``fires_squares`` and ``dated_squares`` come with them for
+        :func:`sampling.estimate <src.apps.statistics.sampling.estimate>`.
 
     Notes
     -----
@@ -635,8 +658,16 @@ def statistics_query(year: int,
     )
     for condition in scope_conditions(include_prescribed, cause):
         fires = fires.where(condition)
+    if sample is not None:
+        drawn = sampling.drawn(nbac, sample)
+        fires = fires.join(drawn, drawn.c.id == Wildfire.id) \
+            .add_columns(drawn.c[sampling.UNIT])
 
     fire = fires.subquery("fire")
+    if sample is not None:
+        return sampling.estimate_query(
+            fire, ["country"], {"fires": None, "dated": fire.c.dated},
+            [] if min_area is None else [fire.c.hectares >= min_area])
     statistics = (
         select(
             fire.c.country,
@@ -713,6 +744,10 @@ class Row:
         How many of those ``fires`` carry a real published date rather than being
         dated to 1 January of their year. Always at most ``fires``: it is counted over
         the same rows.
+    fires_margin, total_margin, dated_margin : float or None
+        The half-width of the 95% confidence interval of ``fires``, ``total`` and
+        ``dated`` when the row is estimated from a sample, ``None`` when it is exact.
+        An estimated row's ``minimum`` and ``maximum`` are those of the sampled fires.
     """
 
     country: str
@@ -722,6 +757,9 @@ class Row:
     total: float
     fires: int
     dated: int
+    fires_margin: float | None = None
+    total_margin: float | None = None
+    dated_margin: float | None = None
 
     @property
     def is_total(self) -> bool:
@@ -737,9 +775,24 @@ class Row:
         """``dated`` as a percentage of ``fires``: how much of the year has a real date."""
         return share(self.dated, self.fires)
 
+    @property
+    def is_estimate(self) -> bool:
+        """Whether the row was estimated from a sample rather than measured."""
+        return self.total_margin is not None
+
     @property
     def values(self) -> tuple[str, ...]:
-        """The row as the CSV writes it, in :data:`COLUMNS` order."""
+        """The row as the CSV writes it, in :data:`COLUMNS` order.
+
+        Or in :data:`ESTIMATED_COLUMNS` order for an estimate, each count and the total
+        followed by its margin.
+        """
+        if self.is_estimate:
+            return (self.country, self.year_label, str(self.fires),
+                    f"{self.fires_margin:.0f}", f"{self.minimum:.2f}",
+                    f"{self.maximum:.2f}", f"{self.total:.2f}", f"{self.total_margin:.2f}",
+                    str(self.dated), f"{self.dated_margin:.0f}",
+                    share_label(self.dated, self.fires))
         return (self.country, self.year_label, str(self.fires),
                 f"{self.minimum:.2f}", f"{self.maximum:.2f}", f"{self.total:.2f}",
                 str(self.dated), share_label(self.dated, self.fires))
@@ -747,11 +800,44 @@ class Row:
     @property
     def readable_values(self) -> tuple[str, ...]:
         """The row as the Word document writes it: the numbers with separators."""
+        if self.is_estimate:
+            return (self.country, self.year_label, f"{self.fires:,}",
+                    f"{self.fires_margin:,.0f}", f"{self.minimum:,.2f}",
+                    f"{self.maximum:,.2f}", f"{self.total:,.2f}",
+                    f"{self.total_margin:,.2f}", f"{self.dated:,}",
+                    f"{self.dated_margin:,.0f}", share_label(self.dated, self.fires))
         return (self.country, self.year_label, f"{self.fires:,}",
                 f"{self.minimum:,.2f}", f"{self.maximum:,.2f}", f"{self.total:,.2f}",
                 f"{self.dated:,}", share_label(self.dated, self.fires))
 
 
+def measured_row(record, year: int, sample: sampling.Sample | None = None) -> Row:
+    """One row of a year's statement as a :class:`Row`, scaled up if it was sampled.
+
+    The counts are rounded to whole fires and their margins kept as they are; the
+    minimum and maximum are taken as observed, being bounds and not estimates.
+    """
+    if sample is None:
+        return Row(country=record.country, year=year,
+                   minimum=float(record.minimum),
+                   maximum=float(record.maximum),
+                   total=float(record.total),
+                   fires=record.fires,
+                   dated=record.dated)
+    fires = sampling.estimate(record.fires, record.fires_squares, sample)
+    total = sampling.estimate(record.total, record.total_squares, sample)
+    dated = sampling.estimate(record.dated, record.dated_squares, sample)
+    return Row(country=record.country, year=year,
+               minimum=float(record.minimum),
+               maximum=float(record.maximum),
+               total=total.value,
+               fires=round(fires.value),
+               dated=round(dated.value),
+               fires_margin=fires.margin,
+               total_margin=total.margin,
+               dated_margin=dated.margin)
+
+
 def combine(rows: list[Row], country: str = COUNTRY_NAME, year: int | None = None) -> Row:
     """One row summarising several: every figure taken over all of them.
 
@@ -769,6 +855,9 @@ def combine(rows: list[Row], country: str = COUNTRY_NAME, year: int | None = Non
 
     ``fsum`` rather than ``sum``: an exact accumulation over a handful of partial
     totals costs nothing and cannot drift from what one pass would have returned.
+
+    Estimates add the same way, and so do their variances: the margins are combined by
+    :func:`~src.apps.statistics.sampling.combined_margin`.
     """
     return Row(
         country=country,
@@ -778,6 +867,9 @@ def combine(rows: list[Row], country: str = COUNTRY_NAME, year: int | None = Non
         total=math.fsum(row.total for row in rows),
         fires=sum(row.fires for row in rows),
         dated=sum(row.dated for row in rows),
+        fires_margin=sampling.combined_margin(row.fires_margin for row in rows),
+        total_margin=sampling.combined_margin(row.total_margin for row in rows),
+        dated_margin=sampling.combined_margin(row.dated_margin for row in rows),
     )
 
 
@@ -887,6 +979,12 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument("--country", help=argparse.SUPPRESS)
     parser.add_argument("--country-source", help=argparse.SUPPRESS)
 
+    common.add_snapshot_jobs_arguments(parser)
+
+    sampling.add_sample_arguments(parser)
+
+    cache.add_cache_arguments(parser)
+
     output = parser.add_argument_group("output", "at least one is required")
     output.add_argument("--csv", type=Path, help="write the report to this .csv")
     output.add_argument("--docx", type=Path, help="write the report to this .docx (MS Word)")
@@ -927,7 +1025,9 @@ def compute(session: Session, year: int | None, logger: logging.Logger,
             method: str = AREA_METHOD_GEODESIC,
             min_area: float | None = None,
             include_prescribed: bool = False,
-            cause: str | None = None) -> list[Row]:
+            cause: str | None = None,
+            jobs: int = 1,
+            sample: sampling.Sample | None = None) -> list[Row]:
     """Measure the fires a year at a time, returning the report's rows in order.
 
     Notes
@@ -936,15 +1036,19 @@ def compute(session: Session, year: int | None, logger: logging.Logger,
     spinner of its own so that a long run says which year it is on rather than only
     that it is alive.
 
-    Every one of them runs in ``session``'s transaction, and so against a single
-    snapshot: a report assembled from many queries is then exactly as consistent as
-    one assembled from a single query, and an import running alongside it cannot have
-    a fire counted in one year's statement and not in another's.
+    Every one of them reads ``session``'s snapshot, ``jobs`` years at a time (see
+    :func:`~src.apps.imports.common.measure_by_year`): a report assembled from many
+    queries is then exactly as consistent as one assembled from a single query, and
+    an import running alongside it cannot have a fire counted in one year's statement
+    and not in another's.
 
     The dated fires are logged as well as reported, because the shape of that number
     is one of the first things anyone should know about this dataset: a ``Dated``
     column at a quarter in the 1970s is not a broken import, it is an archive whose
     early years were compiled from imagery long after the fact.
+
+    With ``sample`` each year's statement measures a sample of the fires and the rows
+    are estimates — see :mod:`src.apps.statistics.sampling`.
     """
     if year is not None:
         years = [year]
@@ -954,22 +1058,22 @@ def compute(session: Session, year: int | None, logger: logging.Logger,
             years = list(session.scalars(years_query(include_prescribed, cause)))
 
     scope = "every cause" if cause is None else f"{cause} fires"
-    measured: list[Row] = []
-    for index, measuring in enumerate(years, start=1):
-        with common.Spinner(f"Measuring the burnt area of the {COUNTRY_NAME} perimeters "
-                            f"({surface}, {scope}, {measuring}: {index} of {len(years)})",
-                            logger):
-            measured += [
-                Row(country=record.country, year=measuring,
-                    minimum=float(record.minimum),
-                    maximum=float(record.maximum),
-                    total=float(record.total),
-                    fires=record.fires,
-                    dated=record.dated)
-                for record in session.execute(
-                    statistics_query(measuring, surface, method, min_area,
-                                     include_prescribed, cause))
-            ]
+    if sample is not None:
+        logger.warning("Estimating from %s: every count and total is an estimate",
+                       sample.description)
+
+    def measure_year(worker: Session, measuring: int) -> list[Row]:
+        return [
+            measured_row(record, measuring, sample)
+            for record in worker.execute(
+                statistics_query(measuring, surface, method, min_area,
+                                 include_prescribed, cause, sample))
+        ]
+
+    measured = common.measure_by_year(
+        session, years, measure_year, jobs,
+        f"Measuring the burnt area of the {COUNTRY_NAME} perimeters", f"{surface}, {scope}",
+        logger)
 
     excluded = 0 if include_prescribed else prescribed_count(session, year, cause)
 
@@ -990,6 +1094,11 @@ def compute(session: Session, year: int | None, logger: logging.Logger,
     return rows
 
 
+def columns(rows: list[Row]) -> tuple[str, ...]:
+    """The headings: :data:`COLUMNS`, or :data:`ESTIMATED_COLUMNS` for estimates."""
+    return ESTIMATED_COLUMNS if any(row.is_estimate for row in rows) else COLUMNS
+
+
 def write_csv(rows: list[Row], path: Path, logger: logging.Logger) -> None:
     """Write the report as CSV.
 
@@ -1000,7 +1109,7 @@ def write_csv(rows: list[Row], path: Path, logger: logging.Logger) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", newline="", encoding="utf-8") as handle:
         writer = csv.writer(handle)
-        writer.writerow(COLUMNS)
+        writer.writerow(columns(rows))
         for row in rows:
             writer.writerow(row.values)
     logger.info("Wrote %s", path)
@@ -1012,7 +1121,8 @@ def write_docx(rows: list[Row], path: Path, year: int | None,
                method: str = AREA_METHOD_GEODESIC,
                min_area: float | None = None,
                include_prescribed: bool = False,
-               cause: str | None = None) -> None:
+               cause: str | None = None,
+               sample: sampling.Sample | None = None) -> None:
     """Write the report as a Word document.
 
     One table, with the summary row in bold. Numbers get thousands separators here —
@@ -1032,7 +1142,8 @@ def write_docx(rows: list[Row], path: Path, year: int | None,
     from docx.shared import Pt
 
     document = Document()
-    document.add_heading(f"NBAC wildfire burnt area ({COUNTRY_NAME})", level=1)
+    document.add_heading(f"NBAC wildfire burnt area ({COUNTRY_NAME})"
+                         + (" — estimate" if sample is not None else ""), level=1)
 
     scope = [f"year: {year}" if year is not None else "all years"]
     if cause is not None:
@@ -1071,10 +1182,19 @@ def write_docx(rows: list[Row], path: Path, year: int | None,
             f"are 80% Undetermined and 2017 and 2018 barely 2%, so a trend across the "
             f"archive is partly a trend in reporting."
         )
+    if sample is not None:
+        document.add_paragraph(
+            f"An estimate from {sample.description}, not a measurement. Fires, Total and "
+            f"Dated are scaled up from the sample and each is followed by the half-width "
+            f"of its 95% confidence interval; the minimum and maximum are the smallest "
+            f"and largest fire in the sample, so the true ones are no larger and no "
+            f"smaller respectively. A year with no sampled fire is missing."
+        )
 
-    table = document.add_table(rows=1, cols=len(COLUMNS))
+    headings = columns(rows)
+    table = document.add_table(rows=1, cols=len(headings))
     table.style = "Table Grid"
-    for cell, heading in zip(table.rows[0].cells, COLUMNS):
+    for cell, heading in zip(table.rows[0].cells, headings):
         cell.text = heading
         cell.paragraphs[0].runs[0].bold = True
 
@@ -1094,14 +1214,44 @@ def write_docx(rows: list[Row], path: Path, year: int | None,
     logger.info("Wrote %s", path)
 
 
-def report(args: argparse.Namespace, engine: Engine, logger: logging.Logger) -> list[Row]:
-    """Compute the statistics and write whichever outputs were asked for."""
+def report(args: argparse.Namespace, engine: Engine,
+           logger: logging.Logger) -> list[Row] | list[report_engine.ReportRow]:
+    """Compute the statistics and write whichever outputs were asked for.
+
+    Run with the options of the ``statistics`` report of
+    :mod:`~src.apps.statistics.wildfires.canada_nbac.reports` — the defaults — it is
+    that report: computed in one statement and written by
+    :mod:`src.apps.statistics.engine`, and returned as its rows. Any other option is
+    measured a year at a time here.
+    """
+    # Imported here: the description is built from this module's expressions.
+    from src.apps.statistics.wildfires.canada_nbac import reports
+    described = reports.PROVIDER.report("statistics")
+    covered = report_engine.covers(described, args)
     # No spinner here: compute runs one statement per year and turns one of its own
     # for each, which is the only honest place to say how far along it is.
     method = args.area_method or AREA_METHOD_GEODESIC
-    with Session(engine) as session:
-        rows = compute(session, args.year, logger, args.surface, method, args.min_area,
-                       args.include_prescribed, args.cause)
+    sample = sampling.from_arguments(args)
+    if covered:
+        with Session(engine) as session:
+            rows = cache.cached_compute(
+                session, args, [canada_nbac],
+                lambda: report_engine.compute_one(session, reports.PROVIDER, described.name,
+                                                  args.year, logger),
+                logger)
+    else:
+        with common.snapshot_session(engine) as session:
+            def run() -> list[Row]:
+                return compute(session, args.year, logger, args.surface, method,
+                               args.min_area, args.include_prescribed, args.cause,
+                               args.jobs, sample)
+
+            # A sample without --sample-seed is a fresh draw each run, and answering it
+            # from the cache would repeat the last draw instead.
+            if sample is not None and sample.seed is None:
+                rows = run()
+            else:
+                rows = cache.cached_compute(session, args, [canada_nbac], run, logger)
 
     if not rows:
         # An empty report is almost always a year with no data, and writing an empty
@@ -1117,11 +1267,14 @@ def report(args: argparse.Namespace, engine: Engine, logger: logging.Logger) ->
             f"{canada_nbac.FIRST_YEAR}." + extra
         )
 
-    if args.csv is not None:
-        write_csv(rows, args.csv, logger)
-    if args.docx is not None:
-        write_docx(rows, args.docx, args.year, logger, args.surface, method,
-                   args.min_area, args.include_prescribed, args.cause)
+    if covered:
+        report_engine.write(reports.PROVIDER, described, rows, args.csv, args.docx, logger)
+    else:
+        if args.csv is not None:
+            write_csv(rows, args.csv, logger)
+        if args.docx is not None:
+            write_docx(rows, args.docx, args.year, logger, args.surface, method,
+                       args.min_area, args.include_prescribed, args.cause, sample)
     return rows
 
 
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""NFDB's burnt-area and cause reports, described for the shared report engine.
+
+:mod:`~src.apps.statistics.wildfires.canada_nfdb.wildfire_statistics` and
+:mod:`~src.apps.statistics.wildfires.canada_nfdb.wildfire_causes` are companions over
+the same agency reports, each testing every published point against the country
+polygons once per year. Described here as one
+:class:`~src.apps.statistics.engine.Provider`, the two are answered by
+:mod:`src.apps.statistics.run_reports` from a single grouped pass, and print the same
+rows — the tests hold them to it.
+
+What the engine does not have is those applications' options. These are the reports
+as they run by default: the country by the point's containment (``--country-source
+geometry``), every agency (no ``--agency``), every fire and every size (no
+``--cause`` or ``--min-area``), the declared prescribed burns excluded, and the
+natural fires counted by cause. Run that way, each application computes and writes
+its report through the engine; with any other option, it still does so itself.
+
+The source
+----------
+
+One row per fire in scope, with the country its point is in, its published year, its
+reported hectares, its agency and its cause. The point test is the statistics
+application's own, joined inner as it is there, so a coordinate in the sea is in
+neither report. The statistics report also leaves out the fires that report no size,
+as its application does, and the causes report counts them; that is its ``FILTER``.
+
+The geometry default is kept in one statement, where the GWIS and GFA descriptions
+read the stored country: these are half a million points, each found in one
+``LATERAL`` lookup against the cut country pieces, and it was twenty million
+perimeters that did not fit.
+
+``Agencies`` is a ``count(DISTINCT ...)`` in every grouping set, which is the union
+the application's ``combine`` takes for its summary row: thirteen agencies over fifty
+years are thirteen, in one statement as in fifty.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import Select
+from sqlalchemy import func
+from sqlalchemy import select
+
+from src.apps.statistics import engine
+from src.apps.statistics.wildfires.canada_nfdb.wildfire_causes import CAUSE_LABELS
+from src.apps.statistics.wildfires.canada_nfdb.wildfire_causes import COUNTABLE_CAUSES
+from src.apps.statistics.wildfires.canada_nfdb.wildfire_causes import DEFAULT_CAUSE
+from src.apps.statistics.wildfires.canada_nfdb.wildfire_causes import DETERMINED_CAUSES
+from src.apps.statistics.wildfires.canada_nfdb.wildfire_causes import columns
+from src.apps.statistics.wildfires.canada_nfdb.wildfire_statistics import AGENCY
+from src.apps.statistics.wildfires.canada_nfdb.wildfire_statistics import COUNTRY_NAME
+from src.apps.statistics.wildfires.canada_nfdb.wildfire_statistics import (
+    COUNTRY_SOURCE_GEOMETRY)
+from src.apps.statistics.wildfires.canada_nfdb.wildfire_statistics import PUBLISHED_YEAR
+from src.apps.statistics.wildfires.canada_nfdb.wildfire_statistics import SIZE_HA
+from src.apps.statistics.wildfires.canada_nfdb.wildfire_statistics import country_columns
+from src.apps.statistics.wildfires.canada_nfdb.wildfire_statistics import scope_conditions
+from src.providers import canada_nfdb
+from src.providers.canada_nfdb.wildfire import NfdbWildfire
+
+#: How :mod:`src.apps.statistics.run_reports` names this provider.
+PROVIDER_NAME = "canada_nfdb"
+
+#: The causes report's headings, which name the cause counted.
+CAUSE_HEADINGS = columns(DEFAULT_CAUSE)
+
+
+def source(year: int | None) -> Select:
+    """Every NFDB fire in scope, or one published year's, with what both reports read."""
+    nfdb = NfdbWildfire.__table__
+    country_name, joins = country_columns(COUNTRY_SOURCE_GEOMETRY)
+
+    query = (
+        select(
+            country_name.label("country"),
+            PUBLISHED_YEAR.label("year"),
+            SIZE_HA.label("area"),
+            AGENCY.label("agency"),
+            nfdb.c.fire_cause.label("cause"),
+        )
+        .select_from(nfdb)
+        .where(PUBLISHED_YEAR.is_not(None))
+    )
+    for target, condition in joins:
+        query = query.join(target, condition)
+    for condition in scope_conditions():
+        query = query.where(condition)
+    if year is not None:
+        query = query.where(PUBLISHED_YEAR == year)
+    return query
+
+
+PROVIDER = engine.register(engine.Provider(
+    name=PROVIDER_NAME,
+    source=source,
+    dimensions=(
+        engine.Dimension("country", "Country", collated=True),
+        engine.Dimension("year", "Year", descending=True),
+    ),
+    measures=(
+        engine.Measure("fires", "Fires", lambda c: func.count()),
+        engine.Measure("minimum", "Minimum (ha)", lambda c: func.min(c.area),
+                       kind=engine.KIND_HECTARES),
+        engine.Measure("maximum", "Maximum (ha)", lambda c: func.max(c.area),
+                       kind=engine.KIND_HECTARES),
+        engine.Measure("total", "Total (ha)", lambda c: func.sum(c.area),
+                       kind=engine.KIND_HECTARES, default=0.0),
+        engine.Measure("agencies", "Agencies", lambda c: func.count(c.agency.distinct())),
+        engine.Measure("determined", CAUSE_HEADINGS[3], lambda c: func.count(),
+                       condition=lambda c: c.cause.in_(DETERMINED_CAUSES)),
+        engine.Measure("natural", CAUSE_HEADINGS[4], lambda c: func.count(),
+                       condition=lambda c: c.cause == COUNTABLE_CAUSES[DEFAULT_CAUSE]),
+        engine.Measure("natural_ha", CAUSE_HEADINGS[6], lambda c: func.sum(c.area),
+                       kind=engine.KIND_HECTARES, default=0.0,
+                       condition=lambda c: c.cause == COUNTABLE_CAUSES[DEFAULT_CAUSE]),
+        engine.Measure("determined_ha", "Determined (ha)", lambda c: func.sum(c.area),
+                       kind=engine.KIND_HECTARES, default=0.0,
+                       condition=lambda c: c.cause.in_(DETERMINED_CAUSES)),
+    ),
+    shares=(
+        engine.Share("natural_percent", CAUSE_HEADINGS[5], "natural", of="determined"),
+        engine.Share("natural_ha_percent", CAUSE_HEADINGS[7], "natural_ha",
+                     of="determined_ha"),
+    ),
+    reports=(
+        engine.ReportDefinition(
+            name="statistics",
+            title=f"NFDB wildfire reported burnt area ({COUNTRY_NAME})",
+            rows=("country", "year"),
+            columns=("fires", "minimum", "maximum", "total", "agencies"),
+            total_over="year",
+            totals=engine.TOTALS_ALWAYS,
+            where=lambda c: c.area.is_not(None),
+            notes=(
+                "Areas in hectares as the agencies reported them (SIZE_HA) — this "
+                "dataset publishes no perimeter, so nothing is measured. A reported "
+                "zero is counted. Years are the published YEAR. Declared prescribed "
+                "burns are excluded, as is any fire whose published point falls inside "
+                "no country.",
+                "These are not the NBAC figures for the same fires and are not a "
+                "correction of them: one is what somebody recorded at the time, the "
+                "other what a satellite could see afterwards. Do not add them.",
+                "Agencies counts the fire management agencies behind the row. In a "
+                "summary row it is the number of agencies over the whole period, not a "
+                "sum of the years.",
+            ),
+            options={"min_area": None, "cause": None, "agency": None,
+                     "include_prescribed": False,
+                     "country_source": COUNTRY_SOURCE_GEOMETRY},
+        ),
+        engine.ReportDefinition(
+            name="causes",
+            title=f"NFDB wildfires by cause ({COUNTRY_NAME})",
+            rows=("country", "year"),
+            columns=("fires", "determined", "natural", "natural_percent", "natural_ha",
+                     "natural_ha_percent"),
+            total_over="year",
+            totals=engine.TOTALS_ALWAYS,
+            notes=(
+                "Counts of the agency fire reports whose published CAUSE is "
+                f"{CAUSE_LABELS[DEFAULT_CAUSE]}, and the area they reported burning "
+                "(SIZE_HA). Years are the published YEAR. Declared prescribed burns are "
+                "excluded, as is any fire whose published point falls inside no "
+                "country.",
+                f"The NFDB publishes no lightning category. {canada_nfdb.CAUSE_NATURAL} "
+                "is the nearest it comes, and it is not defined as lightning.",
+                "The percentages are of the fires whose cause somebody determined, not "
+                f"of all of them. {canada_nfdb.CAUSE_UNKNOWN} is a published category "
+                "rather than a missing value; Fires minus Determined is the unknown "
+                "count.",
+            ),
+            options={"cause": DEFAULT_CAUSE, "agency": None, "include_prescribed": False,
+                     "country_source": COUNTRY_SOURCE_GEOMETRY},
+        ),
+    ),
+    tables=("nfdb_wildfire", "ignition", "admin_boundary", "admin_boundary_part",
+            "ocha_admin_boundary"),
+))
@@ -183,6 +183,7 @@ from sqlalchemy.orm import Session
 import src.settings  # noqa: F401  (imported for the side effect of loading .env)
 
 from src.apps.imports import common
+from src.apps.statistics import engine as report_engine
 from src.apps.statistics.wildfires.canada_nfdb.wildfire_statistics import COUNTRY_NAME
 from src.apps.statistics.wildfires.canada_nfdb.wildfire_statistics import COUNTRY_SOURCES
 from src.apps.statistics.wildfires.canada_nfdb.wildfire_statistics import (
@@ -653,17 +654,31 @@ def write_docx(rows: list[Row], path: Path, year: int | None,
     logger.info("Wrote %s", path)
 
 
-def report(args: argparse.Namespace, engine: Engine, logger: logging.Logger) -> list[Row]:
+def report(args: argparse.Namespace, engine: Engine,
+           logger: logging.Logger) -> list[Row] | list[report_engine.ReportRow]:
     """Count the causes and write whichever outputs were asked for.
 
     The agency is resolved first, inside the same session, so that a code nobody
     recognises fails before any fire is counted — and against the database, so the
     error can list the agencies that really are imported.
+
+    Run with the options of the ``causes`` report of
+    :mod:`~src.apps.statistics.wildfires.canada_nfdb.reports` — the defaults — it is
+    that report: computed and written by :mod:`src.apps.statistics.engine`, and
+    returned as its rows. Any other option is counted and written here.
     """
+    # Imported here: the description is built from this module's expressions.
+    from src.apps.statistics.wildfires.canada_nfdb import reports
+    described = reports.PROVIDER.report("causes")
+    covered = report_engine.covers(described, args)
     with Session(engine) as session:
         agency = None if args.agency is None else resolve_agency(session, args.agency)
-        rows = compute(session, args.year, logger, args.cause, args.country_source,
-                       args.include_prescribed, agency)
+        if covered:
+            rows = report_engine.compute_one(session, reports.PROVIDER, described.name,
+                                             args.year, logger)
+        else:
+            rows = compute(session, args.year, logger, args.cause, args.country_source,
+                           args.include_prescribed, agency)
 
     if not rows:
         extra = "" if agency is None else \
@@ -674,11 +689,14 @@ def report(args: argparse.Namespace, engine: Engine, logger: logging.Logger) ->
             f"— the import reads from {canada_nfdb.FIRST_YEAR} on." + extra
         )
 
-    if args.csv is not None:
-        write_csv(rows, args.csv, logger, args.cause)
-    if args.docx is not None:
-        write_docx(rows, args.docx, args.year, logger, args.cause, args.country_source,
-                   args.include_prescribed, agency)
+    if covered:
+        report_engine.write(reports.PROVIDER, described, rows, args.csv, args.docx, logger)
+    else:
+        if args.csv is not None:
+            write_csv(rows, args.csv, logger, args.cause)
+        if args.docx is not None:
+            write_docx(rows, args.docx, args.year, logger, args.cause,
+                       args.country_source, args.include_prescribed, agency)
     return rows
 
 
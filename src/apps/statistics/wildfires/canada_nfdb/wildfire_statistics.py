@@ -204,7 +204,10 @@ keeping identical.
 Nothing about the figures changes. ``count``, ``sum``, ``min`` and ``max`` all
 decompose over a partition of the fires, and the agencies are unioned rather than
 added, so the ``Total`` row is exactly the number one pass would have returned.
-Every statement runs in one transaction and so against one snapshot.
+Every statement runs in one ``REPEATABLE READ`` transaction and so against one
+snapshot. ``--jobs N`` sums N years at once, on connections that import that
+snapshot rather than take their own; it is worth having under ``geometry``, and
+under ``filed`` a year is too quick to be worth a connection.
 """
 
 from __future__ import annotations
@@ -233,7 +236,10 @@ from sqlalchemy.orm import Session
 import src.settings  # noqa: F401  (imported for the side effect of loading .env)
 
 from src.apps.imports import common
+from src.apps.statistics import cache
+from src.apps.statistics import engine as report_engine
 from src.data_model.geography.admin_boundary import AdminBoundary
+from src.data_model.geography.admin_boundary import AdminBoundaryPart
 from src.data_model.ignition import Ignition
 from src.providers import canada_nfdb
 from src.providers.canada_nfdb.wildfire import NfdbWildfire
@@ -328,9 +334,14 @@ def country_columns(source: str) -> tuple[ColumnElement, list]:
     :func:`location_audit` counts the two separately, because they mean entirely
     different things about the data.
 
+    The test runs against :class:`~src.data_model.geography.admin_boundary.AdminBoundaryPart`,
+    Canada cut into pieces of a few hundred vertices, rather than against an outline
+    whose Arctic coastline alone would be walked once per fire.
+
     ``LATERAL ... LIMIT 1`` rather than a plain join: a point on a shared border can
-    satisfy ``ST_Contains`` for two countries — and the Canada-United States border is
-    nine thousand kilometres of exactly that — so one fire must not become two rows.
+    intersect two countries — and the Canada-United States border is nine thousand
+    kilometres of exactly that — and a point on a cut between two pieces intersects
+    both, so one fire must not become two rows.
     The join to ``ocha_admin_boundary`` is what keeps the test against the OCHA
     country outlines rather than against every level-0 boundary any provider has ever
     loaded.
@@ -347,10 +358,11 @@ def country_columns(source: str) -> tuple[ColumnElement, list]:
     ocha_boundary = OchaAdminBoundary.__table__
     containing = (
         select(AdminBoundary.name.label("name"))
-        .select_from(AdminBoundary)
+        .select_from(AdminBoundaryPart)
+        .join(AdminBoundary, AdminBoundary.id == AdminBoundaryPart.admin_boundary_id)
         .join(ocha_boundary, ocha_boundary.c.id == AdminBoundary.id)
-        .where(AdminBoundary.level == COUNTRY_LEVEL)
-        .where(func.ST_Contains(AdminBoundary.geometry, ignition.c.geometry))
+        .where(AdminBoundaryPart.level == COUNTRY_LEVEL)
+        .where(func.ST_Intersects(AdminBoundaryPart.geometry, ignition.c.geometry))
         .limit(1)
         .lateral("containing")
     )
@@ -695,11 +707,12 @@ def location_audit(year: int | None = None,
     ocha_boundary = OchaAdminBoundary.__table__
 
     located = (
-        select(AdminBoundary.id)
-        .select_from(AdminBoundary)
+        select(AdminBoundaryPart.id)
+        .select_from(AdminBoundaryPart)
+        .join(AdminBoundary, AdminBoundary.id == AdminBoundaryPart.admin_boundary_id)
         .join(ocha_boundary, ocha_boundary.c.id == AdminBoundary.id)
-        .where(AdminBoundary.level == COUNTRY_LEVEL)
-        .where(func.ST_Contains(AdminBoundary.geometry, ignition.c.geometry))
+        .where(AdminBoundaryPart.level == COUNTRY_LEVEL)
+        .where(func.ST_Intersects(AdminBoundaryPart.geometry, ignition.c.geometry))
         .exists()
     )
 
@@ -958,6 +971,10 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument("--area-method", help=argparse.SUPPRESS)
     parser.add_argument("--surface", help=argparse.SUPPRESS)
 
+    common.add_snapshot_jobs_arguments(parser)
+
+    cache.add_cache_arguments(parser)
+
     output = parser.add_argument_group("output", "at least one is required")
     output.add_argument("--csv", type=Path, help="write the report to this .csv")
     output.add_argument("--docx", type=Path, help="write the report to this .docx (MS Word)")
@@ -996,7 +1013,8 @@ def compute(session: Session, year: int | None, logger: logging.Logger,
             country_source: str = COUNTRY_SOURCE_GEOMETRY,
             include_prescribed: bool = False,
             cause: str | None = None,
-            agency: str | None = None) -> list[Row]:
+            agency: str | None = None,
+            jobs: int = 1) -> list[Row]:
     """Measure the fires a year at a time, returning the report's rows in order.
 
     Notes
@@ -1005,10 +1023,11 @@ def compute(session: Session, year: int | None, logger: logging.Logger,
     spinner of its own so that a long run says which year it is on rather than only
     that it is alive.
 
-    Every one of them runs in ``session``'s transaction, and so against a single
-    snapshot: a report assembled from many queries is then exactly as consistent as
-    one assembled from a single query, and an import running alongside it cannot have
-    a fire counted in one year's statement and not in another's.
+    Every one of them reads ``session``'s snapshot, ``jobs`` years at a time (see
+    :func:`~src.apps.imports.common.measure_by_year`): a report assembled from many
+    queries is then exactly as consistent as one assembled from a single query, and
+    an import running alongside it cannot have a fire counted in one year's statement
+    and not in another's.
 
     Under ``geometry`` a second statement follows them: :func:`location_audit` counts
     what they dropped and why. A report that quietly left out a fire whose coordinate
@@ -1023,27 +1042,63 @@ def compute(session: Session, year: int | None, logger: logging.Logger,
     scope = "every agency" if agency is None else agency
     if cause is not None:
         scope = f"{cause}, {scope}"
-    measured: list[Row] = []
-    for index, measuring in enumerate(years, start=1):
-        with common.Spinner(f"Summing the reported burnt area of the NFDB fires "
-                            f"({scope}, {measuring}: {index} of {len(years)})", logger):
-            measured += [
-                Row(country=record.country, year=measuring,
-                    minimum=float(record.minimum),
-                    maximum=float(record.maximum),
-                    total=float(record.total),
-                    fires=record.fires,
-                    agencies=frozenset(record.agencies or ()))
-                for record in session.execute(
-                    statistics_query(measuring, min_area, country_source,
-                                     include_prescribed, cause, agency))
-            ]
 
+    def measure_year(worker: Session, measuring: int) -> list[Row]:
+        return [
+            Row(country=record.country, year=measuring,
+                minimum=float(record.minimum),
+                maximum=float(record.maximum),
+                total=float(record.total),
+                fires=record.fires,
+                agencies=frozenset(record.agencies or ()))
+            for record in worker.execute(
+                statistics_query(measuring, min_area, country_source,
+                                 include_prescribed, cause, agency))
+        ]
+
+    measured = common.measure_by_year(session, years, measure_year, jobs,
+                                      "Summing the reported burnt area of the NFDB fires",
+                                      scope, logger)
+
+    log_exclusions(session, year, sum(row.fires for row in measured), logger, min_area,
+                   country_source, include_prescribed, cause, agency)
+
+    countries = ordered_countries(session, {row.country for row in measured})
+    rows = summarise(measured, countries)
+    logger.info("Computed %d rows over %d country/countries and %d year(s) "
+                "(reported hectares, country from %s, %s, %s)",
+                len(rows), len(countries), len({row.year for row in measured}),
+                country_source,
+                "every fire" if min_area is None else f"fires of {min_area:g} ha or more",
+                scope)
+    if rows:
+        agencies = frozenset().union(*(row.agencies for row in rows))
+        logger.info("%d agency/agencies filed the fires reported: %s",
+                    len(agencies), ", ".join(sorted(agencies)))
+    return rows
+
+
+def log_exclusions(session: Session, year: int | None, counted: int,
+                   logger: logging.Logger,
+                   min_area: float | None = None,
+                   country_source: str = COUNTRY_SOURCE_GEOMETRY,
+                   include_prescribed: bool = False,
+                   cause: str | None = None,
+                   agency: str | None = None) -> None:
+    """Say which fires in scope are in no row, and why.
+
+    Under ``geometry``, :func:`location_audit` counts what the point test dropped: a
+    report that quietly left out a fire whose coordinate is in the sea would be worse
+    than one that did not offer the option. Under either mode, a fire with no published
+    year is in no row at all. ``counted`` is how many fires the report's rows hold.
+
+    Shared by :func:`compute` and by the report the engine computes, which drop the
+    same fires.
+    """
     if country_source == COUNTRY_SOURCE_GEOMETRY:
         with common.Spinner("Counting the fires with no usable point", logger):
             audit = session.execute(
                 location_audit(year, min_area, include_prescribed, cause, agency)).one()
-        counted = sum(row.fires for row in measured)
         logger.info("Excluded %d of %d fire(s): %d have no usable published point, "
                     "%d have one that is inside no country",
                     audit.no_point + audit.outside,
@@ -1062,20 +1117,6 @@ def compute(session: Session, year: int | None, logger: logging.Logger,
             "The import cannot store one, so this is a database written by something "
             "else", orphaned)
 
-    countries = ordered_countries(session, {row.country for row in measured})
-    rows = summarise(measured, countries)
-    logger.info("Computed %d rows over %d country/countries and %d year(s) "
-                "(reported hectares, country from %s, %s, %s)",
-                len(rows), len(countries), len({row.year for row in measured}),
-                country_source,
-                "every fire" if min_area is None else f"fires of {min_area:g} ha or more",
-                scope)
-    if rows:
-        agencies = frozenset().union(*(row.agencies for row in rows))
-        logger.info("%d agency/agencies filed the fires reported: %s",
-                    len(agencies), ", ".join(sorted(agencies)))
-    return rows
-
 
 def write_csv(rows: list[Row], path: Path, logger: logging.Logger) -> None:
     """Write the report as CSV.
@@ -1191,17 +1232,41 @@ def write_docx(rows: list[Row], path: Path, year: int | None,
     logger.info("Wrote %s", path)
 
 
-def report(args: argparse.Namespace, engine: Engine, logger: logging.Logger) -> list[Row]:
+def report(args: argparse.Namespace, engine: Engine,
+           logger: logging.Logger) -> list[Row] | list[report_engine.ReportRow]:
     """Compute the statistics and write whichever outputs were asked for.
 
     The agency is resolved first, inside the same session, so that a code nobody
     recognises fails before any fire is counted — and against the database, so the
     error can list the agencies that really are imported.
+
+    Run with the options of the ``statistics`` report of
+    :mod:`~src.apps.statistics.wildfires.canada_nfdb.reports` — the defaults — it is
+    that report: computed in one statement and written by
+    :mod:`src.apps.statistics.engine`, and returned as its rows. The exclusions are
+    logged after it from the same snapshot, as :func:`compute` logs them. Any other
+    option is measured a year at a time here.
     """
-    with Session(engine) as session:
+    # Imported here: the description is built from this module's expressions.
+    from src.apps.statistics.wildfires.canada_nfdb import reports
+    described = reports.PROVIDER.report("statistics")
+    covered = report_engine.covers(described, args)
+    with common.snapshot_session(engine) as session:
         agency = None if args.agency is None else resolve_agency(session, args.agency)
-        rows = compute(session, args.year, logger, args.min_area, args.country_source,
-                       args.include_prescribed, args.cause, agency)
+        if covered:
+            def run() -> list[report_engine.ReportRow]:
+                computed = report_engine.compute_one(session, reports.PROVIDER,
+                                                     described.name, args.year, logger)
+                log_exclusions(session, args.year,
+                               sum(row.values["fires"] for row in computed
+                                   if not row.is_total), logger)
+                return computed
+        else:
+            def run() -> list[Row]:
+                return compute(session, args.year, logger, args.min_area,
+                               args.country_source, args.include_prescribed, args.cause,
+                               agency, args.jobs)
+        rows = cache.cached_compute(session, args, [canada_nfdb], run, logger)
 
     if not rows:
         # An empty report is almost always a year with no data, and writing an empty
@@ -1222,11 +1287,14 @@ def report(args: argparse.Namespace, engine: Engine, logger: logging.Logger) ->
             f"— the import reads from {canada_nfdb.FIRST_YEAR} on." + extra
         )
 
-    if args.csv is not None:
-        write_csv(rows, args.csv, logger)
-    if args.docx is not None:
-        write_docx(rows, args.docx, args.year, logger, args.min_area,
-                   args.country_source, args.include_prescribed, args.cause, agency)
+    if covered:
+        report_engine.write(reports.PROVIDER, described, rows, args.csv, args.docx, logger)
+    else:
+        if args.csv is not None:
+            write_csv(rows, args.csv, logger)
+        if args.docx is not None:
+            write_docx(rows, args.docx, args.year, logger, args.min_area,
+                       args.country_source, args.include_prescribed, args.cause, agency)
     return rows
 
 
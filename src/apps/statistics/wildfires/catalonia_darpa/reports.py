@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""The DARPA burnt-area report, described for the shared report engine.
+
+:mod:`~src.apps.statistics.wildfires.catalonia_darpa.wildfire_statistics` is already
+one statement, so what describing it here buys is not a scan saved but a report that
+:mod:`src.apps.statistics.run_reports` can run alongside the others, and that the
+application writes through the same engine when it runs by default. It prints the same
+rows — the tests hold it to it.
+
+What the engine does not have is the application's options. This is the report as it
+runs by default: geodesic areas, every fire (no ``--min-area``), and every EGIF
+binding counted whatever its confidence (no ``--min-confidence``). Run that way, the
+application computes and writes it through the engine; with any other option, it
+still does so itself.
+
+The source
+----------
+
+One row per Catalan fire with a perimeter, with its published year, its measured
+hectares and whether it is bound to an EGIF *parte*. The country is the constant the
+application prints; nothing is tested against a boundary, so nothing here is joined
+for it either.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import Select
+from sqlalchemy import func
+from sqlalchemy import literal
+from sqlalchemy import select
+
+from src.apps.statistics import engine
+from src.apps.statistics.wildfires.catalonia_darpa.wildfire_statistics import (
+    AREA_METHOD_GEODESIC)
+from src.apps.statistics.wildfires.catalonia_darpa.wildfire_statistics import COUNTRY_NAME
+from src.apps.statistics.wildfires.catalonia_darpa.wildfire_statistics import PUBLISHED_YEAR
+from src.apps.statistics.wildfires.catalonia_darpa.wildfire_statistics import REGION_NAME
+from src.apps.statistics.wildfires.catalonia_darpa.wildfire_statistics import burnt_area
+from src.apps.statistics.wildfires.catalonia_darpa.wildfire_statistics import is_matched
+from src.data_model.wildfire import Wildfire
+from src.providers.catalonia_darpa.wildfire import DarpaWildfire
+
+#: How :mod:`src.apps.statistics.run_reports` names this provider.
+PROVIDER_NAME = "catalonia_darpa"
+
+
+def source(year: int | None) -> Select:
+    """Every Catalan fire with a perimeter, or one published year's."""
+    darpa = DarpaWildfire.__table__
+
+    query = (
+        select(
+            literal(COUNTRY_NAME).label("country"),
+            PUBLISHED_YEAR.label("year"),
+            burnt_area(AREA_METHOD_GEODESIC).label("area"),
+            is_matched().label("matched"),
+        )
+        .select_from(Wildfire)
+        .join(darpa, darpa.c.id == Wildfire.id)
+        .where(Wildfire.perimeter.is_not(None))
+    )
+    if year is not None:
+        query = query.where(PUBLISHED_YEAR == year)
+    return query
+
+
+PROVIDER = engine.register(engine.Provider(
+    name=PROVIDER_NAME,
+    source=source,
+    dimensions=(
+        engine.Dimension("country", "Country"),
+        engine.Dimension("year", "Year", descending=True),
+    ),
+    measures=(
+        engine.Measure("fires", "Fires", lambda c: func.count()),
+        engine.Measure("minimum", "Minimum (ha)", lambda c: func.min(c.area),
+                       kind=engine.KIND_HECTARES),
+        engine.Measure("maximum", "Maximum (ha)", lambda c: func.max(c.area),
+                       kind=engine.KIND_HECTARES),
+        engine.Measure("total", "Total (ha)", lambda c: func.sum(c.area),
+                       kind=engine.KIND_HECTARES, default=0.0),
+        engine.Measure("matched", "EGIF matched", lambda c: func.count(),
+                       condition=lambda c: c.matched),
+    ),
+    shares=(
+        engine.Share("matched_percent", "EGIF matched (%)", "matched", of="fires"),
+    ),
+    reports=(
+        engine.ReportDefinition(
+            name="statistics",
+            title=f"DARPA wildfire burnt area ({REGION_NAME})",
+            rows=("country", "year"),
+            columns=("fires", "minimum", "maximum", "total", "matched",
+                     "matched_percent"),
+            total_over="year",
+            totals=engine.TOTALS_ALWAYS,
+            notes=(
+                "Areas in hectares, computed geodesically on the WGS84 ellipsoid from "
+                "the published perimeter — this dataset publishes no burnt area of its "
+                "own. Years are the published layer's.",
+                f"The Country column is {COUNTRY_NAME} on every row and nothing is "
+                f"tested against a boundary. These totals are one autonomous "
+                f"community's, {REGION_NAME}'s, and are not a Spanish total.",
+                "EGIF matched counts the fires linked to the Spanish parte for the same "
+                "fire, whatever the confidence of the link. It is a column and not a "
+                "filter.",
+            ),
+            options={"area_method": AREA_METHOD_GEODESIC, "min_area": None,
+                     "min_confidence": None},
+        ),
+    ),
+    tables=("wildfire", "darpa_wildfire"),
+))
@@ -233,11 +233,9 @@ import sys
 from dataclasses import dataclass
 from pathlib import Path
 
-from geoalchemy2 import Geography
 from sqlalchemy import ColumnElement
 from sqlalchemy import Engine
 from sqlalchemy import Select
-from sqlalchemy import cast
 from sqlalchemy import create_engine
 from sqlalchemy import func
 from sqlalchemy import literal
@@ -247,7 +245,10 @@ from sqlalchemy.orm import Session
 import src.settings  # noqa: F401  (imported for the side effect of loading .env)
 
 from src.apps.imports import common
+from src.apps.statistics import cache
+from src.apps.statistics import engine as report_engine
 from src.data_model.wildfire import Wildfire
+from src.providers import catalonia_darpa
 from src.providers.catalonia_darpa.wildfire import DarpaWildfire
 
 #: Label used in the ``Year`` column for the summary row.
@@ -326,15 +327,9 @@ def burnt_area(method: str) -> ColumnElement:
     Always measured from the EPSG:4326 perimeter on the parent ``wildfire`` row,
     never from the published EPSG:25831 copy — see the module docstring for why the
     department's own grid is not an option here.
-
-    The geodesic cast carries the geometry type and SRID rather than being a bare
-    ``Geography()``: that renders as ``geography(GEOMETRY,-1)``, which PostGIS
-    rejects, because -1 is not a SRID it knows.
     """
     if method == AREA_METHOD_GEODESIC:
-        square_metres = func.ST_Area(
-            cast(Wildfire.perimeter, Geography(geometry_type="MULTIPOLYGON", srid=4326))
-        )
+        square_metres = Wildfire.perimeter_area_m2
     elif method == AREA_METHOD_EQUAL_AREA:
         square_metres = func.ST_Area(func.ST_Transform(Wildfire.perimeter, EQUAL_AREA_SRID))
     else:
@@ -702,6 +697,8 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument("--country", help=argparse.SUPPRESS)
     parser.add_argument("--country-source", help=argparse.SUPPRESS)
 
+    cache.add_cache_arguments(parser)
+
     output = parser.add_argument_group("output", "at least one is required")
     output.add_argument("--csv", type=Path, help="write the report to this .csv")
     output.add_argument("--docx", type=Path, help="write the report to this .docx (MS Word)")
@@ -871,11 +868,30 @@ def write_docx(rows: list[Row], path: Path, year: int | None,
     logger.info("Wrote %s", path)
 
 
-def report(args: argparse.Namespace, engine: Engine, logger: logging.Logger) -> list[Row]:
-    """Compute the statistics and write whichever outputs were asked for."""
+def report(args: argparse.Namespace, engine: Engine,
+           logger: logging.Logger) -> list[Row] | list[report_engine.ReportRow]:
+    """Compute the statistics and write whichever outputs were asked for.
+
+    Run with the options of the ``statistics`` report of
+    :mod:`~src.apps.statistics.wildfires.catalonia_darpa.reports` — the defaults — it
+    is that report: computed and written by :mod:`src.apps.statistics.engine`, and
+    returned as its rows. Any other option is computed and written here.
+    """
+    # Imported here: the description is built from this module's expressions.
+    from src.apps.statistics.wildfires.catalonia_darpa import reports
+    described = reports.PROVIDER.report("statistics")
+    covered = report_engine.covers(described, args)
     with Session(engine) as session:
-        rows = compute(session, args.year, logger, args.area_method, args.min_area,
-                       args.min_confidence)
+        if covered:
+            def run() -> list[report_engine.ReportRow]:
+                return report_engine.compute_one(session, reports.PROVIDER,
+                                                 described.name, args.year, logger)
+        else:
+            def run() -> list[Row]:
+                return compute(session, args.year, logger, args.area_method,
+                               args.min_area, args.min_confidence)
+        rows = cache.cached_compute(session, args, [catalonia_darpa], run, logger,
+                                    bindings=[DarpaWildfire.matched_at])
 
     if not rows:
         # An empty report is almost always a year with no data, and writing an empty
@@ -888,11 +904,14 @@ def report(args: argparse.Namespace, engine: Engine, logger: logging.Logger) ->
             f"imported — the published layers run from 1986." + threshold
         )
 
-    if args.csv is not None:
-        write_csv(rows, args.csv, logger)
-    if args.docx is not None:
-        write_docx(rows, args.docx, args.year, logger, args.area_method, args.min_area,
-                   args.min_confidence)
+    if covered:
+        report_engine.write(reports.PROVIDER, described, rows, args.csv, args.docx, logger)
+    else:
+        if args.csv is not None:
+            write_csv(rows, args.csv, logger)
+        if args.docx is not None:
+            write_docx(rows, args.docx, args.year, logger, args.area_method,
+                       args.min_area, args.min_confidence)
     return rows
 
 
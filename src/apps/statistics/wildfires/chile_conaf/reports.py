@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""CONAF's burnt-area and cause reports, described for the shared report engine.
+
+:mod:`~src.apps.statistics.wildfires.chile_conaf.wildfire_statistics` and
+:mod:`~src.apps.statistics.wildfires.chile_conaf.wildfire_causes` each read every
+CONAF fire to group it one way. Described here as one
+:class:`~src.apps.statistics.engine.Provider`, the two are answered by
+:mod:`src.apps.statistics.run_reports` from a single grouped pass, and print the same
+rows — the tests hold them to it.
+
+What the engine does not have is those applications' options. These are the reports
+as they run by default: the whole published area (``--surface total``), every fire
+(no ``--dated-only``, ``--min-area`` or ``--reporter``), countries by the point's
+containment, and the 2023-2024 break in the causes **not** bridged. Run that way, each
+application computes and writes its report through the engine; with any of those
+options, it still does so itself.
+
+The source
+----------
+
+One row per fire, with the country it is in, its season, the cause it is grouped
+under and its area. The country is joined **outer** here, where the statistics
+application joins it inner: the causes report counts the fire mis-keyed into the
+Pacific and the statistics report does not, so the source keeps it and the statistics
+report's ``FILTER`` drops it.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import Select
+from sqlalchemy import func
+from sqlalchemy import select
+
+from src.apps.statistics import engine
+from src.apps.statistics.wildfires.chile_conaf.wildfire_causes import SYNTHETIC_LABELS
+from src.apps.statistics.wildfires.chile_conaf.wildfire_causes import cause_labels
+from src.apps.statistics.wildfires.chile_conaf.wildfire_statistics import (
+    COUNTRY_SOURCE_GEOMETRY)
+from src.apps.statistics.wildfires.chile_conaf.wildfire_statistics import DEFAULT_SURFACE
+from src.apps.statistics.wildfires.chile_conaf.wildfire_statistics import SEASON
+from src.apps.statistics.wildfires.chile_conaf.wildfire_statistics import country_columns
+from src.apps.statistics.wildfires.chile_conaf.wildfire_statistics import season_label
+from src.apps.statistics.wildfires.chile_conaf.wildfire_statistics import surface_area
+from src.providers import chile_conaf
+from src.providers.chile_conaf.fire_cause import ConafFireCause
+from src.providers.chile_conaf.wildfire import ConafWildfire
+
+#: How :mod:`src.apps.statistics.run_reports` names this provider.
+PROVIDER_NAME = "chile_conaf"
+
+
+def source(season: int | None) -> Select:
+    """Every CONAF fire, or one season's, with the columns both reports group on."""
+    conaf = ConafWildfire.__table__
+    cause = ConafFireCause.__table__
+    country_name, joins = country_columns(COUNTRY_SOURCE_GEOMETRY)
+    label, english = cause_labels()
+
+    query = select(
+        country_name.label("country"),
+        SEASON.label("season"),
+        label.label("cause"),
+        english.label("cause_en"),
+        (conaf.c.date_time_precision != chile_conaf.PRECISION_SEASON).label("dated"),
+        surface_area(DEFAULT_SURFACE).label("area"),
+    ).select_from(conaf)
+    for target, condition in joins:
+        query = query.outerjoin(target, condition)
+    query = query.outerjoin(cause, cause.c.id == conaf.c.cause_id)
+    if season is not None:
+        query = query.where(SEASON == season)
+    return query
+
+
+def causes_order(row: engine.ReportRow) -> tuple:
+    """Seasons oldest first and the summary block last; within each, real causes by
+    descending fire count and the three synthetic labels after them.
+
+    :func:`~src.apps.statistics.wildfires.chile_conaf.wildfire_causes.sort_key`, over
+    the engine's rows.
+    """
+    season, cause = row.keys["season"], row.keys["cause"]
+    synthetic = cause in SYNTHETIC_LABELS
+    order = SYNTHETIC_LABELS.index(cause) if synthetic else 0
+    return (season is None, season or 0, synthetic, order, -row.values["fires"], cause)
+
+
+PROVIDER = engine.register(engine.Provider(
+    name=PROVIDER_NAME,
+    source=source,
+    dimensions=(
+        engine.Dimension("country", "Country"),
+        engine.Dimension("season", "Season", season_label),
+        engine.Dimension("cause", "Cause"),
+    ),
+    measures=(
+        engine.Measure("fires", "Fires", lambda c: func.count()),
+        engine.Measure("dated", "Dated", lambda c: func.count(),
+                       condition=lambda c: c.dated),
+        engine.Measure("minimum", "Minimum (ha)", lambda c: func.min(c.area),
+                       kind=engine.KIND_HECTARES),
+        engine.Measure("maximum", "Maximum (ha)", lambda c: func.max(c.area),
+                       kind=engine.KIND_HECTARES),
+        engine.Measure("total", "Total (ha)", lambda c: func.sum(c.area),
+                       kind=engine.KIND_HECTARES, default=0.0),
+        engine.Measure("cause_en", "Cause (English)", lambda c: func.min(c.cause_en),
+                       kind=engine.KIND_TEXT),
+    ),
+    shares=(
+        engine.Share("fires_percent", "Fires (%)", "fires", over="cause"),
+        engine.Share("total_percent", "Total (% of ha)", "total", over="cause"),
+    ),
+    reports=(
+        engine.ReportDefinition(
+            name="statistics",
+            title="CONAF wildfire burnt area (Chile)",
+            rows=("country", "season"),
+            columns=("fires", "dated", "minimum", "maximum", "total"),
+            total_over="season",
+            totals=engine.TOTALS_PER_GROUP,
+            where=lambda c: c.country.isnot(None),
+            notes=(
+                "Areas in hectares, as CONAF reported them, for the whole fire "
+                "(SUPERFICIE). These are filed figures and not measured polygons — this "
+                "archive publishes no perimeter. Seasons run 1 July to 30 June. Fires "
+                "not attributable to a country are excluded.",
+                "The Dated column counts the fires with a published start date. The "
+                "rest have none at all and are stored at 1 July of their season.",
+            ),
+            options={"surface": DEFAULT_SURFACE, "country_source": COUNTRY_SOURCE_GEOMETRY,
+                     "dated_only": False, "min_area": None, "reporter": None},
+        ),
+        engine.ReportDefinition(
+            name="causes",
+            title="CONAF wildfire causes (Chile)",
+            rows=("season", "cause"),
+            columns=("cause_en", "fires", "fires_percent", "total", "total_percent"),
+            total_over="season",
+            totals=engine.TOTALS_PER_REPORT,
+            order=causes_order,
+            notes=(
+                "Fires and reported hectares by cause, grouped on CONAF's "
+                "classification. Seasons run 1 July to 30 June.",
+                "CONAF renumbered and renamed its cause classification in 2023-2024, "
+                "so ten categories stop there and their successors start. That break "
+                "is real and is printed as it is.",
+            ),
+            options={"bridge_schemes": False, "cause": None},
+        ),
+    ),
+    tables=("conaf_wildfire", "conaf_fire_cause", "ignition", "admin_boundary",
+            "admin_boundary_part"),
+))
@@ -67,7 +67,9 @@ import sys
 
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterable
 
+from sqlalchemy import ColumnElement
 from sqlalchemy import Engine
 from sqlalchemy import Select
 from sqlalchemy import case
@@ -79,6 +81,7 @@ from sqlalchemy.orm import Session
 import src.settings  # noqa: F401  (imported for the side effect of loading .env)
 
 from src.apps.imports import common
+from src.apps.statistics import engine as report_engine
 from src.apps.statistics.wildfires.chile_conaf.wildfire_statistics import SEASON
 from src.apps.statistics.wildfires.chile_conaf.wildfire_statistics import TOTAL_LABEL
 from src.apps.statistics.wildfires.chile_conaf.wildfire_statistics import season_label
@@ -115,6 +118,29 @@ UNRECONCILED_LABEL = "(unreconciled cause)"
 SYNTHETIC_LABELS = (SPECIFIC_ONLY_LABEL, UNRECONCILED_LABEL, NO_CAUSE_LABEL)
 
 
+def cause_labels() -> tuple[ColumnElement, ColumnElement]:
+    """The label a fire is grouped under and its English, as ``(label, english)``.
+
+    Reads :class:`~src.providers.chile_conaf.fire_cause.ConafFireCause`, so the query
+    using them must join it — outer, so that a fire with no ``cause_id`` is
+    :data:`NO_CAUSE_LABEL` rather than missing.
+    """
+    cause = ConafFireCause.__table__
+    # A CASE rather than a COALESCE chain: these are four distinct states of
+    # knowledge, and a coalesce would read as though they were degrees of one.
+    label = case(
+        (cause.c.cause_normalised.isnot(None), cause.c.cause_normalised),
+        (cause.c.cause.isnot(None), UNRECONCILED_LABEL),
+        (cause.c.specific_cause.isnot(None), SPECIFIC_ONLY_LABEL),
+        else_=NO_CAUSE_LABEL,
+    )
+    english = case(
+        (cause.c.cause_normalised.isnot(None), cause.c.cause_en),
+        else_=None,
+    )
+    return label, english
+
+
 def counts_query(season: int) -> Select:
     """Build the counting query for one season.
 
@@ -141,19 +167,7 @@ def counts_query(season: int) -> Select:
     conaf = ConafWildfire.__table__
     cause = ConafFireCause.__table__
     surface = surface_area("total")
-
-    # A CASE rather than a COALESCE chain: these are four distinct states of
-    # knowledge, and a coalesce would read as though they were degrees of one.
-    label = case(
-        (cause.c.cause_normalised.isnot(None), cause.c.cause_normalised),
-        (cause.c.cause.isnot(None), UNRECONCILED_LABEL),
-        (cause.c.specific_cause.isnot(None), SPECIFIC_ONLY_LABEL),
-        else_=NO_CAUSE_LABEL,
-    )
-    english = case(
-        (cause.c.cause_normalised.isnot(None), cause.c.cause_en),
-        else_=None,
-    )
+    label, english = cause_labels()
 
     return (
         select(
@@ -309,13 +323,17 @@ def broken_series(rows: list[Row]) -> list[str]:
     Reported rather than repaired: a reader looking at a column of counts that goes to
     zero needs to know whether the fires stopped or the category did.
     """
-    seasons = sorted({row.season for row in rows if row.season is not None})
-    if not seasons:
+    return broken_causes((row.season, row.cause, row.fires) for row in rows)
+
+
+def broken_causes(counted: Iterable[tuple[int | None, str, int]]) -> list[str]:
+    """:func:`broken_series` over ``(season, cause, fires)``, from whichever rows."""
+    counted = [(season, cause, fires) for season, cause, fires in counted
+               if season is not None]
+    if not counted:
         return []
-    before = {row.cause for row in rows
-              if row.season is not None and row.season < 2023 and row.fires}
-    after = {row.cause for row in rows
-             if row.season is not None and row.season >= 2023 and row.fires}
+    before = {cause for season, cause, fires in counted if season < 2023 and fires}
+    after = {cause for season, cause, fires in counted if season >= 2023 and fires}
     renamed = set(SCHEME_SUCCESSORS) | set(SCHEME_SUCCESSORS.values())
     return sorted((before ^ after) & renamed)
 
@@ -422,23 +440,48 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
     return args
 
 
+def warn_of_broken_series(broken: list[str], logger: logging.Logger) -> None:
+    """Say which cause series the 2023-2024 renumbering cuts, if any."""
+    if broken:
+        logger.warning(
+            "%d cause series stop or start at the 2023-2024 renumbering (%s). The "
+            "zeros on either side of it are the category changing, not the fires. "
+            "Pass --bridge-schemes to join them deliberately",
+            len(broken), ", ".join(broken[:6]))
+
+
 def report(args: argparse.Namespace, engine: Engine,
-           logger: logging.Logger) -> list[Row]:
-    """Compute and write the report."""
+           logger: logging.Logger) -> list[Row] | list[report_engine.ReportRow]:
+    """Compute and write the report.
+
+    Run with the options of the ``causes`` report of
+    :mod:`~src.apps.statistics.wildfires.chile_conaf.reports` — the defaults — it is
+    that report: computed and written by :mod:`src.apps.statistics.engine`, and
+    returned as its rows. Any other option is computed and written here.
+    """
     common.require_tables(engine, ["conaf_wildfire", "conaf_fire_cause"], logger)
+    # Imported here: the description is built from this module's expressions.
+    from src.apps.statistics.wildfires.chile_conaf import reports
+    described = reports.PROVIDER.report("causes")
+    if report_engine.covers(described, args):
+        with Session(engine) as session:
+            rows = report_engine.compute_one(session, reports.PROVIDER, described.name,
+                                             args.season, logger)
+        if rows:
+            warn_of_broken_series(broken_causes(
+                (row.keys["season"], row.keys["cause"], row.values["fires"])
+                for row in rows), logger)
+            report_engine.write(reports.PROVIDER, described, rows, args.csv, args.docx,
+                                logger)
+        return rows
+
     with Session(engine) as session:
         rows = compute(session, args.season, logger, args.bridge_schemes)
     if not rows:
         return rows
 
     if not args.bridge_schemes:
-        broken = broken_series(rows)
-        if broken:
-            logger.warning(
-                "%d cause series stop or start at the 2023-2024 renumbering (%s). The "
-                "zeros on either side of it are the category changing, not the fires. "
-                "Pass --bridge-schemes to join them deliberately",
-                len(broken), ", ".join(broken[:6]))
+        warn_of_broken_series(broken_series(rows), logger)
 
     if args.cause is not None:
         wanted = chile_conaf.normalise(args.cause)
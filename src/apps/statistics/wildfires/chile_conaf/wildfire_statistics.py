@@ -84,7 +84,10 @@ from sqlalchemy.orm import Session
 import src.settings  # noqa: F401  (imported for the side effect of loading .env)
 
 from src.apps.imports import common
+from src.apps.statistics import cache
+from src.apps.statistics import engine as report_engine
 from src.data_model.geography.admin_boundary import AdminBoundary
+from src.data_model.geography.admin_boundary import AdminBoundaryPart
 from src.data_model.ignition import Ignition
 from src.data_model.wildfire import Wildfire
 from src.providers import chile_conaf
@@ -211,12 +214,17 @@ def country_columns(source: str) -> tuple[ColumnElement, list]:
             f"unknown country source {source!r}; expected one of "
             f"{', '.join(COUNTRY_SOURCES)}")
 
-    # LATERAL ... LIMIT 1 rather than a plain join: a point on a shared border can
-    # satisfy ST_Contains for two countries, and one fire must not become two rows.
+    # LATERAL ... LIMIT 1 rather than a plain join: a point on a shared border, or
+    # on a cut between two pieces of one country, intersects two pieces, and one
+    # fire must not become two rows. The pieces are admin_boundary_part's, a few
+    # hundred vertices each, so the test never walks Chile's whole coastline.
     containing = (
         select(AdminBoundary.name.label("name"))
-        .where(AdminBoundary.level == COUNTRY_LEVEL)
-        .where(func.ST_Contains(AdminBoundary.geometry, Ignition.__table__.c.geometry))
+        .select_from(AdminBoundaryPart)
+        .join(AdminBoundary, AdminBoundary.id == AdminBoundaryPart.admin_boundary_id)
+        .where(AdminBoundaryPart.level == COUNTRY_LEVEL)
+        .where(func.ST_Intersects(AdminBoundaryPart.geometry,
+                                  Ignition.__table__.c.geometry))
         .limit(1)
         .lateral("containing_country")
     )
@@ -530,6 +538,8 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument("--country-source", choices=COUNTRY_SOURCES,
                         default=COUNTRY_SOURCE_GEOMETRY, help=argparse.SUPPRESS)
 
+    cache.add_cache_arguments(parser)
+
     output = parser.add_argument_group("output")
     output.add_argument("--csv", type=Path, help="write the report to this .csv")
     output.add_argument("--docx", type=Path, help="write the report to this .docx")
@@ -546,14 +556,38 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
 
 
 def report(args: argparse.Namespace, engine: Engine,
-           logger: logging.Logger) -> list[Row]:
-    """Compute and write the report."""
-    common.require_tables(engine, ["wildfire", "conaf_wildfire", "admin_boundary"],
-                          logger)
+           logger: logging.Logger) -> list[Row] | list[report_engine.ReportRow]:
+    """Compute and write the report.
+
+    Run with the options of the ``statistics`` report of
+    :mod:`~src.apps.statistics.wildfires.chile_conaf.reports` — the defaults — it is
+    that report: computed and written by :mod:`src.apps.statistics.engine`, and
+    returned as its rows. Any other option is computed and written here.
+    """
+    common.require_tables(engine, ["wildfire", "conaf_wildfire", "admin_boundary",
+                                   "admin_boundary_part"], logger)
+    # Imported here: the description is built from this module's expressions.
+    from src.apps.statistics.wildfires.chile_conaf import reports
+    described = reports.PROVIDER.report("statistics")
+    if report_engine.covers(described, args):
+        with Session(engine) as session:
+            rows = cache.cached_compute(
+                session, args, [chile_conaf],
+                lambda: report_engine.compute_one(session, reports.PROVIDER, described.name,
+                                                  args.season, logger),
+                logger)
+        if rows:
+            report_engine.write(reports.PROVIDER, described, rows, args.csv, args.docx,
+                                logger)
+        return rows
+
     with Session(engine) as session:
-        rows = compute(session, args.season, args.surface, logger,
-                       args.country_source, args.dated_only, args.min_area,
-                       args.reporter)
+        rows = cache.cached_compute(
+            session, args, [chile_conaf],
+            lambda: compute(session, args.season, args.surface, logger,
+                            args.country_source, args.dated_only, args.min_area,
+                            args.reporter),
+            logger)
     if not rows:
         return rows
     if args.csv:
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""CONAF's *incendio de magnitud* report, described for the shared report engine.
+
+:mod:`~src.apps.statistics.wildfires.chile_conaf_magnitud.wildfire_statistics` runs
+one statement per season. Described here as a
+:class:`~src.apps.statistics.engine.Provider`, it is answered by
+:mod:`src.apps.statistics.run_reports` from one grouped pass beside the seasonal
+reports' own, and prints the same rows — the tests hold it to it: each country, its
+seasons oldest first, and its ``Total`` where it has more than one.
+
+What the engine does not have is the application's options. This is the report as it
+runs by default: the published area (``--area-method published``), every perimeter
+(no ``--min-area`` or ``--bound-only``), and the country by the containment of a
+point on the perimeter's surface. Run that way, the application computes and writes
+it through the engine; with any other option, it still does so itself.
+
+The source
+----------
+
+One row per perimeter in a country, with its season, its mapped hectares and the
+filed hectares of the report it is bound to. The report is joined outer, as the
+application joins it, so an unbound perimeter is counted and adds nothing to
+``Reported (ha)``; the country is joined inner, so a perimeter in no country is in
+neither. Seven hundred perimeters are one ``LATERAL`` lookup each in a single pass as
+in one per season.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import Select
+from sqlalchemy import func
+from sqlalchemy import select
+
+from src.apps.statistics import engine
+from src.apps.statistics.wildfires.chile_conaf.wildfire_statistics import (
+    COUNTRY_SOURCE_GEOMETRY)
+from src.apps.statistics.wildfires.chile_conaf.wildfire_statistics import season_label
+from src.apps.statistics.wildfires.chile_conaf_magnitud.wildfire_statistics import (
+    AREA_METHOD_LABELS)
+from src.apps.statistics.wildfires.chile_conaf_magnitud.wildfire_statistics import (
+    AREA_METHOD_PUBLISHED)
+from src.apps.statistics.wildfires.chile_conaf_magnitud.wildfire_statistics import SEASON
+from src.apps.statistics.wildfires.chile_conaf_magnitud.wildfire_statistics import (
+    burnt_area)
+from src.apps.statistics.wildfires.chile_conaf_magnitud.wildfire_statistics import (
+    country_columns)
+from src.data_model.wildfire import Wildfire
+from src.providers import chile_conaf_magnitud
+from src.providers.chile_conaf.wildfire import ConafWildfire
+from src.providers.chile_conaf_magnitud.wildfire import ConafMagnitudWildfire
+
+#: How :mod:`src.apps.statistics.run_reports` names this provider.
+PROVIDER_NAME = "chile_conaf_magnitud"
+
+
+def source(season: int | None) -> Select:
+    """Every mapped perimeter in a country, or one season's."""
+    magnitud = ConafMagnitudWildfire.__table__
+    report_table = ConafWildfire.__table__
+    country_name, joins = country_columns(COUNTRY_SOURCE_GEOMETRY)
+
+    query = (
+        select(
+            country_name.label("country"),
+            SEASON.label("season"),
+            burnt_area(AREA_METHOD_PUBLISHED).label("area"),
+            magnitud.c.conaf_wildfire_id.isnot(None).label("bound"),
+            report_table.c.area_ha_total.label("reported"),
+        )
+        .select_from(magnitud)
+        .join(Wildfire.__table__, Wildfire.__table__.c.id == magnitud.c.id)
+        .join(report_table, report_table.c.id == magnitud.c.conaf_wildfire_id,
+              isouter=True)
+    )
+    for target, condition in joins:
+        query = query.join(target, condition)
+    if season is not None:
+        query = query.where(SEASON == season)
+    return query
+
+
+PROVIDER = engine.register(engine.Provider(
+    name=PROVIDER_NAME,
+    source=source,
+    dimensions=(
+        engine.Dimension("country", "Country"),
+        engine.Dimension("season", "Season", season_label),
+    ),
+    measures=(
+        engine.Measure("fires", "Fires", lambda c: func.count()),
+        engine.Measure("bound", "Bound", lambda c: func.count(),
+                       condition=lambda c: c.bound),
+        engine.Measure("minimum", "Minimum (ha)", lambda c: func.min(c.area),
+                       kind=engine.KIND_HECTARES),
+        engine.Measure("maximum", "Maximum (ha)", lambda c: func.max(c.area),
+                       kind=engine.KIND_HECTARES),
+        engine.Measure("mapped", "Mapped (ha)", lambda c: func.sum(c.area),
+                       kind=engine.KIND_HECTARES, default=0.0),
+        engine.Measure("reported", "Reported (ha)", lambda c: func.sum(c.reported),
+                       kind=engine.KIND_HECTARES, default=0.0),
+    ),
+    reports=(
+        engine.ReportDefinition(
+            name="statistics",
+            title="CONAF mapped burnt area, incendios de magnitud (Chile)",
+            rows=("country", "season"),
+            columns=("fires", "bound", "minimum", "maximum", "mapped", "reported"),
+            total_over="season",
+            totals=engine.TOTALS_PER_GROUP,
+            notes=(
+                f"Areas in hectares, measured {AREA_METHOD_LABELS[AREA_METHOD_PUBLISHED]}. "
+                f"Seasons run 1 July to 30 June. Fires not attributable to a country are "
+                f"excluded.",
+                f"CONAF maps the fires that reached about "
+                f"{chile_conaf_magnitud.MAGNITUD_THRESHOLD_HA:g} hectares, and does not "
+                f"map all of them, so these totals are the area mapped and not the area "
+                f"burnt. The Reported column is the same fires' own filed figures, "
+                f"reached through the binding, and covers the Bound column's fires only.",
+            ),
+            options={"area_method": AREA_METHOD_PUBLISHED, "min_area": None,
+                     "bound_only": False, "country_source": COUNTRY_SOURCE_GEOMETRY},
+        ),
+    ),
+    tables=("wildfire", "conaf_magnitud_wildfire", "conaf_wildfire", "admin_boundary",
+            "admin_boundary_part"),
+))
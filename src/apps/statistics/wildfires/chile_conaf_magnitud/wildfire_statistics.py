@@ -69,11 +69,9 @@ import sys
 from dataclasses import dataclass
 from pathlib import Path
 
-from geoalchemy2 import Geography
 from sqlalchemy import ColumnElement
 from sqlalchemy import Engine
 from sqlalchemy import Select
-from sqlalchemy import cast
 from sqlalchemy import create_engine
 from sqlalchemy import func
 from sqlalchemy import select
@@ -83,6 +81,8 @@ from sqlalchemy.orm import Session
 import src.settings  # noqa: F401  (imported for the side effect of loading .env)
 
 from src.apps.imports import common
+from src.apps.statistics import cache
+from src.apps.statistics import engine as report_engine
 from src.apps.statistics.wildfires.chile_conaf.wildfire_statistics import COUNTRY_LEVEL
 from src.apps.statistics.wildfires.chile_conaf.wildfire_statistics import COUNTRY_SOURCES
 from src.apps.statistics.wildfires.chile_conaf.wildfire_statistics import (
@@ -92,7 +92,9 @@ from src.apps.statistics.wildfires.chile_conaf.wildfire_statistics import (
 from src.apps.statistics.wildfires.chile_conaf.wildfire_statistics import TOTAL_LABEL
 from src.apps.statistics.wildfires.chile_conaf.wildfire_statistics import season_label
 from src.data_model.geography.admin_boundary import AdminBoundary
+from src.data_model.geography.admin_boundary import AdminBoundaryPart
 from src.data_model.wildfire import Wildfire
+from src.providers import chile_conaf
 from src.providers import chile_conaf_magnitud
 from src.providers.chile_conaf.wildfire import ConafWildfire
 from src.providers.chile_conaf_magnitud.wildfire import ConafMagnitudWildfire
@@ -150,17 +152,11 @@ def burnt_area(method: str) -> ColumnElement:
     ``wildfire`` row rather than from the published grid copy, so that they mean the
     same thing for a mainland fire and for the Easter Island one — which are on
     different grids and could not otherwise be added together.
-
-    The geodesic cast carries the geometry type and SRID rather than being a bare
-    ``Geography()``: that renders as ``geography(GEOMETRY,-1)``, which PostGIS rejects,
-    because -1 is not a SRID it knows.
     """
     if method == AREA_METHOD_PUBLISHED:
         return ConafMagnitudWildfire.__table__.c.area_ha_mapped
     if method == AREA_METHOD_GEODESIC:
-        square_metres = func.ST_Area(
-            cast(Wildfire.__table__.c.perimeter,
-                 Geography(geometry_type="MULTIPOLYGON", srid=4326)))
+        square_metres = Wildfire.__table__.c.perimeter_area_m2
     elif method == AREA_METHOD_EQUAL_AREA:
         square_metres = func.ST_Area(
             func.ST_Transform(Wildfire.__table__.c.perimeter, EQUAL_AREA_SRID))
@@ -198,9 +194,11 @@ def country_columns(source: str) -> tuple[ColumnElement, list]:
 
     containing = (
         select(AdminBoundary.name.label("name"))
-        .where(AdminBoundary.level == COUNTRY_LEVEL)
-        .where(func.ST_Contains(AdminBoundary.geometry,
-                                func.ST_PointOnSurface(Wildfire.__table__.c.perimeter)))
+        .select_from(AdminBoundaryPart)
+        .join(AdminBoundary, AdminBoundary.id == AdminBoundaryPart.admin_boundary_id)
+        .where(AdminBoundaryPart.level == COUNTRY_LEVEL)
+        .where(func.ST_Intersects(AdminBoundaryPart.geometry,
+                                  func.ST_PointOnSurface(Wildfire.__table__.c.perimeter)))
         .limit(1)
         .lateral("containing_country")
     )
@@ -466,6 +464,8 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument("--country-source", choices=COUNTRY_SOURCES,
                         default=COUNTRY_SOURCE_GEOMETRY, help=argparse.SUPPRESS)
 
+    cache.add_cache_arguments(parser)
+
     output = parser.add_argument_group("output")
     output.add_argument("--csv", type=Path, help="write the report to this .csv")
     output.add_argument("--docx", type=Path, help="write the report to this .docx")
@@ -482,20 +482,43 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
 
 
 def report(args: argparse.Namespace, engine: Engine,
-           logger: logging.Logger) -> list[Row]:
-    """Compute and write the report."""
+           logger: logging.Logger) -> list[Row] | list[report_engine.ReportRow]:
+    """Compute and write the report.
+
+    Run with the options of the ``statistics`` report of
+    :mod:`~src.apps.statistics.wildfires.chile_conaf_magnitud.reports` — the defaults —
+    it is that report: computed and written by :mod:`src.apps.statistics.engine`, and
+    returned as its rows. Any other option is computed and written here.
+    """
     common.require_tables(engine, ["wildfire", "conaf_magnitud_wildfire",
-                                   "conaf_wildfire", "admin_boundary"], logger)
+                                   "conaf_wildfire", "admin_boundary",
+                                   "admin_boundary_part"], logger)
+    # Imported here: the description is built from this module's expressions.
+    from src.apps.statistics.wildfires.chile_conaf_magnitud import reports
+    described = reports.PROVIDER.report("statistics")
+    covered = report_engine.covers(described, args)
     with Session(engine) as session:
-        rows = compute(session, args.season, args.area_method, logger,
-                       args.country_source, args.min_area, args.bound_only)
+        if covered:
+            def run() -> list[report_engine.ReportRow]:
+                return report_engine.compute_one(session, reports.PROVIDER,
+                                                 described.name, args.season, logger)
+        else:
+            def run() -> list[Row]:
+                return compute(session, args.season, args.area_method, logger,
+                               args.country_source, args.min_area, args.bound_only)
+        rows = cache.cached_compute(
+            session, args, [chile_conaf_magnitud, chile_conaf], run,
+            logger, bindings=[ConafMagnitudWildfire.matched_at])
     if not rows:
         return rows
-    if args.csv:
-        write_csv(rows, args.csv, logger)
-    if args.docx:
-        write_docx(rows, args.docx, args.season, args.area_method, logger,
-                   args.min_area, args.bound_only)
+    if covered:
+        report_engine.write(reports.PROVIDER, described, rows, args.csv, args.docx, logger)
+    else:
+        if args.csv:
+            write_csv(rows, args.csv, logger)
+        if args.docx:
+            write_docx(rows, args.docx, args.season, args.area_method, logger,
+                       args.min_area, args.bound_only)
     return rows
 
 
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""The Global Fire Atlas's burnt-area report, described for the shared report engine.
+
+:mod:`~src.apps.statistics.wildfires.gfa.wildfire_statistics`, described as a
+:class:`~src.apps.statistics.engine.Provider` the same way as
+:mod:`GWIS's <src.apps.statistics.wildfires.gwis.reports>`. It prints the same rows
+as the application run with ``--country-source reported`` and the default geodesic
+areas — the tests hold it to it.
+
+What the engine does not have is the application's options: ``--country``,
+``--area-method equal-area``, ``--from-summary``, ``--split-area`` and ``--jobs``. Run
+with ``--country-source reported`` and none of those, the application computes and
+writes its report through the engine; with any of them, it still measures a year at a
+time itself.
+
+Which country a fire counts towards
+-----------------------------------
+
+The one the import stored, for the reason the GWIS module gives: the application's
+``geometry`` default, in one grouped statement over the Atlas, is the statement that
+was killed for its memory. For the Atlas the two modes are **not** always the same
+answer. The stored country is that of the fire's ignition point, and a fire that
+ignited on one side of a border and burnt across it is in that country here, where
+``--country-source geometry`` may put it in the other; ``--split-area`` puts it in
+both.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import Select
+from sqlalchemy import func
+from sqlalchemy import select
+
+from src.apps.statistics import engine
+from src.apps.statistics.wildfires.gfa.wildfire_statistics import AREA_METHOD_GEODESIC
+from src.apps.statistics.wildfires.gfa.wildfire_statistics import (
+    COUNTRY_SOURCE_REPORTED)
+from src.apps.statistics.wildfires.gfa.wildfire_statistics import LOCAL_YEAR
+from src.apps.statistics.wildfires.gfa.wildfire_statistics import WORLD_LABEL
+from src.apps.statistics.wildfires.gfa.wildfire_statistics import burnt_area
+from src.apps.statistics.wildfires.gfa.wildfire_statistics import country_columns
+from src.data_model.wildfire import Wildfire
+from src.providers.gfa.wildfire import GfaWildfire
+
+#: How :mod:`src.apps.statistics.run_reports` names this provider.
+PROVIDER_NAME = "gfa"
+
+
+def source(year: int | None) -> Select:
+    """Every Atlas fire with a perimeter and a country, or one local year's."""
+    gfa_fire = GfaWildfire.__table__
+    country_name, _, joins = country_columns(COUNTRY_SOURCE_REPORTED)
+
+    query = (
+        select(
+            country_name.label("country"),
+            LOCAL_YEAR.label("year"),
+            burnt_area(AREA_METHOD_GEODESIC).label("area"),
+        )
+        .select_from(Wildfire)
+        .join(gfa_fire, gfa_fire.c.id == Wildfire.id)
+        .where(Wildfire.perimeter.is_not(None))
+    )
+    for target, condition, is_outer in joins:
+        query = query.outerjoin(target, condition) if is_outer \
+            else query.join(target, condition)
+    if year is not None:
+        query = query.where(LOCAL_YEAR == year)
+    return query
+
+
+PROVIDER = engine.register(engine.Provider(
+    name=PROVIDER_NAME,
+    source=source,
+    dimensions=(
+        engine.Dimension("country", "Country", total_label=WORLD_LABEL, collated=True),
+        engine.Dimension("year", "Year", descending=True),
+    ),
+    measures=(
+        engine.Measure("fires", "Fires", lambda c: func.count()),
+        engine.Measure("minimum", "Minimum (ha)", lambda c: func.min(c.area),
+                       kind=engine.KIND_HECTARES),
+        engine.Measure("maximum", "Maximum (ha)", lambda c: func.max(c.area),
+                       kind=engine.KIND_HECTARES),
+        engine.Measure("total", "Total (ha)", lambda c: func.sum(c.area),
+                       kind=engine.KIND_HECTARES, default=0.0),
+    ),
+    reports=(
+        engine.ReportDefinition(
+            name="statistics",
+            title="Global Fire Atlas wildfire burnt area",
+            rows=("country", "year"),
+            columns=("fires", "minimum", "maximum", "total"),
+            total_over="year",
+            totals=engine.TOTALS_ALWAYS,
+            block_over="country",
+            notes=(
+                "Areas in hectares, computed geodesically on the WGS84 ellipsoid. "
+                "Fires not attributable to a country are excluded; a fire counts "
+                "towards the country of its ignition point, stored at import, and a "
+                "fire that burnt across a border is wholly in that country.",
+            ),
+            options={"country_source": COUNTRY_SOURCE_REPORTED, "country": None,
+                     "area_method": AREA_METHOD_GEODESIC, "from_summary": False,
+                     "split_area": False},
+        ),
+    ),
+    tables=("wildfire", "gfa_wildfire", "admin_boundary", "ocha_admin_boundary"),
+))
@@ -128,11 +128,9 @@ by the two, which makes the pair a useful way to find such fires.
 
 .. note::
 
-   Both modes attribute a fire's **whole** area to one country. Splitting a
-   border-crossing fire between the countries it actually burnt in is a different
-   and larger question, and this report does not attempt it: ``Total (ha)`` is
+   Both modes attribute a fire's **whole** area to one country: ``Total (ha)`` is
    the area of fires attributed to a country, not the area burnt inside its
-   borders.
+   borders. ``--split-area`` reports the latter; see below.
 
 Which fires are counted
 -----------------------
@@ -178,9 +176,48 @@ slightly slower is worth any number of runs that do not finish at all.
 Nothing about the figures changes. ``count``, ``sum``, ``min`` and ``max`` all
 decompose over a partition of the fires, so a country's ``Total`` row and the
 whole World block are exactly the numbers ``GROUPING SETS`` returned, from the
-same rows. Every statement runs in one transaction and so against one snapshot,
-which is what keeps a report built from twenty-five queries as consistent as one
-built from a single query.
+same rows. Every statement runs in one ``REPEATABLE READ`` transaction and so
+against one snapshot, which is what keeps a report built from twenty-five queries
+as consistent as one built from a single query.
+
+``--jobs N`` measures N of the twenty-five years at once, on N connections. They
+stay on that one snapshot: the report's transaction exports it with
+``pg_export_snapshot()`` and each worker imports it with ``SET TRANSACTION
+SNAPSHOT`` before it measures anything, the report's own transaction being held
+open until they are all done. What it does not change is the memory: each worker
+is a year's statement, so eight workers are eight gigabytes or so, and it was
+memory this layout was chosen to keep down. Raise it as far as the server has
+both the cores and the room.
+
+Reading from the summary
+------------------------
+
+``--from-summary --country-source reported`` reads the figures from
+``wildfire_yearly_summary`` — per stored country and local year, the count,
+minimum, maximum and total geodesic area — which the importer recomputes for the
+years of every shapefile it imports. It is the GWIS report's fast path, with one
+more case it cannot serve: the summary holds geodesic areas, so
+``--area-method equal-area`` measures the fires as usual, as does
+``--country-source geometry`` and a summary that holds nothing for GFA.
+
+The area burnt inside each country
+----------------------------------
+
+``--split-area`` splits each fire between the countries it burnt in and reports
+the area burnt inside each, as the
+:mod:`GWIS report <src.apps.statistics.wildfires.gwis.wildfire_statistics>` does
+and from the same table: ``wildfire_boundary_area``, which the importer fills for
+the years of every shapefile it imports, intersecting only the perimeters whose
+bounding box crosses a border (see
+:func:`~src.apps.imports.common.refresh_boundary_areas`). A report is then a
+``GROUP BY`` over it. For the Atlas this is the mode that settles what
+``reported`` and ``geometry`` disagree about: a fire that ignited on one side of a
+border and burnt across it is in both countries, with the area it burnt in each.
+
+A border fire is counted in every country it reached, and a country's minimum and
+maximum are of the parts of fires inside it; the World block counts each fire
+once. The areas are geodesic, so the mode does not combine with ``--area-method
+equal-area``, nor with ``--from-summary``, and ignores ``--country-source``.
 """
 
 from __future__ import annotations
@@ -195,7 +232,6 @@ import sys
 from dataclasses import dataclass
 from pathlib import Path
 
-from geoalchemy2 import Geography
 from sqlalchemy import ColumnElement
 from sqlalchemy import Engine
 from sqlalchemy import Integer
@@ -211,8 +247,18 @@ from sqlalchemy.orm import Session
 import src.settings  # noqa: F401  (imported for the side effect of loading .env)
 
 from src.apps.imports import common
+from src.apps.statistics import cache
+from src.apps.statistics import engine as report_engine
+from src.data_model.data_provider import DataProvider
 from src.data_model.geography.admin_boundary import AdminBoundary
+from src.data_model.geography.admin_boundary import AdminBoundaryPart
 from src.data_model.wildfire import Wildfire
+from src.data_model.wildfire_boundary_area import WildfireBoundaryArea
+from src.data_model.wildfire_yearly_summary import SURFACE_PERIMETER
+from src.data_model.wildfire_yearly_summary import WildfireYearlySummary
+from src.providers import gfa
+from src.providers.gfa import PROVIDER_NAME
+from src.providers.gfa import PROVIDER_PRODUCT
 from src.providers.gfa.wildfire import GfaWildfire
 from src.providers.ocha.admin_boundary import OchaAdminBoundary
 
@@ -226,6 +272,12 @@ TOTAL_LABEL = "Total"
 #: figures you have nothing to read a single country's against.
 WORLD_LABEL = "World"
 
+#: Why a report is refused when no fire matched: almost always a mistyped country or
+#: a year with no data, and writing an empty file would hide that.
+NOTHING_MATCHED = ("No wildfires matched. Check --country (a name or an ISO alpha-3 code) "
+                   "and --year, and that the GFA fires and the OCHA boundaries are both "
+                   "imported — fires with no country are not counted.")
+
 #: The report's columns, in order, shared by both output formats so that a change
 #: to one cannot silently leave the other behind.
 #:
@@ -294,17 +346,9 @@ def burnt_area(method: str) -> ColumnElement:
     ------
     ValueError
         If ``method`` is not one of :data:`AREA_METHODS`.
-
-    Notes
-    -----
-    The geodesic cast carries the geometry type and SRID rather than being a bare
-    ``Geography()``: that renders as ``geography(GEOMETRY,-1)``, which PostGIS
-    rejects, because -1 is not a SRID it knows.
     """
     if method == AREA_METHOD_GEODESIC:
-        square_metres = func.ST_Area(
-            cast(Wildfire.perimeter, Geography(geometry_type="MULTIPOLYGON", srid=4326))
-        )
+        square_metres = Wildfire.perimeter_area_m2
     elif method == AREA_METHOD_EQUAL_AREA:
         square_metres = func.ST_Area(func.ST_Transform(Wildfire.perimeter, EQUAL_AREA_SRID))
     else:
@@ -370,9 +414,8 @@ def country_columns(source: str) -> tuple[ColumnElement, ColumnElement, list]:
     crosses a border**. Both modes attribute the whole burnt area to one country,
     and for GFA they may pick different ones — ``reported`` follows the ignition
     point, ``geometry`` follows an interior point of the perimeter. Splitting the
-    area between the countries it actually burnt in is a different and larger
-    question, and this report does not attempt it: ``Total (ha)`` is the area of
-    fires attributed to a country, not the area burnt inside its borders.
+    area between the countries it actually burnt in is ``--split-area``'s business
+    and not this function's (see :func:`split_query`).
     """
     ocha_boundary = OchaAdminBoundary.__table__
 
@@ -389,16 +432,18 @@ def country_columns(source: str) -> tuple[ColumnElement, ColumnElement, list]:
             f"unknown country source {source!r}; expected one of {', '.join(COUNTRY_SOURCES)}"
         )
 
-    # LATERAL ... LIMIT 1 rather than a plain join: a point on a shared border can
-    # satisfy ST_Contains for two countries, and one fire must not become two rows.
+    # LATERAL ... LIMIT 1 rather than a plain join: a point on a shared border, or
+    # on a cut between two pieces of one country, intersects two admin_boundary_part
+    # rows, and one fire must not become two rows.
     # The join is inner, which is what drops a fire that is inside no country at
     # all — the same rule ``reported`` gets from its inner join to admin_boundary.
     containing = (
         select(AdminBoundary.name.label("name"), ocha_boundary.c.iso_3.label("iso_3"))
-        .select_from(AdminBoundary)
+        .select_from(AdminBoundaryPart)
+        .join(AdminBoundary, AdminBoundary.id == AdminBoundaryPart.admin_boundary_id)
         .join(ocha_boundary, ocha_boundary.c.id == AdminBoundary.id)
-        .where(AdminBoundary.level == COUNTRY_LEVEL)
-        .where(func.ST_Contains(AdminBoundary.geometry, LOCATOR))
+        .where(AdminBoundaryPart.level == COUNTRY_LEVEL)
+        .where(func.ST_Intersects(AdminBoundaryPart.geometry, LOCATOR))
         .limit(1)
         .lateral("containing")
     )
@@ -515,6 +560,177 @@ def statistics_query(country: str | None, year: int,
     )
 
 
+def summary_query(country: str | None, year: int | None) -> Select:
+    """Build the statistics query over ``wildfire_yearly_summary``.
+
+    Returns
+    -------
+    Select
+        A query yielding ``country, year, minimum, maximum, total, fires``: one
+        row per country and year, unordered — the rows :func:`statistics_query`
+        returns for every year at once, with geodesic areas under
+        ``--country-source reported``.
+
+    Notes
+    -----
+    A country's figures are combined from its boundaries' rows the way
+    :func:`combine` combines years, which is what grouping by name needs and what
+    the raw query does.
+    """
+    summary = WildfireYearlySummary.__table__
+    ocha_boundary = OchaAdminBoundary.__table__
+
+    rows = (
+        select(
+            AdminBoundary.name.label("country"),
+            summary.c.year,
+            (func.min(summary.c.minimum_m2) / SQUARE_METRES_PER_HECTARE).label("minimum"),
+            (func.max(summary.c.maximum_m2) / SQUARE_METRES_PER_HECTARE).label("maximum"),
+            (func.sum(summary.c.total_m2) / SQUARE_METRES_PER_HECTARE).label("total"),
+            func.sum(summary.c.fires).label("fires"),
+        )
+        .select_from(summary)
+        .join(DataProvider, DataProvider.id == summary.c.data_provider_id)
+        .join(AdminBoundary, AdminBoundary.id == summary.c.admin_boundary_id)
+        .outerjoin(ocha_boundary, ocha_boundary.c.id == AdminBoundary.id)
+        .where(DataProvider.name == PROVIDER_NAME)
+        .where(DataProvider.product == PROVIDER_PRODUCT)
+        .where(summary.c.surface == SURFACE_PERIMETER)
+        .group_by(AdminBoundary.name, summary.c.year)
+    )
+    if year is not None:
+        rows = rows.where(summary.c.year == year)
+    if country is not None:
+        rows = rows.where(or_(
+            func.lower(AdminBoundary.name) == country.lower(),
+            func.upper(ocha_boundary.c.iso_3) == country.upper(),
+        ))
+    return rows
+
+
+def summary_is_kept(session: Session) -> bool:
+    """Whether ``wildfire_yearly_summary`` holds anything for GFA at all.
+
+    An empty summary is a database imported before the table existed, not a
+    dataset without fires, and a report read from it would say nothing burnt.
+    """
+    summary = WildfireYearlySummary.__table__
+    return session.scalar(
+        select(summary.c.year)
+        .join(DataProvider, DataProvider.id == summary.c.data_provider_id)
+        .where(DataProvider.name == PROVIDER_NAME)
+        .where(DataProvider.product == PROVIDER_PRODUCT)
+        .limit(1)
+    ) is not None
+
+
+def split_query(country: str | None, year: int | None) -> Select:
+    """Build the ``--split-area`` query over ``wildfire_boundary_area``.
+
+    Returns
+    -------
+    Select
+        A query yielding ``country, year, minimum, maximum, total, fires``: one row
+        per country and year, unordered, in the shape :func:`summary_query` returns.
+        A fire is in the row of every country it burnt in, with the area it burnt
+        there.
+
+    Notes
+    -----
+    A plain ``GROUP BY`` over rows the importer keeps: nothing here touches a
+    geometry. ``count(DISTINCT wildfire_id)`` rather than ``count(*)`` for the case
+    of one country being several boundaries of the same name, where a fire
+    burning across the line between them must still be one fire of that country.
+    """
+    areas = WildfireBoundaryArea.__table__
+    ocha_boundary = OchaAdminBoundary.__table__
+
+    rows = (
+        select(
+            AdminBoundary.name.label("country"),
+            areas.c.year,
+            (func.min(areas.c.area_m2) / SQUARE_METRES_PER_HECTARE).label("minimum"),
+            (func.max(areas.c.area_m2) / SQUARE_METRES_PER_HECTARE).label("maximum"),
+            (func.sum(areas.c.area_m2) / SQUARE_METRES_PER_HECTARE).label("total"),
+            func.count(areas.c.wildfire_id.distinct()).label("fires"),
+        )
+        .select_from(areas)
+        .join(DataProvider, DataProvider.id == areas.c.data_provider_id)
+        .join(AdminBoundary, AdminBoundary.id == areas.c.admin_boundary_id)
+        .outerjoin(ocha_boundary, ocha_boundary.c.id == AdminBoundary.id)
+        .where(DataProvider.name == PROVIDER_NAME)
+        .where(DataProvider.product == PROVIDER_PRODUCT)
+        .where(areas.c.level == COUNTRY_LEVEL)
+        .group_by(AdminBoundary.name, areas.c.year)
+    )
+    if year is not None:
+        rows = rows.where(areas.c.year == year)
+    if country is not None:
+        rows = rows.where(or_(
+            func.lower(AdminBoundary.name) == country.lower(),
+            func.upper(ocha_boundary.c.iso_3) == country.upper(),
+        ))
+    return rows
+
+
+def split_world_query(year: int | None) -> Select:
+    """Build the World rows of a ``--split-area`` report.
+
+    Returns
+    -------
+    Select
+        A query yielding ``year, minimum, maximum, total, fires``: one row per year,
+        over every fire that burnt in some country, each once and with the area it
+        burnt on land.
+
+    Notes
+    -----
+    Not combined from the country rows, as :func:`summarise` otherwise builds the
+    World block: a border fire is in two of them, and its parts are not the fire.
+    Summing a fire's parts first gives it back whole, less what burnt outside
+    every country.
+    """
+    areas = WildfireBoundaryArea.__table__
+
+    fires = (
+        select(areas.c.year, func.sum(areas.c.area_m2).label("area_m2"))
+        .join(DataProvider, DataProvider.id == areas.c.data_provider_id)
+        .where(DataProvider.name == PROVIDER_NAME)
+        .where(DataProvider.product == PROVIDER_PRODUCT)
+        .where(areas.c.level == COUNTRY_LEVEL)
+        .group_by(areas.c.wildfire_id, areas.c.year)
+    )
+    if year is not None:
+        fires = fires.where(areas.c.year == year)
+    fire = fires.subquery("fire")
+    return (
+        select(
+            fire.c.year,
+            (func.min(fire.c.area_m2) / SQUARE_METRES_PER_HECTARE).label("minimum"),
+            (func.max(fire.c.area_m2) / SQUARE_METRES_PER_HECTARE).label("maximum"),
+            (func.sum(fire.c.area_m2) / SQUARE_METRES_PER_HECTARE).label("total"),
+            func.count().label("fires"),
+        )
+        .group_by(fire.c.year)
+    )
+
+
+def split_areas_kept(session: Session) -> bool:
+    """Whether ``wildfire_boundary_area`` holds anything for GFA at all.
+
+    For the reason :func:`summary_is_kept` gives: an empty table is a database
+    imported before it existed, not a world without fires.
+    """
+    areas = WildfireBoundaryArea.__table__
+    return session.scalar(
+        select(areas.c.year)
+        .join(DataProvider, DataProvider.id == areas.c.data_provider_id)
+        .where(DataProvider.name == PROVIDER_NAME)
+        .where(DataProvider.product == PROVIDER_PRODUCT)
+        .limit(1)
+    ) is not None
+
+
 @dataclass(frozen=True)
 class Row:
     """One line of the report.
@@ -621,7 +837,8 @@ def ordered_countries(session: Session, names: set[str]) -> list[str]:
     return ordered + sorted(names - set(ordered))
 
 
-def summarise(measured: list[Row], countries: list[str], with_world: bool) -> list[Row]:
+def summarise(measured: list[Row], countries: list[str], with_world: bool,
+              world: list[Row] | None = None) -> list[Row]:
     """Build the report from the years measured: the summary rows, in order.
 
     Parameters
@@ -633,6 +850,9 @@ def summarise(measured: list[Row], countries: list[str], with_world: bool) -> li
     with_world : bool
         Whether to open with the World block. It is dropped when ``--country`` is
         given, where it could only repeat that country's rows word for word.
+    world : list of Row, optional
+        The World block's years, when they are not combined from ``measured`` —
+        under ``--split-area``, where a fire is in the rows of several countries.
 
     Returns
     -------
@@ -641,7 +861,10 @@ def summarise(measured: list[Row], countries: list[str], with_world: bool) -> li
         each country, its years newest first and its summary row last.
     """
     report: list[Row] = []
-    if with_world and measured:
+    if with_world and measured and world is not None:
+        report += sorted(world, key=lambda row: row.year, reverse=True)
+        report.append(combine(world, WORLD_LABEL, None, is_world=True))
+    elif with_world and measured:
         for year in sorted({row.year for row in measured}, reverse=True):
             report.append(combine([row for row in measured if row.year == year],
                                   WORLD_LABEL, year, is_world=True))
@@ -682,6 +905,19 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
                              "mis-attributes a fire cannot mislead the report; 'reported' "
                              "trusts the admin_boundary_id the import stored, which is "
                              "much faster and, for this dataset, the same answer")
+    parser.add_argument("--from-summary", action="store_true",
+                        help="read the figures from the yearly summary the importer keeps "
+                             "instead of measuring every fire; only with --country-source "
+                             "reported and geodesic areas, and measures the fires anyway if "
+                             "the summary is empty")
+    parser.add_argument("--split-area", action="store_true",
+                        help="split each fire between the countries it burnt in and report "
+                             "the area burnt inside each, from the geodesic areas the "
+                             "importer keeps; --country-source does not apply")
+
+    common.add_snapshot_jobs_arguments(parser)
+
+    cache.add_cache_arguments(parser)
 
     output = parser.add_argument_group("output", "at least one is required")
     output.add_argument("--csv", type=Path, help="write the report to this .csv")
@@ -693,15 +929,89 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
                         help="verbosity (env: GISFIRE_LOG_LEVEL, default INFO)")
 
     arguments = parser.parse_args(argv)
+    if arguments.split_area and (arguments.from_summary
+                                 or arguments.area_method != AREA_METHOD_GEODESIC):
+        parser.error("--split-area reads the geodesic areas per country the importer "
+                     "keeps, and combines with neither --from-summary nor --area-method "
+                     f"{AREA_METHOD_EQUAL_AREA}")
     if arguments.csv is None and arguments.docx is None:
         parser.error("nothing to write: pass --csv, --docx, or both")
     return arguments
 
 
+def read_summary(session: Session, country: str | None, year: int | None,
+                 logger: logging.Logger, method: str,
+                 country_source: str) -> list[Row] | None:
+    """The rows :func:`compute` would measure, read from the yearly summary.
+
+    Returns ``None`` when the summary cannot answer the question asked, which
+    tells the caller to measure the fires after all: it holds geodesic areas and
+    the country the import stored, and an empty summary holds nothing.
+    """
+    if method != AREA_METHOD_GEODESIC:
+        logger.info("The summary holds geodesic areas; --area-method %s needs the fires "
+                    "themselves", method)
+        return None
+    if country_source != COUNTRY_SOURCE_REPORTED:
+        logger.info("The summary holds the country the import stored; "
+                    "--country-source %s needs the fires themselves", country_source)
+        return None
+    if not summary_is_kept(session):
+        logger.warning("The yearly summary holds nothing for GFA; measuring the fires instead")
+        return None
+    with common.Spinner("Reading the GFA burnt area from the yearly summary", logger):
+        return [
+            Row(country=record.country, year=record.year,
+                minimum=float(record.minimum),
+                maximum=float(record.maximum),
+                total=float(record.total),
+                fires=int(record.fires))
+            for record in session.execute(summary_query(country, year))
+        ]
+
+
+def read_split_areas(session: Session, country: str | None, year: int | None,
+                     logger: logging.Logger) -> tuple[list[Row], list[Row]]:
+    """The country rows and the World rows of a ``--split-area`` report.
+
+    Raises
+    ------
+    RuntimeError
+        If ``wildfire_boundary_area`` holds nothing for GFA: reporting from it
+        would say that nothing burnt anywhere.
+    """
+    if not split_areas_kept(session):
+        raise RuntimeError(
+            "The areas per country hold nothing for GFA. They are kept by the importer "
+            "from the OCHA boundaries: import the boundaries, then the GFA fires again."
+        )
+    with common.Spinner("Reading the GFA burnt area per country", logger):
+        measured = [
+            Row(country=record.country, year=record.year,
+                minimum=float(record.minimum),
+                maximum=float(record.maximum),
+                total=float(record.total),
+                fires=int(record.fires))
+            for record in session.execute(split_query(country, year))
+        ]
+        world = [
+            Row(country=WORLD_LABEL, year=record.year, is_world=True,
+                minimum=float(record.minimum),
+                maximum=float(record.maximum),
+                total=float(record.total),
+                fires=int(record.fires))
+            for record in session.execute(split_world_query(year))
+        ] if country is None else None
+    return measured, world
+
+
 def compute(session: Session, country: str | None, year: int | None,
             logger: logging.Logger,
             method: str = AREA_METHOD_GEODESIC,
-            country_source: str = COUNTRY_SOURCE_GEOMETRY) -> list[Row]:
+            country_source: str = COUNTRY_SOURCE_GEOMETRY,
+            from_summary: bool = False,
+            jobs: int = 1,
+            split_area: bool = False) -> list[Row]:
     """Measure the fires a year at a time, returning the report's rows in order.
 
     Notes
@@ -710,43 +1020,69 @@ def compute(session: Session, country: str | None, year: int | None,
     under a spinner of its own so that a run of hours says which year it is on
     rather than only that it is alive.
 
-    Every one of them runs in ``session``'s transaction, and so against a single
-    snapshot: a report assembled from twenty-five queries is then exactly as
-    consistent as one assembled from a single query, and an import running
-    alongside it cannot have a fire counted in one year's statement and not in
-    another's.
+    Every one of them reads ``session``'s snapshot, ``jobs`` of them at a time:
+    a report assembled from twenty-five queries is then exactly as consistent as
+    one assembled from a single query, and an import running alongside it cannot
+    have a fire counted in one year's statement and not in another's.
+
+    With ``from_summary`` the per-country, per-year rows are read from
+    ``wildfire_yearly_summary`` instead, when it can answer (see
+    :func:`read_summary`).
+
+    With ``split_area`` nothing is measured: the rows are the area burnt inside
+    each country, read from ``wildfire_boundary_area`` (see
+    :func:`read_split_areas`), and ``country_source`` does not apply.
     """
-    if year is not None:
-        years = [year]
+    world = None
+    if split_area:
+        measured, world = read_split_areas(session, country, year, logger)
+        country_source = "the areas split per country"
     else:
-        with common.Spinner("Finding the years the GFA fires cover", logger):
-            years = list(session.scalars(years_query()))
-
-    scope = country or "every country"
-    measured: list[Row] = []
-    for index, measuring in enumerate(years, start=1):
-        with common.Spinner(f"Measuring the burnt area of the GFA fires "
-                            f"({scope}, {measuring}: {index} of {len(years)})", logger):
-            measured += [
-                Row(country=record.country, year=measuring,
-                    minimum=float(record.minimum),
-                    maximum=float(record.maximum),
-                    total=float(record.total),
-                    fires=record.fires)
-                for record in session.execute(
-                    statistics_query(country, measuring, method, country_source))
-            ]
+        measured = read_summary(session, country, year, logger, method, country_source) \
+            if from_summary else None
+    if measured is None:
+        measured = measure(session, country, year, logger, method, country_source, jobs)
 
     # Counted over the country rows alone: the World block is a summary of them,
     # not a country, and reporting "3 countries" for two would be a small lie in
     # the one line a user is most likely to read.
     countries = ordered_countries(session, {row.country for row in measured})
-    rows = summarise(measured, countries, with_world=country is None)
+    rows = summarise(measured, countries, with_world=country is None, world=world)
     logger.info("Computed %d rows over %d countries (%s areas, country from %s)",
                 len(rows), len(countries), method, country_source)
     return rows
 
 
+def measure(session: Session, country: str | None, year: int | None,
+            logger: logging.Logger, method: str, country_source: str,
+            jobs: int = 1) -> list[Row]:
+    """Measure the fires themselves, one statement per year: one row per country and year.
+
+    ``jobs`` years at a time, sharing ``session``'s snapshot; see
+    :func:`~src.apps.imports.common.measure_by_year`.
+    """
+    if year is not None:
+        years = [year]
+    else:
+        with common.Spinner("Finding the years the GFA fires cover", logger):
+            years = list(session.scalars(years_query()))
+
+    def measure_year(worker: Session, measuring: int) -> list[Row]:
+        return [
+            Row(country=record.country, year=measuring,
+                minimum=float(record.minimum),
+                maximum=float(record.maximum),
+                total=float(record.total),
+                fires=record.fires)
+            for record in worker.execute(
+                statistics_query(country, measuring, method, country_source))
+        ]
+
+    return common.measure_by_year(session, years, measure_year, jobs,
+                                  "Measuring the burnt area of the GFA fires",
+                                  country or "every country", logger)
+
+
 def write_csv(rows: list[Row], path: Path, logger: logging.Logger) -> None:
     """Write the report as CSV.
 
@@ -766,7 +1102,8 @@ def write_csv(rows: list[Row], path: Path, logger: logging.Logger) -> None:
 
 def write_docx(rows: list[Row], path: Path, country: str | None, year: int | None,
                logger: logging.Logger,
-               method: str = AREA_METHOD_GEODESIC) -> None:
+               method: str = AREA_METHOD_GEODESIC,
+               split_area: bool = False) -> None:
     """Write the report as a Word document.
 
     One table, with each country's summary row in bold so the blocks read apart
@@ -795,6 +1132,14 @@ def write_docx(rows: list[Row], path: Path, country: str | None, year: int | Non
         f"Areas in hectares, computed {measured}. "
         f"Fires not attributable to a country are excluded. Scope: {subtitle}."
     )
+    if split_area:
+        document.add_paragraph(
+            "Each fire is split between the countries it burnt in: a country's total "
+            "is the area burnt inside its borders, a fire that crossed a border is "
+            "counted in each country it reached, and the minimum and maximum are of "
+            "the parts of fires inside the country. The World rows count each fire "
+            "once, with the area it burnt inside any country."
+        )
 
     table = document.add_table(rows=1, cols=len(COLUMNS))
     table.style = "Table Grid"
@@ -820,27 +1165,49 @@ def write_docx(rows: list[Row], path: Path, country: str | None, year: int | Non
     logger.info("Wrote %s", path)
 
 
-def report(args: argparse.Namespace, engine: Engine, logger: logging.Logger) -> list[Row]:
-    """Compute the statistics and write whichever outputs were asked for."""
+def report(args: argparse.Namespace, engine: Engine,
+           logger: logging.Logger) -> list[Row] | list[report_engine.ReportRow]:
+    """Compute the statistics and write whichever outputs were asked for.
+
+    With ``--country-source reported``, geodesic areas and none of ``--country``,
+    ``--from-summary`` or ``--split-area``, the report is the ``statistics`` report of
+    :mod:`~src.apps.statistics.wildfires.gfa.reports`: computed in one statement and
+    written by :mod:`src.apps.statistics.engine`, and returned as its rows. Anything
+    else is measured a year at a time here.
+    """
+    # Imported here: the description is built from this module's expressions.
+    from src.apps.statistics.wildfires.gfa import reports
+    described = reports.PROVIDER.report("statistics")
+    if report_engine.covers(described, args):
+        with Session(engine) as session:
+            rows = cache.cached_compute(
+                session, args, [gfa],
+                lambda: report_engine.compute_one(session, reports.PROVIDER, described.name,
+                                                  args.year, logger),
+                logger)
+        if not rows:
+            raise RuntimeError(NOTHING_MATCHED)
+        report_engine.write(reports.PROVIDER, described, rows, args.csv, args.docx, logger)
+        return rows
+
     # No spinner here: compute runs one statement per year and turns one of its
     # own for each, which is the only honest place to say how far along it is.
-    with Session(engine) as session:
-        rows = compute(session, args.country, args.year, logger, args.area_method,
-                       args.country_source)
+    with common.snapshot_session(engine) as session:
+        rows = cache.cached_compute(
+            session, args, [gfa],
+            lambda: compute(session, args.country, args.year, logger, args.area_method,
+                            args.country_source, args.from_summary, args.jobs,
+                            args.split_area),
+            logger)
 
     if not rows:
-        # An empty report is almost always a mistyped country or a year with no
-        # data, and writing an empty file would hide that.
-        raise RuntimeError(
-            "No wildfires matched. Check --country (a name or an ISO alpha-3 code) and "
-            "--year, and that the GFA fires and the OCHA boundaries are both imported "
-            "— fires with no country are not counted."
-        )
+        raise RuntimeError(NOTHING_MATCHED)
 
     if args.csv is not None:
         write_csv(rows, args.csv, logger)
     if args.docx is not None:
-        write_docx(rows, args.docx, args.country, args.year, logger, args.area_method)
+        write_docx(rows, args.docx, args.country, args.year, logger, args.area_method,
+                   args.split_area)
     return rows
 
 
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""The Greek Fire Service burnt-area report, described for the shared report engine.
+
+:mod:`~src.apps.statistics.wildfires.greece_ffa.wildfire_statistics` is already one
+statement, so what describing it here buys is not a scan saved but a report that
+:mod:`src.apps.statistics.run_reports` can run alongside the others, and that the
+application writes through the same engine when it runs by default. It prints the same
+rows — the tests hold it to it.
+
+What the engine does not have is the application's options. This is the report as it
+runs by default: every land cover summed (``--surface burnt``), every fire (no
+``--min-area``), and the 2025 false alarms left out. Run that way, the application
+computes and writes it through the engine; with any other option, it still does so
+itself.
+
+The source
+----------
+
+One row per fire that reports a burnt area and is not a false alarm, with its
+published year, its hectares and whether it publishes a coordinate. The country is the
+constant the application prints; nothing is tested against a boundary, so nothing
+here is joined for it either.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import Select
+from sqlalchemy import func
+from sqlalchemy import literal
+from sqlalchemy import select
+
+from src.apps.statistics import engine
+from src.apps.statistics.wildfires.greece_ffa.wildfire_statistics import COUNTRY_NAME
+from src.apps.statistics.wildfires.greece_ffa.wildfire_statistics import PUBLISHED_YEAR
+from src.apps.statistics.wildfires.greece_ffa.wildfire_statistics import SURFACE_BURNT
+from src.apps.statistics.wildfires.greece_ffa.wildfire_statistics import SURFACE_PROSE
+from src.apps.statistics.wildfires.greece_ffa.wildfire_statistics import is_a_fire
+from src.apps.statistics.wildfires.greece_ffa.wildfire_statistics import is_located
+from src.apps.statistics.wildfires.greece_ffa.wildfire_statistics import reported_surface
+from src.data_model.wildfire import Wildfire
+from src.providers import greece_ffa
+from src.providers.greece_ffa.wildfire import GreeceFfaWildfire
+
+#: How :mod:`src.apps.statistics.run_reports` names this provider.
+PROVIDER_NAME = "greece_ffa"
+
+
+def source(year: int | None) -> Select:
+    """Every Greek fire that reports a burnt area, or one published year's."""
+    greek = GreeceFfaWildfire.__table__
+    hectares, reported = reported_surface(SURFACE_BURNT)
+
+    query = (
+        select(
+            literal(COUNTRY_NAME).label("country"),
+            PUBLISHED_YEAR.label("year"),
+            hectares.label("area"),
+            is_located().label("located"),
+        )
+        .select_from(Wildfire)
+        .join(greek, greek.c.id == Wildfire.id)
+        .where(reported)
+        .where(is_a_fire())
+    )
+    if year is not None:
+        query = query.where(PUBLISHED_YEAR == year)
+    return query
+
+
+PROVIDER = engine.register(engine.Provider(
+    name=PROVIDER_NAME,
+    source=source,
+    dimensions=(
+        engine.Dimension("country", "Country"),
+        engine.Dimension("year", "Year", descending=True),
+    ),
+    measures=(
+        engine.Measure("fires", "Fires", lambda c: func.count()),
+        engine.Measure("minimum", "Minimum (ha)", lambda c: func.min(c.area),
+                       kind=engine.KIND_HECTARES),
+        engine.Measure("maximum", "Maximum (ha)", lambda c: func.max(c.area),
+                       kind=engine.KIND_HECTARES),
+        engine.Measure("total", "Total (ha)", lambda c: func.sum(c.area),
+                       kind=engine.KIND_HECTARES, default=0.0),
+        engine.Measure("located", "Located", lambda c: func.count(),
+                       condition=lambda c: c.located),
+    ),
+    shares=(
+        engine.Share("located_percent", "Located (%)", "located", of="fires"),
+    ),
+    reports=(
+        engine.ReportDefinition(
+            name="statistics",
+            title=f"Greek Fire Service wildfire burnt area ({COUNTRY_NAME})",
+            rows=("country", "year"),
+            columns=("fires", "minimum", "maximum", "total", "located",
+                     "located_percent"),
+            total_over="year",
+            totals=engine.TOTALS_ALWAYS,
+            notes=(
+                "Areas in hectares as the service reports them — this dataset publishes "
+                f"no perimeter, so nothing is measured. Surface: "
+                f"{SURFACE_PROSE[SURFACE_BURNT]}. Years are the published sheet's, not "
+                "the start date's. False alarms are excluded.",
+                f"Located counts the fires that publish a coordinate. It is a column and "
+                f"not a filter, and it is zero for every year before "
+                f"{greece_ffa.FIRST_YEAR_WITH_COORDINATES}: no earlier year publishes "
+                f"one.",
+            ),
+            options={"surface": SURFACE_BURNT, "min_area": None,
+                     "include_false_alarms": False},
+        ),
+    ),
+    tables=("wildfire", "greece_ffa_wildfire"),
+))
@@ -122,6 +122,8 @@ from sqlalchemy.orm import Session
 import src.settings  # noqa: F401  (imported for the side effect of loading .env)
 
 from src.apps.imports import common
+from src.apps.statistics import cache
+from src.apps.statistics import engine as report_engine
 from src.data_model.wildfire import Wildfire
 from src.providers import greece_ffa
 from src.providers.greece_ffa.wildfire import GreeceFfaWildfire
@@ -620,6 +622,8 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument("--country-source", help=argparse.SUPPRESS)
     parser.add_argument("--area-method", help=argparse.SUPPRESS)
 
+    cache.add_cache_arguments(parser)
+
     output = parser.add_argument_group("output", "at least one is required")
     output.add_argument("--csv", type=Path, help="write the report to this .csv")
     output.add_argument("--docx", type=Path, help="write the report to this .docx (MS Word)")
@@ -799,11 +803,29 @@ def write_docx(rows: list[Row], path: Path, year: int | None,
     logger.info("Wrote %s", path)
 
 
-def report(args: argparse.Namespace, engine: Engine, logger: logging.Logger) -> list[Row]:
-    """Compute the statistics and write whichever outputs were asked for."""
+def report(args: argparse.Namespace, engine: Engine,
+           logger: logging.Logger) -> list[Row] | list[report_engine.ReportRow]:
+    """Compute the statistics and write whichever outputs were asked for.
+
+    Run with the options of the ``statistics`` report of
+    :mod:`~src.apps.statistics.wildfires.greece_ffa.reports` — the defaults — it is
+    that report: computed and written by :mod:`src.apps.statistics.engine`, and
+    returned as its rows. Any other option is computed and written here.
+    """
+    # Imported here: the description is built from this module's expressions.
+    from src.apps.statistics.wildfires.greece_ffa import reports
+    described = reports.PROVIDER.report("statistics")
+    covered = report_engine.covers(described, args)
     with Session(engine) as session:
-        rows = compute(session, args.year, logger, args.surface, args.min_area,
-                       args.include_false_alarms)
+        if covered:
+            def run() -> list[report_engine.ReportRow]:
+                return report_engine.compute_one(session, reports.PROVIDER,
+                                                 described.name, args.year, logger)
+        else:
+            def run() -> list[Row]:
+                return compute(session, args.year, logger, args.surface, args.min_area,
+                               args.include_false_alarms)
+        rows = cache.cached_compute(session, args, [greece_ffa], run, logger)
 
     if not rows:
         # An empty report is almost always a year with no data, and writing an empty
@@ -817,11 +839,14 @@ def report(args: argparse.Namespace, engine: Engine, logger: logging.Logger) ->
             f"{greece_ffa.FIRST_YEAR}." + threshold
         )
 
-    if args.csv is not None:
-        write_csv(rows, args.csv, logger)
-    if args.docx is not None:
-        write_docx(rows, args.docx, args.year, logger, args.surface, args.min_area,
-                   args.include_false_alarms)
+    if covered:
+        report_engine.write(reports.PROVIDER, described, rows, args.csv, args.docx, logger)
+    else:
+        if args.csv is not None:
+            write_csv(rows, args.csv, logger)
+        if args.docx is not None:
+            write_docx(rows, args.docx, args.year, logger, args.surface, args.min_area,
+                       args.include_false_alarms)
     return rows
 
 
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""The INAB fire-report statistics, described for the shared report engine.
+
+:mod:`~src.apps.statistics.wildfires.guatemala_inab.wildfire_statistics` is already
+one statement, so what describing it here buys is not a scan saved but a report that
+:mod:`src.apps.statistics.run_reports` can run alongside the others, and that the
+application writes through the same engine when it runs by default. It prints the same
+rows — the tests hold it to it.
+
+What the engine does not have is the application's options. This is the report as it
+runs by default: the false alarms left out of ``Fires`` (no
+``--include-false-alarms``) and counted in a column of their own. Run that way, the
+application computes and writes it through the engine; with the option, it still does
+so itself.
+
+The three hectare columns are measures of a typed ``NULL``, so the engine writes them
+as the application does — empty on every row, because INAB publishes no area and a
+zero would say that nothing burnt.
+
+:mod:`~src.apps.statistics.wildfires.guatemala_inab.wildfire_classification` is not
+described here. Its columns are the published vocabulary *and* whatever unpublished
+value the data in scope carries, which is only known once the data has been read; a
+description with a fixed set of columns would drop exactly the value that report is
+built to surface.
+
+The source
+----------
+
+One row per fire report, with its Guatemalan calendar year and four flags: whether it
+counts towards ``Fires``, whether it is located, whether it fell in a protected area,
+and whether it was a false alarm. Nothing is filtered in a ``WHERE``, for the reason
+:func:`~src.apps.statistics.wildfires.guatemala_inab.wildfire_statistics.statistics_query`
+gives: the false alarms stay in the rows so that one pass can count them too.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import ColumnElement
+from sqlalchemy import Float
+from sqlalchemy import Select
+from sqlalchemy import cast
+from sqlalchemy import func
+from sqlalchemy import literal
+from sqlalchemy import null
+from sqlalchemy import select
+
+from src.apps.statistics import engine
+from src.apps.statistics.wildfires.guatemala_inab.wildfire_statistics import COUNTRY_NAME
+from src.apps.statistics.wildfires.guatemala_inab.wildfire_statistics import LOCAL_YEAR
+from src.apps.statistics.wildfires.guatemala_inab.wildfire_statistics import (
+    is_a_false_alarm)
+from src.apps.statistics.wildfires.guatemala_inab.wildfire_statistics import is_a_fire
+from src.apps.statistics.wildfires.guatemala_inab.wildfire_statistics import (
+    is_in_protected_area)
+from src.apps.statistics.wildfires.guatemala_inab.wildfire_statistics import is_located
+from src.data_model.wildfire import Wildfire
+from src.providers import guatemala_inab
+from src.providers.guatemala_inab.wildfire import InabWildfire
+
+#: How :mod:`src.apps.statistics.run_reports` names this provider.
+PROVIDER_NAME = "guatemala_inab"
+
+
+def source(year: int | None) -> Select:
+    """Every fire report INAB published, or one Guatemalan year's."""
+    inab = InabWildfire.__table__
+
+    query = (
+        select(
+            literal(COUNTRY_NAME).label("country"),
+            LOCAL_YEAR.label("year"),
+            is_a_fire().label("counted"),
+            is_located().label("located"),
+            is_in_protected_area().label("protected"),
+            is_a_false_alarm().label("false_alarm"),
+        )
+        .select_from(Wildfire)
+        .join(inab, inab.c.id == Wildfire.id)
+    )
+    if year is not None:
+        query = query.where(LOCAL_YEAR == year)
+    return query
+
+
+def no_area(columns: object) -> ColumnElement:
+    """A hectare measure with nothing to measure: ``NULL``, written as an empty cell."""
+    return cast(null(), Float)
+
+
+PROVIDER = engine.register(engine.Provider(
+    name=PROVIDER_NAME,
+    source=source,
+    dimensions=(
+        engine.Dimension("country", "Country"),
+        engine.Dimension("year", "Year", descending=True),
+    ),
+    measures=(
+        engine.Measure("fires", "Fires", lambda c: func.count(),
+                       condition=lambda c: c.counted),
+        engine.Measure("minimum", "Minimum (ha)", no_area, kind=engine.KIND_HECTARES),
+        engine.Measure("maximum", "Maximum (ha)", no_area, kind=engine.KIND_HECTARES),
+        engine.Measure("total", "Total (ha)", no_area, kind=engine.KIND_HECTARES),
+        engine.Measure("false_alarms", "False alarms", lambda c: func.count(),
+                       condition=lambda c: c.false_alarm),
+        engine.Measure("located", "Located", lambda c: func.count(),
+                       condition=lambda c: c.counted & c.located),
+        engine.Measure("protected", "In protected area", lambda c: func.count(),
+                       condition=lambda c: c.counted & c.protected),
+    ),
+    shares=(
+        engine.Share("located_percent", "Located (%)", "located", of="fires"),
+    ),
+    reports=(
+        engine.ReportDefinition(
+            name="statistics",
+            title=f"INAB wildfire statistics ({COUNTRY_NAME})",
+            rows=("country", "year"),
+            columns=("fires", "minimum", "maximum", "total", "false_alarms", "located",
+                     "located_percent", "protected"),
+            total_over="year",
+            totals=engine.TOTALS_ALWAYS,
+            notes=(
+                f"Counts of the fire reports INAB received. Years are the Guatemalan "
+                f"calendar year of each fire's own instant "
+                f"({guatemala_inab.DEFAULT_TIME_ZONE}): this source publishes no year "
+                f"field, so the year is derived from fecha_hora_incendio.",
+                "The Minimum (ha), Maximum (ha) and Total (ha) columns are empty on "
+                "every row, and that is the dataset rather than a fault: INAB publishes "
+                "no perimeter and no burnt area, so there is nothing to measure.",
+                f"False alarms — a report status of {guatemala_inab.STATUS_FALSE} — "
+                f"are left out of Fires and counted in a column of their own.",
+                f"The Country column is {COUNTRY_NAME} on every row and nothing is "
+                f"tested against a boundary. In protected area is the provider's own "
+                f"containment test, nombre_ap_1 filled.",
+            ),
+            options={"include_false_alarms": False},
+        ),
+    ),
+    tables=("wildfire", "inab_wildfire"),
+))
@@ -149,6 +149,8 @@ from sqlalchemy.orm import Session
 import src.settings  # noqa: F401  (imported for the side effect of loading .env)
 
 from src.apps.imports import common
+from src.apps.statistics import cache
+from src.apps.statistics import engine as report_engine
 from src.data_model.wildfire import Wildfire
 from src.providers import guatemala_inab
 from src.providers.guatemala_inab.wildfire import InabWildfire
@@ -576,6 +578,8 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
 
     add_refused_arguments(parser)
 
+    cache.add_cache_arguments(parser)
+
     output = parser.add_argument_group("output", "at least one is required")
     output.add_argument("--csv", type=Path, help="write the report to this .csv")
     output.add_argument("--docx", type=Path,
@@ -742,10 +746,27 @@ def write_docx(rows: list[Row], path: Path, year: int | None, logger: logging.Lo
 
 
 def report(args: argparse.Namespace, engine: Engine,
-           logger: logging.Logger) -> list[Row]:
-    """Compute the statistics and write whichever outputs were asked for."""
+           logger: logging.Logger) -> list[Row] | list[report_engine.ReportRow]:
+    """Compute the statistics and write whichever outputs were asked for.
+
+    Run with the options of the ``statistics`` report of
+    :mod:`~src.apps.statistics.wildfires.guatemala_inab.reports` — the defaults — it is
+    that report: computed and written by :mod:`src.apps.statistics.engine`, and
+    returned as its rows. ``--include-false-alarms`` is computed and written here.
+    """
+    # Imported here: the description is built from this module's expressions.
+    from src.apps.statistics.wildfires.guatemala_inab import reports
+    described = reports.PROVIDER.report("statistics")
+    covered = report_engine.covers(described, args)
     with Session(engine) as session:
-        rows = compute(session, args.year, logger, args.include_false_alarms)
+        if covered:
+            def run() -> list[report_engine.ReportRow]:
+                return report_engine.compute_one(session, reports.PROVIDER,
+                                                 described.name, args.year, logger)
+        else:
+            def run() -> list[Row]:
+                return compute(session, args.year, logger, args.include_false_alarms)
+        rows = cache.cached_compute(session, args, [guatemala_inab], run, logger)
 
     if not rows:
         # An empty report is almost always a year with no data, and writing an empty
@@ -756,10 +777,13 @@ def report(args: argparse.Namespace, engine: Engine,
             f"src.apps.imports.wildfires.guatemala_inab.import_wildfires."
         )
 
-    if args.csv is not None:
-        write_csv(rows, args.csv, logger)
-    if args.docx is not None:
-        write_docx(rows, args.docx, args.year, logger, args.include_false_alarms)
+    if covered:
+        report_engine.write(reports.PROVIDER, described, rows, args.csv, args.docx, logger)
+    else:
+        if args.csv is not None:
+            write_csv(rows, args.csv, logger)
+        if args.docx is not None:
+            write_docx(rows, args.docx, args.year, logger, args.include_false_alarms)
     return rows
 
 
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""GWIS's burnt-area report, described for the shared report engine.
+
+:mod:`~src.apps.statistics.wildfires.gwis.wildfire_statistics`, described as a
+:class:`~src.apps.statistics.engine.Provider`, so that
+:mod:`src.apps.statistics.run_reports` answers it from one grouped pass beside the
+other providers' reports. It prints the same rows as the application run with
+``--country-source reported`` — the tests hold it to it: the World block first, its
+years newest first and then its total, and every country in the database's order,
+its years newest first and then its ``Total``.
+
+What the engine does not have is the application's options: ``--country``,
+``--from-summary``, ``--split-area``, ``--sample`` and ``--jobs``. Run with
+``--country-source reported`` and none of those, the application computes and writes
+its report through the engine; with any of them, it still measures a year at a time
+itself.
+
+Which country a fire counts towards
+-----------------------------------
+
+The one the import stored, which is the application's ``reported``. Its default,
+``geometry``, tests a point of every perimeter against the country polygons, and
+that test in one grouped statement over the whole dataset is the statement the
+application's module docstring tells of being killed for its memory; the
+application measures a year at a time for that reason, and a single pass cannot.
+GWIS resolves its country by containment at import, so for GWIS the two modes give
+the same answer, and ``reported`` is an index lookup on a foreign key.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import Select
+from sqlalchemy import func
+from sqlalchemy import select
+
+from src.apps.statistics import engine
+from src.apps.statistics.wildfires.gwis.wildfire_statistics import BURNT_AREA
+from src.apps.statistics.wildfires.gwis.wildfire_statistics import (
+    COUNTRY_SOURCE_REPORTED)
+from src.apps.statistics.wildfires.gwis.wildfire_statistics import LOCAL_YEAR
+from src.apps.statistics.wildfires.gwis.wildfire_statistics import WORLD_LABEL
+from src.apps.statistics.wildfires.gwis.wildfire_statistics import country_columns
+from src.data_model.wildfire import Wildfire
+from src.providers.gwis.wildfire import GwisWildfire
+
+#: How :mod:`src.apps.statistics.run_reports` names this provider.
+PROVIDER_NAME = "gwis"
+
+
+def source(year: int | None) -> Select:
+    """Every GWIS fire with a perimeter and a country, or one local year's."""
+    gwis = GwisWildfire.__table__
+    country_name, _, joins = country_columns(COUNTRY_SOURCE_REPORTED)
+
+    query = (
+        select(
+            country_name.label("country"),
+            LOCAL_YEAR.label("year"),
+            BURNT_AREA.label("area"),
+        )
+        .select_from(Wildfire)
+        .join(gwis, gwis.c.id == Wildfire.id)
+        .where(Wildfire.perimeter.is_not(None))
+    )
+    for target, condition, is_outer in joins:
+        query = query.outerjoin(target, condition) if is_outer \
+            else query.join(target, condition)
+    if year is not None:
+        query = query.where(LOCAL_YEAR == year)
+    return query
+
+
+PROVIDER = engine.register(engine.Provider(
+    name=PROVIDER_NAME,
+    source=source,
+    dimensions=(
+        engine.Dimension("country", "Country", total_label=WORLD_LABEL, collated=True),
+        engine.Dimension("year", "Year", descending=True),
+    ),
+    measures=(
+        engine.Measure("fires", "Fires", lambda c: func.count()),
+        engine.Measure("minimum", "Minimum (ha)", lambda c: func.min(c.area),
+                       kind=engine.KIND_HECTARES),
+        engine.Measure("maximum", "Maximum (ha)", lambda c: func.max(c.area),
+                       kind=engine.KIND_HECTARES),
+        engine.Measure("total", "Total (ha)", lambda c: func.sum(c.area),
+                       kind=engine.KIND_HECTARES, default=0.0),
+    ),
+    reports=(
+        engine.ReportDefinition(
+            name="statistics",
+            title="GWIS wildfire burnt area",
+            rows=("country", "year"),
+            columns=("fires", "minimum", "maximum", "total"),
+            total_over="year",
+            totals=engine.TOTALS_ALWAYS,
+            block_over="country",
+            notes=(
+                "Areas in hectares, computed geodesically on the WGS84 ellipsoid. "
+                "Fires not attributable to a country are excluded; a fire counts "
+                "towards the country stored at import, which GWIS resolves by "
+                "containment.",
+            ),
+            options={"country_source": COUNTRY_SOURCE_REPORTED, "country": None,
+                     "from_summary": False, "split_area": False, "sample": None},
+        ),
+    ),
+    tables=("wildfire", "gwis_wildfire", "admin_boundary", "ocha_admin_boundary"),
+))
@@ -47,7 +47,10 @@ How the area is measured
 ------------------------
 
 ``ST_Area(perimeter::geography)``: the true area on the WGS84 ellipsoid, in
-square metres, divided by 10,000 for hectares.
+square metres, divided by 10,000 for hectares. It is not measured by the report:
+the database computed it once, when the perimeter was stored, into
+:attr:`~src.data_model.wildfire.Wildfire.perimeter_area_m2`. Measuring twenty
+million perimeters was most of what a full report used to cost.
 
 Deliberately *not* a projected area. Every map projection distorts something,
 and for a dataset spanning every latitude from the Arctic to Tasmania there is
@@ -84,11 +87,9 @@ in the Gulf of Guinea. Under ``reported`` that fire is in Spain's total; under
 
 .. note::
 
-   Both modes attribute a fire's **whole** area to one country. Splitting a
-   border-crossing fire between the countries it actually burnt in is a different
-   and larger question, and this report does not attempt it: ``Total (ha)`` is
+   Both modes attribute a fire's **whole** area to one country: ``Total (ha)`` is
    the area of fires attributed to a country, not the area burnt inside its
-   borders.
+   borders. ``--split-area`` reports the latter; see below.
 
 Which fires are counted
 -----------------------
@@ -136,9 +137,94 @@ slightly slower is worth any number of runs that do not finish at all.
 Nothing about the figures changes. ``count``, ``sum``, ``min`` and ``max`` all
 decompose over a partition of the fires, so a country's ``Total`` row and the
 whole World block are exactly the numbers ``GROUPING SETS`` returned, from the
-same rows. Every statement runs in one transaction and so against one snapshot,
-which is what keeps a report built from many queries as consistent as one built
-from a single query.
+same rows. Every statement runs in one ``REPEATABLE READ`` transaction and so
+against one snapshot, which is what keeps a report built from many queries as
+consistent as one built from a single query.
+
+Several years at a time
+-----------------------
+
+One year at a time is also one server core at a time. ``--jobs N`` measures N
+years at once, each on a connection of its own::
+
+    python3 -m src.apps.statistics.wildfires.gwis.wildfire_statistics \\
+        --country-source geometry --jobs 8 --csv burnt.csv
+
+without giving up the single snapshot. The report's transaction exports it with
+``pg_export_snapshot()`` once it has found the years, and every worker begins
+with ``SET TRANSACTION SNAPSHOT`` before its first statement, so the workers read
+exactly the rows the report's own transaction does — an import committing midway
+is in none of the years, not in some. The report's transaction stays open until
+the last worker is done; the snapshot stops being importable when it closes.
+
+Each worker is a backend running one year's point-in-polygon tests, with the
+gigabyte or so that takes, so N workers want N times the memory one statement
+did. ``--jobs auto`` takes the server's ``max_parallel_workers`` as its core
+count; either way the pool never outnumbers the years or the free connections.
+
+Reading from the summary
+------------------------
+
+``--from-summary --country-source reported`` does not measure the fires at all.
+The importer keeps ``wildfire_yearly_summary`` — per stored country and local
+year, the count, minimum, maximum and total area — and recomputes the years of
+every archive it imports, so a report that trusts the stored country can read a
+few thousand rows where it scanned twenty million. The figures are the same: the
+four of them decompose over any partition of the fires, the same property that
+lets the years be measured one at a time.
+
+It answers only what the summary holds. Under ``--country-source geometry`` the
+country is decided at report time, so the fires are measured as usual; so they
+are, with a warning, when the summary holds nothing for GWIS.
+
+A preview from a sample
+-----------------------
+
+``--sample PERCENT`` measures that share of the fires, drawn with ``TABLESAMPLE``
+from ``gwis_wildfire``, and scales the counts and totals up::
+
+    python3 -m src.apps.statistics.wildfires.gwis.wildfire_statistics \\
+        --sample 1 --country Spain --csv spain-preview.csv
+
+The point-in-polygon tests are paid for the sampled fires only, so a 1% preview
+under ``geometry`` is a matter of seconds where the report is one of half an
+hour. Every count and total comes with a 95% confidence interval, the minimum
+and maximum are the smallest and largest fire *in the sample*, and the headings
+say so; see :mod:`src.apps.statistics.sampling` for how the figures are
+estimated. It does not combine with ``--from-summary``, which is already exact
+and cheap. A preview is cached only with ``--sample-seed``: without one, each run
+is a draw of its own and is computed again.
+
+The area burnt inside each country
+----------------------------------
+
+``--split-area`` answers the question the two country sources leave aside: how
+much burnt *inside* each country, with a fire that crossed a border split between
+the countries it burnt in::
+
+    python3 -m src.apps.statistics.wildfires.gwis.wildfire_statistics \\
+        --split-area --country Portugal --csv portugal-inside.csv
+
+Intersecting twenty million perimeters with the country polygons is not something
+to do at report time, and it only changes when an import does. So the importer
+does it, for the years it replaces and in the same transaction, into
+``wildfire_boundary_area`` (see
+:func:`~src.apps.imports.common.refresh_boundary_areas`), and the report is a
+``GROUP BY`` over that table — seconds for every year at once.
+
+A country's row then reads differently. ``Fires`` counts every fire that burnt in
+it, so a border fire is counted in each country it reached; ``Minimum`` and
+``Maximum`` are of the parts of fires inside the country; ``Total (ha)`` is the
+area burnt within its borders. The World block still counts each fire once, with
+the area it burnt on land: it is measured from the same table per fire rather
+than added up from the countries, which would count a border fire twice. The
+country figures therefore do not add up to the World's ``Fires``, by design.
+
+The areas are the import's, against the boundaries it split them with, so the
+mode does not combine with ``--from-summary`` or ``--sample`` and ignores
+``--country-source``. A database imported before the table existed has it filled
+by its migration; one that holds nothing for GWIS is an error that asks for a
+re-import rather than an empty report.
 """
 
 from __future__ import annotations
@@ -153,7 +239,6 @@ import sys
 from dataclasses import dataclass
 from pathlib import Path
 
-from geoalchemy2 import Geography
 from sqlalchemy import ColumnElement
 from sqlalchemy import Engine
 from sqlalchemy import Integer
@@ -169,8 +254,19 @@ from sqlalchemy.orm import Session
 import src.settings  # noqa: F401  (imported for the side effect of loading .env)
 
 from src.apps.imports import common
+from src.apps.statistics import cache
+from src.apps.statistics import engine as report_engine
+from src.apps.statistics import sampling
+from src.data_model.data_provider import DataProvider
 from src.data_model.geography.admin_boundary import AdminBoundary
+from src.data_model.geography.admin_boundary import AdminBoundaryPart
 from src.data_model.wildfire import Wildfire
+from src.data_model.wildfire_boundary_area import WildfireBoundaryArea
+from src.data_model.wildfire_yearly_summary import SURFACE_PERIMETER
+from src.data_model.wildfire_yearly_summary import WildfireYearlySummary
+from src.providers import gwis
+from src.providers.gwis import PROVIDER_NAME
+from src.providers.gwis import PROVIDER_PRODUCT
 from src.providers.gwis.wildfire import GwisWildfire
 from src.providers.ocha.admin_boundary import OchaAdminBoundary
 
@@ -184,6 +280,12 @@ TOTAL_LABEL = "Total"
 #: figures you have nothing to read a single country's against.
 WORLD_LABEL = "World"
 
+#: Why a report is refused when no fire matched: almost always a mistyped country or
+#: a year with no data, and writing an empty file would hide that.
+NOTHING_MATCHED = ("No wildfires matched. Check --country (a name or an ISO alpha-3 code) "
+                   "and --year, and that the GWIS fires and the OCHA boundaries are both "
+                   "imported — fires with no country are not counted.")
+
 #: The report's columns, in order, shared by both output formats so that a change
 #: to one cannot silently leave the other behind.
 #:
@@ -220,13 +322,9 @@ SQUARE_METRES_PER_HECTARE = 10_000.0
 
 #: Burnt area of one fire, in hectares.
 #:
-#: The cast carries the geometry type and SRID rather than being a bare
-#: ``Geography()``: that renders as ``geography(GEOMETRY,-1)``, which PostGIS
-#: rejects, because -1 is not a SRID it knows.
-BURNT_AREA = (
-    func.ST_Area(cast(Wildfire.perimeter, Geography(geometry_type="MULTIPOLYGON", srid=4326)))
-    / SQUARE_METRES_PER_HECTARE
-)
+#: Read from the stored geodesic area rather than measured: see
+#: :attr:`~src.data_model.wildfire.Wildfire.perimeter_area_m2`.
+BURNT_AREA = Wildfire.perimeter_area_m2 / SQUARE_METRES_PER_HECTARE
 
 #: The year a fire counts towards: the year of its *local* start date.
 #:
@@ -284,9 +382,8 @@ def country_columns(source: str) -> tuple[ColumnElement, ColumnElement, list]:
     crosses a border**. Both modes attribute the whole burnt area to one country,
     and for GFA they may pick different ones — ``reported`` follows the ignition
     point, ``geometry`` follows an interior point of the perimeter. Splitting the
-    area between the countries it actually burnt in is a different and larger
-    question, and this report does not attempt it: ``Total (ha)`` is the area of
-    fires attributed to a country, not the area burnt inside its borders.
+    area between the countries it actually burnt in is ``--split-area``'s business
+    and not this function's (see :func:`split_query`).
     """
     ocha_boundary = OchaAdminBoundary.__table__
 
@@ -303,16 +400,18 @@ def country_columns(source: str) -> tuple[ColumnElement, ColumnElement, list]:
             f"unknown country source {source!r}; expected one of {', '.join(COUNTRY_SOURCES)}"
         )
 
-    # LATERAL ... LIMIT 1 rather than a plain join: a point on a shared border can
-    # satisfy ST_Contains for two countries, and one fire must not become two rows.
+    # LATERAL ... LIMIT 1 rather than a plain join: a point on a shared border, or
+    # on a cut between two pieces of one country, intersects two admin_boundary_part
+    # rows, and one fire must not become two rows.
     # The join is inner, which is what drops a fire that is inside no country at
     # all — the same rule ``reported`` gets from its inner join to admin_boundary.
     containing = (
         select(AdminBoundary.name.label("name"), ocha_boundary.c.iso_3.label("iso_3"))
-        .select_from(AdminBoundary)
+        .select_from(AdminBoundaryPart)
+        .join(AdminBoundary, AdminBoundary.id == AdminBoundaryPart.admin_boundary_id)
         .join(ocha_boundary, ocha_boundary.c.id == AdminBoundary.id)
-        .where(AdminBoundary.level == COUNTRY_LEVEL)
-        .where(func.ST_Contains(AdminBoundary.geometry, LOCATOR))
+        .where(AdminBoundaryPart.level == COUNTRY_LEVEL)
+        .where(func.ST_Intersects(AdminBoundaryPart.geometry, LOCATOR))
         .limit(1)
         .lateral("containing")
     )
@@ -355,7 +454,8 @@ def years_query() -> Select:
 
 
 def statistics_query(country: str | None, year: int,
-                     country_source: str = COUNTRY_SOURCE_GEOMETRY) -> Select:
+                     country_source: str = COUNTRY_SOURCE_GEOMETRY,
+                     sample: sampling.Sample | None = None) -> Select:
     """Build the statistics query for one year.
 
     Returns
@@ -363,7 +463,9 @@ def statistics_query(country: str | None, year: int,
     Select
         A query yielding ``country, minimum, maximum, total, fires``: one row per
         country that had a fire in ``year``, unordered. The summary rows and the
-        report's order are :func:`summarise`'s work.
+        report's order are :func:`summarise`'s work. With a ``sample``, the figures
+        are over the sampled fires and ``total_squares`` and ``fires_squares`` come
+        with them, for :func:`sampling.estimate <src.apps.statistics.sampling.estimate>`.
 
     Notes
     -----
@@ -374,10 +476,10 @@ def statistics_query(country: str | None, year: int,
     statement could serve every combination, leaving a branch in the SQL that is
     dead on every actual run.
 
-    The inner query computes each area exactly once. Folded into the outer
-    aggregate instead, ``ST_Area`` would be evaluated three times per row — for
-    the minimum, the maximum and the sum — and it is by far the most expensive
-    thing here.
+    The inner query reads each area exactly once, for the minimum, the maximum
+    and the sum. It was written that way when the area was an ``ST_Area`` per row,
+    and by far the most expensive thing here; reading the stored column, the shape
+    costs nothing and keeps the outer aggregate simple.
 
     Whichever way the country is resolved the join is inner, and that is what
     drops the fires belonging to no country. ``gwis_wildfire`` is joined — by
@@ -391,6 +493,9 @@ def statistics_query(country: str | None, year: int,
     aggregates over zero fires.
 
     See :func:`country_columns` for what ``country_source`` changes.
+
+    A sample is joined before the country is: the sampled fires are the only ones
+    tested against the country polygons, which is the whole of what a preview saves.
     """
     gwis = GwisWildfire.__table__
     country_name, country_iso_3, joins = country_columns(country_source)
@@ -405,6 +510,10 @@ def statistics_query(country: str | None, year: int,
         .where(Wildfire.perimeter.is_not(None))
         .where(LOCAL_YEAR == year)
     )
+    if sample is not None:
+        drawn = sampling.drawn(gwis, sample)
+        fires = fires.join(drawn, drawn.c.id == Wildfire.id) \
+            .add_columns(drawn.c[sampling.UNIT])
     for target, condition, is_outer in joins:
         fires = fires.outerjoin(target, condition) if is_outer \
             else fires.join(target, condition)
@@ -416,6 +525,8 @@ def statistics_query(country: str | None, year: int,
         ))
 
     fire = fires.subquery("fire")
+    if sample is not None:
+        return sampling.estimate_query(fire, ["country"], {"fires": None})
     return (
         select(
             fire.c.country,
@@ -428,6 +539,184 @@ def statistics_query(country: str | None, year: int,
     )
 
 
+def summary_query(country: str | None, year: int | None) -> Select:
+    """Build the statistics query over ``wildfire_yearly_summary``.
+
+    Returns
+    -------
+    Select
+        A query yielding ``country, year, minimum, maximum, total, fires``: one
+        row per country and year, unordered — the rows :func:`statistics_query`
+        returns for every year at once, under ``--country-source reported``.
+
+    Notes
+    -----
+    The summary is kept per boundary, and a country's figures are combined from
+    its boundaries here the way :func:`combine` combines years: a minimum of
+    minima, a sum of sums. For GWIS each fire's boundary *is* its country, so the
+    grouping merely renames, but it is what a name shared by two boundaries
+    would need, and it is the grouping the raw query does.
+
+    Every year fits in one statement, unlike the raw scan: there are a few
+    thousand summary rows where there were twenty million fires.
+    """
+    summary = WildfireYearlySummary.__table__
+    ocha_boundary = OchaAdminBoundary.__table__
+
+    rows = (
+        select(
+            AdminBoundary.name.label("country"),
+            summary.c.year,
+            (func.min(summary.c.minimum_m2) / SQUARE_METRES_PER_HECTARE).label("minimum"),
+            (func.max(summary.c.maximum_m2) / SQUARE_METRES_PER_HECTARE).label("maximum"),
+            (func.sum(summary.c.total_m2) / SQUARE_METRES_PER_HECTARE).label("total"),
+            func.sum(summary.c.fires).label("fires"),
+        )
+        .select_from(summary)
+        .join(DataProvider, DataProvider.id == summary.c.data_provider_id)
+        .join(AdminBoundary, AdminBoundary.id == summary.c.admin_boundary_id)
+        .outerjoin(ocha_boundary, ocha_boundary.c.id == AdminBoundary.id)
+        .where(DataProvider.name == PROVIDER_NAME)
+        .where(DataProvider.product == PROVIDER_PRODUCT)
+        .where(summary.c.surface == SURFACE_PERIMETER)
+        .group_by(AdminBoundary.name, summary.c.year)
+    )
+    if year is not None:
+        rows = rows.where(summary.c.year == year)
+    if country is not None:
+        rows = rows.where(or_(
+            func.lower(AdminBoundary.name) == country.lower(),
+            func.upper(ocha_boundary.c.iso_3) == country.upper(),
+        ))
+    return rows
+
+
+def summary_is_kept(session: Session) -> bool:
+    """Whether ``wildfire_yearly_summary`` holds anything for GWIS at all.
+
+    An empty summary is not "no fires": it is a database whose fires were
+    imported without the summary being filled, and a report read from it would
+    say nothing happened anywhere. Whether the table is *current* is the
+    importer's business — it refreshes the years it replaces — and this cannot
+    tell.
+    """
+    summary = WildfireYearlySummary.__table__
+    return session.scalar(
+        select(summary.c.year)
+        .join(DataProvider, DataProvider.id == summary.c.data_provider_id)
+        .where(DataProvider.name == PROVIDER_NAME)
+        .where(DataProvider.product == PROVIDER_PRODUCT)
+        .limit(1)
+    ) is not None
+
+
+def split_query(country: str | None, year: int | None) -> Select:
+    """Build the ``--split-area`` query over ``wildfire_boundary_area``.
+
+    Returns
+    -------
+    Select
+        A query yielding ``country, year, minimum, maximum, total, fires``: one row
+        per country and year, unordered, in the shape :func:`summary_query` returns.
+        A fire is in the row of every country it burnt in, with the area it burnt
+        there.
+
+    Notes
+    -----
+    A plain ``GROUP BY`` over rows the importer keeps: nothing here touches a
+    geometry. ``count(DISTINCT wildfire_id)`` rather than ``count(*)`` for the case
+    of one country being several boundaries of the same name, where a fire
+    burning across the line between them must still be one fire of that country.
+    """
+    areas = WildfireBoundaryArea.__table__
+    ocha_boundary = OchaAdminBoundary.__table__
+
+    rows = (
+        select(
+            AdminBoundary.name.label("country"),
+            areas.c.year,
+            (func.min(areas.c.area_m2) / SQUARE_METRES_PER_HECTARE).label("minimum"),
+            (func.max(areas.c.area_m2) / SQUARE_METRES_PER_HECTARE).label("maximum"),
+            (func.sum(areas.c.area_m2) / SQUARE_METRES_PER_HECTARE).label("total"),
+            func.count(areas.c.wildfire_id.distinct()).label("fires"),
+        )
+        .select_from(areas)
+        .join(DataProvider, DataProvider.id == areas.c.data_provider_id)
+        .join(AdminBoundary, AdminBoundary.id == areas.c.admin_boundary_id)
+        .outerjoin(ocha_boundary, ocha_boundary.c.id == AdminBoundary.id)
+        .where(DataProvider.name == PROVIDER_NAME)
+        .where(DataProvider.product == PROVIDER_PRODUCT)
+        .where(areas.c.level == COUNTRY_LEVEL)
+        .group_by(AdminBoundary.name, areas.c.year)
+    )
+    if year is not None:
+        rows = rows.where(areas.c.year == year)
+    if country is not None:
+        rows = rows.where(or_(
+            func.lower(AdminBoundary.name) == country.lower(),
+            func.upper(ocha_boundary.c.iso_3) == country.upper(),
+        ))
+    return rows
+
+
+def split_world_query(year: int | None) -> Select:
+    """Build the World rows of a ``--split-area`` report.
+
+    Returns
+    -------
+    Select
+        A query yielding ``year, minimum, maximum, total, fires``: one row per year,
+        over every fire that burnt in some country, each once and with the area it
+        burnt on land.
+
+    Notes
+    -----
+    Not combined from the country rows, as :func:`summarise` otherwise builds the
+    World block: a border fire is in two of them, and its parts are not the fire.
+    Summing a fire's parts first gives it back whole, less what burnt outside
+    every country.
+    """
+    areas = WildfireBoundaryArea.__table__
+
+    fires = (
+        select(areas.c.year, func.sum(areas.c.area_m2).label("area_m2"))
+        .join(DataProvider, DataProvider.id == areas.c.data_provider_id)
+        .where(DataProvider.name == PROVIDER_NAME)
+        .where(DataProvider.product == PROVIDER_PRODUCT)
+        .where(areas.c.level == COUNTRY_LEVEL)
+        .group_by(areas.c.wildfire_id, areas.c.year)
+    )
+    if year is not None:
+        fires = fires.where(areas.c.year == year)
+    fire = fires.subquery("fire")
+    return (
+        select(
+            fire.c.year,
+            (func.min(fire.c.area_m2) / SQUARE_METRES_PER_HECTARE).label("minimum"),
+            (func.max(fire.c.area_m2) / SQUARE_METRES_PER_HECTARE).label("maximum"),
+            (func.sum(fire.c.area_m2) / SQUARE_METRES_PER_HECTARE).label("total"),
+            func.count().label("fires"),
+        )
+        .group_by(fire.c.year)
+    )
+
+
+def split_areas_kept(session: Session) -> bool:
+    """Whether ``wildfire_boundary_area`` holds anything for GWIS at all.
+
+    For the reason :func:`summary_is_kept` gives: an empty table is a database
+    imported before it existed, not a world without fires.
+    """
+    areas = WildfireBoundaryArea.__table__
+    return session.scalar(
+        select(areas.c.year)
+        .join(DataProvider, DataProvider.id == areas.c.data_provider_id)
+        .where(DataProvider.name == PROVIDER_NAME)
+        .where(DataProvider.product == PROVIDER_PRODUCT)
+        .limit(1)
+    ) is not None
+
+
 @dataclass(frozen=True)
 class Row:
     """One line of the report.
@@ -450,6 +739,10 @@ class Row:
         Worth reading beside the areas rather than instead of them: a year whose
         total is small because it had few fires is a different year from one
         whose total is small because its fires were.
+    fires_margin, total_margin : float or None
+        The half-width of the 95% confidence interval of ``fires`` and ``total``
+        when the row is estimated from a sample, ``None`` when it is exact. An
+        estimated row's ``minimum`` and ``maximum`` are those of the sampled fires.
     """
 
     country: str
@@ -459,6 +752,8 @@ class Row:
     total: float
     fires: int
     is_world: bool = False
+    fires_margin: float | None = None
+    total_margin: float | None = None
 
     @property
     def is_total(self) -> bool:
@@ -478,6 +773,34 @@ class Row:
     def year_label(self) -> str:
         return TOTAL_LABEL if self.is_total else str(self.year)
 
+    @property
+    def is_estimate(self) -> bool:
+        """Whether the row was estimated from a sample rather than measured."""
+        return self.total_margin is not None
+
+
+def measured_row(record, year: int, sample: sampling.Sample | None = None) -> Row:
+    """One row of a year's statement as a :class:`Row`, scaled up if it was sampled.
+
+    The count is rounded to a whole number of fires and its margin kept as it is;
+    the minimum and maximum are taken as observed, being bounds and not estimates.
+    """
+    if sample is None:
+        return Row(country=record.country, year=year,
+                   minimum=float(record.minimum),
+                   maximum=float(record.maximum),
+                   total=float(record.total),
+                   fires=record.fires)
+    fires = sampling.estimate(record.fires, record.fires_squares, sample)
+    total = sampling.estimate(record.total, record.total_squares, sample)
+    return Row(country=record.country, year=year,
+               minimum=float(record.minimum),
+               maximum=float(record.maximum),
+               total=total.value,
+               fires=round(fires.value),
+               fires_margin=fires.margin,
+               total_margin=total.margin)
+
 
 def combine(rows: list[Row], country: str, year: int | None,
             is_world: bool = False) -> Row:
@@ -494,6 +817,9 @@ def combine(rows: list[Row], country: str, year: int | None,
     ``fsum`` rather than ``sum`` because the values being added are themselves
     sums of millions of hectares; an exact accumulation over a handful of them
     costs nothing and cannot drift from what one pass would have returned.
+
+    Estimates add the same way, and so do their variances: the margins are
+    combined by :func:`~src.apps.statistics.sampling.combined_margin`.
     """
     return Row(
         country=country,
@@ -503,6 +829,8 @@ def combine(rows: list[Row], country: str, year: int | None,
         maximum=max(row.maximum for row in rows),
         total=math.fsum(row.total for row in rows),
         fires=sum(row.fires for row in rows),
+        fires_margin=sampling.combined_margin(row.fires_margin for row in rows),
+        total_margin=sampling.combined_margin(row.total_margin for row in rows),
     )
 
 
@@ -534,7 +862,8 @@ def ordered_countries(session: Session, names: set[str]) -> list[str]:
     return ordered + sorted(names - set(ordered))
 
 
-def summarise(measured: list[Row], countries: list[str], with_world: bool) -> list[Row]:
+def summarise(measured: list[Row], countries: list[str], with_world: bool,
+              world: list[Row] | None = None) -> list[Row]:
     """Build the report from the years measured: the summary rows, in order.
 
     Parameters
@@ -546,6 +875,9 @@ def summarise(measured: list[Row], countries: list[str], with_world: bool) -> li
     with_world : bool
         Whether to open with the World block. It is dropped when ``--country`` is
         given, where it could only repeat that country's rows word for word.
+    world : list of Row, optional
+        The World block's years, when they are not combined from ``measured`` —
+        under ``--split-area``, where a fire is in the rows of several countries.
 
     Returns
     -------
@@ -554,7 +886,10 @@ def summarise(measured: list[Row], countries: list[str], with_world: bool) -> li
         each country, its years newest first and its summary row last.
     """
     report: list[Row] = []
-    if with_world and measured:
+    if with_world and measured and world is not None:
+        report += sorted(world, key=lambda row: row.year, reverse=True)
+        report.append(combine(world, WORLD_LABEL, None, is_world=True))
+    elif with_world and measured:
         for year in sorted({row.year for row in measured}, reverse=True):
             report.append(combine([row for row in measured if row.year == year],
                                   WORLD_LABEL, year, is_world=True))
@@ -590,6 +925,20 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
                              "mis-attributes a fire cannot mislead the report; 'reported' "
                              "trusts the admin_boundary_id the import stored, which is "
                              "much faster and, for this dataset, the same answer")
+    parser.add_argument("--from-summary", action="store_true",
+                        help="read the figures from the yearly summary the importer keeps "
+                             "instead of measuring every fire; only with --country-source "
+                             "reported, and measures the fires anyway if the summary is empty")
+    parser.add_argument("--split-area", action="store_true",
+                        help="split each fire between the countries it burnt in and report "
+                             "the area burnt inside each, from the areas the importer keeps; "
+                             "--country-source does not apply")
+
+    common.add_snapshot_jobs_arguments(parser)
+
+    sampling.add_sample_arguments(parser)
+
+    cache.add_cache_arguments(parser)
 
     output = parser.add_argument_group("output", "at least one is required")
     output.add_argument("--csv", type=Path, help="write the report to this .csv")
@@ -601,14 +950,86 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
                         help="verbosity (env: GISFIRE_LOG_LEVEL, default INFO)")
 
     arguments = parser.parse_args(argv)
+    if arguments.sample is not None and arguments.from_summary:
+        parser.error("--sample and --from-summary do not combine: the summary is already "
+                     "exact and reads a few thousand rows, so there is nothing to estimate")
+    if arguments.split_area and (arguments.from_summary or arguments.sample is not None):
+        parser.error("--split-area reads the areas per country the importer keeps, and "
+                     "combines with neither --from-summary nor --sample")
     if arguments.csv is None and arguments.docx is None:
         parser.error("nothing to write: pass --csv, --docx, or both")
     return arguments
 
 
+def read_summary(session: Session, country: str | None, year: int | None,
+                 logger: logging.Logger, country_source: str) -> list[Row] | None:
+    """The rows :func:`compute` would measure, read from the yearly summary.
+
+    Returns ``None`` when the summary cannot answer the question asked, which
+    tells the caller to measure the fires after all: under ``geometry`` the
+    country is decided at report time and the summary only knows the stored one,
+    and an empty summary knows nothing.
+    """
+    if country_source != COUNTRY_SOURCE_REPORTED:
+        logger.info("The summary holds the country the import stored; "
+                    "--country-source %s needs the fires themselves", country_source)
+        return None
+    if not summary_is_kept(session):
+        logger.warning("The yearly summary holds nothing for GWIS; measuring the fires instead")
+        return None
+    with common.Spinner("Reading the GWIS burnt area from the yearly summary", logger):
+        return [
+            Row(country=record.country, year=record.year,
+                minimum=float(record.minimum),
+                maximum=float(record.maximum),
+                total=float(record.total),
+                fires=int(record.fires))
+            for record in session.execute(summary_query(country, year))
+        ]
+
+
+def read_split_areas(session: Session, country: str | None, year: int | None,
+                     logger: logging.Logger) -> tuple[list[Row], list[Row]]:
+    """The country rows and the World rows of a ``--split-area`` report.
+
+    Raises
+    ------
+    RuntimeError
+        If ``wildfire_boundary_area`` holds nothing for GWIS: reporting from it
+        would say that nothing burnt anywhere.
+    """
+    if not split_areas_kept(session):
+        raise RuntimeError(
+            "The areas per country hold nothing for GWIS. They are kept by the importer "
+            "from the OCHA boundaries: import the boundaries, then the GWIS fires again."
+        )
+    with common.Spinner("Reading the GWIS burnt area per country", logger):
+        measured = [
+            Row(country=record.country, year=record.year,
+                minimum=float(record.minimum),
+                maximum=float(record.maximum),
+                total=float(record.total),
+                fires=int(record.fires))
+            for record in session.execute(split_query(country, year))
+        ]
+        world = [
+            Row(country=WORLD_LABEL, year=record.year, is_world=True,
+                minimum=float(record.minimum),
+                maximum=float(record.maximum),
+                total=float(record.total),
+                fires=int(record.fires))
+            for record in session.execute(split_world_query(year))
+        ] if country is None else None
+    return measured, world
+
+
 def compute(session: Session, country: str | None, year: int | None,
             logger: logging.Logger,
-            country_source: str = COUNTRY_SOURCE_GEOMETRY) -> list[Row]:
+            country_source: str = COUNTRY_SOURCE_GEOMETRY,
+            from_summary: bool = False,
+            jobs: int = 1,
+            sample: sampling.Sample | None = None,
+            split_area: bool = False) -> list[Row]:
     """Measure the fires a year at a time, returning the report's rows in order.
 
     Notes
@@ -617,42 +1038,94 @@ def compute(session: Session, country: str | None, year: int | None,
     under a spinner of its own so that a run of hours says which year it is on
     rather than only that it is alive.
 
-    Every one of them runs in ``session``'s transaction, and so against a single
-    snapshot: a report assembled from many queries is then exactly as consistent
-    as one assembled from a single query, and an import running alongside it
-    cannot have a fire counted in one year's statement and not in another's.
+    Every one of them reads ``session``'s snapshot: a report assembled from many
+    queries is then exactly as consistent as one assembled from a single query,
+    and an import running alongside it cannot have a fire counted in one year's
+    statement and not in another's. With ``jobs`` above 1 the years are measured
+    that many at a time, on connections that import the snapshot rather than take
+    their own, so the same holds.
+
+    With ``from_summary`` the per-country, per-year rows are read from
+    ``wildfire_yearly_summary`` instead, when it can answer (see
+    :func:`read_summary`); the summary rows are built from them the same way.
+
+    With ``sample`` each year's statement measures a sample of the fires and the
+    rows are estimates — see :mod:`src.apps.statistics.sampling`.
+
+    With ``split_area`` nothing is measured: the rows are the area burnt inside
+    each country, read from ``wildfire_boundary_area`` (see
+    :func:`read_split_areas`), and ``country_source`` does not apply.
     """
-    if year is not None:
-        years = [year]
+    world = None
+    if split_area:
+        measured, world = read_split_areas(session, country, year, logger)
+        country_source = "the areas split per country"
     else:
-        with common.Spinner("Finding the years the GWIS fires cover", logger):
-            years = list(session.scalars(years_query()))
-
-    scope = country or "every country"
-    measured: list[Row] = []
-    for index, measuring in enumerate(years, start=1):
-        with common.Spinner(f"Measuring the burnt area of the GWIS fires "
-                            f"({scope}, {measuring}: {index} of {len(years)})", logger):
-            measured += [
-                Row(country=record.country, year=measuring,
-                    minimum=float(record.minimum),
-                    maximum=float(record.maximum),
-                    total=float(record.total),
-                    fires=record.fires)
-                for record in session.execute(
-                    statistics_query(country, measuring, country_source))
-            ]
+        measured = read_summary(session, country, year, logger, country_source) \
+            if from_summary else None
+    if measured is None:
+        if sample is not None:
+            logger.warning("Estimating from %s: every count and total is an estimate",
+                           sample.description)
+        measured = measure(session, country, year, logger, country_source, jobs, sample)
 
     # Counted over the country rows alone: the World block is a summary of them,
     # not a country, and reporting "3 countries" for two would be a small lie in
     # the one line a user is most likely to read.
     countries = ordered_countries(session, {row.country for row in measured})
-    rows = summarise(measured, countries, with_world=country is None)
+    rows = summarise(measured, countries, with_world=country is None, world=world)
     logger.info("Computed %d rows over %d countries (country from %s)",
                 len(rows), len(countries), country_source)
     return rows
 
 
+def measure(session: Session, country: str | None, year: int | None,
+            logger: logging.Logger, country_source: str, jobs: int = 1,
+            sample: sampling.Sample | None = None) -> list[Row]:
+    """Measure the fires themselves, one statement per year: one row per country and year.
+
+    ``jobs`` above 1 measures that many years at a time, on connections sharing
+    ``session``'s snapshot (see :func:`~src.apps.imports.common.measure_by_year`).
+    A ``sample`` measures a sample of each year's fires instead of all of them.
+    """
+    if year is not None:
+        years = [year]
+    else:
+        with common.Spinner("Finding the years the GWIS fires cover", logger):
+            years = list(session.scalars(years_query()))
+
+    def measure_year(worker: Session, measuring: int) -> list[Row]:
+        return [
+            measured_row(record, measuring, sample)
+            for record in worker.execute(
+                statistics_query(country, measuring, country_source, sample))
+        ]
+
+    return common.measure_by_year(session, years, measure_year, jobs,
+                                  "Measuring the burnt area of the GWIS fires",
+                                  country or "every country", logger)
+
+
+def columns(rows: list[Row]) -> tuple[str, ...]:
+    """The headings: :data:`COLUMNS`, or the estimate's if the rows are estimates."""
+    if any(row.is_estimate for row in rows):
+        return sampling.ESTIMATED_COLUMNS
+    return COLUMNS
+
+
+def values(row: Row, readable: bool = False) -> list[str]:
+    """A row's cells in :func:`columns` order, with separators if ``readable``."""
+    grouping = "," if readable else ""
+    cells = [row.country, row.year_label, f"{row.fires:{grouping}}"]
+    if row.is_estimate:
+        cells.append(f"{row.fires_margin:{grouping}.0f}")
+    cells += [f"{row.minimum:{grouping}.2f}", f"{row.maximum:{grouping}.2f}",
+              f"{row.total:{grouping}.2f}"]
+    if row.is_estimate:
+        cells.append(f"{row.total_margin:{grouping}.2f}")
+    return cells
+
+
 def write_csv(rows: list[Row], path: Path, logger: logging.Logger) -> None:
     """Write the report as CSV.
 
@@ -663,15 +1136,15 @@ def write_csv(rows: list[Row], path: Path, logger: logging.Logger) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", newline="", encoding="utf-8") as handle:
         writer = csv.writer(handle)
-        writer.writerow(COLUMNS)
+        writer.writerow(columns(rows))
         for row in rows:
-            writer.writerow([row.country, row.year_label, row.fires,
-                             f"{row.minimum:.2f}", f"{row.maximum:.2f}", f"{row.total:.2f}"])
+            writer.writerow(values(row))
     logger.info("Wrote %s", path)
 
 
 def write_docx(rows: list[Row], path: Path, country: str | None, year: int | None,
-               logger: logging.Logger) -> None:
+               logger: logging.Logger, sample: sampling.Sample | None = None,
+               split_area: bool = False) -> None:
     """Write the report as a Word document.
 
     One table, with each country's summary row in bold so the blocks read apart
@@ -686,7 +1159,8 @@ def write_docx(rows: list[Row], path: Path, country: str | None, year: int | Non
     from docx.shared import Pt
 
     document = Document()
-    document.add_heading("GWIS wildfire burnt area", level=1)
+    document.add_heading("GWIS wildfire burnt area"
+                         + (" — estimate" if sample is not None else ""), level=1)
 
     scope = []
     if country is not None:
@@ -698,18 +1172,34 @@ def write_docx(rows: list[Row], path: Path, country: str | None, year: int | Non
         f"Areas in hectares, computed geodesically on the WGS84 ellipsoid. "
         f"Fires not attributable to a country are excluded. Scope: {subtitle}."
     )
+    if sample is not None:
+        document.add_paragraph(
+            f"An estimate from {sample.description}, not a measurement. Each count "
+            f"and total is scaled up from the sample and followed by the half-width "
+            f"of its 95% confidence interval; the minimum and maximum are the "
+            f"smallest and largest fire in the sample, so the true ones are no "
+            f"larger and no smaller respectively. A country-year with no sampled "
+            f"fire is missing."
+        )
+    if split_area:
+        document.add_paragraph(
+            "Each fire is split between the countries it burnt in: a country's total "
+            "is the area burnt inside its borders, a fire that crossed a border is "
+            "counted in each country it reached, and the minimum and maximum are of "
+            "the parts of fires inside the country. The World rows count each fire "
+            "once, with the area it burnt inside any country."
+        )
 
-    table = document.add_table(rows=1, cols=len(COLUMNS))
+    headings = columns(rows)
+    table = document.add_table(rows=1, cols=len(headings))
     table.style = "Table Grid"
-    for cell, heading in zip(table.rows[0].cells, COLUMNS):
+    for cell, heading in zip(table.rows[0].cells, headings):
         cell.text = heading
         cell.paragraphs[0].runs[0].bold = True
 
     for row in rows:
         cells = table.add_row().cells
-        values = [row.country, row.year_label, f"{row.fires:,}",
-                  f"{row.minimum:,.2f}", f"{row.maximum:,.2f}", f"{row.total:,.2f}"]
-        for index, (cell, value) in enumerate(zip(cells, values)):
+        for index, (cell, value) in enumerate(zip(cells, values(row, readable=True))):
             cell.text = value
             paragraph = cell.paragraphs[0]
             if index >= FIRST_NUMERIC_COLUMN:
@@ -723,26 +1213,54 @@ def write_docx(rows: list[Row], path: Path, country: str | None, year: int | Non
     logger.info("Wrote %s", path)
 
 
-def report(args: argparse.Namespace, engine: Engine, logger: logging.Logger) -> list[Row]:
-    """Compute the statistics and write whichever outputs were asked for."""
+def report(args: argparse.Namespace, engine: Engine,
+           logger: logging.Logger) -> list[Row] | list[report_engine.ReportRow]:
+    """Compute the statistics and write whichever outputs were asked for.
+
+    With ``--country-source reported`` and none of ``--country``,
+    ``--from-summary``, ``--split-area`` or ``--sample``, the report is the
+    ``statistics`` report of :mod:`~src.apps.statistics.wildfires.gwis.reports`:
+    computed in one statement and written by :mod:`src.apps.statistics.engine`, and
+    returned as its rows. Anything else is measured a year at a time here.
+    """
+    # Imported here: the description is built from this module's expressions.
+    from src.apps.statistics.wildfires.gwis import reports
+    described = reports.PROVIDER.report("statistics")
+    if report_engine.covers(described, args):
+        with Session(engine) as session:
+            rows = cache.cached_compute(
+                session, args, [gwis],
+                lambda: report_engine.compute_one(session, reports.PROVIDER, described.name,
+                                                  args.year, logger),
+                logger)
+        if not rows:
+            raise RuntimeError(NOTHING_MATCHED)
+        report_engine.write(reports.PROVIDER, described, rows, args.csv, args.docx, logger)
+        return rows
+
     # No spinner here: compute runs one statement per year and turns one of its
     # own for each, which is the only honest place to say how far along it is.
-    with Session(engine) as session:
-        rows = compute(session, args.country, args.year, logger, args.country_source)
+    sample = sampling.from_arguments(args)
+    with common.snapshot_session(engine) as session:
+        def run() -> list[Row]:
+            return compute(session, args.country, args.year, logger, args.country_source,
+                           args.from_summary, args.jobs, sample, args.split_area)
+
+        # A sample without --sample-seed is a fresh draw each run, and answering it
+        # from the cache would repeat the last draw instead.
+        if sample is not None and sample.seed is None:
+            rows = run()
+        else:
+            rows = cache.cached_compute(session, args, [gwis], run, logger)
 
     if not rows:
-        # An empty report is almost always a mistyped country or a year with no
-        # data, and writing an empty file would hide that.
-        raise RuntimeError(
-            "No wildfires matched. Check --country (a name or an ISO alpha-3 code) and "
-            "--year, and that the GWIS fires and the OCHA boundaries are both imported "
-            "— fires with no country are not counted."
-        )
+        raise RuntimeError(NOTHING_MATCHED)
 
     if args.csv is not None:
         write_csv(rows, args.csv, logger)
     if args.docx is not None:
-        write_docx(rows, args.docx, args.country, args.year, logger)
+        write_docx(rows, args.docx, args.country, args.year, logger, sample,
+                   args.split_area)
     return rows
 
 
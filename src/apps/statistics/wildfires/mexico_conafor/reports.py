@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""CONAFOR's burnt-area and cause reports, described for the shared report engine.
+
+:mod:`~src.apps.statistics.wildfires.mexico_conafor.wildfire_statistics` and
+:mod:`~src.apps.statistics.wildfires.mexico_conafor.wildfire_causes` are companions
+over the same fires, each run one statement per year. Described here as one
+:class:`~src.apps.statistics.engine.Provider`, the two are answered by
+:mod:`src.apps.statistics.run_reports` from a single grouped pass, and print the same
+rows — the tests hold them to it. The statistics application's module docstring says
+the year-at-a-time shape is there for its GWIS and GFA counterparts and not for this
+dataset; forty-five thousand perimeters fit in one statement.
+
+What the engine does not have is those applications' options. These are the reports
+as they run by default: geodesic areas (``--area-method geodesic``), every fire (no
+``--min-area``), and the natural fires counted by cause (``--cause Naturales``). Run
+that way, each application computes and writes its report through the engine; with
+any other option, it still does so itself.
+
+The source
+----------
+
+One row per CONAFOR fire, with its published year, its geodesic hectares, whether it
+has a perimeter to measure, and its reconciled cause. The cause is joined outer, as
+the causes application joins it, so the fires whose published cause was a null token
+are still fires. The statistics report leaves out the fires with no perimeter, as its
+application does, and the causes report counts them; that is its ``FILTER``.
+
+The ``Lightning`` cell
+----------------------
+
+Empty, not zero, where no fire in the row publishes a specific cause — 2011 and every
+year from 2020. The measure is a ``CASE`` over that count, so the engine reads a
+``NULL`` and writes the blank the application writes; a summary row has a number
+whenever any year in it does, which is the application's total too.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import Select
+from sqlalchemy import case
+from sqlalchemy import func
+from sqlalchemy import literal
+from sqlalchemy import select
+
+from src.apps.statistics import engine
+from src.apps.statistics.wildfires.mexico_conafor.wildfire_causes import DEFAULT_CAUSE
+from src.apps.statistics.wildfires.mexico_conafor.wildfire_causes import LIGHTNING_LABEL
+from src.apps.statistics.wildfires.mexico_conafor.wildfire_causes import columns
+from src.apps.statistics.wildfires.mexico_conafor.wildfire_statistics import (
+    AREA_METHOD_GEODESIC)
+from src.apps.statistics.wildfires.mexico_conafor.wildfire_statistics import COUNTRY_NAME
+from src.apps.statistics.wildfires.mexico_conafor.wildfire_statistics import (
+    PUBLISHED_YEAR)
+from src.apps.statistics.wildfires.mexico_conafor.wildfire_statistics import burnt_area
+from src.apps.statistics.wildfires.mexico_conafor.wildfire_statistics import measurable
+from src.data_model.wildfire import Wildfire
+from src.providers.mexico_conafor.fire_cause import ConaforFireCause
+from src.providers.mexico_conafor.wildfire import ConaforWildfire
+
+#: How :mod:`src.apps.statistics.run_reports` names this provider.
+PROVIDER_NAME = "mexico_conafor"
+
+#: The causes report's headings, which name the cause counted.
+CAUSE_HEADINGS = columns(DEFAULT_CAUSE)
+
+
+def source(year: int | None) -> Select:
+    """Every CONAFOR fire, or one published year's, with what both reports read."""
+    conafor = ConaforWildfire.__table__
+    fire_cause = ConaforFireCause.__table__
+
+    query = (
+        select(
+            literal(COUNTRY_NAME).label("country"),
+            PUBLISHED_YEAR.label("year"),
+            burnt_area(AREA_METHOD_GEODESIC).label("area"),
+            measurable(AREA_METHOD_GEODESIC).label("measurable"),
+            conafor.c.cause_id.label("cause_id"),
+            fire_cause.c.cause_normalised.label("cause"),
+            fire_cause.c.specific_cause.label("specific_cause"),
+            fire_cause.c.specific_cause_en.label("specific_cause_en"),
+        )
+        .select_from(Wildfire)
+        .join(conafor, conafor.c.id == Wildfire.id)
+        .outerjoin(fire_cause, fire_cause.c.id == conafor.c.cause_id)
+    )
+    if year is not None:
+        query = query.where(PUBLISHED_YEAR == year)
+    return query
+
+
+PROVIDER = engine.register(engine.Provider(
+    name=PROVIDER_NAME,
+    source=source,
+    dimensions=(
+        engine.Dimension("country", "Country"),
+        engine.Dimension("year", "Year", descending=True),
+    ),
+    measures=(
+        engine.Measure("fires", "Fires", lambda c: func.count()),
+        engine.Measure("minimum", "Minimum (ha)", lambda c: func.min(c.area),
+                       kind=engine.KIND_HECTARES),
+        engine.Measure("maximum", "Maximum (ha)", lambda c: func.max(c.area),
+                       kind=engine.KIND_HECTARES),
+        engine.Measure("total", "Total (ha)", lambda c: func.sum(c.area),
+                       kind=engine.KIND_HECTARES, default=0.0),
+        engine.Measure("classified", CAUSE_HEADINGS[3],
+                       lambda c: func.count(c.cause_id)),
+        engine.Measure("natural", CAUSE_HEADINGS[4], lambda c: func.count(),
+                       condition=lambda c: c.cause == DEFAULT_CAUSE),
+        engine.Measure("lightning", LIGHTNING_LABEL, lambda c: case(
+            (func.count(c.specific_cause) > 0,
+             func.count().filter(c.specific_cause_en == LIGHTNING_LABEL)))),
+    ),
+    shares=(
+        engine.Share("natural_percent", CAUSE_HEADINGS[5], "natural", of="classified"),
+    ),
+    reports=(
+        engine.ReportDefinition(
+            name="statistics",
+            title=f"CONAFOR wildfire burnt area ({COUNTRY_NAME})",
+            rows=("country", "year"),
+            columns=("fires", "minimum", "maximum", "total"),
+            total_over="year",
+            totals=engine.TOTALS_ALWAYS,
+            where=lambda c: c.measurable,
+            notes=(
+                "Areas in hectares, computed geodesically on the WGS84 ellipsoid. Years "
+                "are the year of the archive the fire was published in.",
+                "The series runs 2010 to 2023; a year missing from the table is a year "
+                "not imported. The counts are not comparable across 2016: before then "
+                "CONAFOR published only the fires it had drawn, and from 2016 it "
+                "publishes the season.",
+                f"The Country column is {COUNTRY_NAME} on every row, a label rather "
+                f"than the answer of a containment test.",
+            ),
+            options={"area_method": AREA_METHOD_GEODESIC, "min_area": None},
+        ),
+        engine.ReportDefinition(
+            name="causes",
+            title=(f"CONAFOR wildfire counts — {CAUSE_HEADINGS[4]} causes "
+                   f"({COUNTRY_NAME})"),
+            rows=("country", "year"),
+            columns=("fires", "classified", "natural", "natural_percent", "lightning"),
+            total_over="year",
+            totals=engine.TOTALS_ALWAYS,
+            notes=(
+                f"Counts of CONAFOR wildfires whose reconciled cause is {DEFAULT_CAUSE}, "
+                f"with the lightning fires beside them. Every fire is counted; no "
+                f"perimeter is required. Years are the year of the archive the fire was "
+                f"published in.",
+                "CONAFOR publishes lightning as a specific cause only in 2010 and "
+                "2012-2019. For the other years the Lightning cell is left blank: a "
+                "blank is not a zero. The Total is a total of the years that answer it.",
+                "The percentage is of the classified fires and not of all of them. "
+                "Treat it as a floor: Desconocidas is the second largest cause in the "
+                "archive.",
+            ),
+            options={"cause": DEFAULT_CAUSE},
+        ),
+    ),
+    tables=("wildfire", "conafor_wildfire", "conafor_fire_cause"),
+))
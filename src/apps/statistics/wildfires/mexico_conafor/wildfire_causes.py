@@ -197,6 +197,7 @@ from sqlalchemy.orm import Session
 import src.settings  # noqa: F401  (imported for the side effect of loading .env)
 
 from src.apps.imports import common
+from src.apps.statistics import engine as report_engine
 from src.apps.statistics.wildfires.mexico_conafor.wildfire_statistics import COUNTRY_NAME
 from src.apps.statistics.wildfires.mexico_conafor.wildfire_statistics import PUBLISHED_YEAR
 from src.apps.statistics.wildfires.mexico_conafor.wildfire_statistics import TOTAL_LABEL
@@ -691,10 +692,25 @@ def write_docx(rows: list[Row], path: Path, year: int | None,
     logger.info("Wrote %s", path)
 
 
-def report(args: argparse.Namespace, engine: Engine, logger: logging.Logger) -> list[Row]:
-    """Count the fires and write whichever outputs were asked for."""
+def report(args: argparse.Namespace, engine: Engine,
+           logger: logging.Logger) -> list[Row] | list[report_engine.ReportRow]:
+    """Count the fires and write whichever outputs were asked for.
+
+    Run with the options of the ``causes`` report of
+    :mod:`~src.apps.statistics.wildfires.mexico_conafor.reports` — the defaults — it is
+    that report: computed and written by :mod:`src.apps.statistics.engine`, and
+    returned as its rows. Any other ``--cause`` is counted and written here.
+    """
+    # Imported here: the description is built from this module's expressions.
+    from src.apps.statistics.wildfires.mexico_conafor import reports
+    described = reports.PROVIDER.report("causes")
+    covered = report_engine.covers(described, args)
     with Session(engine) as session:
-        rows = compute(session, args.year, logger, args.cause)
+        if covered:
+            rows = report_engine.compute_one(session, reports.PROVIDER, described.name,
+                                             args.year, logger)
+        else:
+            rows = compute(session, args.year, logger, args.cause)
 
     if not rows:
         # An empty report is almost always a year with no data, and writing an empty
@@ -706,10 +722,13 @@ def report(args: argparse.Namespace, engine: Engine, logger: logging.Logger) ->
             "imported has nothing to find — and that the CONAFOR fires are imported."
         )
 
-    if args.csv is not None:
-        write_csv(rows, args.csv, logger, args.cause)
-    if args.docx is not None:
-        write_docx(rows, args.docx, args.year, logger, args.cause)
+    if covered:
+        report_engine.write(reports.PROVIDER, described, rows, args.csv, args.docx, logger)
+    else:
+        if args.csv is not None:
+            write_csv(rows, args.csv, logger, args.cause)
+        if args.docx is not None:
+            write_docx(rows, args.docx, args.year, logger, args.cause)
     return rows
 
 
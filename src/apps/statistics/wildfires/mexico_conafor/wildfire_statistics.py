@@ -164,11 +164,9 @@ import sys
 from dataclasses import dataclass
 from pathlib import Path
 
-from geoalchemy2 import Geography
 from sqlalchemy import ColumnElement
 from sqlalchemy import Engine
 from sqlalchemy import Select
-from sqlalchemy import cast
 from sqlalchemy import create_engine
 from sqlalchemy import func
 from sqlalchemy import literal
@@ -178,7 +176,10 @@ from sqlalchemy.orm import Session
 import src.settings  # noqa: F401  (imported for the side effect of loading .env)
 
 from src.apps.imports import common
+from src.apps.statistics import cache
+from src.apps.statistics import engine as report_engine
 from src.data_model.wildfire import Wildfire
+from src.providers import mexico_conafor
 from src.providers.mexico_conafor.wildfire import ConaforWildfire
 
 #: Label used in the ``Year`` column for the summary row.
@@ -248,19 +249,13 @@ def burnt_area(method: str) -> ColumnElement:
 
     Notes
     -----
-    The geodesic cast carries the geometry type and SRID rather than being a bare
-    ``Geography()``: that renders as ``geography(GEOMETRY,-1)``, which PostGIS
-    rejects, because -1 is not a SRID it knows.
-
     ``reported`` returns the published column untouched. It is not converted,
     scaled or measured — the whole point of the option is that it is CONAFOR's own
     number — and it is the one method whose value can be present for a fire with
     no polygon, and absent for a fire that has one. See :func:`measurable`.
     """
     if method == AREA_METHOD_GEODESIC:
-        square_metres = func.ST_Area(
-            cast(Wildfire.perimeter, Geography(geometry_type="MULTIPOLYGON", srid=4326))
-        )
+        square_metres = Wildfire.perimeter_area_m2
     elif method == AREA_METHOD_EQUAL_AREA:
         square_metres = func.ST_Area(func.ST_Transform(Wildfire.perimeter, EQUAL_AREA_SRID))
     elif method == AREA_METHOD_REPORTED:
@@ -566,6 +561,8 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument("--country", help=argparse.SUPPRESS)
     parser.add_argument("--country-source", help=argparse.SUPPRESS)
 
+    cache.add_cache_arguments(parser)
+
     output = parser.add_argument_group("output", "at least one is required")
     output.add_argument("--csv", type=Path, help="write the report to this .csv")
     output.add_argument("--docx", type=Path, help="write the report to this .docx (MS Word)")
@@ -729,12 +726,31 @@ def write_docx(rows: list[Row], path: Path, year: int | None,
     logger.info("Wrote %s", path)
 
 
-def report(args: argparse.Namespace, engine: Engine, logger: logging.Logger) -> list[Row]:
-    """Compute the statistics and write whichever outputs were asked for."""
+def report(args: argparse.Namespace, engine: Engine,
+           logger: logging.Logger) -> list[Row] | list[report_engine.ReportRow]:
+    """Compute the statistics and write whichever outputs were asked for.
+
+    Run with the options of the ``statistics`` report of
+    :mod:`~src.apps.statistics.wildfires.mexico_conafor.reports` — the defaults — it is
+    that report: computed and written by :mod:`src.apps.statistics.engine`, and
+    returned as its rows. Any other option is computed and written here.
+    """
+    # Imported here: the description is built from this module's expressions.
+    from src.apps.statistics.wildfires.mexico_conafor import reports
+    described = reports.PROVIDER.report("statistics")
+    covered = report_engine.covers(described, args)
     # No spinner here: compute runs one statement per year and turns one of its own
     # for each, which is the only honest place to say how far along it is.
     with Session(engine) as session:
-        rows = compute(session, args.year, logger, args.area_method, args.min_area)
+        if covered:
+            def run() -> list[report_engine.ReportRow]:
+                return report_engine.compute_one(session, reports.PROVIDER,
+                                                 described.name, args.year, logger)
+        else:
+            def run() -> list[Row]:
+                return compute(session, args.year, logger, args.area_method,
+                               args.min_area)
+        rows = cache.cached_compute(session, args, [mexico_conafor], run, logger)
 
     if not rows:
         # An empty report is almost always a year with no data, and writing an empty
@@ -748,10 +764,14 @@ def report(args: argparse.Namespace, engine: Engine, logger: logging.Logger) ->
             + threshold
         )
 
-    if args.csv is not None:
-        write_csv(rows, args.csv, logger)
-    if args.docx is not None:
-        write_docx(rows, args.docx, args.year, logger, args.area_method, args.min_area)
+    if covered:
+        report_engine.write(reports.PROVIDER, described, rows, args.csv, args.docx, logger)
+    else:
+        if args.csv is not None:
+            write_csv(rows, args.csv, logger)
+        if args.docx is not None:
+            write_docx(rows, args.docx, args.year, logger, args.area_method,
+                       args.min_area)
     return rows
 
 
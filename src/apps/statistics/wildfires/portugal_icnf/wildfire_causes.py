@@ -124,6 +124,7 @@ from sqlalchemy.orm import Session
 import src.settings  # noqa: F401  (imported for the side effect of loading .env)
 
 from src.apps.imports import common
+from src.apps.statistics import engine as report_engine
 from src.apps.statistics.wildfires.portugal_icnf.wildfire_statistics import COUNTRY_SOURCES
 from src.apps.statistics.wildfires.portugal_icnf.wildfire_statistics import (
     COUNTRY_SOURCE_GEOMETRY,
@@ -518,10 +519,26 @@ def write_docx(rows: list[Row], path: Path, year: int | None,
     logger.info("Wrote %s", path)
 
 
-def report(args: argparse.Namespace, engine: Engine, logger: logging.Logger) -> list[Row]:
-    """Count the fires and write whichever outputs were asked for."""
+def report(args: argparse.Namespace, engine: Engine,
+           logger: logging.Logger) -> list[Row] | list[report_engine.ReportRow]:
+    """Count the fires and write whichever outputs were asked for.
+
+    Run with the options of the ``causes`` report of
+    :mod:`~src.apps.statistics.wildfires.portugal_icnf.reports` — the defaults — it is
+    that report: computed and written by :mod:`src.apps.statistics.engine`, and
+    returned as its rows. Any other option is counted and written here.
+    """
+    # Imported here: the description is built from this module's expressions.
+    from src.apps.statistics.wildfires.portugal_icnf import reports
+    described = reports.PROVIDER.report("causes")
+    covered = report_engine.covers(described, args)
     with Session(engine) as session:
-        rows = compute(session, args.year, logger, args.cause_type, args.country_source)
+        if covered:
+            rows = report_engine.compute_one(session, reports.PROVIDER, described.name,
+                                             args.year, logger)
+        else:
+            rows = compute(session, args.year, logger, args.cause_type,
+                           args.country_source)
 
     if not rows:
         # An empty report is almost always a year with no data, and writing an
@@ -533,10 +550,13 @@ def report(args: argparse.Namespace, engine: Engine, logger: logging.Logger) ->
             "boundaries are both imported — fires with no country are not counted."
         )
 
-    if args.csv is not None:
-        write_csv(rows, args.csv, logger, args.cause_type)
-    if args.docx is not None:
-        write_docx(rows, args.docx, args.year, logger, args.cause_type)
+    if covered:
+        report_engine.write(reports.PROVIDER, described, rows, args.csv, args.docx, logger)
+    else:
+        if args.csv is not None:
+            write_csv(rows, args.csv, logger, args.cause_type)
+        if args.docx is not None:
+            write_docx(rows, args.docx, args.year, logger, args.cause_type)
     return rows
 
 
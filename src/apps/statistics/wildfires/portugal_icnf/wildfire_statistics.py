@@ -167,11 +167,9 @@ import sys
 from dataclasses import dataclass
 from pathlib import Path
 
-from geoalchemy2 import Geography
 from sqlalchemy import ColumnElement
 from sqlalchemy import Engine
 from sqlalchemy import Select
-from sqlalchemy import cast
 from sqlalchemy import create_engine
 from sqlalchemy import func
 from sqlalchemy import select
@@ -181,8 +179,12 @@ from sqlalchemy.orm import Session
 import src.settings  # noqa: F401  (imported for the side effect of loading .env)
 
 from src.apps.imports import common
+from src.apps.statistics import cache
+from src.apps.statistics import engine as report_engine
 from src.data_model.geography.admin_boundary import AdminBoundary
+from src.data_model.geography.admin_boundary import AdminBoundaryPart
 from src.data_model.wildfire import Wildfire
+from src.providers import portugal_icnf
 from src.providers.ocha.admin_boundary import OchaAdminBoundary
 from src.providers.portugal_icnf.wildfire import IcnfWildfire
 
@@ -256,15 +258,9 @@ def burnt_area(method: str) -> ColumnElement:
     Always measured from the EPSG:4326 perimeter on the parent ``wildfire`` row,
     never from the published EPSG:3763 copy — see the module docstring for why the
     national grid is not an option here.
-
-    The geodesic cast carries the geometry type and SRID rather than being a bare
-    ``Geography()``: that renders as ``geography(GEOMETRY,-1)``, which PostGIS
-    rejects, because -1 is not a SRID it knows.
     """
     if method == AREA_METHOD_GEODESIC:
-        square_metres = func.ST_Area(
-            cast(Wildfire.perimeter, Geography(geometry_type="MULTIPOLYGON", srid=4326))
-        )
+        square_metres = Wildfire.perimeter_area_m2
     elif method == AREA_METHOD_EQUAL_AREA:
         square_metres = func.ST_Area(func.ST_Transform(Wildfire.perimeter, EQUAL_AREA_SRID))
     else:
@@ -322,16 +318,18 @@ def country_columns(source: str) -> tuple[ColumnElement, list]:
             f"unknown country source {source!r}; expected one of {', '.join(COUNTRY_SOURCES)}"
         )
 
-    # LATERAL ... LIMIT 1 rather than a plain join: a point on a shared border can
-    # satisfy ST_Contains for two countries, and one fire must not become two rows.
+    # LATERAL ... LIMIT 1 rather than a plain join: a point on a shared border, or
+    # on a cut between two pieces of one country, intersects two admin_boundary_part
+    # rows, and one fire must not become two rows.
     # The join is inner, which is what drops a fire that is inside no country at
     # all — the same rule ``reported`` gets from its inner join to admin_boundary.
     containing = (
         select(AdminBoundary.name.label("name"))
-        .select_from(AdminBoundary)
+        .select_from(AdminBoundaryPart)
+        .join(AdminBoundary, AdminBoundary.id == AdminBoundaryPart.admin_boundary_id)
         .join(ocha_boundary, ocha_boundary.c.id == AdminBoundary.id)
-        .where(AdminBoundary.level == COUNTRY_LEVEL)
-        .where(func.ST_Contains(AdminBoundary.geometry, LOCATOR))
+        .where(AdminBoundaryPart.level == COUNTRY_LEVEL)
+        .where(func.ST_Intersects(AdminBoundaryPart.geometry, LOCATOR))
         .limit(1)
         .lateral("containing")
     )
@@ -634,6 +632,8 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
     # thing to have done.
     parser.add_argument("--country", help=argparse.SUPPRESS)
 
+    cache.add_cache_arguments(parser)
+
     output = parser.add_argument_group("output", "at least one is required")
     output.add_argument("--csv", type=Path, help="write the report to this .csv")
     output.add_argument("--docx", type=Path, help="write the report to this .docx (MS Word)")
@@ -779,13 +779,32 @@ def write_docx(rows: list[Row], path: Path, year: int | None,
     logger.info("Wrote %s", path)
 
 
-def report(args: argparse.Namespace, engine: Engine, logger: logging.Logger) -> list[Row]:
-    """Compute the statistics and write whichever outputs were asked for."""
+def report(args: argparse.Namespace, engine: Engine,
+           logger: logging.Logger) -> list[Row] | list[report_engine.ReportRow]:
+    """Compute the statistics and write whichever outputs were asked for.
+
+    Run with the options of the ``statistics`` report of
+    :mod:`~src.apps.statistics.wildfires.portugal_icnf.reports` — the defaults — it is
+    that report: computed in one statement and written by
+    :mod:`src.apps.statistics.engine`, and returned as its rows. Any other option is
+    measured a year at a time here.
+    """
+    # Imported here: the description is built from this module's expressions.
+    from src.apps.statistics.wildfires.portugal_icnf import reports
+    described = reports.PROVIDER.report("statistics")
+    covered = report_engine.covers(described, args)
     # No spinner here: compute runs one statement per year and turns one of its
     # own for each, which is the only honest place to say how far along it is.
     with Session(engine) as session:
-        rows = compute(session, args.year, logger, args.area_method, args.country_source,
-                       args.min_area)
+        if covered:
+            def run() -> list[report_engine.ReportRow]:
+                return report_engine.compute_one(session, reports.PROVIDER,
+                                                 described.name, args.year, logger)
+        else:
+            def run() -> list[Row]:
+                return compute(session, args.year, logger, args.area_method,
+                               args.country_source, args.min_area)
+        rows = cache.cached_compute(session, args, [portugal_icnf], run, logger)
 
     if not rows:
         # An empty report is almost always a year with no data, and writing an
@@ -799,10 +818,14 @@ def report(args: argparse.Namespace, engine: Engine, logger: logging.Logger) ->
             + threshold
         )
 
-    if args.csv is not None:
-        write_csv(rows, args.csv, logger)
-    if args.docx is not None:
-        write_docx(rows, args.docx, args.year, logger, args.area_method, args.min_area)
+    if covered:
+        report_engine.write(reports.PROVIDER, described, rows, args.csv, args.docx, logger)
+    else:
+        if args.csv is not None:
+            write_csv(rows, args.csv, logger)
+        if args.docx is not None:
+            write_docx(rows, args.docx, args.year, logger, args.area_method,
+                       args.min_area)
     return rows
 
 
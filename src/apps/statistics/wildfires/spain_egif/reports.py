@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""EGIF's burnt-area and cause reports, described for the shared report engine.
+
+:mod:`~src.apps.statistics.wildfires.spain_egif.wildfire_statistics` and
+:mod:`~src.apps.statistics.wildfires.spain_egif.wildfire_causes` each read the
+archive a campaign at a time. Described here as one
+:class:`~src.apps.statistics.engine.Provider`, the two are answered by
+:mod:`src.apps.statistics.run_reports` from a single grouped pass, and print the same
+rows — the tests hold them to it.
+
+What the engine does not have is those applications' options. These are the reports
+as they run by default: the forest area as filed (``--surface forest``), the country
+as filed, every fire (no ``--min-area`` or ``--region``), and the lightning family
+counted by cause. Run with those defaults, each application computes and writes its
+report through the engine; a report needing any other option is still computed by its
+own application.
+
+The source
+----------
+
+One row per fire the archive holds, with its forest area, its cause family and
+whether its published point is inside Spain. The statistics report counts only the
+fires that report a forest area, and the causes report every fire, so the source
+keeps them all and the statistics report's ``FILTER`` narrows it. Spain's outline is
+one row, materialised once and joined to every fire, as
+:data:`~src.apps.statistics.wildfires.spain_egif.wildfire_causes.SPAIN_SQL` explains;
+the causes application's one test per fire is the same test here, over every
+campaign at once.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import Select
+from sqlalchemy import and_
+from sqlalchemy import func
+from sqlalchemy import literal
+from sqlalchemy import select
+from sqlalchemy import true
+
+from src.apps.statistics import engine
+from src.apps.statistics.wildfires.spain_egif.wildfire_causes import DEFAULT_FAMILY
+from src.apps.statistics.wildfires.spain_egif.wildfire_causes import cause_family
+from src.apps.statistics.wildfires.spain_egif.wildfire_causes import columns
+from src.apps.statistics.wildfires.spain_egif.wildfire_statistics import CAMPAIGN
+from src.apps.statistics.wildfires.spain_egif.wildfire_statistics import COUNTRY_LEVEL
+from src.apps.statistics.wildfires.spain_egif.wildfire_statistics import COUNTRY_NAME
+from src.apps.statistics.wildfires.spain_egif.wildfire_statistics import (
+    COUNTRY_SOURCE_FILED)
+from src.apps.statistics.wildfires.spain_egif.wildfire_statistics import SURFACE_FOREST
+from src.apps.statistics.wildfires.spain_egif.wildfire_statistics import SURFACE_PROSE
+from src.apps.statistics.wildfires.spain_egif.wildfire_statistics import reported_surface
+from src.data_model.geography.admin_boundary import AdminBoundary
+from src.data_model.ignition import Ignition
+from src.providers.ocha.admin_boundary import OchaAdminBoundary
+from src.providers.spain_egif.fire_cause import EgifFireCause
+from src.providers.spain_egif.wildfire import EgifWildfire
+
+#: How :mod:`src.apps.statistics.run_reports` names this provider.
+PROVIDER_NAME = "spain_egif"
+
+#: The causes report's headings, which name the family counted.
+CAUSE_HEADINGS = columns(DEFAULT_FAMILY)
+
+#: The leading ``idcausa`` digit of the family counted.
+FAMILY_DIGIT = cause_family(DEFAULT_FAMILY).digit
+
+
+def source(campaign: int | None) -> Select:
+    """Every EGIF fire, or one campaign's, with the columns both reports read."""
+    egif = EgifWildfire.__table__
+    cause = EgifFireCause.__table__
+    ignition = Ignition.__table__
+    ocha_boundary = OchaAdminBoundary.__table__
+    hectares, is_reported = reported_surface(SURFACE_FOREST)
+
+    spain = (
+        select(AdminBoundary.geometry.label("geometry"))
+        .join(ocha_boundary, ocha_boundary.c.id == AdminBoundary.id)
+        .where(AdminBoundary.level == COUNTRY_LEVEL)
+        .where(AdminBoundary.name == COUNTRY_NAME)
+        .limit(1)
+        .cte("spain")
+        .prefix_with("MATERIALIZED")
+    )
+    query = (
+        select(
+            literal(COUNTRY_NAME).label("country"),
+            CAMPAIGN.label("year"),
+            hectares.label("area"),
+            is_reported.label("reported"),
+            egif.c.cause_id.label("cause_id"),
+            func.substr(cause.c.code, 1, 1).label("family"),
+            and_(ignition.c.geometry.is_not(None),
+                 func.ST_Contains(spain.c.geometry, ignition.c.geometry)).label("inside"),
+        )
+        .select_from(egif)
+        .outerjoin(cause, cause.c.id == egif.c.cause_id)
+        .outerjoin(ignition, ignition.c.id == egif.c.ignition_id)
+        .outerjoin(spain, true())
+    )
+    if campaign is not None:
+        query = query.where(CAMPAIGN == campaign)
+    return query
+
+
+PROVIDER = engine.register(engine.Provider(
+    name=PROVIDER_NAME,
+    source=source,
+    dimensions=(
+        engine.Dimension("country", "Country"),
+        engine.Dimension("year", "Year", descending=True),
+    ),
+    measures=(
+        engine.Measure("fires", "Fires", lambda c: func.count()),
+        engine.Measure("minimum", "Minimum (ha)", lambda c: func.min(c.area),
+                       kind=engine.KIND_HECTARES),
+        engine.Measure("maximum", "Maximum (ha)", lambda c: func.max(c.area),
+                       kind=engine.KIND_HECTARES),
+        engine.Measure("total", "Total (ha)", lambda c: func.sum(c.area),
+                       kind=engine.KIND_HECTARES, default=0.0),
+        engine.Measure("classified", "Classified", lambda c: func.count(c.cause_id)),
+        engine.Measure("lightning", CAUSE_HEADINGS[4], lambda c: func.count(),
+                       condition=lambda c: c.family == FAMILY_DIGIT),
+        engine.Measure("inside", "Fires inside", lambda c: func.count(),
+                       condition=lambda c: c.inside),
+        engine.Measure("classified_inside", "Classified inside",
+                       lambda c: func.count(c.cause_id), condition=lambda c: c.inside),
+        engine.Measure("lightning_inside", CAUSE_HEADINGS[9], lambda c: func.count(),
+                       condition=lambda c: c.inside & (c.family == FAMILY_DIGIT)),
+    ),
+    shares=(
+        engine.Share("lightning_percent", CAUSE_HEADINGS[5], "lightning",
+                     of="classified"),
+        engine.Share("inside_percent", "Fires inside (%)", "inside", of="fires"),
+        engine.Share("lightning_inside_percent", CAUSE_HEADINGS[10], "lightning_inside",
+                     of="classified_inside"),
+    ),
+    reports=(
+        engine.ReportDefinition(
+            name="statistics",
+            title=f"EGIF wildfire burnt area ({COUNTRY_NAME})",
+            rows=("country", "year"),
+            columns=("fires", "minimum", "maximum", "total"),
+            total_over="year",
+            totals=engine.TOTALS_ALWAYS,
+            where=lambda c: c.reported,
+            notes=(
+                f"Areas in hectares as reported by EGIF — "
+                f"{SURFACE_PROSE[SURFACE_FOREST]} — and not measured from a perimeter, "
+                "which EGIF does not publish. Fires that do not report this area are "
+                "excluded; a reported zero is counted. Years are the filed Campania.",
+                "A campaign's total is a floor: the service exports only fires it has "
+                "closed and reviewed, so a recently exported year is missing whole "
+                "regions and will grow when it is re-imported.",
+            ),
+            options={"surface": SURFACE_FOREST, "min_area": None, "region": None,
+                     "country_source": COUNTRY_SOURCE_FILED},
+        ),
+        engine.ReportDefinition(
+            name="causes",
+            title=f"EGIF wildfire counts — {CAUSE_HEADINGS[4]} causes ({COUNTRY_NAME})",
+            rows=("country", "year"),
+            columns=("fires", "classified", "lightning", "lightning_percent", "inside",
+                     "inside_percent", "classified_inside", "lightning_inside",
+                     "lightning_inside_percent"),
+            total_over="year",
+            totals=engine.TOTALS_ALWAYS,
+            notes=(
+                f"Counts of EGIF wildfires whose idcausa is of the {FAMILY_DIGIT} "
+                "family. Every filed fire is counted, whether or not its report form "
+                "gives a burnt area and wherever its coordinate is. Years are the filed "
+                "Campania. The percentage is of the classified fires and not of all of "
+                "them, and is left blank where nothing was classified.",
+                "The '... inside' columns repeat the counts over the fires whose "
+                f"published ignition point is inside the {COUNTRY_NAME} polygon. EGIF "
+                "publishes no coordinate at all for about half of the archive.",
+            ),
+            options={"cause_family": DEFAULT_FAMILY, "region": None},
+        ),
+    ),
+    tables=("egif_wildfire", "egif_fire_cause", "ignition", "admin_boundary",
+            "ocha_admin_boundary"),
+))
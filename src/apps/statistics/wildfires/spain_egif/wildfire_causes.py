@@ -212,6 +212,7 @@ from sqlalchemy.orm import Session
 import src.settings  # noqa: F401  (imported for the side effect of loading .env)
 
 from src.apps.imports import common
+from src.apps.statistics import engine as report_engine
 from src.apps.statistics.wildfires.spain_egif.wildfire_statistics import COUNTRY_LEVEL
 from src.apps.statistics.wildfires.spain_egif.wildfire_statistics import COUNTRY_NAME
 from src.apps.statistics.wildfires.spain_egif.wildfire_statistics import TOTAL_LABEL
@@ -895,16 +896,30 @@ def write_docx(rows: list[Row], path: Path, year: int | None,
     logger.info("Wrote %s", path)
 
 
-def report(args: argparse.Namespace, engine: Engine, logger: logging.Logger) -> list[Row]:
+def report(args: argparse.Namespace, engine: Engine,
+           logger: logging.Logger) -> list[Row] | list[report_engine.ReportRow]:
     """Count the fires and write whichever outputs were asked for.
 
+    Run with the options of the ``causes`` report of
+    :mod:`~src.apps.statistics.wildfires.spain_egif.reports` — the defaults — it is
+    that report: computed and written by :mod:`src.apps.statistics.engine`, and
+    returned as its rows. Any other option is counted and written here.
+
     The region is resolved first, inside the same session, so that a name nobody
     recognises fails before any fire is counted — and against the database, so the
     error can list the communities that really are imported.
     """
+    # Imported here: the description is built from this module's expressions.
+    from src.apps.statistics.wildfires.spain_egif import reports
+    described = reports.PROVIDER.report("causes")
+    covered = report_engine.covers(described, args)
     with Session(engine) as session:
         region = None if args.region is None else resolve_region(session, args.region)
-        rows = compute(session, args.year, logger, args.cause_family, region)
+        if covered:
+            rows = report_engine.compute_one(session, reports.PROVIDER, described.name,
+                                             args.year, logger)
+        else:
+            rows = compute(session, args.year, logger, args.cause_family, region)
 
     if not rows:
         # An empty report is almost always a campaign with no data, and writing an
@@ -921,10 +936,13 @@ def report(args: argparse.Namespace, engine: Engine, logger: logging.Logger) ->
             "in scope at all." + extra
         )
 
-    if args.csv is not None:
-        write_csv(rows, args.csv, logger, args.cause_family)
-    if args.docx is not None:
-        write_docx(rows, args.docx, args.year, logger, args.cause_family, region)
+    if covered:
+        report_engine.write(reports.PROVIDER, described, rows, args.csv, args.docx, logger)
+    else:
+        if args.csv is not None:
+            write_csv(rows, args.csv, logger, args.cause_family)
+        if args.docx is not None:
+            write_docx(rows, args.docx, args.year, logger, args.cause_family, region)
     return rows
 
 
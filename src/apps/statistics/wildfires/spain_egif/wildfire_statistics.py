@@ -211,6 +211,12 @@ died, and a point is a far cheaper thing to contain than a multipolygon. The
 ``Total`` row is arithmetic over the campaigns, by :func:`combine`, so the output
 is the same shape as the other three either way.
 
+``--jobs N`` is the one exception: it splits the statement by campaign and
+measures N campaigns at once, on connections of their own that all import the
+report transaction's snapshot (``SET TRANSACTION SNAPSHOT``), so the figures are
+the single statement's to the fire. Under ``filed`` there is nothing for it to
+win; under ``geometry`` the point tests are spread over N server cores.
+
 The ``Country`` column is kept in both modes so that this report's CSV has the
 same shape as the other three and the four can be concatenated and compared, which
 is the whole reason for reporting a national statistic in the same table as three
@@ -245,8 +251,12 @@ from sqlalchemy.orm import aliased
 import src.settings  # noqa: F401  (imported for the side effect of loading .env)
 
 from src.apps.imports import common
+from src.apps.statistics import cache
+from src.apps.statistics import engine as report_engine
 from src.data_model.geography.admin_boundary import AdminBoundary
+from src.data_model.geography.admin_boundary import AdminBoundaryPart
 from src.data_model.ignition import Ignition
+from src.providers import spain_egif
 from src.providers.ocha.admin_boundary import OchaAdminBoundary
 from src.providers.spain_egif.wildfire import EgifWildfire
 from src.providers.spain_ign.admin_boundary import IgnAdminBoundary
@@ -437,11 +447,13 @@ def country_columns(source: str) -> tuple[ColumnElement, list]:
     sea is. :func:`location_audit` counts the two separately, because they mean
     entirely different things about the data.
 
-    ``LATERAL ... LIMIT 1`` rather than a plain join: a point on a shared border
-    can satisfy ``ST_Contains`` for two countries, and one fire must not become two
-    rows. The join to ``ocha_admin_boundary`` is what keeps the test against the
-    OCHA country outlines rather than against every level-0 boundary any provider
-    has ever loaded.
+    ``LATERAL ... LIMIT 1`` rather than a plain join: a point on a shared border,
+    or on a cut between two of the country's
+    :class:`~src.data_model.geography.admin_boundary.AdminBoundaryPart` pieces,
+    intersects two of them, and one fire must not become two rows. The join to
+    ``ocha_admin_boundary`` is what keeps the test against the OCHA country
+    outlines rather than against every level-0 boundary any provider has ever
+    loaded.
     """
     if source == COUNTRY_SOURCE_FILED:
         return literal(COUNTRY_NAME), []
@@ -455,10 +467,11 @@ def country_columns(source: str) -> tuple[ColumnElement, list]:
     ocha_boundary = OchaAdminBoundary.__table__
     containing = (
         select(AdminBoundary.name.label("name"))
-        .select_from(AdminBoundary)
+        .select_from(AdminBoundaryPart)
+        .join(AdminBoundary, AdminBoundary.id == AdminBoundaryPart.admin_boundary_id)
         .join(ocha_boundary, ocha_boundary.c.id == AdminBoundary.id)
-        .where(AdminBoundary.level == COUNTRY_LEVEL)
-        .where(func.ST_Contains(AdminBoundary.geometry, ignition.c.geometry))
+        .where(AdminBoundaryPart.level == COUNTRY_LEVEL)
+        .where(func.ST_Intersects(AdminBoundaryPart.geometry, ignition.c.geometry))
         .limit(1)
         .lateral("containing")
     )
@@ -675,6 +688,21 @@ def resolve_region(session: Session, wanted: str) -> Region:
     return region
 
 
+def campaigns_query(surface: str = SURFACE_FOREST,
+                    region: Region | None = None) -> Select:
+    """The campaigns with a fire reporting ``surface``, newest first: what ``--jobs`` splits.
+
+    Over ``egif_wildfire`` alone, like the ``filed`` statement: the campaign and
+    the province are both on it, and a campaign whose fires all fall in no country
+    under ``geometry`` simply measures to nothing.
+    """
+    _, is_reported = reported_surface(surface)
+    campaigns = select(CAMPAIGN).select_from(EgifWildfire.__table__).where(is_reported)
+    if region is not None:
+        campaigns = campaigns.where(PROVINCE.in_(region.provinces))
+    return campaigns.distinct().order_by(CAMPAIGN.desc())
+
+
 def statistics_query(surface: str = SURFACE_FOREST,
                      year: int | None = None,
                      min_area: float | None = None,
@@ -795,11 +823,12 @@ def location_audit(surface: str = SURFACE_FOREST,
     ocha_boundary = OchaAdminBoundary.__table__
 
     located = (
-        select(AdminBoundary.id)
-        .select_from(AdminBoundary)
+        select(AdminBoundaryPart.id)
+        .select_from(AdminBoundaryPart)
+        .join(AdminBoundary, AdminBoundary.id == AdminBoundaryPart.admin_boundary_id)
         .join(ocha_boundary, ocha_boundary.c.id == AdminBoundary.id)
-        .where(AdminBoundary.level == COUNTRY_LEVEL)
-        .where(func.ST_Contains(AdminBoundary.geometry, ignition.c.geometry))
+        .where(AdminBoundaryPart.level == COUNTRY_LEVEL)
+        .where(func.ST_Intersects(AdminBoundaryPart.geometry, ignition.c.geometry))
         .exists()
     )
 
@@ -1022,6 +1051,10 @@ def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument("--country", help=argparse.SUPPRESS)
     parser.add_argument("--area-method", help=argparse.SUPPRESS)
 
+    common.add_snapshot_jobs_arguments(parser)
+
+    cache.add_cache_arguments(parser)
+
     output = parser.add_argument_group("output", "at least one is required")
     output.add_argument("--csv", type=Path, help="write the report to this .csv")
     output.add_argument("--docx", type=Path, help="write the report to this .docx (MS Word)")
@@ -1054,7 +1087,8 @@ def compute(session: Session, year: int | None, logger: logging.Logger,
             surface: str = SURFACE_FOREST,
             min_area: float | None = None,
             country_source: str = COUNTRY_SOURCE_FILED,
-            region: Region | None = None) -> list[Row]:
+            region: Region | None = None,
+            jobs: int = 1) -> list[Row]:
     """Run the statement and return the report's rows in order.
 
     Notes
@@ -1063,6 +1097,10 @@ def compute(session: Session, year: int | None, logger: logging.Logger,
     report does not need the year-at-a-time machinery the other three are built
     on. The ``Total`` row is arithmetic over its result, not a second query.
 
+    With ``jobs`` above 1 and no ``year``, it is that machinery after all: one
+    statement per campaign, ``jobs`` at a time on ``session``'s snapshot (see
+    :func:`~src.apps.imports.common.measure_by_year`).
+
     Under ``geometry`` a second, cheap statement follows it: :func:`location_audit`
     counts what the first one dropped and why. A report that quietly left out half
     its fires would be worse than one that did not offer the option.
@@ -1071,17 +1109,28 @@ def compute(session: Session, year: int | None, logger: logging.Logger,
     fires the report is of.
     """
     scope = "the EGIF fires" if region is None else f"the EGIF fires of {region.name}"
-    with common.Spinner(f"Measuring the reported {surface} area of {scope}", logger):
-        measured = [
+
+    def measure_campaign(worker: Session, campaign: int | None) -> list[Row]:
+        return [
             Row(country=record.country, year=record.year,
                 minimum=float(record.minimum),
                 maximum=float(record.maximum),
                 total=float(record.total),
                 fires=record.fires)
-            for record in session.execute(
-                statistics_query(surface, year, min_area, country_source, region))
+            for record in worker.execute(
+                statistics_query(surface, campaign, min_area, country_source, region))
         ]
 
+    if jobs == 1 or year is not None:
+        with common.Spinner(f"Measuring the reported {surface} area of {scope}", logger):
+            measured = measure_campaign(session, year)
+    else:
+        with common.Spinner(f"Finding the campaigns of {scope}", logger):
+            campaigns = list(session.scalars(campaigns_query(surface, region)))
+        measured = common.measure_by_year(session, campaigns, measure_campaign, jobs,
+                                          f"Measuring the reported {surface} area", scope,
+                                          logger)
+
     if country_source == COUNTRY_SOURCE_GEOMETRY:
         with common.Spinner("Counting the fires with no usable point", logger):
             audit = session.execute(location_audit(surface, year, min_area, region)).one()
@@ -1219,17 +1268,40 @@ def write_docx(rows: list[Row], path: Path, year: int | None,
     logger.info("Wrote %s", path)
 
 
-def report(args: argparse.Namespace, engine: Engine, logger: logging.Logger) -> list[Row]:
+def report(args: argparse.Namespace, engine: Engine,
+           logger: logging.Logger) -> list[Row] | list[report_engine.ReportRow]:
     """Compute the statistics and write whichever outputs were asked for.
 
+    Run with the options of the ``statistics`` report of
+    :mod:`~src.apps.statistics.wildfires.spain_egif.reports` — the defaults — it is
+    that report: computed in one statement and written by
+    :mod:`src.apps.statistics.engine`, and returned as its rows. Any other option is
+    computed a campaign at a time here.
+
     The region is resolved first, inside the same session, so that a name nobody
     recognises fails before any fire is measured — and against the database, so the
     error can list the communities that really are imported.
     """
-    with Session(engine) as session:
-        region = None if args.region is None else resolve_region(session, args.region)
-        rows = compute(session, args.year, logger, args.surface, args.min_area,
-                       args.country_source, region)
+    # Imported here: the description is built from this module's expressions.
+    from src.apps.statistics.wildfires.spain_egif import reports
+    described = reports.PROVIDER.report("statistics")
+    covered = report_engine.covers(described, args)
+    if covered:
+        region = None
+        with Session(engine) as session:
+            rows = cache.cached_compute(
+                session, args, [spain_egif],
+                lambda: report_engine.compute_one(session, reports.PROVIDER, described.name,
+                                                  args.year, logger),
+                logger)
+    else:
+        with common.snapshot_session(engine) as session:
+            region = None if args.region is None else resolve_region(session, args.region)
+            rows = cache.cached_compute(
+                session, args, [spain_egif],
+                lambda: compute(session, args.year, logger, args.surface, args.min_area,
+                                args.country_source, region, args.jobs),
+                logger)
 
     if not rows:
         # An empty report is almost always a campaign with no data, and writing an
@@ -1250,11 +1322,14 @@ def report(args: argparse.Namespace, engine: Engine, logger: logging.Logger) ->
             f"asked for are not counted." + extra
         )
 
-    if args.csv is not None:
-        write_csv(rows, args.csv, logger)
-    if args.docx is not None:
-        write_docx(rows, args.docx, args.year, logger, args.surface, args.min_area,
-                   args.country_source, region)
+    if covered:
+        report_engine.write(reports.PROVIDER, described, rows, args.csv, args.docx, logger)
+    else:
+        if args.csv is not None:
+            write_csv(rows, args.csv, logger)
+        if args.docx is not None:
+            write_docx(rows, args.docx, args.year, logger, args.surface, args.min_area,
+                       args.country_source, region)
     return rows
 
 
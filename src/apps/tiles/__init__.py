@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Applications that render imported data into map tiles.
+
+Like :mod:`src.apps.statistics` they only read the database. What they write is
+meant for map clients rather than for people: the features cut once per zoom level
+into the squares a web map requests, so that a client reads a prebuilt tile
+instead of running a spatial query — which is what every client of the QGIS views
+does, on every pan. See :mod:`src.apps.tiles.wildfires.render_tiles`.
+"""
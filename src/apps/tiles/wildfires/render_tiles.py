@@ -0,0 +1,551 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Mapbox Vector Tiles of one wildfire dataset, kept in an MBTiles archive.
+
+Renders the burnt perimeters of one provider over a range of zoom levels, one
+tile at a time, with PostGIS's ``ST_AsMVT`` / ``ST_AsMVTGeom``, and stores each
+tile in an `MBTiles <https://github.com/mapbox/mbtiles-spec>`_ file — a SQLite
+database that MapLibre, Leaflet plugins, QGIS, ``tileserver-gl`` and
+``martin`` all read as it is::
+
+    python3 -m src.apps.tiles.wildfires.render_tiles --dataset gwis \\
+        --mbtiles gwis.mbtiles --min-zoom 0 --max-zoom 8
+
+After an import has replaced some years, render only the tiles those years touch,
+into the archive the first run wrote::
+
+    python3 -m src.apps.tiles.wildfires.render_tiles --dataset gwis \\
+        --mbtiles gwis.mbtiles --years 2021 2022
+
+The application only reads the database. Database settings come from the
+environment (``.env``, see :mod:`src.settings`); every one of them can be
+overridden with a command-line argument.
+
+What a tile holds
+-----------------
+
+One layer, :data:`LAYER`, with one feature per fire of the dataset that reaches
+into the tile — every year of it, so a tile is the whole archive of that square.
+Each feature carries the fire's ``id`` as the feature id and four properties: the
+``year`` it counts towards in the reports, its local ``start_date`` and
+``end_date`` (``YYYY-MM-DD``) and its geodesic ``area_ha``. A client filters and
+styles by those; anything else about a fire is one request to the database away,
+by its id.
+
+Geometries are clipped to the tile with a :data:`BUFFER` of 64 units of its 4096,
+so a polygon's outline does not show a seam where two tiles meet.
+
+Which perimeter a zoom level is cut from
+----------------------------------------
+
+A tile at zoom 3 covers a continent in 4096 units; cut from the full perimeter,
+almost every vertex it reads is thrown away by ``ST_AsMVTGeom`` after being read,
+transformed and clipped. So each zoom level reads the simplified copy whose
+tolerance is below the size of one of its pixels
+(:func:`perimeter_column`): ``perimeter_z1`` up to zoom 7, ``perimeter_z2`` up to
+10, ``perimeter_z3`` up to 13, and the perimeter itself beyond — the same
+thresholds the level-of-detail views are documented with, and for the same reason.
+Each of those columns has its own spatial index, which is what finds a tile's fires.
+
+Only the datasets that store a perimeter on ``wildfire`` can be tiled
+(:data:`DATASETS`); a dataset published as points has nothing here to draw.
+
+Rendering only what changed
+---------------------------
+
+An import replaces whole years, and a tile holds every year, so a replaced year
+makes stale exactly the tiles that held one of its fires before the import or
+hold one after it. The archive keeps which years each tile holds — a
+``tile_year`` table beside the standard ``tiles`` and ``metadata`` — and
+``--years`` uses it: for every zoom level in the archive it renders the union of
+the tiles the archive says held those years and the tiles the fires of those
+years now reach, and deletes a tile that comes out empty. A tile no replaced year
+touches is not read, and keeps its bytes.
+
+The years an importer replaced are the ones it logs when it refreshes the yearly
+summary (``refreshed the yearly summary for 2021, 2022``).
+
+A run without ``--years`` renders everything and replaces whatever the archive
+held.
+
+Why MBTiles and not PMTiles
+---------------------------
+
+A PMTiles archive is one file ordered along a curve with its directory written
+after the tiles, which is what lets a static file server answer tile requests; it
+is also why one tile cannot be replaced without rewriting the file. MBTiles is a
+table, so an incremental run is an ``UPDATE`` of a few rows. Where a PMTiles
+archive is wanted, ``pmtiles convert gwis.mbtiles gwis.pmtiles`` writes one from
+this file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import logging
+import os
+import sqlite3
+import sys
+
+from pathlib import Path
+
+from sqlalchemy import Engine
+from sqlalchemy import create_engine
+from sqlalchemy import select
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+import src.settings  # noqa: F401  (imported for the side effect of loading .env)
+
+from src.apps.imports import common
+from src.data_model.data_provider import DataProvider
+from src.providers import andalusia_rediam
+from src.providers import canada_nbac
+from src.providers import catalonia_darpa
+from src.providers import chile_conaf_magnitud
+from src.providers import gfa
+from src.providers import gwis
+from src.providers import mexico_conafor
+from src.providers import portugal_icnf
+
+#: The datasets whose perimeters are stored on ``wildfire``, by the name the
+#: command line and the ``v_<name>_wildfire`` views know them by, with the
+#: :class:`~src.data_model.data_provider.DataProvider` they were imported as.
+DATASETS = {
+    "gwis": (gwis.PROVIDER_NAME, gwis.PROVIDER_PRODUCT),
+    "gfa": (gfa.PROVIDER_NAME, gfa.PROVIDER_PRODUCT),
+    "icnf": (portugal_icnf.PROVIDER_NAME, portugal_icnf.PROVIDER_PRODUCT),
+    "darpa": (catalonia_darpa.PROVIDER_NAME, catalonia_darpa.PROVIDER_PRODUCT),
+    "rediam": (andalusia_rediam.PROVIDER_NAME, andalusia_rediam.PROVIDER_PRODUCT),
+    "nbac": (canada_nbac.PROVIDER_NAME, canada_nbac.PROVIDER_PRODUCT),
+    "conafor": (mexico_conafor.PROVIDER_NAME, mexico_conafor.PROVIDER_PRODUCT),
+    "conaf_magnitud": (chile_conaf_magnitud.PROVIDER_NAME, chile_conaf_magnitud.PROVIDER_PRODUCT),
+}
+
+#: Name of the one layer in every tile.
+LAYER = "wildfires"
+
+#: Tile extent and clipping buffer, in tile units: the MVT defaults.
+EXTENT = 4096
+BUFFER = 64
+
+#: Default zoom range. Zoom 8 is a tile of about 150 km at the equator, the
+#: scale of a region; how far beyond that is worth prebuilding depends on the
+#: dataset and on the disk, and is the caller's choice.
+DEFAULT_MIN_ZOOM = 0
+DEFAULT_MAX_ZOOM = 8
+
+#: Deepest zoom accepted: a tile of about 600 m, past which a burnt perimeter
+#: has nothing left to show that the full-resolution view does not.
+MAX_ZOOM = 16
+
+#: Latitude where Web Mercator, the grid of every tile, ends.
+MERCATOR_LATITUDE = 85.0511287798066
+
+#: The simplified perimeter each zoom level is cut from, as ``(deepest zoom,
+#: column)``; beyond the last one, the perimeter itself. See the module docstring.
+PERIMETER_COLUMNS = ((7, "perimeter_z1"), (10, "perimeter_z2"), (13, "perimeter_z3"))
+
+#: ``metadata`` key recording which dataset an archive holds, so an incremental
+#: run cannot update one dataset's archive from another's fires.
+DATASET_KEY = "gisfire_dataset"
+
+#: The properties of a feature, as the MBTiles ``vector_layers`` metadata
+#: declares them.
+FIELDS = {
+    "year": "Number",
+    "start_date": "String",
+    "end_date": "String",
+    "area_ha": "Number",
+}
+
+
+def perimeter_column(zoom: int) -> str:
+    """The ``wildfire`` column tiles at ``zoom`` are cut from."""
+    for deepest, column in PERIMETER_COLUMNS:
+        if zoom <= deepest:
+            return column
+    return "perimeter"
+
+
+def tms_row(zoom: int, y: int) -> int:
+    """The MBTiles ``tile_row`` of XYZ row ``y``: MBTiles counts rows from the south."""
+    return (1 << zoom) - 1 - y
+
+
+# --------------------------------------------------------------------------
+# Reading the database
+# --------------------------------------------------------------------------
+
+#: Restricts :data:`TILES_SQL` to some local years. The ``start_date_time`` window
+#: is there for the index on ``(data_provider_id, start_date_time)``, exactly as in
+#: :data:`src.apps.imports.common.INSERT_YEARLY_SUMMARY_SQL`.
+YEARS_FILTER_SQL = f"""
+      AND start_date_time >= make_timestamptz(:first_year, 1, 1, 0, 0, 0, 'UTC') - interval '1 day'
+      AND start_date_time < make_timestamptz(:last_year + 1, 1, 1, 0, 0, 0, 'UTC') + interval '1 day'
+      AND {common.LOCAL_YEAR_SQL} = ANY(:years)"""
+
+#: The tiles a provider's fires reach at one zoom level, with the local year of
+#: each fire reaching it: every tile of each perimeter's bounding box, by the
+#: standard slippy-map formulas, clamped to the Web Mercator square. A tile a box
+#: reaches and its shape does not renders empty and is not stored.
+TILES_SQL = """
+WITH fires AS (
+    SELECT {local_year} AS year,
+           GREATEST(ST_XMin({column}), -180) AS west,
+           LEAST(ST_XMax({column}), 180) AS east,
+           GREATEST(ST_YMin({column}), -{latitude}) AS south,
+           LEAST(ST_YMax({column}), {latitude}) AS north
+    FROM wildfire
+    WHERE data_provider_id = :provider_id AND {column} IS NOT NULL{years_filter}
+), spans AS (
+    SELECT DISTINCT year,
+           GREATEST(floor((west + 180) / 360 * 2 ^ :zoom), 0)::integer AS first_x,
+           LEAST(floor((east + 180) / 360 * 2 ^ :zoom), 2 ^ :zoom - 1)::integer AS last_x,
+           GREATEST(floor((1 - ln(tan(radians(north)) + 1 / cos(radians(north))) / pi())
+                          / 2 * 2 ^ :zoom), 0)::integer AS first_y,
+           LEAST(floor((1 - ln(tan(radians(south)) + 1 / cos(radians(south))) / pi())
+                       / 2 * 2 ^ :zoom), 2 ^ :zoom - 1)::integer AS last_y
+    FROM fires
+)
+SELECT DISTINCT x, y, year
+FROM spans, generate_series(first_x, last_x) AS x, generate_series(first_y, last_y) AS y
+"""
+
+#: One tile, as an uncompressed MVT. The search box is the tile grown by its
+#: buffer and taken back to EPSG:4326, so the spatial index on the column finds
+#: the fires; ``ST_AsMVTGeom`` then transforms, clips and quantises each of them.
+TILE_SQL = """
+WITH bounds AS (
+    SELECT ST_TileEnvelope(:zoom, :x, :y) AS tile,
+           ST_Transform(ST_TileEnvelope(:zoom, :x, :y, margin => :margin), 4326) AS search
+), features AS (
+    SELECT w.id,
+           {local_year} AS year,
+           to_char(w.start_date_time AT TIME ZONE COALESCE(w.time_zone, 'UTC'), 'YYYY-MM-DD') AS start_date,
+           to_char(w.end_date_time AT TIME ZONE COALESCE(w.time_zone, 'UTC'), 'YYYY-MM-DD') AS end_date,
+           round((w.perimeter_area_m2 / 10000)::numeric, 2)::double precision AS area_ha,
+           ST_AsMVTGeom(ST_Transform(w.{column}, 3857), bounds.tile, :extent, :buffer, true) AS geometry
+    FROM wildfire w, bounds
+    WHERE w.data_provider_id = :provider_id AND w.{column} && bounds.search
+)
+SELECT ST_AsMVT(features, :layer, :extent, 'geometry', 'id')
+FROM features
+WHERE geometry IS NOT NULL
+"""
+
+
+def find_provider(session: Session, dataset: str) -> int:
+    """Return the id of the provider ``dataset`` was imported as.
+
+    Raises
+    ------
+    RuntimeError
+        If the dataset has not been imported.
+    """
+    name, product = DATASETS[dataset]
+    provider_id = session.scalar(
+        select(DataProvider.id).where(DataProvider.name == name, DataProvider.product == product))
+    if provider_id is None:
+        raise RuntimeError(f"No {name} — {product} provider in the database. Import the "
+                           f"{dataset} wildfires first.")
+    return provider_id
+
+
+def reached_tiles(session: Session, provider_id: int, zoom: int,
+                  years: list[int] | None = None) -> set[tuple[int, int, int]]:
+    """Return ``(x, y, year)`` for every tile the provider's fires reach at ``zoom``.
+
+    ``x`` and ``y`` are XYZ tile coordinates. With ``years``, only the fires of
+    those local years are read.
+    """
+    parameters = {"provider_id": provider_id, "zoom": zoom}
+    years_filter = ""
+    if years is not None:
+        years_filter = YEARS_FILTER_SQL
+        parameters.update(years=years, first_year=min(years), last_year=max(years))
+    statement = TILES_SQL.format(local_year=common.LOCAL_YEAR_SQL, column=perimeter_column(zoom),
+                                 latitude=MERCATOR_LATITUDE, years_filter=years_filter)
+    return {tuple(row) for row in session.execute(text(statement), parameters)}
+
+
+def render_tile(session: Session, provider_id: int, zoom: int, x: int, y: int) -> bytes:
+    """Return tile ``zoom/x/y`` of the provider's fires as an MVT, empty if it has none."""
+    statement = TILE_SQL.format(local_year=common.LOCAL_YEAR_SQL, column=perimeter_column(zoom))
+    data = session.scalar(text(statement), {
+        "provider_id": provider_id, "zoom": zoom, "x": x, "y": y, "layer": LAYER,
+        "extent": EXTENT, "buffer": BUFFER, "margin": BUFFER / EXTENT,
+    })
+    return bytes(data) if data else b""
+
+
+# --------------------------------------------------------------------------
+# The archive
+# --------------------------------------------------------------------------
+
+#: The MBTiles 1.3 schema, plus ``tile_year``: the local years of the fires each
+#: stored tile was rendered from, which is what an incremental run reads to find
+#: the tiles a replaced year used to reach. Rows are in MBTiles (TMS) order.
+ARCHIVE_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS metadata (name TEXT NOT NULL, value TEXT);
+CREATE UNIQUE INDEX IF NOT EXISTS name ON metadata (name);
+CREATE TABLE IF NOT EXISTS tiles (
+    zoom_level INTEGER NOT NULL,
+    tile_column INTEGER NOT NULL,
+    tile_row INTEGER NOT NULL,
+    tile_data BLOB NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS tile_index ON tiles (zoom_level, tile_column, tile_row);
+CREATE TABLE IF NOT EXISTS tile_year (
+    zoom_level INTEGER NOT NULL,
+    year INTEGER NOT NULL,
+    tile_column INTEGER NOT NULL,
+    tile_row INTEGER NOT NULL,
+    PRIMARY KEY (zoom_level, year, tile_column, tile_row)
+);
+"""
+
+
+class TileArchive:
+    """An MBTiles file and the year bookkeeping kept inside it.
+
+    Tiles go in and come out by XYZ coordinates, as PostGIS and every web map
+    number them; the flip to the MBTiles row order happens here and nowhere else.
+    Tile data is stored gzip-compressed, as the MBTiles readers expect of
+    ``pbf`` tiles.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        The ``.mbtiles`` file, created with its schema if it does not exist.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(ARCHIVE_SCHEMA_SQL)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def commit(self) -> None:
+        self.connection.commit()
+
+    def metadata(self) -> dict[str, str]:
+        """The archive's ``metadata`` table, as a dict."""
+        return dict(self.connection.execute("SELECT name, value FROM metadata"))
+
+    def write_metadata(self, dataset: str, min_zoom: int, max_zoom: int) -> None:
+        """Write the MBTiles metadata of a ``dataset`` archive over a zoom range."""
+        name, product = DATASETS[dataset]
+        layer = {"id": LAYER, "description": f"{name} — {product}", "fields": FIELDS,
+                 "minzoom": min_zoom, "maxzoom": max_zoom}
+        values = {
+            "name": f"{dataset} wildfires",
+            "description": f"Burnt perimeters of {name} — {product}",
+            "format": "pbf",
+            "type": "overlay",
+            "version": "1",
+            "minzoom": str(min_zoom),
+            "maxzoom": str(max_zoom),
+            "bounds": f"-180,{-MERCATOR_LATITUDE:.6f},180,{MERCATOR_LATITUDE:.6f}",
+            "json": json.dumps({"vector_layers": [layer]}, ensure_ascii=False),
+            DATASET_KEY: dataset,
+        }
+        self.connection.executemany("INSERT OR REPLACE INTO metadata (name, value) VALUES (?, ?)",
+                                    values.items())
+
+    def clear(self) -> None:
+        """Delete every tile and every year recorded for one."""
+        self.connection.execute("DELETE FROM tiles")
+        self.connection.execute("DELETE FROM tile_year")
+
+    def put(self, zoom: int, x: int, y: int, data: bytes) -> None:
+        """Store tile ``zoom/x/y``, replacing it if it was there."""
+        self.connection.execute(
+            "INSERT OR REPLACE INTO tiles (zoom_level, tile_column, tile_row, tile_data) "
+            "VALUES (?, ?, ?, ?)", (zoom, x, tms_row(zoom, y), gzip.compress(data)))
+
+    def get(self, zoom: int, x: int, y: int) -> bytes | None:
+        """Tile ``zoom/x/y``, uncompressed, or ``None`` if the archive has none."""
+        row = self.connection.execute(
+            "SELECT tile_data FROM tiles WHERE zoom_level = ? AND tile_column = ? AND tile_row = ?",
+            (zoom, x, tms_row(zoom, y))).fetchone()
+        return None if row is None else gzip.decompress(row[0])
+
+    def delete(self, zoom: int, x: int, y: int) -> None:
+        """Remove tile ``zoom/x/y``, if it was there."""
+        self.connection.execute(
+            "DELETE FROM tiles WHERE zoom_level = ? AND tile_column = ? AND tile_row = ?",
+            (zoom, x, tms_row(zoom, y)))
+
+    def tiles_of_years(self, zoom: int, years: list[int]) -> set[tuple[int, int]]:
+        """The XYZ ``(x, y)`` of the tiles recorded as holding a fire of ``years``."""
+        marks = ", ".join("?" for _ in years)
+        rows = self.connection.execute(
+            f"SELECT DISTINCT tile_column, tile_row FROM tile_year "
+            f"WHERE zoom_level = ? AND year IN ({marks})", (zoom, *years))
+        return {(x, tms_row(zoom, row)) for x, row in rows}
+
+    def record_years(self, zoom: int, years: list[int] | None,
+                     reached: set[tuple[int, int, int]]) -> None:
+        """Replace what is recorded of ``years`` at ``zoom`` with ``reached``.
+
+        ``years`` of ``None`` replaces every year.
+        """
+        if years is None:
+            self.connection.execute("DELETE FROM tile_year WHERE zoom_level = ?", (zoom,))
+        else:
+            marks = ", ".join("?" for _ in years)
+            self.connection.execute(
+                f"DELETE FROM tile_year WHERE zoom_level = ? AND year IN ({marks})",
+                (zoom, *years))
+        self.connection.executemany(
+            "INSERT INTO tile_year (zoom_level, year, tile_column, tile_row) VALUES (?, ?, ?, ?)",
+            ((zoom, year, x, tms_row(zoom, y)) for x, y, year in reached))
+
+
+# --------------------------------------------------------------------------
+# Rendering
+# --------------------------------------------------------------------------
+
+def render(session: Session, archive: TileArchive, provider_id: int, zooms: range,
+           years: list[int] | None, logger: logging.Logger) -> tuple[int, int]:
+    """Render the tiles of ``zooms`` into ``archive``, or only those ``years`` touch.
+
+    Without ``years``, every tile the provider's fires reach; with them, the
+    tiles recorded as holding one of those years and the tiles their fires reach
+    now, each rendered whole. Commits once per zoom level, so an interrupted run
+    leaves whole levels behind it.
+
+    Returns
+    -------
+    tuple of int
+        Tiles written and tiles removed for coming out empty.
+    """
+    written = removed = 0
+    for zoom in zooms:
+        reached = reached_tiles(session, provider_id, zoom, years)
+        touched = {(x, y) for x, y, _ in reached}
+        if years is not None:
+            touched |= archive.tiles_of_years(zoom, years)
+
+        progress = common.ProgressReporter(len(touched), f"zoom {zoom}", logger, log_every=1000)
+        for x, y in sorted(touched):
+            data = render_tile(session, provider_id, zoom, x, y)
+            if data:
+                archive.put(zoom, x, y, data)
+                written += 1
+            else:
+                archive.delete(zoom, x, y)
+                removed += 1
+            progress.advance()
+        progress.finish()
+
+        archive.record_years(zoom, years, reached)
+        archive.commit()
+    return written, removed
+
+
+def parse_arguments(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(
+        description="Render one wildfire dataset's perimeters into Mapbox Vector Tiles, "
+                    "stored in an MBTiles archive.",
+        epilog="Without --years the archive is rebuilt from scratch. Database settings not "
+               "given here are read from the environment (.env).",
+    )
+    parser.add_argument("-d", "--dataset", required=True, choices=sorted(DATASETS),
+                        help="the dataset to render")
+    parser.add_argument("-o", "--mbtiles", required=True, type=Path,
+                        help="the .mbtiles archive to write; created if missing")
+    parser.add_argument("--min-zoom", type=int,
+                        help=f"shallowest zoom level to render (default {DEFAULT_MIN_ZOOM})")
+    parser.add_argument("--max-zoom", type=int,
+                        help=f"deepest zoom level to render (default {DEFAULT_MAX_ZOOM}, "
+                             f"at most {MAX_ZOOM})")
+    parser.add_argument("-y", "--years", type=int, nargs="+", metavar="YEAR",
+                        help="render only the tiles these years touch, at the zoom levels "
+                             "the archive already holds; for after an import replaced them")
+
+    common.add_database_arguments(parser)
+    parser.add_argument("--log-level", default=os.getenv("GISFIRE_LOG_LEVEL", "INFO"),
+                        choices=["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"],
+                        help="verbosity (env: GISFIRE_LOG_LEVEL, default INFO)")
+
+    arguments = parser.parse_args(argv)
+    if arguments.years is not None:
+        if arguments.min_zoom is not None or arguments.max_zoom is not None:
+            parser.error("--years renders the zoom levels the archive holds; "
+                         "--min-zoom and --max-zoom are for a full run")
+        if not arguments.mbtiles.exists():
+            parser.error(f"{arguments.mbtiles} does not exist: run once without --years first")
+        return arguments
+
+    if arguments.min_zoom is None:
+        arguments.min_zoom = DEFAULT_MIN_ZOOM
+    if arguments.max_zoom is None:
+        arguments.max_zoom = DEFAULT_MAX_ZOOM
+    if not 0 <= arguments.min_zoom <= arguments.max_zoom <= MAX_ZOOM:
+        parser.error(f"zoom levels must satisfy 0 <= --min-zoom <= --max-zoom <= {MAX_ZOOM}")
+    return arguments
+
+
+def tile(args: argparse.Namespace, engine: Engine, logger: logging.Logger) -> tuple[int, int]:
+    """Render what the arguments ask for into the archive they name."""
+    with Session(engine) as session:
+        # Looked up before the archive is opened, so a dataset that was never
+        # imported cannot cost an existing archive its tiles.
+        provider_id = find_provider(session, args.dataset)
+
+        archive = TileArchive(args.mbtiles)
+        try:
+            if args.years is None:
+                zooms = range(args.min_zoom, args.max_zoom + 1)
+                archive.clear()
+                archive.write_metadata(args.dataset, args.min_zoom, args.max_zoom)
+                archive.commit()
+            else:
+                metadata = archive.metadata()
+                if metadata.get(DATASET_KEY) != args.dataset:
+                    raise RuntimeError(
+                        f"{args.mbtiles} does not hold the {args.dataset} tiles (it holds "
+                        f"{metadata.get(DATASET_KEY) or 'nothing known'}).")
+                zooms = range(int(metadata["minzoom"]), int(metadata["maxzoom"]) + 1)
+
+            written, removed = render(session, archive, provider_id, zooms, args.years, logger)
+        finally:
+            archive.close()
+
+    logger.info("Wrote %d tile(s) to %s, removed %d that came out empty",
+                written, args.mbtiles, removed)
+    return written, removed
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_arguments(argv)
+    logging.basicConfig(level=args.log_level, format=common.LOG_FORMAT)
+    logger = logging.getLogger("wildfire-tiles")
+
+    try:
+        settings = common.resolve_database_settings(args)
+    except RuntimeError as error:
+        logger.error("%s", error)
+        return 1
+
+    engine = create_engine(common.database_url(settings))
+    try:
+        common.require_tables(engine, ["wildfire", "data_provider"], logger)
+        tile(args, engine, logger)
+    except Exception as error:  # noqa: BLE001  (the CLI boundary: report, do not traceback)
+        logger.error("%s", error)
+        return 1
+    finally:
+        engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":  # pragma nocover
+    sys.exit(main())
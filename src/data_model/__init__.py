@@ -24,6 +24,11 @@ class Base(DeclarativeBase):
 # ``Base`` from this module).
 from src.data_model.data_provider import DataProvider  # noqa: E402,F401
 from src.data_model.geography.admin_boundary import AdminBoundary  # noqa: E402,F401
+from src.data_model.geography.admin_boundary import AdminBoundaryPart  # noqa: E402,F401
 from src.data_model.geography.time_zone import TimeZone  # noqa: E402,F401
+from src.data_model.geography.time_zone import TimeZonePart  # noqa: E402,F401
 from src.data_model.ignition import Ignition  # noqa: E402,F401
 from src.data_model.wildfire import Wildfire  # noqa: E402,F401
+from src.data_model.source_file import SourceFile  # noqa: E402,F401
+from src.data_model.wildfire_yearly_summary import WildfireYearlySummary  # noqa: E402,F401
+from src.data_model.wildfire_boundary_area import WildfireBoundaryArea  # noqa: E402,F401
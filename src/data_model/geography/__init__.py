@@ -10,3 +10,11 @@ source and then change only when that source republishes.
 Kept apart from the models in :mod:`src.data_model` proper, which hold the
 wildfire domain itself.
 """
+
+#: Most vertices a piece of a subdivided lookup table
+#: (:class:`~src.data_model.geography.time_zone.TimeZonePart`,
+#: :class:`~src.data_model.geography.admin_boundary.AdminBoundaryPart`) may have.
+#: The figure the PostGIS documentation uses for point-in-polygon lookups; anything
+#: of this order works, because what matters is that a piece is small, not exactly
+#: how small.
+SUBDIVIDE_VERTICES = 256
@@ -12,6 +12,11 @@ without the model having to fix a number of levels in advance.
 This is the *generic* model. Each source publishes its own identifiers and
 metadata through a subclass, using joined table inheritance on
 :attr:`AdminBoundary.type`.
+
+Nothing tests a point or a perimeter against ``admin_boundary`` itself: the
+importers and the statistics look places up in :class:`AdminBoundaryPart`, the
+same divisions cut into small pieces. A country's coastline runs to millions of
+vertices, and a GiST hit on it still tests the fire against every one of them.
 """
 
 from __future__ import annotations
@@ -135,3 +140,69 @@ class AdminBoundary(Base):
 
     def __repr__(self) -> str:
         return f"AdminBoundary(id={self.id!r}, level={self.level!r}, name={self.name!r})"
+
+
+class AdminBoundaryPart(Base):
+    """A piece of an :class:`AdminBoundary`'s area, small enough to test a fire against.
+
+    The pieces are ``ST_Subdivide`` of the boundary's geometry: together they tile
+    it exactly and each has at most
+    :data:`~src.data_model.geography.SUBDIVIDE_VERTICES` vertices. Chile's OCHA
+    country is 8.7 million vertices and Canada's 8.5 million; the GiST index on
+    ``admin_boundary`` finds either in no time, and then the containment test
+    detoasts 130 MB and walks all of it, about 100 ms per fire. Against the pieces
+    the same lookup costs hundredths of a millisecond and gives the same answer.
+
+    Derived data, never edited by hand. The three boundary importers cut the
+    boundaries they write before committing, and
+    :func:`src.apps.imports.common.find_boundary_provider` cuts any boundary of the
+    provider it returns that has no pieces yet, so a wildfire import never reads a
+    boundary its pieces do not cover. Deleted with their boundary.
+
+    Attributes
+    ----------
+    id : int
+        Surrogate autoincrement primary key.
+    admin_boundary_id : int
+        Foreign key to the :class:`AdminBoundary` this is a piece of — the id a
+        lookup stores on the event.
+    data_provider_id : int
+        The boundary's provider, copied from it so that a lookup can keep to one
+        provider's boundaries without a join.
+    level : int
+        The boundary's :attr:`~AdminBoundary.level`, copied for the same reason.
+    geometry : geoalchemy2.elements.WKBElement
+        The piece as a ``POLYGON`` in EPSG:4326.
+
+    Notes
+    -----
+    Test points with ``ST_Intersects``, not ``ST_Contains``. Cutting a boundary
+    creates internal edges that were never part of it, and ``ST_Contains`` rejects
+    a point lying exactly on one: the fire would fall down the crack between two
+    pieces of the same country and come back with none.
+
+    A perimeter can meet several pieces of the same boundary, so a query that
+    wants one row per boundary has to say so — ``DISTINCT`` on
+    :attr:`admin_boundary_id`, or a ``GROUP BY`` summing what each piece
+    contributes.
+    """
+
+    __tablename__ = "admin_boundary_part"
+
+    __table_args__ = (
+        Index("ix_admin_boundary_part_provider_level", "data_provider_id", "level"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    admin_boundary_id: Mapped[int] = mapped_column(
+        ForeignKey(AdminBoundary.id, ondelete="CASCADE"), index=True, nullable=False
+    )
+    data_provider_id: Mapped[int] = mapped_column(ForeignKey(DataProvider.id), nullable=False)
+    level: Mapped[int] = mapped_column(Integer, nullable=False)
+    geometry: Mapped[str] = mapped_column(
+        Geometry(geometry_type="POLYGON", srid=4326), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return (f"AdminBoundaryPart(id={self.id!r}, "
+                f"admin_boundary_id={self.admin_boundary_id!r}, level={self.level!r})")
@@ -16,6 +16,11 @@ The zone name is what a query wants, not this table's primary key, so nothing
 references ``TimeZone`` by foreign key. Models store the resolved IANA name as
 text instead, which means a row here can be replaced when IANA republishes
 without rewriting the events that were located against it.
+
+Importers do not look points up in ``time_zone`` itself but in
+:class:`TimeZonePart`, the same areas cut into small pieces. Some zones are
+hundreds of thousands of vertices, and a GiST hit on one of them still tests the
+point against all of it; a piece is at most a few hundred.
 """
 
 from __future__ import annotations
@@ -24,6 +29,7 @@ import datetime
 
 from geoalchemy2 import Geometry
 from sqlalchemy import DateTime
+from sqlalchemy import ForeignKey
 from sqlalchemy import String
 from sqlalchemy import func
 from sqlalchemy.orm import Mapped
@@ -80,3 +86,55 @@ class TimeZone(Base):
 
     def __repr__(self) -> str:
         return f"TimeZone(id={self.id!r}, name={self.name!r})"
+
+
+class TimeZonePart(Base):
+    """A piece of a :class:`TimeZone`'s area, small enough to test a point against.
+
+    The pieces are ``ST_Subdivide`` of the zone's geometry: together they tile it
+    exactly, each has at most :data:`~src.data_model.geography.SUBDIVIDE_VERTICES`
+    vertices, and each has a bounding box that hugs it far more closely than the
+    zone's does. The GiST index then finds the one or two pieces a point could be
+    in and the exact test runs against those, where against ``time_zone`` it finds
+    the zone and tests the point against every vertex of it. On a year of GWIS
+    fires this is the difference between the zone lookup dominating the import and
+    not showing in it.
+
+    Built by
+    :mod:`src.apps.imports.time_zones.timezone_boundary_builder.import_time_zones`
+    every time it writes ``time_zone``, and by
+    :func:`src.apps.imports.common.check_time_zones` for a zone written any other
+    way, so the two never disagree; deleted with their zone.
+
+    Attributes
+    ----------
+    id : int
+        Surrogate autoincrement primary key.
+    time_zone_id : int
+        Foreign key to the :class:`TimeZone` this is a piece of.
+    name : str
+        The zone's IANA name, copied from it so that a lookup needs no join.
+    geometry : geoalchemy2.elements.WKBElement
+        The piece as a ``POLYGON`` in EPSG:4326.
+
+    Notes
+    -----
+    Look points up with ``ST_Intersects``, not ``ST_Contains``. Cutting a zone
+    creates internal edges that were never part of its boundary, and
+    ``ST_Contains`` rejects a point lying exactly on one — the point would fall down
+    the crack between two pieces of the same zone and come back with none.
+    """
+
+    __tablename__ = "time_zone_part"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    time_zone_id: Mapped[int] = mapped_column(
+        ForeignKey(TimeZone.id, ondelete="CASCADE"), index=True, nullable=False
+    )
+    name: Mapped[str] = mapped_column(String, nullable=False)
+    geometry: Mapped[str] = mapped_column(
+        Geometry(geometry_type="POLYGON", srid=4326), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"TimeZonePart(id={self.id!r}, name={self.name!r})"
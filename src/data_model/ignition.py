@@ -107,6 +107,9 @@ class Ignition(Base):
     __table_args__ = (
         Index("ix_ignition_admin_boundary_id", "admin_boundary_id"),
         Index("ix_ignition_date_time", "date_time"),
+        # One provider's points over a span of years, as the wildfire table has;
+        # see "One table, not partitions" in src.data_model.wildfire.
+        Index("ix_ignition_data_provider_id_date_time", "data_provider_id", "date_time"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
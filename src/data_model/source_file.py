@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Source file manifest model.
+
+A ``SourceFile`` records one published file an importer has read: what it was
+(its name, SHA-256 and size), which
+:class:`~src.data_model.data_provider.DataProvider` it was imported for, and which
+:class:`~src.data_model.wildfire.Wildfire` rows it produced.
+
+The table exists for ``--incremental`` runs (see :mod:`src.apps.imports.common`).
+A nightly re-run over twenty yearly archives re-reads and re-transforms every one
+of them, when what has usually changed is nothing at all, or one file the agency
+republished. With a manifest the run costs one hash pass: a file whose content is
+the one recorded is skipped, and a file whose content changed has the rows of its
+previous import deleted before it is imported again.
+
+Content-addressed rather than keyed on a modification time: a download tool that
+re-fetches an unchanged archive rewrites the time and not the bytes, and a
+republished file copied with its time preserved would be the one that went
+missing.
+"""
+
+from __future__ import annotations
+
+import datetime
+
+from sqlalchemy import BigInteger
+from sqlalchemy import DateTime
+from sqlalchemy import ForeignKey
+from sqlalchemy import Integer
+from sqlalchemy import String
+from sqlalchemy import UniqueConstraint
+from sqlalchemy import func
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+from sqlalchemy.orm import relationship
+
+from src.data_model import Base
+from src.data_model.data_provider import DataProvider
+
+
+class SourceFile(Base):
+    """A published file an importer has read, and the wildfires it produced.
+
+    Attributes
+    ----------
+    id : int
+        Surrogate autoincrement primary key.
+    data_provider_id : int
+        Foreign key to :class:`~src.data_model.data_provider.DataProvider`, the
+        provider the file was imported for.
+    data_provider : DataProvider
+        The provider the file was imported for.
+    name : str
+        The file's name, without its directory (``Final_GlobFirev3_GWIS_MCD64A1__2021.zip``).
+        Unique within the provider: it is what a later run recognises the file by,
+        whatever directory it was downloaded into that time.
+    sha256 : str
+        Hexadecimal SHA-256 of the file's content. For a loose shapefile it covers
+        the ``.shp`` and every sidecar sharing its stem, since a republished
+        ``.dbf`` changes the fires as much as a republished ``.shp`` does.
+    size_bytes : int
+        Size of what was hashed, in bytes. Compared before the hash is, because a
+        size that differs settles the question without reading anything.
+    first_wildfire_id : int or None
+        Smallest :attr:`~src.data_model.wildfire.Wildfire.id` the import produced,
+        or ``None`` if it produced none.
+    last_wildfire_id : int or None
+        Largest :attr:`~src.data_model.wildfire.Wildfire.id` the import produced,
+        or ``None`` if it produced none.
+    wildfire_count : int
+        Number of wildfires the import produced. Together with the two ids it
+        says whether the range holds this file's fires and nothing else, which is
+        what makes deleting by range safe (see
+        :func:`src.apps.imports.common.delete_source_file_wildfires`).
+    created_at : datetime.datetime
+        Timezone-aware creation timestamp, set by the database on insert.
+    updated_at : datetime.datetime
+        Timezone-aware last-modification timestamp, refreshed by the database on
+        every update — the last time the file was imported.
+    """
+
+    __tablename__ = "source_file"
+
+    __table_args__ = (
+        UniqueConstraint("data_provider_id", "name", name="uq_source_file_provider_name"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    data_provider_id: Mapped[int] = mapped_column(ForeignKey(DataProvider.id), nullable=False)
+    name: Mapped[str] = mapped_column(String, nullable=False)
+    sha256: Mapped[str] = mapped_column(String(64), nullable=False)
+    size_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    first_wildfire_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    last_wildfire_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    wildfire_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+    data_provider: Mapped[DataProvider] = relationship()
+
+    def __repr__(self) -> str:
+        return f"SourceFile(id={self.id!r}, name={self.name!r}, sha256={self.sha256[:12]!r})"
@@ -35,6 +35,33 @@ published reading comes back out with
 ``SELECT start_date_time AT TIME ZONE time_zone``. Note that ``AT TIME ZONE``
 resolves daylight saving from the date itself, which is why the zone is kept as
 a name rather than as a fixed offset.
+
+One table, not partitions
+-------------------------
+
+Every import that replaces a year deletes that provider's rows for it, and every
+statistics query is scoped to one provider and usually to a span of years.
+Partitioning by provider and year would turn the first into a ``DETACH`` and
+prune the second, but PostgreSQL only allows a unique key on a partitioned table
+that includes the partition columns: :attr:`id` would become
+``(id, data_provider_id, start_date_time)``, and so would the key of every
+provider's subclass table and every foreign key pointing at them — the
+inheritance join included. What the table has instead is an index on
+``(data_provider_id, start_date_time)``, which serves the deletes and the scoped
+queries with a range scan, and autovacuum settings tight enough to reclaim a
+replaced year promptly rather than once a fifth of the table is dead (see the
+``c3e8f1a9d4b6`` migration).
+
+Where and when, in one index
+----------------------------
+
+The dashboards' question is "what was burning in this box during this window".
+With a GiST index on the perimeter and a btree on the start date, the planner
+can use only one of them and must filter whatever it returns by the other — and
+a start-date bound alone cannot exclude a fire that started long before the
+window and was still burning in it. :attr:`active_period` holds the two dates as
+a range, and one GiST index covers the perimeter and that range together, so
+:func:`active_within` is answered by a single index scan on both conditions.
 """
 
 from __future__ import annotations
@@ -42,11 +69,17 @@ from __future__ import annotations
 import datetime
 
 from geoalchemy2 import Geometry
+from sqlalchemy import ColumnElement
+from sqlalchemy import Computed
 from sqlalchemy import DateTime
+from sqlalchemy import Float
 from sqlalchemy import ForeignKey
 from sqlalchemy import Index
 from sqlalchemy import String
+from sqlalchemy import and_
 from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import Range
+from sqlalchemy.dialects.postgresql import TSTZRANGE
 from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import mapped_column
 from sqlalchemy.orm import relationship
@@ -55,6 +88,48 @@ from src.data_model import Base
 from src.data_model.data_provider import DataProvider
 from src.data_model.geography.admin_boundary import AdminBoundary
 
+#: What :attr:`Wildfire.active_period` is generated from: both ends included, and
+#: no end — a fire still burning, or one whose provider never says — read as a
+#: period that has not closed. Some providers publish an end before the start
+#: (CONAF, CONAFOR), which the importers store as published; ``tstzrange`` would
+#: refuse the row, so such a fire's period is its start instant alone. Everything
+#: here is immutable, as a generated column requires.
+ACTIVE_PERIOD_SQL = ("tstzrange(start_date_time, CASE WHEN end_date_time < start_date_time "
+                     "THEN start_date_time ELSE end_date_time END, '[]')")
+
+#: What :attr:`Wildfire.perimeter_area_m2` is generated from. The geography cast
+#: is what makes it geodesic; ``ST_Area`` and the cast are both immutable, which
+#: PostgreSQL requires of a generated column.
+PERIMETER_AREA_SQL = "ST_Area(perimeter::geography)"
+
+#: Tolerances, in degrees, of :attr:`Wildfire.perimeter_z1`, ``_z2`` and ``_z3``:
+#: roughly 1 km, 100 m and 10 m, about one screen pixel at 1:5,000,000,
+#: 1:500,000 and 1:50,000. A vertex closer than that to the line through its
+#: neighbours cannot be seen at that scale, so dropping it changes nothing drawn.
+PERIMETER_LOD_TOLERANCES = (0.01, 0.001, 0.0001)
+
+
+def perimeter_lod_sql(tolerance: float) -> str:
+    """What a simplified perimeter column is generated from.
+
+    ``ST_SimplifyPreserveTopology`` rather than ``ST_Simplify``: it never drops a
+    ring or lets one cross another, so a small fire stays a polygon however coarse
+    the level, and the result keeps the ``MULTIPOLYGON`` type and SRID of the
+    perimeter the column is declared with. It is immutable, as a generated column
+    requires.
+
+    Parameters
+    ----------
+    tolerance : float
+        Douglas-Peucker distance tolerance, in degrees.
+
+    Returns
+    -------
+    str
+        The SQL expression.
+    """
+    return f"ST_SimplifyPreserveTopology(perimeter, {tolerance})"
+
 
 class Wildfire(Base):
     """A wildfire event reported by a data provider.
@@ -85,6 +160,26 @@ class Wildfire(Base):
     perimeter : geoalchemy2.elements.WKBElement or None
         Burnt area as a ``MULTIPOLYGON`` in EPSG:4326 (WGS 84), or ``None`` if
         the provider reports no perimeter (yet).
+    perimeter_area_m2 : float or None
+        Geodesic area of :attr:`perimeter` on the WGS84 ellipsoid, in square
+        metres — ``ST_Area(perimeter::geography)`` — or ``None`` with no
+        perimeter. A stored generated column: PostgreSQL computes it on insert and
+        again whenever the perimeter changes, so it cannot disagree with the
+        perimeter, and a report that sums areas reads a number instead of
+        measuring every polygon on every run. Every statistics report's geodesic
+        method is this column; the equal-area one, on a projection of its own, is
+        still measured per run. Read-only from Python.
+    perimeter_z1, perimeter_z2, perimeter_z3 : geoalchemy2.elements.WKBElement or None
+        :attr:`perimeter` simplified at each of
+        :data:`PERIMETER_LOD_TOLERANCES`, coarsest first, for map layers that
+        draw at a scale where the full perimeter's vertices would be fetched and
+        never seen (the ``v_*_lod*`` views). Stored generated columns, computed
+        when the import writes the perimeter; read-only from Python.
+    active_period : sqlalchemy.dialects.postgresql.Range
+        ``[start_date_time, end_date_time]`` as a ``tstzrange``, unbounded above
+        when there is no end and only the start instant when the end precedes
+        it. A stored generated column, read-only from Python, that exists to be
+        indexed together with :attr:`perimeter`: see :func:`active_within`.
     admin_boundary_id : int or None
         Foreign key to the :class:`~src.data_model.geography.admin_boundary.
         AdminBoundary` the fire burnt in, resolved once at import time by spatial
@@ -105,6 +200,9 @@ class Wildfire(Base):
     __table_args__ = (
         Index("ix_wildfire_admin_boundary_id", "admin_boundary_id"),
         Index("ix_wildfire_start_date_time", "start_date_time"),
+        Index("ix_wildfire_data_provider_id_start_date_time", "data_provider_id", "start_date_time"),
+        Index("ix_wildfire_perimeter_active_period", "perimeter", "active_period",
+              postgresql_using="gist"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -116,6 +214,24 @@ class Wildfire(Base):
     perimeter: Mapped[str | None] = mapped_column(
         Geometry(geometry_type="MULTIPOLYGON", srid=4326), nullable=True
     )
+    perimeter_area_m2: Mapped[float | None] = mapped_column(
+        Float, Computed(PERIMETER_AREA_SQL, persisted=True), nullable=True
+    )
+    perimeter_z1: Mapped[str | None] = mapped_column(
+        Geometry(geometry_type="MULTIPOLYGON", srid=4326),
+        Computed(perimeter_lod_sql(PERIMETER_LOD_TOLERANCES[0]), persisted=True), nullable=True
+    )
+    perimeter_z2: Mapped[str | None] = mapped_column(
+        Geometry(geometry_type="MULTIPOLYGON", srid=4326),
+        Computed(perimeter_lod_sql(PERIMETER_LOD_TOLERANCES[1]), persisted=True), nullable=True
+    )
+    perimeter_z3: Mapped[str | None] = mapped_column(
+        Geometry(geometry_type="MULTIPOLYGON", srid=4326),
+        Computed(perimeter_lod_sql(PERIMETER_LOD_TOLERANCES[2]), persisted=True), nullable=True
+    )
+    active_period: Mapped[Range[datetime.datetime]] = mapped_column(
+        TSTZRANGE, Computed(ACTIVE_PERIOD_SQL, persisted=True), nullable=False
+    )
     admin_boundary_id: Mapped[int | None] = mapped_column(
         ForeignKey(AdminBoundary.id), nullable=True
     )
@@ -136,3 +252,44 @@ class Wildfire(Base):
 
     def __repr__(self) -> str:
         return f"Wildfire(id={self.id!r}, start_date_time={self.start_date_time!r})"
+
+
+def active_within(bounds: tuple[float, float, float, float],
+                  start: datetime.datetime, end: datetime.datetime) -> ColumnElement[bool]:
+    """The fires burning inside a bounding box at some point of a time window.
+
+    Parameters
+    ----------
+    bounds : tuple of float
+        ``(west, south, east, north)`` in degrees, EPSG:4326.
+    start, end : datetime.datetime
+        Timezone-aware ends of the window, both included.
+
+    Returns
+    -------
+    ColumnElement
+        A condition for the ``WHERE`` of a query over :class:`Wildfire`::
+
+            select(Wildfire).where(active_within((-9.5, 36.0, 3.5, 44.0), monday, sunday))
+
+    Notes
+    -----
+    Both halves are operators the one GiST index over ``(perimeter,
+    active_period)`` answers together — ``ST_Intersects``, whose bounding-box
+    test PostGIS hands to the index before checking the shapes, and the range
+    overlap ``&&`` — so the planner walks a single index for the box *and* the
+    window, rather than scanning the fires inside one and filtering by the other.
+    Both column types have GiST operator classes of their own; no ``btree_gist``
+    is involved.
+
+    A fire with no end date overlaps every window from its start onwards, since
+    its period has not closed. For a provider that never publishes an end, that is
+    every one of its fires: add a condition on ``start_date_time`` if that is not
+    what is wanted. A fire with no perimeter is never in a box.
+    """
+    west, south, east, north = bounds
+    envelope = func.ST_MakeEnvelope(float(west), float(south), float(east), float(north), 4326)
+    return and_(
+        func.ST_Intersects(Wildfire.perimeter, envelope),
+        Wildfire.active_period.overlaps(Range(start, end, bounds="[]")),
+    )
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Wildfire area per administrative boundary.
+
+A ``WildfireBoundaryArea`` row holds the geodesic area of one fire's perimeter that
+lies inside one administrative boundary. A fire inside a single country has one row
+per level, carrying its whole area; a fire that burnt across a border has one row per
+boundary it burnt in, and its rows add up to the part of it that is on land.
+
+The table exists for ``--split-area`` reports (see
+:mod:`src.apps.statistics.wildfires.gwis.wildfire_statistics`). Every other mode
+attributes a fire's whole area to the one country an interior point of it falls in,
+which is the right answer for almost every fire and the wrong one for the large fires
+that burn across a border. Splitting them means intersecting the perimeter with the
+boundaries, which is far too expensive to do at report time over twenty million fires
+and only changes when an import does — so it is done then, by the importers that
+maintain the table, for the years a file replaced and in the transaction that replaced
+them (see :func:`src.apps.imports.common.refresh_boundary_areas`).
+
+Only the fires whose bounding box crosses a boundary are intersected. A fire whose
+bounding box a single piece of one boundary covers — the pieces are those of
+:class:`~src.data_model.geography.admin_boundary.AdminBoundaryPart` — is inside that
+boundary whole, and its row is its stored
+:attr:`~src.data_model.wildfire.Wildfire.perimeter_area_m2`.
+
+Areas are kept in square metres, as ``perimeter_area_m2`` stores them; the conversion
+to hectares is the report's business.
+"""
+
+from __future__ import annotations
+
+import datetime
+
+from sqlalchemy import DateTime
+from sqlalchemy import Float
+from sqlalchemy import ForeignKey
+from sqlalchemy import Index
+from sqlalchemy import Integer
+from sqlalchemy import func
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+
+from src.data_model import Base
+from src.data_model.data_provider import DataProvider
+from src.data_model.geography.admin_boundary import AdminBoundary
+from src.data_model.wildfire import Wildfire
+
+#: The boundary levels the importers split the fires over: countries and their first
+#: subdivision. A report grouping by either is a ``GROUP BY`` over this table.
+BOUNDARY_AREA_LEVELS = (0, 1)
+
+
+class WildfireBoundaryArea(Base):
+    """The part of one fire's burnt area inside one administrative boundary.
+
+    Attributes
+    ----------
+    wildfire_id : int
+        Foreign key to :class:`~src.data_model.wildfire.Wildfire`. Part of the primary
+        key; the row is deleted with its fire.
+    admin_boundary_id : int
+        Foreign key to :class:`~src.data_model.geography.admin_boundary.AdminBoundary`,
+        the boundary the area is inside. Part of the primary key; the row is deleted
+        with its boundary.
+    data_provider_id : int
+        The fire's provider, copied from it so that a refresh can replace one
+        provider's years, and a report read them, without a join.
+    level : int
+        The boundary's :attr:`~src.data_model.geography.admin_boundary.AdminBoundary.level`,
+        one of :data:`BOUNDARY_AREA_LEVELS`, copied for the same reason.
+    year : int
+        The year of the fire's *local* start date, the year the reports count a fire
+        towards, copied for the same reason.
+    area_m2 : float
+        Geodesic area of the fire's perimeter inside the boundary, in square metres.
+        Never zero: a perimeter that only touches a boundary along an edge has no row
+        for it.
+    refreshed_at : datetime.datetime
+        Timezone-aware timestamp of the last time the row was computed, set by the
+        database.
+    """
+
+    __tablename__ = "wildfire_boundary_area"
+
+    __table_args__ = (
+        Index("ix_wildfire_boundary_area_provider_level_year",
+              "data_provider_id", "level", "year"),
+    )
+
+    wildfire_id: Mapped[int] = mapped_column(
+        ForeignKey(Wildfire.id, ondelete="CASCADE"), primary_key=True
+    )
+    admin_boundary_id: Mapped[int] = mapped_column(
+        ForeignKey(AdminBoundary.id, ondelete="CASCADE"), primary_key=True, index=True
+    )
+    data_provider_id: Mapped[int] = mapped_column(ForeignKey(DataProvider.id), nullable=False)
+    level: Mapped[int] = mapped_column(Integer, nullable=False)
+    year: Mapped[int] = mapped_column(Integer, nullable=False)
+    area_m2: Mapped[float] = mapped_column(Float, nullable=False)
+    refreshed_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return (f"WildfireBoundaryArea(wildfire_id={self.wildfire_id!r}, "
+                f"admin_boundary_id={self.admin_boundary_id!r}, level={self.level!r}, "
+                f"area_m2={self.area_m2!r})")
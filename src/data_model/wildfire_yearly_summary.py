@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Yearly wildfire summary model.
+
+A ``WildfireYearlySummary`` row holds, for one
+:class:`~src.data_model.data_provider.DataProvider`, one administrative boundary,
+one local year and one kind of surface, the four figures every burnt-area report
+is made of: how many fires there were and the smallest, largest and total area
+they burnt.
+
+The table exists for ``--from-summary`` reports (see
+:mod:`src.apps.statistics.wildfires.gwis.wildfire_statistics`). A report that
+trusts the country the import stored groups the fires by that country and year
+and nothing else, which is a question whose answer only changes when an import
+does — yet every run asked it of every fire again. Here the answer is kept, and
+the importers that maintain it recompute only the years a file replaced, in the
+transaction that replaced them (see
+:func:`src.apps.imports.common.refresh_yearly_summary`).
+
+All four figures decompose over a partition of the fires, which is what makes
+the table enough: a country's total over several boundaries, or the world's over
+every country, is the same arithmetic the reports already do over the years they
+measure, and comes out exactly as the raw scan would.
+
+Areas are kept in square metres, as
+:attr:`~src.data_model.wildfire.Wildfire.perimeter_area_m2` stores them; the
+conversion to hectares is the report's business.
+"""
+
+from __future__ import annotations
+
+import datetime
+
+from sqlalchemy import DateTime
+from sqlalchemy import Float
+from sqlalchemy import ForeignKey
+from sqlalchemy import Integer
+from sqlalchemy import String
+from sqlalchemy import func
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+
+from src.data_model import Base
+from src.data_model.data_provider import DataProvider
+from src.data_model.geography.admin_boundary import AdminBoundary
+
+#: The surface measured from the burnt perimeter: the geodesic area the database
+#: stores with every perimeter. The only kind the importers maintain today; the
+#: column is part of the key so that a published (reported) area can sit beside it
+#: without a second table, should a provider's report come to need one.
+SURFACE_PERIMETER = "perimeter"
+
+
+class WildfireYearlySummary(Base):
+    """One provider's fires in one boundary and one year, reduced to four figures.
+
+    Attributes
+    ----------
+    data_provider_id : int
+        Foreign key to :class:`~src.data_model.data_provider.DataProvider`, the
+        provider whose fires are summarised. Part of the primary key.
+    admin_boundary_id : int
+        Foreign key to :class:`~src.data_model.geography.admin_boundary.AdminBoundary`:
+        the :attr:`~src.data_model.wildfire.Wildfire.admin_boundary_id` the import
+        stored. Part of the primary key. Fires with no boundary are not
+        summarised, since no report could attribute them to anything.
+    year : int
+        The year of the fires' *local* start date, ``start_date_time AT TIME ZONE
+        time_zone`` — the year the reports count a fire towards. Part of the
+        primary key.
+    surface : str
+        Which area the figures are of; :data:`SURFACE_PERIMETER` for the geodesic
+        area of the perimeter. Part of the primary key.
+    fires : int
+        How many fires the figures summarise.
+    minimum_m2, maximum_m2, total_m2 : float
+        Smallest single fire, largest single fire and sum of every fire, in square
+        metres.
+    refreshed_at : datetime.datetime
+        Timezone-aware timestamp of the last time the row was recomputed, set by
+        the database.
+    """
+
+    __tablename__ = "wildfire_yearly_summary"
+
+    data_provider_id: Mapped[int] = mapped_column(ForeignKey(DataProvider.id), primary_key=True)
+    admin_boundary_id: Mapped[int] = mapped_column(ForeignKey(AdminBoundary.id), primary_key=True)
+    year: Mapped[int] = mapped_column(Integer, primary_key=True)
+    surface: Mapped[str] = mapped_column(String, primary_key=True)
+    fires: Mapped[int] = mapped_column(Integer, nullable=False)
+    minimum_m2: Mapped[float] = mapped_column(Float, nullable=False)
+    maximum_m2: Mapped[float] = mapped_column(Float, nullable=False)
+    total_m2: Mapped[float] = mapped_column(Float, nullable=False)
+    refreshed_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return (f"WildfireYearlySummary(data_provider_id={self.data_provider_id!r}, "
+                f"admin_boundary_id={self.admin_boundary_id!r}, year={self.year!r}, "
+                f"surface={self.surface!r}, fires={self.fires!r})")
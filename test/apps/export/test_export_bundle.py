@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the FlatGeobuf / GeoPackage bundle export.
+
+``ogr2ogr`` is not run: :func:`subprocess.run` is intercepted, and a fake one
+writes the file it was asked for, so what is checked is which runs are made,
+with what, and what happens to the files around them. The GeoPackage's
+incremental delete runs against a real SQLite file.
+"""
+
+import logging
+import sqlite3
+import subprocess
+
+import pytest
+
+from sqlalchemy import Integer
+from sqlalchemy import text
+
+from src.apps.export import export_bundle as app
+from src.apps.export import partitions
+from src.apps.imports import common
+
+logger = logging.getLogger("test-export-bundle")
+
+SETTINGS = {"host": "localhost", "port": "5432", "name": "gisfire", "user": "gisfire",
+            "password": "secret"}
+
+
+def a_source(geometries=None) -> partitions.Source:
+    return partitions.Source("v_gwis_wildfire", [("id", Integer())],
+                             geometries or {"perimeter": ("MULTIPOLYGON", 4326)}, "start_date_time")
+
+
+@pytest.fixture
+def ogr2ogr(monkeypatch):
+    """Intercept ``subprocess.run``: record each command and create its destination.
+
+    A GeoPackage destination becomes a SQLite file with the layer in it and one row
+    per run, holding the year that run wrote, so the delete has something to find.
+    """
+    commands = []
+
+    def fake_run(command, **kwargs):
+        commands.append((command, kwargs))
+        destination = command[command.index("-f") + 2]
+        if command[command.index("-f") + 1] == "GPKG":
+            layer = command[command.index("-nln") + 1]
+            year = int(command[command.index("-sql") + 1].rsplit("= ", 1)[1])
+            with sqlite3.connect(destination) as connection:
+                connection.execute(f'CREATE TABLE IF NOT EXISTS "{layer}" (local_year INTEGER)')
+                connection.execute(f'INSERT INTO "{layer}" VALUES (?)', (year,))
+            connection.close()
+        else:
+            open(destination, "wb").close()
+        return subprocess.CompletedProcess(command, 0, stdout=None, stderr="")
+
+    monkeypatch.setattr(app.subprocess, "run", fake_run)
+    return commands
+
+
+# --------------------------------------------------------------------------
+# The ogr2ogr runs
+# --------------------------------------------------------------------------
+
+def test_a_flatgeobuf_is_written_with_its_spatial_index(tmp_path):
+    command = app.ogr2ogr_command("ogr2ogr", "FlatGeobuf", tmp_path / "data.fgb", SETTINGS,
+                                  a_source(), 3, 2021, append=False)
+
+    assert command[:4] == ["ogr2ogr", "-f", "FlatGeobuf", str(tmp_path / "data.fgb")]
+    assert command[4] == common.ogr_connection_string(SETTINGS)
+    assert "secret" not in " ".join(command)
+    assert command[command.index("-nlt") + 1] == "MULTIPOLYGON"
+    assert command[command.index("-a_srs") + 1] == "EPSG:4326"
+    assert command[command.index("-lco") + 1] == "SPATIAL_INDEX=YES"
+    assert "-gt" not in command and "-append" not in command
+
+
+def test_the_query_reads_one_partition_and_adds_its_local_year():
+    sql = app.partition_sql(a_source(), 3, 2021)
+
+    assert sql.startswith(f'SELECT *, {common.LOCAL_YEAR_SQL} AS local_year FROM "v_gwis_wildfire"')
+    assert "data_provider_id = 3" in sql
+    assert sql.endswith(f"{common.LOCAL_YEAR_SQL} = 2021")
+
+
+def test_a_geopackage_is_created_once_and_appended_to_after(tmp_path):
+    first = app.ogr2ogr_command("ogr2ogr", "GPKG", tmp_path / "v.gpkg", SETTINGS,
+                                a_source(), 3, 2020, append=False)
+    then = app.ogr2ogr_command("ogr2ogr", "GPKG", tmp_path / "v.gpkg", SETTINGS,
+                               a_source(), 3, 2021, append=True)
+
+    assert "GEOMETRY_NAME=perimeter" in first and "-append" not in first
+    assert "-append" in then and "-lco" not in then
+    assert then[then.index("-gt") + 1] == str(app.TRANSACTION_SIZE)
+
+
+def test_the_password_goes_in_the_environment_and_a_failure_is_reported(monkeypatch):
+    seen = {}
+
+    def failing_run(command, **kwargs):
+        seen.update(kwargs)
+        return subprocess.CompletedProcess(command, 1, stdout=None, stderr="ERROR 1: no such view")
+
+    monkeypatch.setattr(app.subprocess, "run", failing_run)
+    with pytest.raises(RuntimeError, match="no such view"):
+        app.run_ogr2ogr(["ogr2ogr"], SETTINGS, logger)
+    assert seen["env"]["PGPASSWORD"] == "secret"
+
+
+# --------------------------------------------------------------------------
+# Writing
+# --------------------------------------------------------------------------
+
+def test_flatgeobufs_replace_their_partitions_and_drop_the_emptied_ones(tmp_path, ogr2ogr):
+    source = a_source()
+    app.write_flatgeobuf(source, [(3, 2020, 5), (3, 2021, 7), (4, 2021, 1)], tmp_path, None,
+                         SETTINGS, "ogr2ogr", logger)
+    assert partitions.existing_partitions(tmp_path, source.name, app.FGB_FILE_NAME) == {
+        (3, 2020), (3, 2021), (4, 2021)}
+
+    ogr2ogr.clear()
+    written = app.write_flatgeobuf(source, [(3, 2021, 6)], tmp_path, [2021], SETTINGS,
+                                   "ogr2ogr", logger)
+
+    assert written == 1 and len(ogr2ogr) == 1
+    assert partitions.existing_partitions(tmp_path, source.name, app.FGB_FILE_NAME) == {
+        (3, 2020), (3, 2021)}
+    assert not list(tmp_path.rglob(".data.partial.fgb"))
+
+
+def test_a_geopackage_loses_the_rewritten_years_and_gets_them_again(tmp_path, ogr2ogr):
+    source = a_source()
+    app.write_geopackage(source, [(3, 2020, 5), (3, 2021, 7), (4, 2021, 1)], tmp_path, None,
+                         SETTINGS, "ogr2ogr", logger)
+    path = app.geopackage_path(tmp_path, source.name)
+    commands = [command for command, _ in ogr2ogr]
+    assert ["-append" in command for command in commands] == [False, True, True]
+    assert not (tmp_path / f".{source.name}.partial.gpkg").exists()
+
+    # Provider 4's 2021 is gone from the database: its row goes with the year's delete.
+    app.write_geopackage(source, [(3, 2021, 6)], tmp_path, [2021], SETTINGS, "ogr2ogr", logger)
+    with sqlite3.connect(path) as connection:
+        years = sorted(year for year, in connection.execute(f'SELECT local_year FROM "{source.name}"'))
+    connection.close()
+    assert years == [2020, 2021]
+
+
+def test_only_dataset_views_can_be_named():
+    assert app.parse_arguments(["-f", "fgb", "-o", "bundle"]).views is None
+    with pytest.raises(SystemExit):
+        app.parse_arguments(["-f", "fgb", "-o", "bundle", "--views", "wildfire"])
+
+
+# --------------------------------------------------------------------------
+# Against the database
+# --------------------------------------------------------------------------
+
+VIEWS_SQL = [
+    """CREATE VIEW v_gwis_wildfire AS
+       SELECT w.id::integer AS id, w.start_date_time, w.time_zone, w.data_provider_id, w.perimeter
+       FROM wildfire w""",
+    """CREATE VIEW v_gwis_wildfire_lod1 AS
+       SELECT w.id::integer AS id, w.start_date_time, w.time_zone, w.data_provider_id,
+              w.perimeter_z1 AS perimeter
+       FROM wildfire w""",
+]
+
+
+def test_the_level_of_detail_views_are_left_out_unless_named(db_session):
+    for sql in VIEWS_SQL:
+        db_session.execute(text(sql))
+    db_session.commit()
+
+    with db_session.get_bind().connect() as connection:
+        assert app.dataset_views(connection) == ["v_gwis_wildfire"]
+
+
+def test_an_incremental_geopackage_run_needs_the_file(db_session, tmp_path, ogr2ogr):
+    db_session.execute(text(VIEWS_SQL[0]))
+    db_session.commit()
+
+    with pytest.raises(RuntimeError, match="run once without --years"):
+        app.export_bundle(db_session.get_bind(), "gpkg", tmp_path, None, [2021], SETTINGS,
+                          "ogr2ogr", logger)
+    assert ogr2ogr == []
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the GeoParquet export.
+
+The type mapping, the ``geo`` metadata and the command line are tested without a
+database (the partitions themselves in ``test_partitions.py``); the export itself runs against GWIS fires inserted through the ORM,
+both from the generic ``wildfire`` table and from a view shaped like the dataset
+views, which ``create_all`` does not build.
+"""
+
+import datetime
+import json
+import logging
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from geoalchemy2 import Geometry  # noqa: E402
+from shapely import wkb  # noqa: E402
+from shapely.geometry import MultiPolygon  # noqa: E402
+from shapely.geometry import box  # noqa: E402
+from sqlalchemy import BigInteger  # noqa: E402
+from sqlalchemy import DateTime  # noqa: E402
+from sqlalchemy import Integer  # noqa: E402
+from sqlalchemy import Numeric  # noqa: E402
+from sqlalchemy import SmallInteger  # noqa: E402
+from sqlalchemy import String  # noqa: E402
+from sqlalchemy import delete  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+from sqlalchemy.dialects.postgresql import TSTZRANGE  # noqa: E402
+
+from src.apps.export import export_geoparquet as app  # noqa: E402
+from src.apps.export import partitions  # noqa: E402
+from src.data_model.data_provider import DataProvider  # noqa: E402
+from src.providers import gwis  # noqa: E402
+from src.providers.gwis.wildfire import GwisWildfire  # noqa: E402
+
+logger = logging.getLogger("test-export-geoparquet")
+
+
+def a_source(geometries=None) -> partitions.Source:
+    geometries = geometries or {"perimeter": ("MULTIPOLYGON", 4326)}
+    columns = [("id", Integer()), ("name", String())]
+    columns += [(column, Geometry()) for column in geometries]
+    columns.insert(1, ("data_provider_id", Integer()))
+    return partitions.Source("v_test_wildfire", columns, geometries, "start_date_time")
+
+
+# --------------------------------------------------------------------------
+# Without a database
+# --------------------------------------------------------------------------
+
+@pytest.mark.parametrize("column_type, expression, arrow_type", [
+    (Geometry("MULTIPOLYGON", 4326), 'ST_AsBinary("c")', pa.binary()),
+    (SmallInteger(), '"c"', pa.int16()),
+    (Integer(), '"c"', pa.int32()),
+    (BigInteger(), '"c"', pa.int64()),
+    (Numeric(10, 2), '"c"', pa.decimal128(10, 2)),
+    (Numeric(), '"c"::double precision', pa.float64()),
+    (DateTime(timezone=True), '"c"', pa.timestamp("us", tz="UTC")),
+    (DateTime(), '"c"', pa.timestamp("us")),
+    (String(40), '"c"', pa.string()),
+    (TSTZRANGE(), '"c"::text', pa.string()),
+])
+def test_a_column_keeps_its_type_or_becomes_text(column_type, expression, arrow_type):
+    assert app.column_expression("c", column_type) == (expression, arrow_type)
+
+
+def test_the_geo_metadata_declares_every_geometry_and_covers_the_first():
+    source = a_source({"perimeter": ("MULTIPOLYGON", 4326), "perimeter_3763": ("GEOMETRY", 3763)})
+    metadata = app.geo_metadata(source)
+
+    assert metadata["version"] == "1.1.0"
+    assert metadata["primary_column"] == "perimeter"
+    perimeter, grid = metadata["columns"]["perimeter"], metadata["columns"]["perimeter_3763"]
+    assert perimeter["encoding"] == grid["encoding"] == "WKB"
+    assert perimeter["geometry_types"] == ["MultiPolygon"]
+    assert grid["geometry_types"] == []
+    # Longitude first, the order the WKB is in.
+    assert perimeter["crs"]["id"] == {"authority": "OGC", "code": "CRS84"}
+    assert grid["crs"]["id"] == {"authority": "EPSG", "code": 3763}
+    assert perimeter["covering"]["bbox"]["xmin"] == ["bbox", "xmin"]
+    assert "covering" not in grid
+
+
+def test_a_batch_folds_the_corners_into_the_bbox():
+    _, schema = app.partition_query(a_source())
+    batch = app.record_batch([(1, "a", b"\x01", 0.0, 1.0, 2.0, 3.0),
+                              (2, None, None, None, None, None, None)], schema)
+
+    assert batch.schema.names == ["id", "name", "perimeter", "bbox"]
+    assert batch.to_pylist()[0]["bbox"] == {"xmin": 0.0, "ymin": 1.0, "xmax": 2.0, "ymax": 3.0}
+    assert batch.to_pylist()[1]["bbox"] is None
+    assert json.loads(schema.metadata[b"geo"])["primary_column"] == "perimeter"
+
+
+def test_statistics_are_kept_for_everything_but_the_geometry():
+    source = a_source()
+    _, schema = app.partition_query(source)
+    assert app.statistics_columns(source, schema) == [
+        "id", "name", "bbox.xmin", "bbox.ymin", "bbox.xmax", "bbox.ymax"]
+
+
+def test_the_row_group_size_must_be_positive():
+    arguments = app.parse_arguments(["-s", "wildfire", "-o", "exports"])
+    assert arguments.row_group_size == app.ROW_GROUP_SIZE
+    with pytest.raises(SystemExit):
+        app.parse_arguments(["-s", "wildfire", "-o", "exports", "--row-group-size", "0"])
+
+
+# --------------------------------------------------------------------------
+# Exporting
+# --------------------------------------------------------------------------
+
+#: (gwis_id, start, time zone, perimeter). The second starts on 31 December in UTC and
+#: counts towards 2021 only because its zone is Madrid's.
+FIRES = [
+    ("1", datetime.datetime(2020, 7, 1, 12, 0, tzinfo=datetime.timezone.utc), "UTC",
+     box(-4.1, 40.0, -4.0, 40.1)),
+    ("2", datetime.datetime(2020, 12, 31, 23, 30, tzinfo=datetime.timezone.utc), "Europe/Madrid",
+     box(4.0, 45.0, 4.1, 45.1)),
+    ("3", datetime.datetime(2021, 8, 1, 12, 0, tzinfo=datetime.timezone.utc), "UTC",
+     box(22.0, 39.0, 22.1, 39.1)),
+]
+
+#: A view shaped like the dataset views: the subclass joined to ``wildfire`` and
+#: to its provider, a local reading beside the instant, one geometry.
+VIEW_SQL = """
+CREATE VIEW v_gwis_wildfire AS
+SELECT s.id::integer AS id, s.gwis_id AS gwis_id,
+       w.start_date_time AS start_date_time,
+       w.start_date_time AT TIME ZONE w.time_zone AS start_date_time_local,
+       w.time_zone AS time_zone, w.data_provider_id AS data_provider_id,
+       dp.name AS data_provider_name, w.perimeter AS perimeter
+FROM gwis_wildfire s
+JOIN wildfire w ON w.id = s.id
+LEFT JOIN data_provider dp ON dp.id = w.data_provider_id
+"""
+
+
+@pytest.fixture
+def populated(db_session):
+    provider = DataProvider(name=gwis.PROVIDER_NAME, product=gwis.PROVIDER_PRODUCT,
+                            full_name="Global Wildfire Information System")
+    db_session.add(provider)
+    db_session.flush()
+    for gwis_id, start, zone, geometry in FIRES:
+        db_session.add(GwisWildfire(gwis_id=gwis_id, data_provider_id=provider.id,
+                                    start_date_time=start, time_zone=zone,
+                                    perimeter=f"SRID=4326;{MultiPolygon([geometry]).wkt}"))
+    db_session.execute(text(VIEW_SQL))
+    db_session.commit()
+    return db_session, provider
+
+
+def test_the_table_is_written_one_file_per_provider_and_local_year(populated, tmp_path):
+    session, provider = populated
+    written, removed = app.export(session.get_bind(), "wildfire", tmp_path, None, 1, logger)
+
+    assert (written, removed) == (2, 0)
+    assert partitions.existing_partitions(tmp_path, "wildfire", app.FILE_NAME) == {
+        (provider.id, 2020), (provider.id, 2021)}
+
+    path = partitions.partition_path(tmp_path, "wildfire", provider.id, 2021) / app.FILE_NAME
+    table = pq.read_table(path)
+    assert "data_provider_id" not in table.column_names
+    assert not set(partitions.DERIVED_COLUMNS) & set(table.column_names)
+    assert table.schema.field("start_date_time").type == pa.timestamp("us", tz="UTC")
+    # Both 2021 fires — one of them by its Madrid date — and one row group each.
+    rows = sorted(table.to_pylist(), key=lambda row: row["id"])
+    assert [wkb.loads(row["perimeter"]).bounds for row in rows] == [
+        fire[3].bounds for fire in FIRES[1:]]
+    assert rows[0]["bbox"] == dict(zip(("xmin", "ymin", "xmax", "ymax"), FIRES[1][3].bounds))
+    assert pq.ParquetFile(path).metadata.num_row_groups == 2
+    assert json.loads(table.schema.metadata[b"geo"])["columns"]["perimeter"]["geometry_types"] == [
+        "MultiPolygon"]
+
+
+def test_a_view_keeps_its_columns_and_its_local_reading(populated, tmp_path):
+    session, provider = populated
+    app.export(session.get_bind(), "v_gwis_wildfire", tmp_path, None, app.ROW_GROUP_SIZE, logger)
+
+    path = partitions.partition_path(tmp_path, "v_gwis_wildfire", provider.id, 2021) / app.FILE_NAME
+    rows = sorted(pq.read_table(path).to_pylist(), key=lambda row: row["gwis_id"])
+    assert [row["gwis_id"] for row in rows] == ["2", "3"]
+    assert rows[0]["start_date_time_local"] == datetime.datetime(2021, 1, 1, 0, 30)
+    assert rows[0]["data_provider_name"] == gwis.PROVIDER_NAME
+
+
+def test_exporting_some_years_replaces_only_those(populated, tmp_path):
+    session, provider = populated
+    app.export(session.get_bind(), "wildfire", tmp_path, None, app.ROW_GROUP_SIZE, logger)
+    kept = partitions.partition_path(tmp_path, "wildfire", provider.id, 2020) / app.FILE_NAME
+    before = kept.stat().st_mtime_ns
+
+    session.execute(delete(GwisWildfire).where(GwisWildfire.gwis_id.in_(["2", "3"])))
+    session.commit()
+    written, removed = app.export(session.get_bind(), "wildfire", tmp_path, [2021],
+                                  app.ROW_GROUP_SIZE, logger)
+
+    assert (written, removed) == (0, 1)
+    assert partitions.existing_partitions(tmp_path, "wildfire", app.FILE_NAME) == {(provider.id, 2020)}
+    assert kept.stat().st_mtime_ns == before
+
+
+def test_only_the_tables_and_the_dataset_views_are_sources(populated, tmp_path):
+    session, _ = populated
+    with pytest.raises(RuntimeError, match="not a source"):
+        app.export(session.get_bind(), "data_provider", tmp_path, None, app.ROW_GROUP_SIZE, logger)
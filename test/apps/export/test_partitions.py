@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for what the exports share: the partition layout and the partition filter."""
+
+from src.apps.export import partitions
+from src.apps.imports import common
+
+
+def a_source(time_column="start_date_time") -> partitions.Source:
+    return partitions.Source("v_test_wildfire", [], {"perimeter": ("MULTIPOLYGON", 4326)}, time_column)
+
+
+def test_the_local_year_is_the_reports_one():
+    assert a_source().year_sql == common.LOCAL_YEAR_SQL
+    assert a_source("date_time").year_sql == common.LOCAL_YEAR_SQL.replace("start_date_time", "date_time")
+
+
+def test_the_filter_binds_by_default_and_takes_literals_for_ogr2ogr():
+    bound = a_source().partition_filter()
+    assert bound.startswith("data_provider_id = :provider_id")
+    assert bound.endswith(f"{common.LOCAL_YEAR_SQL} = :year")
+
+    literal = a_source("date_time").partition_filter(3, 2021)
+    assert ":" not in literal.replace("::", "")
+    assert "make_timestamptz(2021 + 1, 1, 1" in literal
+    assert literal.startswith("data_provider_id = 3")
+
+
+def test_partitions_are_laid_out_hive_style(tmp_path):
+    path = partitions.partition_path(tmp_path, "wildfire", 3, 2021)
+    assert path == tmp_path / "wildfire" / "data_provider_id=3" / "local_year=2021"
+
+    path.mkdir(parents=True)
+    (path / "data.parquet").touch()
+    partitions.partition_path(tmp_path, "wildfire", 3, 2022).mkdir(parents=True)  # never completed
+    assert partitions.existing_partitions(tmp_path, "wildfire", "data.parquet") == {(3, 2021)}
+    assert partitions.existing_partitions(tmp_path, "wildfire", "data.fgb") == set()
+
+
+def test_only_the_rewritten_years_lose_their_stale_partitions(tmp_path):
+    for provider_id, year in [(3, 2020), (3, 2021), (4, 2021)]:
+        path = partitions.partition_path(tmp_path, "wildfire", provider_id, year)
+        path.mkdir(parents=True)
+        (path / "data.parquet").touch()
+
+    # 2021 rewritten, and provider 4 no longer has any of it; 2020 not asked about.
+    removed = partitions.remove_stale_partitions(tmp_path, "wildfire", "data.parquet",
+                                                 [(3, 2021, 10)], [2021])
+    assert removed == [partitions.partition_path(tmp_path, "wildfire", 4, 2021)]
+    assert partitions.existing_partitions(tmp_path, "wildfire", "data.parquet") == {(3, 2020), (3, 2021)}
+
+    removed = partitions.remove_stale_partitions(tmp_path, "wildfire", "data.parquet", [], None)
+    assert len(removed) == 2
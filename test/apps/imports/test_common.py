@@ -8,19 +8,28 @@ streams are captured, and both are visible in the call.
 """
 
 import argparse
+import hashlib
 import io
 import logging
+import struct
 import subprocess
 import threading
 import time
 
 import pytest
 
+from shapely.geometry import box
+from sqlalchemy import func
 from sqlalchemy import select
 from sqlalchemy import text
 
 from src.apps.imports import common
 from src.data_model.data_provider import DataProvider
+from src.data_model.geography.admin_boundary import AdminBoundary
+from src.data_model.geography.admin_boundary import AdminBoundaryPart
+from src.data_model.geography.time_zone import TimeZone
+from src.data_model.geography.time_zone import TimeZonePart
+from src.data_model.source_file import SourceFile
 
 PROVIDER = ("GWIS", "Global Wildfire Database v3", "Global Wildfire Information System",
             "https://gwis.jrc.ec.europa.eu/")
@@ -34,7 +43,17 @@ def args():
 
 
 @pytest.fixture
-def recorded_run(monkeypatch):
+def indexed(monkeypatch):
+    """Intercept :func:`common.index_staging_table`, recording the table and columns."""
+    calls = []
+    monkeypatch.setattr(common, "index_staging_table",
+                        lambda staging_table, settings, logger, index_columns=None:
+                        calls.append((staging_table, index_columns)))
+    return calls
+
+
+@pytest.fixture
+def recorded_run(monkeypatch, indexed):
     """Intercept ``subprocess.run``, recording the command and the stream arguments."""
     recorded = {}
 
@@ -81,6 +100,27 @@ def test_stderr_is_captured_whatever_the_level(args, recorded_run, level):
     assert recorded_run["kwargs"]["stderr"] is subprocess.PIPE
 
 
+def test_the_staging_table_is_unlogged_and_indexed_after_the_load(args, recorded_run, indexed):
+    """Thrown away after the run, so not worth the WAL; indexed once, not per row."""
+    logger = logging.getLogger("test-common-unlogged")
+    common.load_staging_table("source.shp", "layer", "staging.table", args, SETTINGS, logger,
+                              index_columns=["Id", "IDate"])
+
+    command = recorded_run["command"]
+    assert command[command.index("UNLOGGED=ON") - 1] == "-lco"
+    assert command[command.index("SPATIAL_INDEX=NONE") - 1] == "-lco"
+    assert indexed == [("staging.table", ["Id", "IDate"])]
+
+
+def test_an_append_creates_nothing_but_is_still_indexed(args, recorded_run, indexed):
+    """The table exists, so there is nothing to create; the index is built if it is not."""
+    common.load_staging_table("source.shp", "layer", "staging.table", args, SETTINGS,
+                              logging.getLogger("test-common-append"), append=True)
+
+    assert "UNLOGGED=ON" not in recorded_run["command"]
+    assert indexed == [("staging.table", None)]
+
+
 def test_a_provider_being_inserted_by_someone_else_is_waited_for_and_reused(db_session):
     """The look-then-insert this replaced killed every racing importer but the winner.
 
@@ -136,6 +176,239 @@ def test_a_failure_still_reports_what_ogr2ogr_said(args, monkeypatch):
         load(args, logging.INFO)
 
 
+# --------------------------------------------------------------------------
+# The in-process loader
+# --------------------------------------------------------------------------
+
+def test_the_copy_loader_is_used_when_asked_for_and_available(monkeypatch, recorded_run):
+    """``--loader copy`` replaces the subprocess entirely, with the same arguments."""
+    called = {}
+
+    def fake_copy(datasource, layer, staging_table, settings, logger, **kwargs):
+        called.update(datasource=datasource, layer=layer, table=staging_table, **kwargs)
+        return 0
+
+    monkeypatch.setattr(common, "_gdal_bindings", lambda: (object(), object(), object()))
+    monkeypatch.setattr(common, "copy_staging_table", fake_copy)
+    args = argparse.Namespace(ogr2ogr="ogr2ogr", loader="copy")
+    common.load_staging_table("source.shp", "layer", "staging.table", args, SETTINGS,
+                              logging.getLogger("test-common-copy"), geometry_type="POINT",
+                              target_srs="EPSG:3978", fid_column="ogc_fid")
+
+    assert recorded_run == {}
+    assert (called["datasource"], called["layer"], called["table"]) == (
+        "source.shp", "layer", "staging.table")
+    assert (called["geometry_type"], called["target_srs"], called["fid_column"]) == (
+        "POINT", "EPSG:3978", "ogc_fid")
+
+
+def test_the_copy_loader_falls_back_to_ogr2ogr_without_the_bindings(
+        monkeypatch, recorded_run, caplog):
+    """Asking for the faster loader must never fail an import that would have run."""
+    monkeypatch.setattr(common, "_gdal_bindings", lambda: None)
+    args = argparse.Namespace(ogr2ogr="ogr2ogr", loader="copy")
+    with caplog.at_level(logging.WARNING):
+        load(args, logging.INFO)
+
+    assert recorded_run["command"][0] == "ogr2ogr"
+    assert "loading with ogr2ogr instead" in caplog.text
+
+
+@pytest.mark.parametrize("name, column", [
+    ("Id", "id"),
+    ("FIRE-ID", "fire_id"),
+    ("No#", "no_"),
+    ("x" * 70, "x" * 63),
+])
+def test_field_names_are_laundered_as_ogr2ogr_lands_them(name, column):
+    """The transforms name staging columns the way ogr2ogr writes them."""
+    assert common.launder_column_name(name) == column
+
+
+@pytest.mark.parametrize("byte_order, pack", [(1, "<"), (0, ">")])
+def test_a_wkb_point_becomes_ewkb_carrying_its_srid(byte_order, pack):
+    """The SRID flag and four bytes after the type word, in the geometry's own order."""
+    wkb = bytes([byte_order]) + struct.pack(f"{pack}Idd", 1, 2.0, 41.5)
+
+    spliced = common.ewkb(wkb, 4326)
+
+    kind, srid, x, y = struct.unpack(f"{pack}IIdd", spliced[1:])
+    assert spliced[0] == byte_order
+    assert kind == 1 | common.EWKB_SRID_FLAG
+    assert (srid, x, y) == (4326, 2.0, 41.5)
+
+
+# --------------------------------------------------------------------------
+# The manifest
+# --------------------------------------------------------------------------
+
+def test_a_loose_shapefile_is_hashed_with_its_sidecars(tmp_path):
+    """A republished .dbf changes the fires as much as a republished .shp."""
+    for suffix in (".shp", ".shx", ".dbf"):
+        (tmp_path / f"fires{suffix}").write_bytes(suffix.encode())
+    (tmp_path / "other.dbf").write_bytes(b"not part of it")
+
+    members = common.source_members(tmp_path / "fires.shp")
+    first, size = common.source_digest(tmp_path / "fires.shp")
+    (tmp_path / "fires.dbf").write_bytes(b"republished")
+    second, _ = common.source_digest(tmp_path / "fires.shp")
+
+    assert [member.name for member in members] == ["fires.dbf", "fires.shp", "fires.shx"]
+    assert size == 12
+    assert first != second
+
+
+def test_an_archive_is_hashed_on_its_own(tmp_path):
+    archive = tmp_path / "year.zip"
+    archive.write_bytes(b"zip bytes")
+    (tmp_path / "year.txt").write_bytes(b"unrelated")
+
+    assert common.source_members(archive) == [archive]
+    assert common.source_digest(archive) == (hashlib.sha256(b"year.zipzip bytes").hexdigest(), 9)
+
+
+def test_only_the_recorded_content_counts_as_unchanged():
+    record = SourceFile(name="year.zip", sha256="a" * 64, size_bytes=10, wildfire_count=3)
+
+    assert common.is_unchanged(record, "a" * 64, 10)
+    assert not common.is_unchanged(record, "b" * 64, 10)
+    assert not common.is_unchanged(record, "a" * 64, 11)
+    assert not common.is_unchanged(None, "a" * 64, 10)
+
+
+# --------------------------------------------------------------------------
+# Running several imports at once
+# --------------------------------------------------------------------------
+
+@pytest.mark.parametrize("value, jobs", [("1", 1), ("4", 4), ("auto", common.AUTO_JOBS)])
+def test_jobs_is_a_count_or_auto(value, jobs):
+    assert common.jobs_argument(value) == jobs
+
+
+@pytest.mark.parametrize("value", ["0", "-2"])
+def test_jobs_below_one_is_rejected(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        common.jobs_argument(value)
+
+
+@pytest.mark.parametrize("value", ["0", "-1"])
+def test_chunks_below_one_is_rejected(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        common.chunks_argument(value)
+
+
+def test_a_whole_table_transform_draws_its_ids_from_the_sequence():
+    assert common.slice_sql(None) == common.WHOLE_TABLE_SQL
+    assert common.slice_parameters(None) == {}
+
+
+def test_a_slice_looks_its_ids_up_and_filters_on_its_keys():
+    staging_slice = common.StagingSlice(2, "staging.gfa_00_ids", "fire_id", 140, 299)
+    sql = common.slice_sql(staging_slice)
+
+    assert "FROM staging.gfa_00_ids AS allocated" in sql["wildfire_id"]
+    assert "allocated.key = staging.fire_id" in sql["wildfire_id"]
+    assert sql["slice_filter"] == "AND staging.fire_id BETWEEN :slice_first AND :slice_last"
+    assert common.slice_parameters(staging_slice) == {"slice_first": 140, "slice_last": 299}
+
+
+def test_a_pool_never_outnumbers_the_files_or_the_free_connections(db_session, monkeypatch):
+    """A worker refused a connection fails its file; a smaller pool only takes longer."""
+    engine = db_session.get_bind()
+    logger = logging.getLogger("test-common-jobs")
+    with engine.connect() as connection:
+        free = connection.execute(text(common.FREE_CONNECTIONS_SQL)).scalar()
+    room = max(1, (free - common.RESERVED_CONNECTIONS) // common.CONNECTIONS_PER_WORKER)
+    monkeypatch.setattr(common.os, "cpu_count", lambda: 1000)
+
+    assert common.worker_count(engine, 8, 1, logger) == 1
+    assert common.worker_count(engine, 3, 2, logger) == 2
+    assert common.worker_count(engine, 10_000, 10_000, logger) == room
+    assert common.worker_count(engine, common.AUTO_JOBS, 10_000, logger) == room
+
+
+def test_a_report_pool_never_outnumbers_the_years_or_the_free_connections(db_session):
+    """One connection per worker, and none for a report of a single year."""
+    logger = logging.getLogger("test-common-snapshot-jobs")
+    free = db_session.execute(text(common.FREE_CONNECTIONS_SQL)).scalar()
+    room = max(1, free - common.RESERVED_CONNECTIONS)
+
+    assert common.snapshot_worker_count(db_session, 8, 1, logger) == 1
+    assert common.snapshot_worker_count(db_session, 3, 2, logger) == 2
+    assert common.snapshot_worker_count(db_session, 10_000, 10_000, logger) == room
+
+
+def test_the_years_measured_in_parallel_read_the_reports_snapshot(db_session):
+    """A provider committed after the report began is in none of the years, in any worker."""
+    engine = db_session.get_bind()
+    logger = logging.getLogger("test-common-snapshot")
+    count = select(func.count()).select_from(DataProvider)
+    threads = set()
+
+    def measure(session, year):
+        threads.add(threading.get_ident())
+        return [(year, session.scalar(count))]
+
+    with common.snapshot_session(engine) as report:
+        before = report.scalar(count)
+        db_session.add(DataProvider(name="LATE", product="late", full_name="Late"))
+        db_session.commit()
+
+        measured = common.measure_by_year(report, [2023, 2022, 2021, 2020], measure, 2,
+                                          "Counting", "every provider", logger)
+
+    assert measured == [(2023, before), (2022, before), (2021, before), (2020, before)]
+    assert threading.get_ident() not in threads
+    assert db_session.scalar(count) == before + 1
+
+
+def test_a_failed_year_fails_the_report_and_says_which(db_session):
+    logger = logging.getLogger("test-common-snapshot-failure")
+
+    def measure(session, year):
+        if year == 2021:
+            raise ValueError("no such column")
+        return [year]
+
+    with common.snapshot_session(db_session.get_bind()) as report:
+        with pytest.raises(RuntimeError, match=r"2021 \(no such column\)"):
+            common.measure_by_year(report, [2022, 2021, 2020], measure, 3, "Failing",
+                                   "every year", logger)
+
+
+def test_one_job_measures_on_the_reports_own_session():
+    sessions = []
+    measured = common.measure_by_year("the report", [2021, 2020],
+                                      lambda session, year: sessions.append(session) or [year],
+                                      1, "Measuring", "everything",
+                                      logging.getLogger("test-common-serial-years"))
+
+    assert measured == [2021, 2020]
+    assert sessions == ["the report", "the report"]
+
+
+def test_a_serial_run_keeps_the_order_and_reports_each_file(tmp_path, caplog):
+    """Only a parallel run reorders; a serial one imports in the order it was given."""
+    small, large = tmp_path / "small.zip", tmp_path / "large.zip"
+    small.write_bytes(b"x")
+    large.write_bytes(b"x" * 100)
+    seen = []
+
+    def importer(path, engine, args, offset, logger):
+        seen.append(path.name)
+        return len(path.name) + offset
+
+    args = argparse.Namespace(jobs=1)
+    with caplog.at_level(logging.INFO):
+        results = common.run_imports([small, large], importer, None, args, (1,),
+                                     logging.getLogger("test-common-serial"))
+
+    assert seen == ["small.zip", "large.zip"]
+    assert sorted(results) == [10, 10]
+    assert common.source_size(large) > common.source_size(small)
+    assert "small.zip: 0s loading" in caplog.text
+
+
 # --------------------------------------------------------------------------
 # The progress reporter
 # --------------------------------------------------------------------------
@@ -304,3 +577,149 @@ def test_a_quiet_logger_spins_nothing_but_still_times_the_work(caplog):
     assert stream.getvalue() == ""
     assert "Measuring" not in caplog.text
     assert spinner.elapsed >= 0.02
+
+
+# --------------------------------------------------------------------------
+# The time zone lookup pieces
+# --------------------------------------------------------------------------
+
+def test_a_zone_written_by_hand_is_cut_before_an_import_reads_it(db_session):
+    """Only the time zone import cuts as it writes; anything else is caught up here."""
+    db_session.add(TimeZone(name="Europe/Madrid",
+                            geometry="SRID=4326;MULTIPOLYGON(((0 40, 1 40, 1 41, 0 41, 0 40)))"))
+    db_session.commit()
+
+    common.check_time_zones(db_session, logging.getLogger("test-time-zone-parts"))
+
+    assert db_session.scalars(select(TimeZonePart.name)).all() == ["Europe/Madrid"]
+    # A second check finds nothing missing and cuts nothing more.
+    assert common.cut_time_zone_parts(db_session, logging.getLogger("test")) == 0
+
+
+# --------------------------------------------------------------------------
+# The boundary lookup pieces
+# --------------------------------------------------------------------------
+
+def test_a_boundary_written_by_hand_is_cut_for_its_provider_only(db_session):
+    """The catch-up is scoped to the provider asked about, and is idempotent."""
+    ours = DataProvider(name="OCHA", product="Global International Boundaries - OSM",
+                        full_name="UN Office for the Coordination of Humanitarian Affairs")
+    theirs = DataProvider(name="IGN", product="Recintos municipales",
+                          full_name="Instituto Geográfico Nacional")
+    square = "SRID=4326;MULTIPOLYGON(((1.4 42.4, 1.8 42.4, 1.8 42.7, 1.4 42.7, 1.4 42.4)))"
+    andorra = AdminBoundary(data_provider=ours, source_id="AND", level=0,
+                            name="Andorra", geometry=square)
+    db_session.add_all([andorra, AdminBoundary(data_provider=theirs, source_id="AND",
+                                               level=0, name="Andorra", geometry=square)])
+    db_session.commit()
+
+    logger = logging.getLogger("test-boundary-parts")
+    assert common.cut_admin_boundary_parts(db_session, logger, ours.id) == 1
+
+    parts = db_session.scalars(select(AdminBoundaryPart)).all()
+    assert [(part.admin_boundary_id, part.data_provider_id, part.level) for part in parts] \
+        == [(andorra.id, ours.id, 0)]
+    assert common.cut_admin_boundary_parts(db_session, logger, ours.id) == 0
+
+
+# --------------------------------------------------------------------------
+# Resolving points in Python
+# --------------------------------------------------------------------------
+
+def test_a_batch_is_resolved_point_by_point_in_order():
+    resolver = common.SpatialResolver([10, 20], [box(0, 0, 1, 1), box(2, 0, 3, 1)])
+
+    assert resolver.resolve([2.5, 0.5, 5.0], [0.5, 0.5, 0.5]) == [20, 10, None]
+
+
+def test_a_missing_coordinate_resolves_to_nothing():
+    resolver = common.SpatialResolver([10], [box(0, 0, 1, 1)])
+
+    assert resolver.resolve([None, 0.5], [0.5, None]) == [None, None]
+
+
+def test_a_point_on_a_cut_resolves_to_the_first_piece():
+    """Intersects, as the SQL lookup: a point on the edge is in, and once."""
+    resolver = common.SpatialResolver([10, 20], [box(0, 0, 1, 1), box(1, 0, 2, 1)])
+
+    assert resolver.resolve([1.0], [0.5]) == [10]
+
+
+def test_an_empty_resolver_resolves_nothing():
+    assert common.SpatialResolver([], []).resolve([0.5], [0.5]) == [None]
+
+
+# --------------------------------------------------------------------------
+# Writing a batch with COPY
+# --------------------------------------------------------------------------
+
+def test_a_batch_is_copied_with_the_source_types_and_the_extra_columns(db_session):
+    rows = [("GWIS", "v3", "2024-07-01 12:00:00"), ("GFA", "v1", None)]
+
+    copied = common.copy_batch(db_session, "provider_batch", "data_provider",
+                               ("name", "product"), {"seen": "timestamp"}, rows)
+
+    assert copied == 2
+    assert db_session.execute(text(
+        "SELECT name, product, seen::text FROM provider_batch ORDER BY name"
+    )).all() == [("GFA", "v1", None), ("GWIS", "v3", "2024-07-01 12:00:00")]
+
+
+def test_a_second_batch_replaces_the_first(db_session):
+    """Each batch reads its own rows only, and none of the source's NOT NULLs."""
+    common.copy_batch(db_session, "provider_batch", "data_provider", ("name",), {},
+                      [("GWIS",)])
+    common.copy_batch(db_session, "provider_batch", "data_provider", ("product",), {},
+                      [("v1",)])
+
+    assert db_session.execute(text("SELECT * FROM provider_batch")).all() == [("v1",)]
+
+
+def test_the_batch_table_is_gone_after_commit(db_session):
+    common.copy_batch(db_session, "provider_batch", "data_provider", ("name",), {},
+                      [("GWIS",)])
+    db_session.commit()
+
+    assert db_session.scalar(text("SELECT to_regclass('pg_temp.provider_batch')")) is None
+
+
+# --------------------------------------------------------------------------
+# Reading ahead
+# --------------------------------------------------------------------------
+
+def test_reading_ahead_keeps_every_record_in_order():
+    assert list(common.read_ahead(range(1234), chunk=100, depth=2)) == list(range(1234))
+
+
+def test_a_reader_failure_is_raised_in_the_caller():
+    def records():
+        yield 1
+        raise ValueError("row 2 is not a row")
+
+    with pytest.raises(ValueError, match="row 2"):
+        list(common.read_ahead(records(), chunk=1))
+
+
+def test_the_reader_stays_at_most_depth_chunks_ahead():
+    read = []
+
+    def records():
+        for number in range(1000):
+            read.append(number)
+            yield number
+
+    ahead = common.read_ahead(records(), chunk=10, depth=2)
+    assert next(ahead) == 0
+    time.sleep(0.2)
+    # The chunk being handed out, two queued, and one the reader is holding.
+    assert len(read) <= 40
+    ahead.close()
+
+
+def test_closing_early_stops_the_reader():
+    before = threading.active_count()
+    ahead = common.read_ahead(iter(range(100_000)), chunk=10, depth=1)
+    next(ahead)
+    ahead.close()
+
+    assert threading.active_count() == before
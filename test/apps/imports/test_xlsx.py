@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the streaming ``.xlsx`` reader shared by the importers.
+
+The workbooks here are written part by part, as the stored XML, because what is
+being tested is how that XML is read: a formula's cached value beside its
+formula, a date that is only a date because of its style, a row or a cell the
+writer left out. The importers' own tests cover the same reader through real
+sheet shapes.
+"""
+
+import datetime
+import zipfile
+
+import pytest
+
+from src.apps.imports import xlsx
+
+NAMESPACES = (
+    'xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+)
+
+
+def write_workbook(path, sheets, shared=(), number_formats=(), cell_formats=(0,),
+                   date1904=False, dimension=True):
+    """Write a workbook from its sheets' row XML.
+
+    ``sheets`` is a list of ``(name, rows XML)``; ``cell_formats`` the number
+    format id of each cell style, in ``s`` order, and ``number_formats`` the
+    custom ones as ``(id, code)``.
+    """
+    properties = '<workbookPr date1904="1"/>' if date1904 else ""
+    entries = "".join(f'<sheet name="{name}" sheetId="{number}" r:id="rId{number}"/>'
+                      for number, (name, _) in enumerate(sheets, start=1))
+    relationships = "".join(
+        f'<Relationship Id="rId{number}" Target="worksheets/sheet{number}.xml" '
+        f'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet"/>'
+        for number in range(1, len(sheets) + 1)
+    )
+    formats = "".join(f'<numFmt numFmtId="{fmt}" formatCode="{code}"/>'
+                      for fmt, code in number_formats)
+    styles = "".join(f'<xf numFmtId="{fmt}"/>' for fmt in cell_formats)
+
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("xl/workbook.xml",
+                         f"<workbook {NAMESPACES}>{properties}<sheets>{entries}</sheets></workbook>")
+        archive.writestr(
+            "xl/_rels/workbook.xml.rels",
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            f"{relationships}</Relationships>")
+        archive.writestr("xl/styles.xml",
+                         f"<styleSheet {NAMESPACES}><numFmts>{formats}</numFmts>"
+                         f"<cellXfs>{styles}</cellXfs></styleSheet>")
+        archive.writestr("xl/sharedStrings.xml",
+                         f"<sst {NAMESPACES}>"
+                         + "".join(f"<si><t>{text}</t></si>" for text in shared) + "</sst>")
+        for number, (_, rows) in enumerate(sheets, start=1):
+            declared = '<dimension ref="A1:C9"/>' if dimension else ""
+            archive.writestr(f"xl/worksheets/sheet{number}.xml",
+                             f"<worksheet {NAMESPACES}>{declared}"
+                             f"<sheetData>{rows}</sheetData></worksheet>")
+    return path
+
+
+def rows(path, sheet=0, **options):
+    with zipfile.ZipFile(path) as archive:
+        return list(xlsx.Workbook(archive).worksheets[sheet].rows(**options))
+
+
+# --------------------------------------------------------------------------
+# References, escapes and formats
+# --------------------------------------------------------------------------
+
+def test_a_reference_splits_into_its_column_and_its_row():
+    assert xlsx.column_index("A1") == 0
+    assert xlsx.column_index("AE483001") == 30
+    assert xlsx.row_number("AE483001") == 483001
+    assert xlsx.row_number("AE") is None
+
+
+def test_an_escaped_control_character_is_resolved_and_an_escaped_escape_kept():
+    assert xlsx.unescape("ΚΑΛΑΜΟΣ_x000D_") == "ΚΑΛΑΜΟΣ\r"
+    assert xlsx.unescape("_x005F_x000D_") == "_x000D_"
+
+
+@pytest.mark.parametrize("code, is_date", [
+    ("dd/mm/yyyy", True),
+    ("hh:mm", True),
+    ("[h]:mm:ss", True),
+    ("0.00", False),
+    ("0.00;[Red]-0.00", False),
+    ('"Day "0', False),        # the letters are a quoted literal
+    ("General", False),
+])
+def test_a_format_is_a_date_by_its_letters_outside_literals(code, is_date):
+    assert xlsx.is_date_format(code) is is_date
+
+
+def test_a_serial_below_one_is_a_time_of_day():
+    assert xlsx.from_excel(0.5625) == datetime.time(13, 30)
+
+
+def test_a_serial_is_counted_from_its_workbooks_epoch():
+    assert xlsx.from_excel(44726) == datetime.datetime(2022, 6, 14)
+    assert xlsx.from_excel(43264, xlsx.MAC_EPOCH) == datetime.datetime(2022, 6, 14)
+
+
+def test_shared_strings_are_found_by_offset():
+    strings = xlsx.SharedStrings(["Ourense", "", "Άλση"])
+
+    assert len(strings) == 3
+    assert [strings[0], strings[1], strings[2]] == ["Ourense", "", "Άλση"]
+    with pytest.raises(IndexError):
+        strings[3]
+
+
+def test_a_rich_text_shared_string_is_its_runs_joined(tmp_path):
+    with zipfile.ZipFile(tmp_path / "e.xlsx", "w") as archive:
+        archive.writestr("xl/sharedStrings.xml", (
+            f"<sst {NAMESPACES}><si><t>Plain</t></si>"
+            "<si><r><t>Rich </t></r><r><t>text</t></r><rPh><t>ふり</t></rPh></si></sst>"))
+    with zipfile.ZipFile(tmp_path / "e.xlsx") as archive:
+        strings = xlsx.SharedStrings.read(archive)
+
+    assert [strings[0], strings[1]] == ["Plain", "Rich text"]
+
+
+# --------------------------------------------------------------------------
+# Reading rows
+# --------------------------------------------------------------------------
+
+def test_cells_are_typed_as_they_are_stored(tmp_path):
+    path = write_workbook(tmp_path / "w.xlsx", [("2022", (
+        '<row r="1">'
+        '<c r="A1" t="s"><v>0</v></c>'
+        '<c r="B1"><v>17</v></c>'
+        '<c r="C1"><v>0.9</v></c>'
+        '<c r="D1" t="b"><v>1</v></c>'
+        '<c r="E1" t="inlineStr"><is><t>ΜΙΚΡΗ</t></is></c>'
+        '<c r="F1" t="e"><v>#N/A</v></c>'
+        '</row>'
+    ))], shared=["ΑΤΤΙΚΗΣ"])
+
+    assert rows(path) == [(1, ("ΑΤΤΙΚΗΣ", 17, 0.9, True, "ΜΙΚΡΗ", "#N/A"))]
+
+
+def test_a_formula_is_read_as_the_value_excel_cached_for_it(tmp_path):
+    path = write_workbook(tmp_path / "w.xlsx", [("2022", (
+        '<row r="1"><c r="A1"><f>VLOOKUP(B1,engagexy!A:C,2,FALSE)</f><v>23.86</v></c>'
+        '<c r="B1" t="str"><f>A1&amp;""</f><v>23.86</v></c></row>'
+    ))])
+
+    assert rows(path) == [(1, (23.86, "23.86"))]
+
+
+def test_a_number_is_a_date_when_its_style_says_so(tmp_path):
+    path = write_workbook(tmp_path / "w.xlsx", [("2022", (
+        '<row r="1"><c r="A1" s="1"><v>44726</v></c><c r="B1" s="2"><v>0.5625</v></c>'
+        '<c r="C1"><v>44726</v></c></row>'
+    ))], number_formats=[(164, "hh:mm")], cell_formats=(0, 14, 164))
+
+    assert rows(path) == [
+        (1, (datetime.datetime(2022, 6, 14), datetime.time(13, 30), 44726))]
+
+
+def test_a_1904_workbook_counts_its_dates_from_1904(tmp_path):
+    path = write_workbook(tmp_path / "w.xlsx", [("2022", (
+        '<row r="1"><c r="A1" s="1"><v>43264</v></c></row>'
+    ))], cell_formats=(0, 14), date1904=True)
+
+    assert rows(path) == [(1, (datetime.datetime(2022, 6, 14),))]
+
+
+def test_an_omitted_cell_is_a_none_in_its_place(tmp_path):
+    path = write_workbook(tmp_path / "w.xlsx", [("2022", (
+        '<row r="1"><c r="A1"><v>1</v></c><c r="C1"><v>3</v></c></row>'
+    ))])
+
+    assert rows(path) == [(1, (1, None, 3))]
+
+
+def test_an_omitted_row_is_skipped_and_its_number_kept(tmp_path):
+    path = write_workbook(tmp_path / "w.xlsx", [("2022", (
+        '<row r="1"><c r="A1"><v>1</v></c></row>'
+        '<row r="4"><c r="A4"><v>4</v></c></row>'
+    ))])
+
+    assert rows(path) == [(1, (1,)), (4, (4,))]
+    assert rows(path, min_row=2) == [(4, (4,))]
+
+
+def test_the_head_fills_the_rows_a_sheet_leaves_out(tmp_path):
+    path = write_workbook(tmp_path / "w.xlsx", [("2022", (
+        '<row r="2"><c r="A2"><v>2</v></c></row>'
+        '<row r="3"><c r="A3"><v>3</v></c></row>'
+    ))])
+    with zipfile.ZipFile(path) as archive:
+        worksheet = xlsx.Workbook(archive).worksheets[0]
+        assert worksheet.head(4) == [(), (2,), (3,), ()]
+
+
+def test_the_sheets_come_in_workbook_order_with_their_dimensions(tmp_path):
+    path = write_workbook(tmp_path / "w.xlsx", [("2000", ""), ("engage", "")])
+    with zipfile.ZipFile(path) as archive:
+        worksheets = xlsx.Workbook(archive).worksheets
+        assert [worksheet.title for worksheet in worksheets] == ["2000", "engage"]
+        assert worksheets[0].max_row == 9
+
+
+def test_a_sheet_without_a_dimension_has_no_declared_last_row(tmp_path):
+    path = write_workbook(tmp_path / "w.xlsx", [("2000", "")], dimension=False)
+    with zipfile.ZipFile(path) as archive:
+        assert xlsx.Workbook(archive).worksheets[0].max_row is None
@@ -23,6 +23,7 @@ from sqlalchemy.orm import Session
 
 from src.apps.imports.time_zones.timezone_boundary_builder import import_time_zones as app
 from src.data_model import Base
+from src.data_model.geography import SUBDIVIDE_VERTICES
 from src.data_model.geography.time_zone import TimeZone
 from src.settings import ROOT_DIR
 
@@ -176,6 +177,54 @@ def test_re_importing_replaces_the_geometry_rather_than_duplicating(database, ar
         assert len(session.scalars(select(TimeZone)).all()) == len(SAMPLE_ZONES)
 
 
+@needs_ogr2ogr
+def test_every_zone_is_cut_into_pieces_that_cover_it_exactly(database, args):
+    """The pieces are what the importers look points up in, so they must lose nothing."""
+    engine, _ = database
+    app.import_time_zones(args, engine, logger)
+
+    with Session(engine) as session:
+        mismatched = session.scalars(text(
+            "SELECT time_zone.name FROM time_zone "
+            "JOIN time_zone_part ON time_zone_part.time_zone_id = time_zone.id "
+            "GROUP BY time_zone.id "
+            "HAVING abs(ST_Area(time_zone.geometry) - sum(ST_Area(time_zone_part.geometry))) "
+            "       > 1e-9 * ST_Area(time_zone.geometry)"
+        )).all()
+        cut = session.scalar(text("SELECT count(DISTINCT time_zone_id) FROM time_zone_part"))
+        largest = session.scalar(text("SELECT max(ST_NPoints(geometry)) FROM time_zone_part"))
+    assert mismatched == []
+    assert cut == len(SAMPLE_ZONES)
+    assert largest <= SUBDIVIDE_VERTICES
+
+
+@needs_ogr2ogr
+def test_a_point_on_a_cut_still_finds_its_zone(database, args):
+    """Cuts are internal edges: a lookup with ``ST_Intersects`` does not fall through them."""
+    engine, _ = database
+    app.import_time_zones(args, engine, logger)
+
+    with Session(engine) as session:
+        # The same pocket as above, answered from the pieces rather than the zones.
+        matches = session.scalars(text(
+            "SELECT DISTINCT name FROM time_zone_part "
+            "WHERE ST_Intersects(geometry, ST_SetSRID(ST_Point(0.5, 43.5), 4326))"
+        )).all()
+        assert matches == ["Atlantic/Canary"]
+
+
+@needs_ogr2ogr
+def test_re_importing_cuts_the_pieces_again_rather_than_adding_to_them(database, args):
+    engine, _ = database
+    app.import_time_zones(args, engine, logger)
+    with Session(engine) as session:
+        first = session.scalar(text("SELECT count(*) FROM time_zone_part"))
+
+    app.import_time_zones(args, engine, logger)
+    with Session(engine) as session:
+        assert session.scalar(text("SELECT count(*) FROM time_zone_part")) == first
+
+
 @needs_ogr2ogr
 def test_the_staging_table_is_dropped(database, args):
     engine, _ = database
@@ -215,7 +264,7 @@ def test_an_unmigrated_database_is_reported_before_the_staging_load(database, ar
     """
     engine, _ = database
     with engine.begin() as connection:
-        connection.execute(text("DROP TABLE time_zone"))
+        connection.execute(text("DROP TABLE time_zone CASCADE"))
 
     with pytest.raises(RuntimeError, match="make migrate"):
         app.import_time_zones(args, engine, logger)
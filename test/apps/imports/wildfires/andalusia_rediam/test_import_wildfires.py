@@ -282,6 +282,13 @@ def test_the_two_sources_are_mutually_exclusive(tmp_path):
         app.parse_arguments(["-d", str(tmp_path), "-s", str(tmp_path / "a.shp")])
 
 
+@pytest.mark.parametrize("partial", [["--year", "2022"], ["--skip-ignitions"]])
+def test_an_incremental_run_reads_the_whole_source(tmp_path, partial):
+    """The manifest records the directory; a run over part of it is not a run over it."""
+    with pytest.raises(SystemExit):
+        app.parse_arguments(["-d", str(tmp_path), "--incremental", *partial])
+
+
 def test_the_combined_layer_is_what_perimeters_come_from(published):
     args = app.parse_arguments(["-d", str(published)])
     perimeters, _ = app.find_layers(args)
@@ -580,6 +580,12 @@ def test_an_empty_directory_is_refused(tmp_path):
         app.find_archives(arguments)
 
 
+def test_an_incremental_run_cannot_pick_years(tmp_path):
+    """The manifest records whole archives; one read for a single year is not one."""
+    with pytest.raises(SystemExit):
+        app.parse_arguments(["-d", str(tmp_path), "--incremental", "--year", "2023"])
+
+
 def test_a_missing_path_is_reported_rather_than_raised(tmp_path):
     assert app.main(["-s", str(tmp_path / "nowhere.zip"),
                      "--db-name", "x", "--db-user", "y"]) == 1
@@ -677,6 +677,12 @@ def test_the_year_cut_defaults_to_where_the_perimeters_start():
     assert arguments.from_year == canada_nfdb.FIRST_YEAR == 1973
 
 
+def test_an_incremental_run_cannot_pick_years():
+    """The manifest records the archive; a run over one year would hide the others."""
+    with pytest.raises(SystemExit):
+        app.parse_arguments(["-s", "x.zip", "--incremental", "--year", "2023"])
+
+
 def test_the_year_column_is_converted_rather_than_accepted():
     """``YEAR`` is published as Real and carries a sentinel compared against an int."""
     assert "double precision" not in app.COMPATIBLE_TYPES["integer"]
@@ -290,6 +290,12 @@ def test_the_two_sources_are_mutually_exclusive(tmp_path):
         app.parse_arguments(["-d", str(tmp_path), "-s", str(tmp_path / "a.shp")])
 
 
+def test_an_incremental_run_can_pick_years(tmp_path):
+    """``--year`` picks whole files here, which is what the manifest records."""
+    args = app.parse_arguments(["-d", str(tmp_path), "--incremental", "--year", "2022"])
+    assert args.incremental and args.year == [2022]
+
+
 def test_the_layers_are_ordered_by_year_not_by_name(published):
     """``incendis10`` is 2010 and sorts there, not between 1 and 1986."""
     args = app.parse_arguments(["-d", str(published)])
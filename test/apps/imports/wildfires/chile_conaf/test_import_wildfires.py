@@ -822,6 +822,30 @@ def test_reimporting_the_mainland_leaves_easter_island_alone(archives,
     assert easter == 1
 
 
+def test_an_incremental_run_cannot_pick_seasons(tmp_path):
+    """The manifest records whole archives; one read for a single season is not one."""
+    with pytest.raises(SystemExit):
+        app.parse_arguments(["-s", str(tmp_path / "a.rar"), "--incremental", "-y", "2022"])
+
+
+@needs_ogr2ogr
+def test_an_incremental_re_run_skips_an_unchanged_archive(archives, with_boundaries):
+    engine, url = with_boundaries
+    archive = archives / "if_temporada_2023_2024.shp"
+    run(url, archive, extra=["--incremental"])
+    with Session(engine) as session:
+        first = session.scalars(text("SELECT id FROM conaf_wildfire ORDER BY id")).all()
+        recorded = session.execute(text(
+            "SELECT name, wildfire_count, first_wildfire_id FROM source_file")).all()
+
+    run(url, archive, extra=["--incremental"])
+
+    with Session(engine) as session:
+        again = session.scalars(text("SELECT id FROM conaf_wildfire ORDER BY id")).all()
+    assert recorded == [(archive.name, 3, None)]
+    assert again == first, "the season was not deleted and written again"
+
+
 @needs_ogr2ogr
 def test_a_dry_run_writes_nothing(archives, with_boundaries):
     engine, url = with_boundaries
@@ -841,26 +865,3 @@ def test_the_staging_table_is_dropped_when_the_run_ends(archives, with_boundarie
             "SELECT count(*) FROM information_schema.tables "
             "WHERE table_schema = 'staging' AND table_name = 'conaf_reports'"))
     assert remaining == 0
-
-
-@needs_ogr2ogr
-def test_the_subdivided_lookup_tables_go_with_it(archives, with_boundaries):
-    """The pieces the country lookup is made of are staging, and are dropped as such."""
-    engine, url = with_boundaries
-    run(url, archives / "if_temporada_2023_2024.shp")
-
-    with Session(engine) as session:
-        remaining = session.scalar(text(
-            "SELECT count(*) FROM information_schema.tables "
-            "WHERE table_schema = 'staging' AND table_name LIKE '%_parts'"))
-    assert remaining == 0
-
-
-@needs_ogr2ogr
-def test_keeping_the_staging_table_keeps_the_lookup_tables_too(archives, with_boundaries):
-    """``--keep-staging`` is for looking at what a run did, lookups included."""
-    engine, url = with_boundaries
-    run(url, archives / "if_temporada_2023_2024.shp", extra=["--keep-staging"])
-
-    assert count(engine, "staging.conaf_reports_boundary_parts") > 0
-    assert count(engine, "staging.conaf_reports_time_zone_parts") > 0
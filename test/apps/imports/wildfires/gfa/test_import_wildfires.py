@@ -29,6 +29,7 @@ from sqlalchemy import select
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from src.apps.imports import common
 from src.apps.imports.time_zones.timezone_boundary_builder import import_time_zones as time_zone_app
 from src.apps.imports.wildfires.gfa import import_wildfires as app
 from src.data_model import Base
@@ -243,6 +244,13 @@ def test_defaults_are_applied():
     assert parsed.id_field == app.DEFAULT_ID_FIELD
     assert parsed.staging_table == app.DEFAULT_STAGING_TABLE
     assert parsed.keep_staging is False
+    assert parsed.chunks == 1
+
+
+def test_slices_cannot_be_combined_with_an_incremental_run():
+    """The slices could not see the incremental delete and would skip every correction."""
+    with pytest.raises(SystemExit):
+        app.parse_arguments(["-s", "one.shp", "--chunks", "4", "--incremental"])
 
 
 def test_the_shapefiles_of_a_directory_are_found_in_order(tmp_path):
@@ -788,7 +796,7 @@ def test_more_jobs_than_shapefiles_does_not_spawn_idle_workers(database, boundar
                                                                args, monkeypatch):
     """One shapefile is a serial run whatever was asked for."""
     args.jobs = 8
-    monkeypatch.setattr(app, "import_in_parallel",
+    monkeypatch.setattr(common, "ProcessPoolExecutor",
                         lambda *a, **k: pytest.fail("a single shapefile went through the pool"))
 
     engine, _ = database
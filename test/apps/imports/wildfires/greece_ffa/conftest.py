@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 """Fixture builders for the Greek Fire Service import tests.
 
-The workbooks are written with ``openpyxl``, which is also what reads them — so
+The workbooks are written with ``openpyxl``, the way Excel would store them — so
 unlike the EGIF fixtures next door, which hand-write the stored XML because the
 *encoding* is what goes wrong there, these fixtures are about **shape**. What goes
 wrong with this source is the shape of the sheet, and all of it is reproduced here:
@@ -10,6 +10,8 @@ forms of every date and time — Excel value and text — read the same.
 """
 
 import datetime
+import re
+import zipfile
 
 import pytest
 
@@ -323,6 +325,28 @@ def test_a_published_coordinate_is_read_as_degrees(tmp_path):
     assert records[0].located
 
 
+def test_a_coordinate_formula_is_read_as_its_cached_value(tmp_path):
+    """2022-2024 publish ``X-ENGAGE`` as a ``VLOOKUP`` into a helper sheet.
+
+    ``openpyxl`` writes no cached value for a formula, so the stored cell is
+    rewritten into what Excel saves: the formula and, beside it, its last result.
+    """
+    path = write_workbook(tmp_path / "y.xlsx", {"2022": (HEADER_2022, [a_2022_fire()])})
+    with zipfile.ZipFile(path) as archive:
+        parts = {name: archive.read(name) for name in archive.namelist()}
+    sheet = next(name for name in parts if name.startswith("xl/worksheets/"))
+    parts[sheet], replaced = re.subn(
+        rb'(<c r="C3"[^>]*>)<v>',
+        rb"\1<f>VLOOKUP(B3,engagexy!A:C,2,FALSE)</f><v>", parts[sheet])
+    assert replaced == 1
+    with zipfile.ZipFile(path, "w") as archive:
+        for name, content in parts.items():
+            archive.writestr(name, content)
+
+    (_, records), = read(path)
+    assert records[0].longitude == 23.86
+
+
 def test_a_zero_pair_is_not_a_location(tmp_path):
     """3,755 rows of 2020-2025 carry it, and null island is in the Gulf of Guinea."""
     path = write_workbook(tmp_path / "y.xlsx", {"2022": (HEADER_2022, [a_2022_fire(**{
@@ -30,12 +30,15 @@ from sqlalchemy import select
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from src.apps.imports import common
 from src.apps.imports.time_zones.timezone_boundary_builder import import_time_zones as time_zone_app
 from src.apps.imports.wildfires.gwis import import_wildfires as app
 from src.data_model import Base
 from src.data_model.data_provider import DataProvider
 from src.data_model.geography.admin_boundary import AdminBoundary
+from src.data_model.source_file import SourceFile
 from src.data_model.wildfire import Wildfire
+from src.data_model.wildfire_yearly_summary import WildfireYearlySummary
 from src.providers import ocha
 from src.providers.gwis.wildfire import GwisWildfire
 from src.providers.ocha.admin_boundary import OchaAdminBoundary
@@ -474,6 +477,127 @@ def test_re_importing_stores_the_file_again_and_warns(database, boundaries, time
     assert "already imported" in caplog.text
 
 
+@needs_ogr2ogr
+def test_an_incremental_re_run_skips_an_unchanged_archive(database, boundaries, time_zones,
+                                                         connection_arguments):
+    """The manifest is what lets a re-run skip by file when it cannot skip by fire."""
+    engine, _ = database
+    args = app.parse_arguments(["--shapefile", str(SAMPLE_ARCHIVE), "--incremental",
+                                *connection_arguments])
+    assert app.import_wildfires(args, engine, logger) == 7
+    assert app.import_wildfires(args, engine, logger) == 0
+
+    with Session(engine) as session:
+        assert session.scalar(select(func.count()).select_from(Wildfire)) == 7
+        entry = session.scalar(select(SourceFile))
+        assert entry.name == SAMPLE_ARCHIVE.name
+        assert entry.size_bytes == SAMPLE_ARCHIVE.stat().st_size
+        assert entry.wildfire_count == 7
+        assert entry.last_wildfire_id - entry.first_wildfire_id == 6
+
+
+@needs_ogr2ogr
+def test_an_incremental_re_run_replaces_a_changed_archive(database, boundaries, time_zones,
+                                                          connection_arguments):
+    """A republished year replaces its previous fires rather than joining them."""
+    engine, _ = database
+    args = app.parse_arguments(["--shapefile", str(SAMPLE_ARCHIVE), "--incremental",
+                                *connection_arguments])
+    app.import_wildfires(args, engine, logger)
+    with Session(engine) as session:
+        before = set(session.scalars(select(Wildfire.id)))
+        # What a republished file looks like to the manifest.
+        session.execute(text("UPDATE source_file SET sha256 = repeat('0', 64)"))
+        session.commit()
+
+    assert app.import_wildfires(args, engine, logger) == 7
+
+    with Session(engine) as session:
+        after = set(session.scalars(select(Wildfire.id)))
+        assert len(after) == 7
+        assert before & after == set()
+        assert session.scalar(select(func.count()).select_from(GwisWildfire)) == 7
+        assert session.scalar(select(SourceFile.first_wildfire_id)) == min(after)
+
+
+@needs_ogr2ogr
+def test_slices_that_fail_to_commit_leave_the_archive_recorded_as_incomplete(
+        database, boundaries, time_zones, connection_arguments, monkeypatch):
+    """What did commit is recorded under a digest no archive has, to be replaced."""
+    engine, _ = database
+    args = app.parse_arguments(["--shapefile", str(SAMPLE_ARCHIVE), "--incremental",
+                                *connection_arguments])
+    app.import_wildfires(args, engine, logger)
+    with Session(engine) as session:
+        session.execute(text("UPDATE source_file SET sha256 = repeat('0', 64)"))
+        session.commit()
+
+    def commit_the_first_slice_only(self):
+        number, connection = min(self._connections.items())
+        if number in self._prepared:
+            self._resolve_prepared("COMMIT", number)
+        else:
+            connection.commit()
+        self._committed.append(number)
+        raise RuntimeError("the next slice could not be committed")
+
+    monkeypatch.setattr(common.SlicedTransform, "commit", commit_the_first_slice_only)
+    sliced = app.parse_arguments(["--shapefile", str(SAMPLE_ARCHIVE), "--chunks", "3",
+                                  "--incremental", *connection_arguments])
+    with pytest.raises(RuntimeError, match="could not be committed"):
+        app.import_wildfires(sliced, engine, logger)
+
+    with Session(engine) as session:
+        record = session.scalar(select(SourceFile))
+        stored = session.scalar(select(func.count()).select_from(Wildfire))
+        assert record.sha256 == common.INCOMPLETE_SHA256
+        assert 0 < stored < 7
+        assert record.wildfire_count == stored
+
+    monkeypatch.undo()
+    assert app.import_wildfires(args, engine, logger) == 7
+    with Session(engine) as session:
+        assert session.scalar(select(func.count()).select_from(Wildfire)) == 7
+
+
+def summarised_fires(engine) -> dict[int, int]:
+    """Fires per year in the yearly summary, over every boundary."""
+    summary = WildfireYearlySummary.__table__
+    with Session(engine) as session:
+        return dict(session.execute(
+            select(summary.c.year, func.sum(summary.c.fires)).group_by(summary.c.year)).all())
+
+
+def fires_with_a_country(engine) -> int:
+    with Session(engine) as session:
+        return session.scalar(select(func.count()).select_from(Wildfire)
+                              .where(Wildfire.admin_boundary_id.is_not(None)))
+
+
+@needs_ogr2ogr
+def test_the_import_fills_the_yearly_summary(imported):
+    """Every fire with a country, under its local year; the Atlantic one has none."""
+    engine, _ = imported
+    assert summarised_fires(engine) == {2021: fires_with_a_country(engine)}
+    assert fires_with_a_country(engine) < 7
+
+
+@needs_ogr2ogr
+def test_a_replaced_archive_replaces_its_years_in_the_summary(database, boundaries, time_zones,
+                                                              connection_arguments):
+    """Recomputed from the fires, so the year is not counted twice."""
+    engine, _ = database
+    args = app.parse_arguments(["--shapefile", str(SAMPLE_ARCHIVE), "--incremental",
+                                *connection_arguments])
+    app.import_wildfires(args, engine, logger)
+    with Session(engine) as session:
+        session.execute(text("UPDATE source_file SET sha256 = repeat('0', 64)"))
+        session.commit()
+    app.import_wildfires(args, engine, logger)
+
+    assert summarised_fires(engine) == {2021: fires_with_a_country(engine)}
+
+
 @needs_ogr2ogr
 def test_the_staging_table_is_dropped(imported):
     engine, _ = imported
@@ -566,6 +690,27 @@ def test_parallel_imports_everything_exactly_once(database, boundaries, time_zon
             select(DataProvider).where(DataProvider.name == "GWIS")).all()) == 1
 
 
+@needs_ogr2ogr
+def test_parallel_incremental_archives_each_record_a_range_of_their_own(
+        database, boundaries, time_zones, connection_arguments, tmp_path):
+    """Ids drawn as one block per archive, so no recorded range holds another's fires."""
+    directory = archive_directory(tmp_path, (2018, 2019, 2020, 2021))
+    args = app.parse_arguments(["--directory", str(directory), "--jobs", "3",
+                                "--incremental", *connection_arguments])
+
+    engine, _ = database
+    assert app.import_wildfires(args, engine, logger) == 4 * 7
+
+    with Session(engine) as session:
+        records = session.scalars(select(SourceFile)).all()
+        assert len(records) == 4
+        for record in records:
+            assert record.wildfire_count == 7
+            assert session.scalar(select(func.count()).select_from(Wildfire).where(
+                Wildfire.id.between(record.first_wildfire_id,
+                                    record.last_wildfire_id))) == 7
+
+
 @needs_ogr2ogr
 def test_each_worker_stages_into_its_own_table_and_drops_it(database, boundaries, time_zones,
                                                             connection_arguments, tmp_path):
@@ -607,7 +752,7 @@ def test_more_jobs_than_archives_does_not_spawn_idle_workers(database, boundarie
                                                              args, monkeypatch):
     """One archive is a serial run whatever was asked for."""
     args.jobs = 8
-    monkeypatch.setattr(app, "import_in_parallel",
+    monkeypatch.setattr(common, "ProcessPoolExecutor",
                         lambda *a, **k: pytest.fail("a single archive went through the pool"))
 
     engine, _ = database
@@ -631,3 +776,39 @@ def test_main_returns_non_zero_when_the_import_fails(database, connection_argume
                           *connection_arguments])
     assert exit_code == 1
     assert "Import failed" in caplog.text
+
+
+@needs_ogr2ogr
+def test_an_archive_transformed_in_slices_matches_a_serial_import(database, boundaries,
+                                                                  time_zones,
+                                                                  connection_arguments):
+    """The slices write what one transform writes, under one contiguous block of ids."""
+    engine, _ = database
+
+    def stored():
+        with Session(engine) as session:
+            return sorted(session.execute(select(
+                GwisWildfire.gwis_id, Wildfire.start_date_time, Wildfire.end_date_time,
+                Wildfire.time_zone, Wildfire.admin_boundary_id,
+            ).join(Wildfire, Wildfire.id == GwisWildfire.id)).all())
+
+    serial = app.parse_arguments(["--shapefile", str(SAMPLE_ARCHIVE), *connection_arguments])
+    assert app.import_wildfires(serial, engine, logger) == 7
+    expected = stored()
+    with Session(engine) as session:
+        session.execute(text("DELETE FROM gwis_wildfire"))
+        session.execute(text("DELETE FROM wildfire"))
+        session.commit()
+
+    sliced = app.parse_arguments(["--shapefile", str(SAMPLE_ARCHIVE), "--chunks", "3",
+                                  "--incremental", *connection_arguments])
+    assert app.import_wildfires(sliced, engine, logger) == 7
+
+    assert stored() == expected
+    with Session(engine) as session:
+        entry = session.scalar(select(SourceFile))
+        assert entry.wildfire_count == 7
+        assert entry.last_wildfire_id - entry.first_wildfire_id == 6
+        assert session.scalar(text(
+            "SELECT count(*) FROM information_schema.tables WHERE table_schema = 'staging'"
+        )) == 0
@@ -287,6 +287,7 @@ def test_defaults_are_applied():
     assert parsed.staging_table == app.DEFAULT_STAGING_TABLE
     assert parsed.keep_staging is False
     assert parsed.replace is False
+    assert parsed.incremental is False
 
 
 def test_the_archives_of_a_directory_are_found_in_published_order(tmp_path):
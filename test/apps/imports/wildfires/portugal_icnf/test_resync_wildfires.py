@@ -12,6 +12,7 @@ import. What is under test is what the resync does to a row the import already
 produced, and stating that starting point explicitly is clearer than deriving it.
 """
 
+import argparse
 import datetime
 import logging
 
@@ -24,6 +25,7 @@ from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from src.apps.imports.wildfires.portugal_icnf import resync_wildfires as app
+from src.apps.statistics import cache
 from src.data_model import Base
 from src.providers import portugal_icnf
 from src.providers.portugal_icnf.wildfire import IcnfWildfire
@@ -527,6 +529,31 @@ def test_running_twice_changes_nothing_the_second_time(stored, args):
             "WHERE i.sgif_code = 'SGIF-1'")) == touched
 
 
+def test_a_corrected_year_alone_is_a_change_to_the_report_cache(stored, args, tmp_path):
+    """The cache notices a change by ``wildfire.updated_at``, and the year lives on
+    ``icnf_wildfire``: the resync has to move the one when it rewrites the other."""
+    resync_one_layer(stored, args, [feature("SGIF-1")])
+    computed = []
+
+    def compute():
+        computed.append(True)
+        return ["a row"]
+
+    def report():
+        with Session(stored) as session:
+            cache.cached_compute(session, argparse.Namespace(), [portugal_icnf], compute,
+                                 logger, directory=tmp_path)
+
+    report()
+    report()
+    assert len(computed) == 1
+
+    counts = resync_one_layer(stored, args, [feature("SGIF-1", Ano=2023)])
+    assert (counts["dates"], counts["attributes"]) == (0, 1)
+    report()
+    assert len(computed) == 2
+
+
 # --------------------------------------------------------------------------
 # The run as a whole
 # --------------------------------------------------------------------------
@@ -78,12 +78,13 @@ def excel_row(values: dict[str, str | None]) -> dict[str, str | None]:
 
 
 def write_excel(path: Path, rows: list[dict[str, str | None]],
-                header: tuple[str, ...] = EXCEL_COLUMNS) -> Path:
+                header: tuple[str, ...] = EXCEL_COLUMNS, dimension: bool = True) -> Path:
     """Write a workbook in the shape the EGIF service exports.
 
     A cell whose value is ``None`` is **left out of the row entirely**, ``r``
     references and all, which is exactly what the 2008-2010 export does for the
-    two fires with no extinction time.
+    two fires with no extinction time. ``dimension=False`` leaves out the
+    ``<dimension>`` every real export declares, which the format allows.
     """
     strings: list[str] = []
     index_of: dict[str, int] = {}
@@ -111,7 +112,9 @@ def write_excel(path: Path, rows: list[dict[str, str | None]],
     sheet = (
         '<?xml version="1.0" encoding="utf-8"?>'
         '<x:worksheet xmlns:x="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
-        f'<x:sheetData>{"".join(body)}</x:sheetData></x:worksheet>'
+        + (f'<x:dimension ref="A1:{column_reference(len(header) - 1)}{len(body)}"/>'
+           if dimension else "")
+        + f'<x:sheetData>{"".join(body)}</x:sheetData></x:worksheet>'
     )
     shared_strings = (
         '<?xml version="1.0" encoding="utf-8"?>'
@@ -9,6 +9,7 @@ things a caller could do wrong.
 """
 
 import datetime
+import zipfile
 
 import pytest
 
@@ -134,6 +135,27 @@ def test_the_rows_can_be_counted_without_converting_them(tmp_path):
     assert readers.count_excel_rows(tmp_path / "e.xlsx") == 7
 
 
+def test_the_rows_are_counted_from_the_declared_dimension(tmp_path):
+    """Not by walking the sheet: a declared range that disagrees with the rows wins."""
+    write_excel(tmp_path / "e.xlsx", [excel_row({"NumeroParte": "2020080001"})])
+    with zipfile.ZipFile(tmp_path / "e.xlsx") as archive:
+        parts = {name: archive.read(name) for name in archive.namelist()}
+    parts["xl/worksheets/sheet.xml"] = parts["xl/worksheets/sheet.xml"].replace(
+        b'ref="A1:AE2"', b'ref="A1:AE483001"')
+    with zipfile.ZipFile(tmp_path / "e.xlsx", "w") as archive:
+        for name, content in parts.items():
+            archive.writestr(name, content)
+
+    assert readers.count_excel_rows(tmp_path / "e.xlsx") == 483000
+
+
+def test_a_sheet_without_a_dimension_is_counted_row_by_row(tmp_path):
+    rows = [excel_row({"NumeroParte": f"20200800{n:02d}"}) for n in range(3)]
+    write_excel(tmp_path / "e.xlsx", rows, dimension=False)
+
+    assert readers.count_excel_rows(tmp_path / "e.xlsx") == 3
+
+
 def test_counting_a_file_that_is_not_a_workbook_says_so_quietly(tmp_path):
     """The count is only for the bar, so it defers the real complaint to the read."""
     (tmp_path / "e.xlsx").write_text("not a zip at all")
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the shared report engine.
+
+Everything here is about the engine's bookkeeping, and none of it needs a database:
+which grouping sets a report reads, which ``GROUPING()`` bitmask each one comes back
+under, and how a report's rows are assembled from the grouped result. The grouped
+result is built by hand, as the mappings PostgreSQL would return, so that what is
+asserted is the assembly and not the aggregation — the aggregation is PostgreSQL's,
+and the CONAF tests hold the engine's output to the applications it replaces.
+"""
+
+import argparse
+
+import pytest
+
+from sqlalchemy import column
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy import table
+from sqlalchemy.dialects import postgresql
+
+from src.apps.statistics import engine
+
+FIRES = table("fires", column("region"), column("year"), column("kind"),
+              column("area"))
+
+DIMENSIONS = ["region", "year", "kind"]
+
+
+def source(year):
+    query = select(FIRES.c.region, FIRES.c.year, FIRES.c.kind, FIRES.c.area)
+    return query if year is None else query.where(FIRES.c.year == year)
+
+
+STATISTICS = engine.ReportDefinition(
+    name="statistics", title="Statistics", rows=("region", "year"),
+    columns=("fires", "total"), total_over="year", totals=engine.TOTALS_PER_GROUP,
+    where=lambda c: c.region.isnot(None))
+
+KINDS = engine.ReportDefinition(
+    name="kinds", title="Kinds", rows=("year", "kind"),
+    columns=("fires", "fires_percent"), total_over="year")
+
+PROVIDER = engine.Provider(
+    name="test",
+    source=source,
+    dimensions=(engine.Dimension("region", "Region"),
+                engine.Dimension("year", "Year", lambda year: f"Y{year}"),
+                engine.Dimension("kind", "Kind")),
+    measures=(engine.Measure("fires", "Fires", lambda c: func.count()),
+              engine.Measure("total", "Total (ha)", lambda c: func.sum(c.area),
+                             kind=engine.KIND_HECTARES, default=0.0)),
+    shares=(engine.Share("fires_percent", "Fires (%)", "fires", over="kind"),),
+    reports=(STATISTICS, KINDS),
+)
+
+
+WORLD = engine.ReportDefinition(
+    name="world", title="World", rows=("region", "year"),
+    columns=("fires", "total", "total_percent"), total_over="year",
+    totals=engine.TOTALS_ALWAYS, block_over="region")
+
+WORLDWIDE = engine.Provider(
+    name="worldwide",
+    source=source,
+    dimensions=(engine.Dimension("region", "Region", total_label="World",
+                                 collated=True),
+                engine.Dimension("year", "Year", descending=True),
+                engine.Dimension("kind", "Kind")),
+    measures=PROVIDER.measures,
+    shares=(engine.Share("total_percent", "Total (% of fires)", "total", of="fires"),),
+    reports=(WORLD,),
+)
+
+
+def result(region=None, year=None, kind=None, **values):
+    """One row of the grouped statement, for the sets in :data:`DIMENSIONS`."""
+    grouped = frozenset(name for name, value in
+                        (("region", region), ("year", year), ("kind", kind))
+                        if value is not None)
+    row = {"region": region, "year": year, "kind": kind,
+           engine.GROUPING_MASK: engine.grouping_mask(DIMENSIONS, grouped)}
+    row.update(values)
+    return row
+
+
+# --------------------------------------------------------------------------
+# Grouping sets
+# --------------------------------------------------------------------------
+
+def test_a_report_reads_its_detail_and_summary_sets():
+    assert engine.grouping_sets(PROVIDER, STATISTICS) == [
+        frozenset({"region", "year"}), frozenset({"region"})]
+
+
+def test_a_share_adds_the_sets_its_denominators_are_in():
+    assert engine.grouping_sets(PROVIDER, KINDS) == [
+        frozenset({"year", "kind"}), frozenset({"kind"}), frozenset({"year"}),
+        frozenset()]
+
+
+def test_the_mask_sets_a_bit_for_each_collapsed_dimension_leftmost_highest():
+    assert engine.grouping_mask(DIMENSIONS, frozenset(DIMENSIONS)) == 0
+    assert engine.grouping_mask(DIMENSIONS, frozenset({"region", "year"})) == 1
+    assert engine.grouping_mask(DIMENSIONS, frozenset({"year", "kind"})) == 4
+    assert engine.grouping_mask(DIMENSIONS, frozenset()) == 7
+
+
+def test_every_report_is_one_statement_grouped_by_grouping_sets():
+    sql = str(engine.grouped_query(PROVIDER, [STATISTICS, KINDS]).compile(
+        dialect=postgresql.dialect()))
+    assert sql.count("SELECT") == 2  # the grouped pass and its source
+    assert "GROUPING SETS((fires.region, fires.year), (fires.region), " \
+           "(fires.year, fires.kind), (fires.kind), (fires.year), ())" in sql
+    assert "grouping(fires.region, fires.year, fires.kind)" in sql
+
+
+def test_a_report_scope_filters_only_its_own_measures():
+    sql = str(engine.grouped_query(PROVIDER, [STATISTICS, KINDS]).compile(
+        dialect=postgresql.dialect()))
+    assert "count(*) FILTER (WHERE fires.region IS NOT NULL) AS statistics__fires" in sql
+    assert "count(*) AS kinds__fires" in sql
+
+
+def test_the_pass_groups_only_on_the_dimensions_the_reports_use():
+    sql = str(engine.grouped_query(PROVIDER, [STATISTICS]).compile(
+        dialect=postgresql.dialect()))
+    assert "grouping(fires.region, fires.year)" in sql
+    assert "kinds__" not in sql
+
+
+# --------------------------------------------------------------------------
+# Assembling a report
+# --------------------------------------------------------------------------
+
+def test_summary_rows_follow_their_group_and_a_group_of_one_has_none():
+    results = [
+        result("North", 2020, statistics__fires=2, statistics__total=3.0),
+        result("North", 2021, statistics__fires=1, statistics__total=4.0),
+        result("South", 2020, statistics__fires=1, statistics__total=1.0),
+        result("North", statistics__fires=3, statistics__total=7.0),
+        result("South", statistics__fires=1, statistics__total=1.0),
+    ]
+    rows = engine.assemble(PROVIDER, STATISTICS, DIMENSIONS, results)
+    assert [(row.keys["region"], row.keys["year"], row.is_total) for row in rows] == [
+        ("North", 2020, False), ("North", 2021, False), ("North", None, True),
+        ("South", 2020, False)]
+
+
+def test_a_row_the_report_filter_emptied_is_dropped():
+    results = [result(None, 2020, kinds__fires=0),
+               result(None, 2020, "grass", kinds__fires=0)]
+    rows = engine.assemble(PROVIDER, KINDS, DIMENSIONS, results)
+    assert rows == []
+
+
+def test_a_share_is_of_the_row_with_its_dimension_collapsed():
+    results = [
+        result(year=2020, kind="grass", kinds__fires=3),
+        result(year=2020, kind="forest", kinds__fires=1),
+        result(year=2020, kinds__fires=4),
+    ]
+    rows = engine.assemble(PROVIDER, KINDS, DIMENSIONS, results)
+    shares = {row.keys["kind"]: row.values["fires_percent"] for row in rows}
+    assert shares == {"grass": pytest.approx(75.0), "forest": pytest.approx(25.0)}
+
+
+def test_a_report_of_one_year_has_no_summary_block():
+    results = [
+        result(year=2020, kind="grass", kinds__fires=3),
+        result(kind="grass", kinds__fires=3),
+        result(year=2020, kinds__fires=3),
+        result(kinds__fires=3),
+    ]
+    rows = engine.assemble(PROVIDER, KINDS, DIMENSIONS, results)
+    assert [row.is_total for row in rows] == [False]
+
+
+def test_cells_print_totals_labels_and_separators():
+    row = engine.ReportRow(keys={"region": "North", "year": None},
+                           values={"fires": 12345, "total": 1234.5}, is_total=True)
+    assert engine.cells(PROVIDER, STATISTICS, row, separators=False) == [
+        "North", "Total", "12345", "1234.50"]
+    assert engine.cells(PROVIDER, STATISTICS, row, separators=True) == [
+        "North", "Total", "12,345", "1,234.50"]
+
+
+def world_results():
+    """Two regions, the second first in the database's collation, over two years."""
+    rows = [
+        result("Éire", 2020, world__fires=1, world__total=1.0),
+        result("Éire", 2021, world__fires=2, world__total=4.0),
+        result("Eire", 2021, world__fires=1, world__total=2.0),
+        result("Éire", world__fires=3, world__total=5.0),
+        result("Eire", world__fires=1, world__total=2.0),
+        result(year=2020, world__fires=1, world__total=1.0),
+        result(year=2021, world__fires=3, world__total=6.0),
+        result(world__fires=4, world__total=7.0),
+    ]
+    for row in rows:
+        row["region__rank"] = {"Eire": 1, "Éire": 2}.get(row["region"])
+    return rows
+
+
+def test_the_block_comes_first_and_years_are_newest_first():
+    rows = engine.assemble(WORLDWIDE, WORLD, DIMENSIONS, world_results())
+    assert [(row.keys["region"], row.keys["year"], row.is_total) for row in rows] == [
+        (None, 2021, True), (None, 2020, True), (None, None, True),
+        ("Eire", 2021, False), ("Eire", None, True),
+        ("Éire", 2021, False), ("Éire", 2020, False), ("Éire", None, True)]
+
+
+def test_the_block_is_read_from_sets_of_its_own():
+    assert engine.grouping_sets(WORLDWIDE, WORLD) == [
+        frozenset({"region", "year"}), frozenset({"region"}), frozenset({"year"}),
+        frozenset()]
+
+
+def test_a_collated_dimension_is_ranked_in_the_grouped_statement():
+    sql = str(engine.grouped_query(WORLDWIDE, [WORLD]).compile(
+        dialect=postgresql.dialect()))
+    assert "dense_rank() OVER (ORDER BY fires.region) AS region__rank" in sql
+
+
+def test_a_share_of_a_measure_divides_within_the_row():
+    rows = engine.assemble(WORLDWIDE, WORLD, DIMENSIONS, world_results())
+    assert [row.values["total_percent"] for row in rows][:3] == [
+        pytest.approx(200.0), pytest.approx(100.0), pytest.approx(175.0)]
+
+
+def test_a_collapsed_dimension_prints_its_own_total_label():
+    row = engine.ReportRow(keys={"region": None, "year": None},
+                           values={"fires": 4, "total": 7.0, "total_percent": None},
+                           is_total=True)
+    assert engine.cells(WORLDWIDE, WORLD, row, separators=False)[:2] == [
+        "World", "Total"]
+
+
+# --------------------------------------------------------------------------
+# Registering
+# --------------------------------------------------------------------------
+
+def test_a_report_naming_an_unknown_measure_is_refused():
+    broken = engine.ReportDefinition(name="broken", title="Broken", rows=("year",),
+                                     columns=("hectares",))
+    with pytest.raises(ValueError, match="hectares"):
+        engine.register(engine.Provider(
+            name="broken", source=source, dimensions=PROVIDER.dimensions,
+            measures=PROVIDER.measures, reports=(broken,)))
+    assert "broken" not in engine.REGISTRY
+
+
+def test_an_unknown_report_is_refused_by_name():
+    with pytest.raises(ValueError, match="statistics, kinds"):
+        PROVIDER.report("causes")
+
+
+def test_a_share_needs_exactly_one_denominator():
+    broken = engine.Share("broken", "Broken (%)", "fires", over="kind", of="total")
+    with pytest.raises(ValueError, match="exactly one"):
+        engine.register(engine.Provider(
+            name="broken", source=source, dimensions=PROVIDER.dimensions,
+            measures=PROVIDER.measures, shares=(broken,), reports=(KINDS,)))
+
+
+def test_an_application_run_with_the_described_options_is_covered():
+    described = engine.ReportDefinition(
+        name="statistics", title="Statistics", rows=("region",), columns=("fires",),
+        options={"surface": "forest", "min_area": None})
+    assert engine.covers(described, argparse.Namespace(surface="forest", min_area=None,
+                                                       csv="a.csv"))
+    assert not engine.covers(described, argparse.Namespace(surface="total",
+                                                           min_area=None))
+    assert not engine.covers(described, argparse.Namespace(surface="forest",
+                                                           min_area=5.0))
+    # An option the application does not have cannot have been changed.
+    assert engine.covers(described, argparse.Namespace(surface="forest"))
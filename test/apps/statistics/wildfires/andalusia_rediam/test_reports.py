@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the REDIAM report as the shared report engine computes it.
+
+Over a fixture with bound and unbound fires, a year with no binding at all and
+published hectares that are not the perimeter's, the rows
+:mod:`src.apps.statistics.run_reports` writes are the rows
+:mod:`~src.apps.statistics.wildfires.andalusia_rediam.wildfire_statistics` writes,
+cell for cell.
+"""
+
+import csv
+import datetime
+import logging
+
+import pytest
+
+from shapely.geometry import MultiPolygon
+from shapely.geometry import box
+
+from src.apps.statistics import engine
+from src.apps.statistics import run_reports
+from src.apps.statistics.wildfires.andalusia_rediam import reports
+from src.apps.statistics.wildfires.andalusia_rediam import wildfire_statistics
+from src.data_model.data_provider import DataProvider
+from src.providers import andalusia_rediam
+from src.providers import spain_egif
+from src.providers.andalusia_rediam.wildfire import MATCH_CODE
+from src.providers.andalusia_rediam.wildfire import MATCH_DATE_PROVINCE_NAME
+from src.providers.andalusia_rediam.wildfire import MATCH_METHOD_CONFIDENCE
+from src.providers.andalusia_rediam.wildfire import RediamWildfire
+from src.providers.spain_egif.wildfire import EgifWildfire
+
+logger = logging.getLogger("test-rediam-reports")
+
+UTC = datetime.timezone.utc
+
+#: (code, year, match method, perimeter, published hectares). 2025 is bound to
+#: nothing, as on the published data.
+FIRES = [
+    ("2022040091", 2022, MATCH_CODE, box(-2.50, 37.00, -2.40, 37.10), (10.0, 20.0, 5.0)),
+    ("2022040092", 2022, MATCH_DATE_PROVINCE_NAME,
+     box(-2.20, 37.20, -1.80, 37.60), (100.0, 200.0, 50.0)),
+    ("2022040093", 2022, None, box(-2.60, 36.90, -2.55, 36.95), (1.0, 2.0, 0.0)),
+    ("2012110044", 2012, MATCH_CODE, box(-5.60, 36.10, -5.59, 36.11), (0.5, 1.0, 0.0)),
+    ("2025040059", 2025, None, box(-3.00, 37.00, -2.95, 37.05), (2.0, 3.0, 1.0)),
+]
+
+
+@pytest.fixture
+def populated(db_session):
+    rediam = DataProvider(name=andalusia_rediam.PROVIDER_NAME,
+                          product=andalusia_rediam.PROVIDER_PRODUCT,
+                          full_name=andalusia_rediam.PROVIDER_FULL_NAME,
+                          url=andalusia_rediam.PROVIDER_URL)
+    egif = DataProvider(name=spain_egif.PROVIDER_NAME,
+                        product=spain_egif.PROVIDER_PRODUCT,
+                        full_name=spain_egif.PROVIDER_FULL_NAME)
+    db_session.add_all([rediam, egif])
+    db_session.flush()
+
+    for code, year, method, geometry, (wooded, scrub, grassland) in FIRES:
+        fire_date = datetime.date(year, 8, 1)
+        start = datetime.datetime(year, 8, 1, tzinfo=UTC)
+        egif_wildfire_id = None
+        if method is not None:
+            parte = EgifWildfire(
+                data_provider_id=egif.id, report_number=code, campaign=year,
+                province_ine_code=code[4:6], municipality_name="DALIAS",
+                start_date_time=start, time_zone=spain_egif.DEFAULT_TIME_ZONE)
+            db_session.add(parte)
+            db_session.flush()
+            egif_wildfire_id = parte.id
+        db_session.add(RediamWildfire(
+            data_provider_id=rediam.id, source_layer="PERIMETROS_COR_2008_2025",
+            code=code, fire_date=fire_date, year=year, municipality_name="DALIAS",
+            province_name="Almería", part_count=1,
+            area_ha_wooded=wooded, area_ha_scrub=scrub, area_ha_grassland=grassland,
+            start_date_time=start, time_zone=andalusia_rediam.DEFAULT_TIME_ZONE,
+            perimeter=f"SRID=4326;{MultiPolygon([geometry]).wkt}",
+            perimeter_etrs89_utm30n=None,
+            egif_wildfire_id=egif_wildfire_id,
+            match_method=method,
+            match_confidence=None if method is None else MATCH_METHOD_CONFIDENCE[method],
+            matched_at=None if method is None
+            else datetime.datetime(2026, 1, 1, tzinfo=UTC),
+        ))
+    db_session.commit()
+    return db_session
+
+
+def cells(rows):
+    report = reports.PROVIDER.report("statistics")
+    return [engine.cells(reports.PROVIDER, report, row, separators=False)
+            for row in rows]
+
+
+@pytest.mark.parametrize("year", [None, 2022, 2025])
+def test_the_report_matches_the_application(populated, year):
+    computed = engine.compute_one(populated, reports.PROVIDER, "statistics", year, logger)
+    expected = wildfire_statistics.compute(populated, year, logger)
+    assert cells(computed) == [list(row.values) for row in expected]
+
+
+def test_the_runner_writes_the_report(populated, tmp_path):
+    args = run_reports.parse_arguments(
+        ["--provider", reports.PROVIDER_NAME, "--output-dir", str(tmp_path), "--csv"])
+    run_reports.run(args, populated.get_bind(), logger)
+
+    with (tmp_path / "andalusia_rediam-statistics.csv").open(encoding="utf-8") as handle:
+        assert next(csv.reader(handle)) == list(wildfire_statistics.COLUMNS)
+
+
+def test_the_application_run_by_default_is_the_engines_report(populated, tmp_path):
+    rows = wildfire_statistics.report(wildfire_statistics.parse_arguments(
+        ["--csv", str(tmp_path / "statistics.csv"), "--no-cache"]),
+        populated.get_bind(), logger)
+
+    assert all(isinstance(row, engine.ReportRow) for row in rows)
+    with (tmp_path / "statistics.csv").open(encoding="utf-8") as handle:
+        assert list(csv.reader(handle))[1:] == cells(rows)
+
+
+def test_the_published_hectares_are_the_applications_own(populated, tmp_path):
+    rows = wildfire_statistics.report(wildfire_statistics.parse_arguments(
+        ["--surface", "published", "--csv", str(tmp_path / "published.csv"),
+         "--no-cache"]),
+        populated.get_bind(), logger)
+    assert all(isinstance(row, wildfire_statistics.Row) for row in rows)
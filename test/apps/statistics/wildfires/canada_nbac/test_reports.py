@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for NBAC's reports as the shared report engine computes them.
+
+Over a fixture with a prescribed burn, an undated fire, undetermined causes and a fire
+with no perimeter, the rows :mod:`src.apps.statistics.run_reports` writes are the rows
+:mod:`~src.apps.statistics.wildfires.canada_nbac.wildfire_statistics` and
+:mod:`~src.apps.statistics.wildfires.canada_nbac.wildfire_causes` write, cell for
+cell — from one statement instead of one per year per report.
+"""
+
+import csv
+import datetime
+import logging
+
+import pytest
+
+from src.apps.statistics import engine
+from src.apps.statistics import run_reports
+from src.apps.statistics.wildfires.canada_nbac import reports
+from src.apps.statistics.wildfires.canada_nbac import wildfire_causes
+from src.apps.statistics.wildfires.canada_nbac import wildfire_statistics
+from src.data_model.data_provider import DataProvider
+from src.providers import canada_nbac
+from src.providers.canada_nbac.wildfire import NbacWildfire
+
+logger = logging.getLogger("test-nbac-reports")
+
+UTC = datetime.timezone.utc
+
+#: (year, cause, published hectares, dated, has a perimeter, prescribed).
+FIRES = [
+    (2023, canada_nbac.CAUSE_NATURAL, 1000.0, True, True, False),
+    (2023, canada_nbac.CAUSE_HUMAN, 300.0, True, True, False),
+    (2023, canada_nbac.CAUSE_HUMAN, 50.0, True, True, True),
+    # Counted by cause and not measured: it has no perimeter.
+    (2023, canada_nbac.CAUSE_NATURAL, 200.0, True, False, False),
+    (1977, canada_nbac.CAUSE_NATURAL, 5000.0, True, True, False),
+    (1977, canada_nbac.CAUSE_UNDETERMINED, 700.0, False, True, False),
+    # A year with no cause determined at all, and so no percentages.
+    (1980, canada_nbac.CAUSE_UNDETERMINED, 400.0, False, True, False),
+]
+
+
+@pytest.fixture
+def populated(db_session):
+    provider = DataProvider(name=canada_nbac.PROVIDER_NAME,
+                            product=canada_nbac.PROVIDER_PRODUCT,
+                            full_name=canada_nbac.PROVIDER_FULL_NAME,
+                            url=canada_nbac.PROVIDER_URL)
+    db_session.add(provider)
+    db_session.flush()
+
+    for index, (year, cause, hectares, dated, measured, prescribed) in enumerate(FIRES):
+        west = -114 + index * 0.1
+        db_session.add(NbacWildfire(
+            data_provider=provider, gid=f"{year}_{index}", nfireid=index + 1, year=year,
+            start_date_time=datetime.datetime(year, 7, 1, tzinfo=UTC),
+            time_zone=canada_nbac.DEFAULT_TIME_ZONE,
+            perimeter=(f"SRID=4326;MULTIPOLYGON((({west} 55, {west + 0.05 * (index + 1)} "
+                       f"55, {west + 0.05 * (index + 1)} 55.1, {west} 55.1, {west} 55)))"
+                       if measured else None),
+            part_count=1, crosses_admin=False, admin_name="AB",
+            fire_cause=cause,
+            date_source=canada_nbac.SOURCE_AGENCY if dated else canada_nbac.SOURCE_YEAR,
+            date_time_precision=(canada_nbac.PRECISION_DAY if dated
+                                 else canada_nbac.PRECISION_YEAR),
+            area_ha_polygon=hectares, area_ha_adjusted=hectares,
+            area_adjusted=False, prescribed=prescribed,
+        ))
+    db_session.commit()
+    return db_session
+
+
+def cells(name, rows):
+    report = reports.PROVIDER.report(name)
+    return [engine.cells(reports.PROVIDER, report, row, separators=False)
+            for row in rows]
+
+
+@pytest.mark.parametrize("year", [None, 2023])
+def test_the_statistics_report_matches_the_application(populated, year):
+    computed = engine.compute(populated, reports.PROVIDER, ["statistics"], year, logger)
+    expected = wildfire_statistics.compute(populated, year, logger)
+    assert cells("statistics", computed["statistics"]) == [list(row.values)
+                                                           for row in expected]
+
+
+@pytest.mark.parametrize("year", [None, 1980])
+def test_the_causes_report_matches_the_application(populated, year):
+    computed = engine.compute(populated, reports.PROVIDER, ["causes"], year, logger)
+    expected = wildfire_causes.compute(populated, year, logger)
+    assert cells("causes", computed["causes"]) == [list(row.values) for row in expected]
+
+
+def test_the_fire_without_a_perimeter_is_only_in_the_causes(populated):
+    computed = engine.compute(populated, reports.PROVIDER, None, 2023, logger)
+    assert [row.values["fires"] for row in computed["statistics"]] == [2, 2]
+    assert [row.values["fires"] for row in computed["causes"]] == [3, 3]
+
+
+def test_the_runner_writes_one_file_per_report(populated, tmp_path):
+    args = run_reports.parse_arguments(
+        ["--provider", reports.PROVIDER_NAME, "--output-dir", str(tmp_path), "--csv"])
+    run_reports.run(args, populated.get_bind(), logger)
+
+    with (tmp_path / "canada_nbac-statistics.csv").open(encoding="utf-8") as handle:
+        assert next(csv.reader(handle)) == list(wildfire_statistics.COLUMNS)
+    with (tmp_path / "canada_nbac-causes.csv").open(encoding="utf-8") as handle:
+        assert next(csv.reader(handle)) == list(wildfire_causes.columns())
+
+
+def test_the_applications_run_by_default_are_the_engines_reports(populated, tmp_path):
+    bind = populated.get_bind()
+    statistics = wildfire_statistics.report(wildfire_statistics.parse_arguments(
+        ["--csv", str(tmp_path / "statistics.csv"), "--no-cache"]), bind, logger)
+    causes = wildfire_causes.report(wildfire_causes.parse_arguments(
+        ["--csv", str(tmp_path / "causes.csv")]), bind, logger)
+
+    assert all(isinstance(row, engine.ReportRow) for row in statistics + causes)
+    with (tmp_path / "statistics.csv").open(encoding="utf-8") as handle:
+        assert list(csv.reader(handle))[1:] == cells("statistics", statistics)
+    with (tmp_path / "causes.csv").open(encoding="utf-8") as handle:
+        assert list(csv.reader(handle))[1:] == cells("causes", causes)
+
+
+def test_an_option_the_engine_does_not_have_is_the_applications_own(populated, tmp_path):
+    rows = wildfire_statistics.report(wildfire_statistics.parse_arguments(
+        ["--surface", "published", "--csv", str(tmp_path / "published.csv"),
+         "--no-cache"]), populated.get_bind(), logger)
+    assert all(isinstance(row, wildfire_statistics.Row) for row in rows)
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for NFDB's reports as the shared report engine computes them.
+
+Over a fixture with a fire over the American border, one in the sea, one that reported
+no size, a declared prescribed burn and an ``U`` cause, the rows
+:mod:`src.apps.statistics.run_reports` writes are the rows
+:mod:`~src.apps.statistics.wildfires.canada_nfdb.wildfire_statistics` and
+:mod:`~src.apps.statistics.wildfires.canada_nfdb.wildfire_causes` write, cell for cell
+— from one statement instead of one per year per report.
+"""
+
+import csv
+import datetime
+import logging
+
+import pytest
+
+from shapely.geometry import MultiPolygon
+from shapely.geometry import box
+
+from src.apps.imports import common as import_common
+from src.apps.statistics import engine
+from src.apps.statistics import run_reports
+from src.apps.statistics.wildfires.canada_nfdb import reports
+from src.apps.statistics.wildfires.canada_nfdb import wildfire_causes
+from src.apps.statistics.wildfires.canada_nfdb import wildfire_statistics
+from src.data_model.data_provider import DataProvider
+from src.providers import canada_nfdb
+from src.providers import ocha
+from src.providers.canada_nfdb.ignition import NfdbIgnition
+from src.providers.canada_nfdb.wildfire import NfdbWildfire
+from src.providers.ocha.admin_boundary import OchaAdminBoundary
+
+logger = logging.getLogger("test-nfdb-reports")
+
+UTC = datetime.timezone.utc
+
+COUNTRIES = [
+    ("CAN", "Canada", box(-141.0, 49.0, -52.0, 84.0)),
+    ("USA", "United States of America", box(-125.0, 25.0, -66.0, 48.5)),
+]
+
+#: (agency, year, cause, size_ha, prescribed, point). The ON fire is over the border
+#: and the NL one in the Atlantic; the 1990 BC fire with no size is in the causes
+#: report and not in the statistics one.
+FIRES = [
+    ("NT", 2023, canada_nfdb.CAUSE_NATURAL, 5000.0, False, (-114.0, 62.0)),
+    ("NT", 2023, canada_nfdb.CAUSE_HUMAN, 100.0, False, (-116.0, 62.0)),
+    ("NS", 2023, canada_nfdb.CAUSE_HUMAN, 0.0, False, (-63.0, 55.0)),
+    ("NS", 2023, canada_nfdb.CAUSE_HUMAN, 50.0, True, (-63.5, 55.0)),
+    ("ON", 2023, canada_nfdb.CAUSE_NATURAL, 700.0, False, (-85.0, 45.0)),
+    ("NL", 2023, canada_nfdb.CAUSE_NATURAL, 30.0, False, (-40.0, 60.0)),
+    ("BC", 1990, canada_nfdb.CAUSE_NATURAL, 900.0, False, (-122.0, 55.0)),
+    ("BC", 1990, canada_nfdb.CAUSE_UNKNOWN, 60.0, False, (-124.0, 55.0)),
+    ("BC", 1990, canada_nfdb.CAUSE_HUMAN, None, False, (-123.0, 55.0)),
+]
+
+
+@pytest.fixture
+def populated(db_session):
+    ocha_provider = DataProvider(name=ocha.PROVIDER_NAME, product=ocha.PROVIDER_PRODUCT,
+                                 full_name=ocha.PROVIDER_FULL_NAME, url=ocha.PROVIDER_URL)
+    nfdb_provider = DataProvider(name=canada_nfdb.PROVIDER_NAME,
+                                 product=canada_nfdb.PROVIDER_PRODUCT,
+                                 full_name=canada_nfdb.PROVIDER_FULL_NAME,
+                                 url=canada_nfdb.PROVIDER_URL)
+    db_session.add_all([ocha_provider, nfdb_provider])
+    db_session.flush()
+
+    for code, name, geometry in COUNTRIES:
+        db_session.add(OchaAdminBoundary(
+            data_provider_id=ocha_provider.id, source_id=code, level=0, name=name,
+            geometry=f"SRID=4326;{MultiPolygon([geometry]).wkt}",
+            source=code, iso_code=1, iso_2=code[:2], iso_3=code, iso_name=name,
+            iso_3_group=code, region1_code=1, region1_name="r1", region2_code=2,
+            region2_name="r2", region3_code=3, region3_name="r3", status_code=1,
+            status_name="State", valid_date=datetime.date(2025, 1, 1),
+            update_date=datetime.date(2025, 1, 1), land_source="osm", view="intl",
+        ))
+
+    for index, (agency, year, cause, size, prescribed, point) in enumerate(FIRES):
+        longitude, latitude = point
+        instant = datetime.datetime(year, 7, 1, tzinfo=UTC)
+        ignition = NfdbIgnition(
+            data_provider_id=nfdb_provider.id, nfdb_fire_id=f"{agency}-{index}",
+            year=year, src_agency=agency,
+            geometry=f"SRID=4326;POINT({longitude} {latitude})",
+            geometry_lambert=f"SRID=3978;POINT({index * 1000.0} {index * 1000.0})",
+            date_time=instant, time_zone=canada_nfdb.DEFAULT_TIME_ZONE,
+        )
+        db_session.add(ignition)
+        db_session.flush()
+        db_session.add(NfdbWildfire(
+            data_provider_id=nfdb_provider.id, nfdb_fire_id=f"{agency}-{index}",
+            agency_fire_id=str(index), src_agency=agency, year=year, size_ha=size,
+            fire_cause=cause, prescribed=prescribed,
+            report_date=datetime.date(year, 7, 1), start_date_time=instant,
+            time_zone=canada_nfdb.DEFAULT_TIME_ZONE, ignition_id=ignition.id,
+        ))
+    db_session.commit()
+    import_common.cut_admin_boundary_parts(db_session, logging.getLogger("test"))
+    db_session.commit()
+    return db_session
+
+
+def cells(name, rows):
+    report = reports.PROVIDER.report(name)
+    return [engine.cells(reports.PROVIDER, report, row, separators=False)
+            for row in rows]
+
+
+@pytest.mark.parametrize("year", [None, 2023])
+def test_the_statistics_report_matches_the_application(populated, year):
+    computed = engine.compute(populated, reports.PROVIDER, ["statistics"], year, logger)
+    expected = wildfire_statistics.compute(populated, year, logger)
+    assert cells("statistics", computed["statistics"]) == [list(row.values)
+                                                           for row in expected]
+
+
+@pytest.mark.parametrize("year", [None, 1990])
+def test_the_causes_report_matches_the_application(populated, year):
+    computed = engine.compute(populated, reports.PROVIDER, ["causes"], year, logger)
+    expected = wildfire_causes.compute(populated, year, logger)
+    assert cells("causes", computed["causes"]) == [list(row.values) for row in expected]
+
+
+def test_a_fire_with_no_size_is_counted_by_cause_only(populated):
+    computed = engine.compute(populated, reports.PROVIDER, None, 1990, logger)
+    statistics = [row for row in computed["statistics"] if not row.is_total]
+    causes = [row for row in computed["causes"] if not row.is_total]
+    assert [row.values["fires"] for row in statistics] == [2]
+    assert [row.values["fires"] for row in causes] == [3]
+
+
+def test_the_agencies_of_a_summary_row_are_not_added_up(populated):
+    rows = engine.compute_one(populated, reports.PROVIDER, "statistics", None, logger)
+    canada = [row for row in rows if row.keys["country"] == "Canada"]
+    assert [row.values["agencies"] for row in canada] == [2, 1, 3]
+
+
+def test_the_runner_writes_one_file_per_report(populated, tmp_path):
+    args = run_reports.parse_arguments(
+        ["--provider", reports.PROVIDER_NAME, "--output-dir", str(tmp_path), "--csv"])
+    run_reports.run(args, populated.get_bind(), logger)
+
+    with (tmp_path / "canada_nfdb-statistics.csv").open(encoding="utf-8") as handle:
+        assert next(csv.reader(handle)) == list(wildfire_statistics.COLUMNS)
+    with (tmp_path / "canada_nfdb-causes.csv").open(encoding="utf-8") as handle:
+        assert next(csv.reader(handle)) == list(wildfire_causes.columns())
+
+
+def test_the_applications_run_by_default_are_the_engines_reports(populated, tmp_path):
+    bind = populated.get_bind()
+    statistics = wildfire_statistics.report(wildfire_statistics.parse_arguments(
+        ["--csv", str(tmp_path / "statistics.csv"), "--no-cache"]), bind, logger)
+    causes = wildfire_causes.report(wildfire_causes.parse_arguments(
+        ["--csv", str(tmp_path / "causes.csv")]), bind, logger)
+
+    assert all(isinstance(row, engine.ReportRow) for row in statistics + causes)
+    with (tmp_path / "statistics.csv").open(encoding="utf-8") as handle:
+        assert list(csv.reader(handle))[1:] == cells("statistics", statistics)
+    with (tmp_path / "causes.csv").open(encoding="utf-8") as handle:
+        assert list(csv.reader(handle))[1:] == cells("causes", causes)
+
+
+def test_the_engine_run_still_logs_the_fires_it_could_not_place(populated, tmp_path,
+                                                                 caplog):
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        wildfire_statistics.report(wildfire_statistics.parse_arguments(
+            ["--csv", str(tmp_path / "statistics.csv"), "--no-cache"]),
+            populated.get_bind(), logger)
+    assert "1 have one that is inside no country" in caplog.text
+
+
+def test_an_option_the_engine_does_not_have_is_the_applications_own(populated, tmp_path):
+    rows = wildfire_causes.report(wildfire_causes.parse_arguments(
+        ["--agency", "NT", "--csv", str(tmp_path / "nt.csv")]),
+        populated.get_bind(), logger)
+    assert all(isinstance(row, wildfire_causes.Row) for row in rows)
@@ -27,6 +27,7 @@ import pytest
 from shapely.geometry import MultiPolygon
 from shapely.geometry import box
 
+from src.apps.imports import common as import_common
 from src.apps.statistics.wildfires.canada_nfdb import wildfire_causes as app
 from src.apps.statistics.wildfires.canada_nfdb import wildfire_statistics as statistics
 from src.data_model.data_provider import DataProvider
@@ -108,6 +109,8 @@ def populated(db_session):
             ignition_id=ignition.id,
         ))
     db_session.commit()
+    import_common.cut_admin_boundary_parts(db_session, logging.getLogger("test"))
+    db_session.commit()
     return db_session
 
 
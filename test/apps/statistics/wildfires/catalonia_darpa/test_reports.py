@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the DARPA report as the shared report engine computes it.
+
+Over a fixture with bound and unbound fires and a year with no binding at all, the
+rows :mod:`src.apps.statistics.run_reports` writes are the rows
+:mod:`~src.apps.statistics.wildfires.catalonia_darpa.wildfire_statistics` writes,
+cell for cell.
+"""
+
+import csv
+import datetime
+import logging
+
+import pytest
+
+from shapely.geometry import MultiPolygon
+from shapely.geometry import box
+
+from src.apps.statistics import engine
+from src.apps.statistics import run_reports
+from src.apps.statistics.wildfires.catalonia_darpa import reports
+from src.apps.statistics.wildfires.catalonia_darpa import wildfire_statistics
+from src.data_model.data_provider import DataProvider
+from src.providers import catalonia_darpa
+from src.providers import spain_egif
+from src.providers.catalonia_darpa.wildfire import MATCH_CODE
+from src.providers.catalonia_darpa.wildfire import MATCH_DATE_PROVINCE_NAME
+from src.providers.catalonia_darpa.wildfire import MATCH_METHOD_CONFIDENCE
+from src.providers.catalonia_darpa.wildfire import DarpaWildfire
+from src.providers.spain_egif.wildfire import EgifWildfire
+
+logger = logging.getLogger("test-darpa-reports")
+
+UTC = datetime.timezone.utc
+
+#: (code, year, match method, perimeter). 2024 is bound to nothing, as on the
+#: published data.
+FIRES = [
+    ("2013080287", 2013, MATCH_CODE, box(1.80, 41.80, 1.90, 41.90)),
+    ("2013080288", 2013, MATCH_DATE_PROVINCE_NAME, box(2.00, 41.60, 2.40, 42.00)),
+    ("2013080289", 2013, None, box(1.50, 41.50, 1.55, 41.55)),
+    ("2012080101", 2012, MATCH_CODE, box(0.80, 41.20, 0.81, 41.21)),
+    ("210_24N", 2024, None, box(1.00, 41.00, 1.05, 41.05)),
+]
+
+
+@pytest.fixture
+def populated(db_session):
+    darpa = DataProvider(name=catalonia_darpa.PROVIDER_NAME,
+                         product=catalonia_darpa.PROVIDER_PRODUCT,
+                         full_name=catalonia_darpa.PROVIDER_FULL_NAME,
+                         url=catalonia_darpa.PROVIDER_URL)
+    egif = DataProvider(name=spain_egif.PROVIDER_NAME,
+                        product=spain_egif.PROVIDER_PRODUCT,
+                        full_name=spain_egif.PROVIDER_FULL_NAME)
+    db_session.add_all([darpa, egif])
+    db_session.flush()
+
+    for code, year, method, geometry in FIRES:
+        fire_date = datetime.date(year, 7, 15)
+        start = datetime.datetime(year, 7, 15, tzinfo=UTC)
+        egif_wildfire_id = None
+        if method is not None:
+            parte = EgifWildfire(
+                data_provider_id=egif.id, report_number=f"{year:04d}08{code[-4:]}",
+                campaign=year, province_ine_code="08", municipality_name="Bellprat",
+                start_date_time=start, time_zone=spain_egif.DEFAULT_TIME_ZONE)
+            db_session.add(parte)
+            db_session.flush()
+            egif_wildfire_id = parte.id
+        db_session.add(DarpaWildfire(
+            data_provider_id=darpa.id,
+            source_layer=catalonia_darpa.source_layer_name(year),
+            code=code, fire_date=fire_date, year=year, municipality_name="Bellprat",
+            part_count=1, start_date_time=start,
+            time_zone=catalonia_darpa.DEFAULT_TIME_ZONE,
+            perimeter=f"SRID=4326;{MultiPolygon([geometry]).wkt}",
+            perimeter_etrs89_utm31n=None,
+            egif_wildfire_id=egif_wildfire_id,
+            match_method=method,
+            match_confidence=None if method is None else MATCH_METHOD_CONFIDENCE[method],
+            matched_at=None if method is None
+            else datetime.datetime(2026, 1, 1, tzinfo=UTC),
+        ))
+    db_session.commit()
+    return db_session
+
+
+def cells(rows):
+    report = reports.PROVIDER.report("statistics")
+    return [engine.cells(reports.PROVIDER, report, row, separators=False)
+            for row in rows]
+
+
+@pytest.mark.parametrize("year", [None, 2013, 2024])
+def test_the_report_matches_the_application(populated, year):
+    computed = engine.compute_one(populated, reports.PROVIDER, "statistics", year, logger)
+    expected = wildfire_statistics.compute(populated, year, logger)
+    assert cells(computed) == [list(row.values) for row in expected]
+
+
+def test_every_binding_counts_whatever_its_confidence(populated):
+    rows = engine.compute_one(populated, reports.PROVIDER, "statistics", 2013, logger)
+    assert [row.values["matched"] for row in rows] == [2, 2]
+
+
+def test_the_runner_writes_the_report(populated, tmp_path):
+    args = run_reports.parse_arguments(
+        ["--provider", reports.PROVIDER_NAME, "--output-dir", str(tmp_path), "--csv"])
+    run_reports.run(args, populated.get_bind(), logger)
+
+    with (tmp_path / "catalonia_darpa-statistics.csv").open(encoding="utf-8") as handle:
+        assert next(csv.reader(handle)) == list(wildfire_statistics.COLUMNS)
+
+
+def test_the_application_run_by_default_is_the_engines_report(populated, tmp_path):
+    rows = wildfire_statistics.report(wildfire_statistics.parse_arguments(
+        ["--csv", str(tmp_path / "statistics.csv"), "--no-cache"]),
+        populated.get_bind(), logger)
+
+    assert all(isinstance(row, engine.ReportRow) for row in rows)
+    with (tmp_path / "statistics.csv").open(encoding="utf-8") as handle:
+        assert list(csv.reader(handle))[1:] == cells(rows)
+
+
+def test_an_option_the_engine_does_not_have_is_the_applications_own(populated, tmp_path):
+    rows = wildfire_statistics.report(wildfire_statistics.parse_arguments(
+        ["--min-confidence", "0.9", "--csv", str(tmp_path / "codes.csv"), "--no-cache"]),
+        populated.get_bind(), logger)
+    assert all(isinstance(row, wildfire_statistics.Row) for row in rows)
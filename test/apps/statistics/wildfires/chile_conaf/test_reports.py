@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for CONAF's reports as the shared report engine computes them.
+
+The engine's reports are worth having only if they are the applications' reports,
+so what is pinned here is exactly that: over a fixture with two countries, a point in
+the Pacific, two seasons and every kind of cause, the rows
+:mod:`src.apps.statistics.run_reports` writes are the rows
+:mod:`~src.apps.statistics.wildfires.chile_conaf.wildfire_statistics` and
+:mod:`~src.apps.statistics.wildfires.chile_conaf.wildfire_causes` write, cell for
+cell — from one statement instead of one per season per report.
+"""
+
+import csv
+import datetime
+import logging
+
+import pytest
+
+from shapely.geometry import MultiPolygon
+from shapely.geometry import box
+from sqlalchemy import event
+
+from src.apps.imports import common as import_common
+from src.apps.statistics import engine
+from src.apps.statistics import run_reports
+from src.apps.statistics.wildfires.chile_conaf import reports
+from src.apps.statistics.wildfires.chile_conaf import wildfire_causes
+from src.apps.statistics.wildfires.chile_conaf import wildfire_statistics
+from src.data_model.data_provider import DataProvider
+from src.providers import chile_conaf
+from src.providers import ocha
+from src.providers.chile_conaf.fire_cause import ConafFireCause
+from src.providers.chile_conaf.ignition import ConafIgnition
+from src.providers.chile_conaf.wildfire import ConafWildfire
+from src.providers.ocha.admin_boundary import OchaAdminBoundary
+
+logger = logging.getLogger("test-conaf-reports")
+
+UTC = datetime.timezone.utc
+
+COUNTRIES = [
+    ("CHL", "Chile", box(-76.0, -56.0, -66.5, -17.0)),
+    ("ARG", "Argentina", box(-66.0, -56.0, -53.0, -21.0)),
+]
+
+#: ``(key, cause, cause_normalised, cause_en, specific_cause)``.
+CAUSES = [
+    ("intentional", "2.1. Incendios intencionales", "Incendios intencionales",
+     "Intentional fires", None),
+    ("electrical", "4.9 - Líneas eléctricas", "Líneas eléctricas", "Power lines", None),
+    ("unreconciled", "TRANSEONTES", None, None, None),
+    ("specific_only", None, None, None, "1.7.1. Uso de fuego por transeúntes"),
+]
+
+#: ``(season, cause key or None, longitude, latitude, dated, hectares or None)``.
+FIRES = [
+    (2016, "intentional", -73.05, -36.83, False, 55.0),
+    (2016, "intentional", -72.50, -37.20, False, 2.5),
+    (2016, "unreconciled", -72.40, -37.10, False, None),
+    # Over the cordillera: Argentina's only fire, in one season.
+    (2016, "specific_only", -65.00, -37.00, False, 3.0),
+    # In the Pacific: in no country, but it still has a cause.
+    (2016, None, -85.00, -37.00, False, 4.0),
+    (2023, "electrical", -73.10, -36.90, True, 5.0),
+    (2023, "intentional", -72.60, -37.30, True, 4.0),
+    (2023, None, -72.70, -37.40, False, 300.0),
+]
+
+
+@pytest.fixture
+def populated(db_session):
+    ocha_provider = DataProvider(name=ocha.PROVIDER_NAME, product=ocha.PROVIDER_PRODUCT,
+                                 full_name=ocha.PROVIDER_FULL_NAME, url=ocha.PROVIDER_URL)
+    conaf_provider = DataProvider(name=chile_conaf.PROVIDER_NAME,
+                                  product=chile_conaf.PROVIDER_PRODUCT,
+                                  full_name=chile_conaf.PROVIDER_FULL_NAME,
+                                  url=chile_conaf.PROVIDER_URL)
+    db_session.add_all([ocha_provider, conaf_provider])
+    db_session.flush()
+
+    for code, name, geometry in COUNTRIES:
+        db_session.add(OchaAdminBoundary(
+            data_provider_id=ocha_provider.id, source_id=code, level=0, name=name,
+            geometry=f"SRID=4326;{MultiPolygon([geometry]).wkt}",
+            source=code, iso_code=1, iso_2=code[:2], iso_3=code, iso_name=name,
+            iso_3_group=code, region1_code=1, region1_name="r1", region2_code=2,
+            region2_name="r2", region3_code=3, region3_name="r3", status_code=1,
+            status_name="State", valid_date=datetime.date(2025, 1, 1),
+            update_date=datetime.date(2025, 1, 1), land_source="osm", view="intl",
+        ))
+    db_session.flush()
+
+    causes = {}
+    for key, cause, normalised, english, specific in CAUSES:
+        row = ConafFireCause(cause=cause, cause_normalised=normalised, cause_en=english,
+                             specific_cause=specific)
+        db_session.add(row)
+        db_session.flush()
+        causes[key] = row.id
+
+    for index, (season, key, longitude, latitude, dated, hectares) in enumerate(FIRES):
+        instant = (datetime.datetime(season + 1, 1, 18, 15, 50, tzinfo=UTC) if dated
+                   else datetime.datetime(season, 7, 1, tzinfo=UTC))
+        ignition = ConafIgnition(
+            data_provider_id=conaf_provider.id, season_start_year=season,
+            number=index, region_code="08",
+            geometry=f"SRID=4326;POINT({longitude} {latitude})",
+            geometry_utm19s=f"SRID={chile_conaf.SOURCE_SRID_MAINLAND};"
+                            f"POINT({670000 + index * 1000} {5920000 + index * 1000})",
+            date_time=instant, time_zone=chile_conaf.DEFAULT_TIME_ZONE,
+        )
+        db_session.add(ignition)
+        db_session.flush()
+        db_session.add(ConafWildfire(
+            data_provider_id=conaf_provider.id, ignition_id=ignition.id,
+            season=wildfire_statistics.season_label(season), season_start_year=season,
+            number=index, name=f"FUEGO {index}", region_code="08",
+            cause_id=None if key is None else causes[key],
+            date_time_precision=(chile_conaf.PRECISION_MINUTE if dated
+                                 else chile_conaf.PRECISION_SEASON),
+            area_ha_total=hectares, area_totals_agree=hectares is not None,
+            start_date_time=instant, time_zone=chile_conaf.DEFAULT_TIME_ZONE,
+        ))
+    db_session.commit()
+    import_common.cut_admin_boundary_parts(db_session, logging.getLogger("test"))
+    db_session.commit()
+    return db_session
+
+
+def cells(name, rows):
+    report = reports.PROVIDER.report(name)
+    return [engine.cells(reports.PROVIDER, report, row, separators=False)
+            for row in rows]
+
+
+# --------------------------------------------------------------------------
+# The same rows as the applications
+# --------------------------------------------------------------------------
+
+@pytest.mark.parametrize("season", [None, 2016])
+def test_the_statistics_report_matches_the_application(populated, season):
+    computed = engine.compute(populated, reports.PROVIDER, ["statistics"], season,
+                              logger)
+    expected = wildfire_statistics.compute(populated, season,
+                                           wildfire_statistics.DEFAULT_SURFACE, logger)
+    assert cells("statistics", computed["statistics"]) == [row.values
+                                                           for row in expected]
+
+
+@pytest.mark.parametrize("season", [None, 2023])
+def test_the_causes_report_matches_the_application(populated, season):
+    computed = engine.compute(populated, reports.PROVIDER, ["causes"], season, logger)
+    expected = wildfire_causes.compute(populated, season, logger)
+    assert cells("causes", computed["causes"]) == [row.values for row in expected]
+
+
+def test_a_country_with_one_season_has_no_summary_row(populated):
+    rows = engine.compute(populated, reports.PROVIDER, ["statistics"], None,
+                          logger)["statistics"]
+    argentina = [row for row in rows if row.keys["country"] == "Argentina"]
+    assert [row.is_total for row in argentina] == [False]
+
+
+def test_the_fire_in_no_country_is_in_the_causes_and_not_the_statistics(populated):
+    computed = engine.compute(populated, reports.PROVIDER, None, 2016, logger)
+    assert sum(row.values["fires"] for row in computed["statistics"]) == 4
+    assert sum(row.values["fires"] for row in computed["causes"]) == 5
+
+
+# --------------------------------------------------------------------------
+# One pass
+# --------------------------------------------------------------------------
+
+def test_both_reports_are_one_statement(populated):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    connection = populated.connection()
+    event.listen(connection, "before_cursor_execute", record)
+    try:
+        engine.compute(populated, reports.PROVIDER, None, None, logger)
+    finally:
+        event.remove(connection, "before_cursor_execute", record)
+    assert len(statements) == 1
+    assert "GROUPING SETS" in statements[0]
+
+
+def test_the_runner_writes_one_file_per_report(populated, tmp_path):
+    args = run_reports.parse_arguments(
+        ["--provider", reports.PROVIDER_NAME, "--output-dir", str(tmp_path), "--csv"])
+    run_reports.run(args, populated.get_bind(), logger)
+
+    with (tmp_path / "chile_conaf-statistics.csv").open(encoding="utf-8") as handle:
+        assert next(csv.reader(handle)) == list(wildfire_statistics.COLUMNS)
+    with (tmp_path / "chile_conaf-causes.csv").open(encoding="utf-8") as handle:
+        assert next(csv.reader(handle)) == list(wildfire_causes.COLUMNS)
+
+
+def test_the_runner_refuses_a_report_the_provider_does_not_have():
+    with pytest.raises(SystemExit):
+        run_reports.parse_arguments(["--provider", reports.PROVIDER_NAME, "--report",
+                                     "classification", "--output-dir", "/tmp", "--csv"])
+
+
+def test_the_runner_requires_a_format():
+    with pytest.raises(SystemExit):
+        run_reports.parse_arguments(["--provider", reports.PROVIDER_NAME,
+                                     "--output-dir", "/tmp"])
+
+
+def test_the_applications_run_by_default_are_the_engines_reports(populated, tmp_path):
+    connection = ["--db-name", "x", "--db-user", "y"]
+    statistics = wildfire_statistics.report(wildfire_statistics.parse_arguments(
+        ["--csv", str(tmp_path / "statistics.csv"), "--no-cache", *connection]),
+        populated.get_bind(), logger)
+    causes = wildfire_causes.report(wildfire_causes.parse_arguments(
+        ["--csv", str(tmp_path / "causes.csv"), *connection]), populated.get_bind(), logger)
+
+    assert cells("statistics", statistics) == cells(
+        "statistics", engine.compute(populated, reports.PROVIDER, ["statistics"], None,
+                                     logger)["statistics"])
+    assert all(isinstance(row, engine.ReportRow) for row in statistics + causes)
+    with (tmp_path / "causes.csv").open(encoding="utf-8") as handle:
+        assert next(csv.reader(handle)) == list(wildfire_causes.COLUMNS)
+
+
+def test_an_option_the_engine_does_not_have_is_the_applications_own(populated, tmp_path):
+    rows = wildfire_statistics.report(wildfire_statistics.parse_arguments(
+        ["--csv", str(tmp_path / "dated.csv"), "--dated-only", "--no-cache",
+         "--db-name", "x", "--db-user", "y"]), populated.get_bind(), logger)
+    assert rows
+    assert all(isinstance(row, wildfire_statistics.Row) for row in rows)
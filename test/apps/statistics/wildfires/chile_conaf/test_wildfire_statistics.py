@@ -30,6 +30,7 @@ import pytest
 from shapely.geometry import MultiPolygon
 from shapely.geometry import box
 
+from src.apps.imports import common as import_common
 from src.apps.statistics.wildfires.chile_conaf import wildfire_statistics as app
 from src.data_model.data_provider import DataProvider
 from src.providers import chile_conaf
@@ -125,6 +126,8 @@ def populated(db_session):
             admin_boundary_id=boundaries["CHL"],
         ))
     db_session.commit()
+    import_common.cut_admin_boundary_parts(db_session, logging.getLogger("test"))
+    db_session.commit()
     return db_session
 
 
@@ -141,6 +144,14 @@ def find(rows, country, season):
     return matches[0]
 
 
+def fires(rows, country, season):
+    """A season's fires in the rows the default run returns, the report engine's."""
+    matches = [row for row in rows
+               if row.keys["country"] == country and row.keys["season"] == season]
+    assert len(matches) == 1, f"expected one row for {country}/{season}"
+    return matches[0].values["fires"]
+
+
 # --------------------------------------------------------------------------
 # The season
 # --------------------------------------------------------------------------
@@ -371,3 +382,42 @@ def test_the_scope_sentence_says_what_was_measured():
     assert "published start date" in sentence
     assert "5 ha" in sentence
     assert "Conaf" in sentence
+
+
+# --------------------------------------------------------------------------
+# The cache
+# --------------------------------------------------------------------------
+
+def test_a_rerun_is_cached_until_a_fire_is_imported(populated, tmp_path, caplog):
+    """The fingerprint is read from ``wildfire``, so no import can forget to move it."""
+    argv = ["--csv", str(tmp_path / "conaf.csv"), "--db-name", "x", "--db-user", "y"]
+    engine = populated.get_bind()
+
+    first = app.report(app.parse_arguments(argv), engine, logger)
+    with caplog.at_level(logging.INFO):
+        second = app.report(app.parse_arguments(argv), engine, logger)
+    assert second == first
+    assert "cached" in caplog.text
+
+    # One more Chilean fire, as an import would add it.
+    template = populated.query(ConafWildfire).filter_by(number=0).one()
+    ignition = populated.get(ConafIgnition, template.ignition_id)
+    copy = ConafIgnition(
+        data_provider_id=ignition.data_provider_id, season_start_year=2016, number=99,
+        region_code="08", geometry="SRID=4326;POINT(-73.0 -36.8)",
+        geometry_utm19s=f"SRID={chile_conaf.SOURCE_SRID_MAINLAND};POINT(700000 5950000)",
+        date_time=ignition.date_time, time_zone=chile_conaf.DEFAULT_TIME_ZONE)
+    populated.add(copy)
+    populated.flush()
+    populated.add(ConafWildfire(
+        data_provider_id=template.data_provider_id, ignition_id=copy.id,
+        season=template.season, season_start_year=2016, number=99, name="FUEGO 99",
+        region_code="08", date_time_precision=chile_conaf.PRECISION_SEASON,
+        area_ha_total=1.0, area_totals_agree=True, start_date_time=ignition.date_time,
+        time_zone=chile_conaf.DEFAULT_TIME_ZONE))
+    populated.commit()
+
+    third = app.report(app.parse_arguments(argv), engine, logger)
+    assert fires(third, "Chile", 2016) == fires(first, "Chile", 2016) + 1
+    assert app.report(app.parse_arguments(argv + ["--no-cache"]), engine,
+                      logger) == third
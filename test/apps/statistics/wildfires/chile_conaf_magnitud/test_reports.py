@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the CONAF *incendio de magnitud* report as the shared report engine
+computes it.
+
+Over a fixture with a bound and an unbound perimeter, one over the cordillera and a
+country with a single season, the rows :mod:`src.apps.statistics.run_reports` writes
+are the rows
+:mod:`~src.apps.statistics.wildfires.chile_conaf_magnitud.wildfire_statistics`
+writes, cell for cell.
+"""
+
+import csv
+import datetime
+import logging
+
+import pytest
+
+from shapely.geometry import MultiPolygon
+from shapely.geometry import box
+
+from src.apps.imports import common as import_common
+from src.apps.statistics import engine
+from src.apps.statistics import run_reports
+from src.apps.statistics.wildfires.chile_conaf_magnitud import reports
+from src.apps.statistics.wildfires.chile_conaf_magnitud import wildfire_statistics
+from src.data_model.data_provider import DataProvider
+from src.providers import chile_conaf
+from src.providers import chile_conaf_magnitud
+from src.providers import ocha
+from src.providers.chile_conaf.ignition import ConafIgnition
+from src.providers.chile_conaf.wildfire import ConafWildfire
+from src.providers.chile_conaf_magnitud.wildfire import ConafMagnitudWildfire
+from src.providers.ocha.admin_boundary import OchaAdminBoundary
+
+logger = logging.getLogger("test-conaf-magnitud-reports")
+
+UTC = datetime.timezone.utc
+
+COUNTRIES = [
+    ("CHL", "Chile", box(-76.0, -56.0, -66.5, -17.0)),
+    ("ARG", "Argentina", box(-66.0, -56.0, -53.0, -21.0)),
+]
+
+#: ``(season, west, south, side_degrees, mapped_ha, reported_ha or None)``. The third
+#: is over the cordillera, and Argentina's only season.
+PERIMETERS = [
+    (2016, -73.0, -36.0, 0.10, 1000.0, 950.0),
+    (2016, -72.5, -36.5, 0.05, 250.0, None),
+    (2016, -65.0, -37.0, 0.05, 300.0, 280.0),
+    (2023, -73.2, -37.2, 0.20, 4000.0, 3900.0),
+]
+
+
+def square(west, south, side):
+    return f"SRID=4326;{MultiPolygon([box(west, south, west + side, south + side)]).wkt}"
+
+
+def grid_square(index):
+    """A stand-in for the published grid copy, which nothing here reads."""
+    x, y = 670_000.0 + index * 20_000.0, 5_920_000.0
+    return (f"SRID={chile_conaf.SOURCE_SRID_MAINLAND};MULTIPOLYGON((({x} {y}, "
+            f"{x + 1000} {y}, {x + 1000} {y + 1000}, {x} {y + 1000}, {x} {y})))")
+
+
+@pytest.fixture
+def populated(db_session):
+    ocha_provider = DataProvider(name=ocha.PROVIDER_NAME, product=ocha.PROVIDER_PRODUCT,
+                                 full_name=ocha.PROVIDER_FULL_NAME, url=ocha.PROVIDER_URL)
+    report_provider = DataProvider(name=chile_conaf.PROVIDER_NAME,
+                                   product=chile_conaf.PROVIDER_PRODUCT,
+                                   full_name=chile_conaf.PROVIDER_FULL_NAME,
+                                   url=chile_conaf.PROVIDER_URL)
+    perimeter_provider = DataProvider(name=chile_conaf_magnitud.PROVIDER_NAME,
+                                      product=chile_conaf_magnitud.PROVIDER_PRODUCT,
+                                      full_name=chile_conaf.PROVIDER_FULL_NAME,
+                                      url=chile_conaf_magnitud.PROVIDER_URL)
+    db_session.add_all([ocha_provider, report_provider, perimeter_provider])
+    db_session.flush()
+
+    for code, name, geometry in COUNTRIES:
+        db_session.add(OchaAdminBoundary(
+            data_provider_id=ocha_provider.id, source_id=code, level=0, name=name,
+            geometry=f"SRID=4326;{MultiPolygon([geometry]).wkt}",
+            source=code, iso_code=1, iso_2=code[:2], iso_3=code, iso_name=name,
+            iso_3_group=code, region1_code=1, region1_name="r1", region2_code=2,
+            region2_name="r2", region3_code=3, region3_name="r3", status_code=1,
+            status_name="State", valid_date=datetime.date(2025, 1, 1),
+            update_date=datetime.date(2025, 1, 1), land_source="osm", view="intl",
+        ))
+
+    for index, (season, west, south, side, mapped, reported) in enumerate(PERIMETERS):
+        instant = datetime.datetime(season + 1, 1, 18, tzinfo=UTC)
+        report_id = None
+        if reported is not None:
+            ignition = ConafIgnition(
+                data_provider_id=report_provider.id, season_start_year=season,
+                number=index, geometry=f"SRID=4326;POINT({west} {south})",
+                geometry_utm19s=f"SRID={chile_conaf.SOURCE_SRID_MAINLAND};"
+                                f"POINT({670000 + index * 1000} 5920000)",
+                date_time=instant, time_zone=chile_conaf.DEFAULT_TIME_ZONE)
+            db_session.add(ignition)
+            db_session.flush()
+            report = ConafWildfire(
+                data_provider_id=report_provider.id, ignition_id=ignition.id,
+                season=wildfire_statistics.season_label(season),
+                season_start_year=season, number=index, name=f"FUEGO {index}",
+                date_time_precision=chile_conaf.PRECISION_DAY,
+                area_ha_total=reported, area_totals_agree=True,
+                start_date_time=instant, time_zone=chile_conaf.DEFAULT_TIME_ZONE)
+            db_session.add(report)
+            db_session.flush()
+            report_id = report.id
+
+        method = chile_conaf_magnitud.MATCH_NUMBER_REGION_NAME_SEASON
+        db_session.add(ConafMagnitudWildfire(
+            data_provider_id=perimeter_provider.id,
+            season=wildfire_statistics.season_label(season), season_start_year=season,
+            number=index, name=f"FUEGO {index}", region_code="08",
+            cause_published=None, area_ha_mapped=mapped, area_ha_published=mapped,
+            part_count=1, date_time_precision=chile_conaf.PRECISION_DAY,
+            perimeter=square(west, south, side),
+            perimeter_utm19s=grid_square(index),
+            perimeter_utm12s=None,
+            conaf_wildfire_id=report_id,
+            match_method=None if report_id is None else method,
+            match_confidence=(None if report_id is None
+                              else chile_conaf_magnitud.MATCH_METHOD_CONFIDENCE[method]),
+            matched_at=None if report_id is None else instant,
+            start_date_time=instant, time_zone=chile_conaf.DEFAULT_TIME_ZONE))
+    db_session.commit()
+    import_common.cut_admin_boundary_parts(db_session, logging.getLogger("test"))
+    db_session.commit()
+    return db_session
+
+
+def cells(rows):
+    report = reports.PROVIDER.report("statistics")
+    return [engine.cells(reports.PROVIDER, report, row, separators=False)
+            for row in rows]
+
+
+@pytest.mark.parametrize("season", [None, 2016, 2023])
+def test_the_report_matches_the_application(populated, season):
+    computed = engine.compute_one(populated, reports.PROVIDER, "statistics", season,
+                                  logger)
+    expected = wildfire_statistics.compute(populated, season,
+                                           wildfire_statistics.AREA_METHOD_PUBLISHED,
+                                           logger)
+    assert cells(computed) == [row.values for row in expected]
+
+
+def test_a_country_with_one_season_has_no_total(populated):
+    rows = engine.compute_one(populated, reports.PROVIDER, "statistics", None, logger)
+    assert [(row.keys["country"], row.keys["season"]) for row in rows] == [
+        ("Argentina", 2016), ("Chile", 2016), ("Chile", 2023), ("Chile", None)]
+
+
+def test_an_unbound_perimeter_adds_nothing_to_the_reported_area(populated):
+    rows = engine.compute_one(populated, reports.PROVIDER, "statistics", 2016, logger)
+    chile = next(row for row in rows if row.keys["country"] == "Chile")
+    assert (chile.values["fires"], chile.values["bound"]) == (2, 1)
+    assert chile.values["mapped"] == pytest.approx(1250.0)
+    assert chile.values["reported"] == pytest.approx(950.0)
+
+
+def test_the_runner_writes_the_report(populated, tmp_path):
+    args = run_reports.parse_arguments(
+        ["--provider", reports.PROVIDER_NAME, "--output-dir", str(tmp_path), "--csv"])
+    run_reports.run(args, populated.get_bind(), logger)
+
+    path = tmp_path / "chile_conaf_magnitud-statistics.csv"
+    with path.open(encoding="utf-8") as handle:
+        assert next(csv.reader(handle)) == list(wildfire_statistics.COLUMNS)
+
+
+def test_the_application_run_by_default_is_the_engines_report(populated, tmp_path):
+    rows = wildfire_statistics.report(wildfire_statistics.parse_arguments(
+        ["--csv", str(tmp_path / "statistics.csv"), "--no-cache"]),
+        populated.get_bind(), logger)
+
+    assert all(isinstance(row, engine.ReportRow) for row in rows)
+    with (tmp_path / "statistics.csv").open(encoding="utf-8") as handle:
+        assert list(csv.reader(handle))[1:] == cells(rows)
+
+
+def test_an_option_the_engine_does_not_have_is_the_applications_own(populated, tmp_path):
+    rows = wildfire_statistics.report(wildfire_statistics.parse_arguments(
+        ["--bound-only", "--csv", str(tmp_path / "bound.csv"), "--no-cache"]),
+        populated.get_bind(), logger)
+    assert all(isinstance(row, wildfire_statistics.Row) for row in rows)
@@ -28,6 +28,7 @@ import pytest
 from shapely.geometry import MultiPolygon
 from shapely.geometry import box
 
+from src.apps.imports import common as import_common
 from src.apps.statistics.wildfires.chile_conaf_magnitud import wildfire_statistics as app
 from src.data_model.data_provider import DataProvider
 from src.providers import chile_conaf
@@ -145,6 +146,8 @@ def populated(db_session):
             matched_at=None if report_id is None else instant,
             start_date_time=instant, time_zone=chile_conaf.DEFAULT_TIME_ZONE))
     db_session.commit()
+    import_common.cut_admin_boundary_parts(db_session, logging.getLogger("test"))
+    db_session.commit()
     return db_session
 
 
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the Global Fire Atlas's report as the shared report engine computes it.
+
+The rows :mod:`src.apps.statistics.run_reports` writes are the rows
+:mod:`~src.apps.statistics.wildfires.gfa.wildfire_statistics` writes with
+``--country-source reported``, cell for cell, including for a fire that ignited in
+Spain and burnt mostly in France: the report takes the country the import stored.
+"""
+
+import csv
+import datetime
+import logging
+
+import pytest
+
+from shapely.geometry import MultiPolygon
+from shapely.geometry import box
+
+from src.apps.statistics import engine
+from src.apps.statistics import run_reports
+from src.apps.statistics.wildfires.gfa import reports
+from src.apps.statistics.wildfires.gfa import wildfire_statistics as app
+from src.data_model.data_provider import DataProvider
+from src.providers import gfa
+from src.providers import ocha
+from src.providers.gfa.ignition import GfaIgnition
+from src.providers.gfa.wildfire import GfaWildfire
+from src.providers.ocha.admin_boundary import OchaAdminBoundary
+
+logger = logging.getLogger("test-gfa-reports")
+
+COUNTRIES = [
+    ("ESP", "Spain", box(-9, 36, 3, 44)),
+    ("FRA", "France", box(3, 42, 8, 51)),
+]
+
+#: (gfa_id, stored country, local start date, perimeter). The ignition point is the
+#: perimeter's south-west corner, so fire 4 ignites in Spain and burns into France.
+FIRES = [
+    ("1", "Spain", datetime.date(2021, 7, 1), box(0.0, 41.0, 0.1, 41.1)),
+    ("2", "Spain", datetime.date(2020, 6, 1), box(0.0, 40.0, 0.05, 40.05)),
+    ("3", "France", datetime.date(2021, 7, 15), box(4.0, 44.0, 4.2, 44.2)),
+    ("4", "Spain", datetime.date(2021, 8, 1), box(2.9, 43.0, 4.0, 43.5)),
+    ("5", None, datetime.date(2021, 5, 5), box(-30.0, 10.0, -29.9, 10.1)),
+]
+
+
+@pytest.fixture
+def populated(db_session):
+    ocha_provider = DataProvider(name=ocha.PROVIDER_NAME, product=ocha.PROVIDER_PRODUCT,
+                                 full_name=ocha.PROVIDER_FULL_NAME, url=ocha.PROVIDER_URL)
+    gfa_provider = DataProvider(name=gfa.PROVIDER_NAME, product=gfa.PROVIDER_PRODUCT,
+                                full_name=gfa.PROVIDER_FULL_NAME, url=gfa.PROVIDER_URL)
+    db_session.add_all([ocha_provider, gfa_provider])
+    db_session.flush()
+
+    boundaries = {}
+    for code, name, geometry in COUNTRIES:
+        boundary = OchaAdminBoundary(
+            data_provider_id=ocha_provider.id, source_id=code, level=0, name=name,
+            geometry=f"SRID=4326;{MultiPolygon([geometry]).wkt}",
+            source=code, iso_code=1, iso_2=code[:2], iso_3=code, iso_name=name,
+            iso_3_group=code, region1_code=1, region1_name="r1", region2_code=2,
+            region2_name="r2", region3_code=3, region3_name="r3", status_code=1,
+            status_name="State", valid_date=datetime.date(2025, 1, 1),
+            update_date=datetime.date(2025, 1, 1), land_source="osm", view="intl",
+        )
+        db_session.add(boundary)
+        db_session.flush()
+        boundaries[name] = boundary
+
+    for gfa_id, country, start, geometry in FIRES:
+        start_instant = datetime.datetime.combine(
+            start, datetime.time(0, 0), tzinfo=datetime.timezone.utc)
+        boundary_id = boundaries[country].id if country else None
+        ignition = GfaIgnition(
+            gfa_id=gfa_id, data_provider_id=gfa_provider.id,
+            geometry=f"SRID=4326;POINT({geometry.bounds[0]} {geometry.bounds[1]})",
+            date_time=start_instant, time_zone="UTC", admin_boundary_id=boundary_id,
+        )
+        db_session.add(ignition)
+        db_session.flush()
+        db_session.add(GfaWildfire(
+            gfa_id=gfa_id,
+            gfa_ignition_id=ignition.id,
+            data_provider_id=gfa_provider.id,
+            start_date_time=start_instant,
+            time_zone="UTC",
+            perimeter=f"SRID=4326;{MultiPolygon([geometry]).wkt}",
+            admin_boundary_id=boundary_id,
+        ))
+    db_session.commit()
+    return db_session
+
+
+def cells(rows):
+    report = reports.PROVIDER.report("statistics")
+    return [engine.cells(reports.PROVIDER, report, row, separators=False)
+            for row in rows]
+
+
+def values(row):
+    """A row of the application's, as its CSV writes it."""
+    return [row.country, row.year_label, str(row.fires),
+            f"{row.minimum:.2f}", f"{row.maximum:.2f}", f"{row.total:.2f}"]
+
+
+@pytest.mark.parametrize("year", [None, 2021])
+def test_the_report_matches_the_application(populated, year):
+    computed = engine.compute(populated, reports.PROVIDER, None, year, logger)
+    expected = app.compute(populated, None, year, logger,
+                           country_source=app.COUNTRY_SOURCE_REPORTED)
+    assert cells(computed["statistics"]) == [values(row) for row in expected]
+
+
+def test_a_fire_that_burnt_across_a_border_is_in_the_country_it_ignited_in(populated):
+    rows = engine.compute(populated, reports.PROVIDER, None, 2021,
+                          logger)["statistics"]
+    fires = {row.keys["country"]: row.values["fires"] for row in rows
+             if row.keys["year"] == 2021}
+    assert fires == {None: 3, "Spain": 2, "France": 1}
+
+
+def test_the_runner_writes_the_report(populated, tmp_path):
+    args = run_reports.parse_arguments(
+        ["--provider", reports.PROVIDER_NAME, "--output-dir", str(tmp_path), "--csv"])
+    run_reports.run(args, populated.get_bind(), logger)
+
+    with (tmp_path / "gfa-statistics.csv").open(encoding="utf-8") as handle:
+        assert next(csv.reader(handle)) == list(app.COLUMNS)
+
+
+def test_the_application_with_the_reported_country_is_the_engines_report(populated,
+                                                                          tmp_path):
+    rows = app.report(app.parse_arguments(
+        ["--country-source", "reported", "--csv", str(tmp_path / "gfa.csv"),
+         "--no-cache"]), populated.get_bind(), logger)
+
+    assert all(isinstance(row, engine.ReportRow) for row in rows)
+    with (tmp_path / "gfa.csv").open(encoding="utf-8") as handle:
+        written = list(csv.reader(handle))
+    assert written[0] == list(app.COLUMNS)
+    assert written[1:] == cells(rows)
+
+
+def test_equal_area_measures_are_the_applications_own(populated, tmp_path):
+    rows = app.report(app.parse_arguments(
+        ["--country-source", "reported", "--area-method", "equal-area", "--csv",
+         str(tmp_path / "equal-area.csv"), "--no-cache"]), populated.get_bind(), logger)
+    assert all(isinstance(row, app.Row) for row in rows)
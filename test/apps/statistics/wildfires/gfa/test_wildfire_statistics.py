@@ -30,6 +30,7 @@ from shapely.geometry import box
 from sqlalchemy import func
 from sqlalchemy import select
 
+from src.apps.imports import common as import_common
 from src.apps.statistics.wildfires.gfa import wildfire_statistics as app
 from src.data_model.data_provider import DataProvider
 from src.providers import gfa
@@ -134,6 +135,8 @@ def populated(db_session):
             admin_boundary_id=boundary_id,
         ))
     db_session.commit()
+    import_common.cut_admin_boundary_parts(db_session, logging.getLogger("test"))
+    db_session.commit()
     return db_session
 
 
@@ -182,6 +185,14 @@ def test_an_unknown_area_method_is_refused():
         app.burnt_area("web-mercator")
 
 
+def test_the_split_area_is_geodesic_only():
+    """The areas the importer keeps are geodesic; an equal-area split would be a lie."""
+    assert app.parse_arguments(["--split-area", "--csv", "out.csv"]).split_area
+    with pytest.raises(SystemExit):
+        app.parse_arguments(["--split-area", "--area-method", app.AREA_METHOD_EQUAL_AREA,
+                             "--csv", "out.csv"])
+
+
 # --------------------------------------------------------------------------
 # The statistics themselves
 # --------------------------------------------------------------------------
@@ -849,3 +860,39 @@ def test_the_countries_are_ordered_by_the_database(populated):
     # A name that is not a country in the database is kept rather than dropped.
     assert app.ordered_countries(populated, {"Spain", "Atlantis"}) == ["Spain", "Atlantis"]
     assert app.ordered_countries(populated, set()) == []
+
+
+# --------------------------------------------------------------------------
+# Reading from the yearly summary
+# --------------------------------------------------------------------------
+
+@pytest.fixture
+def summarised(populated):
+    """The fixture world with its yearly summary filled, as the importer fills it."""
+    provider_id = populated.scalar(
+        select(DataProvider.id).where(DataProvider.name == gfa.PROVIDER_NAME))
+    import_common.refresh_yearly_summary(populated, provider_id, [2019, 2020, 2021], logger)
+    populated.commit()
+    return populated
+
+
+def test_the_summary_gives_the_report_the_fires_give(summarised, monkeypatch):
+    expected_rows = rows_for(summarised, country_source=app.COUNTRY_SOURCE_REPORTED)
+    years = measured_years(monkeypatch)
+    read = app.compute(summarised, None, None, logger, app.AREA_METHOD_GEODESIC,
+                       app.COUNTRY_SOURCE_REPORTED, from_summary=True)
+
+    assert years == []
+    assert [(r.country, r.year, r.fires) for r in read] == \
+           [(r.country, r.year, r.fires) for r in expected_rows]
+    for one, other in zip(read, expected_rows):
+        assert (one.minimum, one.maximum, one.total) == pytest.approx(
+            (other.minimum, other.maximum, other.total))
+
+
+def test_the_summary_holds_no_equal_area_figures(summarised, monkeypatch):
+    """Projected areas are measured per run, so the fires are measured after all."""
+    years = measured_years(monkeypatch)
+    app.compute(summarised, None, 2021, logger, app.AREA_METHOD_EQUAL_AREA,
+                app.COUNTRY_SOURCE_REPORTED, from_summary=True)
+    assert years == [2021]
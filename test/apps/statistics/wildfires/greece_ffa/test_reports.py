@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the Greek Fire Service report as the shared report engine computes it.
+
+Over a fixture with a year that publishes no coordinate, years that do, and a false
+alarm, the rows :mod:`src.apps.statistics.run_reports` writes are the rows
+:mod:`~src.apps.statistics.wildfires.greece_ffa.wildfire_statistics` writes, cell for
+cell.
+"""
+
+import csv
+import datetime
+import logging
+
+import pytest
+
+from src.apps.statistics import engine
+from src.apps.statistics import run_reports
+from src.apps.statistics.wildfires.greece_ffa import reports
+from src.apps.statistics.wildfires.greece_ffa import wildfire_statistics
+from src.data_model.data_provider import DataProvider
+from src.providers import greece_ffa
+from src.providers.greece_ffa.ignition import GreeceFfaIgnition
+from src.providers.greece_ffa.wildfire import GreeceFfaWildfire
+
+logger = logging.getLogger("test-greece-reports")
+
+UTC = datetime.timezone.utc
+
+#: (year, forest, grassland, located, category). 2005 publishes no coordinate; the
+#: 2025 false alarm is in neither report.
+FIRES = [
+    (2005, 1.0, 0.5, False, None),
+    (2005, 100.0, 25.0, False, None),
+    (2021, 3.0, 0.0, True, None),
+    (2021, 300.0, 0.0, False, None),
+    (2025, 7.0, 0.0, True, greece_ffa.CATEGORY_SMALL),
+    (2025, 0.5, 0.5, True, greece_ffa.CATEGORY_FALSE_ALARM),
+]
+
+
+@pytest.fixture
+def populated(db_session):
+    provider = DataProvider(name=greece_ffa.PROVIDER_NAME,
+                            product=greece_ffa.PROVIDER_PRODUCT,
+                            full_name=greece_ffa.PROVIDER_FULL_NAME,
+                            url=greece_ffa.PROVIDER_URL)
+    db_session.add(provider)
+    db_session.flush()
+
+    for index, (year, forest, grassland, located, category) in enumerate(FIRES):
+        start = datetime.datetime(year, 7, 1, 12, 0, tzinfo=UTC)
+        ignition_id = None
+        if located:
+            ignition = GreeceFfaIgnition(
+                data_provider=provider, year=year,
+                geometry=f"SRID=4326;POINT(23.{index:02d} 38.{index:02d})",
+                date_time=start, time_zone=greece_ffa.DEFAULT_TIME_ZONE,
+            )
+            db_session.add(ignition)
+            db_session.flush()
+            ignition_id = ignition.id
+        db_session.add(GreeceFfaWildfire(
+            data_provider=provider, year=year, source_sheet=str(year),
+            start_date_time=start, time_zone=greece_ffa.DEFAULT_TIME_ZONE,
+            incident_category=category,
+            area_ha_forest=forest, area_ha_forest_land=0.0,
+            area_ha_grove=0.0, area_ha_grassland=grassland,
+            area_ha_reeds_marsh=0.0, area_ha_agricultural=0.0,
+            area_ha_crop_residue=0.0, area_ha_landfill=0.0,
+            ignition_id=ignition_id,
+        ))
+    db_session.commit()
+    return db_session
+
+
+def cells(rows):
+    report = reports.PROVIDER.report("statistics")
+    return [engine.cells(reports.PROVIDER, report, row, separators=False)
+            for row in rows]
+
+
+@pytest.mark.parametrize("year", [None, 2005, 2025])
+def test_the_report_matches_the_application(populated, year):
+    computed = engine.compute_one(populated, reports.PROVIDER, "statistics", year, logger)
+    expected = wildfire_statistics.compute(populated, year, logger)
+    assert cells(computed) == [list(row.values) for row in expected]
+
+
+def test_the_located_share_of_the_total_is_of_every_year(populated):
+    rows = engine.compute_one(populated, reports.PROVIDER, "statistics", None, logger)
+    total = rows[-1]
+    assert total.is_total
+    assert (total.values["fires"], total.values["located"]) == (5, 2)
+    assert total.values["located_percent"] == pytest.approx(40.0)
+
+
+def test_the_runner_writes_the_report(populated, tmp_path):
+    args = run_reports.parse_arguments(
+        ["--provider", reports.PROVIDER_NAME, "--output-dir", str(tmp_path), "--csv"])
+    run_reports.run(args, populated.get_bind(), logger)
+
+    with (tmp_path / "greece_ffa-statistics.csv").open(encoding="utf-8") as handle:
+        assert next(csv.reader(handle)) == list(wildfire_statistics.COLUMNS)
+
+
+def test_the_application_run_by_default_is_the_engines_report(populated, tmp_path):
+    rows = wildfire_statistics.report(wildfire_statistics.parse_arguments(
+        ["--csv", str(tmp_path / "statistics.csv"), "--no-cache"]),
+        populated.get_bind(), logger)
+
+    assert all(isinstance(row, engine.ReportRow) for row in rows)
+    with (tmp_path / "statistics.csv").open(encoding="utf-8") as handle:
+        assert list(csv.reader(handle))[1:] == cells(rows)
+
+
+def test_an_option_the_engine_does_not_have_is_the_applications_own(populated, tmp_path):
+    rows = wildfire_statistics.report(wildfire_statistics.parse_arguments(
+        ["--surface", "forest", "--csv", str(tmp_path / "forest.csv"), "--no-cache"]),
+        populated.get_bind(), logger)
+    assert all(isinstance(row, wildfire_statistics.Row) for row in rows)
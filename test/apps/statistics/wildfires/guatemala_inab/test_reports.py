@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the INAB report as the shared report engine computes it.
+
+Over the fires in ``conftest.py`` — a New Year fire, two false alarms, a ``NULL``
+status and a fire with no point — the rows :mod:`src.apps.statistics.run_reports`
+writes are the rows
+:mod:`~src.apps.statistics.wildfires.guatemala_inab.wildfire_statistics` writes, cell
+for cell, the three empty hectare cells included.
+"""
+
+import csv
+import logging
+
+import pytest
+
+from src.apps.statistics import engine
+from src.apps.statistics import run_reports
+from src.apps.statistics.wildfires.guatemala_inab import reports
+from src.apps.statistics.wildfires.guatemala_inab import wildfire_statistics
+
+logger = logging.getLogger("test-inab-reports")
+
+
+def cells(rows):
+    report = reports.PROVIDER.report("statistics")
+    return [engine.cells(reports.PROVIDER, report, row, separators=False)
+            for row in rows]
+
+
+@pytest.mark.parametrize("year", [None, 2024, 2025])
+def test_the_report_matches_the_application(fires, year):
+    computed = engine.compute_one(fires, reports.PROVIDER, "statistics", year, logger)
+    expected = wildfire_statistics.compute(fires, year, logger)
+    assert cells(computed) == [list(row.values) for row in expected]
+
+
+def test_every_hectare_cell_is_empty(fires):
+    for row in cells(engine.compute_one(fires, reports.PROVIDER, "statistics", None,
+                                        logger)):
+        assert row[3:6] == ["", "", ""]
+
+
+def test_the_runner_writes_the_report(fires, tmp_path):
+    args = run_reports.parse_arguments(
+        ["--provider", reports.PROVIDER_NAME, "--output-dir", str(tmp_path), "--csv"])
+    run_reports.run(args, fires.get_bind(), logger)
+
+    with (tmp_path / "guatemala_inab-statistics.csv").open(encoding="utf-8") as handle:
+        assert next(csv.reader(handle)) == list(wildfire_statistics.COLUMNS)
+
+
+def test_the_application_run_by_default_is_the_engines_report(fires, tmp_path):
+    rows = wildfire_statistics.report(wildfire_statistics.parse_arguments(
+        ["--csv", str(tmp_path / "statistics.csv"), "--no-cache"]),
+        fires.get_bind(), logger)
+
+    assert all(isinstance(row, engine.ReportRow) for row in rows)
+    with (tmp_path / "statistics.csv").open(encoding="utf-8") as handle:
+        assert list(csv.reader(handle))[1:] == cells(rows)
+
+
+def test_an_option_the_engine_does_not_have_is_the_applications_own(fires, tmp_path):
+    rows = wildfire_statistics.report(wildfire_statistics.parse_arguments(
+        ["--include-false-alarms", "--csv", str(tmp_path / "all.csv"), "--no-cache"]),
+        fires.get_bind(), logger)
+    assert all(isinstance(row, wildfire_statistics.Row) for row in rows)
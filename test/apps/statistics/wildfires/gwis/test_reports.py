@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for GWIS's report as the shared report engine computes it.
+
+Over a fixture with two countries that burnt, one that did not and a fire in the
+Atlantic, the rows :mod:`src.apps.statistics.run_reports` writes are the rows
+:mod:`~src.apps.statistics.wildfires.gwis.wildfire_statistics` writes with
+``--country-source reported``, cell for cell — the World block first, then the
+countries — from one statement instead of one per year.
+"""
+
+import csv
+import datetime
+import logging
+
+import pytest
+
+from shapely.geometry import MultiPolygon
+from shapely.geometry import box
+
+from src.apps.statistics import engine
+from src.apps.statistics import run_reports
+from src.apps.statistics.wildfires.gwis import reports
+from src.apps.statistics.wildfires.gwis import wildfire_statistics as app
+from src.data_model.data_provider import DataProvider
+from src.providers import ocha
+from src.providers.gwis.wildfire import GwisWildfire
+from src.providers.ocha.admin_boundary import OchaAdminBoundary
+
+logger = logging.getLogger("test-gwis-reports")
+
+COUNTRIES = [
+    ("ESP", "Spain", box(-9, 36, 3, 44)),
+    ("FRA", "France", box(3, 42, 8, 51)),
+    ("AND", "Andorra", box(1.4, 42.4, 1.8, 42.7)),
+]
+
+#: (gwis_id, country, local start date, perimeter); France burnt in one year only.
+FIRES = [
+    ("1", "Spain", datetime.date(2021, 7, 1), box(0.0, 41.0, 0.1, 41.1)),
+    ("2", "Spain", datetime.date(2021, 8, 1), box(0.5, 41.0, 0.9, 41.4)),
+    ("3", "Spain", datetime.date(2020, 6, 1), box(0.0, 40.0, 0.05, 40.05)),
+    ("4", "France", datetime.date(2021, 7, 15), box(4.0, 44.0, 4.2, 44.2)),
+    ("5", None, datetime.date(2021, 5, 5), box(-30.0, 10.0, -29.9, 10.1)),
+]
+
+
+@pytest.fixture
+def populated(db_session):
+    ocha_provider = DataProvider(name=ocha.PROVIDER_NAME, product=ocha.PROVIDER_PRODUCT,
+                                 full_name=ocha.PROVIDER_FULL_NAME, url=ocha.PROVIDER_URL)
+    gwis_provider = DataProvider(name="GWIS", product="Global Wildfire Database v3",
+                                 full_name="Global Wildfire Information System",
+                                 url="https://doi.pangaea.de/10.1594/PANGAEA.943975")
+    db_session.add_all([ocha_provider, gwis_provider])
+    db_session.flush()
+
+    boundaries = {}
+    for code, name, geometry in COUNTRIES:
+        boundary = OchaAdminBoundary(
+            data_provider_id=ocha_provider.id, source_id=code, level=0, name=name,
+            geometry=f"SRID=4326;{MultiPolygon([geometry]).wkt}",
+            source=code, iso_code=1, iso_2=code[:2], iso_3=code, iso_name=name,
+            iso_3_group=code, region1_code=1, region1_name="r1", region2_code=2,
+            region2_name="r2", region3_code=3, region3_name="r3", status_code=1,
+            status_name="State", valid_date=datetime.date(2025, 1, 1),
+            update_date=datetime.date(2025, 1, 1), land_source="osm", view="intl",
+        )
+        db_session.add(boundary)
+        db_session.flush()
+        boundaries[name] = boundary
+
+    for gwis_id, country, start, geometry in FIRES:
+        db_session.add(GwisWildfire(
+            gwis_id=gwis_id,
+            data_provider_id=gwis_provider.id,
+            start_date_time=datetime.datetime.combine(
+                start, datetime.time(0, 0), tzinfo=datetime.timezone.utc),
+            time_zone="UTC",
+            perimeter=f"SRID=4326;{MultiPolygon([geometry]).wkt}",
+            admin_boundary_id=boundaries[country].id if country else None,
+        ))
+    db_session.commit()
+    return db_session
+
+
+def cells(rows):
+    report = reports.PROVIDER.report("statistics")
+    return [engine.cells(reports.PROVIDER, report, row, separators=False)
+            for row in rows]
+
+
+@pytest.mark.parametrize("year", [None, 2021])
+def test_the_report_matches_the_application(populated, year):
+    computed = engine.compute(populated, reports.PROVIDER, None, year, logger)
+    expected = app.compute(populated, None, year, logger,
+                           country_source=app.COUNTRY_SOURCE_REPORTED)
+    assert cells(computed["statistics"]) == [app.values(row) for row in expected]
+
+
+def test_the_world_block_comes_first_and_every_country_has_a_total(populated):
+    rows = engine.compute(populated, reports.PROVIDER, None, None,
+                          logger)["statistics"]
+    assert [cell[:2] for cell in cells(rows)] == [
+        ["World", "2021"], ["World", "2020"], ["World", "Total"],
+        ["France", "2021"], ["France", "Total"],
+        ["Spain", "2021"], ["Spain", "2020"], ["Spain", "Total"]]
+    assert all(row.is_total for row in rows[:3])
+
+
+def test_the_runner_writes_the_report(populated, tmp_path):
+    args = run_reports.parse_arguments(
+        ["--provider", reports.PROVIDER_NAME, "--output-dir", str(tmp_path), "--csv"])
+    run_reports.run(args, populated.get_bind(), logger)
+
+    with (tmp_path / "gwis-statistics.csv").open(encoding="utf-8") as handle:
+        assert next(csv.reader(handle)) == list(app.COLUMNS)
+
+
+def test_the_application_with_the_reported_country_is_the_engines_report(populated,
+                                                                          tmp_path):
+    rows = app.report(app.parse_arguments(
+        ["--country-source", "reported", "--csv", str(tmp_path / "gwis.csv"),
+         "--no-cache"]), populated.get_bind(), logger)
+
+    assert all(isinstance(row, engine.ReportRow) for row in rows)
+    with (tmp_path / "gwis.csv").open(encoding="utf-8") as handle:
+        written = list(csv.reader(handle))
+    assert written[0] == list(app.COLUMNS)
+    assert written[1:] == cells(rows)
+
+
+def test_an_option_the_engine_does_not_have_is_the_applications_own(populated, tmp_path):
+    rows = app.report(app.parse_arguments(
+        ["--country-source", "reported", "--country", "Spain", "--csv",
+         str(tmp_path / "spain.csv"), "--no-cache"]), populated.get_bind(), logger)
+    assert all(isinstance(row, app.Row) for row in rows)
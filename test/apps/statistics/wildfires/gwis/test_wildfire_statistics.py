@@ -25,11 +25,16 @@ import pytest
 from pyproj import Geod
 from shapely.geometry import MultiPolygon
 from shapely.geometry import box
+from sqlalchemy import func
 from sqlalchemy import select
 
+from src.apps.imports import common as import_common
 from src.apps.statistics.wildfires.gwis import wildfire_statistics as app
 from src.data_model.data_provider import DataProvider
 from src.data_model.geography.admin_boundary import AdminBoundary
+from src.data_model.wildfire import Wildfire
+from src.data_model.wildfire_boundary_area import WildfireBoundaryArea
+from src.data_model.wildfire_yearly_summary import WildfireYearlySummary
 from src.providers import ocha
 from src.providers.gwis.wildfire import GwisWildfire
 from src.providers.ocha.admin_boundary import OchaAdminBoundary
@@ -119,6 +124,8 @@ def populated(db_session):
             admin_boundary_id=boundaries[country].id if country else None,
         ))
     db_session.commit()
+    import_common.cut_admin_boundary_parts(db_session, logging.getLogger("test"))
+    db_session.commit()
     return db_session
 
 
@@ -155,6 +162,12 @@ def test_the_scope_defaults_to_everything():
     assert parsed.year is None
 
 
+@pytest.mark.parametrize("other", [["--from-summary"], ["--sample", "1"]])
+def test_the_split_area_reads_neither_the_summary_nor_a_sample(other):
+    with pytest.raises(SystemExit):
+        app.parse_arguments(["--split-area", *other, "--csv", "out.csv"])
+
+
 # --------------------------------------------------------------------------
 # The statistics themselves
 # --------------------------------------------------------------------------
@@ -706,6 +719,18 @@ def test_the_fires_are_measured_one_year_at_a_time(populated, monkeypatch):
     assert len(years) == len({row.year for row in rows_for(populated) if row.year})
 
 
+def test_several_years_at_a_time_give_the_same_report(populated, monkeypatch):
+    """--jobs spreads the years over connections; it must not change a figure."""
+    serial = rows_for(populated)
+    years = measured_years(monkeypatch)
+    with import_common.snapshot_session(populated.get_bind()) as session:
+        parallel = app.compute(session, None, None, logger, jobs=3)
+
+    assert sorted(years, reverse=True) == sorted({row.year for row in serial if row.year},
+                                                 reverse=True)
+    assert parallel == serial
+
+
 def test_a_narrowed_year_is_measured_by_one_statement(populated, monkeypatch):
     """And the years are not looked up at all: --year already named the only one."""
     years = measured_years(monkeypatch)
@@ -731,3 +756,150 @@ def test_the_countries_are_ordered_by_the_database(populated):
     # A name that is not a country in the database is kept rather than dropped.
     assert app.ordered_countries(populated, {"Spain", "Atlantis"}) == ["Spain", "Atlantis"]
     assert app.ordered_countries(populated, set()) == []
+
+
+# --------------------------------------------------------------------------
+# Reading from the yearly summary
+# --------------------------------------------------------------------------
+
+@pytest.fixture
+def summarised(populated):
+    """The fixture world with its yearly summary filled, as the importer fills it."""
+    provider_id = populated.scalar(select(DataProvider.id).where(DataProvider.name == "GWIS"))
+    import_common.refresh_yearly_summary(populated, provider_id, [2019, 2020, 2021], logger)
+    populated.commit()
+    return populated
+
+
+def test_the_summary_gives_the_report_the_fires_give(summarised, monkeypatch):
+    """The same rows, and not a single fire measured to get them."""
+    expected_rows = rows_for(summarised, country_source=app.COUNTRY_SOURCE_REPORTED)
+    years = measured_years(monkeypatch)
+    read = app.compute(summarised, None, None, logger, app.COUNTRY_SOURCE_REPORTED,
+                       from_summary=True)
+
+    assert years == []
+    assert [(r.country, r.year, r.fires) for r in read] == \
+           [(r.country, r.year, r.fires) for r in expected_rows]
+    for one, other in zip(read, expected_rows):
+        assert (one.minimum, one.maximum, one.total) == pytest.approx(
+            (other.minimum, other.maximum, other.total))
+
+
+def test_the_summary_is_narrowed_like_the_fires(summarised):
+    rows = app.compute(summarised, "esp", 2021, logger, app.COUNTRY_SOURCE_REPORTED,
+                       from_summary=True)
+    assert [(row.country, row.year_label, row.fires) for row in rows] == [
+        ("Spain", "2021", 3), ("Spain", "Total", 3)]
+
+
+def test_the_summary_cannot_decide_the_country_by_geometry(summarised, monkeypatch):
+    """It only knows the stored country, so the fires are measured after all."""
+    years = measured_years(monkeypatch)
+    app.compute(summarised, None, 2021, logger, app.COUNTRY_SOURCE_GEOMETRY,
+                from_summary=True)
+    assert years == [2021]
+
+
+def test_an_empty_summary_falls_back_to_the_fires(populated, monkeypatch, caplog):
+    """An empty summary is an unfilled one, not a dataset without fires."""
+    years = measured_years(monkeypatch)
+    rows = app.compute(populated, None, 2021, logger, app.COUNTRY_SOURCE_REPORTED,
+                       from_summary=True)
+
+    assert years == [2021]
+    assert find(rows, "Spain", 2021).fires == 3
+    assert "holds nothing for GWIS" in caplog.text
+
+
+def test_a_refresh_replaces_only_the_years_it_is_given(summarised):
+    """The years not named keep their rows; the ones named are recomputed whole."""
+    provider_id = summarised.scalar(select(DataProvider.id).where(DataProvider.name == "GWIS"))
+    summary = WildfireYearlySummary.__table__
+    summarised.execute(summary.update().where(summary.c.year == 2019).values(fires=99))
+    # Fire 4 is the only one in 2020.
+    gone = summarised.scalar(select(GwisWildfire.id).where(GwisWildfire.gwis_id == "4"))
+    summarised.execute(GwisWildfire.__table__.delete().where(GwisWildfire.id == gone))
+    summarised.execute(Wildfire.__table__.delete().where(Wildfire.id == gone))
+    import_common.refresh_yearly_summary(summarised, provider_id, [2020], logger)
+
+    fires = dict(summarised.execute(
+        select(summary.c.year, func.sum(summary.c.fires)).group_by(summary.c.year)).all())
+    assert fires == {2021: 4, 2019: 99}
+
+
+# --------------------------------------------------------------------------
+# Splitting the area between countries
+# --------------------------------------------------------------------------
+
+#: A fire astride the Spanish-French border at 3°E, a little more of it in France.
+BORDER_FIRE = ("8", datetime.date(2021, 8, 20), box(2.95, 42.5, 3.1, 42.6))
+
+
+@pytest.fixture
+def split(populated):
+    """The fixture world plus a border fire, its areas per boundary filled."""
+    provider_id = populated.scalar(select(DataProvider.id).where(DataProvider.name == "GWIS"))
+    ocha_id = populated.scalar(
+        select(DataProvider.id).where(DataProvider.name == ocha.PROVIDER_NAME))
+    gwis_id, start, geometry = BORDER_FIRE
+    populated.add(GwisWildfire(
+        gwis_id=gwis_id, data_provider_id=provider_id,
+        start_date_time=datetime.datetime.combine(
+            start, datetime.time(0, 0), tzinfo=datetime.timezone.utc),
+        time_zone="UTC", perimeter=f"SRID=4326;{MultiPolygon([geometry]).wkt}",
+    ))
+    populated.flush()
+    import_common.refresh_boundary_areas(populated, provider_id, ocha_id,
+                                         [2019, 2020, 2021], logger)
+    populated.commit()
+    return populated
+
+
+def test_a_border_fire_is_split_between_the_countries_it_burnt_in(split):
+    rows = app.compute(split, None, 2021, logger, split_area=True)
+    spain, france = find(rows, "Spain", 2021), find(rows, "France", 2021)
+
+    assert (spain.fires, france.fires) == (4, 2)
+    inside_spain = hectares(box(2.95, 42.5, 3.0, 42.6))
+    inside_france = hectares(box(3.0, 42.5, 3.1, 42.6))
+    assert spain.minimum == pytest.approx(min(inside_spain, expected("1")), rel=1e-4)
+    assert france.maximum == pytest.approx(max(inside_france, expected("6")), rel=1e-4)
+    assert spain.total + france.total == pytest.approx(
+        sum(expected(fire) for fire in ["1", "2", "3", "6"])
+        + hectares(BORDER_FIRE[2]), rel=1e-4)
+
+
+def test_the_world_counts_a_border_fire_once_and_whole(split):
+    rows = app.compute(split, None, 2021, logger, split_area=True)
+    world = find(rows, app.WORLD_LABEL, 2021)
+    assert world.fires == 5
+    assert world.maximum == pytest.approx(expected("2"), rel=1e-4)
+    assert world.total == pytest.approx(find(rows, "Spain", 2021).total
+                                        + find(rows, "France", 2021).total)
+
+
+def test_a_fire_inside_one_country_keeps_its_stored_area(split):
+    """Covered by one piece, it is not intersected: its row is its perimeter_area_m2."""
+    areas = WildfireBoundaryArea.__table__
+    stored, kept = split.execute(
+        select(Wildfire.perimeter_area_m2, areas.c.area_m2)
+        .join(areas, areas.c.wildfire_id == Wildfire.id)
+        .join(GwisWildfire.__table__, GwisWildfire.__table__.c.id == Wildfire.id)
+        .where(GwisWildfire.__table__.c.gwis_id == "5")
+    ).one()
+    assert kept == stored
+
+
+def test_a_split_report_measures_no_fire(split, monkeypatch):
+    years = measured_years(monkeypatch)
+    rows = app.compute(split, "fra", None, logger, split_area=True)
+    assert years == []
+    assert [(row.country, row.year_label, row.fires) for row in rows] == [
+        ("France", "2021", 2), ("France", "Total", 2)]
+
+
+def test_an_empty_split_table_is_an_error(populated):
+    """Not an empty report: the table is filled by the import, and this one was not."""
+    with pytest.raises(RuntimeError, match="again"):
+        app.compute(populated, None, None, logger, split_area=True)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the CONAFOR reports as the shared report engine computes them.
+
+Over a fixture with a year that publishes a specific cause and a year that does not,
+a fire with no cause and a fire with no perimeter, the rows
+:mod:`src.apps.statistics.run_reports` writes are the rows
+:mod:`~src.apps.statistics.wildfires.mexico_conafor.wildfire_statistics` and
+:mod:`~src.apps.statistics.wildfires.mexico_conafor.wildfire_causes` write, cell for
+cell — the blank ``Lightning`` cells included.
+"""
+
+import csv
+import datetime
+import logging
+
+import pytest
+
+from shapely.geometry import MultiPolygon
+from shapely.geometry import box
+
+from src.apps.statistics import engine
+from src.apps.statistics import run_reports
+from src.apps.statistics.wildfires.mexico_conafor import reports
+from src.apps.statistics.wildfires.mexico_conafor import wildfire_causes
+from src.apps.statistics.wildfires.mexico_conafor import wildfire_statistics
+from src.data_model.data_provider import DataProvider
+from src.providers import mexico_conafor
+from src.providers.mexico_conafor.fire_cause import ConaforFireCause
+from src.providers.mexico_conafor.wildfire import ConaforWildfire
+
+logger = logging.getLogger("test-conafor-reports")
+
+UTC = datetime.timezone.utc
+
+#: ``(cause, cause_normalised, specific_cause, specific_cause_en)``.
+CAUSES = {
+    "lightning": ("Naturales", "Naturales", "Rayos", "Lightning"),
+    "natural": ("Naturales", "Naturales", None, None),
+    "arson": ("Intencional", "Intencional", "Vandalismo", "Vandalism"),
+    "arson-plain": ("Intencional", "Intencional", None, None),
+}
+
+#: ``(fire_code, year, cause key or None, perimeter or None)``. 2019 publishes a
+#: specific cause and 2023 does not; one fire has no cause and one no perimeter.
+FIRES = [
+    ("19-01-0001", 2019, "lightning", box(-102.30, 21.80, -102.20, 21.90)),
+    ("19-01-0002", 2019, "arson", box(-102.40, 21.80, -102.39, 21.81)),
+    ("19-01-0003", 2019, None, box(-103.00, 20.00, -102.50, 20.50)),
+    ("23-14-0001", 2023, "natural", box(-103.50, 20.50, -103.45, 20.55)),
+    ("23-14-0002", 2023, "arson-plain", box(-103.60, 20.60, -103.59, 20.61)),
+    ("23-14-0003", 2023, "natural", None),
+]
+
+
+@pytest.fixture
+def populated(db_session):
+    provider = DataProvider(name=mexico_conafor.PROVIDER_NAME,
+                            product=mexico_conafor.PROVIDER_PRODUCT,
+                            full_name=mexico_conafor.PROVIDER_FULL_NAME,
+                            url=mexico_conafor.PROVIDER_URL)
+    db_session.add(provider)
+    db_session.flush()
+
+    stored = {}
+    for key, (cause, normalised, specific, specific_en) in CAUSES.items():
+        row = ConaforFireCause(cause=cause, cause_normalised=normalised,
+                               specific_cause=specific, specific_cause_en=specific_en)
+        db_session.add(row)
+        db_session.flush()
+        stored[key] = row.id
+
+    for fire_code, year, key, geometry in FIRES:
+        db_session.add(ConaforWildfire(
+            data_provider_id=provider.id,
+            fire_code=fire_code, year=year, source_layer=f"incendios_{year}",
+            state_code=int(fire_code.split("-")[1]), state_name="Jalisco",
+            municipality_name="Bolanos",
+            date_time_precision=mexico_conafor.PRECISION_DAY,
+            start_date_time=datetime.datetime(year, 6, 1, 6, tzinfo=UTC),
+            time_zone=mexico_conafor.DEFAULT_TIME_ZONE,
+            area_ha=10.0,
+            perimeter=None if geometry is None
+            else f"SRID=4326;{MultiPolygon([geometry]).wkt}",
+            cause_id=None if key is None else stored[key],
+        ))
+    db_session.commit()
+    return db_session
+
+
+def cells(name, rows):
+    report = reports.PROVIDER.report(name)
+    return [engine.cells(reports.PROVIDER, report, row, separators=False)
+            for row in rows]
+
+
+def csv_rows(path):
+    with path.open(newline="", encoding="utf-8") as handle:
+        return list(csv.reader(handle))
+
+
+@pytest.mark.parametrize("year", [None, 2019, 2023])
+def test_the_statistics_match_the_application(populated, year, tmp_path):
+    computed = engine.compute_one(populated, reports.PROVIDER, "statistics", year, logger)
+    path = tmp_path / "statistics.csv"
+    wildfire_statistics.write_csv(wildfire_statistics.compute(populated, year, logger),
+                                  path, logger)
+    assert cells("statistics", computed) == csv_rows(path)[1:]
+
+
+@pytest.mark.parametrize("year", [None, 2019, 2023])
+def test_the_causes_match_the_application(populated, year, tmp_path):
+    computed = engine.compute_one(populated, reports.PROVIDER, "causes", year, logger)
+    path = tmp_path / "causes.csv"
+    wildfire_causes.write_csv(wildfire_causes.compute(populated, year, logger),
+                              path, logger)
+    assert cells("causes", computed) == csv_rows(path)[1:]
+
+
+def test_a_year_with_no_specific_cause_has_a_blank_lightning_cell(populated):
+    rows = engine.compute_one(populated, reports.PROVIDER, "causes", None, logger)
+    lightning = {row.keys["year"]: row.values["lightning"] for row in rows}
+    assert lightning == {2019: 1, 2023: None, None: 1}
+
+
+def test_the_fire_with_no_perimeter_is_a_cause_and_not_an_area(populated):
+    statistics = engine.compute_one(populated, reports.PROVIDER, "statistics", 2023,
+                                    logger)
+    causes = engine.compute_one(populated, reports.PROVIDER, "causes", 2023, logger)
+    assert (statistics[0].values["fires"], causes[0].values["fires"]) == (2, 3)
+
+
+def test_the_runner_writes_both_reports(populated, tmp_path):
+    args = run_reports.parse_arguments(
+        ["--provider", reports.PROVIDER_NAME, "--output-dir", str(tmp_path), "--csv"])
+    run_reports.run(args, populated.get_bind(), logger)
+
+    assert csv_rows(tmp_path / "mexico_conafor-statistics.csv")[0] == \
+        list(wildfire_statistics.COLUMNS)
+    assert csv_rows(tmp_path / "mexico_conafor-causes.csv")[0] == \
+        list(wildfire_causes.columns())
+
+
+def test_the_applications_run_by_default_are_the_engines_reports(populated, tmp_path):
+    statistics = wildfire_statistics.report(wildfire_statistics.parse_arguments(
+        ["--csv", str(tmp_path / "statistics.csv"), "--no-cache"]),
+        populated.get_bind(), logger)
+    causes = wildfire_causes.report(wildfire_causes.parse_arguments(
+        ["--csv", str(tmp_path / "causes.csv")]), populated.get_bind(), logger)
+
+    assert all(isinstance(row, engine.ReportRow) for row in statistics + causes)
+    assert csv_rows(tmp_path / "statistics.csv")[1:] == cells("statistics", statistics)
+    assert csv_rows(tmp_path / "causes.csv")[1:] == cells("causes", causes)
+
+
+def test_an_option_the_engine_does_not_have_is_the_applications_own(populated, tmp_path):
+    statistics = wildfire_statistics.report(wildfire_statistics.parse_arguments(
+        ["--area-method", "reported", "--csv", str(tmp_path / "reported.csv"),
+         "--no-cache"]),
+        populated.get_bind(), logger)
+    causes = wildfire_causes.report(wildfire_causes.parse_arguments(
+        ["--cause", "Intencional", "--csv", str(tmp_path / "arson.csv")]),
+        populated.get_bind(), logger)
+    assert all(isinstance(row, wildfire_statistics.Row) for row in statistics)
+    assert all(isinstance(row, wildfire_causes.Row) for row in causes)
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for ICNF's reports as the shared report engine computes them.
+
+Over a fixture with classified and unclassified fires, a year before the ICNF
+classified anything, a perimeter that lies in Spain and one digitised into the
+Atlantic, the rows :mod:`src.apps.statistics.run_reports` writes are the rows
+:mod:`~src.apps.statistics.wildfires.portugal_icnf.wildfire_statistics` and
+:mod:`~src.apps.statistics.wildfires.portugal_icnf.wildfire_causes` write, cell for
+cell — from one statement instead of one per year per report.
+"""
+
+import csv
+import datetime
+import logging
+
+import pytest
+
+from shapely.geometry import MultiPolygon
+from shapely.geometry import box
+
+from src.apps.imports import common as import_common
+from src.apps.statistics import engine
+from src.apps.statistics import run_reports
+from src.apps.statistics.wildfires.portugal_icnf import reports
+from src.apps.statistics.wildfires.portugal_icnf import wildfire_causes
+from src.apps.statistics.wildfires.portugal_icnf import wildfire_statistics
+from src.data_model.data_provider import DataProvider
+from src.providers import ocha
+from src.providers import portugal_icnf
+from src.providers.ocha.admin_boundary import OchaAdminBoundary
+from src.providers.portugal_icnf.fire_cause import IcnfFireCause
+from src.providers.portugal_icnf.wildfire import IcnfWildfire
+
+logger = logging.getLogger("test-icnf-reports")
+
+UTC = datetime.timezone.utc
+
+COUNTRIES = [
+    ("PRT", "Portugal", box(-9.6, 37.0, -6.2, 42.2)),
+    ("ESP", "Spain", box(-6.2, 36.0, 3.0, 43.8)),
+]
+
+CAUSES = [
+    ("100", "Natural", "Naturais"),
+    ("300", "Intencional", "Incendiarismo - Sem motivação conhecida"),
+]
+
+#: (sgif_code, year, cause code or None, perimeter). Every fire is filed as
+#: Portuguese; the one at -5.5 lies in Spain and the one at -14.0 in the sea.
+FIRES = [
+    ("2024-nat", 2024, "100", box(-8.0, 40.0, -7.9, 40.1)),
+    ("2024-int", 2024, "300", box(-8.5, 40.0, -8.3, 40.2)),
+    ("2024-non", 2024, None, box(-7.5, 40.0, -7.45, 40.05)),
+    ("2024-esp", 2024, "100", box(-5.5, 40.0, -5.4, 40.1)),
+    ("2019-sea", 2019, "100", box(-14.0, 39.0, -13.9, 39.1)),
+    ("1985-a", 1985, None, box(-8.0, 41.0, -7.9, 41.1)),
+    ("1985-b", 1985, None, box(-9.0, 38.0, -8.7, 38.3)),
+]
+
+
+@pytest.fixture
+def populated(db_session):
+    ocha_provider = DataProvider(name=ocha.PROVIDER_NAME, product=ocha.PROVIDER_PRODUCT,
+                                 full_name=ocha.PROVIDER_FULL_NAME, url=ocha.PROVIDER_URL)
+    icnf_provider = DataProvider(name=portugal_icnf.PROVIDER_NAME,
+                                 product=portugal_icnf.PROVIDER_PRODUCT,
+                                 full_name=portugal_icnf.PROVIDER_FULL_NAME,
+                                 url=portugal_icnf.PROVIDER_URL)
+    db_session.add_all([ocha_provider, icnf_provider])
+    db_session.flush()
+
+    boundaries = {}
+    for code, name, geometry in COUNTRIES:
+        boundary = OchaAdminBoundary(
+            data_provider_id=ocha_provider.id, source_id=code, level=0, name=name,
+            geometry=f"SRID=4326;{MultiPolygon([geometry]).wkt}",
+            source=code, iso_code=1, iso_2=code[:2], iso_3=code, iso_name=name,
+            iso_3_group=code, region1_code=1, region1_name="r1", region2_code=2,
+            region2_name="r2", region3_code=3, region3_name="r3", status_code=1,
+            status_name="State", valid_date=datetime.date(2025, 1, 1),
+            update_date=datetime.date(2025, 1, 1), land_source="osm", view="intl",
+        )
+        db_session.add(boundary)
+        db_session.flush()
+        boundaries[name] = boundary
+
+    causes = {}
+    for code, kind, description in CAUSES:
+        cause = IcnfFireCause(code=code, type=kind, description=description)
+        db_session.add(cause)
+        db_session.flush()
+        causes[code] = cause
+
+    for sgif, year, cause_code, geometry in FIRES:
+        db_session.add(IcnfWildfire(
+            source_layer=f"ardida_{year}", sgif_code=sgif, year=year,
+            date_time_precision=portugal_icnf.PRECISION_DAY,
+            area_ha_gis=1.0, data_provider_id=icnf_provider.id,
+            start_date_time=datetime.datetime(year, 7, 1, tzinfo=UTC),
+            time_zone=portugal_icnf.DEFAULT_TIME_ZONE,
+            perimeter=f"SRID=4326;{MultiPolygon([geometry]).wkt}",
+            admin_boundary_id=boundaries["Portugal"].id,
+            cause_id=None if cause_code is None else causes[cause_code].id,
+        ))
+    db_session.commit()
+    import_common.cut_admin_boundary_parts(db_session, logging.getLogger("test"))
+    db_session.commit()
+    return db_session
+
+
+def cells(name, rows):
+    report = reports.PROVIDER.report(name)
+    return [engine.cells(reports.PROVIDER, report, row, separators=False)
+            for row in rows]
+
+
+def statistics_values(row):
+    """A row of the statistics application's, as its CSV writes it."""
+    return [row.country, row.year_label, str(row.fires),
+            f"{row.minimum:.2f}", f"{row.maximum:.2f}", f"{row.total:.2f}"]
+
+
+def causes_values(row):
+    """A row of the causes application's, as its CSV writes it."""
+    return [row.country, row.year_label, str(row.fires), str(row.classified),
+            str(row.matching), row.share_label]
+
+
+@pytest.mark.parametrize("year", [None, 2024])
+def test_the_statistics_report_matches_the_application(populated, year):
+    computed = engine.compute(populated, reports.PROVIDER, ["statistics"], year, logger)
+    expected = wildfire_statistics.compute(populated, year, logger)
+    assert cells("statistics", computed["statistics"]) == [statistics_values(row)
+                                                           for row in expected]
+
+
+@pytest.mark.parametrize("year", [None, 1985])
+def test_the_causes_report_matches_the_application(populated, year):
+    computed = engine.compute(populated, reports.PROVIDER, ["causes"], year, logger)
+    expected = wildfire_causes.compute(populated, year, logger)
+    assert cells("causes", computed["causes"]) == [causes_values(row)
+                                                   for row in expected]
+
+
+def test_each_fire_is_in_the_country_its_perimeter_is_in(populated):
+    rows = engine.compute(populated, reports.PROVIDER, ["statistics"], None,
+                          logger)["statistics"]
+    fires = {row.keys["country"]: row.values["fires"] for row in rows if row.is_total}
+    assert fires == {"Portugal": 5, "Spain": 1}
+
+
+def test_the_runner_writes_one_file_per_report(populated, tmp_path):
+    args = run_reports.parse_arguments(
+        ["--provider", reports.PROVIDER_NAME, "--output-dir", str(tmp_path), "--csv"])
+    run_reports.run(args, populated.get_bind(), logger)
+
+    with (tmp_path / "portugal_icnf-statistics.csv").open(encoding="utf-8") as handle:
+        assert next(csv.reader(handle)) == list(wildfire_statistics.COLUMNS)
+    with (tmp_path / "portugal_icnf-causes.csv").open(encoding="utf-8") as handle:
+        assert next(csv.reader(handle)) == list(wildfire_causes.columns())
+
+
+def test_the_applications_run_by_default_are_the_engines_reports(populated, tmp_path):
+    bind = populated.get_bind()
+    statistics = wildfire_statistics.report(wildfire_statistics.parse_arguments(
+        ["--csv", str(tmp_path / "statistics.csv"), "--no-cache"]), bind, logger)
+    causes = wildfire_causes.report(wildfire_causes.parse_arguments(
+        ["--csv", str(tmp_path / "causes.csv")]), bind, logger)
+
+    assert all(isinstance(row, engine.ReportRow) for row in statistics + causes)
+    with (tmp_path / "statistics.csv").open(encoding="utf-8") as handle:
+        assert list(csv.reader(handle))[1:] == cells("statistics", statistics)
+    with (tmp_path / "causes.csv").open(encoding="utf-8") as handle:
+        assert list(csv.reader(handle))[1:] == cells("causes", causes)
+
+
+def test_an_option_the_engine_does_not_have_is_the_applications_own(populated, tmp_path):
+    rows = wildfire_causes.report(wildfire_causes.parse_arguments(
+        ["--cause-type", "Intencional", "--csv", str(tmp_path / "arson.csv")]),
+        populated.get_bind(), logger)
+    assert all(isinstance(row, wildfire_causes.Row) for row in rows)
@@ -23,6 +23,7 @@ from shapely.geometry import MultiPolygon
 from shapely.geometry import box
 from sqlalchemy import select
 
+from src.apps.imports import common as import_common
 from src.apps.statistics.wildfires.portugal_icnf import wildfire_causes as app
 from src.apps.statistics.wildfires.portugal_icnf import wildfire_statistics as stats_app
 from src.data_model.data_provider import DataProvider
@@ -118,6 +119,8 @@ def populated(db_session):
             cause_id=None if cause_code is None else causes[cause_code].id,
         ))
     db_session.commit()
+    import_common.cut_admin_boundary_parts(db_session, logging.getLogger("test"))
+    db_session.commit()
     return db_session
 
 
@@ -30,6 +30,7 @@ from shapely.geometry import MultiPolygon
 from shapely.geometry import box
 from sqlalchemy import select
 
+from src.apps.imports import common as import_common
 from src.apps.statistics.wildfires.portugal_icnf import wildfire_statistics as app
 from src.data_model.data_provider import DataProvider
 from src.providers import ocha
@@ -129,6 +130,8 @@ def populated(db_session):
             admin_boundary_id=boundaries["Portugal"].id,
         ))
     db_session.commit()
+    import_common.cut_admin_boundary_parts(db_session, logging.getLogger("test"))
+    db_session.commit()
     return db_session
 
 
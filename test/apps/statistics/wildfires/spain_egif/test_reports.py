@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for EGIF's reports as the shared report engine computes them.
+
+Over a fixture with fires in Spain, in the sea, over the French border and with no
+point at all, classified and not, with and without a reported forest area, the rows
+:mod:`src.apps.statistics.run_reports` writes are the rows
+:mod:`~src.apps.statistics.wildfires.spain_egif.wildfire_statistics` and
+:mod:`~src.apps.statistics.wildfires.spain_egif.wildfire_causes` write, cell for
+cell — from one statement instead of one per campaign per report.
+"""
+
+import csv
+import datetime
+import logging
+
+import pytest
+
+from shapely.geometry import MultiPolygon
+from shapely.geometry import box
+
+from src.apps.statistics import engine
+from src.apps.statistics import run_reports
+from src.apps.statistics.wildfires.spain_egif import reports
+from src.apps.statistics.wildfires.spain_egif import wildfire_causes
+from src.apps.statistics.wildfires.spain_egif import wildfire_statistics
+from src.data_model.data_provider import DataProvider
+from src.providers import ocha
+from src.providers import spain_egif
+from src.providers.ocha.admin_boundary import OchaAdminBoundary
+from src.providers.spain_egif.fire_cause import EgifFireCause
+from src.providers.spain_egif.ignition import EgifIgnition
+from src.providers.spain_egif.wildfire import EgifWildfire
+
+logger = logging.getLogger("test-egif-reports")
+
+UTC = datetime.timezone.utc
+
+COUNTRIES = [
+    ("ESP", "Spain", box(-9.3, 36.0, 3.0, 43.8)),
+    ("FRA", "France", box(3.0, 42.0, 8.0, 51.0)),
+]
+
+CAUSES = [
+    ("100", "Rayo"),
+    ("231", "Quema de restos agrícolas (viñas,etc)"),
+    ("400", "Intencionado"),
+]
+
+IN_SPAIN = (-3.70, 40.42)
+IN_THE_SEA = (-12.00, 40.00)
+IN_FRANCE = (5.00, 44.00)
+
+#: ``(report_number, campaign, cause code or None, coordinate or None, forest ha)``.
+#: 2019 has no classified fire, and none that reports a forest area.
+FIRES = [
+    ("2023280001", 2023, "100", IN_SPAIN, 12.5),
+    ("2023280002", 2023, "100", None, 0.0),
+    ("2023280003", 2023, "400", IN_SPAIN, 3.0),
+    ("2023280004", 2023, "231", IN_THE_SEA, None),
+    ("2023280005", 2023, None, IN_SPAIN, 40.0),
+    ("2022170001", 2022, "100", IN_FRANCE, 7.25),
+    ("2022170002", 2022, "400", IN_SPAIN, None),
+    ("2019120001", 2019, None, IN_SPAIN, None),
+]
+
+
+@pytest.fixture
+def populated(db_session):
+    ocha_provider = DataProvider(name=ocha.PROVIDER_NAME, product=ocha.PROVIDER_PRODUCT,
+                                 full_name=ocha.PROVIDER_FULL_NAME, url=ocha.PROVIDER_URL)
+    egif_provider = DataProvider(name=spain_egif.PROVIDER_NAME,
+                                 product=spain_egif.PROVIDER_PRODUCT,
+                                 full_name=spain_egif.PROVIDER_FULL_NAME,
+                                 url=spain_egif.PROVIDER_URL)
+    db_session.add_all([ocha_provider, egif_provider])
+    db_session.flush()
+
+    for code, name, geometry in COUNTRIES:
+        db_session.add(OchaAdminBoundary(
+            data_provider_id=ocha_provider.id, source_id=code, level=0, name=name,
+            geometry=f"SRID=4326;{MultiPolygon([geometry]).wkt}",
+            source=code, iso_code=1, iso_2=code[:2], iso_3=code, iso_name=name,
+            iso_3_group=code, region1_code=1, region1_name="r1", region2_code=2,
+            region2_name="r2", region3_code=3, region3_name="r3", status_code=1,
+            status_name="State", valid_date=datetime.date(2025, 1, 1),
+            update_date=datetime.date(2025, 1, 1), land_source="osm", view="intl",
+        ))
+    causes = {}
+    for code, label in CAUSES:
+        cause = EgifFireCause(code=code, label=label)
+        db_session.add(cause)
+        db_session.flush()
+        causes[code] = cause.id
+
+    for number, campaign, code, coordinate, forest in FIRES:
+        ignition_id = None
+        if coordinate is not None:
+            ignition = EgifIgnition(
+                data_provider_id=egif_provider.id, report_number=number,
+                geometry=f"SRID=4326;POINT({coordinate[0]} {coordinate[1]})",
+                date_time=datetime.datetime(campaign, 7, 1, tzinfo=UTC),
+                time_zone=spain_egif.DEFAULT_TIME_ZONE,
+                utm_zone=30, utm_x=440000.0, utm_y=4474000.0,
+                datum=spain_egif.DATUM_ETRS89, start_point_count=1)
+            db_session.add(ignition)
+            db_session.flush()
+            ignition_id = ignition.id
+        db_session.add(EgifWildfire(
+            report_number=number, campaign=campaign, province_ine_code=number[4:6],
+            data_provider_id=egif_provider.id,
+            cause_id=None if code is None else causes[code],
+            ignition_id=ignition_id, area_ha_forest_total=forest,
+            start_date_time=datetime.datetime(campaign, 7, 1, tzinfo=UTC),
+            time_zone=spain_egif.DEFAULT_TIME_ZONE,
+        ))
+    db_session.commit()
+    return db_session
+
+
+def cells(name, rows):
+    report = reports.PROVIDER.report(name)
+    return [engine.cells(reports.PROVIDER, report, row, separators=False)
+            for row in rows]
+
+
+def statistics_values(row):
+    """A row of the statistics application's, as its CSV writes it."""
+    return [row.country, row.year_label, str(row.fires),
+            f"{row.minimum:.2f}", f"{row.maximum:.2f}", f"{row.total:.2f}"]
+
+
+@pytest.mark.parametrize("campaign", [None, 2022])
+def test_the_statistics_report_matches_the_application(populated, campaign):
+    computed = engine.compute(populated, reports.PROVIDER, ["statistics"], campaign,
+                              logger)
+    expected = wildfire_statistics.compute(populated, campaign, logger)
+    assert cells("statistics", computed["statistics"]) == [statistics_values(row)
+                                                           for row in expected]
+
+
+@pytest.mark.parametrize("campaign", [None, 2019])
+def test_the_causes_report_matches_the_application(populated, campaign):
+    computed = engine.compute(populated, reports.PROVIDER, ["causes"], campaign, logger)
+    expected = wildfire_causes.compute(populated, campaign, logger)
+    assert cells("causes", computed["causes"]) == [list(row.values) for row in expected]
+
+
+def test_a_fire_with_no_forest_area_is_only_in_the_causes(populated):
+    computed = engine.compute(populated, reports.PROVIDER, None, 2023, logger)
+    assert [row.values["fires"] for row in computed["statistics"]] == [4, 4]
+    assert [row.values["fires"] for row in computed["causes"]] == [5, 5]
+
+
+def test_the_runner_writes_one_file_per_report(populated, tmp_path):
+    args = run_reports.parse_arguments(
+        ["--provider", reports.PROVIDER_NAME, "--output-dir", str(tmp_path), "--csv"])
+    run_reports.run(args, populated.get_bind(), logger)
+
+    with (tmp_path / "spain_egif-statistics.csv").open(encoding="utf-8") as handle:
+        assert next(csv.reader(handle)) == list(wildfire_statistics.COLUMNS)
+    with (tmp_path / "spain_egif-causes.csv").open(encoding="utf-8") as handle:
+        assert next(csv.reader(handle)) == list(wildfire_causes.columns())
+
+
+def test_the_applications_run_by_default_are_the_engines_reports(populated, tmp_path):
+    bind = populated.get_bind()
+    statistics = wildfire_statistics.report(wildfire_statistics.parse_arguments(
+        ["--csv", str(tmp_path / "statistics.csv"), "--no-cache"]), bind, logger)
+    causes = wildfire_causes.report(wildfire_causes.parse_arguments(
+        ["--csv", str(tmp_path / "causes.csv")]), bind, logger)
+
+    assert all(isinstance(row, engine.ReportRow) for row in statistics + causes)
+    with (tmp_path / "statistics.csv").open(encoding="utf-8") as handle:
+        assert list(csv.reader(handle))[1:] == cells("statistics", statistics)
+    with (tmp_path / "causes.csv").open(encoding="utf-8") as handle:
+        assert list(csv.reader(handle))[1:] == cells("causes", causes)
+
+
+def test_an_option_the_engine_does_not_have_is_the_applications_own(populated, tmp_path):
+    rows = wildfire_statistics.report(wildfire_statistics.parse_arguments(
+        ["--min-area", "1", "--csv", str(tmp_path / "large.csv"), "--no-cache"]),
+        populated.get_bind(), logger)
+    assert all(isinstance(row, wildfire_statistics.Row) for row in rows)
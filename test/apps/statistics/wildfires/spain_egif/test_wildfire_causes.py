@@ -28,6 +28,7 @@ from shapely.geometry import box
 
 from sqlalchemy import select
 
+from src.apps.imports import common as import_common
 from src.apps.statistics.wildfires.spain_egif import wildfire_causes as app
 from src.apps.statistics.wildfires.spain_egif import wildfire_statistics as stats_app
 from src.data_model.data_provider import DataProvider
@@ -148,6 +149,8 @@ def boundaries(db_session):
             update_date=datetime.date(2025, 1, 1), land_source="osm", view="intl",
         ))
     db_session.commit()
+    import_common.cut_admin_boundary_parts(db_session, logging.getLogger("test"))
+    db_session.commit()
     return db_session
 
 
@@ -24,6 +24,7 @@ import pytest
 from shapely.geometry import MultiPolygon
 from shapely.geometry import box
 
+from src.apps.imports import common as import_common
 from src.apps.statistics.wildfires.spain_egif import wildfire_statistics as app
 from src.data_model.data_provider import DataProvider
 from src.providers import ocha
@@ -556,6 +557,24 @@ def test_the_whole_report_is_one_statement(populated, monkeypatch):
     assert len(built) == 1
 
 
+def test_jobs_splits_the_statement_by_campaign_and_changes_nothing(populated, monkeypatch):
+    """The one exception, and the figures are the single statement's."""
+    whole = rows_for(populated)
+    built = []
+    original = app.statistics_query
+
+    def spy(surface, year, *arguments, **keywords):
+        built.append(year)
+        return original(surface, year, *arguments, **keywords)
+
+    monkeypatch.setattr(app, "statistics_query", spy)
+    with import_common.snapshot_session(populated.get_bind()) as session:
+        split = app.compute(session, None, logger, jobs=2)
+
+    assert sorted(built, reverse=True) == [row.year for row in whole if not row.is_total]
+    assert split == whole
+
+
 def test_the_total_row_is_combined_from_the_campaigns_measured(populated):
     """The summary row comes from no statement of its own: it is arithmetic."""
     rows = rows_for(populated)
@@ -624,6 +643,8 @@ def located(db_session, provider_id):
             area_ha_forest_total=hectares,
             area_ha_agricultural=0.0, area_ha_other_non_forest=0.0))
     db_session.commit()
+    import_common.cut_admin_boundary_parts(db_session, logging.getLogger("test"))
+    db_session.commit()
     return db_session
 
 
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the wildfire tile renderer.
+
+The archive and the command line are tested on their own, without a database;
+the rendering is tested against GWIS fires inserted through the ORM, placed far
+enough apart that at zoom 4 each falls in a tile of its own.
+
+The tests do not decode the tiles: what is asserted is *which* tiles exist and
+which are rendered again, which is the application's business. That a tile is an
+MVT at all is PostGIS's, and is checked only as far as its first bytes.
+"""
+
+import datetime
+import gzip
+import logging
+import math
+import sqlite3
+
+import pytest
+
+from shapely.geometry import MultiPolygon
+from shapely.geometry import box
+from sqlalchemy import delete
+
+from src.apps.tiles.wildfires import render_tiles as app
+from src.data_model.data_provider import DataProvider
+from src.providers import gwis
+from src.providers.gwis.wildfire import GwisWildfire
+
+logger = logging.getLogger("test-render-tiles")
+
+#: The zoom level the tests look at, where each fixture fire has a tile to itself.
+ZOOM = 4
+
+
+def xyz(lon: float, lat: float, zoom: int) -> tuple[int, int]:
+    """The XYZ tile of a point, by the slippy-map formulas, written independently."""
+    n = 2 ** zoom
+    y = (1 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2 * n
+    return int((lon + 180) / 360 * n), int(y)
+
+
+# --------------------------------------------------------------------------
+# Without a database
+# --------------------------------------------------------------------------
+
+def test_the_simplified_perimeters_serve_the_shallow_zooms():
+    assert [app.perimeter_column(zoom) for zoom in (0, 7, 8, 10, 11, 13, 14, 16)] == [
+        "perimeter_z1", "perimeter_z1", "perimeter_z2", "perimeter_z2",
+        "perimeter_z3", "perimeter_z3", "perimeter", "perimeter"]
+
+
+def test_mbtiles_rows_are_counted_from_the_south():
+    assert app.tms_row(0, 0) == 0
+    assert app.tms_row(4, 0) == 15
+    assert app.tms_row(4, 15) == 0
+
+
+def test_a_tile_is_stored_compressed_in_mbtiles_order(tmp_path):
+    archive = app.TileArchive(tmp_path / "t.mbtiles")
+    archive.put(4, 8, 5, b"\x1a\x02ab")
+    archive.commit()
+
+    assert archive.get(4, 8, 5) == b"\x1a\x02ab"
+    stored = sqlite3.connect(tmp_path / "t.mbtiles").execute(
+        "SELECT zoom_level, tile_column, tile_row, tile_data FROM tiles").fetchall()
+    assert [(z, x, row) for z, x, row, _ in stored] == [(4, 8, 10)]
+    assert gzip.decompress(stored[0][3]) == b"\x1a\x02ab"
+
+    archive.delete(4, 8, 5)
+    assert archive.get(4, 8, 5) is None
+    archive.close()
+
+
+def test_the_metadata_describes_the_layer_and_the_dataset(tmp_path):
+    archive = app.TileArchive(tmp_path / "t.mbtiles")
+    archive.write_metadata("gwis", 0, 8)
+    metadata = archive.metadata()
+    archive.close()
+
+    assert metadata["format"] == "pbf"
+    assert (metadata["minzoom"], metadata["maxzoom"]) == ("0", "8")
+    assert metadata[app.DATASET_KEY] == "gwis"
+    (layer,) = app.json.loads(metadata["json"])["vector_layers"]
+    assert layer["id"] == app.LAYER
+    assert set(layer["fields"]) == {"year", "start_date", "end_date", "area_ha"}
+
+
+def test_recording_some_years_leaves_the_others(tmp_path):
+    archive = app.TileArchive(tmp_path / "t.mbtiles")
+    archive.record_years(4, None, {(7, 6, 2020), (8, 5, 2021), (8, 6, 2021)})
+    archive.record_years(4, [2021], {(9, 6, 2021)})
+
+    assert archive.tiles_of_years(4, [2020]) == {(7, 6)}
+    assert archive.tiles_of_years(4, [2021]) == {(9, 6)}
+    assert archive.tiles_of_years(4, [2020, 2021]) == {(7, 6), (9, 6)}
+    assert archive.tiles_of_years(3, [2020]) == set()
+    archive.close()
+
+
+def test_the_zoom_range_defaults_and_is_checked(tmp_path):
+    arguments = app.parse_arguments(["-d", "gwis", "-o", str(tmp_path / "t.mbtiles")])
+    assert (arguments.min_zoom, arguments.max_zoom) == (app.DEFAULT_MIN_ZOOM, app.DEFAULT_MAX_ZOOM)
+    with pytest.raises(SystemExit):
+        app.parse_arguments(["-d", "gwis", "-o", "t.mbtiles", "--min-zoom", "5", "--max-zoom", "4"])
+    with pytest.raises(SystemExit):
+        app.parse_arguments(["-d", "gwis", "-o", "t.mbtiles", "--max-zoom", str(app.MAX_ZOOM + 1)])
+
+
+def test_an_incremental_run_needs_an_archive_and_takes_its_zooms_from_it(tmp_path):
+    archive = tmp_path / "t.mbtiles"
+    with pytest.raises(SystemExit):
+        app.parse_arguments(["-d", "gwis", "-o", str(archive), "--years", "2021"])
+
+    archive.touch()
+    assert app.parse_arguments(["-d", "gwis", "-o", str(archive), "--years", "2021"]).years == [2021]
+    with pytest.raises(SystemExit):
+        app.parse_arguments(["-d", "gwis", "-o", str(archive), "--years", "2021", "--max-zoom", "6"])
+
+
+# --------------------------------------------------------------------------
+# Rendering
+# --------------------------------------------------------------------------
+
+#: (gwis_id, local start date, perimeter), each in a zoom-4 tile of its own.
+FIRES = [
+    ("1", datetime.date(2020, 7, 1), box(-4.1, 40.0, -4.0, 40.1)),   # Spain
+    ("2", datetime.date(2021, 8, 1), box(4.0, 45.0, 4.1, 45.1)),     # France
+]
+
+#: A 2021 fire the import that replaces 2021 brings, somewhere neither of the above is.
+GREEK_FIRE = ("3", datetime.date(2021, 8, 15), box(22.0, 39.0, 22.1, 39.1))
+
+
+def add_fire(session, provider, fire):
+    gwis_id, start, geometry = fire
+    session.add(GwisWildfire(
+        gwis_id=gwis_id, data_provider_id=provider.id,
+        start_date_time=datetime.datetime.combine(start, datetime.time(0, 0),
+                                                  tzinfo=datetime.timezone.utc),
+        time_zone="UTC", perimeter=f"SRID=4326;{MultiPolygon([geometry]).wkt}"))
+
+
+@pytest.fixture
+def populated(db_session):
+    provider = DataProvider(name=gwis.PROVIDER_NAME, product=gwis.PROVIDER_PRODUCT,
+                            full_name="Global Wildfire Information System")
+    db_session.add(provider)
+    db_session.flush()
+    for fire in FIRES:
+        add_fire(db_session, provider, fire)
+    db_session.commit()
+    return db_session, provider
+
+
+def tile_of(fire) -> tuple[int, int]:
+    return xyz(*fire[2].centroid.coords[0], ZOOM)
+
+
+def test_a_fire_is_drawn_in_its_tile_and_nowhere_else(populated, tmp_path):
+    session, provider = populated
+    archive = app.TileArchive(tmp_path / "t.mbtiles")
+    app.render(session, archive, provider.id, range(ZOOM, ZOOM + 1), None, logger)
+
+    stored = {(x, app.tms_row(ZOOM, row)) for x, row in archive.connection.execute(
+        "SELECT tile_column, tile_row FROM tiles")}
+    assert stored == {tile_of(fire) for fire in FIRES}
+    data = archive.get(ZOOM, *tile_of(FIRES[0]))
+    assert data[:1] == b"\x1a"  # an MVT layer, field 3
+    assert app.LAYER.encode() in data
+    archive.close()
+
+
+def test_replacing_a_year_renders_only_the_tiles_it_touched(populated, tmp_path, monkeypatch):
+    session, provider = populated
+    archive = app.TileArchive(tmp_path / "t.mbtiles")
+    app.render(session, archive, provider.id, range(ZOOM, ZOOM + 1), None, logger)
+
+    # The import that replaces 2021: the French fire goes, a Greek one comes.
+    session.execute(delete(GwisWildfire).where(GwisWildfire.gwis_id == "2"))
+    add_fire(session, provider, GREEK_FIRE)
+    session.commit()
+
+    rendered = []
+    render_tile = app.render_tile
+    monkeypatch.setattr(app, "render_tile", lambda session, provider_id, zoom, x, y: (
+        rendered.append((x, y)) or render_tile(session, provider_id, zoom, x, y)))
+    written, removed = app.render(session, archive, provider.id, range(ZOOM, ZOOM + 1),
+                                  [2021], logger)
+
+    assert sorted(rendered) == sorted([tile_of(FIRES[1]), tile_of(GREEK_FIRE)])
+    assert (written, removed) == (1, 1)
+    assert archive.get(ZOOM, *tile_of(FIRES[1])) is None
+    assert archive.get(ZOOM, *tile_of(GREEK_FIRE)) is not None
+    assert archive.get(ZOOM, *tile_of(FIRES[0])) is not None
+    assert archive.tiles_of_years(ZOOM, [2021]) == {tile_of(GREEK_FIRE)}
+    archive.close()
@@ -34,3 +34,16 @@ def db_session(postgresql):
     with Session(engine) as session:
         yield session
     engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def statistics_cache(tmp_path, monkeypatch):
+    """Keep every test's cached statistics reports in its own directory.
+
+    A report run by a test would otherwise be cached in the user's own
+    ``~/.cache/gisfire``, and answered from there by the next test whose ephemeral
+    database happened to produce the same fingerprint.
+    """
+    directory = tmp_path / "statistics-cache"
+    monkeypatch.setenv("GISFIRE_CACHE_DIR", str(directory))
+    return directory
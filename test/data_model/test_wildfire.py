@@ -8,13 +8,16 @@ import pytest
 
 from geoalchemy2.shape import to_shape
 from shapely.geometry import MultiPolygon
+from shapely.geometry import Point
 from shapely.geometry import Polygon
 from sqlalchemy import func
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import Range
 from sqlalchemy.exc import IntegrityError
 
 from src.data_model.data_provider import DataProvider
 from src.data_model.wildfire import Wildfire
+from src.data_model.wildfire import active_within
 
 
 @pytest.fixture
@@ -65,6 +68,99 @@ def test_perimeter_is_stored_as_multipolygon_in_4326(db_session, provider):
     assert db_session.scalar(select(func.GeometryType(stored.perimeter))) == "MULTIPOLYGON"
 
 
+def test_the_area_is_stored_with_the_perimeter_and_follows_it(db_session, provider):
+    """Generated by the database, so it is right after an insert and after an update."""
+    wildfire = Wildfire(data_provider=provider,
+                        start_date_time=datetime.datetime(2024, 7, 15, tzinfo=datetime.timezone.utc),
+                        perimeter=func.ST_GeomFromText(a_multipolygon().wkt, 4326))
+    db_session.add(wildfire)
+    db_session.commit()
+
+    measured = select(func.ST_Area(func.Geography(Wildfire.perimeter)))
+    both_parts = wildfire.perimeter_area_m2
+    assert both_parts == pytest.approx(db_session.scalar(measured))
+
+    one_part = MultiPolygon([a_multipolygon().geoms[0]])
+    wildfire.perimeter = func.ST_GeomFromText(one_part.wkt, 4326)
+    db_session.commit()
+
+    assert wildfire.perimeter_area_m2 == pytest.approx(db_session.scalar(measured))
+    assert wildfire.perimeter_area_m2 < both_parts
+
+
+def test_the_simplified_perimeters_drop_vertices_coarsest_first(db_session, provider):
+    """A 2 km-wide circle traced every degree of bearing: the 1 km level cannot keep
+    its 360 vertices, the 10 m level keeps nearly all of them, and every level is
+    still a MULTIPOLYGON in 4326."""
+    circle = MultiPolygon([Point(2.0, 41.0).buffer(0.01, quad_segs=90)])
+    wildfire = Wildfire(data_provider=provider,
+                        start_date_time=datetime.datetime(2024, 7, 15, tzinfo=datetime.timezone.utc),
+                        perimeter=func.ST_GeomFromText(circle.wkt, 4326))
+    db_session.add(wildfire)
+    db_session.commit()
+
+    levels = [wildfire.perimeter_z1, wildfire.perimeter_z2, wildfire.perimeter_z3]
+    vertices = [len(to_shape(level).geoms[0].exterior.coords) for level in levels]
+    assert vertices == sorted(vertices)
+    assert vertices[0] < 20 < vertices[2]
+    assert vertices[2] <= len(circle.geoms[0].exterior.coords)
+    for level in levels:
+        assert db_session.scalar(select(func.GeometryType(level))) == "MULTIPOLYGON"
+        assert db_session.scalar(select(func.ST_SRID(level))) == 4326
+
+
+def test_the_active_period_is_stored_with_the_dates_and_follows_them(db_session, provider):
+    start = datetime.datetime(2024, 7, 15, tzinfo=datetime.timezone.utc)
+    end = datetime.datetime(2024, 7, 17, tzinfo=datetime.timezone.utc)
+    wildfire = Wildfire(data_provider=provider, start_date_time=start)
+    db_session.add(wildfire)
+    db_session.commit()
+
+    assert wildfire.active_period == Range(start, None, bounds="[)")
+
+    wildfire.end_date_time = end
+    db_session.commit()
+
+    assert wildfire.active_period == Range(start, end, bounds="[]")
+
+
+def test_an_end_before_the_start_leaves_only_the_start_active(db_session, provider):
+    """Published that way by some providers and stored as published; the row is kept."""
+    start = datetime.datetime(2024, 7, 15, tzinfo=datetime.timezone.utc)
+    wildfire = Wildfire(data_provider=provider, start_date_time=start,
+                        end_date_time=start - datetime.timedelta(days=2))
+    db_session.add(wildfire)
+    db_session.commit()
+
+    assert wildfire.active_period == Range(start, start, bounds="[]")
+
+
+def test_a_fire_is_active_within_a_box_and_window_it_burnt_in(db_session, provider):
+    """Only the fire inside the box *and* burning in the window is found; an open end is
+    still burning."""
+    def fire(start, end=None, perimeter=a_multipolygon()):
+        return Wildfire(data_provider=provider, start_date_time=start, end_date_time=end,
+                        perimeter=func.ST_GeomFromText(perimeter.wkt, 4326))
+
+    july = datetime.datetime(2024, 7, 15, tzinfo=datetime.timezone.utc)
+    day = datetime.timedelta(days=1)
+    elsewhere = MultiPolygon([Polygon([(20, 40), (20.1, 40), (20.1, 40.1), (20, 40)])])
+    burning = fire(july, july + 2 * day)
+    still_burning = fire(july - 30 * day)
+    db_session.add_all([
+        burning,
+        still_burning,
+        fire(july - 10 * day, july - 5 * day),           # out before the window
+        fire(july, july + 2 * day, perimeter=elsewhere),  # outside the box
+    ])
+    db_session.commit()
+
+    found = db_session.scalars(
+        select(Wildfire.id).where(active_within((1.9, 40.9, 2.2, 41.2), july + day, july + 3 * day))
+    ).all()
+    assert sorted(found) == sorted([burning.id, still_burning.id])
+
+
 def test_end_date_time_and_perimeter_are_optional(db_session, provider):
     """A wildfire still burning has neither an end date nor, possibly, a perimeter."""
     wildfire = Wildfire(data_provider=provider,
@@ -74,6 +170,7 @@ def test_end_date_time_and_perimeter_are_optional(db_session, provider):
 
     assert wildfire.end_date_time is None
     assert wildfire.perimeter is None
+    assert wildfire.perimeter_area_m2 is None
 
 
 def test_start_date_time_is_required(db_session, provider):
@@ -95,6 +95,15 @@ VIEWS = {
     "v_conaf_magnitud_wildfire_4326": ("perimeter", "MULTIPOLYGON", 4326),
     "v_conaf_magnitud_wildfire_32719": ("perimeter", "MULTIPOLYGON", 32719),
     "v_conaf_magnitud_wildfire_32712": ("perimeter", "MULTIPOLYGON", 32712),
+    # The levels of detail: three per dataset whose 4326 view draws
+    # wildfire.perimeter, over its simplified copies. Generated columns declared
+    # with the perimeter's own type, so they register exactly as it does. See
+    # revision b8c4f2e6a3d7.
+    **{f"{prefix}_lod{level}": ("perimeter", "MULTIPOLYGON", 4326)
+       for prefix in ("v_gwis_wildfire", "v_gfa_wildfire", "v_icnf_wildfire",
+                      "v_darpa_wildfire", "v_rediam_wildfire", "v_nbac_wildfire",
+                      "v_conafor_wildfire", "v_conaf_magnitud_wildfire")
+       for level in (1, 2, 3)},
 }
 
 